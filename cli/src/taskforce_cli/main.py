@@ -1,57 +1,53 @@
 """Taskforce CLI entry point - wires framework + agent packages."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import typer
-from rich.console import Console
-
-# Framework commands (always available)
-from taskforce.api.cli.commands import (
-    a2a,
-    acp,
-    chat,
-    config,
-    daemon,
-    goals,
-    memory,
-    missions,
-    remote,
-    run,
-    runtimes,
-    skills,
-    tools,
-)
+
 from taskforce.api.cli.env_loader import load_dotenv_if_present
+from taskforce.api.cli.lazy_group import LazySubcommand, lazy_group
+from taskforce.application.agent_plugin_registry import (
+    cli_app_import_paths as _cli_app_import_paths,
+)
 
-# CLI-package-local commands
-from taskforce_cli.commands import serve, up
+if TYPE_CHECKING:
+    from rich.console import Console
 
 load_dotenv_if_present()
 
-app = typer.Typer(
-    name="taskforce",
-    help="Taskforce - AI Agent Framework",
-    add_completion=True,
-    no_args_is_help=True,
-    rich_markup_mode="rich",
-)
-
-console = Console()
-
-# Register framework commands
-app.add_typer(run.app, name="run", help="Execute missions")
-app.add_typer(chat.app, name="chat", help="Interactive chat mode")
-app.add_typer(tools.app, name="tools", help="Tool management")
-app.add_typer(skills.app, name="skills", help="Skill management")
-app.add_typer(config.app, name="config", help="Configuration management")
-app.add_typer(memory.app, name="memory", help="Memory management")
-app.add_typer(missions.app, name="missions", help="Mission templates and runtime control")
-app.add_typer(goals.app, name="goals", help="Standing-goal management (proactive layer)")
-app.add_typer(acp.app, name="acp", help="Agent Communication Protocol")
-app.add_typer(a2a.app, name="a2a", help="Agent-to-Agent (A2A) protocol")
-app.add_typer(remote.app, name="remote", help="Cross-protocol remote agent discovery")
-app.add_typer(runtimes.app, name="runtimes", help="Agent runtime management")
-app.add_typer(daemon.app, name="daemon", help="Generic agent daemon management")
-app.add_typer(serve.app, name="serve", help="Run Taskforce as a REST webservice")
-app.add_typer(up.app, name="up", help="Start Taskforce + web UI (one command)")
+# Subcommands are registered by import path and imported only when
+# invoked, so ``taskforce version`` / ``--help`` / completion never load
+# the application layer (and with it LiteLLM, FastAPI, prompt_toolkit).
+_FRAMEWORK = "taskforce.api.cli.commands"
+_SUBCOMMANDS: dict[str, LazySubcommand] = {
+    # Framework commands (always available)
+    "run": LazySubcommand(f"{_FRAMEWORK}.run:app", "Execute missions"),
+    "chat": LazySubcommand(f"{_FRAMEWORK}.chat:app", "Interactive chat mode"),
+    "tools": LazySubcommand(f"{_FRAMEWORK}.tools:app", "Tool management"),
+    "skills": LazySubcommand(f"{_FRAMEWORK}.skills:app", "Skill management"),
+    "config": LazySubcommand(f"{_FRAMEWORK}.config:app", "Configuration management"),
+    "memory": LazySubcommand(f"{_FRAMEWORK}.memory:app", "Memory management"),
+    "missions": LazySubcommand(
+        f"{_FRAMEWORK}.missions:app", "Mission templates and runtime control"
+    ),
+    "goals": LazySubcommand(
+        f"{_FRAMEWORK}.goals:app", "Standing-goal management (proactive layer)"
+    ),
+    "acp": LazySubcommand(f"{_FRAMEWORK}.acp:app", "Agent Communication Protocol"),
+    "a2a": LazySubcommand(f"{_FRAMEWORK}.a2a:app", "Agent-to-Agent (A2A) protocol"),
+    "remote": LazySubcommand(f"{_FRAMEWORK}.remote:app", "Cross-protocol remote agent discovery"),
+    "runtimes": LazySubcommand(f"{_FRAMEWORK}.runtimes:app", "Agent runtime management"),
+    "daemon": LazySubcommand(f"{_FRAMEWORK}.daemon:app", "Generic agent daemon management"),
+    # CLI-package-local commands
+    "serve": LazySubcommand(
+        "taskforce_cli.commands.serve:app", "Run Taskforce as a REST webservice"
+    ),
+    "up": LazySubcommand(
+        "taskforce_cli.commands.up:app", "Start Taskforce + web UI (one command)"
+    ),
+}
 
 # --- Agent commands (optional, loaded if packages installed) ---
 #
@@ -62,8 +58,6 @@ app.add_typer(up.app, name="up", help="Start Taskforce + web UI (one command)")
 # hardcoded fallback below covers any other agent package that doesn't
 # yet declare a ``taskforce.cli_apps`` entry-point.
 
-from taskforce.application.agent_plugin_registry import load_cli_apps as _load_cli_apps
-
 _AGENT_CLI_HELP: dict[str, str] = {
     "epic": "Epic orchestration (multi-agent)",
     "rag": "RAG agent operations",
@@ -71,10 +65,19 @@ _AGENT_CLI_HELP: dict[str, str] = {
 
 _registered_agent_cli: set[str] = set()
 
-for _name, _cli_app in _load_cli_apps().items():
-    app.add_typer(_cli_app, name=_name, help=_AGENT_CLI_HELP.get(_name, ""))
+for _name, _import_path in _cli_app_import_paths().items():
+    _SUBCOMMANDS[_name] = LazySubcommand(_import_path, _AGENT_CLI_HELP.get(_name, ""))
     _registered_agent_cli.add(_name)
 
+app = typer.Typer(
+    name="taskforce",
+    help="Taskforce - AI Agent Framework",
+    add_completion=True,
+    no_args_is_help=True,
+    rich_markup_mode="rich",
+    cls=lazy_group(_SUBCOMMANDS),
+)
+
 
 def _register_fallback_cli(name: str, import_path: str) -> None:
     """Import a CLI app the legacy way and warn — used only if no entry-point."""
@@ -162,13 +165,13 @@ def version():
 
     tf_console = TaskforceConsole()
     tf_console.print_banner()
-    console.print(f"[bold blue]Version:[/bold blue] [cyan]{__version__}[/cyan]")
+    tf_console.console.print(f"[bold blue]Version:[/bold blue] [cyan]{__version__}[/cyan]")
 
     # Show installed agent packages
-    _print_agent_packages()
+    _print_agent_packages(tf_console.console)
 
 
-def _print_agent_packages() -> None:
+def _print_agent_packages(console: Console) -> None:
     """Print which optional agent packages are installed."""
     agents = [
         ("taskforce-butler", "taskforce_butler"),
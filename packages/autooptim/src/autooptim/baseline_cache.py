@@ -0,0 +1,69 @@
+"""Baseline score cache keyed by commit hash.
+
+Evaluating the baseline costs as much as a full experiment. The scores of
+a given commit under a given eval task do not change, so they are cached
+in a JSON file outside the git-managed area. A resumed or restarted
+campaign on the same commit reuses the recorded scores instead of running
+the evaluator again.
+"""
+
+import json
+import logging
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+
+from autooptim.models import Scores
+
+logger = logging.getLogger(__name__)
+
+
+class BaselineCache:
+    """JSON-file cache of (commit, task, runs) -> baseline scores."""
+
+    def __init__(self, cache_path: Path) -> None:
+        self.cache_path = cache_path
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(sha: str, task_name: str, num_runs: int) -> str:
+        return f"{sha}:{task_name}:{num_runs}"
+
+    def _read(self) -> dict:
+        if not self.cache_path.exists():
+            return {}
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Ignoring unreadable baseline cache %s: %s", self.cache_path, exc)
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def get(self, sha: str, task_name: str, num_runs: int) -> tuple[Scores, float] | None:
+        """Return cached (scores, composite) for the commit, or None."""
+        with self._lock:
+            entry = self._read().get(self._key(sha, task_name, num_runs))
+        if not entry:
+            return None
+        return Scores(values=entry.get("scores", {})), float(entry["composite"])
+
+    def put(
+        self,
+        sha: str,
+        task_name: str,
+        num_runs: int,
+        scores: Scores,
+        composite: float,
+    ) -> None:
+        """Record the baseline scores for a commit."""
+        with self._lock:
+            data = self._read()
+            data[self._key(sha, task_name, num_runs)] = {
+                "scores": scores.values,
+                "composite": composite,
+                "timestamp": datetime.now(UTC).isoformat(),
+            }
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            tmp.replace(self.cache_path)
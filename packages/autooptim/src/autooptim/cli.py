@@ -3,6 +3,7 @@
 Usage:
     autooptim run --config my_optimization.yaml
     autooptim run --config config.yaml --max-iterations 20 --resume
+    autooptim run --config config.yaml --parallel 4
     autooptim dashboard                           # auto-detect latest log
     autooptim dashboard --log .autooptim/logs/run-20260322.tsv
     autooptim dashboard --config config.yaml      # adds budget info
@@ -67,6 +68,12 @@ def main() -> None:
         default=None,
         help="Override number of eval runs per experiment",
     )
+    run_parser.add_argument(
+        "--parallel",
+        type=int,
+        default=None,
+        help="Run N experiments concurrently in isolated git worktrees",
+    )
     run_parser.add_argument(
         "--resume",
         action="store_true",
@@ -113,6 +120,8 @@ def main() -> None:
             config.eval_mode = args.eval_mode
         if args.eval_runs is not None:
             config.eval_runs = args.eval_runs
+        if args.parallel is not None:
+            config.parallel_workers = max(1, args.parallel)
         if args.resume:
             config.resume = True
 
@@ -123,6 +132,7 @@ def main() -> None:
         logger.info("  tolerance: %.3f", config.tolerance)
         logger.info("  max_iterations: %s", config.max_iterations or "unlimited")
         logger.info("  max_cost: $%.2f", config.max_cost_usd)
+        logger.info("  parallel_workers: %d", config.parallel_workers)
 
         try:
             run(config)
@@ -67,6 +67,7 @@ def load_config(config_path: str | Path) -> RunConfig:
             "large_improvement_threshold", 0.05
         ),
         eval_mode=raw.get("runner", {}).get("eval_mode", "quick"),
+        parallel_workers=max(1, int(raw.get("runner", {}).get("parallel_workers", 1))),
     )
 
 
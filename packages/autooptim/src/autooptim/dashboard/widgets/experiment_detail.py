@@ -36,6 +36,7 @@ class ExperimentDetail(Static):
             ExperimentStatus.DISCARDED: "red",
             ExperimentStatus.ERROR: "yellow",
             ExperimentStatus.BASELINE: "blue",
+            ExperimentStatus.SKIPPED: "dim",
         }
         color = status_colors.get(r.status, "white")
         status_text = f"[{color}]{r.status.value.upper()}[/]"
@@ -1,6 +1,9 @@
 """Git operations for the optimization loop.
 
 Manages branching, committing experiments, and discarding failed ones.
+Parallel campaigns additionally materialize detached worktrees that share
+the object database, so a winning experiment commit can be fast-forwarded
+onto the campaign branch without copying files around.
 All operations are local — never pushes to remote.
 """
 
@@ -43,6 +46,11 @@ class GitManager:
         result = self._run("rev-parse", "--short", "HEAD")
         return result.stdout.strip()
 
+    def resolve_sha(self, ref: str = "HEAD") -> str:
+        """Return the full SHA that *ref* points to."""
+        result = self._run("rev-parse", ref)
+        return result.stdout.strip()
+
     def has_uncommitted_changes(self) -> bool:
         """Check if there are uncommitted changes in the working tree."""
         result = self._run("status", "--porcelain", check=False)
@@ -68,6 +76,22 @@ class GitManager:
         self._run("reset", "--hard", sha)
         logger.info("Reset to %s", sha)
 
+    def fast_forward(self, sha: str) -> None:
+        """Fast-forward the current branch to *sha* (fails if not a descendant)."""
+        self._run("merge", "--ff-only", sha)
+        logger.info("Fast-forwarded to %s", sha)
+
+    def add_worktree(self, path: Path, sha: str) -> None:
+        """Create a detached worktree at *path* checked out at *sha*."""
+        self._run("worktree", "add", "--detach", str(path), sha)
+        logger.info("Added worktree %s at %s", path, sha)
+
+    def remove_worktree(self, path: Path) -> None:
+        """Remove a worktree created by :meth:`add_worktree`."""
+        self._run("worktree", "remove", "--force", str(path), check=False)
+        self._run("worktree", "prune", check=False)
+        logger.info("Removed worktree %s", path)
+
     def stash_save(self, message: str = "autooptim-stash") -> bool:
         """Stash current changes. Returns True if something was stashed."""
         result = self._run("stash", "push", "-m", message, check=False)
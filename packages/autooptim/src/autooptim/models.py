@@ -18,6 +18,7 @@ class ExperimentStatus(Enum):
     DISCARDED = "discarded"
     ERROR = "error"
     BASELINE = "baseline"
+    SKIPPED = "skipped"  # not evaluated (no change, or budget ran out)
 
 
 @dataclass
@@ -194,3 +195,4 @@ class RunConfig:
     large_improvement_threshold: float = 0.05
     resume: bool = False
     eval_mode: str = "quick"  # task name passed to evaluator (e.g. "quick", "full", "daily")
+    parallel_workers: int = 1  # >1 = concurrent experiments in isolated git worktrees
@@ -0,0 +1,153 @@
+"""Building blocks for parallel optimization campaigns.
+
+A parallel campaign runs several independent proposals per round, each in
+its own detached git worktree, all branched from the current baseline
+commit. Only the best experiment that clears the tolerance is
+fast-forwarded onto the campaign branch; every other experiment of the
+round is discarded because it was never evaluated on top of the winner.
+
+This module holds the domain-agnostic pieces: the shared budget, the
+worktree pool and winner selection. The loop itself lives in ``runner``.
+"""
+
+from __future__ import annotations
+
+import logging
+import shutil
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Self
+
+from autooptim.git_manager import GitManager
+from autooptim.models import ExperimentPlan, Scores
+
+logger = logging.getLogger(__name__)
+
+
+class SharedBudget:
+    """Iteration and cost budget shared by concurrent workers.
+
+    ``reserve`` hands out experiment slots until either the iteration
+    limit or the cost ceiling is reached; ``charge`` books eval cost as
+    workers finish. Both are thread-safe.
+    """
+
+    def __init__(self, max_iterations: int, max_cost_usd: float, spent_usd: float = 0.0) -> None:
+        self.max_iterations = max_iterations
+        self.max_cost_usd = max_cost_usd
+        self._spent = spent_usd
+        self._reserved = 0
+        self._lock = threading.Lock()
+
+    @property
+    def spent_usd(self) -> float:
+        with self._lock:
+            return self._spent
+
+    @property
+    def iterations(self) -> int:
+        with self._lock:
+            return self._reserved
+
+    def exhausted(self) -> bool:
+        """Whether no further experiment may be started."""
+        with self._lock:
+            return self._exhausted_locked()
+
+    def _exhausted_locked(self) -> bool:
+        if self.max_iterations > 0 and self._reserved >= self.max_iterations:
+            return True
+        return self._spent >= self.max_cost_usd
+
+    def reserve(self) -> bool:
+        """Claim one experiment slot. Returns False if the budget is spent."""
+        with self._lock:
+            if self._exhausted_locked():
+                return False
+            self._reserved += 1
+            return True
+
+    def charge(self, cost_usd: float) -> None:
+        """Book eval cost against the shared ceiling."""
+        with self._lock:
+            self._spent += cost_usd
+
+
+@dataclass
+class WorkerOutcome:
+    """Result of one experiment evaluated inside a worktree."""
+
+    experiment_id: int
+    plan: ExperimentPlan
+    commit_sha: str = ""
+    scores: Scores = field(default_factory=Scores)
+    composite: float = 0.0
+    eval_cost_usd: float = 0.0
+    files_modified: list[str] = field(default_factory=list)
+    duration_seconds: float = 0.0
+    error: str | None = None
+    skipped: bool = False  # budget ran out before evaluation
+
+
+def select_winner(
+    outcomes: list[WorkerOutcome], baseline_composite: float, tolerance: float
+) -> WorkerOutcome | None:
+    """Pick the experiment to keep from one round.
+
+    Candidates are evaluated experiments whose composite clears
+    ``baseline - tolerance`` (the same rule as the serial loop). The
+    highest composite wins; ties go to the lowest experiment id so the
+    choice is deterministic regardless of completion order.
+    """
+    candidates = [
+        o
+        for o in outcomes
+        if o.error is None and not o.skipped and o.composite >= baseline_composite - tolerance
+    ]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda o: (o.composite, -o.experiment_id))
+
+
+class WorktreePool:
+    """A fixed set of detached worktrees sharing the main repo's objects.
+
+    Use as a context manager; worktrees live in a temp directory outside
+    the project so ``git clean`` in the main tree never touches them.
+    """
+
+    def __init__(self, git: GitManager, size: int, base_sha: str) -> None:
+        self._git = git
+        self.size = size
+        self._base_sha = base_sha
+        self._root: Path | None = None
+        self.paths: list[Path] = []
+
+    def __enter__(self) -> Self:
+        self._root = Path(tempfile.mkdtemp(prefix="autooptim-worktrees-"))
+        try:
+            for i in range(self.size):
+                path = self._root / f"worker-{i}"
+                self._git.add_worktree(path, self._base_sha)
+                self.paths.append(path)
+        except BaseException:
+            # ``__exit__`` does not run when ``__enter__`` raises.
+            self.__exit__(None, None, None)
+            raise
+        return self
+
+    def reset_all(self, sha: str) -> None:
+        """Point every worktree at *sha* with a clean working tree."""
+        for path in self.paths:
+            wt = GitManager(path)
+            wt.reset_to_sha(sha)
+            wt.clean_working_tree()
+
+    def __exit__(self, *exc_info: object) -> None:
+        for path in self.paths:
+            self._git.remove_worktree(path)
+        if self._root is not None:
+            shutil.rmtree(self._root, ignore_errors=True)
+        self.paths = []
@@ -2,22 +2,37 @@
 
 Orchestrates the full cycle: propose -> mutate -> eval -> keep/discard.
 All domain-specific behavior comes from the config-driven components.
+
+With ``runner.parallel_workers > 1`` the loop runs in rounds: each round
+proposes up to N experiments, evaluates them concurrently in isolated git
+worktrees and fast-forwards only the best passing one onto the campaign
+branch (see ``autooptim.parallel``).
 """
 
 import importlib
 import json
 import logging
+import subprocess
 import time
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
 from pathlib import Path
 
-from autooptim.errors import GitError, MutationError, PreflightError, ProposerError
+from autooptim.baseline_cache import BaselineCache
+from autooptim.errors import (
+    AutoOptimError,
+    GitError,
+    MutationError,
+    PreflightError,
+    ProposerError,
+)
 from autooptim.evaluators.command_evaluator import CommandEvaluator
 from autooptim.evaluators.script_evaluator import ScriptEvaluator
 from autooptim.experiment_log import ExperimentLog
 from autooptim.git_manager import GitManager
 from autooptim.metric import ConfigurableMetric
 from autooptim.models import (
+    ExperimentPlan,
     ExperimentResult,
     ExperimentStatus,
     RunConfig,
@@ -26,6 +41,7 @@ from autooptim.models import (
 from autooptim.mutators.code_mutator import CodeMutator
 from autooptim.mutators.text_mutator import TextMutator
 from autooptim.mutators.yaml_mutator import YamlMutator
+from autooptim.parallel import SharedBudget, WorkerOutcome, WorktreePool, select_winner
 from autooptim.proposer import ExperimentProposer
 
 logger = logging.getLogger(__name__)
@@ -114,7 +130,7 @@ def _save_state(
         "experiment_id": experiment_id,
         "baseline_sha": baseline_sha,
         "baseline_composite": baseline_composite,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": datetime.now(UTC).isoformat(),
     }
     state_file.write_text(json.dumps(state, indent=2), encoding="utf-8")
 
@@ -145,7 +161,7 @@ def _append_global_history(
         lines.append("Persistent log of all experiments across campaigns and runs.\n")
         lines.append("The proposer uses this to avoid repeating failed approaches.\n\n")
 
-    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+    timestamp = datetime.now(UTC).strftime("%Y-%m-%d %H:%M UTC")
     lines.append(f"## Campaign: {campaign_name} ({timestamp})\n\n")
 
     for r in real_results:
@@ -178,6 +194,288 @@ def _cleanup_state(state_file: Path) -> None:
         state_file.unlink()
 
 
+def _run_worktree_experiment(
+    config: RunConfig,
+    metric: ConfigurableMetric,
+    budget: SharedBudget,
+    experiment_id: int,
+    plan: ExperimentPlan,
+    worktree: Path,
+    baseline_scores: Scores,
+) -> WorkerOutcome:
+    """Mutate, commit and evaluate one experiment inside its own worktree.
+
+    Runs on a worker thread. Mutation, git, evaluator and subprocess
+    failures are reported through ``WorkerOutcome.error`` so one broken
+    experiment cannot sink the round.
+    """
+    start = time.time()
+    outcome = WorkerOutcome(experiment_id=experiment_id, plan=plan)
+    try:
+        mutator = _build_mutators(config, worktree).get(plan.category)
+        if mutator is None:
+            outcome.error = f"No mutator for category: {plan.category}"
+            return outcome
+
+        try:
+            outcome.files_modified = mutator.apply(plan)
+        except (MutationError, PreflightError) as e:
+            outcome.error = f"Mutation failed: {e}"
+            outcome.files_modified = [f.path for f in plan.files]
+            return outcome
+
+        if not outcome.files_modified:
+            logger.warning("Exp #%d: no files were modified. Skipping eval.", experiment_id)
+            outcome.skipped = True
+            return outcome
+
+        outcome.commit_sha = GitManager(worktree).commit_experiment(
+            experiment_id, plan.description, outcome.files_modified
+        )
+
+        if budget.spent_usd >= config.max_cost_usd:
+            logger.info("Exp #%d: cost budget reached before eval. Skipping.", experiment_id)
+            outcome.skipped = True
+            return outcome
+
+        evaluator = _build_evaluator(config, worktree, metric)
+        task_name = _get_eval_task_name(config, experiment_id)
+        logger.info(
+            "Exp #%d: running eval %s (%d runs) in %s",
+            experiment_id,
+            task_name,
+            config.eval_runs,
+            worktree,
+        )
+        outcome.scores, outcome.composite, outcome.eval_cost_usd = evaluator.evaluate(
+            task_name=task_name,
+            num_runs=config.eval_runs,
+            baseline_scores=baseline_scores,
+        )
+        budget.charge(outcome.eval_cost_usd)
+    except (AutoOptimError, OSError, subprocess.SubprocessError) as exc:
+        outcome.error = f"Unexpected error: {exc}"
+    finally:
+        outcome.duration_seconds = time.time() - start
+    return outcome
+
+
+def _run_parallel_loop(
+    config: RunConfig,
+    git: GitManager,
+    experiment_log: ExperimentLog,
+    proposer: ExperimentProposer,
+    metric: ConfigurableMetric,
+    evaluator: CommandEvaluator | ScriptEvaluator,
+    baseline_cache: BaselineCache,
+    state_file: Path,
+    next_id: int,
+    baseline_scores: Scores,
+    baseline_composite: float,
+) -> tuple[int, float, float]:
+    """Run the experiment loop in rounds of concurrent worktree experiments.
+
+    Results are appended to the experiment log in experiment-id order, so
+    the log is identical no matter which worker finishes first.
+
+    Returns:
+        Tuple of (iterations, total_cost, final baseline composite).
+    """
+    workers = config.parallel_workers
+    budget = SharedBudget(config.max_iterations, config.max_cost_usd, experiment_log.total_cost())
+    experiment_id = next_id
+    baseline_sha = git.get_current_sha()
+
+    with (
+        WorktreePool(git, workers, git.resolve_sha()) as pool,
+        ThreadPoolExecutor(max_workers=workers, thread_name_prefix="autooptim") as executor,
+    ):
+        while not budget.exhausted():
+            round_sha = git.resolve_sha()
+            pool.reset_all(round_sha)
+
+            logger.info("")
+            logger.info("=" * 60)
+            logger.info(
+                "  ROUND from %s  (%d workers, budget: $%.2f/$%.2f)",
+                baseline_sha,
+                workers,
+                budget.spent_usd,
+                config.max_cost_usd,
+            )
+            logger.info("=" * 60)
+
+            # 1. Propose serially — the proposer reads the shared log and the
+            #    main tree, both of which only change between rounds.
+            jobs: list[tuple[int, ExperimentPlan, Path]] = []
+            for worktree in pool.paths:
+                if not budget.reserve():
+                    break
+                exp_id = experiment_id
+                experiment_id += 1
+                try:
+                    plan = proposer.propose(baseline_scores)
+                except ProposerError as e:
+                    logger.error("Proposer failed for exp #%d: %s", exp_id, e)
+                    continue
+                logger.info("Proposed #%d [%s]: %s", exp_id, plan.category, plan.description)
+                jobs.append((exp_id, plan, worktree))
+
+            if not jobs:
+                continue
+
+            # 2. Mutate + commit + evaluate concurrently.
+            futures = [
+                executor.submit(
+                    _run_worktree_experiment,
+                    config,
+                    metric,
+                    budget,
+                    exp_id,
+                    plan,
+                    worktree,
+                    baseline_scores,
+                )
+                for exp_id, plan, worktree in jobs
+            ]
+            outcomes = sorted((f.result() for f in futures), key=lambda o: o.experiment_id)
+
+            # 3. Keep at most one winner per round. A large quick-eval win
+            #    must survive the same overfitting guard as the serial loop
+            #    (a full eval in the main tree) before it is logged or cached.
+            round_baseline = baseline_composite
+            winner = select_winner(outcomes, round_baseline, config.tolerance)
+            if winner is not None:
+                git.fast_forward(winner.commit_sha)
+                new_scores, new_composite = winner.scores, winner.composite
+                if (
+                    winner.composite - round_baseline > config.large_improvement_threshold
+                    and config.eval_mode == "quick"
+                ):
+                    logger.info("Large improvement. Running full eval to validate...")
+                    full_scores, full_composite, full_cost = evaluator.evaluate(
+                        task_name=config.evaluator.full_task,
+                        num_runs=config.eval_runs,
+                    )
+                    budget.charge(full_cost)
+                    if full_composite < round_baseline - config.tolerance:
+                        logger.warning(
+                            "Full eval REGRESSED (%.4f < %.4f). Reverting experiment #%d.",
+                            full_composite,
+                            round_baseline,
+                            winner.experiment_id,
+                        )
+                        git.reset_to_sha(round_sha)
+                        winner = None
+                    else:
+                        new_scores, new_composite = full_scores, full_composite
+                        logger.info("Full eval CONFIRMED. New baseline: %.4f", new_composite)
+            if winner is not None:
+                baseline_cache.put(
+                    git.resolve_sha(),
+                    _get_eval_task_name(config, winner.experiment_id),
+                    config.eval_runs,
+                    winner.scores,
+                    winner.composite,
+                )
+                baseline_scores = new_scores
+                baseline_composite = new_composite
+                baseline_sha = winner.commit_sha
+                logger.info(
+                    "KEPT #%d — new baseline: %.4f", winner.experiment_id, baseline_composite
+                )
+            else:
+                logger.info("No experiment beat the baseline: %.4f", baseline_composite)
+
+            # 4. Log every experiment of the round in deterministic order.
+            for o in outcomes:
+                if o.skipped:
+                    status = ExperimentStatus.SKIPPED
+                elif o.error is not None:
+                    logger.error("Exp #%d failed: %s", o.experiment_id, o.error)
+                    status = ExperimentStatus.ERROR
+                elif o is winner:
+                    status = ExperimentStatus.KEPT
+                else:
+                    status = ExperimentStatus.DISCARDED
+                evaluated = status in (ExperimentStatus.KEPT, ExperimentStatus.DISCARDED)
+                experiment_log.append(
+                    ExperimentResult(
+                        experiment_id=o.experiment_id,
+                        timestamp=datetime.now(UTC),
+                        category=o.plan.category,
+                        description=o.plan.description,
+                        hypothesis=o.plan.hypothesis,
+                        git_sha=o.commit_sha or round_sha[:7],
+                        status=status,
+                        scores=o.scores,
+                        composite_score=o.composite,
+                        baseline_composite=(
+                            baseline_composite
+                            if status == ExperimentStatus.KEPT
+                            else round_baseline
+                        ),
+                        eval_runs=config.eval_runs if evaluated else 0,
+                        eval_cost_usd=o.eval_cost_usd,
+                        files_modified=o.files_modified,
+                        duration_seconds=o.duration_seconds,
+                    )
+                )
+            _save_state(state_file, experiment_id, baseline_sha, baseline_composite)
+
+    return budget.iterations, budget.spent_usd, baseline_composite
+
+
+def _finish_campaign(
+    config: RunConfig,
+    project_root: Path,
+    experiment_log: ExperimentLog,
+    log_path: Path,
+    state_file: Path,
+    iterations: int,
+    total_cost: float,
+    baseline_composite: float,
+) -> None:
+    """Log the run summary, update global history and drop the state file."""
+    logger.info("")
+    logger.info("=" * 60)
+    logger.info("  AUTOOPTIM COMPLETE")
+    logger.info("=" * 60)
+    logger.info("Iterations: %d", iterations)
+    logger.info("Total cost: $%.2f", total_cost)
+    logger.info("Final baseline composite: %.4f", baseline_composite)
+    logger.info("Log: %s", log_path)
+
+    all_results = experiment_log.read_all()
+    kept = [r for r in all_results if r.status == ExperimentStatus.KEPT]
+    discarded = [r for r in all_results if r.status == ExperimentStatus.DISCARDED]
+    errors = [r for r in all_results if r.status == ExperimentStatus.ERROR]
+    skipped = [r for r in all_results if r.status == ExperimentStatus.SKIPPED]
+    logger.info(
+        "Kept: %d, Discarded: %d, Errors: %d, Skipped: %d",
+        len(kept),
+        len(discarded),
+        len(errors),
+        len(skipped),
+    )
+
+    if kept:
+        logger.info("Kept experiments:")
+        for r in kept:
+            logger.info(
+                "  #%d [%s]: %s (composite=%.4f)",
+                r.experiment_id,
+                r.category,
+                r.description,
+                r.composite_score,
+            )
+
+    # Append results to global experiment history (persists across runs)
+    _append_global_history(project_root, config.name, all_results)
+
+    _cleanup_state(state_file)
+
+
 def run(config: RunConfig) -> None:
     """Execute the optimization experiment loop.
 
@@ -188,7 +486,7 @@ def run(config: RunConfig) -> None:
         config: Full run configuration (typically loaded from YAML).
     """
     project_root = Path(config.project_root).resolve()
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+    timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
 
     # Set up log directory — use a stable campaign-based name so the log
     # persists across runs and crashes instead of starting fresh each time.
@@ -218,6 +516,7 @@ def run(config: RunConfig) -> None:
             logger.info("No existing log found, starting fresh")
 
     experiment_log = ExperimentLog(log_path)
+    baseline_cache = BaselineCache(project_root / ".autooptim" / "baseline_cache.json")
 
     # Create branch for this run (unless resuming)
     if not config.resume:
@@ -243,10 +542,20 @@ def run(config: RunConfig) -> None:
 
         baseline_task = _get_eval_task_name(config, 0)
         baseline_start = time.time()
-        baseline_scores, baseline_composite, baseline_cost = evaluator.evaluate(
-            task_name=baseline_task,
-            num_runs=config.eval_runs,
-        )
+        head_sha = git.resolve_sha()
+        cached = baseline_cache.get(head_sha, baseline_task, config.eval_runs)
+        if cached is not None:
+            baseline_scores, baseline_composite = cached
+            baseline_cost = 0.0
+            logger.info("Baseline cache hit for %s — skipping evaluation", head_sha[:7])
+        else:
+            baseline_scores, baseline_composite, baseline_cost = evaluator.evaluate(
+                task_name=baseline_task,
+                num_runs=config.eval_runs,
+            )
+            baseline_cache.put(
+                head_sha, baseline_task, config.eval_runs, baseline_scores, baseline_composite
+            )
         baseline_duration = time.time() - baseline_start
 
         # Use first category as default for baseline
@@ -254,7 +563,7 @@ def run(config: RunConfig) -> None:
 
         baseline_result = ExperimentResult(
             experiment_id=0,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=datetime.now(UTC),
             category=first_category,
             description="Baseline (no changes)",
             hypothesis="Establish baseline performance",
@@ -285,6 +594,32 @@ def run(config: RunConfig) -> None:
     baseline_sha = git.get_current_sha()
     _save_state(state_file, next_id, baseline_sha, baseline_composite)
 
+    if config.parallel_workers > 1:
+        iterations, total_cost, baseline_composite = _run_parallel_loop(
+            config,
+            git,
+            experiment_log,
+            proposer,
+            metric,
+            evaluator,
+            baseline_cache,
+            state_file,
+            next_id,
+            baseline_scores,
+            baseline_composite,
+        )
+        _finish_campaign(
+            config,
+            project_root,
+            experiment_log,
+            log_path,
+            state_file,
+            iterations,
+            total_cost,
+            baseline_composite,
+        )
+        return
+
     # --- Experiment Loop ---
     iteration = 0
     total_cost = experiment_log.total_cost()
@@ -345,7 +680,7 @@ def run(config: RunConfig) -> None:
 
                 error_result = ExperimentResult(
                     experiment_id=experiment_id,
-                    timestamp=datetime.now(timezone.utc),
+                    timestamp=datetime.now(UTC),
                     category=plan.category,
                     description=plan.description,
                     hypothesis=plan.hypothesis,
@@ -408,6 +743,9 @@ def run(config: RunConfig) -> None:
                 baseline_scores = scores
                 baseline_composite = composite
                 baseline_sha = commit_sha
+                baseline_cache.put(
+                    git.resolve_sha(), task_name, config.eval_runs, scores, composite
+                )
                 logger.info("KEPT — new baseline: %.4f", baseline_composite)
             else:
                 status = ExperimentStatus.DISCARDED
@@ -417,7 +755,7 @@ def run(config: RunConfig) -> None:
             # 6. Log result
             result = ExperimentResult(
                 experiment_id=experiment_id,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=datetime.now(UTC),
                 category=plan.category,
                 description=plan.description,
                 hypothesis=plan.hypothesis,
@@ -488,36 +826,13 @@ def run(config: RunConfig) -> None:
                 pass
             continue
 
-    # --- Summary ---
-    logger.info("")
-    logger.info("=" * 60)
-    logger.info("  AUTOOPTIM COMPLETE")
-    logger.info("=" * 60)
-    logger.info("Iterations: %d", iteration - 1)
-    logger.info("Total cost: $%.2f", total_cost)
-    logger.info("Final baseline composite: %.4f", baseline_composite)
-    logger.info("Log: %s", log_path)
-
-    all_results = experiment_log.read_all()
-    kept = [r for r in all_results if r.status == ExperimentStatus.KEPT]
-    discarded = [r for r in all_results if r.status == ExperimentStatus.DISCARDED]
-    errors = [r for r in all_results if r.status == ExperimentStatus.ERROR]
-    logger.info(
-        "Kept: %d, Discarded: %d, Errors: %d", len(kept), len(discarded), len(errors)
+    _finish_campaign(
+        config,
+        project_root,
+        experiment_log,
+        log_path,
+        state_file,
+        iteration - 1,
+        total_cost,
+        baseline_composite,
     )
-
-    if kept:
-        logger.info("Kept experiments:")
-        for r in kept:
-            logger.info(
-                "  #%d [%s]: %s (composite=%.4f)",
-                r.experiment_id,
-                r.category,
-                r.description,
-                r.composite_score,
-            )
-
-    # Append results to global experiment history (persists across runs)
-    _append_global_history(project_root, config.name, all_results)
-
-    _cleanup_state(state_file)
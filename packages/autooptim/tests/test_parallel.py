@@ -0,0 +1,308 @@
+"""Tests for parallel worktree campaigns and the baseline cache."""
+
+import json
+import subprocess
+import threading
+from pathlib import Path
+from typing import ClassVar
+
+import pytest
+
+from autooptim import runner
+from autooptim.baseline_cache import BaselineCache
+from autooptim.errors import GitError
+from autooptim.experiment_log import ExperimentLog
+from autooptim.git_manager import GitManager
+from autooptim.models import (
+    CategoryConfig,
+    ExperimentPlan,
+    ExperimentStatus,
+    FileChange,
+    MutatorConfig,
+    RunConfig,
+    Scores,
+)
+from autooptim.parallel import SharedBudget, WorkerOutcome, WorktreePool, select_winner
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-b", "main", str(repo)], capture_output=True, check=True)
+    for key, value in (("user.email", "test@test.com"), ("user.name", "Test")):
+        subprocess.run(["git", "-C", str(repo), "config", key, value], check=True)
+    (repo / ".gitignore").write_text(".autooptim/\n.autooptim_state.json\n")
+    (repo / "prompts").mkdir()
+    (repo / "prompts" / "system.md").write_text("baseline prompt\n")
+    subprocess.run(["git", "-C", str(repo), "add", "."], capture_output=True, check=True)
+    subprocess.run(
+        ["git", "-C", str(repo), "commit", "-m", "Initial"], capture_output=True, check=True
+    )
+    return repo
+
+
+def _outcome(exp_id: int, composite: float, **kwargs) -> WorkerOutcome:
+    plan = ExperimentPlan(category="prompt", hypothesis="h", description="d", files=[])
+    return WorkerOutcome(experiment_id=exp_id, plan=plan, composite=composite, **kwargs)
+
+
+class TestSharedBudget:
+    def test_reserve_stops_at_max_iterations(self):
+        budget = SharedBudget(max_iterations=2, max_cost_usd=100.0)
+        assert budget.reserve()
+        assert budget.reserve()
+        assert not budget.reserve()
+        assert budget.iterations == 2
+
+    def test_cost_ceiling_is_shared_across_threads(self):
+        budget = SharedBudget(max_iterations=0, max_cost_usd=10.0)
+        threads = [threading.Thread(target=budget.charge, args=(1.0,)) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert budget.spent_usd == pytest.approx(10.0)
+        assert budget.exhausted()
+        assert not budget.reserve()
+
+
+class TestSelectWinner:
+    def test_highest_passing_composite_wins(self):
+        outcomes = [_outcome(3, 0.6), _outcome(1, 0.9), _outcome(2, 0.4)]
+        assert select_winner(outcomes, 0.5, 0.02).experiment_id == 1
+
+    def test_tie_goes_to_lowest_id(self):
+        outcomes = [_outcome(5, 0.7), _outcome(4, 0.7)]
+        assert select_winner(outcomes, 0.5, 0.0).experiment_id == 4
+
+    def test_errors_and_regressions_never_win(self):
+        outcomes = [_outcome(1, 0.99, error="boom"), _outcome(2, 0.1)]
+        assert select_winner(outcomes, 0.5, 0.02) is None
+
+
+def test_worktree_pool_creates_and_removes_worktrees(git_repo: Path):
+    git = GitManager(git_repo)
+    with WorktreePool(git, 2, git.resolve_sha()) as pool:
+        assert len(pool.paths) == 2
+        for path in pool.paths:
+            assert (path / "prompts" / "system.md").read_text() == "baseline prompt\n"
+        (pool.paths[0] / "prompts" / "system.md").write_text("dirty")
+        pool.reset_all(git.resolve_sha())
+        assert (pool.paths[0] / "prompts" / "system.md").read_text() == "baseline prompt\n"
+        paths = list(pool.paths)
+    assert not any(p.exists() for p in paths)
+    assert not git.has_uncommitted_changes()
+
+
+def test_worktree_pool_removes_added_worktrees_when_enter_fails(
+    git_repo: Path, monkeypatch: pytest.MonkeyPatch
+):
+    git = GitManager(git_repo)
+    add_worktree = git.add_worktree
+    added: list[Path] = []
+
+    def add_then_fail(path: Path, sha: str) -> None:
+        if added:
+            raise GitError("worktree add failed")
+        add_worktree(path, sha)
+        added.append(path)
+
+    monkeypatch.setattr(git, "add_worktree", add_then_fail)
+    pool = WorktreePool(git, 3, git.resolve_sha())
+
+    with pytest.raises(GitError):
+        pool.__enter__()
+
+    assert added and not any(p.exists() for p in added)
+    assert pool.paths == []
+    worktrees = subprocess.run(
+        ["git", "-C", str(git_repo), "worktree", "list", "--porcelain"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    assert worktrees.count("worktree ") == 1
+
+
+def test_baseline_cache_roundtrip(tmp_path: Path):
+    cache = BaselineCache(tmp_path / "cache.json")
+    assert cache.get("abc", "quick", 2) is None
+    cache.put("abc", "quick", 2, Scores(values={"accuracy": 0.8}), 0.75)
+    scores, composite = BaselineCache(tmp_path / "cache.json").get("abc", "quick", 2)
+    assert scores.values == {"accuracy": 0.8}
+    assert composite == 0.75
+    assert cache.get("abc", "full", 2) is None
+
+
+class _StubProposer:
+    """Proposes prompt rewrites whose 'quality' is encoded in the text."""
+
+    def __init__(self, qualities: list[float]) -> None:
+        self._qualities = iter(qualities)
+
+    def propose(self, baseline_scores: Scores) -> ExperimentPlan:
+        quality = next(self._qualities)
+        # ``None`` proposes no file changes, which the runner skips.
+        files = (
+            []
+            if quality is None
+            else [FileChange(path="prompts/system.md", action="modify", content=f"{quality}\n")]
+        )
+        return ExperimentPlan(
+            category="prompt",
+            hypothesis="better prompt",
+            description=f"quality {quality}",
+            files=files,
+        )
+
+
+class _StubEvaluator:
+    """Scores a tree by reading the quality written into the prompt file."""
+
+    calls: ClassVar[list[Path]] = []
+
+    def __init__(self, project_root: Path) -> None:
+        self.project_root = project_root
+
+    full_eval_quality: float | None = None
+
+    def evaluate(self, task_name, num_runs=1, baseline_scores=None):
+        _StubEvaluator.calls.append(self.project_root)
+        if task_name == "full" and _StubEvaluator.full_eval_quality is not None:
+            quality = _StubEvaluator.full_eval_quality
+            return Scores(values={"quality": quality}), quality, 1.0
+        text = (self.project_root / "prompts" / "system.md").read_text().strip()
+        quality = 0.5 if text == "baseline prompt" else float(text)
+        return Scores(values={"quality": quality}), quality, 1.0
+
+
+def _config(repo: Path, **overrides) -> RunConfig:
+    config = RunConfig(
+        name="parallel-test",
+        project_root=str(repo),
+        categories={
+            "prompt": CategoryConfig(mutator=MutatorConfig(type="text", allowed_paths=["prompts/"]))
+        },
+        max_iterations=4,
+        max_cost_usd=100.0,
+        eval_runs=1,
+        tolerance=0.0,
+        eval_mode="daily",
+        parallel_workers=2,
+    )
+    for key, value in overrides.items():
+        setattr(config, key, value)
+    return config
+
+
+@pytest.fixture
+def stubbed_runner(monkeypatch):
+    _StubEvaluator.calls = []
+    _StubEvaluator.full_eval_quality = None
+    monkeypatch.setattr(
+        runner, "_build_evaluator", lambda config, root, metric: _StubEvaluator(root)
+    )
+
+    def install(qualities: list[float]) -> None:
+        monkeypatch.setattr(
+            runner,
+            "ExperimentProposer",
+            lambda project_root, config, log: _StubProposer(qualities),
+        )
+
+    return install
+
+
+def test_parallel_run_keeps_one_winner_per_round(git_repo: Path, stubbed_runner):
+    # Round 1: exps 1+2 (0.7 beats 0.6). Round 2: exps 3+4 (0.65 < 0.7, 0.9 wins).
+    stubbed_runner([0.6, 0.7, 0.65, 0.9])
+    runner.run(_config(git_repo))
+
+    log_path = git_repo / ".autooptim" / "logs" / "parallel-test.tsv"
+    results = ExperimentLog(log_path).read_all()
+    assert [r.experiment_id for r in results] == [0, 1, 2, 3, 4]
+    assert [r.status for r in results] == [
+        ExperimentStatus.BASELINE,
+        ExperimentStatus.DISCARDED,
+        ExperimentStatus.KEPT,
+        ExperimentStatus.DISCARDED,
+        ExperimentStatus.KEPT,
+    ]
+
+    # Only the two winners landed on the campaign branch, in order.
+    log = subprocess.run(
+        ["git", "-C", str(git_repo), "log", "--format=%s"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.splitlines()
+    assert log[:2] == [
+        "autooptim experiment #4: quality 0.9",
+        "autooptim experiment #2: quality 0.7",
+    ]
+    assert (git_repo / "prompts" / "system.md").read_text() == "0.9\n"
+    # Experiments were evaluated in worktrees, not in the main tree.
+    assert all(p != git_repo.resolve() for p in _StubEvaluator.calls[1:])
+    worktrees = subprocess.run(
+        ["git", "-C", str(git_repo), "worktree", "list", "--porcelain"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    assert worktrees.count("worktree ") == 1
+
+
+def test_skipped_experiments_are_logged(git_repo: Path, stubbed_runner):
+    stubbed_runner([None, 0.7])
+    runner.run(_config(git_repo, max_iterations=2))
+
+    results = ExperimentLog(git_repo / ".autooptim" / "logs" / "parallel-test.tsv").read_all()
+    assert [(r.experiment_id, r.status) for r in results] == [
+        (0, ExperimentStatus.BASELINE),
+        (1, ExperimentStatus.SKIPPED),
+        (2, ExperimentStatus.KEPT),
+    ]
+    assert results[1].eval_runs == 0
+
+
+def test_winner_failing_full_eval_is_not_kept_or_cached(git_repo: Path, stubbed_runner):
+    # Quick eval says 0.9 (large win); the full eval says 0.1 — revert.
+    stubbed_runner([0.6, 0.9])
+    _StubEvaluator.full_eval_quality = 0.1
+    initial_sha = GitManager(git_repo).resolve_sha()
+    runner.run(_config(git_repo, max_iterations=2, eval_mode="quick"))
+
+    results = ExperimentLog(git_repo / ".autooptim" / "logs" / "parallel-test.tsv").read_all()
+    assert [r.status for r in results] == [
+        ExperimentStatus.BASELINE,
+        ExperimentStatus.DISCARDED,
+        ExperimentStatus.DISCARDED,
+    ]
+    assert GitManager(git_repo).resolve_sha() == initial_sha
+    cached = json.loads((git_repo / ".autooptim" / "baseline_cache.json").read_text())
+    assert list(cached) == [f"{initial_sha}:quick:1"]
+
+
+def test_cost_ceiling_stops_parallel_run(git_repo: Path, stubbed_runner):
+    # Baseline costs $1; each experiment $1 — ceiling allows one round only.
+    stubbed_runner([0.6, 0.7, 0.8, 0.9])
+    runner.run(_config(git_repo, max_iterations=0, max_cost_usd=3.0))
+
+    results = ExperimentLog(git_repo / ".autooptim" / "logs" / "parallel-test.tsv").read_all()
+    assert [r.experiment_id for r in results] == [0, 1, 2]
+
+
+def test_baseline_not_reevaluated_for_known_commit(git_repo: Path, stubbed_runner):
+    stubbed_runner([])
+    runner.run(_config(git_repo, max_iterations=0, max_cost_usd=0.5, parallel_workers=1))
+    assert len(_StubEvaluator.calls) == 1
+
+    # A fresh campaign on the same commit reuses the cached baseline.
+    log_path = git_repo / ".autooptim" / "logs" / "parallel-test.tsv"
+    log_path.unlink()
+    runner.run(_config(git_repo, max_iterations=0, max_cost_usd=0.0, parallel_workers=1))
+    assert len(_StubEvaluator.calls) == 1
+    baseline = ExperimentLog(log_path).read_all()[0]
+    assert baseline.composite_score == 0.5
+    assert baseline.eval_cost_usd == 0.0
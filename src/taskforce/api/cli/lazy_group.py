@@ -0,0 +1,132 @@
+"""Lazy sub-app registration for the ``taskforce`` CLI.
+
+Registering every command module with ``add_typer`` imports the whole
+application layer (and through it LiteLLM, FastAPI, prompt_toolkit, ...)
+before Typer has even parsed ``argv`` — ``taskforce version`` and shell
+completion paid seconds for modules they never use.
+:class:`LazyTyperGroup` keeps an ``import_path`` + help text per
+subcommand and imports the module only when that subcommand is resolved
+for execution. ``--help`` and top-level completion render from the
+registered help text alone.
+
+Usage::
+
+    app = typer.Typer(
+        cls=lazy_group(
+            {"run": LazySubcommand("taskforce.api.cli.commands.run:app", "Execute missions")}
+        )
+    )
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from difflib import get_close_matches
+from typing import Any
+
+import click
+import typer
+from typer.core import TyperGroup
+
+
+@dataclass(frozen=True)
+class LazySubcommand:
+    """A subcommand imported on first use.
+
+    Attributes:
+        import_path: ``"package.module:attr"`` of a ``typer.Typer`` (or a
+            ready ``click.Command``).
+        help: Help text shown in ``--help`` without importing the module;
+            also overrides the sub-app's own help once loaded, matching
+            ``add_typer(help=...)``.
+    """
+
+    import_path: str
+    help: str = ""
+
+
+class LazyTyperGroup(TyperGroup):
+    """``TyperGroup`` that resolves :attr:`lazy_subcommands` on demand.
+
+    Eagerly registered commands (``@app.command()``, ``add_typer``) keep
+    working unchanged and are listed first. Create concrete classes with
+    :func:`lazy_group`; Typer instantiates the group class itself.
+    """
+
+    lazy_subcommands: Mapping[str, LazySubcommand] = {}
+
+    def __init__(self, **attrs: Any) -> None:
+        super().__init__(**attrs)
+        self._loaded: dict[str, click.Command] = {}
+        self._listing_only = False
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        names = super().list_commands(ctx)
+        return names + [name for name in self.lazy_subcommands if name not in self.commands]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None:
+            return command
+        spec = self.lazy_subcommands.get(cmd_name)
+        if spec is None:
+            return None
+        if self._listing_only:
+            # Help / completion listings only need the name and help text.
+            return click.Command(cmd_name, help=spec.help, short_help=spec.help)
+        return self._load(cmd_name, spec)
+
+    def resolve_command(
+        self, ctx: click.Context, args: list[str]
+    ) -> tuple[str | None, click.Command | None, list[str]]:
+        try:
+            return click.Group.resolve_command(self, ctx, args)
+        except click.UsageError as exc:
+            if self.suggest_commands and args:
+                matches = get_close_matches(args[0], self.list_commands(ctx))
+                if matches:
+                    suggestions = ", ".join(f"{m!r}" for m in matches)
+                    exc.message = f"{exc.message.rstrip('.')}. Did you mean {suggestions}?"
+            raise
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        with self._listing():
+            super().format_help(ctx, formatter)
+
+    def shell_complete(self, ctx: click.Context, incomplete: str) -> list[Any]:
+        with self._listing():
+            return super().shell_complete(ctx, incomplete)
+
+    @contextmanager
+    def _listing(self) -> Iterator[None]:
+        previous, self._listing_only = self._listing_only, True
+        try:
+            yield
+        finally:
+            self._listing_only = previous
+
+    def _load(self, name: str, spec: LazySubcommand) -> click.Command:
+        command = self._loaded.get(name)
+        if command is not None:
+            return command
+        module_path, _, attr = spec.import_path.partition(":")
+        try:
+            target = getattr(importlib.import_module(module_path), attr)
+        except (ImportError, AttributeError) as exc:
+            raise click.ClickException(
+                f"Command {name!r} is unavailable: cannot load {spec.import_path} ({exc})"
+            ) from exc
+        command = typer.main.get_group(target) if isinstance(target, typer.Typer) else target
+        command.name = name
+        if spec.help:
+            command.help = spec.help
+        self._loaded[name] = command
+        return command
+
+
+def lazy_group(subcommands: Mapping[str, LazySubcommand]) -> type[LazyTyperGroup]:
+    """Return a :class:`LazyTyperGroup` subclass bound to *subcommands*."""
+    return type("LazyTaskforceGroup", (LazyTyperGroup,), {"lazy_subcommands": dict(subcommands)})
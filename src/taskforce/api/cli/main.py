@@ -14,22 +14,31 @@ try:
 except ImportError:
     # Fallback: framework-only CLI (no agent commands)
     import typer
-    from rich.console import Console
 
-    from taskforce.api.cli.commands import (
-        a2a,
-        acp,
-        chat,
-        config,
-        goals,
-        memory,
-        missions,
-        remote,
-        run,
-        runtimes,
-        skills,
-        tools,
-    )
+    from taskforce.api.cli.lazy_group import LazySubcommand, lazy_group
+
+    # Command modules are imported only when their subcommand runs.
+    _COMMANDS = "taskforce.api.cli.commands"
+    _SUBCOMMANDS = {
+        "run": LazySubcommand(f"{_COMMANDS}.run:app", "Execute missions"),
+        "chat": LazySubcommand(f"{_COMMANDS}.chat:app", "Interactive chat mode"),
+        "tools": LazySubcommand(f"{_COMMANDS}.tools:app", "Tool management"),
+        "skills": LazySubcommand(f"{_COMMANDS}.skills:app", "Skill management"),
+        "config": LazySubcommand(f"{_COMMANDS}.config:app", "Configuration management"),
+        "memory": LazySubcommand(f"{_COMMANDS}.memory:app", "Memory management"),
+        "missions": LazySubcommand(
+            f"{_COMMANDS}.missions:app", "Mission templates and runtime control"
+        ),
+        "goals": LazySubcommand(
+            f"{_COMMANDS}.goals:app", "Standing-goal management (proactive layer)"
+        ),
+        "acp": LazySubcommand(f"{_COMMANDS}.acp:app", "Agent Communication Protocol"),
+        "a2a": LazySubcommand(f"{_COMMANDS}.a2a:app", "Agent-to-Agent (A2A) protocol"),
+        "remote": LazySubcommand(
+            f"{_COMMANDS}.remote:app", "Cross-protocol remote agent discovery"
+        ),
+        "runtimes": LazySubcommand(f"{_COMMANDS}.runtimes:app", "Agent runtime management"),
+    }
 
     app = typer.Typer(
         name="taskforce",
@@ -37,24 +46,9 @@ except ImportError:
         add_completion=True,
         no_args_is_help=True,
         rich_markup_mode="rich",
+        cls=lazy_group(_SUBCOMMANDS),
     )
 
-    console = Console()
-
-    # Register framework commands
-    app.add_typer(run.app, name="run", help="Execute missions")
-    app.add_typer(chat.app, name="chat", help="Interactive chat mode")
-    app.add_typer(tools.app, name="tools", help="Tool management")
-    app.add_typer(skills.app, name="skills", help="Skill management")
-    app.add_typer(config.app, name="config", help="Configuration management")
-    app.add_typer(memory.app, name="memory", help="Memory management")
-    app.add_typer(missions.app, name="missions", help="Mission templates and runtime control")
-    app.add_typer(goals.app, name="goals", help="Standing-goal management (proactive layer)")
-    app.add_typer(acp.app, name="acp", help="Agent Communication Protocol")
-    app.add_typer(a2a.app, name="a2a", help="Agent-to-Agent (A2A) protocol")
-    app.add_typer(remote.app, name="remote", help="Cross-protocol remote agent discovery")
-    app.add_typer(runtimes.app, name="runtimes", help="Agent runtime management")
-
     @app.callback()
     def main(
         ctx: typer.Context,
@@ -73,9 +67,11 @@ except ImportError:
     @app.command()
     def version():
         """Show Taskforce version."""
+        from rich.console import Console
+
         from taskforce import __version__
 
-        console.print(f"Taskforce v{__version__}")
+        Console().print(f"Taskforce v{__version__}")
 
 
 if __name__ == "__main__":
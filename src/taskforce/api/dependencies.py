@@ -397,6 +397,7 @@ def get_gateway():
         workflow_runner=_workflow_runner,
         components_provider=_components_provider,
         actions_summary_mode=actions_summary_mode,
+        broadcast_outbox=InfrastructureBuilder().build_broadcast_outbox(work_dir=work_dir),
     )
 
     # Inject gateway into executor so channel-targeted ask_user is routed
@@ -571,7 +572,8 @@ def get_scheduler():
     from taskforce.infrastructure.scheduler.scheduler_service import SchedulerService
 
     work_dir = os.getenv("TASKFORCE_WORK_DIR", ".taskforce")
-    return SchedulerService(work_dir=work_dir)
+    store = os.getenv("TASKFORCE_SCHEDULER_STORE", "file")
+    return SchedulerService(work_dir=work_dir, store=store)
 
 
 # ---------------------------------------------------------------------------
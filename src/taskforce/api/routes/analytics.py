@@ -54,6 +54,7 @@ def token_usage(
                 total_tokens=b.total_tokens,
                 cost_usd=b.cost_usd,
                 call_count=b.call_count,
+                cached_prompt_tokens=b.cached_prompt_tokens,
             )
             for b in buckets
         ],
@@ -9,6 +9,10 @@ Provides REST endpoints for managing persistent agent conversations:
 - ``POST   /conversations/{id}/messages``      -- append a message (and run agent)
 - ``POST   /conversations/{id}/archive``       -- archive a conversation
 - ``DELETE /conversations/{id}``               -- permanently delete a conversation
+
+The two list endpoints are cursor-paginated: pass ``limit`` and, for the
+following pages, the ``cursor`` returned in the ``X-Next-Cursor`` response
+header (absent on the last page).
 """
 
 from __future__ import annotations
@@ -20,7 +24,7 @@ from datetime import datetime
 from typing import Any, AsyncIterator
 
 import structlog
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
@@ -44,6 +48,9 @@ _chat_logger = structlog.get_logger("taskforce.api.routes.conversations")
 
 router = APIRouter(prefix="/conversations", tags=["conversations"])
 
+#: Response header carrying the cursor of the next page of a listing.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 def _default_profile(*, in_project: bool = False) -> str:
     """Resolve the chat default profile.
@@ -224,20 +231,16 @@ async def _resolve_conversation_work_dir(
 ) -> str | None:
     """Return the project's path for a conversation, or ``None``.
 
-    Looks up the conversation in the manager's active list, reads the
-    ``project_id`` if set, and resolves it to a directory path via the
-    project store. Returns ``None`` when the conversation isn't linked
-    to a project (the executor then falls back to the profile's
-    configured ``persistence.work_dir``).
+    Looks up the conversation by id, reads the ``project_id`` if set,
+    and resolves it to a directory path via the project store. Returns
+    ``None`` when the conversation isn't linked to a project (the
+    executor then falls back to the profile's configured
+    ``persistence.work_dir``).
     """
     try:
-        active = await manager.list_active()
+        info = await manager.get_info(conversation_id)
     except Exception:  # noqa: BLE001 — defensive: never block a chat reply
         return None
-    info = next(
-        (c for c in active if c.conversation_id == conversation_id),
-        None,
-    )
     if info is None or info.project_id is None:
         return None
     project = await project_store.get(info.project_id)
@@ -291,8 +294,7 @@ async def create_conversation(
         request.sender_id,
         project_id=request.project_id,
     )
-    active = await manager.list_active()
-    info = next((c for c in active if c.conversation_id == conv_id), None)
+    info = await manager.get_info(conv_id)
     if not info:
         raise _error_response(
             status_code=500,
@@ -300,15 +302,7 @@ async def create_conversation(
             message="Conversation created but not found in active list",
             details={"conversation_id": conv_id},
         )
-    return ConversationInfoResponse(
-        conversation_id=info.conversation_id,
-        channel=info.channel,
-        started_at=info.started_at,
-        last_activity=info.last_activity,
-        message_count=info.message_count,
-        topic=info.topic,
-        project_id=info.project_id,
-    )
+    return _info_response(info)
 
 
 @router.get(
@@ -316,28 +310,31 @@ async def create_conversation(
     response_model=list[ConversationInfoResponse],
 )
 async def list_active_conversations(
+    response: Response,
     project_id: str | None = Query(
         default=None,
         description="Filter to conversations linked to this project id.",
     ),
+    limit: int | None = Query(
+        default=None,
+        ge=1,
+        le=100,
+        description="Page size. Omit to return every active conversation.",
+    ),
+    cursor: str | None = Query(
+        default=None,
+        description=f"Cursor from the previous page's ``{NEXT_CURSOR_HEADER}`` header.",
+    ),
     manager=Depends(get_conversation_manager),
 ) -> list[ConversationInfoResponse]:
     """List active (non-archived) conversations, optionally filtered by project."""
-    active = await manager.list_active()
-    if project_id is not None:
-        active = [c for c in active if c.project_id == project_id]
-    return [
-        ConversationInfoResponse(
-            conversation_id=c.conversation_id,
-            channel=c.channel,
-            started_at=c.started_at,
-            last_activity=c.last_activity,
-            message_count=c.message_count,
-            topic=c.topic,
-            project_id=c.project_id,
-        )
-        for c in active
-    ]
+    try:
+        page = await manager.list_active_page(limit=limit, cursor=cursor, project_id=project_id)
+    except ValueError as exc:
+        raise _invalid_cursor(cursor) from exc
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return [_info_response(c) for c in page.items]
 
 
 @router.get(
@@ -345,17 +342,27 @@ async def list_active_conversations(
     response_model=list[ConversationSummaryResponse],
 )
 async def list_archived_conversations(
+    response: Response,
     limit: int = Query(default=20, ge=1, le=100),
     project_id: str | None = Query(
         default=None,
         description="Filter to conversations linked to this project id.",
     ),
+    cursor: str | None = Query(
+        default=None,
+        description=f"Cursor from the previous page's ``{NEXT_CURSOR_HEADER}`` header.",
+    ),
     manager=Depends(get_conversation_manager),
 ) -> list[ConversationSummaryResponse]:
     """List archived conversations, optionally filtered by project."""
-    archived = await manager.list_archived(limit)
-    if project_id is not None:
-        archived = [c for c in archived if getattr(c, "project_id", None) == project_id]
+    try:
+        page = await manager.list_archived_page(
+            limit=limit, cursor=cursor, project_id=project_id
+        )
+    except ValueError as exc:
+        raise _invalid_cursor(cursor) from exc
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
     return [
         ConversationSummaryResponse(
             conversation_id=c.conversation_id,
@@ -366,7 +373,7 @@ async def list_archived_conversations(
             message_count=c.message_count,
             project_id=getattr(c, "project_id", None),
         )
-        for c in archived
+        for c in page.items
     ]
 
 
@@ -696,37 +703,16 @@ async def rename_conversation(
         )
 
     # Return refreshed metadata so the client doesn't need a follow-up GET.
-    # Look in both active + archived buckets — rename works on either.
-    active = await manager.list_active()
-    info = next((c for c in active if c.conversation_id == conversation_id), None)
+    # Rename works on active and archived conversations alike.
+    info = await manager.get_info(conversation_id)
     if info is not None:
-        return ConversationInfoResponse(
-            conversation_id=info.conversation_id,
-            channel=info.channel,
-            started_at=info.started_at,
-            last_activity=info.last_activity,
-            message_count=info.message_count,
-            topic=info.topic,
-            project_id=info.project_id,
-        )
-    archived = await manager.list_archived(limit=10_000)
-    archived_info = next((c for c in archived if c.conversation_id == conversation_id), None)
-    if archived_info is not None:
-        return ConversationInfoResponse(
-            conversation_id=archived_info.conversation_id,
-            channel="",  # archived summaries don't carry the original channel
-            started_at=archived_info.started_at,
-            last_activity=archived_info.archived_at,
-            message_count=archived_info.message_count,
-            topic=archived_info.topic,
-            project_id=getattr(archived_info, "project_id", None),
-        )
+        return _info_response(info)
     # Should not happen — `update_title` returned True so the entry exists,
-    # but lists raced. Return what we know.
+    # but a concurrent delete can remove it before the lookup.
     raise _error_response(
         status_code=500,
         code="internal_error",
-        message="Conversation renamed but not found in either list.",
+        message="Conversation renamed but no longer found.",
         details={"conversation_id": conversation_id},
     )
 
@@ -1017,12 +1003,11 @@ async def compact_conversation(
 
 
 async def _conversation_exists(manager: Any, conversation_id: str) -> bool:
-    """Cheap existence check: scan the active list for the id."""
+    """Cheap existence check: look the id up in the manager."""
     try:
-        active = await manager.list_active()
+        return await manager.get_info(conversation_id) is not None
     except Exception:  # noqa: BLE001 — defensive
         return False
-    return any(c.conversation_id == conversation_id for c in active)
 
 
 async def _require_conversation_access(manager: Any, conversation_id: str) -> None:
@@ -1030,18 +1015,15 @@ async def _require_conversation_access(manager: Any, conversation_id: str) -> No
 
     The ``ConversationManager`` is per-(tenant, user) scoped by the
     ``InfrastructureBuilder`` conversation-store override in multi-tenant
-    deployments, so its active + archived lists are exactly the
-    conversations the current caller may see. A ``conversation_id``
-    outside that set is treated as non-existent (404) — the route-level
+    deployments, so ``get_info`` resolves exactly the conversations the
+    current caller may see (one indexed lookup, not a scan of every
+    active and archived conversation). A ``conversation_id`` outside
+    that scope is treated as non-existent (404) — the route-level
     ownership check that closes the cross-tenant / cross-user read
     described in #279. In a single-tenant build the manager sees every
     conversation, so any valid id passes and behaviour is unchanged.
     """
-    active = await manager.list_active()
-    if any(c.conversation_id == conversation_id for c in active):
-        return
-    archived = await manager.list_archived(limit=10_000)
-    if any(c.conversation_id == conversation_id for c in archived):
+    if await manager.get_info(conversation_id) is not None:
         return
     raise _error_response(
         status_code=404,
@@ -1049,3 +1031,24 @@ async def _require_conversation_access(manager: Any, conversation_id: str) -> No
         message=f"No conversation with id {conversation_id!r}.",
         details={"conversation_id": conversation_id},
     )
+
+
+def _info_response(info: Any) -> ConversationInfoResponse:
+    return ConversationInfoResponse(
+        conversation_id=info.conversation_id,
+        channel=info.channel,
+        started_at=info.started_at,
+        last_activity=info.last_activity,
+        message_count=info.message_count,
+        topic=info.topic,
+        project_id=info.project_id,
+    )
+
+
+def _invalid_cursor(cursor: str | None) -> HTTPException:
+    return _error_response(
+        status_code=400,
+        code="invalid_cursor",
+        message="The pagination cursor is malformed or expired.",
+        details={"cursor": cursor},
+    )
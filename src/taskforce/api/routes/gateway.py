@@ -149,6 +149,9 @@ class BroadcastResponseSchema(BaseModel):
     sent: int
     failed: int
     results: list[NotificationResponseSchema]
+    resumed: int = Field(default=0, description="Recipients handled by an earlier, interrupted run.")
+    duration_ms: float | None = Field(default=None, description="Wall-clock fan-out time.")
+    throughput_per_s: float | None = Field(default=None, description="Deliveries per second.")
 
 
 class ChannelsResponseSchema(BaseModel):
@@ -436,10 +439,14 @@ async def broadcast(
         metadata=request.metadata,
     )
 
+    stats = getattr(results, "stats", None)
     return BroadcastResponseSchema(
         total=len(results),
         sent=sum(1 for r in results if r.success),
         failed=sum(1 for r in results if not r.success),
+        resumed=stats.resumed if stats else 0,
+        duration_ms=stats.duration_ms if stats else None,
+        throughput_per_s=stats.throughput_per_s if stats else None,
         results=[
             NotificationResponseSchema(
                 success=r.success,
@@ -0,0 +1,20 @@
+"""Prometheus text-exposition endpoint for the in-process metrics registry.
+
+Mounted at the root (``GET /metrics``) next to ``/health`` so standard
+scrape configs work without a path override. Set
+``TASKFORCE_METRICS_ENABLED=0`` to stop recording; the route then serves
+the (empty) registered families.
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from taskforce.core.utils.metrics import CONTENT_TYPE, get_metrics_registry
+
+router = APIRouter()
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Render all runtime metrics in the Prometheus text format."""
+    return PlainTextResponse(get_metrics_registry().render(), media_type=CONTENT_TYPE)
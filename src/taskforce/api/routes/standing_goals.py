@@ -38,6 +38,7 @@ class StandingGoalIn(BaseModel):
     priority: int = 5
     enabled: bool = True
     metadata: dict[str, Any] = Field(default_factory=dict)
+    inputs: list[dict[str, Any]] = Field(default_factory=list)
 
 
 class StandingGoalPatch(BaseModel):
@@ -47,6 +48,7 @@ class StandingGoalPatch(BaseModel):
     priority: int | None = None
     enabled: bool | None = None
     metadata: dict[str, Any] | None = None
+    inputs: list[dict[str, Any]] | None = None
 
 
 class StandingGoalOut(BaseModel):
@@ -59,6 +61,7 @@ class StandingGoalOut(BaseModel):
     last_evaluated_at: datetime | None
     last_action_taken: str
     metadata: dict[str, Any]
+    inputs: list[dict[str, Any]]
 
 
 def _to_out(goal: StandingGoal) -> StandingGoalOut:
@@ -86,6 +89,7 @@ async def create_goal(
         priority=body.priority,
         enabled=body.enabled,
         metadata=dict(body.metadata),
+        inputs=[dict(spec) for spec in body.inputs],
     )
     return _to_out(await store.add(goal))
 
@@ -119,6 +123,8 @@ async def update_goal(
         goal.enabled = body.enabled
     if body.metadata is not None:
         goal.metadata = dict(body.metadata)
+    if body.inputs is not None:
+        goal.inputs = [dict(spec) for spec in body.inputs]
     return _to_out(await store.update(goal))
 
 
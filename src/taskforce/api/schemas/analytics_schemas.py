@@ -12,6 +12,7 @@ class TokenUsageBucket(BaseModel):
     total_tokens: int
     cost_usd: float
     call_count: int
+    cached_prompt_tokens: int = Field(0, description="Prompt tokens read from provider caches")
 
 
 class TokenUsageResponse(BaseModel):
@@ -49,6 +50,7 @@ class ConversationUsageCall(BaseModel):
     model: str
     prompt_tokens: int
     completion_tokens: int
+    cached_prompt_tokens: int = 0
     cost_usd: float
     ts: str
 
@@ -35,21 +35,15 @@ _LOG_PATH = _configure_logging(
     debug=_LOG_DEBUG,
 )
 
-# Eagerly import the LiteLLM service so its module-level
-# ``AZURE_OPENAI_* -> AZURE_*`` env mapping runs before the first request
-# (which would otherwise hit the agent factory with half-mapped credentials).
-import taskforce.infrastructure.llm.litellm_service  # noqa: F401
-
-# Install the LiteLLM token-analytics callback so every completion
-# lands in ``.taskforce/analytics.db``. Without this the analytics
-# endpoints stay empty because nothing ever writes a row.
-from taskforce.infrastructure.llm.token_analytics_callback import (  # noqa: E402
-    TokenAnalyticsCallback as _TokenAnalyticsCallback,
-    get_token_analytics as _get_token_analytics,
+# Apply the ``AZURE_OPENAI_* -> AZURE_*`` env mapping before the first
+# request (which would otherwise hit the agent factory with half-mapped
+# credentials). LiteLLM itself is imported on first use, not here — it
+# costs seconds of import time.
+from taskforce.infrastructure.llm.provider_env import (  # noqa: E402
+    apply_litellm_env_defaults as _apply_litellm_env_defaults,
 )
 
-if _get_token_analytics() is None:
-    _TokenAnalyticsCallback().install()
+_apply_litellm_env_defaults()
 
 import structlog
 from fastapi import FastAPI, HTTPException
@@ -79,6 +73,7 @@ from taskforce.api.routes import (
     llm,
     mcp,
     memory,
+    metrics,
     planning_strategies,
     profiles,
     projects,
@@ -103,6 +98,16 @@ from taskforce.application.tracing_facade import init_tracing, shutdown_tracing
 logger = structlog.get_logger()
 
 
+def _install_token_analytics() -> None:
+    from taskforce.infrastructure.llm.token_analytics_callback import (
+        TokenAnalyticsCallback,
+        get_token_analytics,
+    )
+
+    if get_token_analytics() is None:
+        TokenAnalyticsCallback().install()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for FastAPI startup/shutdown events."""
@@ -125,6 +130,12 @@ async def lifespan(app: FastAPI):
             error_type=type(exc).__name__,
         )
 
+    # Install the LiteLLM token-analytics callback so every completion
+    # lands in ``.taskforce/analytics.db``. Without this the analytics
+    # endpoints stay empty because nothing ever writes a row. Done here
+    # rather than at module import because it imports LiteLLM.
+    _install_token_analytics()
+
     # Register agent-package config directories so /api/v1/profiles can
     # discover butler / coding-agent / rag-agent profiles regardless of
     # whether the CLI was used to start the server.
@@ -161,8 +172,9 @@ async def lifespan(app: FastAPI):
     # (and any FastAPI route that doesn't ``Depends(get_gateway)``)
     # build agents whose send_notification tool returns
     # "Communication gateway not configured".
+    gateway = None
     try:
-        get_gateway()
+        gateway = get_gateway()
     except Exception as exc:  # pragma: no cover — defensive startup wiring
         await logger.awarning(
             "fastapi.startup.gateway_unavailable",
@@ -170,6 +182,20 @@ async def lifespan(app: FastAPI):
             error_type=type(exc).__name__,
         )
 
+    # Finish broadcasts a previous process was killed in the middle of.
+    # Runs in the background — a large fan-out must not delay the API
+    # becoming ready.
+    resume_task: asyncio.Task[Any] | None = None
+    if gateway is not None:
+        try:
+            resume_task = asyncio.create_task(gateway.resume_broadcasts())
+        except Exception as exc:  # pragma: no cover — defensive
+            await logger.awarning(
+                "fastapi.startup.broadcast_resume_failed",
+                error=str(exc),
+                error_type=type(exc).__name__,
+            )
+
     scheduler = get_scheduler()
     # G4: register the workflow dispatcher so EXECUTE_WORKFLOW jobs
     # actually run their workflow when the cron tick fires.
@@ -200,6 +226,9 @@ async def lifespan(app: FastAPI):
     yield
     await logger.ainfo("fastapi.shutdown", message="Taskforce API shutting down...")
 
+    if resume_task is not None and not resume_task.done():
+        resume_task.cancel()
+
     # Stop pollers before the rest so in-flight gateway dispatches see
     # a still-live executor.
     if bot_poller_manager is not None:
@@ -215,6 +244,12 @@ async def lifespan(app: FastAPI):
     except Exception:  # pragma: no cover — defensive
         pass
 
+    # Extract what the learning queue still holds while the LLM
+    # provider plugins are loaded.
+    from taskforce.application.learning_queue import drain_learning_queues
+
+    await drain_learning_queues()
+
     # Shutdown plugins
     shutdown_plugins()
 
@@ -280,7 +315,7 @@ def _mount_ui(app: FastAPI) -> None:
         app.mount("/assets", StaticFiles(directory=assets_dir), name="ui-assets")
 
     index_file = ui_dir / "index.html"
-    _api_prefixes = ("api/", "health", "docs", "redoc", "openapi.json")
+    _api_prefixes = ("api/", "health", "metrics", "docs", "redoc", "openapi.json")
 
     @app.get("/", include_in_schema=False)
     async def _ui_root() -> FileResponse:
@@ -334,6 +369,7 @@ def create_app(plugin_config: dict[str, Any] | None = None) -> FastAPI:
         standing_goals.router, prefix="/api/v1", tags=["standing-goals"]
     )
     app.include_router(health.router, tags=["health"])
+    app.include_router(metrics.router, tags=["metrics"])
     app.include_router(memory.router, prefix="/api/v1", tags=["memory"])
     app.include_router(conversations.router, prefix="/api/v1", tags=["conversations"])
     app.include_router(workflows.router, prefix="/api/v1", tags=["workflows"])
@@ -377,6 +413,8 @@ def create_app(plugin_config: dict[str, Any] | None = None) -> FastAPI:
         allow_credentials=allow_creds,
         allow_methods=["*"],
         allow_headers=["*"],
+        # Cursor of the next page on paginated listings (conversations).
+        expose_headers=["X-Next-Cursor"],
     )
 
     # Serve the bundled web UI (when present) so a single process delivers
@@ -90,8 +90,23 @@ class AcpService:
     # ------------------------------------------------------------------ #
 
     def build_message_bus(self) -> MessageBusProtocol | None:
-        """Return an :class:`AcpMessageBus` when the profile selects it."""
-        if self._config.message_bus.transport != "acp":
+        """Return the bus the profile selects, ``None`` for the in-memory default.
+
+        ``transport: acp`` builds an :class:`AcpMessageBus`;
+        ``transport: sqlite`` the durable ``SqliteMessageBus`` configured
+        by the ``sqlite`` block.
+        """
+        transport = self._config.message_bus.transport
+        if transport == "sqlite":
+            from taskforce.application.infrastructure_builder import InfrastructureBuilder
+
+            options = self._config.message_bus.sqlite.model_dump(exclude_none=True)
+            self._bus = InfrastructureBuilder().build_message_bus(
+                {"message_bus": {"type": "sqlite", **options}},
+                work_dir_override=self._work_dir,
+            )
+            return self._bus
+        if transport != "acp":
             return None
         bus = AcpMessageBus(
             self._runtime,
@@ -211,6 +211,11 @@ class AgentDaemon:
         if self._service:
             await self._service.stop()
 
+        # Missions finished during the last batch window still get learned.
+        from taskforce.application.learning_queue import drain_learning_queues
+
+        await drain_learning_queues()
+
         self._running = False
 
         # Write final status
@@ -551,10 +556,13 @@ class AgentDaemon:
             )
             return GoalDecision(act=True, mission=mission, rationale="due-by-cron")
 
+        prober = self._build_goal_input_prober(proactive_cfg)
         evaluator = GoalEvaluatorService(
             store=store,
             submit=_submit,
             decide=_decide,
+            fingerprint=prober.fingerprint,
+            max_concurrent=int(proactive_cfg.get("max_concurrent_evaluations", 4)),
         )
 
         # Publish both to the API layer.
@@ -596,6 +604,33 @@ class AgentDaemon:
             goals=len(await store.list()),
         )
 
+    def _build_goal_input_prober(self, proactive_cfg: dict[str, Any]) -> Any:
+        """Build the probe runner for goals that declare ``inputs``.
+
+        Wiki store and tool registry are created on first use so goals
+        without such inputs cost nothing extra.
+        """
+        from taskforce.application.goal_input_probes import GoalInputProber
+        from taskforce.application.infrastructure_builder import InfrastructureBuilder
+
+        tool_registry: Any = None
+
+        def _resolve_tool(name: str) -> Any:
+            nonlocal tool_registry
+            if tool_registry is None:
+                from taskforce.application.tool_registry import ToolRegistry
+
+                tool_registry = ToolRegistry()
+            return tool_registry.resolve_single(name)
+
+        router = self._service.event_router if self._service is not None else None
+        return GoalInputProber(
+            wiki_store_factory=lambda: InfrastructureBuilder().build_wiki_store(self._work_dir),
+            event_counts=router.events_seen if router is not None else None,
+            tool_resolver=_resolve_tool,
+            timeout_seconds=float(proactive_cfg.get("probe_timeout_seconds", 10.0)),
+        )
+
     async def _heartbeat_loop(self, evaluator: Any, heartbeat_minutes: float) -> None:
         """Periodically evaluate every due standing goal.
 
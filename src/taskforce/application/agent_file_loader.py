@@ -24,6 +24,8 @@ from typing import Any
 import structlog
 import yaml
 
+from taskforce.core.utils.config_catalog import get_config_catalog
+
 logger = structlog.get_logger(__name__)
 
 
@@ -71,15 +73,21 @@ def load_agent_md(path: Path) -> AgentFile:
         FileNotFoundError: If the file does not exist.
         ValueError: If the frontmatter is missing or malformed.
     """
-    text = path.read_text(encoding="utf-8")
-    frontmatter, body = _split_frontmatter(text, path)
-    return AgentFile(frontmatter=frontmatter, body=body, path=path)
+    try:
+        frontmatter, body = get_config_catalog().parse(path, _parse_agent_text)
+    except ValueError as exc:
+        raise ValueError(f"{exc}: {path}") from exc
+    return AgentFile(frontmatter=copy.deepcopy(frontmatter), body=body, path=path)
+
 
+def _parse_agent_text(text: str) -> tuple[dict[str, Any], str]:
+    """Split a markdown file with YAML frontmatter into (dict, body).
 
-def _split_frontmatter(text: str, path: Path) -> tuple[dict[str, Any], str]:
-    """Split a markdown file with YAML frontmatter into (dict, body)."""
+    Path-independent so the result can be cached per file by the config
+    catalog; :func:`load_agent_md` appends the path to error messages.
+    """
     if not text.startswith("---"):
-        raise ValueError(f"Agent file missing frontmatter (expected leading '---'): {path}")
+        raise ValueError("Agent file missing frontmatter (expected leading '---')")
 
     # Find the closing '---' on its own line after the opening.
     lines = text.splitlines()
@@ -89,7 +97,7 @@ def _split_frontmatter(text: str, path: Path) -> tuple[dict[str, Any], str]:
             closing_idx = i
             break
     if closing_idx is None:
-        raise ValueError(f"Agent file frontmatter not terminated by '---': {path}")
+        raise ValueError("Agent file frontmatter not terminated by '---'")
 
     frontmatter_yaml = "\n".join(lines[1:closing_idx])
     body = "\n".join(lines[closing_idx + 1 :])
@@ -97,8 +105,7 @@ def _split_frontmatter(text: str, path: Path) -> tuple[dict[str, Any], str]:
     parsed = yaml.safe_load(frontmatter_yaml) or {}
     if not isinstance(parsed, dict):
         raise ValueError(
-            f"Agent file frontmatter must be a YAML mapping, got "
-            f"{type(parsed).__name__}: {path}"
+            f"Agent file frontmatter must be a YAML mapping, got {type(parsed).__name__}"
         )
     return parsed, body
 
@@ -169,11 +176,11 @@ def _normalize_extends(extends: Any) -> list[str]:
 
 def _load_preset(name: str, preset_dirs: list[Path]) -> dict[str, Any]:
     """Load a named preset YAML from any of the given directories."""
+    catalog = get_config_catalog()
     for preset_dir in preset_dirs:
         candidate = preset_dir / f"{name}.yaml"
-        if candidate.is_file():
-            with open(candidate, encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+        if catalog.is_file(candidate):
+            data = catalog.load_yaml(candidate) or {}
             if not isinstance(data, dict):
                 raise ValueError(f"Preset '{name}' must be a YAML mapping: {candidate}")
             logger.debug("preset_loaded", preset=name, path=str(candidate))
@@ -9,8 +9,9 @@ plugin):
   :data:`taskforce.infrastructure.tools.registry._BUILTIN_REGISTRY` already
   uses, so callers can merge the result on top of the hardcoded baseline.
 * ``taskforce.cli_apps`` — subcommand name → ``"module.path:typer_app"``.
-  Loaded eagerly and returned as ``{name: typer.Typer}`` for the unified
-  CLI's ``add_typer`` call.
+  Loaded eagerly and returned as ``{name: typer.Typer}``
+  (:func:`load_cli_apps`), or returned unloaded as import paths for the
+  unified CLI's lazy registration (:func:`cli_app_import_paths`).
 * ``taskforce.config_dirs`` — agent name → ``"package_module:relpath"``.
   Resolved to filesystem paths suitable for
   :func:`taskforce.application.profile_loader.register_config_dir`.
@@ -28,6 +29,7 @@ The module owns *no* state — callers cache the merged dicts themselves
 from __future__ import annotations
 
 import importlib
+import importlib.util
 from collections.abc import Iterator
 from importlib.metadata import EntryPoint, entry_points
 from pathlib import Path
@@ -136,6 +138,35 @@ def load_cli_apps() -> dict[str, Any]:
     return apps
 
 
+def cli_app_import_paths() -> dict[str, str]:
+    """Return ``{subcommand_name: "module:attr"}`` from ``taskforce.cli_apps``.
+
+    Lazy counterpart of :func:`load_cli_apps` for the unified CLI, which
+    imports a sub-app only when its subcommand is invoked. Nothing is
+    imported here; entries that are malformed or whose top-level package
+    is not installed are skipped with a warning.
+    """
+    paths: dict[str, str] = {}
+    for ep in iter_entry_points(GROUP_CLI_APPS):
+        module_path, _, attr = ep.value.partition(":")
+        if not module_path or not attr:
+            logger.warning(
+                "agent_plugin_registry.malformed_cli_app_entry_point",
+                name=ep.name,
+                value=ep.value,
+            )
+            continue
+        if importlib.util.find_spec(module_path.split(".", 1)[0]) is None:
+            logger.warning(
+                "agent_plugin_registry.cli_app_module_missing",
+                name=ep.name,
+                module=module_path,
+            )
+            continue
+        paths[ep.name] = ep.value
+    return paths
+
+
 def load_config_dirs() -> dict[str, Path]:
     """Return ``{agent_name: Path}`` from ``taskforce.config_dirs`` entry-points.
 
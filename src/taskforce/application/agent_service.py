@@ -229,6 +229,7 @@ class AgentService:
                 action_type=action_type,
                 params=action_cfg.get("params", {}),
                 template=action_cfg.get("template"),
+                ordered=bool(action_cfg.get("ordered", False)),
             ),
             priority=int(config.get("priority", 0)),
         )
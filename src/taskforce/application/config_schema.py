@@ -266,6 +266,25 @@ class AcpServerSchema(BaseModel):
     )
 
 
+class AcpSqliteBusSchema(BaseModel):
+    """Options of the durable SQLite bus (``transport: sqlite``)."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    path: str | None = Field(
+        None, description="Database file (default <work_dir>/message_bus.db)"
+    )
+    consumer_group: str = Field("default", description="Group used when none is given")
+    visibility_timeout_seconds: float = Field(30.0, ge=0)
+    max_attempts: int = Field(5, ge=1)
+    retention_seconds: float = Field(
+        7 * 24 * 3600.0, ge=0, description="Keep consumed messages this long (0 = forever)"
+    )
+    poll_interval_seconds: float = Field(0.5, gt=0)
+    batch_size: int = Field(32, ge=1)
+    synchronous: str = Field("NORMAL", pattern="^(NORMAL|FULL|normal|full)$")
+
+
 class AcpMessageBusSchema(BaseModel):
     """Message bus transport selector."""
 
@@ -273,9 +292,10 @@ class AcpMessageBusSchema(BaseModel):
 
     transport: str = Field(
         "in_memory",
-        pattern="^(in_memory|acp)$",
-        description="Bus transport: in_memory (default) or acp",
+        pattern="^(in_memory|acp|sqlite)$",
+        description="Bus transport: in_memory (default), acp or sqlite",
     )
+    sqlite: AcpSqliteBusSchema = Field(default_factory=AcpSqliteBusSchema)
     publish_peers: list[str] = Field(
         default_factory=list,
         description="Peer names that receive published messages",
@@ -17,6 +17,7 @@ import structlog
 from taskforce.core.interfaces.conversation import (
     ConversationInfo,
     ConversationManagerProtocol,
+    ConversationPage,
     ConversationSummary,
 )
 
@@ -400,6 +401,34 @@ class ConversationManager:
         """List archived conversations."""
         return await self._store.list_archived(limit)
 
+    async def get_info(self, conversation_id: str) -> ConversationInfo | None:
+        """Look up one active or archived conversation by id."""
+        return await self._store.get_info(conversation_id)
+
+    async def list_active_page(
+        self,
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+        project_id: str | None = None,
+    ) -> ConversationPage[ConversationInfo]:
+        """Page through active conversations (newest activity first)."""
+        return await self._store.list_active_page(
+            limit=limit, cursor=cursor, project_id=project_id
+        )
+
+    async def list_archived_page(
+        self,
+        *,
+        limit: int | None = 20,
+        cursor: str | None = None,
+        project_id: str | None = None,
+    ) -> ConversationPage[ConversationSummary]:
+        """Page through archived conversations (newest archive first)."""
+        return await self._store.list_archived_page(
+            limit=limit, cursor=cursor, project_id=project_id
+        )
+
     # ------------------------------------------------------------------
     # Topic segmentation
     # ------------------------------------------------------------------
@@ -6,7 +6,9 @@ actions (notifications, agent missions, memory logging).
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+import asyncio
+from collections import Counter
+from collections.abc import Awaitable, Callable, Mapping
 from typing import Any
 
 import structlog
@@ -17,6 +19,14 @@ from taskforce.core.interfaces.rule_engine import RuleEngineProtocol
 
 logger = structlog.get_logger(__name__)
 
+# In-flight dispatches per action type, shared by all events routed
+# concurrently. Memory logs append to one wiki log, so they stay serial.
+DEFAULT_ACTION_CONCURRENCY: dict[str, int] = {
+    RuleActionType.NOTIFY.value: 8,
+    RuleActionType.EXECUTE_MISSION.value: 4,
+    RuleActionType.LOG_MEMORY.value: 1,
+}
+
 
 class EventRouter:
     """Routes AgentEvents through a RuleEngine and dispatches actions.
@@ -28,6 +38,13 @@ class EventRouter:
       4. For 'log_memory' actions -> store in wiki log via callback
       5. If no rules match and llm_fallback is enabled -> send to agent
 
+    Actions of one event are dispatched concurrently, each type limited by
+    ``action_concurrency`` (merged over :data:`DEFAULT_ACTION_CONCURRENCY`),
+    so a slow notification no longer holds up the mission behind it. An
+    action with ``ordered=True`` is a barrier: it starts after every
+    higher-priority action has finished, and lower-priority actions start
+    after it. ``route`` returns once all actions of the event are done.
+
     Callbacks are injected to avoid direct dependencies on infrastructure.
     """
 
@@ -39,6 +56,7 @@ class EventRouter:
         memory_callback: Callable[[str, dict[str, Any]], Awaitable[None]] | None = None,
         llm_fallback: bool = False,
         default_channel: str = "",
+        action_concurrency: Mapping[str, int] | None = None,
     ) -> None:
         self._rule_engine = rule_engine
         self._notify_callback = notify_callback
@@ -46,8 +64,14 @@ class EventRouter:
         self._memory_callback = memory_callback
         self._llm_fallback = llm_fallback
         self._default_channel = default_channel
+        limits = {**DEFAULT_ACTION_CONCURRENCY, **(action_concurrency or {})}
+        self._action_slots = {
+            action_type: asyncio.Semaphore(max(1, int(limit)))
+            for action_type, limit in limits.items()
+        }
         self._event_count = 0
         self._action_count = 0
+        self._events_seen: Counter[tuple[str, str]] = Counter()
 
     @property
     def event_count(self) -> int:
@@ -59,6 +83,10 @@ class EventRouter:
         """Number of actions dispatched."""
         return self._action_count
 
+    def events_seen(self) -> Mapping[tuple[str, str], int]:
+        """Number of events processed per ``(source, event_type)``."""
+        return self._events_seen
+
     async def route(self, event: AgentEvent) -> list[RuleAction]:
         """Route an event through the rule engine and dispatch actions.
 
@@ -69,6 +97,7 @@ class EventRouter:
             List of actions that were dispatched.
         """
         self._event_count += 1
+        self._events_seen[(event.source, event.event_type.value)] += 1
         logger.info(
             "event_router.routing",
             event_id=event.event_id,
@@ -88,12 +117,41 @@ class EventRouter:
                 await self._dispatch_llm_fallback(event)
             return []
 
-        for action in actions:
-            await self._dispatch_action(action, event)
-            self._action_count += 1
+        if len(actions) == 1:
+            await self._dispatch_limited(actions[0], event)
+        else:
+            await self._dispatch_all(actions, event)
+        self._action_count += len(actions)
 
         return actions
 
+    async def _dispatch_all(self, actions: list[RuleAction], event: AgentEvent) -> None:
+        """Dispatch concurrently, with ``ordered`` actions as barriers."""
+        running: list[asyncio.Task[None]] = []
+        try:
+            for action in actions:
+                if not action.ordered:
+                    running.append(asyncio.create_task(self._dispatch_limited(action, event)))
+                    continue
+                if running:
+                    await asyncio.gather(*running)
+                    running = []
+                await self._dispatch_limited(action, event)
+            if running:
+                await asyncio.gather(*running)
+        finally:
+            for task in running:
+                task.cancel()
+
+    async def _dispatch_limited(self, action: RuleAction, event: AgentEvent) -> None:
+        """Dispatch one action within its action type's concurrency limit."""
+        slots = self._action_slots.get(action.action_type.value)
+        if slots is None:
+            await self._dispatch_action(action, event)
+            return
+        async with slots:
+            await self._dispatch_action(action, event)
+
     async def _dispatch_action(self, action: RuleAction, event: AgentEvent) -> None:
         """Dispatch a single rule action."""
         try:
@@ -801,8 +801,11 @@ class AgentExecutor:
         """Optionally extract reusable knowledge into the wiki.
 
         Activated only when the resolved profile config sets
-        ``learning.enabled: true``. All exceptions are swallowed so
-        learning never breaks the mission flow.
+        ``learning.enabled: true``. The mission is handed to the
+        profile's ``LearningQueue``, which batches extraction in the
+        background unless ``learning.background`` is false. All
+        exceptions are swallowed so learning never breaks the mission
+        flow.
         """
         if not mission_success:
             self.logger.info(
@@ -835,27 +838,28 @@ class AgentExecutor:
             if not messages:
                 return
 
-            from taskforce.application.learning_service import (
-                LlmExtractingLearningService,
-            )
+            from taskforce.application.learning_queue import get_learning_queue
 
-            service = LlmExtractingLearningService(
-                wiki_store=wiki_store,
-                llm_service=llm_service,
-                model_alias=str(learning_cfg.get("model_alias", "fast")),
-            )
-            result = await service.learn_from_mission(
-                mission=mission,
-                messages=messages,
-                session_id=session_id,
-            )
-            self.logger.info(
-                "post_mission_learning",
-                session_id=session_id,
-                pages_written=result.pages_written,
-                extracted=result.extracted_count,
-                skipped=result.skipped_reason,
-            )
+            # Extraction is batched and normally runs in the background;
+            # see ``learning_queue`` for the novelty filter.
+            queue = get_learning_queue(profile, wiki_store, llm_service, learning_cfg)
+            queued = queue.submit(mission=mission, messages=messages, session_id=session_id)
+            if queued and not queue.background:
+                results = await queue.flush()
+                self.logger.info(
+                    "post_mission_learning",
+                    session_id=session_id,
+                    pages_written=[p for r in results for p in r.pages_written],
+                    extracted=sum(r.extracted_count for r in results),
+                    skipped=next((r.skipped_reason for r in results if r.skipped_reason), None),
+                )
+            else:
+                self.logger.info(
+                    "post_mission_learning_queued",
+                    session_id=session_id,
+                    queued=queued,
+                    pending=queue.pending,
+                )
         except Exception as e:
             self.logger.warning(
                 "post_mission_learning_failed",
@@ -13,7 +13,6 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from taskforce.core.domain.agent_definition import AgentDefinition
 
-import aiofiles
 import structlog
 import yaml
 
@@ -37,6 +36,7 @@ from taskforce.core.interfaces.llm import LLMProviderProtocol
 from taskforce.core.interfaces.runtime import AgentRuntimeTrackerProtocol
 from taskforce.core.interfaces.state import StateManagerProtocol
 from taskforce.core.interfaces.tools import ToolProtocol
+from taskforce.core.utils.config_catalog import get_config_catalog
 from taskforce.core.utils.paths import get_base_path
 
 
@@ -578,6 +578,7 @@ class AgentFactory:
             "react_signature_repeat_threshold": agent_config.get(
                 "react_signature_repeat_threshold"
             ),
+            "prompt_cache_layout": agent_config.get("prompt_cache_layout"),
         }
 
     def _instantiate_agent(
@@ -626,6 +627,7 @@ class AgentFactory:
             approval_bypass_provider=get_approval_bypass_override,
             react_no_progress_threshold=settings.get("react_no_progress_threshold"),
             react_signature_repeat_threshold=settings.get("react_signature_repeat_threshold"),
+            prompt_cache_layout=settings.get("prompt_cache_layout"),
             context_manager_factory=context_manager_factory,
         )
 
@@ -1074,18 +1076,16 @@ class AgentFactory:
             ]
 
             # Also search agent package config directories (agents/*/configs/).
-            agents_dir = get_base_path() / "agents"
-            if agents_dir.is_dir():
-                for agent_dir in agents_dir.iterdir():
-                    agent_configs = agent_dir / "configs"
-                    if agent_configs.is_dir():
-                        candidates.extend(_probe(agent_configs, config_path))
-                        candidates.extend(_probe(agent_configs / "custom", config_path))
-
-            for candidate in candidates:
-                if candidate.exists():
-                    config_path_obj = candidate
-                    break
+            catalog = get_config_catalog()
+            for agent_dir in catalog.subdirs(get_base_path() / "agents"):
+                agent_configs = agent_dir / "configs"
+                if catalog.is_dir(agent_configs):
+                    candidates.extend(_probe(agent_configs, config_path))
+                    candidates.extend(_probe(agent_configs / "custom", config_path))
+
+            found = catalog.first_file(candidates)
+            if found is not None:
+                config_path_obj = found
 
         if not config_path_obj.exists():
             raise FileNotFoundError(f"Config file not found: {config_path}")
@@ -1115,33 +1115,30 @@ class AgentFactory:
 
     def _discover_preset_dirs(self) -> list[Path]:
         """Preset directories searched when resolving ``extends:`` references."""
+        catalog = get_config_catalog()
         dirs: list[Path] = []
         primary = self.config_dir / "presets"
-        if primary.is_dir():
+        if catalog.is_dir(primary):
             dirs.append(primary)
-        agents_dir = get_base_path() / "agents"
-        if agents_dir.is_dir():
-            for agent_dir in agents_dir.iterdir():
-                presets = agent_dir / "configs" / "presets"
-                if presets.is_dir():
-                    dirs.append(presets)
+        for agent_dir in catalog.subdirs(get_base_path() / "agents"):
+            presets = agent_dir / "configs" / "presets"
+            if catalog.is_dir(presets):
+                dirs.append(presets)
         return dirs
 
     def _load_framework_defaults(self) -> dict[str, Any]:
         """Load ``{config_dir}/defaults.yaml`` or an empty dict."""
         defaults_path = self.config_dir / "defaults.yaml"
-        if not defaults_path.is_file():
+        catalog = get_config_catalog()
+        if not catalog.is_file(defaults_path):
             return {}
-        with open(defaults_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        data = catalog.load_yaml(defaults_path) or {}
         return data if isinstance(data, dict) else {}
 
     async def _load_yaml_config(self, path: Path) -> dict[str, Any]:
         """Load and parse a YAML config file asynchronously."""
         try:
-            async with aiofiles.open(path, encoding="utf-8") as f:
-                content = await f.read()
-            config = yaml.safe_load(content)
+            config = await get_config_catalog().load_yaml_async(path)
         except yaml.YAMLError as e:
             self.logger.error(
                 "yaml_parse_failed",
@@ -1247,6 +1244,7 @@ class AgentFactory:
                 "react_signature_repeat_threshold": agent_defaults.get(
                     "react_signature_repeat_threshold"
                 ),
+                "prompt_cache_layout": agent_defaults.get("prompt_cache_layout"),
             },
         }
 
@@ -1380,6 +1378,7 @@ class AgentFactory:
             "react_signature_repeat_threshold": agent_config.get(
                 "react_signature_repeat_threshold"
             ),
+            "prompt_cache_layout": agent_config.get("prompt_cache_layout"),
         }
         plugin_work_dir = merged_config.get("persistence", {}).get("work_dir")
         plugin_wiki_store, plugin_wiki_cfg = self._build_wiki_injection(
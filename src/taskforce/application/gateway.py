@@ -14,6 +14,8 @@ cross-session conversations.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import time
 from collections import deque
 from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any
@@ -22,6 +24,7 @@ from uuid import uuid4
 import structlog
 
 from taskforce.application.executor import AgentExecutor, ProgressUpdate
+from taskforce.application.notification_fanout import NotificationFanout
 from taskforce.core.domain.action_log import (
     ActionLog,
     TurnRecorder,
@@ -30,6 +33,8 @@ from taskforce.core.domain.action_log import (
 )
 from taskforce.core.domain.enums import EventType, MessageRole
 from taskforce.core.domain.gateway import (
+    BroadcastResults,
+    BroadcastStats,
     GatewayOptions,
     GatewayResponse,
     InboundMessage,
@@ -41,6 +46,7 @@ from taskforce.core.domain.multimodal import build_multimodal_content
 from taskforce.core.interfaces.channel_ask import PendingChannelQuestionStoreProtocol
 from taskforce.core.interfaces.gateway import (
     AgentLookupProtocol,
+    BroadcastOutboxProtocol,
     ChannelLinkRegistryProtocol,
     ConversationStoreProtocol,
     OutboundSenderProtocol,
@@ -269,6 +275,8 @@ class CommunicationGateway:
         components_provider: Callable[[], Any] | None = None,
         actions_summary_mode: str = "disabled",
         max_action_logs: int = 10,
+        notification_fanout: NotificationFanout | None = None,
+        broadcast_outbox: BroadcastOutboxProtocol | None = None,
     ) -> None:
         self._executor = executor
         self._conversation_store = conversation_store
@@ -286,6 +294,10 @@ class CommunicationGateway:
         self._agent_lookup: AgentLookupProtocol | None = agent_lookup
         self._workflow_lookup: WorkflowLookupProtocol | None = workflow_lookup
         self._workflow_runner = workflow_runner
+        # Shared per-channel concurrency + rate limits for every outbound
+        # notification; the outbox (optional) makes broadcasts resumable.
+        self._fanout = notification_fanout or NotificationFanout()
+        self._broadcast_outbox = broadcast_outbox
         # ADR-022 §4 / G1: optional components provider so the gateway
         # singleton can serve different tenants by re-reading components
         # per-call. None ⇒ constructor-provided defaults are sticky
@@ -757,6 +769,21 @@ class CommunicationGateway:
                 error=f"Recipient '{request.recipient_id}' not registered on '{request.channel}'",
             )
 
+        return await self._deliver_notification(request, sender, reference)
+
+    async def _deliver_notification(
+        self,
+        request: NotificationRequest,
+        sender: OutboundSenderProtocol,
+        reference: dict[str, Any],
+        *,
+        acquire_slot: bool = True,
+    ) -> NotificationResult:
+        """Dispatch an already-resolved notification.
+
+        Takes a :class:`NotificationFanout` slot unless the caller (the
+        broadcast fan-out) already holds one.
+        """
         # Use conversation_id from the stored reference as the send target
         target_id = reference.get("conversation_id", request.recipient_id)
 
@@ -766,23 +793,28 @@ class CommunicationGateway:
         attachment_type = (request.metadata or {}).get("attachment_type", "auto")
 
         try:
-            if request.attachments:
-                # First file carries the message as caption; subsequent
-                # files go without caption to avoid duplication.
-                for idx, file_path in enumerate(request.attachments):
-                    await sender.send_file(
+            async with (
+                self._fanout.slot(request.channel, str(target_id))
+                if acquire_slot
+                else contextlib.nullcontext()
+            ):
+                if request.attachments:
+                    # First file carries the message as caption; subsequent
+                    # files go without caption to avoid duplication.
+                    for idx, file_path in enumerate(request.attachments):
+                        await sender.send_file(
+                            recipient_id=target_id,
+                            file_path=file_path,
+                            caption=request.message if idx == 0 else None,
+                            attachment_type=attachment_type,
+                            metadata=request.metadata,
+                        )
+                else:
+                    await sender.send(
                         recipient_id=target_id,
-                        file_path=file_path,
-                        caption=request.message if idx == 0 else None,
-                        attachment_type=attachment_type,
+                        message=request.message,
                         metadata=request.metadata,
                     )
-            else:
-                await sender.send(
-                    recipient_id=target_id,
-                    message=request.message,
-                    metadata=request.metadata,
-                )
             self._logger.info(
                 "gateway.notification.sent",
                 channel=request.channel,
@@ -823,7 +855,8 @@ class CommunicationGateway:
         message: str,
         metadata: dict[str, Any] | None = None,
         tenant_id: str | None = None,
-    ) -> list[NotificationResult]:
+        broadcast_id: str | None = None,
+    ) -> BroadcastResults:
         """Send a message to all registered recipients on a channel.
 
         ADR-022 §4: when ``tenant_id`` is supplied the broadcast is
@@ -833,6 +866,14 @@ class CommunicationGateway:
         receives the message). Each :class:`NotificationResult` carries
         the originating tenant id so audit logs can group deliveries.
 
+        Recipients are resolved with one bulk registry query and
+        delivered concurrently under the channel's
+        :class:`NotificationFanout` limits. With a broadcast outbox
+        configured, every outcome is recorded as it happens; re-running
+        an interrupted broadcast (same ``broadcast_id``) skips recipients
+        that were already delivered and retries the failed ones.
+        Recipients without a resolvable reference get a failed result.
+
         Args:
             channel: Target channel.
             message: Message text.
@@ -840,31 +881,188 @@ class CommunicationGateway:
             tenant_id: When provided, only recipients registered with a
                 matching ``tenant_id`` field on their reference receive
                 the broadcast.
+            broadcast_id: Outbox key. Defaults to a fresh unique id, so
+                two identical broadcasts never share an outbox record.
 
         Returns:
-            List of NotificationResult, one per recipient.
+            :class:`BroadcastResults` — one NotificationResult per
+            recipient (in registry order) plus throughput ``stats``.
         """
+        started = time.monotonic()
+        metadata = metadata or {}
         scope_tenant_id = tenant_id or "default"
-        registry = self._resolve_recipient_registry()
-        recipients = await registry.list_recipients(channel)
-        results: list[NotificationResult] = []
-        for user_id in recipients:
-            if tenant_id is not None:
-                reference = await registry.resolve(channel=channel, user_id=user_id)
-                ref_tenant = (reference or {}).get("tenant_id", "default")
-                if ref_tenant != tenant_id:
-                    continue
-            result = await self.send_notification(
-                NotificationRequest(
+        broadcast_id = broadcast_id or uuid4().hex
+
+        references = await self._resolve_channel_references(channel)
+        if tenant_id is not None:
+            references = {
+                user_id: ref
+                for user_id, ref in references.items()
+                if (ref or {}).get("tenant_id", "default") == tenant_id
+            }
+
+        already_handled: dict[str, tuple[bool, str | None]] = {}
+        if self._broadcast_outbox is not None and references:
+            already_handled = await self._broadcast_outbox.open(
+                broadcast_id=broadcast_id,
+                channel=channel,
+                message=message,
+                metadata=metadata,
+                tenant_id=tenant_id,
+            )
+
+        sender = self._resolve_outbound_senders().get(channel)
+        results: dict[str, NotificationResult] = {}
+        jobs: list[tuple[str, Callable[[], Awaitable[NotificationResult]]]] = []
+        for user_id, reference in references.items():
+            if already_handled.get(user_id, (False, None))[0]:
+                results[user_id] = NotificationResult(
+                    success=True,
+                    channel=channel,
+                    recipient_id=user_id,
+                    tenant_id=scope_tenant_id,
+                )
+                continue
+            if not reference:
+                results[user_id] = NotificationResult(
+                    success=False,
                     channel=channel,
                     recipient_id=user_id,
-                    message=message,
-                    metadata=metadata or {},
+                    error=f"Recipient '{user_id}' not registered on '{channel}'",
                     tenant_id=scope_tenant_id,
                 )
+                continue
+            request = NotificationRequest(
+                channel=channel,
+                recipient_id=user_id,
+                message=message,
+                metadata=metadata,
+                tenant_id=scope_tenant_id,
+            )
+            jobs.append(
+                (
+                    str(reference.get("conversation_id", user_id)),
+                    self._broadcast_job(broadcast_id, request, sender, reference),
+                )
             )
-            results.append(result)
-        return results
+
+        for result in await self._fanout.run(channel, jobs):
+            results[result.recipient_id] = result
+
+        if self._broadcast_outbox is not None and references:
+            await self._broadcast_outbox.complete(broadcast_id)
+
+        ordered = [results[user_id] for user_id in references]
+        duration_s = time.monotonic() - started
+        stats = BroadcastStats(
+            broadcast_id=broadcast_id,
+            total=len(ordered),
+            sent=sum(1 for r in ordered if r.success),
+            failed=sum(1 for r in ordered if not r.success),
+            resumed=sum(1 for success, _ in already_handled.values() if success),
+            duration_ms=round(duration_s * 1000, 2),
+            throughput_per_s=round(len(jobs) / duration_s, 2) if duration_s > 0 else 0.0,
+        )
+        self._logger.info(
+            "gateway.broadcast.completed",
+            channel=channel,
+            tenant_id=scope_tenant_id,
+            broadcast_id=broadcast_id,
+            total=stats.total,
+            sent=stats.sent,
+            failed=stats.failed,
+            resumed=stats.resumed,
+            duration_ms=stats.duration_ms,
+            throughput_per_s=stats.throughput_per_s,
+        )
+        return BroadcastResults(ordered, stats)
+
+    async def resume_broadcasts(self) -> list[BroadcastResults]:
+        """Finish broadcasts interrupted by a restart.
+
+        No-op without a broadcast outbox. Called once at API startup.
+        """
+        if self._broadcast_outbox is None:
+            return []
+        resumed: list[BroadcastResults] = []
+        for header in await self._broadcast_outbox.pending():
+            self._logger.info(
+                "gateway.broadcast.resuming",
+                broadcast_id=header["broadcast_id"],
+                channel=header["channel"],
+            )
+            try:
+                resumed.append(
+                    await self.broadcast(
+                        channel=header["channel"],
+                        message=header["message"],
+                        metadata=header.get("metadata") or {},
+                        tenant_id=header.get("tenant_id"),
+                        broadcast_id=header["broadcast_id"],
+                    )
+                )
+            except Exception as exc:
+                self._logger.error(
+                    "gateway.broadcast.resume_failed",
+                    broadcast_id=header["broadcast_id"],
+                    error=str(exc),
+                )
+        return resumed
+
+    async def _resolve_channel_references(
+        self, channel: str
+    ) -> dict[str, dict[str, Any] | None]:
+        """Load every recipient reference on *channel* in one query.
+
+        Keyed by exactly the recipients ``list_recipients`` returns, in
+        registry order; a recipient whose reference cannot be resolved
+        maps to ``None``. References ``resolve_many`` returns for anyone
+        else are ignored. Falls back to per-recipient ``resolve`` for registries
+        that do not implement ``resolve_many``.
+        """
+        registry = self._resolve_recipient_registry()
+        user_ids = await registry.list_recipients(channel)
+        resolve_many = getattr(registry, "resolve_many", None)
+        if resolve_many is not None:
+            resolved = await resolve_many(channel=channel)
+            return {user_id: resolved.get(user_id) for user_id in user_ids}
+        return {
+            user_id: await registry.resolve(channel=channel, user_id=user_id)
+            for user_id in user_ids
+        }
+
+    def _broadcast_job(
+        self,
+        broadcast_id: str,
+        request: NotificationRequest,
+        sender: OutboundSenderProtocol | None,
+        reference: dict[str, Any],
+    ) -> Callable[[], Awaitable[NotificationResult]]:
+        """Build the fan-out job delivering one broadcast notification."""
+
+        async def job() -> NotificationResult:
+            if sender is None:
+                result = NotificationResult(
+                    success=False,
+                    channel=request.channel,
+                    recipient_id=request.recipient_id,
+                    tenant_id=request.tenant_id,
+                    error=f"No outbound sender configured for channel '{request.channel}'",
+                )
+            else:
+                result = await self._deliver_notification(
+                    request, sender, reference, acquire_slot=False
+                )
+            if self._broadcast_outbox is not None:
+                await self._broadcast_outbox.record(
+                    broadcast_id=broadcast_id,
+                    recipient_id=request.recipient_id,
+                    success=result.success,
+                    error=result.error,
+                )
+            return result
+
+        return job
 
     # ------------------------------------------------------------------
     # Introspection
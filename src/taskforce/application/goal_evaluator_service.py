@@ -11,10 +11,18 @@ Cost control: due goals are filtered with a cheap cron pre-filter
 any LLM call happens. A heartbeat at 15-minute granularity with five
 weekly goals therefore burns at most one LLM call per week per goal —
 not one per heartbeat.
+
+Goals that declare ``inputs`` are additionally gated on change: the
+injected ``fingerprint`` callback probes those inputs cheaply (see
+``goal_input_probes``) and a due goal whose fingerprint matches the one
+recorded at its last evaluation is skipped without a decision or a
+mission. Due goals are evaluated concurrently, at most
+``max_concurrent`` at a time.
 """
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -33,6 +41,8 @@ logger = structlog.get_logger(__name__)
 # without a full queue setup.
 SubmitFn = Callable[[AgentRequest], Awaitable[Any]]
 LLMDecisionFn = Callable[[StandingGoal, datetime], Awaitable["GoalDecision"]]
+# Hash of the goal's probed inputs, or None when it declares none.
+FingerprintFn = Callable[[StandingGoal], Awaitable[str | None]]
 
 
 class GoalDecision:
@@ -63,79 +73,121 @@ class GoalEvaluatorService:
         submit: SubmitFn,
         decide: LLMDecisionFn,
         clock: Callable[[], datetime] | None = None,
+        fingerprint: FingerprintFn | None = None,
+        max_concurrent: int = 4,
     ) -> None:
         self._store = store
         self._submit = submit
         self._decide = decide
         self._clock = clock or (lambda: datetime.now(UTC))
+        self._fingerprint = fingerprint
+        self._max_concurrent = max(1, max_concurrent)
 
     async def evaluate_due_goals(self) -> list[dict[str, Any]]:
         """Evaluate every enabled, due goal once.
 
-        Returns one summary record per goal that was evaluated (action
-        or no-action). Goals that are not due are silently skipped so
-        the daemon can call this from every heartbeat tick without
-        rate-limiting itself.
+        Returns one summary record per goal that was evaluated (action,
+        no-action or skipped because its inputs are unchanged). Goals
+        that are not due are silently skipped so the daemon can call
+        this from every heartbeat tick without rate-limiting itself.
         """
         now = self._clock()
-        results: list[dict[str, Any]] = []
-        for goal in await self._store.list():
-            if not goal.enabled:
-                continue
-            if not _is_due(goal, now):
-                continue
+        due = [goal for goal in await self._store.list() if goal.enabled and _is_due(goal, now)]
+        slots = asyncio.Semaphore(self._max_concurrent)
+
+        async def evaluate(goal: StandingGoal) -> dict[str, Any] | None:
+            async with slots:
+                return await self._evaluate_due_goal(goal, now)
+
+        results = await asyncio.gather(*(evaluate(goal) for goal in due))
+        return [result for result in results if result is not None]
+
+    async def _evaluate_due_goal(self, goal: StandingGoal, now: datetime) -> dict[str, Any] | None:
+        fingerprint = await self._probe_inputs(goal)
+        if fingerprint is not None and fingerprint == goal.input_fingerprint:
+            await self._store.mark_evaluated(goal.goal_id, now, "inputs unchanged")
+            logger.info("goal_evaluator.inputs_unchanged", goal_id=goal.goal_id)
+            return {
+                "goal_id": goal.goal_id,
+                "acted": False,
+                "rationale": "inputs unchanged",
+                "skipped": True,
+            }
+
+        try:
+            decision = await self._decide(goal, now)
+        except Exception as exc:
+            logger.warning(
+                "goal_evaluator.decision_failed",
+                goal_id=goal.goal_id,
+                error=str(exc),
+            )
+            return None
+
+        action_summary = decision.rationale
+        if decision.act:
+            request = AgentRequest(
+                channel="standing_goal",
+                message=decision.mission or goal.evaluation_prompt,
+                priority=goal.priority,
+                metadata={
+                    "standing_goal_id": goal.goal_id,
+                    "goal_description": goal.description,
+                },
+            )
             try:
-                decision = await self._decide(goal, now)
+                await self._submit(request)
             except Exception as exc:
                 logger.warning(
-                    "goal_evaluator.decision_failed",
+                    "goal_evaluator.submit_failed",
                     goal_id=goal.goal_id,
                     error=str(exc),
                 )
-                continue
+                return None
 
-            action_summary = decision.rationale
-            if decision.act:
-                request = AgentRequest(
-                    channel="standing_goal",
-                    message=decision.mission or goal.evaluation_prompt,
-                    priority=goal.priority,
-                    metadata={
-                        "standing_goal_id": goal.goal_id,
-                        "goal_description": goal.description,
-                    },
-                )
-                try:
-                    await self._submit(request)
-                except Exception as exc:
-                    logger.warning(
-                        "goal_evaluator.submit_failed",
-                        goal_id=goal.goal_id,
-                        error=str(exc),
-                    )
-                    continue
-
-            await self._store.mark_evaluated(goal.goal_id, now, action_summary)
-            results.append(
-                {
-                    "goal_id": goal.goal_id,
-                    "acted": decision.act,
-                    "rationale": action_summary,
-                }
-            )
-            logger.info(
-                "goal_evaluator.evaluated",
+        await self._store.mark_evaluated(
+            goal.goal_id, now, action_summary, input_fingerprint=fingerprint
+        )
+        logger.info(
+            "goal_evaluator.evaluated",
+            goal_id=goal.goal_id,
+            acted=decision.act,
+        )
+        return {
+            "goal_id": goal.goal_id,
+            "acted": decision.act,
+            "rationale": action_summary,
+        }
+
+    async def _probe_inputs(self, goal: StandingGoal) -> str | None:
+        """Fingerprint the goal's inputs; ``None`` means "evaluate as usual".
+
+        A failing probe must not silence a goal, so errors fall back to
+        an ungated evaluation.
+        """
+        if self._fingerprint is None or not goal.inputs:
+            return None
+        try:
+            return await self._fingerprint(goal)
+        except Exception as exc:
+            logger.warning(
+                "goal_evaluator.probe_failed",
                 goal_id=goal.goal_id,
-                acted=decision.act,
+                error=str(exc) or type(exc).__name__,
             )
-        return results
+            return None
 
     async def evaluate_goal(self, goal_id: str) -> dict[str, Any] | None:
-        """Force evaluation of a single goal (used by the ``/evaluate-now`` route)."""
+        """Force evaluation of a single goal (used by the ``/evaluate-now`` route).
+
+        Never skipped for unchanged inputs, but records their fingerprint
+        so the next heartbeat compares against this evaluation.
+        """
         goal = await self._store.get(goal_id)
         if goal is None:
             return None
         now = self._clock()
+        fingerprint = await self._probe_inputs(goal)
         decision = await self._decide(goal, now)
         action_summary = decision.rationale
         acted = decision.act
@@ -152,7 +204,9 @@ class GoalEvaluatorService:
                     },
                 )
             )
-        await self._store.mark_evaluated(goal_id, now, action_summary)
+        await self._store.mark_evaluated(
+            goal_id, now, action_summary, input_fingerprint=fingerprint
+        )
         return {
             "goal_id": goal_id,
             "acted": acted,
@@ -0,0 +1,159 @@
+"""Cheap input probes for standing goals.
+
+A standing goal may declare the inputs it watches in ``goal.inputs``.
+:class:`GoalInputProber` reads each input with a cheap probe and hashes
+the results into one fingerprint; the :class:`GoalEvaluatorService`
+skips a due goal whose fingerprint equals the one stored at its last
+evaluation, so an unchanged world costs neither an LLM call nor a
+mission.
+
+Built-in probe kinds (the ``type`` key of an input spec):
+
+- ``file`` — ``path`` (glob patterns allowed, relative to ``base_dir``):
+  mtime and size of every match, or a content hash with ``hash: true``
+- ``wiki_page`` — ``page``: the page's ``updated_at`` and body hash
+- ``event_count`` — ``source`` / ``event_type`` (``"*"`` allowed): how
+  many matching events the daemon has routed so far
+- ``tool`` — ``tool`` + ``params``: hash of a small tool call's result
+
+Further kinds are added with :meth:`GoalInputProber.register`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import glob
+import hashlib
+import json
+import os
+from collections.abc import Awaitable, Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+from taskforce.core.domain.standing_goal import StandingGoal
+
+# A probe receives the input spec and returns any JSON-serialisable
+# value; equal values mean "unchanged".
+ProbeFn = Callable[[dict[str, Any]], Awaitable[Any]]
+
+
+class GoalInputProber:
+    """Fingerprints the declared inputs of standing goals.
+
+    Args:
+        base_dir: Directory relative ``file`` paths are resolved against
+            (the daemon's current directory by default).
+        wiki_store_factory: Returns the wiki store on first use, so goals
+            without ``wiki_page`` inputs never build one.
+        event_counts: Returns routed-event counts keyed by
+            ``(source, event_type)``.
+        tool_resolver: Resolves a tool name to an instance (or ``None``).
+        timeout_seconds: Upper bound for probing one goal.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_dir: str | Path = ".",
+        wiki_store_factory: Callable[[], Any] | None = None,
+        event_counts: Callable[[], Mapping[tuple[str, str], int]] | None = None,
+        tool_resolver: Callable[[str], Any] | None = None,
+        timeout_seconds: float = 10.0,
+    ) -> None:
+        self._base_dir = Path(base_dir)
+        self._wiki_store_factory = wiki_store_factory
+        self._wiki_store: Any = None
+        self._event_counts = event_counts
+        self._tool_resolver = tool_resolver
+        self._timeout = timeout_seconds
+        self._probes: dict[str, ProbeFn] = {
+            "file": self._probe_file,
+            "wiki_page": self._probe_wiki_page,
+            "event_count": self._probe_event_count,
+            "tool": self._probe_tool,
+        }
+
+    def register(self, kind: str, probe: ProbeFn) -> None:
+        """Add or replace the probe for input specs of ``type: kind``."""
+        self._probes[kind] = probe
+
+    async def fingerprint(self, goal: StandingGoal) -> str | None:
+        """Return a hash over all probed inputs of ``goal``.
+
+        Returns ``None`` when the goal declares no inputs, so it is
+        evaluated on every cron firing as before.
+
+        Raises:
+            ValueError: If an input spec has an unknown ``type``.
+        """
+        if not goal.inputs:
+            return None
+        probes = []
+        for spec in goal.inputs:
+            probe = self._probes.get(spec.get("type", ""))
+            if probe is None:
+                raise ValueError(f"Unknown input type: {spec.get('type')!r}")
+            probes.append(probe(spec))
+        values = await asyncio.wait_for(asyncio.gather(*probes), timeout=self._timeout)
+        blob = json.dumps(
+            [[spec, value] for spec, value in zip(goal.inputs, values, strict=True)],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    async def _probe_file(self, spec: dict[str, Any]) -> Any:
+        pattern = os.path.expanduser(str(spec["path"]))
+        if not os.path.isabs(pattern):
+            pattern = str(self._base_dir / pattern)
+        with_hash = bool(spec.get("hash", False))
+        return await asyncio.to_thread(_stat_files, pattern, with_hash)
+
+    async def _probe_wiki_page(self, spec: dict[str, Any]) -> Any:
+        if self._wiki_store is None:
+            if self._wiki_store_factory is None:
+                raise RuntimeError("wiki_page inputs need a wiki store")
+            self._wiki_store = self._wiki_store_factory()
+        page = await self._wiki_store.get_page(str(spec["page"]))
+        if page is None:
+            return None
+        return [page.updated_at.isoformat(), _sha256(page.body.encode("utf-8"))]
+
+    async def _probe_event_count(self, spec: dict[str, Any]) -> int:
+        if self._event_counts is None:
+            raise RuntimeError("event_count inputs need an event router")
+        source = spec.get("source", "*")
+        event_type = spec.get("event_type", "*")
+        return sum(
+            count
+            for (seen_source, seen_type), count in self._event_counts().items()
+            if source in ("*", seen_source) and event_type in ("*", seen_type)
+        )
+
+    async def _probe_tool(self, spec: dict[str, Any]) -> str:
+        tool = self._tool_resolver(str(spec["tool"])) if self._tool_resolver else None
+        if tool is None:
+            raise RuntimeError(f"Tool not available for input probe: {spec['tool']!r}")
+        result = await tool.execute(**dict(spec.get("params") or {}))
+        return _sha256(json.dumps(result, sort_keys=True, default=str).encode("utf-8"))
+
+
+def _stat_files(pattern: str, with_hash: bool) -> list[list[Any]]:
+    """Return ``[path, mtime_ns, size(, sha256)]`` for every match of ``pattern``."""
+    rows: list[list[Any]] = []
+    for path in sorted(glob.glob(pattern, recursive=True)):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:  # removed between glob and stat
+            continue
+        if not os.path.isfile(path):
+            rows.append([path, stat.st_mtime_ns, None])
+        elif with_hash:
+            rows.append([path, None, stat.st_size, _sha256(Path(path).read_bytes())])
+        else:
+            rows.append([path, stat.st_mtime_ns, stat.st_size])
+    return rows
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
@@ -435,6 +435,7 @@ class InfrastructureBuilder:
         ctxman_config = CtxmanConfig.from_dict(cm_config.get("ctxman"))
         self._logger.info(
             "context_manager_backend_ctxman",
+            engine=ctxman_config.engine,
             base_url=ctxman_config.base_url,
             provider=ctxman_config.provider,
             on_unavailable=ctxman_config.on_unavailable,
@@ -573,18 +574,48 @@ class InfrastructureBuilder:
     # Message Bus
     # -------------------------------------------------------------------------
 
-    def build_message_bus(self) -> Any:
-        """Build an InMemoryMessageBus instance.
+    def build_message_bus(
+        self,
+        config: dict[str, Any] | None = None,
+        work_dir_override: str | None = None,
+    ) -> Any:
+        """Build the message bus selected by the ``message_bus`` config block.
 
         Centralises the extensions-infrastructure import so that
         application-layer code does not reference extensions directly.
 
+        ``message_bus.type`` is ``memory`` (default) or ``sqlite``; the
+        SQLite bus stores its database at ``message_bus.path`` (default
+        ``<work_dir>/message_bus.db``) and takes its delivery options from
+        the same block.
+
+        Args:
+            config: Profile configuration dictionary.
+            work_dir_override: Optional override for work directory.
+
         Returns:
-            InMemoryMessageBus instance implementing MessageBusProtocol.
+            MessageBusProtocol implementation.
+
+        Raises:
+            ValueError: If the bus type is unknown.
         """
-        from taskforce.infrastructure.messaging import InMemoryMessageBus
+        config = config or {}
+        bus_config = dict(config.get("message_bus") or {})
+        bus_type = bus_config.pop("type", "memory")
+
+        if bus_type == "memory":
+            from taskforce.infrastructure.messaging import InMemoryMessageBus
+
+            return InMemoryMessageBus()
+        if bus_type == "sqlite":
+            from taskforce.infrastructure.messaging import SqliteMessageBus
 
-        return InMemoryMessageBus()
+            work_dir = work_dir_override or config.get("persistence", {}).get(
+                "work_dir", ".taskforce"
+            )
+            path = bus_config.pop("path", None) or Path(work_dir) / "message_bus.db"
+            return SqliteMessageBus(path, **bus_config)
+        raise ValueError(f"Unknown message bus type: {bus_type}")
 
     # -------------------------------------------------------------------------
     # Wiki Store (long-term memory)
@@ -671,6 +702,14 @@ class InfrastructureBuilder:
 
         return FilePendingChannelQuestionStore(work_dir=work_dir)
 
+    def build_broadcast_outbox(self, work_dir: str = ".taskforce") -> Any:
+        """Build a FileBroadcastOutbox rooted at ``<work_dir>/outbox``."""
+        from taskforce.infrastructure.communication.broadcast_outbox import (
+            FileBroadcastOutbox,
+        )
+
+        return FileBroadcastOutbox(work_dir=work_dir)
+
     def build_tool_result_store(self, work_dir: str = ".taskforce") -> Any:
         """Build a FileToolResultStore rooted at ``<work_dir>/tool_results``."""
         from taskforce.application.infrastructure_overrides import (
@@ -0,0 +1,290 @@
+"""Background queue for post-mission learning.
+
+Learning used to run inline after every successful mission: one extra
+LLM call on the path to mission completion, per mission. The executor
+now hands finished missions to a :class:`LearningQueue`, which
+
+* skips missions without *novel tool evidence* — no successful tool
+  call, or only tool calls (same tool, same arguments) already seen by
+  an earlier mission. Re-asking the weather from the same API teaches
+  nothing the first run did not;
+* batches up to ``batch_size`` missions into one extraction call,
+  waiting at most ``max_wait_seconds`` for a batch to fill;
+* runs extraction in a background task, so the mission result is not
+  held back by it.
+
+Queues live for the process, one per ``(profile, wiki root)``, so
+evidence and batches are shared by all agents writing the same wiki.
+Long-running hosts call :func:`drain_learning_queues` before shutdown;
+a cancelled worker (``asyncio.run`` returning after a one-shot CLI
+mission) flushes what is queued before it exits. A wiki store without
+a stable ``root`` (e.g. a custom override) gets a fresh queue per
+mission that is flushed inline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+from taskforce.application.learning_service import (
+    LlmExtractingLearningService,
+    MissionTranscript,
+)
+from taskforce.core.interfaces.learning import LearningResult
+
+logger = structlog.get_logger(__name__)
+
+_QUEUES: dict[tuple[str, str], tuple[asyncio.AbstractEventLoop, LearningQueue]] = {}
+
+
+def tool_evidence(messages: list[dict[str, Any]]) -> list[str]:
+    """Return one key per successful tool call: hash of tool name and arguments."""
+    calls: dict[str, tuple[str, str]] = {}
+    for msg in messages:
+        if msg.get("role") != "assistant":
+            continue
+        for call in msg.get("tool_calls") or []:
+            function = call.get("function") or {}
+            calls[str(call.get("id"))] = (
+                str(function.get("name", "")),
+                _canonical_arguments(function.get("arguments")),
+            )
+    keys: list[str] = []
+    for msg in messages:
+        if msg.get("role") != "tool":
+            continue
+        content = str(msg.get("content") or "").strip()
+        if not content or content.startswith("ERROR:"):
+            continue
+        name, arguments = calls.get(str(msg.get("tool_call_id")), (str(msg.get("name", "")), ""))
+        key = hashlib.sha256(f"{name}\0{arguments}".encode()).hexdigest()
+        if key not in keys:
+            keys.append(key)
+    return keys
+
+
+def _canonical_arguments(arguments: Any) -> str:
+    if isinstance(arguments, str):
+        try:
+            arguments = json.loads(arguments)
+        except ValueError:
+            return arguments.strip()
+    return json.dumps(arguments, sort_keys=True, ensure_ascii=False, default=str)
+
+
+@dataclass
+class _Pending:
+    transcript: MissionTranscript
+    evidence: list[str]
+    queued_at: float
+
+
+class LearningQueue:
+    """Batches finished missions into background extraction calls.
+
+    Args:
+        service: Extraction service writing to one wiki.
+        batch_size: Missions per extraction call.
+        max_wait_seconds: Longest a queued mission waits for its batch
+            to fill.
+        max_pending: Missions held at most; further ones are dropped.
+        seen_capacity: Tool-evidence keys remembered for novelty checks.
+        background: Run extraction in a background task. When false
+            the caller drives it with :meth:`flush`.
+    """
+
+    def __init__(
+        self,
+        service: LlmExtractingLearningService,
+        *,
+        batch_size: int = 4,
+        max_wait_seconds: float = 30.0,
+        max_pending: int = 64,
+        seen_capacity: int = 4096,
+        background: bool = True,
+    ) -> None:
+        self._service = service
+        self._batch_size = max(1, batch_size)
+        self._max_wait = max_wait_seconds
+        self._max_pending = max_pending
+        self._seen_capacity = seen_capacity
+        self._background = background
+        self._pending: list[_Pending] = []
+        self._seen: OrderedDict[str, None] = OrderedDict()
+        self._wake = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._worker: asyncio.Task[None] | None = None
+
+    @property
+    def service(self) -> LlmExtractingLearningService:
+        return self._service
+
+    @property
+    def background(self) -> bool:
+        return self._background
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def submit(self, mission: str, messages: list[dict[str, Any]], session_id: str) -> bool:
+        """Queue a finished mission; return False if it was skipped."""
+        evidence = tool_evidence(messages)
+        if not any(key not in self._seen for key in evidence):
+            logger.info(
+                "learning_queue.skipped",
+                session_id=session_id,
+                reason="no_novel_tool_evidence" if evidence else "no_tool_evidence",
+            )
+            return False
+        if len(self._pending) >= self._max_pending:
+            logger.warning("learning_queue.full", session_id=session_id)
+            return False
+        for key in evidence:
+            self._seen[key] = None
+            self._seen.move_to_end(key)
+        while len(self._seen) > self._seen_capacity:
+            self._seen.popitem(last=False)
+
+        loop = asyncio.get_running_loop()
+        self._pending.append(
+            _Pending(
+                transcript=MissionTranscript(
+                    mission=mission, messages=messages, session_id=session_id
+                ),
+                evidence=evidence,
+                queued_at=loop.time(),
+            )
+        )
+        if self._background:
+            if self._worker is None or self._worker.done():
+                self._worker = loop.create_task(self._run(), name="learning-queue")
+            if len(self._pending) >= self._batch_size:
+                self._wake.set()
+        return True
+
+    async def flush(self) -> list[LearningResult]:
+        """Extract everything queued now, batch by batch."""
+        results = []
+        while self._pending:
+            results.append(await self._learn(self._take()))
+        return results
+
+    async def drain(self) -> list[LearningResult]:
+        """Flush and stop the background task (host shutdown)."""
+        results = await self.flush()
+        if self._worker is not None:
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+        return results
+
+    def _take(self) -> list[_Pending]:
+        batch = self._pending[: self._batch_size]
+        del self._pending[: self._batch_size]
+        return batch
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while self._pending:
+                if len(self._pending) < self._batch_size:
+                    self._wake.clear()
+                    timeout = self._pending[0].queued_at + self._max_wait - loop.time()
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(self._wake.wait(), max(0.0, timeout))
+                batch = self._take()
+                if not batch:
+                    continue
+                try:
+                    await self._learn(batch)
+                except Exception as exc:  # noqa: BLE001 — keep serving later batches
+                    logger.warning(
+                        "learning_queue.batch_failed", missions=len(batch), error=repr(exc)
+                    )
+        except asyncio.CancelledError:
+            # ``asyncio.run`` cancels leftover tasks when a one-shot CLI
+            # mission returns; learn what is queued before giving up.
+            if self._pending:
+                await self.flush()
+            raise
+
+    async def _learn(self, batch: list[_Pending]) -> LearningResult:
+        # One extraction at a time: the worker and a flush may overlap,
+        # and both merge facts into the same pages.
+        async with self._lock:
+            result = await self._service.learn_from_missions([p.transcript for p in batch])
+        if result.skipped_reason and result.skipped_reason != "empty transcript":
+            # Nothing was learned from this evidence; let a later mission retry.
+            for pending in batch:
+                for key in pending.evidence:
+                    self._seen.pop(key, None)
+        logger.info(
+            "learning_queue.batch",
+            missions=len(batch),
+            pages_written=result.pages_written,
+            skipped=result.skipped_reason,
+        )
+        return result
+
+
+def get_learning_queue(
+    profile: str,
+    wiki_store: Any,
+    llm_service: Any,
+    config: dict[str, Any],
+) -> LearningQueue:
+    """Return the process-wide queue for ``profile`` and ``wiki_store``.
+
+    ``config`` is the profile's ``learning`` block. The queue (and its
+    extraction service) is created on first use and then reused; it
+    keeps the LLM service it was created with.
+    """
+    root = getattr(wiki_store, "root", None)
+    loop = asyncio.get_running_loop()
+    key = (profile, str(root))
+    # Queues of finished loops (one ``asyncio.run`` per CLI mission)
+    # can never run again; drop them with their services.
+    for stale_key, (queue_loop, _) in list(_QUEUES.items()):
+        if queue_loop.is_closed():
+            del _QUEUES[stale_key]
+    if root is not None:
+        entry = _QUEUES.get(key)
+        if entry is not None and entry[0] is loop:
+            return entry[1]
+    queue = LearningQueue(
+        LlmExtractingLearningService(
+            wiki_store=wiki_store,
+            llm_service=llm_service,
+            model_alias=str(config.get("model_alias", "fast")),
+            merge_threshold=config.get("merge_threshold", 0.35),
+            duplicate_threshold=float(config.get("duplicate_threshold", 0.8)),
+        ),
+        batch_size=int(config.get("batch_size", 4)),
+        max_wait_seconds=float(config.get("max_wait_seconds", 30.0)),
+        background=bool(config.get("background", True)) and root is not None,
+    )
+    if root is not None:
+        _QUEUES[key] = (loop, queue)
+    return queue
+
+
+async def drain_learning_queues() -> None:
+    """Extract everything still queued on the running loop; never raises."""
+    loop = asyncio.get_running_loop()
+    for queue_loop, queue in list(_QUEUES.values()):
+        if queue_loop is not loop:
+            continue
+        try:
+            await queue.drain()
+        except Exception as exc:  # noqa: BLE001 — shutdown must not fail
+            logger.warning("learning_queue.drain_failed", error=str(exc))
@@ -1,37 +1,50 @@
 """Post-mission learning service.
 
-After a mission completes successfully, this service asks a fast LLM to
+After missions complete successfully, this service asks a fast LLM to
 extract any *reusable* knowledge (working data sources, recurring
 entities, workflow rules) and writes it as wiki pages. Transient facts
 (today's weather, the next train time) are deliberately ignored — the
 prompt is shaped to capture only what would still be useful next week.
+Several finished missions can share one extraction call
+(:meth:`LlmExtractingLearningService.learn_from_missions`); the
+executor feeds it through the background ``LearningQueue``.
+
+Before a fact becomes a new page it is compared with the existing
+pages of its kind by a local TF-IDF index: a near-duplicate of what a
+page already says is dropped, a closely related fact is appended to
+that page's ``Aktualisierung`` section, and only genuinely new facts
+create pages. This keeps the wiki (and every search over it) from
+growing with paraphrases of the same knowledge.
 
 The service is side-effect-only with respect to the wiki. It never
 raises; on error it logs and returns a LearningResult with
-``skipped_reason``. Callers can therefore await it on the hot path
-without try/except wrapping.
+``skipped_reason``.
 """
 
 from __future__ import annotations
 
 import json
+import math
 import re
+from collections import Counter
+from dataclasses import dataclass
 from typing import Any
 
 import structlog
 
+from taskforce.application.topic_detector import content_terms
 from taskforce.core.domain.wiki_page import WikiPage
 from taskforce.core.interfaces.learning import LearningResult
-from taskforce.core.interfaces.wiki_store import WikiStoreProtocol
+from taskforce.core.interfaces.wiki_store import WikiPageSignatureProvider, WikiStoreProtocol
 
 logger = structlog.get_logger(__name__)
 
 
 _EXTRACTION_PROMPT = """\
 You are a knowledge-extraction assistant for a long-running personal AI \
-butler. Your job is to look at one finished mission and decide whether it \
-produced any *reusable* fact that should go into the butler's long-term \
-wiki.
+butler. Your job is to look at one or more finished missions and decide \
+whether they produced any *reusable* fact that should go into the butler's \
+long-term wiki.
 
 Reusable means: still useful in a week or a month, for similar future \
 questions. This wiki is long-term memory, not a scratchpad. NOT reusable: \
@@ -66,7 +79,8 @@ applies",
 
 Rules:
 - Output an empty ``facts`` array if nothing reusable was learned.
-- At most 3 facts per mission. Quality over quantity.
+- At most 3 facts per mission. Quality over quantity. Report a fact \
+  shown by several missions once.
 - Slug: lowercase, hyphens, ASCII only (ae/oe/ue/ss for umlauts).
 - Body must be markdown, ≤ 600 characters.
 - Do not invent facts. Only extract what the mission's tool results \
@@ -74,6 +88,12 @@ Rules:
 - Only write facts with explicit future relevance. If the candidate is \
   merely ephemeral run state, leave ``facts`` empty.
 
+{missions}
+"""
+
+_MISSION_BLOCK = """\
+### Mission {number}
+
 Mission text:
 {mission}
 
@@ -81,6 +101,104 @@ Mission transcript (truncated):
 {transcript}
 """
 
+_KINDS = frozenset({"concepts", "entities", "preferences"})
+_UPDATE_SECTION = "Aktualisierung"
+# Splits a page body into the paragraphs and list items a fact is
+# compared against.
+_ENTRY_SPLIT_RE = re.compile(r"\n\s*\n|\n(?=[-*] )")
+
+
+@dataclass(frozen=True)
+class MissionTranscript:
+    """One finished mission handed to the learning service."""
+
+    mission: str
+    messages: list[dict[str, Any]]
+    session_id: str
+
+
+class _SimilarityIndex:
+    """TF-IDF vectors of the wiki's knowledge pages, updated per page.
+
+    Each page is indexed as a whole and per entry (paragraph or list
+    item), so a fact that repeats one bullet of a long page still scores
+    high. :meth:`nearest` returns the best-matching page of a kind.
+    """
+
+    def __init__(self) -> None:
+        self._pages: dict[str, list[Counter[str]]] = {}
+        self._doc_freq: Counter[str] = Counter()
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def add(self, page: WikiPage) -> None:
+        self.discard(page.name)
+        entries = [
+            Counter(content_terms(page.title + "\n" + chunk)) for chunk in _chunks(page.body)
+        ]
+        whole = Counter(content_terms(f"{page.title}\n{page.body}\n{' '.join(page.tags)}"))
+        self._pages[page.name] = [whole, *(e for e in entries if e)]
+        self._doc_freq.update(whole.keys())
+
+    def discard(self, name: str) -> None:
+        vectors = self._pages.pop(name, None)
+        if vectors:
+            self._doc_freq.subtract(vectors[0].keys())
+
+    def similarity(self, name: str, text: str) -> float:
+        vectors = self._pages.get(name)
+        query = Counter(content_terms(text))
+        if not vectors or not query:
+            return 0.0
+        return max(self._cosine(query, vector) for vector in vectors)
+
+    def nearest(self, kind: str, text: str) -> tuple[str | None, float]:
+        best: tuple[str | None, float] = (None, 0.0)
+        for name in self._pages:
+            if name.split("/", 1)[0] != kind:
+                continue
+            score = self.similarity(name, text)
+            if score > best[1]:
+                best = (name, score)
+        return best
+
+    def _idf(self, term: str) -> float:
+        return math.log((1 + len(self._pages)) / (1 + self._doc_freq[term])) + 1.0
+
+    def _cosine(self, a: Counter[str], b: Counter[str]) -> float:
+        wa = {t: n * self._idf(t) for t, n in a.items()}
+        wb = {t: n * self._idf(t) for t, n in b.items()}
+        dot = sum(w * wb[t] for t, w in wa.items() if t in wb)
+        if dot == 0.0:
+            return 0.0
+        norm = math.sqrt(sum(w * w for w in wa.values())) * math.sqrt(
+            sum(w * w for w in wb.values())
+        )
+        return dot / norm
+
+
+def _update_entry(body: str, page_body: str) -> str | None:
+    """Render ``body`` as one list item, minus headings and lines the page has."""
+    known = {line.strip() for line in page_body.splitlines()}
+    lines = [
+        line.strip()
+        for line in body.splitlines()
+        if line.strip() and not line.lstrip().startswith("#") and line.strip() not in known
+    ]
+    if not lines:
+        return None
+    return "- " + "\n  ".join(lines)
+
+
+def _chunks(body: str) -> list[str]:
+    chunks = []
+    for chunk in _ENTRY_SPLIT_RE.split(body):
+        lines = [line for line in chunk.strip().splitlines() if not line.startswith("#")]
+        if lines:
+            chunks.append("\n".join(lines))
+    return chunks
+
 
 class LlmExtractingLearningService:
     """LearningStrategyProtocol implementation backed by an LLM.
@@ -90,7 +208,13 @@ class LlmExtractingLearningService:
         llm_service: LiteLLMService-like object exposing
             ``complete_json(prompt, system_prompt, model)``.
         model_alias: LLM alias used for extraction (default ``fast``).
-        max_transcript_chars: Cap on the transcript blob fed to the LLM.
+        max_transcript_chars: Cap on the transcript blob fed to the LLM
+            per mission.
+        merge_threshold: Similarity to an existing page of the same kind
+            at which a fact is appended to that page instead of becoming
+            a new one. ``None`` only merges into a page of the same name.
+        duplicate_threshold: Similarity at which a fact counts as already
+            known and is not written at all.
     """
 
     def __init__(
@@ -99,11 +223,26 @@ class LlmExtractingLearningService:
         llm_service: Any,
         model_alias: str = "fast",
         max_transcript_chars: int = 8000,
+        merge_threshold: float | None = 0.35,
+        duplicate_threshold: float = 0.8,
     ) -> None:
         self._wiki = wiki_store
         self._llm = llm_service
         self._model = model_alias
         self._max_chars = max_transcript_chars
+        self._merge_threshold = merge_threshold
+        self._duplicate_threshold = duplicate_threshold
+        self._index = _SimilarityIndex()
+        # Store signature of each indexed page; ``None`` for pages this
+        # service wrote, so the next sync re-reads them.
+        self._indexed: dict[str, tuple[int, int] | None] = {}
+        self._index_current = False
+        self._llm_calls = 0
+
+    @property
+    def llm_calls(self) -> int:
+        """Number of extraction calls made so far."""
+        return self._llm_calls
 
     async def learn_from_mission(
         self,
@@ -111,14 +250,28 @@ class LlmExtractingLearningService:
         messages: list[dict[str, Any]],
         session_id: str,
     ) -> LearningResult:
+        return await self.learn_from_missions(
+            [MissionTranscript(mission=mission, messages=messages, session_id=session_id)]
+        )
+
+    async def learn_from_missions(self, missions: list[MissionTranscript]) -> LearningResult:
+        """Extract reusable facts from several missions with one LLM call."""
+        session_id = ",".join(m.session_id[:8] for m in missions)
         try:
-            transcript = self._render_transcript(messages)
-            if not transcript.strip():
+            blocks = []
+            for number, item in enumerate(missions, start=1):
+                transcript = self._render_transcript(item.messages)
+                if transcript.strip():
+                    blocks.append(
+                        _MISSION_BLOCK.format(
+                            number=number, mission=item.mission, transcript=transcript
+                        )
+                    )
+            if not blocks:
                 return LearningResult(0, [], "empty transcript")
 
-            prompt = _EXTRACTION_PROMPT.format(
-                mission=mission, transcript=transcript
-            )
+            prompt = _EXTRACTION_PROMPT.format(missions="\n".join(blocks))
+            self._llm_calls += 1
             response = await self._llm.complete_json(
                 prompt=prompt,
                 model=self._model,
@@ -136,8 +289,10 @@ class LlmExtractingLearningService:
             if not isinstance(facts, list):
                 return LearningResult(0, [], "invalid llm output shape")
 
+            # Re-synced per pass: the agent edits the wiki between batches.
+            self._index_current = False
             written: list[str] = []
-            for fact in facts[:3]:
+            for fact in facts[: 3 * len(blocks)]:
                 if not self._is_future_relevant_fact(fact):
                     logger.info(
                         "learning.fact_rejected",
@@ -149,17 +304,18 @@ class LlmExtractingLearningService:
                     )
                     continue
                 page_name = await self._persist_fact(fact, session_id)
-                if page_name:
+                if page_name and page_name not in written:
                     written.append(page_name)
 
             if written:
                 await self._wiki.append_log(
                     f"learning: extracted {len(written)} fact(s) "
-                    f"from session {session_id[:8]} → {', '.join(written)}"
+                    f"from session {session_id} → {', '.join(written)}"
                 )
                 logger.info(
                     "learning.completed",
                     session_id=session_id,
+                    missions=len(missions),
                     pages_written=written,
                 )
 
@@ -218,20 +374,47 @@ class LlmExtractingLearningService:
         body = str(fact.get("body", "")).strip()
         tags = fact.get("tags") or []
 
-        if kind not in {"concepts", "entities", "preferences"}:
+        if kind not in _KINDS:
             return None
         if not slug or not title or not body:
             return None
 
+        index = await self._similarity_index()
+        text = f"{title}\n{body}"
         name = f"{kind}/{slug}"
         existing = await self._wiki.get_page(name)
         if existing is not None:
-            await self._wiki.update_section(
+            score = index.similarity(name, text)
+        else:
+            match, score = index.nearest(kind, text)
+            if (
+                match is not None
+                and self._merge_threshold is not None
+                and score >= self._merge_threshold
+            ):
+                name = match
+                existing = await self._wiki.get_page(name)
+
+        if existing is not None:
+            if score >= self._duplicate_threshold:
+                logger.info(
+                    "learning.fact_known",
+                    session_id=session_id,
+                    page=name,
+                    similarity=round(score, 2),
+                )
+                return None
+            content = _update_entry(body, existing.body)
+            if content is None:
+                return None
+            updated = await self._wiki.update_section(
                 name=name,
-                section="Aktualisierung",
-                content=f"- {body}",
+                section=_UPDATE_SECTION,
+                content=content,
                 mode="append",
             )
+            if updated is not None:
+                self._index_page(updated)
             return name
 
         page = WikiPage(
@@ -241,8 +424,52 @@ class LlmExtractingLearningService:
             tags=[str(t) for t in tags if isinstance(t, str)][:8],
         )
         await self._wiki.write_page(page)
+        self._index_page(page)
         return name
 
+    def _index_page(self, page: WikiPage) -> None:
+        self._index.add(page)
+        self._indexed[page.name] = None
+
+    async def _similarity_index(self) -> _SimilarityIndex:
+        """Return the index, synced with the wiki once per pass.
+
+        Stores that report page signatures cost one re-read per page
+        changed since the last pass; others are re-read in full.
+        """
+        if self._index_current:
+            return self._index
+        if isinstance(self._wiki, WikiPageSignatureProvider):
+            await self._sync_changed_pages(await self._wiki.page_signatures())
+        else:
+            self._index = _SimilarityIndex()
+            for page in await self._wiki.list_pages():
+                if page.name.split("/", 1)[0] in _KINDS:
+                    self._index.add(page)
+        self._index_current = True
+        return self._index
+
+    async def _sync_changed_pages(self, signatures: dict[str, tuple[int, int]]) -> None:
+        indexed = self._indexed
+        current = {
+            name: signature
+            for name, signature in signatures.items()
+            if name.split("/", 1)[0] in _KINDS
+        }
+        for name in [name for name in indexed if name not in current]:
+            self._index.discard(name)
+            del indexed[name]
+        for name, signature in current.items():
+            if indexed.get(name) == signature:
+                continue
+            page = await self._wiki.get_page(name)
+            if page is None:
+                self._index.discard(name)
+                indexed.pop(name, None)
+                continue
+            self._index.add(page)
+            indexed[name] = signature
+
     def _render_transcript(self, messages: list[dict[str, Any]]) -> str:
         """Compact the message list into a plain-text transcript.
 
@@ -0,0 +1,219 @@
+"""Rate-limited, bounded-concurrency fan-out for outbound notifications.
+
+Broadcasts used to await one ``send_notification`` after another, so a
+few thousand Telegram recipients took tens of minutes — and nothing kept
+the gateway under the provider's rate limits once sends were
+parallelized. ``NotificationFanout`` enforces, per channel:
+
+- a concurrency cap (``asyncio.Semaphore``) on in-flight sends,
+- a channel-wide token bucket (e.g. Telegram's ~30 msg/s per bot),
+- a per-recipient token bucket (e.g. Telegram's ~1 msg/s per chat).
+
+The limits are shared by every broadcast and single notification going
+through the same gateway, so concurrent callers cannot jointly exceed
+them.
+
+Usage::
+
+    fanout = NotificationFanout()
+    results = await fanout.run("telegram", [(chat_id, make_send(chat_id)) ...])
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class ChannelLimits:
+    """Delivery limits for one channel.
+
+    Attributes:
+        concurrency: Maximum in-flight sends on the channel.
+        rate_per_s: Channel-wide sustained sends per second (``None`` =
+            unlimited).
+        burst: Channel-wide bucket capacity.
+        recipient_rate_per_s: Sustained sends per second to any single
+            recipient (``None`` = unlimited).
+        recipient_burst: Per-recipient bucket capacity.
+    """
+
+    concurrency: int = 8
+    rate_per_s: float | None = None
+    burst: int = 1
+    recipient_rate_per_s: float | None = None
+    recipient_burst: int = 1
+
+
+# Telegram Bot API: ~30 messages/s per bot, ~1 message/s per chat. Stay a
+# little below the global ceiling so retries and other traffic fit.
+DEFAULT_CHANNEL_LIMITS: dict[str, ChannelLimits] = {
+    "telegram": ChannelLimits(
+        concurrency=16,
+        rate_per_s=25.0,
+        burst=25,
+        recipient_rate_per_s=1.0,
+        recipient_burst=1,
+    ),
+}
+
+
+class TokenBucket:
+    """Async token bucket.
+
+    ``acquire`` reserves a token immediately (the balance may go
+    negative) and sleeps off the deficit, so waiters are served in
+    arrival order without a lock or polling loop.
+    """
+
+    def __init__(
+        self,
+        rate_per_s: float,
+        capacity: int,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate_per_s <= 0:
+            raise ValueError("rate_per_s must be positive")
+        self._rate = rate_per_s
+        self._capacity = float(max(1, capacity))
+        self._tokens = self._capacity
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    @property
+    def idle(self) -> bool:
+        """Whether the bucket is full, i.e. dropping it loses no state."""
+        self._refill()
+        return self._tokens >= self._capacity
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it."""
+        self._refill()
+        self._tokens -= 1.0
+        return 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+
+    async def acquire(self) -> None:
+        """Wait until one token is available and consume it."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class NotificationFanout:
+    """Per-channel concurrency and rate limiting for outbound sends.
+
+    Args:
+        limits: Channel name -> :class:`ChannelLimits`. Merged over
+            :data:`DEFAULT_CHANNEL_LIMITS`.
+        default_limits: Limits for channels without an explicit entry.
+        max_tracked_recipients: Per-channel cap on remembered recipient
+            buckets; idle (full) buckets are dropped beyond it.
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, ChannelLimits] | None = None,
+        *,
+        default_limits: ChannelLimits | None = None,
+        max_tracked_recipients: int = 10_000,
+    ) -> None:
+        self._limits = {**DEFAULT_CHANNEL_LIMITS, **(limits or {})}
+        self._default_limits = default_limits or ChannelLimits()
+        self._max_tracked_recipients = max_tracked_recipients
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._channel_buckets: dict[str, TokenBucket] = {}
+        self._recipient_buckets: dict[str, dict[str, TokenBucket]] = {}
+
+    def limits_for(self, channel: str) -> ChannelLimits:
+        """Return the effective limits for *channel*."""
+        return self._limits.get(channel, self._default_limits)
+
+    @asynccontextmanager
+    async def slot(self, channel: str, recipient: str) -> AsyncIterator[None]:
+        """Hold one delivery slot for *recipient* on *channel*.
+
+        Waits for the recipient bucket before taking a concurrency slot,
+        so a chatty recipient never blocks deliveries to everyone else.
+        """
+        limits = self.limits_for(channel)
+        recipient_bucket = self._recipient_bucket(channel, recipient, limits)
+        if recipient_bucket is not None:
+            await recipient_bucket.acquire()
+        async with self._semaphore(channel, limits):
+            channel_bucket = self._channel_bucket(channel, limits)
+            if channel_bucket is not None:
+                await channel_bucket.acquire()
+            yield
+
+    async def run(
+        self,
+        channel: str,
+        jobs: list[tuple[str, Callable[[], Awaitable[T]]]],
+    ) -> list[T]:
+        """Run ``(recipient, job)`` pairs under the channel's limits.
+
+        At most ``concurrency`` worker tasks are spawned regardless of
+        the number of jobs. Results are returned in job order.
+        """
+        results: list[T | None] = [None] * len(jobs)
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        for index in range(len(jobs)):
+            queue.put_nowait(index)
+
+        async def worker() -> None:
+            while True:
+                try:
+                    index = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                recipient, job = jobs[index]
+                async with self.slot(channel, recipient):
+                    results[index] = await job()
+
+        workers = min(self.limits_for(channel).concurrency, len(jobs))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        return results  # type: ignore[return-value]
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _semaphore(self, channel: str, limits: ChannelLimits) -> asyncio.Semaphore:
+        if channel not in self._semaphores:
+            self._semaphores[channel] = asyncio.Semaphore(max(1, limits.concurrency))
+        return self._semaphores[channel]
+
+    def _channel_bucket(self, channel: str, limits: ChannelLimits) -> TokenBucket | None:
+        if limits.rate_per_s is None:
+            return None
+        if channel not in self._channel_buckets:
+            self._channel_buckets[channel] = TokenBucket(limits.rate_per_s, limits.burst)
+        return self._channel_buckets[channel]
+
+    def _recipient_bucket(
+        self, channel: str, recipient: str, limits: ChannelLimits
+    ) -> TokenBucket | None:
+        if limits.recipient_rate_per_s is None:
+            return None
+        buckets = self._recipient_buckets.setdefault(channel, {})
+        bucket = buckets.get(recipient)
+        if bucket is None:
+            if len(buckets) >= self._max_tracked_recipients:
+                for key in [k for k, b in buckets.items() if b.idle]:
+                    del buckets[key]
+            bucket = TokenBucket(limits.recipient_rate_per_s, limits.recipient_burst)
+            buckets[recipient] = bucket
+        return bucket
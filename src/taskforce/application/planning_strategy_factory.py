@@ -6,14 +6,18 @@ planning strategy class from a strategy name and optional parameters.
 
 from __future__ import annotations
 
+import hashlib
+import json
 from typing import Any
 
 import structlog
 
 from taskforce.core.domain.complexity_classifier import (
+    ComplexityVerdictCache,
     HeuristicComplexityClassifier,
     MissionComplexityClassifier,
     TwoStageComplexityClassifier,
+    get_complexity_verdict_cache,
 )
 from taskforce.core.domain.planning_strategy import (
     AdaptivePlanningStrategy,
@@ -37,6 +41,25 @@ def _coerce_bool(value: Any, default: bool) -> bool:
     return bool(value)
 
 
+def _routing_profile_hash(params: dict[str, Any]) -> str:
+    """Hash the adaptive routing params so cached verdicts stay per-profile."""
+    canonical = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+_CUSTOM_TTL_CACHES: dict[float, ComplexityVerdictCache] = {}
+
+
+def _verdict_cache(ttl_seconds: float) -> ComplexityVerdictCache:
+    """Return the shared verdict cache, or a dedicated one for a custom TTL."""
+    shared = get_complexity_verdict_cache()
+    if ttl_seconds == shared.ttl_seconds:
+        return shared
+    return _CUSTOM_TTL_CACHES.setdefault(
+        ttl_seconds, ComplexityVerdictCache(ttl_seconds=ttl_seconds)
+    )
+
+
 def select_planning_strategy(
     strategy_name: str | None = None,
     params: dict[str, Any] | None = None,
@@ -125,6 +148,14 @@ def select_planning_strategy(
         #   "llm"                 — LLM only, every mission
         #   "heuristic"           — heuristic only, no LLM (fallback on UNKNOWN)
         classifier_mode = params.get("classifier_mode", "two_stage")
+        # Verdicts are cached process-wide per mission fingerprint and
+        # routing profile; 0 disables the cache.
+        cache_ttl = float(params.get("classifier_cache_ttl_seconds", 3600))
+        # Start the simple strategy while the LLM classifier runs. Only
+        # native_react is known to be side-effect free up to its first
+        # tool call, so other simple strategies default to waiting.
+        speculate_default = "simple" if simple_name == "native_react" else None
+        speculate = params.get("speculate", speculate_default) or None
 
         # Sub-strategies recursively use the same factory so they pick up
         # their own param defaults. They themselves are non-adaptive, so
@@ -164,6 +195,9 @@ def select_planning_strategy(
             complex_strategy=complex_strategy,
             classifier=classifier,
             fallback_level=fallback_level,
+            speculate=speculate,
+            verdict_cache=_verdict_cache(cache_ttl) if cache_ttl > 0 else None,
+            profile_hash=_routing_profile_hash(params),
             logger=logger,
         )
 
@@ -16,6 +16,10 @@ Lookup order for a given model id:
 If even ``default`` is missing the cost is reported as ``0.0`` rather
 than raising, so analytics endpoints stay non-blocking when the file is
 malformed.
+
+Prompt tokens served from the provider's prompt cache are priced with
+``cached_input_per_1m_usd``; entries without it bill cached tokens at
+the regular input rate.
 """
 
 from __future__ import annotations
@@ -34,12 +38,22 @@ logger = structlog.get_logger(__name__)
 class ModelPrice:
     input_per_1m_usd: float
     output_per_1m_usd: float
+    cached_input_per_1m_usd: float | None = None
+
+    @property
+    def cached_input_rate(self) -> float:
+        """USD per 1M cached prompt tokens (falls back to the input rate)."""
+        if self.cached_input_per_1m_usd is None:
+            return self.input_per_1m_usd
+        return self.cached_input_per_1m_usd
 
     @classmethod
     def from_dict(cls, raw: Mapping[str, object]) -> "ModelPrice":
+        cached = raw.get("cached_input_per_1m_usd")
         return cls(
             input_per_1m_usd=float(raw.get("input_per_1m_usd", 0) or 0),
             output_per_1m_usd=float(raw.get("output_per_1m_usd", 0) or 0),
+            cached_input_per_1m_usd=float(cached) if cached is not None else None,
         )
 
 
@@ -67,14 +81,28 @@ class PricingTable:
     def as_of(self) -> str | None:
         return self._as_of
 
-    def cost(self, model: str, prompt_tokens: int, completion_tokens: int) -> PricingResult:
+    def cost(
+        self,
+        model: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        cached_prompt_tokens: int = 0,
+    ) -> PricingResult:
+        """Estimate the USD cost of one call.
+
+        ``cached_prompt_tokens`` is the part of ``prompt_tokens`` that was
+        read from the provider's prompt cache.
+        """
         if not model:
             model = "unknown"
         price = self._lookup(model)
         if price is None:
             return PricingResult(cost_usd=0.0, matched_model=model, is_default=True)
+        prompt = prompt_tokens or 0
+        cached = min(max(cached_prompt_tokens or 0, 0), prompt)
         cost = (
-            (prompt_tokens or 0) / 1_000_000 * price.input_per_1m_usd
+            (prompt - cached) / 1_000_000 * price.input_per_1m_usd
+            + cached / 1_000_000 * price.cached_input_rate
             + (completion_tokens or 0) / 1_000_000 * price.output_per_1m_usd
         )
         is_default = price is self._default
@@ -35,6 +35,7 @@ from taskforce.application.config_schema import (
     ConfigValidationError,
     validate_profile_config,
 )
+from taskforce.core.utils.config_catalog import get_config_catalog
 
 logger = structlog.get_logger(__name__)
 
@@ -156,10 +157,7 @@ class ProfileLoader:
             config_dir / "custom" / f"{profile}.agent.md",
             config_dir / "custom" / f"{profile}.yaml",
         ]
-        for candidate in candidates:
-            if candidate.exists():
-                return candidate
-        return None
+        return get_config_catalog().first_file(candidates)
 
     def _find_profile_path(self, profile: str) -> Path | None:
         """Search all config directories for a profile file."""
@@ -180,23 +178,20 @@ class ProfileLoader:
 
     def _preset_dirs(self) -> list[Path]:
         """Directories searched when resolving ``extends:`` references."""
-        dirs: list[Path] = []
-        primary_presets = self._config_dir / "presets"
-        if primary_presets.is_dir():
-            dirs.append(primary_presets)
-        for extra_dir in _extra_config_dirs:
-            presets_dir = extra_dir / "presets"
-            if presets_dir.is_dir():
-                dirs.append(presets_dir)
-        return dirs
+        catalog = get_config_catalog()
+        return [
+            config_dir / "presets"
+            for config_dir in [self._config_dir, *_extra_config_dirs]
+            if catalog.is_dir(config_dir / "presets")
+        ]
 
     def _load_defaults(self) -> dict[str, Any]:
         """Load ``configs/defaults.yaml`` as baseline config, or ``{}``."""
         defaults_path = self._config_dir / "defaults.yaml"
-        if not defaults_path.is_file():
+        catalog = get_config_catalog()
+        if not catalog.is_file(defaults_path):
             return {}
-        with open(defaults_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        data = catalog.load_yaml(defaults_path) or {}
         if not isinstance(data, dict):
             self._logger.warning("defaults_yaml_not_a_mapping", path=str(defaults_path))
             return {}
@@ -234,8 +229,7 @@ class ProfileLoader:
                 defaults=self._load_defaults(),
             )
         else:
-            with open(profile_path, encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+            config = get_config_catalog().load_yaml(profile_path)
 
         if not isinstance(config, dict):
             raise ValueError(f"Profile '{profile}' did not parse to a mapping: {profile_path}")
@@ -389,20 +383,15 @@ class ProfileLoader:
         """
         seen: set[str] = set()
         results: list[dict[str, Any]] = []
+        catalog = get_config_catalog()
 
         for search_dir in self._all_search_dirs():
-            if not search_dir.is_dir():
-                continue
             for candidate_dir, is_custom in [
                 (search_dir, False),
                 (search_dir / "custom", True),
                 (search_dir / "roles", False),
             ]:
-                if not candidate_dir.is_dir():
-                    continue
-                for entry in sorted(candidate_dir.iterdir()):
-                    if not entry.is_file():
-                        continue
+                for entry in catalog.files(candidate_dir):
                     if not (entry.name.endswith(".agent.md") or entry.suffix == ".yaml"):
                         continue
                     name = self._profile_name_from_path(entry)
@@ -430,7 +419,7 @@ class ProfileLoader:
             "name_label": None,
         }
         try:
-            text = path.read_text(encoding="utf-8")
+            text = get_config_catalog().read_text(path)
         except OSError:
             return result
 
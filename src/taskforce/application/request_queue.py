@@ -28,6 +28,7 @@ Usage::
 from __future__ import annotations
 
 import asyncio
+import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -35,6 +36,7 @@ import structlog
 
 from taskforce.core.domain.enums import MessageRole
 from taskforce.core.domain.request import AgentRequest
+from taskforce.core.utils.metrics import get_metrics_registry
 
 if TYPE_CHECKING:
     from taskforce.application.conversation_manager import ConversationManager
@@ -42,6 +44,14 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+_QUEUE_DEPTH = get_metrics_registry().gauge(
+    "taskforce_request_queue_depth", "Requests waiting in the RequestQueue."
+)
+_QUEUE_WAIT = get_metrics_registry().histogram(
+    "taskforce_request_queue_wait_seconds",
+    "Time a request spent queued before the processor picked it up.",
+)
+
 
 @dataclass
 class RequestResult:
@@ -69,7 +79,7 @@ class _PrioritizedItem:
     are broken by insertion order (FIFO within same priority level).
     """
 
-    __slots__ = ("priority", "seq", "request")
+    __slots__ = ("priority", "seq", "request", "enqueued_at")
 
     _counter: int = 0
 
@@ -78,6 +88,7 @@ class _PrioritizedItem:
         _PrioritizedItem._counter += 1
         self.seq = _PrioritizedItem._counter
         self.request = request
+        self.enqueued_at = time.monotonic()
 
     def __lt__(self, other: _PrioritizedItem) -> bool:  # type: ignore[override]
         if self.priority != other.priority:
@@ -156,6 +167,7 @@ class RequestQueue:
         self._futures[request.request_id] = future
         self._known_requests[request.request_id] = request
         await self._queue.put(_PrioritizedItem(request))
+        _QUEUE_DEPTH.set(self._queue.qsize())
         logger.debug(
             "request_queue.enqueued",
             request_id=request.request_id,
@@ -168,6 +180,8 @@ class RequestQueue:
     async def dequeue(self) -> AgentRequest:
         """Get the highest-priority request from the queue (blocks until available)."""
         item = await self._queue.get()
+        _QUEUE_DEPTH.set(self._queue.qsize())
+        _QUEUE_WAIT.observe(time.monotonic() - item.enqueued_at)
         return item.request
 
     def is_cancelled(self, request_id: str) -> bool:
@@ -298,6 +312,8 @@ class RequestQueue:
         try:
             while True:
                 item = await self._queue.get()
+                _QUEUE_DEPTH.set(self._queue.qsize())
+                _QUEUE_WAIT.observe(time.monotonic() - item.enqueued_at)
                 request = item.request
                 try:
                     logger.info(
@@ -19,8 +19,19 @@ from typing import Any
 
 import structlog
 
+from taskforce.core.utils.metrics import get_metrics_registry
+
 logger = structlog.get_logger(__name__)
 
+_ACTIVE_RUNS = get_metrics_registry().gauge(
+    "taskforce_active_runs", "Executions currently registered in the RunRegistry."
+)
+_RUN_DURATION = get_metrics_registry().histogram(
+    "taskforce_run_duration_seconds",
+    "Wall-clock duration of finished executions.",
+    buckets=(1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0),
+)
+
 
 @dataclass
 class ActiveRun:
@@ -80,6 +91,7 @@ class RunRegistry:
         )
         with self._lock:
             self._runs[session_id] = run
+            _ACTIVE_RUNS.set(len(self._runs))
         logger.debug("run_registered", session_id=session_id, profile=profile)
         self._notify()
         return run
@@ -118,7 +130,10 @@ class RunRegistry:
 
     def unregister(self, session_id: str) -> None:
         with self._lock:
-            self._runs.pop(session_id, None)
+            run = self._runs.pop(session_id, None)
+            _ACTIVE_RUNS.set(len(self._runs))
+        if run is not None:
+            _RUN_DURATION.observe((datetime.now(UTC) - run.started_at).total_seconds())
         logger.debug("run_unregistered", session_id=session_id)
         self._notify()
 
@@ -18,6 +18,7 @@ Note:
     global skill discovery and browsing is needed.
 """
 
+import os
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
@@ -30,6 +31,11 @@ from taskforce.infrastructure.skills.skill_registry import (
     FileSkillRegistry,
     create_skill_registry,
 )
+from taskforce.infrastructure.skills.skill_watcher import (
+    PollingSkillWatcher,
+    SkillChangeWatcher,
+    create_skill_watcher,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -46,14 +52,13 @@ _extra_skill_dirs: list[Path] = []
 _skill_dir_provider: Callable[[], list[Path]] | None = None
 _writable_skill_root_provider: Callable[[], Path] | None = None
 
-# Cache of the highest mtime_ns we have ever seen across all known skill
-# directories. ``refresh_dynamic_skill_dirs`` consults this on every call
-# and triggers a registry reload when something on disk has changed since
-# the previous check — the framework's "lightweight watcher" answer to
-# ADR-022 §6 (skills hot-reload). Polling at call time keeps the
-# framework dependency-free; an explicit ``refresh()`` always still
-# works.
-_last_seen_mtime_ns: int = 0
+# Change watcher behind the framework's skills hot-reload (ADR-022 §6).
+# ``refresh_dynamic_skill_dirs`` compares the watcher's generation with
+# the last one it applied -- an O(1) check with no directory walk -- and
+# re-reads only the skills whose files changed. Created lazily on the
+# first call and bound to the singleton ``SkillService``.
+_skill_watcher: SkillChangeWatcher | None = None
+_seen_skill_generation: int = 0
 
 
 def register_skill_dir(path: str | Path) -> None:
@@ -118,44 +123,36 @@ def get_extra_skill_dirs() -> list[Path]:
     return list(dict.fromkeys([*_extra_skill_dirs, *dynamic_dirs]))
 
 
-def _max_skill_mtime_ns() -> int:
-    """Return the highest mtime_ns of any ``*.md`` under any registered dir.
+def _watch_skill_dirs(service: "SkillService") -> tuple[SkillChangeWatcher, bool]:
+    """Make sure the watcher covers every registry directory.
 
-    Walks every dir from :func:`get_extra_skill_dirs` and the registry's
-    own dirs, looking for changes that an external process (editor, file
-    mount, ``git pull``) made to skill content. Symlinks are followed.
-    Errors are swallowed — an inaccessible directory cannot trigger a
-    refresh, but it also must not block one for the rest.
+    Returns the watcher and whether at least one directory was newly
+    watched, i.e. its content may have changed unseen. Falls back to
+    the polling watcher when the inotify backend cannot add a watch (for
+    example when ``fs.inotify.max_user_watches`` is exhausted or the
+    directory is on a network mount). ``TASKFORCE_SKILL_WATCHER=polling``
+    forces the polling watcher.
     """
-    highest = 0
-    dirs: list[Path] = list(get_extra_skill_dirs())
-    if _skill_service is not None:
-        try:
-            dirs.extend(Path(d) for d in _skill_service.registry.directories)
-        except Exception:
-            pass
-    seen: set[Path] = set()
-    for directory in dirs:
-        try:
-            resolved = directory.resolve()
-        except OSError:
-            continue
-        if resolved in seen:
-            continue
-        seen.add(resolved)
-        if not resolved.is_dir():
-            continue
+    global _skill_watcher
+
+    if _skill_watcher is None:
+        _skill_watcher = create_skill_watcher(
+            force_polling=os.getenv("TASKFORCE_SKILL_WATCHER", "").lower() == "polling"
+        )
+    try:
+        directories = list(service.registry.directories)
+    except Exception:
+        directories = []
+    added = False
+    for directory in directories:
         try:
-            for path in resolved.rglob("*.md"):
-                try:
-                    mtime_ns = path.stat().st_mtime_ns
-                except OSError:
-                    continue
-                if mtime_ns > highest:
-                    highest = mtime_ns
-        except OSError:
-            continue
-    return highest
+            added = _skill_watcher.watch(directory) or added
+        except OSError as exc:
+            logger.warning("skill.watcher_fallback", path=str(directory), error=str(exc))
+            _skill_watcher.close()
+            _skill_watcher = PollingSkillWatcher()
+            return _watch_skill_dirs(service)[0], True
+    return _skill_watcher, added
 
 
 def refresh_dynamic_skill_dirs() -> None:
@@ -164,25 +161,46 @@ def refresh_dynamic_skill_dirs() -> None:
     This is the framework's "lightweight watcher" for ADR-022 §6: every
     time the API/CLI asks for the current skill list, we (a) make sure
     every dir reported by the active dynamic provider is registered and
-    (b) re-read the registry when any ``*.md`` mtime under those dirs
-    is newer than the last reload. An explicit ``service.refresh()``
-    call still works for callers that want forced consistency.
+    (b) apply the skill file changes the watcher observed since the last
+    call. The steady state (nothing changed) costs one generation
+    comparison and no directory walk; changed skills are re-parsed
+    individually. Newly registered or newly watched directories trigger
+    a full refresh. An explicit ``service.refresh()`` call still works
+    for callers that want forced consistency.
     """
-    global _last_seen_mtime_ns
+    global _seen_skill_generation
 
     if _skill_service is None:
         return
+    registry = _skill_service.registry
+    try:
+        known = set(registry.directories)
+    except Exception:
+        known = set()
     changed = False
     for directory in get_extra_skill_dirs():
-        changed = _skill_service.registry.add_directory(directory) or changed
-
-    current_mtime_ns = _max_skill_mtime_ns()
-    if current_mtime_ns and current_mtime_ns != _last_seen_mtime_ns:
-        _last_seen_mtime_ns = current_mtime_ns
-        changed = True
+        if directory not in known:
+            changed = registry.add_directory(directory) or changed
+    watcher, newly_watched = _watch_skill_dirs(_skill_service)
+    changed = newly_watched or changed
 
+    generation = watcher.generation
     if changed:
+        watcher.drain()
+        _seen_skill_generation = generation
         _skill_service.refresh()
+    elif generation != _seen_skill_generation:
+        _seen_skill_generation = generation
+        _skill_service.apply_changes(watcher.drain())
+
+
+def _close_skill_watcher() -> None:
+    """Stop the change watcher and forget the applied generation."""
+    global _skill_watcher, _seen_skill_generation
+    if _skill_watcher is not None:
+        _skill_watcher.close()
+        _skill_watcher = None
+    _seen_skill_generation = 0
 
 
 def get_writable_skill_root(default_work_dir: str | Path = ".taskforce") -> Path:
@@ -194,11 +212,11 @@ def get_writable_skill_root(default_work_dir: str | Path = ".taskforce") -> Path
 
 def clear_extra_skill_dirs() -> None:
     """Remove all registered extra skill directories (testing helper)."""
-    global _skill_dir_provider, _writable_skill_root_provider, _last_seen_mtime_ns
+    global _skill_dir_provider, _writable_skill_root_provider
     _extra_skill_dirs.clear()
     _skill_dir_provider = None
     _writable_skill_root_provider = None
-    _last_seen_mtime_ns = 0
+    _close_skill_watcher()
 
 
 class SkillService:
@@ -258,6 +276,29 @@ class SkillService:
         self._registry.refresh()
         logger.info("skill.registry_refreshed", skill_count=self._registry.get_skill_count())
 
+    def apply_changes(self, paths: set[Path] | None) -> None:
+        """
+        Re-read only the skills affected by changed file paths.
+
+        Args:
+            paths: Changed paths reported by the skill watcher, or None when
+                   changes were lost and everything must be re-read. Registries
+                   other than :class:`FileSkillRegistry` are always fully
+                   refreshed.
+        """
+        if paths is not None and not paths:
+            return
+        if paths is None or not isinstance(self._registry, FileSkillRegistry):
+            self.refresh()
+            return
+        names = self._registry.apply_changes(paths)
+        logger.info(
+            "skill.registry_updated",
+            changed_paths=len(paths),
+            skills=sorted(names),
+            skill_count=self._registry.get_skill_count(),
+        )
+
     def list_skills(self) -> list[str]:
         """
         List all available skill names.
@@ -544,3 +585,4 @@ def reset_skill_service() -> None:
     """Reset the singleton skill service (useful for testing)."""
     global _skill_service
     _skill_service = None
+    _close_skill_watcher()
@@ -6,9 +6,7 @@ import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import aiofiles
 import structlog
-import yaml
 
 from taskforce.core.domain.enums import ExecutionStatus
 from taskforce.core.domain.sub_agents import (
@@ -18,6 +16,7 @@ from taskforce.core.domain.sub_agents import (
 )
 from taskforce.core.interfaces.sub_agents import SubAgentSpawnerProtocol
 from taskforce.core.interfaces.tools import ToolProtocol
+from taskforce.core.utils.config_catalog import get_config_catalog
 from taskforce.infrastructure.tools.orchestration._event_forwarding import (
     run_sub_agent_with_forwarding,
 )
@@ -353,18 +352,17 @@ class SubAgentSpawner(SubAgentSpawnerProtocol):
         config_path = self._find_agent_config(spec.specialist)
         if not config_path:
             return None
-        async with aiofiles.open(config_path, encoding="utf-8") as handle:
-            content = await handle.read()
-            return yaml.safe_load(content) or None
+        return await get_config_catalog().load_yaml_async(config_path) or None
 
     def _find_agent_config(self, specialist: str) -> Path | None:
         config_dir = Path(self._agent_factory.config_dir)
-        for path in self._candidate_paths(config_dir, specialist):
-            if path.exists():
-                return path
-        return None
+        return get_config_catalog().first_file(self._candidate_paths(config_dir, specialist))
 
     def _candidate_paths(self, config_dir: Path, specialist: str) -> list[Path]:
+        # Existence checks and directory walks go through the shared config
+        # catalog: one stat per directory instead of one per candidate, and
+        # no re-listing of agents/ or plugins/ while they are unchanged.
+        catalog = get_config_catalog()
         candidates = [
             config_dir / "custom" / f"{specialist}.yaml",
             config_dir / "custom" / specialist / f"{specialist}.yaml",
@@ -375,39 +373,33 @@ class SubAgentSpawner(SubAgentSpawnerProtocol):
         # Search agent package config directories (agents/*/configs[/custom]/)
         from taskforce.core.utils.paths import get_base_path
 
-        agents_dir = get_base_path() / "agents"
-        if agents_dir.is_dir():
-            for agent_dir in agents_dir.iterdir():
-                agent_configs = agent_dir / "configs"
-                if not agent_configs.is_dir():
-                    continue
-                # Top-level package profile (e.g. agents/coding-agent/configs/coding_agent.yaml)
-                candidates.append(agent_configs / f"{specialist}.yaml")
-                candidates.append(agent_configs / f"{specialist}.agent.md")
-                # Nested custom/ directory
-                agent_custom = agent_configs / "custom"
-                if agent_custom.is_dir():
-                    candidates.append(agent_custom / f"{specialist}.yaml")
-                    candidates.append(
-                        agent_custom / specialist / f"{specialist}.yaml"
-                    )
+        for agent_dir in catalog.subdirs(get_base_path() / "agents"):
+            agent_configs = agent_dir / "configs"
+            if not catalog.is_dir(agent_configs):
+                continue
+            # Top-level package profile (e.g. agents/coding-agent/configs/coding_agent.yaml)
+            candidates.append(agent_configs / f"{specialist}.yaml")
+            candidates.append(agent_configs / f"{specialist}.agent.md")
+            # Nested custom/ directory
+            agent_custom = agent_configs / "custom"
+            if catalog.is_dir(agent_custom):
+                candidates.append(agent_custom / f"{specialist}.yaml")
+                candidates.append(agent_custom / specialist / f"{specialist}.yaml")
         candidates.extend(self._plugin_candidates(config_dir, specialist))
         return candidates
 
     def _plugin_candidates(self, config_dir: Path, specialist: str) -> list[Path]:
-        plugin_dirs = self._plugin_directories(config_dir)
         return [
             plugin / "configs" / "agents" / f"{specialist}.yaml"
-            for plugin in plugin_dirs
-            if plugin.is_dir()
+            for plugin in self._plugin_directories(config_dir)
         ]
 
     def _plugin_directories(self, config_dir: Path) -> list[Path]:
+        catalog = get_config_catalog()
         plugin_roots = [config_dir.parent / "plugins", config_dir / "plugins"]
         for parent in config_dir.parents:
             plugin_roots.append(parent / "plugins")
-        roots = [root for root in plugin_roots if root.exists()]
         directories: list[Path] = []
-        for root in roots:
-            directories.extend([path for path in root.iterdir() if path.is_dir()])
+        for root in plugin_roots:
+            directories.extend(catalog.subdirs(root))
         return directories
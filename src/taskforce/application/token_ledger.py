@@ -16,6 +16,9 @@ Design choices:
   used by the routes.
 * The ledger never raises into the LLM call path — record swallows
   ``sqlite3.Error`` to keep the executor robust.
+* ``cached_prompt_tokens`` (the part of ``prompt_tokens`` read from the
+  provider's prompt cache) is stored per call and priced separately;
+  databases created before the column existed are migrated in place.
 """
 
 from __future__ import annotations
@@ -48,6 +51,7 @@ class LedgerEntry:
     prompt_tokens: int
     completion_tokens: int
     cost_usd: float
+    cached_prompt_tokens: int = 0
 
 
 @dataclass(frozen=True)
@@ -58,6 +62,7 @@ class UsageBucket:
     total_tokens: int
     cost_usd: float
     call_count: int
+    cached_prompt_tokens: int = 0
 
 
 @dataclass(frozen=True)
@@ -149,10 +154,17 @@ class TokenLedger:
                     model TEXT NOT NULL,
                     prompt_tokens INTEGER NOT NULL,
                     completion_tokens INTEGER NOT NULL,
-                    cost_usd REAL NOT NULL
+                    cost_usd REAL NOT NULL,
+                    cached_prompt_tokens INTEGER NOT NULL DEFAULT 0
                 )
                 """
             )
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(llm_calls)")}
+            if "cached_prompt_tokens" not in columns:
+                conn.execute(
+                    "ALTER TABLE llm_calls "
+                    "ADD COLUMN cached_prompt_tokens INTEGER NOT NULL DEFAULT 0"
+                )
             conn.execute("CREATE INDEX IF NOT EXISTS llm_calls_ts ON llm_calls(ts)")
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS llm_calls_conversation ON llm_calls(conversation_id)"
@@ -172,6 +184,7 @@ class TokenLedger:
         model: str,
         prompt_tokens: int,
         completion_tokens: int,
+        cached_prompt_tokens: int = 0,
         session_id: str | None = None,
         conversation_id: str | None = None,
         agent_id: str | None = None,
@@ -182,7 +195,9 @@ class TokenLedger:
         conversation_id = conversation_id or ctx.get("conversation_id")
         agent_id = agent_id or ctx.get("agent_id")
         profile = profile or ctx.get("profile")
-        cost = self._pricing.cost(model, prompt_tokens, completion_tokens).cost_usd
+        cost = self._pricing.cost(
+            model, prompt_tokens, completion_tokens, cached_prompt_tokens
+        ).cost_usd
         entry = LedgerEntry(
             timestamp=timestamp,
             session_id=session_id or "",
@@ -193,13 +208,14 @@ class TokenLedger:
             prompt_tokens=int(prompt_tokens or 0),
             completion_tokens=int(completion_tokens or 0),
             cost_usd=cost,
+            cached_prompt_tokens=int(cached_prompt_tokens or 0),
         )
         try:
             with self._lock, self._connect() as conn:
                 conn.execute(
                     "INSERT INTO llm_calls (ts, session_id, conversation_id, agent_id, "
-                    "profile, model, prompt_tokens, completion_tokens, cost_usd) "
-                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    "profile, model, prompt_tokens, completion_tokens, cost_usd, "
+                    "cached_prompt_tokens) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
                     (
                         entry.timestamp.isoformat(),
                         entry.session_id,
@@ -210,6 +226,7 @@ class TokenLedger:
                         entry.prompt_tokens,
                         entry.completion_tokens,
                         entry.cost_usd,
+                        entry.cached_prompt_tokens,
                     ),
                 )
         except sqlite3.Error:
@@ -247,7 +264,7 @@ class TokenLedger:
             f"SELECT {bucket_expr} AS bucket, "
             "SUM(prompt_tokens) AS prompt, SUM(completion_tokens) AS completion, "
             "SUM(prompt_tokens + completion_tokens) AS total, SUM(cost_usd) AS cost, "
-            "COUNT(*) AS calls "
+            "COUNT(*) AS calls, SUM(cached_prompt_tokens) AS cached "
             f"FROM llm_calls{where_sql} GROUP BY bucket ORDER BY bucket"
         )
         with self._connect() as conn:
@@ -260,6 +277,7 @@ class TokenLedger:
                 total_tokens=int(row["total"] or 0),
                 cost_usd=float(row["cost"] or 0.0),
                 call_count=int(row["calls"] or 0),
+                cached_prompt_tokens=int(row["cached"] or 0),
             )
             for row in rows
         ]
@@ -362,6 +380,7 @@ class TokenLedger:
             row = conn.execute(
                 "SELECT COALESCE(SUM(prompt_tokens), 0) AS p, "
                 "COALESCE(SUM(completion_tokens), 0) AS c, "
+                "COALESCE(SUM(cached_prompt_tokens), 0) AS cached, "
                 "COALESCE(SUM(cost_usd), 0.0) AS cost "
                 "FROM llm_calls WHERE session_id = ?",
                 (session_id,),
@@ -370,13 +389,15 @@ class TokenLedger:
             "session_id": session_id,
             "prompt_tokens": int(row["p"] or 0) if row else 0,
             "completion_tokens": int(row["c"] or 0) if row else 0,
+            "cached_prompt_tokens": int(row["cached"] or 0) if row else 0,
             "cost_usd": float(row["cost"] or 0.0) if row else 0.0,
         }
 
     def per_conversation(self, conversation_id: str) -> dict[str, object]:
         with self._connect() as conn:
             rows = conn.execute(
-                "SELECT model, prompt_tokens, completion_tokens, cost_usd, ts "
+                "SELECT model, prompt_tokens, completion_tokens, cached_prompt_tokens, "
+                "cost_usd, ts "
                 "FROM llm_calls WHERE conversation_id = ? ORDER BY ts",
                 (conversation_id,),
             ).fetchall()
@@ -396,6 +417,7 @@ class TokenLedger:
                 "model": row["model"],
                 "prompt_tokens": int(row["prompt_tokens"] or 0),
                 "completion_tokens": int(row["completion_tokens"] or 0),
+                "cached_prompt_tokens": int(row["cached_prompt_tokens"] or 0),
                 "cost_usd": float(row["cost_usd"] or 0.0),
                 "ts": row["ts"],
             }
@@ -1,8 +1,12 @@
-"""LLM-based topic change detection for conversation segmentation.
+"""Topic change detection for conversation segmentation.
 
 Analyses incoming messages to determine whether the user has changed topic.
-Uses a fast/cheap model via the LLM Router (hint: ``summarizing``) to
-minimise latency (~200ms).
+A lexical first pass scores the message against a TF-IDF keyword profile
+of the current topic (label + recent messages). Clear continuations and
+clear departures are decided locally; only scores inside the configurable
+uncertainty band (and explicit "let's talk about ..." switches) reach the
+LLM, which uses a fast/cheap model via the LLM Router (hint:
+``summarizing``, ~200ms).
 
 Usage::
 
@@ -20,8 +24,11 @@ Usage::
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
-from typing import Any
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, replace
+from typing import Any, Literal
 
 import structlog
 
@@ -64,14 +71,112 @@ class TopicChange:
     confidence: float
 
 
+@dataclass(frozen=True)
+class TopicDecision:
+    """How one :meth:`TopicDetector.decide` call reached its verdict.
+
+    Exposed for tuning the lexical band (returned by ``decide`` and
+    logged as ``topic_detector.decided``).
+
+    Attributes:
+        stage: ``"lexical"`` when the first pass decided, ``"llm"`` when
+            the LLM was consulted, ``"initial"`` for the first topic.
+        changed: Whether a topic change was reported.
+        score: Lexical similarity (0.0–1.0) of the message to the topic
+            profile; ``None`` for the initial topic.
+        reason: Short machine-readable reason (``"similar"``,
+            ``"dissimilar"``, ``"no_content_terms"``, ``"uncertain"``,
+            ``"explicit_switch"``, ``"thin_profile"``, ...).
+    """
+
+    stage: Literal["lexical", "llm", "initial"]
+    changed: bool
+    score: float | None
+    reason: str
+
+
+# Function words that carry no topic signal (EN + DE, the languages the
+# gateway channels see most).
+_STOPWORDS = frozenset(
+    """
+    about above after again also and any are because been before being but can
+    could did does doing done down during each few for from further had has have
+    having her here hers him his how into its just let lets like more most much
+    need now off once only other our out over own please same she should some
+    such than thank thanks that the their them then there these they this those
+    through too under until very was way were what when where which while who
+    whom why will with would yes you your yours okay sure right well really
+    also aber alle als also am andere auch auf aus bei bin bis bist da damit dann
+    das dass dein dem den der des die dies diese dir doch dort du durch ein eine
+    einem einen einer eines er es etwas euch für gibt hab habe hat hatte hier
+    ich ihm ihn ihr im in ist ja jetzt kann kannst kein keine mal man mehr mein
+    mich mir mit muss nach nein nicht noch nun nur ob oder ohne schon sehr sein
+    sich sie sind so soll über um und uns unser vom von vor war was weil wenn
+    wer wie wieder wir wird wo zu zum zur danke bitte gut okay
+    """.split()
+)
+_TOKEN_RE = re.compile(r"[a-zà-öø-ÿß0-9]+")
+# Explicit switch phrases always go to the LLM: it produces a far better
+# label for the new topic than the first pass could.
+_EXPLICIT_SWITCH_RE = re.compile(
+    r"\b(let'?s (talk|move|switch|change|turn)|new topic|different topic|"
+    r"change (the )?(topic|subject)|anderes thema|neues thema|themenwechsel|"
+    r"lass uns (über|ueber|zu))",
+    re.I,
+)
+
+
+def content_terms(text: str) -> list[str]:
+    """Lower-case content terms with a crude plural fold."""
+    terms = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        if len(token) < 3 or token in _STOPWORDS or token.isdigit():
+            continue
+        if len(token) > 4 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        terms.append(token)
+    return terms
+
+
 class TopicDetector:
-    """Detects topic changes in conversation messages using an LLM.
+    """Detects topic changes in conversation messages.
+
+    The lexical first pass scores the message against a keyword profile
+    of the active topic: the label and the recent messages, weighted by
+    TF-IDF with document frequencies learned from the messages the
+    detector has seen. One detector serves every conversation, so the
+    frequencies decay: every ``idf_window`` messages all counts are
+    halved and terms that drop to zero are forgotten, and at most
+    ``max_vocabulary`` terms are kept. Then:
+
+    * ``score >= same_topic_above`` (or no content terms, e.g. "ok",
+      "thanks") — same topic, no LLM call.
+    * ``score <= changed_below`` with a well-populated profile and a
+      message of at least ``min_message_terms`` content terms — topic
+      change, labelled from the message's strongest terms, no LLM call.
+    * anything in between — the LLM decides, as before.
+
+    Set ``lexical_first_pass=False`` to send every message to the LLM.
 
     Args:
         llm_provider: LLM provider implementing ``LLMProviderProtocol``.
         confidence_threshold: Minimum confidence to report a change (default 0.7).
         model_hint: Model hint for the LLM Router (default ``"summarizing"``
             for fast/cheap inference).
+        lexical_first_pass: Enable the local scoring stage.
+        same_topic_above: Similarity at or above which the message
+            continues the topic.
+        changed_below: Similarity at or below which the message starts a
+            new topic.
+        min_message_terms: Content terms a message needs before a low
+            score may count as a change (short follow-ups stay uncertain).
+        min_profile_terms: Distinct profile terms needed before a low
+            score may count as a change.
+        idf_window: Messages after which document frequencies decay.
+        max_vocabulary: Most terms the document frequencies keep.
+
+    ``stats`` counts decisions by stage and outcome across all
+    conversations.
     """
 
     def __init__(
@@ -80,10 +185,27 @@ class TopicDetector:
         *,
         confidence_threshold: float = 0.7,
         model_hint: str = "summarizing",
+        lexical_first_pass: bool = True,
+        same_topic_above: float = 0.3,
+        changed_below: float = 0.02,
+        min_message_terms: int = 3,
+        min_profile_terms: int = 8,
+        idf_window: int = 1000,
+        max_vocabulary: int = 20_000,
     ) -> None:
         self._llm = llm_provider
         self._threshold = confidence_threshold
         self._model_hint = model_hint
+        self._lexical = lexical_first_pass
+        self._same_above = same_topic_above
+        self._changed_below = changed_below
+        self._min_message_terms = min_message_terms
+        self._min_profile_terms = min_profile_terms
+        self._idf_window = max(2, idf_window)
+        self._max_vocabulary = max_vocabulary
+        self._doc_freq: Counter[str] = Counter()
+        self._docs = 0
+        self.stats: Counter[str] = Counter()
 
     async def detect(
         self,
@@ -103,11 +225,161 @@ class TopicDetector:
             ``TopicChange`` if a change was detected above the confidence
             threshold, ``None`` otherwise.
         """
+        change, _ = await self.decide(message, current_label, recent_messages)
+        return change
+
+    async def decide(
+        self,
+        message: str,
+        current_label: str | None,
+        recent_messages: list[dict[str, Any]] | None = None,
+    ) -> tuple[TopicChange | None, TopicDecision]:
+        """Like :meth:`detect`, also returning how the verdict was reached."""
         # If there is no current topic, always start one.
         if current_label is None:
+            self._observe(content_terms(message))
+            decision = self._record(TopicDecision("initial", True, None, "no_active_topic"))
             label = await self._generate_label(message, recent_messages)
-            return TopicChange(label=label, confidence=1.0)
+            return TopicChange(label=label, confidence=1.0), decision
+
+        if self._lexical:
+            decision, change = self._first_pass(message, current_label, recent_messages)
+            if decision.stage == "lexical":
+                return change, self._record(decision)
+        else:
+            decision = TopicDecision("llm", False, None, "lexical_disabled")
+
+        change = await self._detect_with_llm(message, current_label, recent_messages)
+        return change, self._record(replace(decision, changed=change is not None))
 
+    def score(
+        self,
+        message: str,
+        current_label: str,
+        recent_messages: list[dict[str, Any]] | None = None,
+    ) -> float:
+        """Return the lexical similarity (0.0–1.0) of *message* to the topic.
+
+        Pure: does not update the learned document frequencies. Useful
+        for tuning ``same_topic_above`` / ``changed_below`` offline.
+        """
+        message_terms = Counter(content_terms(message))
+        profile_terms = Counter(self._profile_terms(current_label, recent_messages))
+        return self._cosine(message_terms, profile_terms)
+
+    # ------------------------------------------------------------------
+    # Lexical first pass
+    # ------------------------------------------------------------------
+
+    def _first_pass(
+        self,
+        message: str,
+        current_label: str,
+        recent_messages: list[dict[str, Any]] | None,
+    ) -> tuple[TopicDecision, TopicChange | None]:
+        """Score *message* locally.
+
+        Returns a ``"lexical"`` decision (and the change, if any) when the
+        first pass is sure, or an ``"llm"`` decision carrying the score and
+        the reason for deferring otherwise.
+        """
+        terms = content_terms(message)
+        profile = self._profile_terms(current_label, recent_messages)
+        self._observe(terms)
+        score = self._cosine(Counter(terms), Counter(profile))
+
+        def defer(reason: str) -> tuple[TopicDecision, None]:
+            return TopicDecision("llm", False, score, reason), None
+
+        if _EXPLICIT_SWITCH_RE.search(message):
+            return defer("explicit_switch")
+        if not terms:
+            return TopicDecision("lexical", False, score, "no_content_terms"), None
+        if score >= self._same_above:
+            return TopicDecision("lexical", False, score, "similar"), None
+        if score > self._changed_below:
+            return defer("uncertain")
+        if len(terms) < self._min_message_terms:
+            return defer("short_message")
+        if len(set(profile)) < self._min_profile_terms:
+            return defer("thin_profile")
+        confidence = round(1.0 - score, 3)
+        if confidence < self._threshold:
+            return defer("below_confidence")
+        change = TopicChange(label=self._keyword_label(terms), confidence=confidence)
+        return TopicDecision("lexical", True, score, "dissimilar"), change
+
+    @staticmethod
+    def _profile_terms(
+        current_label: str, recent_messages: list[dict[str, Any]] | None
+    ) -> list[str]:
+        """Keyword profile of the active topic: label (weighted 2x) + recent turns."""
+        label_terms = content_terms(current_label)
+        terms = label_terms + label_terms
+        for msg in (recent_messages or [])[-5:]:
+            content = msg.get("content")
+            if isinstance(content, str):
+                terms.extend(content_terms(content))
+        return terms
+
+    def _observe(self, terms: list[str]) -> None:
+        """Count *terms* as one document for the IDF weights."""
+        self._docs += 1
+        self._doc_freq.update(set(terms))
+        if self._docs >= self._idf_window:
+            self._decay()
+
+    def _decay(self) -> None:
+        """Halve all document frequencies and drop the rarest terms."""
+        self._docs //= 2
+        self._doc_freq = Counter(
+            {t: n // 2 for t, n in self._doc_freq.most_common(self._max_vocabulary) if n > 1}
+        )
+
+    def _idf(self, term: str) -> float:
+        return math.log((1 + self._docs) / (1 + self._doc_freq[term])) + 1.0
+
+    def _cosine(self, a: Counter[str], b: Counter[str]) -> float:
+        if not a or not b:
+            return 0.0
+        wa = {t: n * self._idf(t) for t, n in a.items()}
+        wb = {t: n * self._idf(t) for t, n in b.items()}
+        dot = sum(w * wb[t] for t, w in wa.items() if t in wb)
+        if dot == 0.0:
+            return 0.0
+        norm = math.sqrt(sum(w * w for w in wa.values())) * math.sqrt(
+            sum(w * w for w in wb.values())
+        )
+        return dot / norm
+
+    def _keyword_label(self, terms: list[str]) -> str:
+        """Label a lexically detected topic from its highest-weighted terms."""
+        weights = Counter({t: n * self._idf(t) for t, n in Counter(terms).items()})
+        ordered = sorted(dict.fromkeys(terms), key=lambda t: -weights[t])[:4]
+        return " ".join(ordered).capitalize()
+
+    def _record(self, decision: TopicDecision) -> TopicDecision:
+        self.stats[f"{decision.stage}_{'changed' if decision.changed else 'same'}"] += 1
+        logger.debug(
+            "topic_detector.decided",
+            stage=decision.stage,
+            changed=decision.changed,
+            score=None if decision.score is None else round(decision.score, 4),
+            reason=decision.reason,
+        )
+        return decision
+
+    # ------------------------------------------------------------------
+    # LLM stage
+    # ------------------------------------------------------------------
+
+    async def _detect_with_llm(
+        self,
+        message: str,
+        current_label: str,
+        recent_messages: list[dict[str, Any]] | None,
+    ) -> TopicChange | None:
+        """Ask the LLM whether *message* changes the topic."""
         recent_context = self._format_recent(recent_messages)
 
         prompt = _DETECTION_PROMPT.format(
@@ -16,6 +16,9 @@ from taskforce.infrastructure.tracing import (
 from taskforce.infrastructure.tracing import (
     init_tracing as _init_tracing,
 )
+from taskforce.infrastructure.tracing import (
+    shutdown_trace_file_writers as _shutdown_trace_file_writers,
+)
 from taskforce.infrastructure.tracing import (
     shutdown_tracing as _shutdown_tracing,
 )
@@ -27,8 +30,9 @@ def init_tracing() -> None:
 
 
 def shutdown_tracing() -> None:
-    """Shutdown application tracing and flush pending spans."""
+    """Shutdown application tracing, flush pending spans and trace files."""
     _shutdown_tracing()
+    _shutdown_trace_file_writers()
 
 
 def get_tracer():
@@ -14,8 +14,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
-from taskforce.core.domain.wiki_service import extract_wiki_links
-from taskforce.core.interfaces.wiki_store import WikiStoreProtocol
+from taskforce.core.domain.wiki_link_graph import WikiLinkGraph
+from taskforce.core.interfaces.wiki_store import WikiLinkGraphProvider, WikiStoreProtocol
 
 
 @dataclass(frozen=True)
@@ -38,44 +38,38 @@ class LintReport:
 
 
 async def lint_wiki(store: WikiStoreProtocol) -> LintReport:
-    """Scan the wiki and return a :class:`LintReport`."""
-    pages = await store.list_pages()
+    """Scan the wiki and return a :class:`LintReport`.
+
+    Stores that maintain a link graph (:class:`WikiLinkGraphProvider`)
+    answer from it without loading page bodies; for others the graph is
+    built from ``list_pages``.
+    """
+    if isinstance(store, WikiLinkGraphProvider):
+        graph = await store.link_graph(rescan=True)
+    else:
+        graph = WikiLinkGraph.from_pages(await store.list_pages())
     report = LintReport()
 
-    by_name = {page.name for page in pages}
-    inbound: dict[str, int] = dict.fromkeys(by_name, 0)
-
-    # Scan outbound links.
-    for page in pages:
-        for target in extract_wiki_links(page.body):
-            if target in by_name:
-                inbound[target] = inbound.get(target, 0) + 1
-            else:
-                report.issues.append(
-                    LintIssue(
-                        kind="broken_link",
-                        message=f"{page.name} links to unknown page [[{target}]]",
-                    )
-                )
+    for source, target in graph.broken_links():
+        report.issues.append(
+            LintIssue(
+                kind="broken_link",
+                message=f"{source} links to unknown page [[{target}]]",
+            )
+        )
 
     # Orphans — pages with zero inbound links.  Exclude pages in the root
     # ``entities/preferences/concepts`` hub pages if/when they exist.
-    for name, count in inbound.items():
-        if count == 0:
-            report.issues.append(LintIssue(kind="orphan", message=f"{name} has no inbound links"))
+    for name in graph.orphans():
+        report.issues.append(LintIssue(kind="orphan", message=f"{name} has no inbound links"))
 
     # Duplicate titles across different page names.
-    seen_titles: dict[str, str] = {}
-    for page in pages:
-        prior = seen_titles.get(page.title)
-        if prior and prior != page.name:
-            report.issues.append(
-                LintIssue(
-                    kind="duplicate_title",
-                    message=f"title '{page.title}' used by both {prior} and {page.name}",
-                )
+    for title, prior, name in graph.duplicate_titles():
+        report.issues.append(
+            LintIssue(
+                kind="duplicate_title",
+                message=f"title '{title}' used by both {prior} and {name}",
             )
-        else:
-            seen_titles[page.title] = page.name
+        )
 
     return report
@@ -13,13 +13,26 @@ Two classifiers, plus a chained two-stage variant:
   invokes the LLM on UNKNOWN. Net result: same accuracy on clear cases
   at zero latency, LLM cost only when the heuristic is unsure.
 
-All three implement the same ``async classify(mission) -> ComplexityVerdict``
+All of them implement the same ``async classify(mission) -> ComplexityVerdict``
 shape so AdaptivePlanningStrategy can swap them without code changes.
+Classifiers that can answer some missions without any I/O additionally
+expose ``classify_local(mission) -> ComplexityVerdict | None``; the
+strategy uses it to decide whether speculative execution is worth it.
+
+:class:`ComplexityVerdictCache` memoises verdicts per mission fingerprint
+and routing-profile hash, so a repeated mission (scheduled jobs, retries,
+chat re-sends) never pays for the LLM classification twice.
 """
 from __future__ import annotations
 
+import hashlib
 import json
 import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any, Literal
 
@@ -232,19 +245,13 @@ class HeuristicComplexityClassifier:
 
     async def classify(self, mission: str) -> ComplexityVerdict:
         """Always async to match the protocol; runs synchronously."""
-        match = self.classify_sync(mission)
-        if match.verdict == "simple":
-            return ComplexityVerdict(
-                level="simple",
-                confidence=self.SIMPLE_CONFIDENCE,
-                reason=f"heuristic: {match.reason}",
-            )
-        if match.verdict == "complex":
-            return ComplexityVerdict(
-                level="complex",
-                confidence=self.COMPLEX_CONFIDENCE,
-                reason=f"heuristic: {match.reason}",
-            )
+        return self.classify_local(mission)
+
+    def classify_local(self, mission: str) -> ComplexityVerdict:
+        """Synchronous verdict; never needs I/O, so never returns None."""
+        verdict = _verdict_from_match(self.classify_sync(mission))
+        if verdict is not None:
+            return verdict
         # UNKNOWN → confidence 0 so chained classifier knows to step in
         return ComplexityVerdict(
             level="complex",  # safe default if no LLM follows
@@ -281,6 +288,23 @@ class HeuristicComplexityClassifier:
         return HeuristicMatch("unknown", "no_rule_matched")
 
 
+def _verdict_from_match(match: HeuristicMatch) -> ComplexityVerdict | None:
+    """Convert a confident heuristic match into a verdict (None on UNKNOWN)."""
+    if match.verdict == "simple":
+        return ComplexityVerdict(
+            level="simple",
+            confidence=HeuristicComplexityClassifier.SIMPLE_CONFIDENCE,
+            reason=f"heuristic: {match.reason}",
+        )
+    if match.verdict == "complex":
+        return ComplexityVerdict(
+            level="complex",
+            confidence=HeuristicComplexityClassifier.COMPLEX_CONFIDENCE,
+            reason=f"heuristic: {match.reason}",
+        )
+    return None
+
+
 # =============================================================================
 # TwoStageComplexityClassifier — heuristic first, LLM on UNKNOWN
 # =============================================================================
@@ -315,20 +339,14 @@ class TwoStageComplexityClassifier:
         self._heuristic = heuristic
         self._llm = llm_fallback
 
+    def classify_local(self, mission: str) -> ComplexityVerdict | None:
+        """Heuristic verdict, or None when only the LLM can decide."""
+        return _verdict_from_match(self._heuristic.classify_sync(mission))
+
     async def classify(self, mission: str) -> ComplexityVerdict:
-        match = self._heuristic.classify_sync(mission)
-        if match.verdict == "simple":
-            return ComplexityVerdict(
-                level="simple",
-                confidence=HeuristicComplexityClassifier.SIMPLE_CONFIDENCE,
-                reason=f"heuristic: {match.reason}",
-            )
-        if match.verdict == "complex":
-            return ComplexityVerdict(
-                level="complex",
-                confidence=HeuristicComplexityClassifier.COMPLEX_CONFIDENCE,
-                reason=f"heuristic: {match.reason}",
-            )
+        verdict = self.classify_local(mission)
+        if verdict is not None:
+            return verdict
         # Heuristic said UNKNOWN — escalate to LLM.
         verdict = await self._llm.classify(mission)
         # Tag the reason so consumers can tell where the verdict came from.
@@ -337,3 +355,93 @@ class TwoStageComplexityClassifier:
             confidence=verdict.confidence,
             reason=f"llm_fallback: {verdict.reason}" if verdict.reason else "llm_fallback",
         )
+
+
+# =============================================================================
+# ComplexityVerdictCache — TTL cache for classifier verdicts
+# =============================================================================
+
+_TRAILING_PUNCTUATION = " \t.!?…"
+
+
+def mission_fingerprint(mission: str) -> str:
+    """Return a stable key for *mission* that ignores cosmetic differences.
+
+    Unicode-normalises (NFKC), case-folds, collapses whitespace and drops
+    trailing punctuation, so ``"Plan my trip!"`` and ``"plan  my trip"``
+    share a verdict.
+    """
+    text = unicodedata.normalize("NFKC", mission).casefold()
+    text = " ".join(text.split()).rstrip(_TRAILING_PUNCTUATION)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+class ComplexityVerdictCache:
+    """Bounded LRU of classifier verdicts with a time-to-live.
+
+    Keys are ``(profile_hash, mission_fingerprint)`` pairs so two profiles
+    with different routing settings never share a verdict. Thread-safe:
+    agents for different sessions may be built on worker threads.
+
+    Args:
+        ttl_seconds: How long a verdict stays valid.
+        max_entries: LRU capacity; the least recently used entry is
+            evicted first.
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = 3600.0,
+        max_entries: int = 2048,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, str], tuple[float, ComplexityVerdict]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str]) -> ComplexityVerdict | None:
+        """Return the cached verdict for *key*, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, verdict = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return verdict
+
+    def put(self, key: tuple[str, str], verdict: ComplexityVerdict) -> None:
+        """Store *verdict* under *key* for ``ttl_seconds``."""
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, verdict)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached verdict."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_verdict_cache: ComplexityVerdictCache | None = None
+
+
+def get_complexity_verdict_cache() -> ComplexityVerdictCache:
+    """Return the process-wide verdict cache shared by all adaptive agents."""
+    global _verdict_cache
+    if _verdict_cache is None:
+        _verdict_cache = ComplexityVerdictCache()
+    return _verdict_cache
@@ -138,6 +138,42 @@ class NotificationResult:
     tenant_id: str = "default"
 
 
+@dataclass(frozen=True)
+class BroadcastStats:
+    """Throughput summary of one broadcast fan-out.
+
+    Attributes:
+        broadcast_id: Stable id of the broadcast (outbox key).
+        total: Number of recipients addressed.
+        sent: Deliveries that succeeded.
+        failed: Deliveries that failed.
+        resumed: Recipients already handled by an earlier, interrupted
+            run of the same broadcast (not re-sent).
+        duration_ms: Wall-clock time of this run.
+        throughput_per_s: Deliveries attempted in this run per second.
+    """
+
+    broadcast_id: str
+    total: int = 0
+    sent: int = 0
+    failed: int = 0
+    resumed: int = 0
+    duration_ms: float = 0.0
+    throughput_per_s: float = 0.0
+
+
+class BroadcastResults(list[NotificationResult]):
+    """Per-recipient results of a broadcast, plus its :class:`BroadcastStats`.
+
+    A plain ``list`` subclass so existing callers that iterate or
+    ``len()`` the results keep working unchanged.
+    """
+
+    def __init__(self, results: list[NotificationResult], stats: BroadcastStats) -> None:
+        super().__init__(results)
+        self.stats = stats
+
+
 @dataclass(frozen=True)
 class ChannelLinkCode:
     """A pending one-time code for linking a channel sender to a user.
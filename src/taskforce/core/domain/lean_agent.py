@@ -41,6 +41,7 @@ from taskforce.core.domain.planning_strategy import (
     NativeReActStrategy,
     PlanningStrategy,
 )
+from taskforce.core.domain.prompt_layout import PromptLayout
 from taskforce.core.domain.token_budgeter import TokenBudgeter
 from taskforce.core.interfaces.llm import LLMProviderProtocol
 from taskforce.core.interfaces.logging import LoggerProtocol
@@ -86,6 +87,10 @@ class Agent:
     # exploration, multi-stage RAG retrieval, …).
     DEFAULT_REACT_NO_PROGRESS_THRESHOLD = 2
     DEFAULT_REACT_SIGNATURE_REPEAT_THRESHOLD = 3
+    # Keep messages[0] byte-stable across steps and send the plan status
+    # and context pack as a trailing message, so provider prompt caches
+    # can reuse the system prompt + history prefix.
+    DEFAULT_PROMPT_CACHE_LAYOUT = True
 
     def __init__(
         self,
@@ -116,6 +121,7 @@ class Agent:
         react_no_progress_threshold: int | None = None,
         react_signature_repeat_threshold: int | None = None,
         context_manager_factory: Callable[..., Any] | None = None,
+        prompt_cache_layout: bool | None = None,
     ):
         """
         Initialize Agent with injected dependencies.
@@ -149,6 +155,10 @@ class Agent:
                          agent knows what pages exist.
             wiki_context_config: Optional configuration for wiki context
                                  injection budget (char limits, top-k).
+            prompt_cache_layout: Send the plan status and context pack as a
+                          trailing per-step message instead of appending them
+                          to the system prompt, keeping the request prefix
+                          cacheable (default: True).
         """
         self.state_manager = state_manager
         self.llm_provider = llm_provider
@@ -213,6 +223,12 @@ class Agent:
             else lambda: frozenset()
         )
 
+        self.prompt_cache_layout = (
+            prompt_cache_layout
+            if prompt_cache_layout is not None
+            else self.DEFAULT_PROMPT_CACHE_LAYOUT
+        )
+
         # Context pack configuration (Story 9.2)
         self.context_policy = context_policy or ContextPolicy.conservative_default()
         self.context_builder = ContextBuilder(self.context_policy)
@@ -276,6 +292,9 @@ class Agent:
             token_budgeter=self.token_budgeter,
             logger=self.logger,
             build_system_prompt_fn=self._build_system_prompt,
+            build_prompt_layout_fn=(
+                self._build_prompt_layout if self.prompt_cache_layout else None
+            ),
         )
 
         # Tool execution helpers
@@ -423,10 +442,36 @@ class Agent:
             state=state,
             messages=messages,
         )
+        return base_prompt + self._build_stable_suffix()
+
+    def _build_prompt_layout(
+        self,
+        mission: str | None = None,
+        state: dict[str, Any] | None = None,
+        messages: list[dict[str, Any]] | None = None,
+    ) -> PromptLayout:
+        """Build the cache-friendly split of :meth:`_build_system_prompt`.
+
+        Wiki index and skill instructions join the stable prefix; the plan
+        status and context pack stay in the volatile tail.
+        """
+        layout = self.prompt_builder.build_prompt_layout(
+            mission=mission,
+            state=state,
+            messages=messages,
+        )
+        return PromptLayout(
+            stable=layout.stable + self._build_stable_suffix(),
+            volatile=layout.volatile,
+        )
+
+    def _build_stable_suffix(self) -> str:
+        """Return the wiki index and active-skill sections of the system prompt."""
+        suffix = ""
 
         # Inject cached wiki index section (long-term memory)
         if self._wiki_context:
-            base_prompt += self._wiki_context
+            suffix += self._wiki_context
 
         # Inject active skill instructions if skill manager is configured
         # Uses a cache keyed on the active skill name to avoid rebuilding
@@ -437,13 +482,13 @@ class Agent:
                 self._cached_skill_suffix is not None
                 and self._cached_skill_suffix[0] == active_name
             ):
-                base_prompt += self._cached_skill_suffix[1]
+                suffix += self._cached_skill_suffix[1]
             else:
-                suffix = self._build_skill_suffix(active_name)
-                self._cached_skill_suffix = (active_name, suffix)
-                base_prompt += suffix
+                skill_suffix = self._build_skill_suffix(active_name)
+                self._cached_skill_suffix = (active_name, skill_suffix)
+                suffix += skill_suffix
 
-        return base_prompt
+        return suffix
 
     def _build_skill_suffix(self, active_skill_name: str | None) -> str:
         """Build the skill instructions suffix for the system prompt.
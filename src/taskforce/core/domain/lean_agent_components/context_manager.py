@@ -3,6 +3,12 @@
 Coordinates MessageHistoryManager, TokenBudgeter, and tool definitions
 to provide a unified view of what is sent to the LLM.  Owns the mutable
 messages list and exposes snapshot generation for CLI commands.
+
+With a ``build_prompt_layout_fn`` the per-step plan status and context
+pack travel as a trailing *volatile tail* message (see
+:mod:`taskforce.core.domain.prompt_layout`) that is kept last in the
+list and replaced on every ``prepare_for_llm()``, so ``messages[0]`` and
+the history before the tail stay byte-identical across steps.
 """
 
 from __future__ import annotations
@@ -15,6 +21,10 @@ from typing import Any
 from taskforce.core.domain.lean_agent_components.message_history_manager import (
     MessageHistoryManager,
 )
+from taskforce.core.domain.prompt_layout import (
+    PromptLayout,
+    is_volatile_context_message,
+)
 from taskforce.core.domain.token_budgeter import TokenBudgeter
 from taskforce.core.interfaces.context_manager import (
     ContextItem,
@@ -39,6 +49,7 @@ class ContextManager:
         token_budgeter: TokenBudgeter,
         logger: LoggerProtocol,
         build_system_prompt_fn: Callable[..., str] | None = None,
+        build_prompt_layout_fn: Callable[..., PromptLayout] | None = None,
         chars_per_token: int = TokenBudgeter.CHARS_PER_TOKEN,
     ) -> None:
         self._history_manager = message_history_manager
@@ -46,6 +57,10 @@ class ContextManager:
         self._token_budgeter = token_budgeter
         self._logger = logger
         self._build_system_prompt_fn = build_system_prompt_fn
+        self._build_prompt_layout_fn = build_prompt_layout_fn
+        # The current volatile tail message (identity-tracked so direct
+        # ``messages.append`` callers cannot make us drop a real message).
+        self._volatile_message: dict[str, Any] | None = None
         self._chars_per_token = max(1, chars_per_token)
         self._messages: list[dict[str, Any]] = []
         self._last_system_prompt: str = ""
@@ -111,6 +126,7 @@ class ContextManager:
         )
         self._messages.clear()
         self._messages.extend(new_messages)
+        self._volatile_message = None
         self._last_system_prompt = base_system_prompt
         self._sub_agent_entries.clear()
         self._initialized = True
@@ -119,11 +135,15 @@ class ContextManager:
     def restore(self, messages: list[dict[str, Any]]) -> None:
         """Restore messages from a resume context (ask_user pause).
 
+        Volatile tail messages captured in the paused list are dropped;
+        the next ``prepare_for_llm()`` builds a fresh one.
+
         Args:
             messages: The full message list from a paused execution.
         """
         self._messages.clear()
-        self._messages.extend(messages)
+        self._messages.extend(m for m in messages if not is_volatile_context_message(m))
+        self._volatile_message = None
         if self._messages and self._messages[0].get("role") == "system":
             self._last_system_prompt = str(self._messages[0].get("content", ""))
         self._initialized = True
@@ -148,10 +168,17 @@ class ContextManager:
     def append_message(self, message: dict[str, Any]) -> None:
         """Append a single message to the context.
 
+        The volatile tail, when present, stays the last message so calls
+        made without another ``prepare_for_llm()`` still see it.
+
         Args:
             message: A message dict (user, assistant, tool, etc.).
         """
-        self._messages.append(message)
+        tail = self._volatile_message
+        if tail is not None and self._messages and self._messages[-1] is tail:
+            self._messages.insert(len(self._messages) - 1, message)
+        else:
+            self._messages.append(message)
 
     # Maximum sub-agent snapshots kept per execution turn to bound memory.
     MAX_SUB_AGENT_SNAPSHOTS = 10
@@ -229,11 +256,14 @@ class ContextManager:
         """Prepare the full context for the next LLM call.
 
         Orchestrates system prompt rebuild, compression, and preflight
-        check in the correct order.
+        check in the correct order. With a ``build_prompt_layout_fn``
+        only the stable prefix goes into messages[0]; the volatile part
+        is re-appended as the last message after compression.
 
         Args:
             rebuild_system_prompt: Whether to rebuild messages[0] via
-                the registered ``build_system_prompt_fn`` callback.
+                the registered ``build_prompt_layout_fn`` (preferred) or
+                ``build_system_prompt_fn`` callback.
             apply_compression: Whether to run compression and preflight.
             mission: Current mission text (for system prompt rebuild).
             state: Current session state (for system prompt rebuild).
@@ -242,7 +272,16 @@ class ContextManager:
             self._logger.warning("prepare_for_llm_called_before_initialize")
             return
 
-        if rebuild_system_prompt and self._build_system_prompt_fn:
+        self._remove_volatile_tail()
+        if rebuild_system_prompt and self._build_prompt_layout_fn:
+            layout = self._build_prompt_layout_fn(
+                mission=mission,
+                state=state,
+                messages=self._messages,
+            )
+            self.set_system_prompt(layout.stable)
+            self._volatile_message = layout.volatile_message()
+        elif rebuild_system_prompt and self._build_system_prompt_fn:
             prompt = self._build_system_prompt_fn(
                 mission=mission,
                 state=state,
@@ -254,6 +293,9 @@ class ContextManager:
             await self.compress()
             self.preflight_check()
 
+        if self._volatile_message is not None:
+            self._messages.append(self._volatile_message)
+
         self._logger.debug(
             "context_prepared_for_llm",
             message_count=len(self._messages),
@@ -261,6 +303,16 @@ class ContextManager:
             compressed=apply_compression,
         )
 
+    def _remove_volatile_tail(self) -> None:
+        """Take the current volatile tail out of the messages list."""
+        tail = self._volatile_message
+        if tail is None:
+            return
+        for idx in range(len(self._messages) - 1, -1, -1):
+            if self._messages[idx] is tail:
+                del self._messages[idx]
+                return
+
     # ------------------------------------------------------------------
     # Snapshot
     # ------------------------------------------------------------------
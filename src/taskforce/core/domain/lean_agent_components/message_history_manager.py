@@ -11,6 +11,13 @@ from taskforce.core.domain.lean_agent_components.message_sanitizer import (
 from taskforce.core.domain.token_budgeter import TokenBudgeter
 from taskforce.core.interfaces.llm import LLMProviderProtocol
 from taskforce.core.interfaces.logging import LoggerProtocol
+from taskforce.core.utils.metrics import get_metrics_registry
+
+_COMPRESSIONS = get_metrics_registry().counter(
+    "taskforce_history_compressions_total",
+    "Message-history compressions by strategy (summary, deterministic).",
+    ("strategy",),
+)
 
 
 class MessageHistoryManager:
@@ -305,6 +312,7 @@ Keep it factual and concise."""
                 *messages[keep_from:],
             ]
 
+            _COMPRESSIONS.labels("summary").inc()
             self._logger.info(
                 "messages_compressed_with_summary",
                 original_count=message_count,
@@ -327,6 +335,7 @@ Keep it factual and concise."""
         - Keep last 10 messages (hard cap)
         - Add a simple text summary of what was dropped
         """
+        _COMPRESSIONS.labels("deterministic").inc()
         self._logger.warning(
             "using_deterministic_compression",
             original_count=len(messages),
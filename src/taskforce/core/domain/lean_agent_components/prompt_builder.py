@@ -11,6 +11,7 @@ from taskforce.core.domain.planning.deliverable_check import (
     build_checklist_section,
     extract_checklist_bullets,
 )
+from taskforce.core.domain.prompt_layout import PromptLayout
 from taskforce.core.interfaces.logging import LoggerProtocol
 from taskforce.core.tools.planner_tool import PlannerTool
 
@@ -70,10 +71,38 @@ class LeanPromptBuilder:
         Returns:
             Complete system prompt with plan context and context pack.
         """
-        prompt = self._base_system_prompt
+        return self.build_prompt_layout(
+            mission=mission,
+            state=state,
+            messages=messages,
+        ).combined
+
+    def build_prompt_layout(
+        self,
+        *,
+        mission: str | None = None,
+        state: dict[str, Any] | None = None,
+        messages: list[dict[str, Any]] | None = None,
+    ) -> PromptLayout:
+        """
+        Build the system prompt split into a stable prefix and a volatile tail.
+
+        The stable part (base prompt, workspace, checklist) only changes
+        with the mission or workspace; the plan status and context pack
+        change every step and go into the volatile part.
+
+        Args:
+            mission: Optional mission description for context pack
+            state: Optional session state for context pack
+            messages: Optional message history for context pack
+
+        Returns:
+            PromptLayout whose ``combined`` equals ``build_system_prompt()``.
+        """
+        stable = self._base_system_prompt
         workspace_section = self._build_workspace_section()
         if workspace_section:
-            prompt += workspace_section
+            stable += workspace_section
 
         # Mandatory-deliverables checklist (#406). When the mission
         # contains an enumerated list of bolded bullets (PinchBench
@@ -82,21 +111,15 @@ class LeanPromptBuilder:
         # named items.
         checklist_section = self._build_checklist_section(mission)
         if checklist_section:
-            prompt += checklist_section
+            stable += checklist_section
 
-        plan_section = self._build_plan_section()
-        if plan_section:
-            prompt += plan_section
-
-        context_section = self._build_context_pack_section(
+        volatile = self._build_plan_section()
+        volatile += self._build_context_pack_section(
             mission=mission,
             state=state,
             messages=messages,
         )
-        if context_section:
-            prompt += context_section
-
-        return prompt
+        return PromptLayout(stable=stable, volatile=volatile)
 
     def _build_checklist_section(self, mission: str | None) -> str:
         """Extract enumerated bullets from the mission into a checklist.
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import time
 from typing import Any
 
 import structlog
@@ -18,9 +19,16 @@ from taskforce.core.interfaces.tools import ToolProtocol
 from taskforce.core.tools.tool_converter import (
     tool_result_to_message,
 )
+from taskforce.core.utils.metrics import get_metrics_registry
 
 MAX_LOGGED_STRING_CHARS = 4000
 
+_TOOL_DURATION = get_metrics_registry().histogram(
+    "taskforce_tool_duration_seconds",
+    "Tool execution latency by tool and outcome (success, failure, exception).",
+    ("tool", "outcome"),
+)
+
 
 def _truncate_for_log(value: Any, max_chars: int = MAX_LOGGED_STRING_CHARS) -> Any:
     """Return a log-safe copy of *value* with long strings truncated.
@@ -62,12 +70,16 @@ class ToolExecutor:
             return {"success": False, "error": f"Tool not found: {tool_name}"}
 
         logged_args = _truncate_for_log(tool_args)
+        started = time.perf_counter()
         try:
             self._logger.info("tool_execute", tool=tool_name, args=logged_args)
             result = await tool.execute(**tool_args)
             if not isinstance(result, dict):
                 result = {"success": True, "data": result}
             success = result.get("success")
+            _TOOL_DURATION.labels(
+                tool_name, "failure" if success is False else "success"
+            ).observe(time.perf_counter() - started)
             logged_result = _truncate_for_log(result)
             if success is False:
                 self._logger.warning(
@@ -88,6 +100,7 @@ class ToolExecutor:
                 )
             return result
         except Exception as error:
+            _TOOL_DURATION.labels(tool_name, "exception").observe(time.perf_counter() - started)
             self._logger.error(
                 "tool_exception",
                 tool=tool_name,
@@ -16,9 +16,15 @@ this module focused on strategy orchestration.
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any, Protocol
 
+from taskforce.core.domain.complexity_classifier import (
+    ComplexityVerdict,
+    ComplexityVerdictCache,
+    mission_fingerprint,
+)
 from taskforce.core.domain.enums import (
     EventType,
     ExecutionStatus,
@@ -621,6 +627,22 @@ async def _run_reflection_cycle(
 # ---------------------------------------------------------------------------
 
 
+# Events a speculative run may produce before the verdict is known: they
+# only reflect the in-flight LLM call. Anything else (tool calls, plan
+# updates, final answers) pauses the speculative stream until it is either
+# kept or discarded, so a discarded run never executed a tool.
+_SPECULATION_SAFE_EVENTS = frozenset(
+    {
+        EventType.STARTED,
+        EventType.STEP_START,
+        EventType.LLM_TOKEN,
+        EventType.LLM_STREAM_RESTART,
+        EventType.TOKEN_USAGE,
+    }
+)
+_SPECULATION_DONE = object()
+
+
 class AdaptivePlanningStrategy:
     """Routes each mission to a cheap or expensive sub-strategy based on
     LLM classification.
@@ -633,7 +655,19 @@ class AdaptivePlanningStrategy:
 
     The classifier is invoked once at mission start and adds ~200-400ms +
     a small token cost. Net win because the saved overhead on simple
-    missions is on the order of 5-10 seconds.
+    missions is on the order of 5-10 seconds. With a ``verdict_cache``
+    confident verdicts are remembered per mission fingerprint and
+    ``profile_hash``, so repeated missions skip the classifier entirely.
+
+    When ``speculate`` names a level and the classifier cannot answer
+    locally (no cache hit, heuristic unsure), that level's strategy starts
+    while the classifier runs. Its events are buffered; the stream pauses
+    at the first event with side effects (tool call, plan update, final
+    answer). If the verdict picks the speculated strategy the buffer is
+    flushed and the run continues, otherwise it is cancelled and the other
+    strategy starts from scratch. Only speculate on strategies whose first
+    LLM call has no side effects beyond (re-)initialising the context —
+    ``native_react`` qualifies.
 
     On classifier failure the strategy uses ``fallback_level`` (default
     ``complex``) so a hard task is never accidentally routed to a single-
@@ -649,6 +683,13 @@ class AdaptivePlanningStrategy:
         fallback_level: routing decision when ``classifier`` returns a
             zero-confidence verdict. ``"complex"`` is safer; ``"simple"``
             optimises for latency.
+        speculate: ``"simple"`` or ``"complex"`` to start that strategy
+            speculatively on a classifier miss; ``None`` (default) waits
+            for the verdict.
+        verdict_cache: optional TTL cache shared across agents; only
+            confident (``confidence > 0``) verdicts are stored, so a
+            transient classifier failure does not stick.
+        profile_hash: identifies the routing configuration in cache keys.
         logger: optional structured logger; if omitted, a default is built
             on first use.
     """
@@ -662,6 +703,9 @@ class AdaptivePlanningStrategy:
         classifier: Any,
         *,
         fallback_level: str = "complex",
+        speculate: str | None = None,
+        verdict_cache: ComplexityVerdictCache | None = None,
+        profile_hash: str = "",
         logger: LoggerProtocol | None = None,
     ) -> None:
         self.simple = simple
@@ -670,6 +714,9 @@ class AdaptivePlanningStrategy:
         self.fallback_level = (
             fallback_level if fallback_level in {"simple", "complex"} else "complex"
         )
+        self.speculate = speculate if speculate in {"simple", "complex"} else None
+        self.verdict_cache = verdict_cache
+        self.profile_hash = profile_hash
         self._logger = logger
 
     def _get_logger(self):
@@ -681,7 +728,12 @@ class AdaptivePlanningStrategy:
 
     async def _route(self, mission: str) -> PlanningStrategy:
         """Run the classifier, log the verdict, return the chosen substrategy."""
-        verdict = await self.classifier.classify(mission)
+        verdict = self._cached_verdict(mission)
+        cached = verdict is not None
+        if verdict is None:
+            verdict = await self.classifier.classify(mission)
+            if self.verdict_cache is not None and verdict.confidence > 0.0:
+                self.verdict_cache.put(self._cache_key(mission), verdict)
         log = self._get_logger()
 
         # Zero-confidence -> classifier failed, use fallback. Non-zero +
@@ -699,17 +751,92 @@ class AdaptivePlanningStrategy:
             verdict_reason=verdict.reason,
             effective_level=effective_level,
             chosen=chosen.name,
+            cached=cached,
             mission_chars=len(mission),
         )
         return chosen
 
+    def _cache_key(self, mission: str) -> tuple[str, str]:
+        return (self.profile_hash, mission_fingerprint(mission))
+
+    def _cached_verdict(self, mission: str) -> ComplexityVerdict | None:
+        if self.verdict_cache is None or not mission.strip():
+            return None
+        return self.verdict_cache.get(self._cache_key(mission))
+
+    def _should_speculate(self, mission: str) -> bool:
+        """True when speculation is on and the verdict needs a remote call."""
+        if self.speculate is None or self._cached_verdict(mission) is not None:
+            return False
+        classify_local = getattr(self.classifier, "classify_local", None)
+        if classify_local is None:
+            return True
+        return not isinstance(classify_local(mission), ComplexityVerdict)
+
     async def execute(self, agent: Agent, mission: str, session_id: str) -> ExecutionResult:
+        if self._should_speculate(mission):
+            return await _collect_result(
+                session_id, self._speculative_stream(agent, mission, session_id)
+            )
         chosen = await self._route(mission)
         return await chosen.execute(agent, mission, session_id)
 
     async def execute_stream(
         self, agent: Agent, mission: str, session_id: str
     ) -> AsyncIterator[StreamEvent]:
+        if self._should_speculate(mission):
+            async for ev in self._speculative_stream(agent, mission, session_id):
+                yield ev
+            return
         chosen = await self._route(mission)
         async for ev in chosen.execute_stream(agent, mission, session_id):
             yield ev
+
+    async def _speculative_stream(
+        self, agent: Agent, mission: str, session_id: str
+    ) -> AsyncIterator[StreamEvent]:
+        """Run the speculated strategy while classifying; keep or cancel it."""
+        speculated = self.simple if self.speculate == "simple" else self.complex
+        stream = speculated.execute_stream(agent, mission, session_id)
+        queue: asyncio.Queue[Any] = asyncio.Queue()
+        committed = asyncio.Event()
+
+        async def pump() -> None:
+            try:
+                async for ev in stream:
+                    await queue.put(ev)
+                    if ev.event_type not in _SPECULATION_SAFE_EVENTS:
+                        await committed.wait()
+            finally:
+                queue.put_nowait(_SPECULATION_DONE)
+
+        pump_task = asyncio.create_task(pump())
+        route_task = asyncio.create_task(self._route(mission))
+        try:
+            chosen = await route_task
+            kept = chosen is speculated
+            self._get_logger().info(
+                "adaptive_strategy.speculation_resolved",
+                speculated=speculated.name,
+                chosen=chosen.name,
+                kept=kept,
+                buffered_events=queue.qsize(),
+            )
+            if kept:
+                committed.set()
+                while (ev := await queue.get()) is not _SPECULATION_DONE:
+                    yield ev
+                await pump_task
+                return
+
+            pump_task.cancel()
+            await asyncio.gather(pump_task, return_exceptions=True)
+            await stream.aclose()
+            async for ev in chosen.execute_stream(agent, mission, session_id):
+                yield ev
+        finally:
+            for task in (route_task, pump_task):
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(route_task, pump_task, return_exceptions=True)
+            await stream.aclose()
@@ -0,0 +1,60 @@
+"""Prompt-cache-aware split of the per-step system prompt.
+
+Provider prompt caches (OpenAI automatic prefix caching, Anthropic
+``cache_control`` breakpoints) only hit when the request prefix is
+byte-identical to a previous request. Appending the plan status and the
+context pack to ``messages[0]`` changed that prefix on every ReAct step,
+so the system prompt, tool schemas and history were re-billed in full.
+
+:class:`PromptLayout` separates the *stable* part (base prompt,
+workspace guidance, checklist, wiki index, active skill) that stays in
+``messages[0]`` from the *volatile* part (plan status, context pack)
+that is sent as a trailing user message — after the history, so it never
+invalidates the cached prefix.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+# Marks the volatile tail message. The LLM layer uses it to place the
+# last cache breakpoint *before* the tail; the context manager uses it to
+# strip stale tails from restored (paused) message lists.
+VOLATILE_CONTEXT_HEADER = "[STEP CONTEXT — refreshed every step, not part of the conversation]"
+
+
+@dataclass(frozen=True)
+class PromptLayout:
+    """System prompt split into a cacheable prefix and a per-step tail.
+
+    Attributes:
+        stable: Content of ``messages[0]``; changes only when the mission,
+            workspace, wiki index or active skill changes.
+        volatile: Plan status and context pack; rebuilt every step.
+    """
+
+    stable: str
+    volatile: str = ""
+
+    @property
+    def combined(self) -> str:
+        """The legacy single-string system prompt."""
+        return self.stable + self.volatile
+
+    def volatile_message(self) -> dict[str, Any] | None:
+        """Return the trailing user message carrying :attr:`volatile`, if any."""
+        body = self.volatile.strip()
+        if not body:
+            return None
+        return {"role": "user", "content": f"{VOLATILE_CONTEXT_HEADER}\n\n{body}"}
+
+
+def is_volatile_context_message(message: dict[str, Any]) -> bool:
+    """Return True if *message* is a volatile tail built by :class:`PromptLayout`."""
+    content = message.get("content")
+    return (
+        message.get("role") == "user"
+        and isinstance(content, str)
+        and content.startswith(VOLATILE_CONTEXT_HEADER)
+    )
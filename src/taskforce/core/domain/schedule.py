@@ -151,7 +151,7 @@ class ScheduleJob:
             coalesce_value = CoalescePolicy.SKIP
 
         return cls(
-            job_id=str(data.get("job_id", uuid4().hex)),
+            job_id=str(data["job_id"]) if "job_id" in data else uuid4().hex,
             name=str(data.get("name", "")),
             schedule_type=ScheduleType(data.get("schedule_type", "cron")),
             expression=str(data.get("expression", "")),
@@ -51,6 +51,15 @@ class StandingGoal:
             evaluator submitted on this goal's behalf, or empty string
             when the LLM decided no action was warranted.
         metadata: Arbitrary user-defined context (tags, links).
+        inputs: Cheap probes describing what the goal watches, e.g.
+            ``{"type": "file", "path": "reports/*.csv"}``,
+            ``{"type": "wiki_page", "page": "projects/alpha"}``,
+            ``{"type": "event_count", "source": "github"}`` or
+            ``{"type": "tool", "tool": "...", "params": {...}}``. When
+            set, a due goal whose probed inputs are unchanged since its
+            last evaluation is skipped without a mission.
+        input_fingerprint: Hash of the probed inputs at the last
+            evaluation; empty when never probed.
     """
 
     description: str
@@ -62,6 +71,8 @@ class StandingGoal:
     last_evaluated_at: datetime | None = None
     last_action_taken: str = ""
     metadata: dict[str, Any] = field(default_factory=dict)
+    inputs: list[dict[str, Any]] = field(default_factory=list)
+    input_fingerprint: str = ""
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to a JSON-friendly dict for the file store."""
@@ -77,6 +88,8 @@ class StandingGoal:
             ),
             "last_action_taken": self.last_action_taken,
             "metadata": dict(self.metadata),
+            "inputs": [dict(spec) for spec in self.inputs],
+            "input_fingerprint": self.input_fingerprint,
         }
 
     @classmethod
@@ -94,4 +107,6 @@ class StandingGoal:
             last_evaluated_at=last_dt,
             last_action_taken=data.get("last_action_taken", ""),
             metadata=dict(data.get("metadata", {})),
+            inputs=[dict(spec) for spec in data.get("inputs") or []],
+            input_fingerprint=data.get("input_fingerprint", ""),
         )
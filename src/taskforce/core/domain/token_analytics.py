@@ -27,6 +27,8 @@ class LLMCallRecord:
         prompt_tokens: Input tokens reported by the provider.
         completion_tokens: Output tokens reported by the provider.
         total_tokens: Total tokens (prompt + completion).
+        cached_prompt_tokens: Part of ``prompt_tokens`` served from the
+            provider's prompt cache.
         latency_ms: Request duration in milliseconds.
         tool_call_names: Names of tools the LLM chose to call (if any).
         timestamp: When this call was made.
@@ -38,6 +40,7 @@ class LLMCallRecord:
     prompt_tokens: int = 0
     completion_tokens: int = 0
     total_tokens: int = 0
+    cached_prompt_tokens: int = 0
     latency_ms: int = 0
     tool_call_names: list[str] = field(default_factory=list)
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
@@ -51,6 +54,7 @@ class LLMCallRecord:
             "prompt_tokens": self.prompt_tokens,
             "completion_tokens": self.completion_tokens,
             "total_tokens": self.total_tokens,
+            "cached_prompt_tokens": self.cached_prompt_tokens,
             "latency_ms": self.latency_ms,
             "tool_call_names": self.tool_call_names,
             "timestamp": self.timestamp.isoformat(),
@@ -154,6 +158,8 @@ class ExecutionTokenSummary:
         total_prompt_tokens: Sum of all prompt tokens.
         total_completion_tokens: Sum of all completion tokens.
         total_tokens: Sum of all tokens.
+        total_cached_prompt_tokens: Sum of prompt tokens served from the
+            provider's prompt cache.
         total_llm_calls: Number of LLM calls.
         total_latency_ms: Sum of all latency.
         prompt_to_completion_ratio: Ratio of prompt to completion tokens.
@@ -165,6 +171,7 @@ class ExecutionTokenSummary:
     total_prompt_tokens: int = 0
     total_completion_tokens: int = 0
     total_tokens: int = 0
+    total_cached_prompt_tokens: int = 0
     total_llm_calls: int = 0
     total_latency_ms: int = 0
     prompt_to_completion_ratio: float = 0.0
@@ -178,6 +185,7 @@ class ExecutionTokenSummary:
             "total_prompt_tokens": self.total_prompt_tokens,
             "total_completion_tokens": self.total_completion_tokens,
             "total_tokens": self.total_tokens,
+            "total_cached_prompt_tokens": self.total_cached_prompt_tokens,
             "total_llm_calls": self.total_llm_calls,
             "total_latency_ms": self.total_latency_ms,
             "prompt_to_completion_ratio": round(self.prompt_to_completion_ratio, 2),
@@ -202,6 +210,7 @@ def build_summary(calls: list[LLMCallRecord]) -> ExecutionTokenSummary:
         summary.total_prompt_tokens += record.prompt_tokens
         summary.total_completion_tokens += record.completion_tokens
         summary.total_tokens += record.total_tokens
+        summary.total_cached_prompt_tokens += record.cached_prompt_tokens
         summary.total_latency_ms += record.latency_ms
 
         ms = model_map.get(record.model)
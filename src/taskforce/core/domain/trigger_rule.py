@@ -66,11 +66,15 @@ class RuleAction:
         params: Action-specific parameters (channel, mission text, etc.).
         template: Optional Jinja2 template for dynamic message generation.
                   Template variables come from the event payload.
+        ordered: Dispatch only after every higher-priority action for the
+                 same event has finished, and before any lower-priority
+                 one starts. Unordered actions run concurrently.
     """
 
     action_type: RuleActionType
     params: dict[str, Any] = field(default_factory=dict)
     template: str | None = None
+    ordered: bool = False
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize for storage."""
@@ -80,6 +84,8 @@ class RuleAction:
         }
         if self.template is not None:
             result["template"] = self.template
+        if self.ordered:
+            result["ordered"] = True
         return result
 
     @classmethod
@@ -89,6 +95,7 @@ class RuleAction:
             action_type=RuleActionType(data["action_type"]),
             params=dict(data.get("params", {})),
             template=data.get("template"),
+            ordered=bool(data.get("ordered", False)),
         )
 
 
@@ -0,0 +1,140 @@
+"""Link graph over a wiki's ``[[wiki-links]]``.
+
+Forward adjacency (page → pages it links to) and backward adjacency
+(page → pages linking to it) kept side by side, so backlink and
+neighbourhood lookups cost O(degree) instead of a scan over every page
+body. Each node also carries the page title and index hook, which is
+all lint and ``index.md`` need. Pure data structure — the store keeps
+it current and persists it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from taskforce.core.domain.wiki_page import WikiPage
+from taskforce.core.domain.wiki_service import extract_wiki_links, index_hook
+
+
+@dataclass(frozen=True)
+class WikiLinkEntry:
+    """What the graph knows about one page."""
+
+    title: str
+    hook: str
+    links: tuple[str, ...]
+
+    @classmethod
+    def from_page(cls, page: WikiPage) -> WikiLinkEntry:
+        links = tuple(dict.fromkeys(extract_wiki_links(page.body)))
+        return cls(title=page.title, hook=index_hook(page), links=links)
+
+
+class WikiLinkGraph:
+    """Forward and backward link adjacency of a wiki.
+
+    Links to pages that do not exist (yet) are kept: they are the broken
+    links, and they resolve as soon as the target page is written.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, WikiLinkEntry] = {}
+        self._backward: dict[str, set[str]] = {}
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[WikiPage]) -> WikiLinkGraph:
+        graph = cls()
+        for page in pages:
+            graph.set_page(page.name, WikiLinkEntry.from_page(page))
+        return graph
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entries
+
+    def get(self, name: str) -> WikiLinkEntry | None:
+        return self._entries.get(name)
+
+    def entries(self) -> Iterator[tuple[str, WikiLinkEntry]]:
+        """Yield ``(name, entry)`` for every page, sorted by name."""
+        for name in sorted(self._entries):
+            yield name, self._entries[name]
+
+    # -- mutation ---------------------------------------------------------
+
+    def set_page(self, name: str, entry: WikiLinkEntry) -> None:
+        """Add or replace a page; only its changed links are touched."""
+        previous = self._entries.get(name)
+        old_links = set(previous.links) if previous else set()
+        new_links = set(entry.links)
+        for target in old_links - new_links:
+            self._unlink(name, target)
+        for target in new_links - old_links:
+            self._backward.setdefault(target, set()).add(name)
+        self._entries[name] = entry
+
+    def remove_page(self, name: str) -> bool:
+        entry = self._entries.pop(name, None)
+        if entry is None:
+            return False
+        for target in entry.links:
+            self._unlink(name, target)
+        return True
+
+    def _unlink(self, source: str, target: str) -> None:
+        sources = self._backward.get(target)
+        if sources is not None:
+            sources.discard(source)
+            if not sources:
+                del self._backward[target]
+
+    # -- queries ----------------------------------------------------------
+
+    def outlinks(self, name: str) -> list[str]:
+        """Link targets of ``name`` in body order (existing or not)."""
+        entry = self._entries.get(name)
+        return list(entry.links) if entry else []
+
+    def backlinks(self, name: str) -> list[str]:
+        """Pages linking to ``name``, sorted."""
+        return sorted(self._backward.get(name, ()))
+
+    def neighbourhood(self, name: str, depth: int = 1) -> set[str]:
+        """Existing pages within ``depth`` link hops of ``name``, either direction."""
+        seen = {name}
+        frontier = {name}
+        for _ in range(depth):
+            step: set[str] = set()
+            for node in frontier:
+                step.update(self.outlinks(node))
+                step.update(self._backward.get(node, ()))
+            frontier = {n for n in step if n in self._entries and n not in seen}
+            if not frontier:
+                break
+            seen |= frontier
+        seen.discard(name)
+        return seen
+
+    def broken_links(self) -> list[tuple[str, str]]:
+        """``(source, target)`` for every link to a page that does not exist."""
+        broken = []
+        for target in sorted(set(self._backward) - set(self._entries)):
+            broken.extend((source, target) for source in self._backward[target])
+        return sorted(broken)
+
+    def orphans(self) -> list[str]:
+        """Pages no page links to, sorted."""
+        return sorted(name for name in self._entries if not self._backward.get(name))
+
+    def duplicate_titles(self) -> list[tuple[str, str, str]]:
+        """``(title, first_page, other_page)`` for titles used by several pages."""
+        first: dict[str, str] = {}
+        duplicates = []
+        for name, entry in self.entries():
+            prior = first.setdefault(entry.title, name)
+            if prior != name:
+                duplicates.append((entry.title, prior, name))
+        return duplicates
@@ -76,9 +76,19 @@ def render_index(pages: Iterable[WikiPage]) -> str:
 
     Pages are grouped by kind (directory prefix) in a stable order.
     """
-    by_kind: dict[str, list[WikiPage]] = {kind: [] for kind in _KIND_ORDER}
-    for page in pages:
-        by_kind.setdefault(page.kind, []).append(page)
+    return render_index_entries((page.name, page.title, index_hook(page)) for page in pages)
+
+
+def render_index_entries(entries: Iterable[tuple[str, str, str]]) -> str:
+    """Render ``index.md`` from ``(name, title, hook)`` triples.
+
+    Same output as :func:`render_index`, for callers that already hold
+    each page's hook and need not load the bodies.
+    """
+    by_kind: dict[str, list[tuple[str, str, str]]] = {kind: [] for kind in _KIND_ORDER}
+    for entry in entries:
+        parts = entry[0].split("/", 1)
+        by_kind.setdefault(parts[0] if len(parts) > 1 else "other", []).append(entry)
     lines = [
         "# Wiki Index",
         "",
@@ -88,20 +98,19 @@ def render_index(pages: Iterable[WikiPage]) -> str:
         "`update_page` / `delete_page`.",
         "",
     ]
-    for kind, kind_pages in by_kind.items():
+    for kind, kind_entries in by_kind.items():
         lines.append(f"## {kind.capitalize()}")
         lines.append("")
-        if not kind_pages:
+        if not kind_entries:
             lines.append("_(no pages yet)_")
         else:
-            for page in sorted(kind_pages, key=lambda p: p.name):
-                hook = _index_hook(page)
-                lines.append(f"- [{page.title}]({page.name}.md) — {hook}")
+            for name, title, hook in sorted(kind_entries):
+                lines.append(f"- [{title}]({name}.md) — {hook}")
         lines.append("")
     return "\n".join(lines).rstrip() + "\n"
 
 
-def _index_hook(page: WikiPage) -> str:
+def index_hook(page: WikiPage) -> str:
     """Return a one-line hook for the index entry.
 
     Prefers the first non-heading paragraph of the body; falls back to
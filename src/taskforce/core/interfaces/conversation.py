@@ -10,7 +10,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Protocol
+from typing import Any, Generic, Protocol, TypeVar
+
+T = TypeVar("T")
 
 
 @dataclass(frozen=True)
@@ -24,6 +26,7 @@ class ConversationInfo:
     message_count: int
     topic: str | None = None
     project_id: str | None = None
+    archived_at: datetime | None = None  # set when the conversation is archived
 
 
 @dataclass(frozen=True)
@@ -39,6 +42,18 @@ class ConversationSummary:
     project_id: str | None = None
 
 
+@dataclass(frozen=True)
+class ConversationPage(Generic[T]):
+    """One page of a conversation listing.
+
+    ``next_cursor`` is an opaque token for the following page, or ``None``
+    when this is the last page.
+    """
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
 class ConversationManagerProtocol(Protocol):
     """Manages conversation lifecycle for the persistent agent.
 
@@ -172,6 +187,60 @@ class ConversationManagerProtocol(Protocol):
         """
         ...
 
+    async def get_info(self, conversation_id: str) -> ConversationInfo | None:
+        """Look up one conversation (active or archived) by id.
+
+        Used for ownership checks on every single-conversation request, so
+        implementations should answer without scanning all conversations.
+        Archived conversations carry ``archived_at``.
+
+        Args:
+            conversation_id: Conversation to look up.
+
+        Returns:
+            The conversation's metadata, or ``None`` when no conversation
+            with that id exists in this store's scope.
+        """
+        ...
+
+    async def list_active_page(
+        self,
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+        project_id: str | None = None,
+    ) -> ConversationPage[ConversationInfo]:
+        """List active conversations one page at a time (newest activity first).
+
+        Args:
+            limit: Maximum number of items; ``None`` returns the rest.
+            cursor: ``next_cursor`` of the previous page, or ``None``.
+            project_id: Only include conversations linked to this project.
+
+        Raises:
+            ValueError: If ``cursor`` is malformed.
+        """
+        ...
+
+    async def list_archived_page(
+        self,
+        *,
+        limit: int | None = 20,
+        cursor: str | None = None,
+        project_id: str | None = None,
+    ) -> ConversationPage[ConversationSummary]:
+        """List archived conversations one page at a time (newest archive first).
+
+        Args:
+            limit: Maximum number of items; ``None`` returns the rest.
+            cursor: ``next_cursor`` of the previous page, or ``None``.
+            project_id: Only include conversations linked to this project.
+
+        Raises:
+            ValueError: If ``cursor`` is malformed.
+        """
+        ...
+
     async def delete(self, conversation_id: str) -> bool:
         """Hard-delete a conversation (active or archived).
 
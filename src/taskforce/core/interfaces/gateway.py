@@ -5,6 +5,7 @@ Separates concerns that were previously mixed in CommunicationProviderProtocol:
 - InboundAdapterProtocol: normalizing raw channel payloads
 - ConversationStoreProtocol: session mapping and history persistence
 - RecipientRegistryProtocol: managing push-notification recipients
+- BroadcastOutboxProtocol: resumable record of in-progress broadcasts
 - RecipientResolverProtocol: mapping a channel-specific identity to a
   logical recipient (extension point for external auth/identity layers)
 - ChannelLinkRegistryProtocol: pairing channel senders to (tenant, user)
@@ -206,11 +207,70 @@ class RecipientRegistryProtocol(Protocol):
         """List all registered user IDs for a channel."""
         ...
 
+    async def resolve_many(self, *, channel: str) -> dict[str, dict[str, Any]]:
+        """Bulk-load every stored reference on a channel.
+
+        Used by broadcast fan-out so resolving N recipients is one query
+        instead of N ``resolve`` round-trips. Implementations that predate
+        this method are still supported — the gateway falls back to
+        ``list_recipients`` + ``resolve``.
+
+        Returns:
+            Mapping of user ID to its stored reference dict.
+        """
+        ...
+
     async def remove(self, *, channel: str, user_id: str) -> bool:
         """Remove a recipient. Returns True if it existed."""
         ...
 
 
+class BroadcastOutboxProtocol(Protocol):
+    """Durable record of in-progress broadcasts.
+
+    The gateway writes a broadcast's recipient list before the first
+    delivery and appends each outcome as it completes, so a process
+    restart can resume the fan-out without re-sending to recipients that
+    were already handled.
+    """
+
+    async def open(
+        self,
+        *,
+        broadcast_id: str,
+        channel: str,
+        message: str,
+        metadata: dict[str, Any],
+        tenant_id: str | None,
+    ) -> dict[str, tuple[bool, str | None]]:
+        """Start or resume a broadcast.
+
+        Returns:
+            Outcomes already recorded for this broadcast, keyed by
+            recipient ID as ``(success, error)``. Empty for a new one.
+        """
+        ...
+
+    async def record(
+        self, *, broadcast_id: str, recipient_id: str, success: bool, error: str | None
+    ) -> None:
+        """Append the delivery outcome for one recipient."""
+        ...
+
+    async def complete(self, broadcast_id: str) -> None:
+        """Drop the record of a broadcast that reached every recipient."""
+        ...
+
+    async def pending(self) -> list[dict[str, Any]]:
+        """List interrupted broadcasts.
+
+        Returns:
+            Header dicts with ``broadcast_id``, ``channel``, ``message``,
+            ``metadata`` and ``tenant_id``.
+        """
+        ...
+
+
 @dataclass(frozen=True)
 class RecipientInfo:
     """Resolved recipient for an inbound message.
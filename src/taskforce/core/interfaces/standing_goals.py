@@ -42,9 +42,14 @@ class StandingGoalStoreProtocol(Protocol):
         goal_id: str,
         evaluated_at: datetime,
         action_taken: str,
+        *,
+        input_fingerprint: str | None = None,
     ) -> None:
         """Record an evaluation outcome on the stored goal.
 
+        ``input_fingerprint`` replaces the stored fingerprint of the
+        goal's probed inputs; ``None`` leaves it unchanged.
+
         Implementations must be safe to call concurrently for different
         ``goal_id``s — the file store serializes writes through a lock.
         """
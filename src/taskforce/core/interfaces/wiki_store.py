@@ -6,8 +6,9 @@ markdown pages, not typed records — no kind enums, no scopes, no decay.
 
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
+from taskforce.core.domain.wiki_link_graph import WikiLinkGraph
 from taskforce.core.domain.wiki_page import WikiPage
 
 
@@ -56,3 +57,39 @@ class WikiStoreProtocol(Protocol):
     async def read_index(self) -> str:
         """Return the raw ``index.md`` contents."""
         ...
+
+
+@runtime_checkable
+class WikiLinkGraphProvider(Protocol):
+    """Optional capability — stores that maintain a wiki link graph.
+
+    Lint and backlink lookups use it instead of loading every page.
+    Stores without it (e.g. plugin overrides) still work; callers fall
+    back to building a graph from ``list_pages``.
+    """
+
+    async def link_graph(self, *, rescan: bool = False) -> WikiLinkGraph:
+        """Return the store's link graph.
+
+        With ``rescan`` the store first picks up pages changed outside
+        it (e.g. edited on disk). The graph is live — treat it as
+        read-only.
+        """
+        ...
+
+
+@runtime_checkable
+class WikiPageSignatureProvider(Protocol):
+    """Optional capability — stores that can tell which pages changed.
+
+    Callers that cache derived data per page (e.g. the learning
+    service's similarity index) re-read only pages whose signature
+    differs from the one they saw. Stores without it are re-read in full.
+    """
+
+    async def page_signatures(self) -> dict[str, tuple[int, int]]:
+        """Map every page name to a signature that changes with the page.
+
+        Includes pages changed outside the store.
+        """
+        ...
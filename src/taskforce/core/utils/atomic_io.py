@@ -41,14 +41,18 @@ def _replace_with_retry(src: Path, dst: Path) -> None:
     os.replace(src, dst)  # final attempt — let any error propagate
 
 
-def _atomic_write_text_sync(path: Path, text: str, encoding: str) -> None:
+def _atomic_write_text_sync(path: Path, text: str, encoding: str, mode: int | None) -> None:
     """Blocking implementation of :func:`atomic_write_text`."""
     # mkstemp gives a guaranteed-unique temp file in the *same* directory,
     # so the rename stays on one filesystem (atomic) and two concurrent
-    # writes to the same target never collide on the temp file.
+    # writes to the same target never collide on the temp file. It opens
+    # the file with mode 0600, so nothing is readable by others before
+    # ``mode`` is applied.
     fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
     tmp = Path(tmp_name)
     try:
+        if mode is not None and hasattr(os, "fchmod"):
+            os.fchmod(fd, mode)
         with os.fdopen(fd, "w", encoding=encoding) as handle:
             handle.write(text)
             handle.flush()
@@ -68,6 +72,7 @@ async def atomic_write_text(
     text: str,
     *,
     encoding: str = "utf-8",
+    mode: int | None = None,
 ) -> None:
     """Write *text* to *path* atomically and durably.
 
@@ -85,5 +90,8 @@ async def atomic_write_text(
         path: Destination file path.
         text: Full file contents to write.
         encoding: Text encoding (default UTF-8).
+        mode: Permission bits for the file, set on the temp file before
+            any content is written (POSIX only). ``None`` leaves
+            ``mkstemp``'s 0600.
     """
-    await asyncio.to_thread(_atomic_write_text_sync, Path(path), text, encoding)
+    await asyncio.to_thread(_atomic_write_text_sync, Path(path), text, encoding, mode)
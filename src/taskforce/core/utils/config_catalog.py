@@ -0,0 +1,211 @@
+"""Stat-validated cache for config directories and parsed config files.
+
+Resolving a profile or specialist used to probe a dozen candidate paths,
+iterate every ``agents/*/configs`` and plugin directory, and re-parse the
+winning YAML on every call — thousands of ``stat()`` calls and YAML
+parses per mission once sub-agents fan out in parallel.
+:class:`ConfigCatalog` keeps two caches shared by every resolver
+(``ProfileLoader``, ``AgentFactory``, ``SubAgentSpawner``,
+``FileAgentRegistry``):
+
+- **Directory listings**, revalidated with one ``stat`` of the directory
+  (its mtime changes whenever an entry is added, removed or renamed), so
+  "does ``{name}.yaml`` exist here" becomes a dict lookup.
+- **Parsed documents**, keyed by the file's ``(mtime_ns, size, inode)``,
+  so an in-place edit or an atomic rename is picked up on the next read.
+
+Filesystem timestamps are coarse (a kernel tick), so a second change in
+the same tick as a cached read would go unnoticed. Like git's racy-index
+check, anything modified less than ``racy_window_s`` before it was read
+is never cached and simply re-read next time.
+
+No locks: the caches are plain dicts, and a race between two threads
+costs at most a redundant parse.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import os
+import stat
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any, TypeVar
+
+import yaml
+
+T = TypeVar("T")
+
+_Signature = tuple[int, int, int]
+
+_MISS = object()
+
+
+def _signature(st: os.stat_result) -> _Signature:
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class ConfigCatalog:
+    """Shared cache of config directory listings and parsed files.
+
+    Args:
+        racy_window_s: Entries modified more recently than this are not
+            cached (see module docstring).
+        max_documents: Cap on cached parsed documents; the oldest entry
+            is evicted beyond it.
+    """
+
+    def __init__(self, *, racy_window_s: float = 2.0, max_documents: int = 2048) -> None:
+        self._racy_window_ns = int(racy_window_s * 1_000_000_000)
+        self._max_documents = max_documents
+        self._listings: dict[Path, tuple[_Signature, dict[str, bool]]] = {}
+        self._documents: dict[tuple[Path, Callable[[str], Any]], tuple[_Signature, Any]] = {}
+
+    # ------------------------------------------------------------------
+    # Directory listings
+    # ------------------------------------------------------------------
+
+    def entries(self, directory: Path) -> dict[str, bool]:
+        """Return ``{name: is_dir}`` for *directory* (empty if missing).
+
+        The returned mapping is shared with the cache — do not mutate it.
+        """
+        try:
+            st = os.stat(directory)
+        except OSError:
+            self._listings.pop(directory, None)
+            return {}
+        if not stat.S_ISDIR(st.st_mode):
+            return {}
+        signature = _signature(st)
+        cached = self._listings.get(directory)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        listing: dict[str, bool] = {}
+        try:
+            with os.scandir(directory) as scan:
+                for entry in scan:
+                    try:
+                        listing[entry.name] = entry.is_dir()
+                    except OSError:
+                        continue
+        except OSError:
+            return {}
+        if self._is_stable(st):
+            self._listings[directory] = (signature, listing)
+        return listing
+
+    def is_file(self, path: Path) -> bool:
+        """Whether *path* exists and is not a directory."""
+        return self.entries(path.parent).get(path.name) is False
+
+    def is_dir(self, path: Path) -> bool:
+        """Whether *path* exists and is a directory."""
+        return self.entries(path.parent).get(path.name) is True
+
+    def subdirs(self, directory: Path) -> list[Path]:
+        """Sorted child directories of *directory*."""
+        return [
+            directory / name for name, is_dir in sorted(self.entries(directory).items()) if is_dir
+        ]
+
+    def files(self, directory: Path, suffix: str = "") -> list[Path]:
+        """Sorted files in *directory* whose name ends with *suffix*."""
+        return [
+            directory / name
+            for name, is_dir in sorted(self.entries(directory).items())
+            if not is_dir and name.endswith(suffix)
+        ]
+
+    def first_file(self, candidates: Iterable[Path]) -> Path | None:
+        """Return the first of *candidates* that is an existing file."""
+        for candidate in candidates:
+            if self.is_file(candidate):
+                return candidate
+        return None
+
+    # ------------------------------------------------------------------
+    # Parsed documents
+    # ------------------------------------------------------------------
+
+    def parse(self, path: Path, parser: Callable[[str], T]) -> T:
+        """Return ``parser(text of path)``, cached until the file changes.
+
+        The result is shared between callers; use :meth:`load_yaml` (which
+        copies) when the caller mutates it.
+
+        Raises:
+            OSError: If the file cannot be read.
+            Exception: Whatever *parser* raises; failures are not cached.
+        """
+        st = os.stat(path)
+        key = (Path(path), parser)
+        cached = self._documents.get(key)
+        signature = _signature(st)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        with open(path, encoding="utf-8") as handle:
+            text = handle.read()
+        value = parser(text)
+        if self._is_stable(st):
+            if key not in self._documents and len(self._documents) >= self._max_documents:
+                self._documents.pop(next(iter(self._documents)))
+            self._documents[key] = (signature, value)
+        return value
+
+    def read_text(self, path: Path) -> str:
+        """Return the text of *path*, cached until the file changes."""
+        return self.parse(path, _identity)
+
+    def load_yaml(self, path: Path) -> Any:
+        """Return a private copy of the parsed YAML document at *path*.
+
+        Raises:
+            OSError: If the file cannot be read.
+            yaml.YAMLError: If the file is not valid YAML.
+        """
+        return copy.deepcopy(self.parse(path, yaml.safe_load))
+
+    async def load_yaml_async(self, path: Path) -> Any:
+        """Async :meth:`load_yaml`: cache hits stay on the loop, misses
+        read and parse in a worker thread."""
+        cached = self._cached(path, yaml.safe_load)
+        if cached is not _MISS:
+            return copy.deepcopy(cached)
+        return await asyncio.to_thread(self.load_yaml, path)
+
+    def clear(self) -> None:
+        """Drop every cached listing and document."""
+        self._listings.clear()
+        self._documents.clear()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _cached(self, path: Path, parser: Callable[[str], Any]) -> Any:
+        cached = self._documents.get((Path(path), parser))
+        if cached is None:
+            return _MISS
+        try:
+            signature = _signature(os.stat(path))
+        except OSError:
+            return _MISS
+        return cached[1] if cached[0] == signature else _MISS
+
+    def _is_stable(self, st: os.stat_result) -> bool:
+        return time.time_ns() - st.st_mtime_ns >= self._racy_window_ns
+
+
+def _identity(text: str) -> str:
+    return text
+
+
+_CATALOG = ConfigCatalog()
+
+
+def get_config_catalog() -> ConfigCatalog:
+    """Return the process-wide config catalog."""
+    return _CATALOG
@@ -0,0 +1,353 @@
+"""Low-overhead in-process metrics registry.
+
+Counters, gauges and fixed-bucket histograms for the runtime hot paths
+(request queue, tool execution, LLM calls, state saves, history
+compression, active runs), exposed in the Prometheus text format by the
+``GET /metrics`` route.
+
+Design constraints — the instrumentation stays on in production:
+
+- No third-party dependency; pure Python, importable from every layer.
+- Label children are resolved once and cached, so a hot path pays one
+  dict lookup plus an addition (histograms: a ``bisect`` on a short
+  tuple) per observation.
+- No locks. Updates are plain attribute arithmetic on the event loop
+  thread; a concurrent update from a worker thread can at worst lose a
+  single increment, which is acceptable for monitoring data.
+- ``TASKFORCE_METRICS_ENABLED=0`` turns every update into an early
+  return.
+
+Usage::
+
+    from taskforce.core.utils.metrics import get_metrics_registry
+
+    _TOOL_SECONDS = get_metrics_registry().histogram(
+        "taskforce_tool_duration_seconds", "Tool execution latency.", ("tool",)
+    )
+    _TOOL_SECONDS.labels("file_read").observe(0.012)
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from typing import Generic, TypeVar
+
+METRICS_ENABLED_ENV = "TASKFORCE_METRICS_ENABLED"
+
+# Latency buckets (seconds) covering sub-millisecond tool calls up to
+# multi-minute LLM generations.
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _metrics_enabled_from_env() -> bool:
+    return os.environ.get(METRICS_ENABLED_ENV, "1").strip().lower() not in ("0", "false", "no")
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape_label(v)}"' for n, v in zip(names, values, strict=True)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _CounterChild:
+    __slots__ = ("_registry", "value")
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        self._registry = registry
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        if self._registry.enabled:
+            self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("_registry", "value")
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        self._registry = registry
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        if self._registry.enabled:
+            self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        if self._registry.enabled:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        if self._registry.enabled:
+            self.value -= amount
+
+
+class _HistogramChild:
+    __slots__ = ("_registry", "_bounds", "counts", "sum", "count")
+
+    def __init__(self, registry: MetricsRegistry, bounds: tuple[float, ...]) -> None:
+        self._registry = registry
+        self._bounds = bounds
+        # One slot per finite bound plus the +Inf overflow; cumulated at
+        # render time so ``observe`` touches a single slot.
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        if not self._registry.enabled:
+            return
+        self.counts[bisect_left(self._bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+ChildT = TypeVar("ChildT", _CounterChild, _GaugeChild, _HistogramChild)
+
+
+class _Metric(Generic[ChildT]):
+    """A named metric family with a fixed set of label names."""
+
+    kind = ""
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str],
+    ) -> None:
+        self._registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._children: dict[tuple[str, ...], ChildT] = {}
+
+    def _new_child(self) -> ChildT:
+        raise NotImplementedError
+
+    def labels(self, *values: str) -> ChildT:
+        """Return the child for *values* (strings, in label-name order).
+
+        Hot paths should call this per observation rather than caching
+        the child across a :meth:`MetricsRegistry.reset`.
+        """
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.label_names):
+                raise ValueError(
+                    f"{self.name} expects labels {self.label_names}, got {len(values)} values"
+                )
+            child = self._new_child()
+            self._children[values] = child
+        return child
+
+    def _items(self) -> Iterator[tuple[tuple[str, ...], ChildT]]:
+        yield from sorted(self._children.items())
+
+    def render(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric[_CounterChild]):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild(self._registry)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the unlabelled series."""
+        self.labels().inc(amount)
+
+    def render(self) -> list[str]:
+        return [
+            f"{self.name}{_label_text(self.label_names, key)} {_format_value(child.value)}"
+            for key, child in self._items()
+        ]
+
+
+class Gauge(_Metric[_GaugeChild]):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild(self._registry)
+
+    def set(self, value: float) -> None:
+        """Set the unlabelled series."""
+        self.labels().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the unlabelled series."""
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrement the unlabelled series."""
+        self.labels().dec(amount)
+
+    def render(self) -> list[str]:
+        return [
+            f"{self.name}{_label_text(self.label_names, key)} {_format_value(child.value)}"
+            for key, child in self._items()
+        ]
+
+
+class Histogram(_Metric[_HistogramChild]):
+    """Distribution over fixed, upper-inclusive buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(registry, name, documentation, label_names)
+        bounds = tuple(sorted(float(b) for b in buckets if b != math.inf))
+        if not bounds:
+            raise ValueError("histogram needs at least one finite bucket")
+        self.buckets = bounds
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self._registry, self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Observe a value on the unlabelled series."""
+        self.labels().observe(value)
+
+    def render(self) -> list[str]:
+        lines: list[str] = []
+        for key, child in self._items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), child.counts, strict=True):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_label_text(self.label_names, key, le)} {cumulative}"
+                )
+            labels = _label_text(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together.
+
+    Registration is get-or-create, so modules declare their metrics at
+    import time and re-imports (or two modules sharing a family) get the
+    same instance.
+
+    Args:
+        enabled: Whether updates are recorded. Defaults to the
+            ``TASKFORCE_METRICS_ENABLED`` environment variable (on).
+    """
+
+    def __init__(self, enabled: bool | None = None) -> None:
+        self.enabled = _metrics_enabled_from_env() if enabled is None else enabled
+        self._metrics: dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is None:
+            self._metrics[metric.name] = metric
+            return metric
+        if existing.kind != metric.kind or existing.label_names != metric.label_names:
+            raise ValueError(
+                f"Metric {metric.name!r} already registered as {existing.kind} "
+                f"with labels {existing.label_names}"
+            )
+        return existing
+
+    def counter(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        metric = self._register(Counter(self, name, documentation, labels))
+        assert isinstance(metric, Counter)
+        return metric
+
+    def gauge(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        metric = self._register(Gauge(self, name, documentation, labels))
+        assert isinstance(metric, Gauge)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram with fixed *buckets*."""
+        metric = self._register(Histogram(self, name, documentation, labels, buckets))
+        assert isinstance(metric, Histogram)
+        return metric
+
+    def get(self, name: str) -> _Metric | None:
+        """Return a registered metric family by name."""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Render every family in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for name in sorted(self._metrics):
+            metric = self._metrics[name]
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Zero every series while keeping the registered families.
+
+        Module-level metric handles stay valid, which is what tests need.
+        """
+        for metric in self._metrics.values():
+            metric._children.clear()
+
+
+_REGISTRY = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Return the process-wide metrics registry."""
+    return _REGISTRY
@@ -0,0 +1,86 @@
+"""Keyset (cursor) pagination helpers.
+
+A cursor is an opaque, URL-safe token that encodes the sort key of the
+last item on the previous page. The next page starts strictly after that
+key, so pages stay stable while items are inserted or removed elsewhere
+in the ordering — unlike offset paging, where every insert shifts all
+following pages.
+
+Keys are tuples of strings (e.g. ``(archived_at_iso, conversation_id)``);
+the trailing id makes every key unique, so no item is skipped or repeated
+when several share a timestamp.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+from typing import TypeVar
+
+T = TypeVar("T")
+
+PageKey = tuple[str, ...]
+
+
+def encode_cursor(key: PageKey) -> str:
+    """Encode a sort key as an opaque cursor."""
+    raw = json.dumps(list(key), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> PageKey:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        key = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from exc
+    if not isinstance(key, list) or not key or not all(isinstance(p, str) for p in key):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return tuple(key)
+
+
+def page_descending(
+    items: Sequence[T],
+    keys: Sequence[PageKey],
+    *,
+    limit: int | None,
+    cursor: str | None = None,
+    predicate: Callable[[T], bool] | None = None,
+) -> tuple[list[T], str | None]:
+    """Return one newest-first page of ``items``.
+
+    Args:
+        items: Items sorted by ascending key.
+        keys: The sort key of each item, parallel to ``items``.
+        limit: Maximum page size; ``None`` returns everything after the
+            cursor.
+        cursor: Cursor returned with the previous page, or ``None`` for
+            the first page.
+        predicate: Optional filter; non-matching items are skipped
+            without counting towards ``limit``.
+
+    Returns:
+        ``(page, next_cursor)``; ``next_cursor`` is ``None`` on the last
+        page.
+
+    Raises:
+        ValueError: If ``cursor`` is malformed.
+    """
+    position = len(items) if cursor is None else bisect_left(keys, decode_cursor(cursor))
+    page: list[T] = []
+    while position > 0:
+        if limit is not None and len(page) >= limit:
+            return page, encode_cursor(keys[position])
+        position -= 1
+        item = items[position]
+        if predicate is None or predicate(item):
+            page.append(item)
+    return page, None
@@ -5,10 +5,15 @@ Gateway components for unified channel-based agent communication:
 - InboundAdapters: normalize raw webhooks from providers
 - ConversationStore: persist session mappings and chat history
 - RecipientRegistry: track recipients for push notifications
+- BroadcastOutbox: resume interrupted broadcasts after a restart
 - GatewayRegistry: auto-configure components from environment
 """
 
 # --- Stores ---
+from taskforce.infrastructure.communication.broadcast_outbox import (
+    FileBroadcastOutbox,
+    InMemoryBroadcastOutbox,
+)
 from taskforce.infrastructure.communication.gateway_conversation_store import (
     GatewayConversationStore,
     InMemoryGatewayConversationStore,
@@ -40,6 +45,8 @@ __all__ = [
     "InMemoryGatewayConversationStore",
     "FileRecipientRegistry",
     "InMemoryRecipientRegistry",
+    "FileBroadcastOutbox",
+    "InMemoryBroadcastOutbox",
     # Channel adapters
     "TelegramOutboundSender",
     "TeamsOutboundSender",
@@ -0,0 +1,189 @@
+"""Broadcast outbox adapters implementing BroadcastOutboxProtocol.
+
+Persists in-progress broadcasts so a process restart resumes the fan-out
+instead of starting over (duplicate messages) or silently dropping the
+remaining recipients.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from taskforce.core.utils.atomic_io import atomic_write_text
+
+
+class FileBroadcastOutbox:
+    """File-based broadcast outbox.
+
+    One append-only JSONL file per broadcast under
+    ``{work_dir}/outbox/{broadcast_id}.jsonl``: the first line is the
+    broadcast header, every further line one delivery outcome. Appending
+    keeps the cost per delivery constant regardless of broadcast size; a
+    torn last line after a crash is skipped on load (that recipient is
+    simply retried).
+    """
+
+    def __init__(self, work_dir: str = ".taskforce") -> None:
+        self._base_dir = Path(work_dir) / "outbox"
+        self._base_dir.mkdir(parents=True, exist_ok=True)
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._logger = structlog.get_logger()
+
+    async def open(
+        self,
+        *,
+        broadcast_id: str,
+        channel: str,
+        message: str,
+        metadata: dict[str, Any],
+        tenant_id: str | None,
+    ) -> dict[str, tuple[bool, str | None]]:
+        """Start or resume a broadcast. Returns already-recorded outcomes."""
+        path = self._record_path(broadcast_id)
+        async with self._get_lock(broadcast_id):
+            if path.exists():
+                header, outcomes = await asyncio.to_thread(self._load, path)
+                if header is not None:
+                    self._logger.info(
+                        "broadcast_outbox.resumed",
+                        broadcast_id=broadcast_id,
+                        already_handled=len(outcomes),
+                    )
+                    return outcomes
+            header = {
+                "type": "header",
+                "broadcast_id": broadcast_id,
+                "channel": channel,
+                "message": message,
+                "metadata": metadata,
+                "tenant_id": tenant_id,
+                "created_at": datetime.now().isoformat(),
+            }
+            await atomic_write_text(path, json.dumps(header, ensure_ascii=False) + "\n")
+            return {}
+
+    async def record(
+        self, *, broadcast_id: str, recipient_id: str, success: bool, error: str | None
+    ) -> None:
+        """Append the delivery outcome for one recipient."""
+        line = json.dumps(
+            {
+                "type": "result",
+                "recipient_id": recipient_id,
+                "success": success,
+                "error": error,
+            },
+            ensure_ascii=False,
+        )
+        path = self._record_path(broadcast_id)
+        async with self._get_lock(broadcast_id):
+            try:
+                await asyncio.to_thread(self._append, path, line)
+            except OSError as exc:
+                # Worst case on resume this recipient is messaged again.
+                self._logger.error(
+                    "broadcast_outbox.record_failed",
+                    broadcast_id=broadcast_id,
+                    recipient_id=recipient_id,
+                    error=str(exc),
+                )
+
+    async def complete(self, broadcast_id: str) -> None:
+        """Drop the record of a finished broadcast."""
+        async with self._get_lock(broadcast_id):
+            self._record_path(broadcast_id).unlink(missing_ok=True)
+        self._locks.pop(broadcast_id, None)
+
+    async def pending(self) -> list[dict[str, Any]]:
+        """List headers of interrupted broadcasts (oldest first)."""
+        headers: list[dict[str, Any]] = []
+        for path in sorted(self._base_dir.glob("*.jsonl"), key=lambda p: p.stat().st_mtime):
+            header, _ = await asyncio.to_thread(self._load, path)
+            if header is not None:
+                headers.append(header)
+        return headers
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _get_lock(self, key: str) -> asyncio.Lock:
+        if key not in self._locks:
+            self._locks[key] = asyncio.Lock()
+        return self._locks[key]
+
+    def _record_path(self, broadcast_id: str) -> Path:
+        return self._base_dir / f"{broadcast_id.replace('/', '_')}.jsonl"
+
+    @staticmethod
+    def _append(path: Path, line: str) -> None:
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
+
+    def _load(
+        self, path: Path
+    ) -> tuple[dict[str, Any] | None, dict[str, tuple[bool, str | None]]]:
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except OSError as exc:
+            self._logger.error("broadcast_outbox.load_failed", path=str(path), error=str(exc))
+            return None, {}
+        header: dict[str, Any] | None = None
+        outcomes: dict[str, tuple[bool, str | None]] = {}
+        for raw in lines:
+            try:
+                entry = json.loads(raw)
+            except json.JSONDecodeError:
+                continue  # torn write from a crash
+            if entry.get("type") == "header":
+                header = entry
+            elif entry.get("type") == "result":
+                outcomes[entry["recipient_id"]] = (bool(entry["success"]), entry.get("error"))
+        return header, outcomes
+
+
+class InMemoryBroadcastOutbox:
+    """In-memory broadcast outbox for tests."""
+
+    def __init__(self) -> None:
+        self._headers: dict[str, dict[str, Any]] = {}
+        self._outcomes: dict[str, dict[str, tuple[bool, str | None]]] = {}
+
+    async def open(
+        self,
+        *,
+        broadcast_id: str,
+        channel: str,
+        message: str,
+        metadata: dict[str, Any],
+        tenant_id: str | None,
+    ) -> dict[str, tuple[bool, str | None]]:
+        if broadcast_id in self._headers:
+            return dict(self._outcomes[broadcast_id])
+        self._headers[broadcast_id] = {
+            "broadcast_id": broadcast_id,
+            "channel": channel,
+            "message": message,
+            "metadata": metadata,
+            "tenant_id": tenant_id,
+        }
+        self._outcomes[broadcast_id] = {}
+        return {}
+
+    async def record(
+        self, *, broadcast_id: str, recipient_id: str, success: bool, error: str | None
+    ) -> None:
+        self._outcomes.setdefault(broadcast_id, {})[recipient_id] = (success, error)
+
+    async def complete(self, broadcast_id: str) -> None:
+        self._headers.pop(broadcast_id, None)
+        self._outcomes.pop(broadcast_id, None)
+
+    async def pending(self) -> list[dict[str, Any]]:
+        return list(self._headers.values())
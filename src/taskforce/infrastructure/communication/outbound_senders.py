@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import asyncio
 import html
+import json
 import mimetypes
 import re
 from pathlib import Path
@@ -112,6 +113,20 @@ class _TelegramClientError(Exception):
     """Non-retryable Telegram API error (4xx except 429)."""
 
 
+def _telegram_retry_after(body: str) -> float | None:
+    """Extract ``parameters.retry_after`` (seconds) from a Telegram 429 body."""
+    try:
+        payload = json.loads(body)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    retry_after = (payload.get("parameters") or {}).get("retry_after")
+    if isinstance(retry_after, int | float) and retry_after >= 0:
+        return float(retry_after)
+    return None
+
+
 class TelegramOutboundSender:
     """Send messages via the Telegram Bot API.
 
@@ -119,7 +134,10 @@ class TelegramOutboundSender:
     The session is created lazily on first send and closed via ``close()``.
 
     Includes automatic retry with exponential backoff for transient
-    network errors (connection drops, timeouts, DNS issues).
+    network errors (connection drops, timeouts, DNS issues). HTTP 429
+    responses honour Telegram's ``parameters.retry_after`` hint; a hint
+    longer than ``max_retry_after`` fails fast instead of stalling the
+    caller.
     """
 
     def __init__(
@@ -128,12 +146,14 @@ class TelegramOutboundSender:
         *,
         max_retries: int = 3,
         base_backoff: float = 1.0,
+        max_retry_after: float = 60.0,
     ) -> None:
         self._api_base = f"https://api.telegram.org/bot{token}"
         self._base_url = f"{self._api_base}/sendMessage"
         self._session: aiohttp.ClientSession | None = None
         self._max_retries = max_retries
         self._base_backoff = base_backoff
+        self._max_retry_after = max_retry_after
         self._logger = structlog.get_logger()
 
     @property
@@ -243,6 +263,14 @@ class TelegramOutboundSender:
                         last_error = ConnectionError(
                             f"Telegram API returned HTTP {response.status}: {body}"
                         )
+                        if attempt < self._max_retries:
+                            await self._wait_before_retry(
+                                "telegram.send_retry",
+                                attempt=attempt,
+                                status=response.status,
+                                body=body,
+                                recipient_id=recipient_id,
+                            )
                     else:
                         if attempt > 0:
                             self._logger.info(
@@ -390,17 +418,14 @@ class TelegramOutboundSender:
                             # Retryable server-side error: back off before the
                             # next attempt so we don't hammer Telegram.
                             if attempt < self._max_retries:
-                                backoff = self._base_backoff * (2**attempt)
-                                self._logger.warning(
+                                await self._wait_before_retry(
                                     "telegram.send_file_retry",
-                                    attempt=attempt + 1,
-                                    max_retries=self._max_retries,
-                                    backoff_s=backoff,
+                                    attempt=attempt,
                                     status=response.status,
+                                    body=body,
                                     recipient_id=recipient_id,
                                     file=path.name,
                                 )
-                                await asyncio.sleep(backoff)
                         else:
                             if attempt > 0:
                                 self._logger.info(
@@ -474,6 +499,43 @@ class TelegramOutboundSender:
                 recipient_id=recipient_id,
             )
 
+    async def _wait_before_retry(
+        self,
+        event: str,
+        *,
+        attempt: int,
+        status: int,
+        body: str,
+        **log_fields: Any,
+    ) -> None:
+        """Sleep before retrying a 429/5xx response.
+
+        429s wait for Telegram's ``retry_after`` hint when present; other
+        statuses use exponential backoff.
+
+        Raises:
+            _TelegramClientError: If Telegram asks to wait longer than
+                ``max_retry_after`` (flood control — retrying inside this
+                call would only stall the caller).
+        """
+        retry_after = _telegram_retry_after(body) if status == 429 else None
+        if retry_after is not None and retry_after > self._max_retry_after:
+            raise _TelegramClientError(
+                f"Telegram rate limit: retry_after={retry_after:g}s exceeds "
+                f"max_retry_after={self._max_retry_after:g}s"
+            )
+        backoff = retry_after if retry_after is not None else self._base_backoff * (2**attempt)
+        self._logger.warning(
+            event,
+            attempt=attempt + 1,
+            max_retries=self._max_retries,
+            backoff_s=backoff,
+            status=status,
+            rate_limited=retry_after is not None,
+            **log_fields,
+        )
+        await asyncio.sleep(backoff)
+
     async def close(self) -> None:
         """Close the underlying HTTP session."""
         await self._close_session()
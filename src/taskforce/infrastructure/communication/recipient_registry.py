@@ -78,6 +78,15 @@ class FileRecipientRegistry:
             return []
         return [p.stem for p in sorted(channel_dir.glob("*.json"))]
 
+    async def resolve_many(self, *, channel: str) -> dict[str, dict[str, Any]]:
+        """Bulk-load every stored reference on a channel.
+
+        Reads the whole channel directory in one worker thread instead of
+        one lock + one async file open per recipient.
+        """
+        channel_dir = self._base_dir / channel.replace("/", "_")
+        return await asyncio.to_thread(self._read_channel_dir, channel, channel_dir)
+
     async def remove(self, *, channel: str, user_id: str) -> bool:
         """Remove a recipient. Returns True if it existed."""
         path = self._record_path(channel, user_id)
@@ -96,6 +105,26 @@ class FileRecipientRegistry:
             self._locks[key] = asyncio.Lock()
         return self._locks[key]
 
+    def _read_channel_dir(self, channel: str, channel_dir: Path) -> dict[str, dict[str, Any]]:
+        if not channel_dir.exists():
+            return {}
+        references: dict[str, dict[str, Any]] = {}
+        for path in sorted(channel_dir.glob("*.json")):
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError) as exc:
+                self._logger.error(
+                    "recipient_registry.resolve_failed",
+                    channel=channel,
+                    user_id=path.stem,
+                    error=str(exc),
+                )
+                continue
+            reference = payload.get("reference")
+            if reference:
+                references[path.stem] = reference
+        return references
+
     def _record_path(self, channel: str, user_id: str) -> Path:
         safe_channel = channel.replace("/", "_")
         safe_user = user_id.replace("/", "_")
@@ -119,6 +148,9 @@ class InMemoryRecipientRegistry:
     async def list_recipients(self, channel: str) -> list[str]:
         return [uid for (ch, uid) in self._records if ch == channel]
 
+    async def resolve_many(self, *, channel: str) -> dict[str, dict[str, Any]]:
+        return {uid: ref for (ch, uid), ref in self._records.items() if ch == channel}
+
     async def remove(self, *, channel: str, user_id: str) -> bool:
         key = (channel, user_id)
         if key in self._records:
@@ -1,8 +1,9 @@
 """ctxman context-management adapter package.
 
 Infrastructure adapter that implements ``ContextManagerProtocol`` on top
-of the external ctxman REST service, switchable via profile config
-(``context_management.backend: ctxman``).
+of the external ctxman REST service — or its embedded in-process engine
+— switchable via profile config (``context_management.backend: ctxman``,
+``context_management.ctxman.engine: remote | embedded``).
 """
 
 from taskforce.infrastructure.context.ctxman_client import (
@@ -19,6 +20,10 @@ from taskforce.infrastructure.context.ctxman_context_manager import (
     CtxmanConfig,
     CtxmanContextManager,
 )
+from taskforce.infrastructure.context.ctxman_embedded import (
+    EmbeddedCtxmanEngine,
+    get_embedded_engine,
+)
 from taskforce.infrastructure.context.expand_context_ref_tool import (
     ExpandContextRefTool,
 )
@@ -38,9 +43,11 @@ __all__ = [
     "CtxmanIncompleteUnitError",
     "CtxmanPayloadTooLargeError",
     "CtxmanUnavailableError",
+    "EmbeddedCtxmanEngine",
     "ExpandContextRefTool",
     "FrameBinding",
     "RenderResult",
+    "get_embedded_engine",
     "get_frame_binding",
     "set_frame_binding",
 ]
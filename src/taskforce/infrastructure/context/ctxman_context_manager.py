@@ -4,6 +4,9 @@ Subclasses the local ``ContextManager`` to inherit message-list ownership,
 snapshot building, and sub-agent bookkeeping, and replaces the budget
 machinery: compression/eviction/compaction run server-side in ctxman.
 
+The remote is either the ctxman service (``CtxmanClient``) or the
+in-process ``EmbeddedCtxmanEngine``; both expose the same client surface.
+
 Sync protocol methods (``initialize``/``restore``/``append_message``)
 stage work locally; all remote I/O happens in ``prepare_for_llm()``:
 
@@ -36,6 +39,10 @@ from taskforce.infrastructure.context.ctxman_client import (
     CtxmanPayloadTooLargeError,
     new_idempotency_key,
 )
+from taskforce.infrastructure.context.ctxman_embedded import (
+    EmbeddedCtxmanEngine,
+    get_embedded_engine,
+)
 from taskforce.infrastructure.context.frame_binding import FrameBinding
 from taskforce.infrastructure.context.message_segment_mapper import (
     build_static_segments,
@@ -64,11 +71,27 @@ class CtxmanConfig:
     gc_on_hard_watermark: bool = True
     frames_enabled: bool = True
     archive_on_close: bool = True
+    engine: str = "remote"
+    storage_dir: str = ".taskforce/ctxman"
+    default_budget_tokens: int = 128_000
+    retention_hours: float = 24.0
 
     @classmethod
     def from_dict(cls, config: dict[str, Any] | None) -> CtxmanConfig:
         config = config or {}
         frames = config.get("frames") or {}
+        embedded = config.get("embedded") or {}
+        engine = str(config.get("engine", "remote"))
+        if engine not in ("remote", "embedded"):
+            raise ValueError(
+                f"context_management.ctxman.engine must be 'remote' or 'embedded', got: {engine!r}"
+            )
+        provider = str(config.get("provider", cls.provider))
+        if engine == "embedded" and provider != "openai":
+            raise ValueError(
+                "context_management.ctxman.engine 'embedded' renders provider 'openai' only, "
+                f"got: {provider!r}"
+            )
         on_unavailable = str(config.get("on_unavailable", "degrade"))
         if on_unavailable not in ("degrade", "fail"):
             raise ValueError(
@@ -77,7 +100,7 @@ class CtxmanConfig:
             )
         return cls(
             base_url=str(config.get("base_url", cls.base_url)),
-            provider=str(config.get("provider", cls.provider)),
+            provider=provider,
             auth_mode=str(config.get("auth_mode", cls.auth_mode)),
             api_key=os.environ.get("TASKFORCE_CTXMAN_API_KEY") or config.get("api_key"),
             tenant_id=config.get("tenant_id"),
@@ -88,6 +111,12 @@ class CtxmanConfig:
             gc_on_hard_watermark=bool(config.get("gc_on_hard_watermark", cls.gc_on_hard_watermark)),
             frames_enabled=bool(frames.get("enabled", cls.frames_enabled)),
             archive_on_close=bool(config.get("archive_on_close", cls.archive_on_close)),
+            engine=engine,
+            storage_dir=str(embedded.get("storage_dir", cls.storage_dir)),
+            default_budget_tokens=int(
+                embedded.get("default_budget_tokens", cls.default_budget_tokens)
+            ),
+            retention_hours=float(embedded.get("retention_hours", cls.retention_hours)),
         )
 
 
@@ -97,7 +126,7 @@ class CtxmanContextManager(ContextManager):
     def __init__(
         self,
         *,
-        client: CtxmanClient,
+        client: CtxmanClient | EmbeddedCtxmanEngine,
         provider: str = "openai",
         on_unavailable: str = "degrade",
         turn_advance: bool = True,
@@ -752,6 +781,8 @@ def build_ctxman_context_manager_factory(
     The factory consults the task-local frame binding: when a parent
     agent published one (sequential sub-agent spawn), the new adapter
     shares the parent's client and session instead of creating its own.
+    With ``engine: embedded`` every adapter talks to the process-wide
+    in-process engine for ``storage_dir`` instead of the HTTP client.
     """
     from taskforce.infrastructure.context.frame_binding import get_frame_binding
 
@@ -769,14 +800,22 @@ def build_ctxman_context_manager_factory(
                 owns_client=False,
                 **kwargs,
             )
-        client = CtxmanClient(
-            base_url=config.base_url,
-            timeout_seconds=config.timeout_seconds,
-            auth_mode=config.auth_mode,
-            api_key=config.api_key,
-            tenant_id=config.tenant_id,
-            logger=kwargs.get("logger"),
-        )
+        client: CtxmanClient | EmbeddedCtxmanEngine
+        if config.engine == "embedded":
+            client = get_embedded_engine(
+                config.storage_dir,
+                default_budget_tokens=config.default_budget_tokens,
+                retention_hours=config.retention_hours,
+            )
+        else:
+            client = CtxmanClient(
+                base_url=config.base_url,
+                timeout_seconds=config.timeout_seconds,
+                auth_mode=config.auth_mode,
+                api_key=config.api_key,
+                tenant_id=config.tenant_id,
+                logger=kwargs.get("logger"),
+            )
         return CtxmanContextManager(
             client=client,
             provider=config.provider,
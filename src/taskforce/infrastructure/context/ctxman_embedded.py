@@ -0,0 +1,1004 @@
+"""Embedded in-process ctxman engine.
+
+Implements the ``CtxmanClient`` surface (sessions, segments, static
+region, render, refs, frames, gc, events, blobs) in-process, so
+``CtxmanContextManager`` runs unchanged against it
+(``context_management.ctxman.engine: embedded``). Single-box deployments
+get ctxman's context management without two HTTP round trips per
+``prepare_for_llm``; tests get a faithful local stand-in for the service.
+
+Semantics mirror the service where the adapter depends on them:
+
+- **Static region** — tool definitions and the base system prompt are
+  hashed; ``replace_static_segments`` with an identical region is a
+  no-op, so the cache breakpoint after the static region stays stable.
+- **Working segments** — appends are idempotent per batch key, honour
+  ``If-Match`` and are rejected (422) when a user/assistant message
+  follows tool calls that never received a result.
+- **Watermarks** — token counts are computed once per segment at append.
+  Above the soft watermark render elides large tool results (content
+  stays retrievable through ``get_ref``); over budget, or on
+  ``gc(level="major")``, the oldest unprotected units are evicted down to
+  the soft watermark and their content is swept. ``get_ref`` on an
+  evicted segment raises ``CtxmanGoneError`` carrying its summary.
+- **Frames** — LIFO sub-agent frames; ``scope="frame"`` renders only the
+  top frame, and popping a frame evicts its working segments.
+
+Sessions persist under ``storage_dir/<session_id>/``: ``session.json``
+(metadata and segment headers) plus content-addressed ``content/`` files
+written once per distinct content. Writes are coalesced per session and
+run off the event loop; the event feed and the turn counter of a bare
+render are kept in memory only. Archiving releases the in-memory session,
+as does going unused for ``idle_release_seconds`` or falling out of the
+``max_resident_sessions`` most recently used; it is
+reloaded from disk on the next request until ``retention_hours`` pass,
+after which it is swept and reported as gone (410). Sessions that are
+never requested again are swept by a periodic scan of ``storage_dir``.
+
+Summaries are deterministic excerpts — the embedded engine has no
+compaction model.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from taskforce.core.domain.heuristic_token_estimator import HeuristicTokenEstimator
+from taskforce.core.utils.atomic_io import atomic_write_text
+from taskforce.infrastructure.context.ctxman_client import (
+    CtxmanBudgetExceededError,
+    CtxmanConflictError,
+    CtxmanError,
+    CtxmanGoneError,
+    CtxmanIncompleteUnitError,
+    RenderResult,
+)
+
+DEFAULT_STORAGE_DIR = ".taskforce/ctxman"
+
+ROOT_FRAME = "root"
+
+# Watermarks as fractions of the session budget.
+SOFT_WATERMARK = 0.70
+HARD_WATERMARK = 0.85
+EMERGENCY_WATERMARK = 0.95
+
+# Tool results at least this large are elided above the soft watermark.
+ELIDE_MIN_TOKENS = 512
+# The newest units of the rendered scope are never elided or evicted.
+PROTECTED_TAIL_UNITS = 4
+SUMMARY_CHARS = 300
+# Bounded replay window for idempotency keys and the event feed.
+MAX_IDEMPOTENCY_KEYS = 512
+MAX_EVENTS = 1000
+
+# Minimum time between scans of storage_dir for expired sessions.
+SWEEP_INTERVAL_SECONDS = 3600.0
+# In-memory sessions released once unused for this long, or once more
+# are resident (they reload from disk on the next request).
+IDLE_RELEASE_SECONDS = 1800.0
+MAX_RESIDENT_SESSIONS = 1000
+
+_SESSION_FILE = "session.json"
+_CONTENT_DIR = "content"
+_FORMAT_VERSION = 1
+
+_ESTIMATOR = HeuristicTokenEstimator()
+
+logger = structlog.get_logger(__name__)
+
+
+def _content_key(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _summarize(content: str) -> str:
+    text = " ".join(content.split())
+    if len(text) <= SUMMARY_CHARS:
+        return text
+    return text[:SUMMARY_CHARS].rstrip() + " …"
+
+
+def _count_tokens(content: str) -> int:
+    return _ESTIMATOR.count_tokens(content) + _ESTIMATOR.count_message_overhead()
+
+
+@dataclass
+class _Segment:
+    """Header of one working segment; content lives in ``_Session.contents``."""
+
+    segment_id: str
+    kind: str
+    role: str
+    frame_id: str
+    content_key: str
+    tokens: int
+    tool_call_id: str | None = None
+    state: str = "live"  # live | elided | evicted
+    summary: str = ""
+    origin: str | None = None
+    # Content-addressed blob holding the full content when the inline
+    # content is only a stub (``upload_blob`` externalization).
+    blob_key: str | None = None
+
+
+@dataclass
+class _Session:
+    session_id: str
+    budget_tokens: int
+    static_segments: list[dict[str, Any]]
+    static_hash: str
+    static_tokens: int
+    agent_template_id: str | None = None
+    static_epoch: int = 0
+    context_version: int = 0
+    turn: int = 0
+    next_segment: int = 0
+    next_frame: int = 0
+    frames: list[str] = field(default_factory=lambda: [ROOT_FRAME])
+    segments: list[_Segment] = field(default_factory=list)
+    idempotency: OrderedDict[str, Any] = field(default_factory=OrderedDict)
+    contents: dict[str, str] = field(default_factory=dict)
+    events: list[dict[str, Any]] = field(default_factory=list)
+    event_seq: int = 0
+    # Persistence bookkeeping (not serialized).
+    written_contents: set[str] = field(default_factory=set)
+    dirty_generation: int = 0
+    written_generation: int = 0
+    write_task: asyncio.Task[None] | None = None
+    last_used: float = field(default_factory=time.monotonic)
+
+    def segment(self, segment_id: str) -> _Segment | None:
+        for segment in self.segments:
+            if segment.segment_id == segment_id:
+                return segment
+        return None
+
+
+def _static_digest(segments: list[dict[str, Any]]) -> tuple[str, int]:
+    payload = json.dumps(segments, ensure_ascii=False, sort_keys=True)
+    tokens = sum(_count_tokens(str(s.get("content") or "")) for s in segments)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest(), tokens
+
+
+class EmbeddedCtxmanEngine:
+    """In-process implementation of the ctxman ``/v1`` client surface.
+
+    Drop-in for :class:`CtxmanClient`; one engine per storage directory
+    is shared by every adapter in the process (see
+    :func:`get_embedded_engine`), so frame-bound sub-agents and
+    follow-up turns find their sessions.
+
+    Args:
+        storage_dir: Directory holding one sub-directory per session.
+        default_budget_tokens: Budget for sessions created without a
+            ``budget_tokens`` policy override.
+        retention_hours: Sessions untouched for longer are swept on
+            their next lookup, or by the periodic storage scan.
+        idle_release_seconds: Unused time after which a session with
+            nothing left to write is released from memory.
+        max_resident_sessions: Sessions kept in memory at most; the
+            least recently used written ones are released beyond it.
+    """
+
+    def __init__(
+        self,
+        *,
+        storage_dir: str | Path = DEFAULT_STORAGE_DIR,
+        default_budget_tokens: int = 128_000,
+        retention_hours: float = 24.0,
+        idle_release_seconds: float = IDLE_RELEASE_SECONDS,
+        max_resident_sessions: int = MAX_RESIDENT_SESSIONS,
+    ) -> None:
+        self._storage_dir = Path(storage_dir)
+        self._default_budget_tokens = default_budget_tokens
+        self._retention_seconds = retention_hours * 3600
+        self._idle_release_seconds = idle_release_seconds
+        self._max_resident_sessions = max(1, max_resident_sessions)
+        # Least recently used first.
+        self._sessions: OrderedDict[str, _Session] = OrderedDict()
+        self._created: OrderedDict[str, tuple[str, int]] = OrderedDict()
+        self._last_sweep = float("-inf")
+        self._sweep_task: asyncio.Task[None] | None = None
+
+    # ------------------------------------------------------------------
+    # Session lifecycle
+    # ------------------------------------------------------------------
+
+    async def create_session(
+        self,
+        *,
+        static_segments: list[dict[str, Any]],
+        policy_overrides: dict[str, Any] | None = None,
+        agent_template_id: str | None = None,
+        idempotency_key: str | None = None,
+    ) -> tuple[str, int]:
+        """Create a session; returns ``(session_id, context_version)``."""
+        if idempotency_key and idempotency_key in self._created:
+            return self._created[idempotency_key]
+        budget = int((policy_overrides or {}).get("budget_tokens") or self._default_budget_tokens)
+        static = [dict(s) for s in static_segments]
+        static_hash, static_tokens = _static_digest(static)
+        session = _Session(
+            session_id=f"emb-{uuid.uuid4().hex}",
+            budget_tokens=budget,
+            static_segments=static,
+            static_hash=static_hash,
+            static_tokens=static_tokens,
+            agent_template_id=agent_template_id,
+        )
+        self._sessions[session.session_id] = session
+        self._emit(session, "session.created", budget_tokens=budget)
+        await self._persist(session)
+        result = (session.session_id, session.context_version)
+        if idempotency_key:
+            self._remember(self._created, idempotency_key, result)
+        return result
+
+    async def get_session(self, session_id: str) -> dict[str, Any]:
+        session = await self._session(session_id)
+        tokens_total = self._tokens_in_scope(session, "path")
+        return {
+            "session_id": session.session_id,
+            "context_version": session.context_version,
+            "static_epoch": session.static_epoch,
+            "static_hash": session.static_hash,
+            "frames": list(session.frames),
+            "budget_tokens": session.budget_tokens,
+            "tokens_total": tokens_total,
+            "watermark_state": self._watermark(session, tokens_total),
+        }
+
+    async def archive_session(self, session_id: str, *, idempotency_key: str) -> None:
+        """Persist and release the in-memory session (kept on disk)."""
+        session = await self._session(session_id)
+        self._emit(session, "session.archived")
+        await self._persist(session)
+        self._sessions.pop(session_id, None)
+
+    # ------------------------------------------------------------------
+    # Segments
+    # ------------------------------------------------------------------
+
+    async def append_segments(
+        self,
+        session_id: str,
+        segments: list[dict[str, Any]],
+        *,
+        idempotency_key: str,
+        if_match: int | None = None,
+    ) -> tuple[list[str], int]:
+        """Append working segments to the top frame; returns ``(ids, version)``."""
+        session = await self._session(session_id)
+        replay = session.idempotency.get(idempotency_key)
+        if replay is not None:
+            return list(replay["segment_ids"]), int(replay["context_version"])
+        self._check_version(session, if_match)
+        self._check_units(session, segments)
+
+        frame_id = session.frames[-1]
+        ids: list[str] = []
+        for raw in segments:
+            content = str(raw.get("content") or "")
+            key = _content_key(content)
+            session.contents[key] = content
+            blob_ref = raw.get("blob_ref") or {}
+            blob_key = str(blob_ref.get("key", "")).removeprefix("sha256:") or None
+            segment = _Segment(
+                segment_id=f"seg-{session.next_segment}",
+                kind=str(raw.get("kind") or "user_msg"),
+                role=str(raw.get("role") or ""),
+                frame_id=frame_id,
+                content_key=key,
+                tokens=_count_tokens(content),
+                tool_call_id=raw.get("tool_call_id"),
+                origin=raw.get("source"),
+                blob_key=blob_key if blob_key in session.contents else None,
+            )
+            session.next_segment += 1
+            session.segments.append(segment)
+            ids.append(segment.segment_id)
+        session.context_version += 1
+        self._remember(
+            session.idempotency,
+            idempotency_key,
+            {"segment_ids": ids, "context_version": session.context_version},
+        )
+        self._emit(session, "segments.appended", count=len(ids), frame_id=frame_id)
+        await self._persist(session)
+        return ids, session.context_version
+
+    async def replace_static_segments(
+        self,
+        session_id: str,
+        segments: list[dict[str, Any]],
+        *,
+        if_match: int,
+        idempotency_key: str,
+    ) -> dict[str, Any]:
+        """Replace the static region; an identical region is a no-op."""
+        session = await self._session(session_id)
+        self._check_version(session, if_match)
+        static = [dict(s) for s in segments]
+        static_hash, static_tokens = _static_digest(static)
+        if static_hash != session.static_hash:
+            session.static_segments = static
+            session.static_hash = static_hash
+            session.static_tokens = static_tokens
+            session.static_epoch += 1
+            session.context_version += 1
+            self._emit(session, "static.replaced", static_epoch=session.static_epoch)
+            await self._persist(session)
+        return {"static_epoch": session.static_epoch, "context_version": session.context_version}
+
+    async def upload_blob(
+        self,
+        session_id: str,
+        content: bytes,
+        *,
+        content_type: str = "text/plain; charset=utf-8",
+    ) -> dict[str, Any]:
+        """Store a content-addressed blob; returns the ``blob_ref`` dict."""
+        session = await self._session(session_id)
+        text = content.decode("utf-8", errors="replace")
+        key = _content_key(text)
+        session.contents[key] = text
+        await self._persist(session)
+        return {"store": "embedded", "key": f"sha256:{key}", "size_bytes": len(content)}
+
+    # ------------------------------------------------------------------
+    # Render
+    # ------------------------------------------------------------------
+
+    async def render(
+        self,
+        session_id: str,
+        *,
+        provider: str,
+        scope: str = "path",
+        turn_advance: bool = True,
+        idempotency_key: str | None = None,
+    ) -> RenderResult:
+        """Render the scope as OpenAI messages, eliding/evicting per watermark.
+
+        Raises:
+            CtxmanError: For providers other than ``openai``.
+            CtxmanBudgetExceededError: Still over budget after emergency
+                eviction (retryable after a major GC).
+        """
+        if provider != "openai":
+            raise CtxmanError(f"embedded ctxman renders provider 'openai' only, got {provider!r}")
+        session = await self._session(session_id)
+        changed = False
+        tokens_total = self._tokens_in_scope(session, scope)
+        if tokens_total >= session.budget_tokens * SOFT_WATERMARK:
+            changed |= self._elide(session, scope)
+            tokens_total = self._tokens_in_scope(session, scope)
+        if tokens_total > session.budget_tokens:
+            changed |= self._evict(session, scope)
+            tokens_total = self._tokens_in_scope(session, scope)
+            if tokens_total > session.budget_tokens:
+                if changed:
+                    await self._persist(session)
+                raise CtxmanBudgetExceededError(
+                    f"{tokens_total} tokens exceed budget {session.budget_tokens} "
+                    "after emergency eviction"
+                )
+        if turn_advance:
+            session.turn += 1
+        if changed:
+            session.context_version += 1
+        watermark = self._watermark(session, tokens_total)
+        self._emit(session, "render", tokens_total=tokens_total, watermark_state=watermark)
+        if changed:
+            await self._persist(session)
+        return RenderResult(
+            messages=self._render_messages(session, scope),
+            system=self._static_system(session),
+            tools=[
+                json.loads(s["content"])
+                for s in session.static_segments
+                if s.get("kind") == "tool_def"
+            ],
+            builtin_tools=[],
+            context_version=session.context_version,
+            tokens_total=tokens_total,
+            watermark_state=watermark,
+            cache_breakpoints=[
+                {
+                    "after": "static",
+                    "static_hash": session.static_hash,
+                    "static_epoch": session.static_epoch,
+                }
+            ],
+        )
+
+    # ------------------------------------------------------------------
+    # Refs (page faults)
+    # ------------------------------------------------------------------
+
+    async def get_ref(self, session_id: str, segment_id: str) -> dict[str, Any]:
+        """Return the full content of a segment.
+
+        Raises:
+            CtxmanGoneError: The segment was evicted (summary attached).
+            CtxmanError: Unknown segment.
+        """
+        session = await self._session(session_id)
+        segment = session.segment(segment_id)
+        if segment is None:
+            raise CtxmanError(f"unknown segment {segment_id!r}")
+        if segment.state == "evicted":
+            raise CtxmanGoneError(
+                f"segment {segment_id} was evicted",
+                summary=segment.summary,
+                origin=segment.origin,
+            )
+        content = session.contents.get(segment.blob_key or segment.content_key, "")
+        return {"content": content, "content_type": "text/plain"}
+
+    # ------------------------------------------------------------------
+    # Frames
+    # ------------------------------------------------------------------
+
+    async def push_frame(self, session_id: str, label: str, *, idempotency_key: str) -> str:
+        session = await self._session(session_id)
+        replay = session.idempotency.get(idempotency_key)
+        if replay is not None:
+            return str(replay["frame_id"])
+        frame_id = f"frame-{session.next_frame}"
+        session.next_frame += 1
+        session.frames.append(frame_id)
+        session.context_version += 1
+        self._remember(session.idempotency, idempotency_key, {"frame_id": frame_id})
+        self._emit(session, "frame.pushed", frame_id=frame_id, label=label)
+        await self._persist(session)
+        return frame_id
+
+    async def pop_frame(
+        self,
+        session_id: str,
+        frame_id: str,
+        *,
+        return_content: str,
+        return_kind: str | None = None,
+        idempotency_key: str,
+    ) -> dict[str, Any]:
+        """Pop the top frame: evict its segments, record the return value.
+
+        Raises:
+            CtxmanConflictError: *frame_id* is not the top frame.
+        """
+        session = await self._session(session_id)
+        replay = session.idempotency.get(idempotency_key)
+        if replay is not None:
+            return dict(replay)
+        if len(session.frames) < 2 or session.frames[-1] != frame_id:
+            raise CtxmanConflictError(
+                f"frame {frame_id!r} is not the top frame",
+                context_version=session.context_version,
+            )
+        session.frames.pop()
+        for segment in session.segments:
+            if segment.frame_id == frame_id and segment.state != "evicted":
+                self._evict_segment(session, segment)
+        key = _content_key(return_content)
+        session.contents[key] = return_content
+        returned = _Segment(
+            segment_id=f"seg-{session.next_segment}",
+            kind=return_kind or "frame_return",
+            role="tool",
+            frame_id=session.frames[-1],
+            content_key=key,
+            tokens=0,
+            origin=f"frame:{frame_id}",
+        )
+        session.next_segment += 1
+        session.segments.append(returned)
+        session.context_version += 1
+        result = {
+            "return_segment_id": returned.segment_id,
+            "context_version": session.context_version,
+        }
+        self._remember(session.idempotency, idempotency_key, result)
+        self._emit(session, "frame.popped", frame_id=frame_id)
+        self._sweep_contents(session)
+        await self._persist(session)
+        return result
+
+    # ------------------------------------------------------------------
+    # GC / events
+    # ------------------------------------------------------------------
+
+    async def gc(self, session_id: str, *, level: str = "minor") -> str:
+        """Run GC synchronously: ``minor`` elides, ``major`` also evicts."""
+        session = await self._session(session_id)
+        changed = self._elide(session, "path")
+        if level == "major":
+            changed |= self._evict(session, "path")
+        if changed:
+            session.context_version += 1
+        job_id = f"gc-{uuid.uuid4().hex[:12]}"
+        self._emit(session, "gc", level=level, job_id=job_id, changed=changed)
+        await self._persist(session)
+        return job_id
+
+    async def get_events(self, session_id: str, *, after_seq: int = -1) -> list[dict[str, Any]]:
+        session = await self._session(session_id)
+        return [dict(e) for e in session.events if e["seq"] > after_seq]
+
+    async def stream_events(
+        self,
+        session_id: str,
+        *,
+        after_seq: int = -1,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield the events after *after_seq*, then complete (like the SSE snapshot)."""
+        for event in await self.get_events(session_id, after_seq=after_seq):
+            yield event
+
+    async def aclose(self) -> None:
+        """No-op: the engine outlives the adapters that share it."""
+
+    # ------------------------------------------------------------------
+    # Validation
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _check_version(session: _Session, if_match: int | None) -> None:
+        if if_match is not None and if_match != session.context_version:
+            raise CtxmanConflictError(
+                f"If-Match {if_match} does not match context_version "
+                f"{session.context_version}",
+                context_version=session.context_version,
+            )
+
+    @staticmethod
+    def _check_units(session: _Session, batch: list[dict[str, Any]]) -> None:
+        """Reject a batch that leaves tool calls unanswered before a new message.
+
+        A call may stay open across batches (the parent's agent-tool call
+        while a sub-agent frame runs), but a user or assistant message may
+        not follow calls whose results never arrive.
+        """
+        frame_id = session.frames[-1]
+        sequence: list[tuple[str, str | None]] = [
+            (s.kind, s.tool_call_id)
+            for s in session.segments
+            if s.frame_id == frame_id and s.state != "evicted"
+        ]
+        sequence.extend((str(s.get("kind") or ""), s.get("tool_call_id")) for s in batch)
+        answered = {call_id for kind, call_id in sequence if kind == "tool_result"}
+        open_ids: list[str] = []
+        pending: list[str] = []
+        for kind, call_id in sequence:
+            if kind == "tool_call" and call_id and call_id not in answered:
+                pending.append(call_id)
+            elif kind in ("user_msg", "assistant_msg") and pending:
+                open_ids.extend(pending)
+                pending = []
+        if open_ids:
+            raise CtxmanIncompleteUnitError(
+                "tool calls without results precede a new message",
+                open_tool_call_ids=open_ids,
+            )
+
+    # ------------------------------------------------------------------
+    # Rendering helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _in_scope(session: _Session, scope: str) -> list[_Segment]:
+        frames = {session.frames[-1]} if scope == "frame" else set(session.frames)
+        return [
+            s
+            for s in session.segments
+            if s.state != "evicted" and s.frame_id in frames and s.kind != "frame_return"
+        ]
+
+    def _tokens_in_scope(self, session: _Session, scope: str) -> int:
+        return session.static_tokens + sum(
+            self._rendered_tokens(s) for s in self._in_scope(session, scope)
+        )
+
+    @classmethod
+    def _rendered_tokens(cls, segment: _Segment) -> int:
+        if segment.state == "elided":
+            return _count_tokens(cls._elided_stub(segment))
+        return segment.tokens
+
+    @staticmethod
+    def _watermark(session: _Session, tokens_total: int) -> str:
+        ratio = tokens_total / max(1, session.budget_tokens)
+        if ratio >= EMERGENCY_WATERMARK:
+            return "emergency"
+        if ratio >= HARD_WATERMARK:
+            return "hard"
+        if ratio >= SOFT_WATERMARK:
+            return "soft"
+        return "ok"
+
+    @staticmethod
+    def _elided_stub(segment: _Segment) -> str:
+        return (
+            f"[elided {segment.tokens} tokens — call expand_context_ref with "
+            f"segment_id={segment.segment_id!r} for the full content] {segment.summary}"
+        )
+
+    @staticmethod
+    def _static_system(session: _Session) -> str:
+        for segment in session.static_segments:
+            if segment.get("kind") == "system_prompt":
+                return str(segment.get("content") or "")
+        return ""
+
+    def _units(self, session: _Session, scope: str) -> list[list[_Segment]]:
+        """Group the scope into message units (user msg, or assistant + results)."""
+        units: list[list[_Segment]] = []
+        by_call: dict[str, list[_Segment]] = {}
+        for segment in self._in_scope(session, scope):
+            if segment.kind == "tool_result":
+                unit = by_call.get(segment.tool_call_id or "")
+                if unit is not None:
+                    unit.append(segment)
+                continue
+            continues_assistant = (
+                segment.kind == "tool_call"
+                and units
+                and units[-1][-1].kind in ("assistant_msg", "tool_call")
+            )
+            if continues_assistant:
+                units[-1].append(segment)
+            else:
+                units.append([segment])
+            if segment.kind == "tool_call" and segment.tool_call_id:
+                by_call[segment.tool_call_id] = units[-1]
+        return units
+
+    def _render_messages(self, session: _Session, scope: str) -> list[dict[str, Any]]:
+        messages: list[dict[str, Any]] = []
+        for unit in self._units(session, scope):
+            head = unit[0]
+            if head.kind not in ("assistant_msg", "tool_call"):
+                role = "user" if head.kind == "user_msg" else head.role or "user"
+                messages.append({"role": role, "content": self._text(session, head)})
+                continue
+            content = self._text(session, head) if head.kind == "assistant_msg" else ""
+            results = {s.tool_call_id: s for s in unit if s.kind == "tool_result"}
+            calls = [s for s in unit if s.kind == "tool_call" and s.tool_call_id in results]
+            if not calls and not content:
+                continue
+            message: dict[str, Any] = {"role": "assistant", "content": content}
+            if calls:
+                message["tool_calls"] = [self._tool_call(session, call) for call in calls]
+            messages.append(message)
+            for call in calls:
+                result = results[call.tool_call_id]
+                messages.append(
+                    {
+                        "role": "tool",
+                        "tool_call_id": call.tool_call_id,
+                        "content": self._text(session, result),
+                    }
+                )
+        return messages
+
+    def _text(self, session: _Session, segment: _Segment) -> str:
+        if segment.state == "elided":
+            return self._elided_stub(segment)
+        return session.contents.get(segment.content_key, "")
+
+    def _tool_call(self, session: _Session, segment: _Segment) -> dict[str, Any]:
+        try:
+            payload = json.loads(session.contents.get(segment.content_key, "") or "{}")
+        except json.JSONDecodeError:
+            payload = {}
+        arguments = payload.get("arguments")
+        if not isinstance(arguments, str):
+            arguments = json.dumps(arguments or {}, ensure_ascii=False)
+        return {
+            "id": segment.tool_call_id,
+            "type": "function",
+            "function": {"name": payload.get("name") or "", "arguments": arguments},
+        }
+
+    # ------------------------------------------------------------------
+    # Watermark GC
+    # ------------------------------------------------------------------
+
+    def _evictable_units(self, session: _Session, scope: str) -> list[list[_Segment]]:
+        """Units eligible for elision/eviction, oldest first.
+
+        The first user message (the mission) and the newest
+        :data:`PROTECTED_TAIL_UNITS` units are pinned.
+        """
+        units = self._units(session, scope)
+        candidates = units[: max(0, len(units) - PROTECTED_TAIL_UNITS)]
+        if candidates and candidates[0][0].kind == "user_msg":
+            candidates = candidates[1:]
+        return candidates
+
+    def _target_tokens(self, session: _Session) -> int:
+        return int(session.budget_tokens * SOFT_WATERMARK)
+
+    def _elide(self, session: _Session, scope: str) -> bool:
+        changed = False
+        target = self._target_tokens(session)
+        tokens_total = self._tokens_in_scope(session, scope)
+        for unit in self._evictable_units(session, scope):
+            if tokens_total < target:
+                break
+            for segment in unit:
+                if (
+                    segment.kind == "tool_result"
+                    and segment.state == "live"
+                    and segment.tokens >= ELIDE_MIN_TOKENS
+                ):
+                    segment.summary = _summarize(session.contents.get(segment.content_key, ""))
+                    segment.state = "elided"
+                    tokens_total -= segment.tokens - self._rendered_tokens(segment)
+                    changed = True
+        if changed:
+            self._emit(session, "segments.elided", tokens_total=tokens_total)
+        return changed
+
+    def _evict(self, session: _Session, scope: str) -> bool:
+        changed = False
+        target = self._target_tokens(session)
+        tokens_total = self._tokens_in_scope(session, scope)
+        for unit in self._evictable_units(session, scope):
+            if tokens_total <= target:
+                break
+            for segment in unit:
+                tokens_total -= self._rendered_tokens(segment)
+                self._evict_segment(session, segment)
+            changed = True
+        if changed:
+            self._sweep_contents(session)
+            self._emit(session, "segments.evicted", tokens_total=tokens_total)
+        return changed
+
+    @staticmethod
+    def _evict_segment(session: _Session, segment: _Segment) -> None:
+        if not segment.summary:
+            segment.summary = _summarize(session.contents.get(segment.content_key, ""))
+        segment.state = "evicted"
+
+    @staticmethod
+    def _sweep_contents(session: _Session) -> None:
+        """Drop content no live, elided or frame-return segment references."""
+        referenced: set[str] = set()
+        for segment in session.segments:
+            if segment.state != "evicted":
+                referenced.add(segment.content_key)
+                if segment.blob_key:
+                    referenced.add(segment.blob_key)
+        for key in [k for k in session.contents if k not in referenced]:
+            del session.contents[key]
+
+    # ------------------------------------------------------------------
+    # Events / idempotency
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _emit(session: _Session, event_type: str, **data: Any) -> None:
+        session.event_seq += 1
+        session.events.append(
+            {
+                "seq": session.event_seq,
+                "type": event_type,
+                "at": time.time(),
+                "context_version": session.context_version,
+                **data,
+            }
+        )
+        if len(session.events) > MAX_EVENTS:
+            del session.events[: len(session.events) - MAX_EVENTS]
+
+    @staticmethod
+    def _remember(store: OrderedDict[str, Any], key: str, value: Any) -> None:
+        store[key] = value
+        while len(store) > MAX_IDEMPOTENCY_KEYS:
+            store.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _session_dir(self, session_id: str) -> Path:
+        return self._storage_dir / session_id
+
+    async def _session(self, session_id: str) -> _Session:
+        session = self._sessions.get(session_id)
+        if session is None:
+            loaded = await asyncio.to_thread(self._load, session_id)
+            if loaded is None:
+                raise CtxmanGoneError(f"session {session_id} not found", origin="embedded")
+            # Another coroutine may have loaded it while this one waited.
+            session = self._sessions.setdefault(session_id, loaded)
+        session.last_used = time.monotonic()
+        self._sessions.move_to_end(session_id)
+        return session
+
+    def _load(self, session_id: str) -> _Session | None:
+        directory = self._session_dir(session_id)
+        path = directory / _SESSION_FILE
+        if "/" in session_id or "\\" in session_id or not path.is_file():
+            return None
+        if time.time() - path.stat().st_mtime > self._retention_seconds:
+            shutil.rmtree(directory, ignore_errors=True)
+            logger.info("ctxman_embedded.session_expired", session_id=session_id)
+            return None
+        data = json.loads(path.read_text(encoding="utf-8"))
+        segments = [_Segment(**s) for s in data.pop("segments")]
+        idempotency = OrderedDict(data.pop("idempotency"))
+        data.pop("format_version", None)
+        session = _Session(**data, segments=segments, idempotency=idempotency)
+        content_dir = directory / _CONTENT_DIR
+        keys = {s.content_key for s in segments if s.state != "evicted"}
+        keys.update(s.blob_key for s in segments if s.blob_key and s.state != "evicted")
+        for key in keys:
+            content_path = content_dir / key
+            if content_path.is_file():
+                session.contents[key] = content_path.read_text(encoding="utf-8")
+        session.written_contents = set(session.contents)
+        return session
+
+    def _serialize(self, session: _Session) -> str:
+        return json.dumps(
+            {
+                "format_version": _FORMAT_VERSION,
+                "session_id": session.session_id,
+                "budget_tokens": session.budget_tokens,
+                "static_segments": session.static_segments,
+                "static_hash": session.static_hash,
+                "static_tokens": session.static_tokens,
+                "agent_template_id": session.agent_template_id,
+                "static_epoch": session.static_epoch,
+                "context_version": session.context_version,
+                "turn": session.turn,
+                "next_segment": session.next_segment,
+                "next_frame": session.next_frame,
+                "frames": session.frames,
+                "segments": [vars(s) for s in session.segments],
+                "idempotency": list(session.idempotency.items()),
+                "event_seq": session.event_seq,
+            },
+            ensure_ascii=False,
+        )
+
+    async def _persist(self, session: _Session) -> None:
+        """Write the session to disk, coalescing concurrent requests.
+
+        A caller arriving while a write is in flight only bumps the dirty
+        generation and awaits the in-flight write, which loops until the
+        newest generation is on disk. Every caller therefore returns once
+        its changes are durable (or sees the write error), and
+        ``session.json`` is never overwritten by an older snapshot.
+        """
+        session.dirty_generation += 1
+        loop = asyncio.get_running_loop()
+        if not _live_task(session.write_task, loop):
+            session.write_task = loop.create_task(self._write_session(session))
+        self._release_idle()
+        self._schedule_sweep()
+        # Shielded: a cancelled caller must not abort the shared write.
+        await asyncio.shield(session.write_task)
+
+    async def _write_session(self, session: _Session) -> None:
+        while session.written_generation < session.dirty_generation:
+            generation = session.dirty_generation
+            header = self._serialize(session)
+            new_contents = {
+                key: text
+                for key, text in session.contents.items()
+                if key not in session.written_contents
+            }
+            live = set(session.contents)
+            directory = self._session_dir(session.session_id)
+            await asyncio.to_thread(
+                lambda directory=directory: (directory / _CONTENT_DIR).mkdir(
+                    parents=True, exist_ok=True
+                )
+            )
+            for key, text in new_contents.items():
+                await atomic_write_text(directory / _CONTENT_DIR / key, text)
+            await atomic_write_text(directory / _SESSION_FILE, header)
+            swept = session.written_contents - live
+            if swept:
+                await asyncio.to_thread(_unlink_contents, directory / _CONTENT_DIR, swept)
+            session.written_contents = (session.written_contents | set(new_contents)) - swept
+            session.written_generation = generation
+
+    def _release_idle(self) -> None:
+        """Drop idle or surplus sessions from memory; they stay on disk.
+
+        Sessions with a pending or failed write are kept so no change is
+        lost.
+        """
+        cutoff = time.monotonic() - self._idle_release_seconds
+        surplus = len(self._sessions) - self._max_resident_sessions
+        for session_id, session in list(self._sessions.items()):
+            if session.last_used > cutoff and surplus <= 0:
+                break  # the rest were used more recently
+            written = session.written_generation == session.dirty_generation
+            if written and (session.write_task is None or session.write_task.done()):
+                del self._sessions[session_id]
+                surplus -= 1
+
+    def _schedule_sweep(self) -> None:
+        """Start a background scan for expired sessions, at most once per interval."""
+        loop = asyncio.get_running_loop()
+        # A task of a closed loop never finishes; do not wait on it.
+        if _live_task(self._sweep_task, loop):
+            return
+        now = time.monotonic()
+        if now - self._last_sweep < min(SWEEP_INTERVAL_SECONDS, self._retention_seconds):
+            return
+        self._last_sweep = now
+        self._sweep_task = loop.create_task(
+            asyncio.to_thread(self._sweep_expired, set(self._sessions))
+        )
+
+    def _sweep_expired(self, active: set[str]) -> None:
+        """Remove session directories untouched for longer than the retention."""
+        cutoff = time.time() - self._retention_seconds
+        try:
+            directories = list(os.scandir(self._storage_dir))
+        except OSError:
+            return
+        for entry in directories:
+            if entry.name in active or not entry.is_dir():
+                continue
+            try:
+                expired = os.stat(Path(entry.path) / _SESSION_FILE).st_mtime < cutoff
+            except OSError:
+                continue
+            if expired:
+                shutil.rmtree(entry.path, ignore_errors=True)
+                logger.info("ctxman_embedded.session_expired", session_id=entry.name)
+
+
+def _live_task(task: asyncio.Task[None] | None, loop: asyncio.AbstractEventLoop) -> bool:
+    """Whether *task* is still running on *loop*."""
+    return task is not None and not task.done() and task.get_loop() is loop
+
+
+def _unlink_contents(content_dir: Path, keys: set[str]) -> None:
+    for key in keys:
+        (content_dir / key).unlink(missing_ok=True)
+
+
+_ENGINES: dict[Path, EmbeddedCtxmanEngine] = {}
+
+
+def get_embedded_engine(
+    storage_dir: str | Path = DEFAULT_STORAGE_DIR,
+    *,
+    default_budget_tokens: int = 128_000,
+    retention_hours: float = 24.0,
+) -> EmbeddedCtxmanEngine:
+    """Return the process-wide engine for *storage_dir* (created on first use)."""
+    key = Path(storage_dir).resolve()
+    engine = _ENGINES.get(key)
+    if engine is None:
+        engine = EmbeddedCtxmanEngine(
+            storage_dir=key,
+            default_budget_tokens=default_budget_tokens,
+            retention_hours=retention_hours,
+        )
+        _ENGINES[key] = engine
+    return engine
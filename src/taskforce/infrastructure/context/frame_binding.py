@@ -19,13 +19,14 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from taskforce.infrastructure.context.ctxman_client import CtxmanClient
+    from taskforce.infrastructure.context.ctxman_embedded import EmbeddedCtxmanEngine
 
 
 @dataclass(frozen=True)
 class FrameBinding:
     """Shared-session binding handed from parent to sub-agent."""
 
-    client: CtxmanClient
+    client: CtxmanClient | EmbeddedCtxmanEngine
     session_id: str
     frame_id: str
 
@@ -0,0 +1,309 @@
+"""Debounce and coalesce raw watchdog callbacks into file changes.
+
+Internal helper for :class:`FileWatcherEventSource`. Not part of the
+public API.
+
+One editor save or ``git checkout`` produces anything from a handful to
+thousands of raw watchdog callbacks. :class:`FileEventCoalescer` keeps
+one :class:`_PathState` per path and only reports it once the path has
+been quiet for ``debounce_seconds`` (or has been changing for
+``max_wait_seconds``, so a file that is written continuously still
+reports). What is reported is the *net* effect of the sequence:
+
+- created → modified … → ``created``
+- created → deleted → nothing (temporary file)
+- deleted → created, or rename away → create → ``modified``
+  (vim-style save with a backup file)
+- temporary file renamed onto a path → ``modified`` for that path
+  (atomic save)
+- rename of an existing file → ``moved`` with ``src_path``; split into
+  ``deleted`` + ``created`` when ``moved`` is not a watched change type
+- ``modified`` on directories is dropped — the children report
+
+While more than ``batch_threshold`` paths are pending the coalescer is
+in bulk mode: nothing is reported until the whole storm has been quiet
+for ``debounce_seconds`` (or ``max_wait_seconds`` have passed since it
+started), and then everything goes out as one :class:`FileChangeBatch`.
+Emissions draw from a budget that refills at ``max_events_per_minute``
+and also covers batches, so a storm can never emit more than that many
+events per minute; when the budget is exhausted pending paths keep
+absorbing callbacks and are reported with the next batch.
+
+The coalescer does no I/O and takes ``now`` from the caller, so recorded
+event storms can be replayed deterministically.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+
+CHANGE_TYPES = ("created", "modified", "deleted", "moved")
+
+
+@dataclass(frozen=True)
+class FileChange:
+    """Net change of one path after its quiet window."""
+
+    path: str
+    change_type: str
+    is_directory: bool
+    src_path: str | None = None
+
+
+@dataclass(frozen=True)
+class FileChangeBatch:
+    """Many changes reported together as one event."""
+
+    root: str
+    changes: tuple[FileChange, ...]
+    counts: dict[str, int]
+    truncated: int = 0
+
+
+@dataclass
+class _PathState:
+    """What happened to one path since it was last reported."""
+
+    existed_before: bool
+    exists_now: bool
+    is_directory: bool
+    first_seen: float
+    last_seen: float
+    # Dest of a rename points at the source (and vice versa) so both
+    # halves are reported together.
+    partner: str | None = None
+    renamed_from: str | None = None
+
+
+@dataclass
+class FileEventCoalescer:
+    """Per-path debouncing, sequence collapsing, batching and rate capping."""
+
+    debounce_seconds: float = 0.5
+    max_wait_seconds: float = 5.0
+    batch_threshold: int = 20
+    max_events_per_minute: int = 120
+    max_batch_paths: int = 1000
+    change_types: tuple[str, ...] = ("created", "modified", "deleted")
+    _states: dict[str, _PathState] = field(default_factory=dict, init=False, repr=False)
+    _budget: float = field(default=0.0, init=False, repr=False)
+    _budget_updated: float | None = field(default=None, init=False, repr=False)
+    _blocked_until: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        unknown = set(self.change_types) - set(CHANGE_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown change_types: {sorted(unknown)}")
+        self.batch_threshold = max(1, self.batch_threshold)
+        self.max_events_per_minute = max(1, self.max_events_per_minute)
+        self._budget = float(self._capacity)
+
+    @property
+    def pending(self) -> int:
+        return len(self._states)
+
+    @property
+    def _capacity(self) -> int:
+        return min(self.batch_threshold, self.max_events_per_minute)
+
+    def add(
+        self,
+        change_type: str,
+        path: str,
+        is_directory: bool,
+        now: float,
+        *,
+        dest_path: str | None = None,
+    ) -> bool:
+        """Record one raw watchdog callback; return True if nothing was pending before."""
+        was_idle = not self._states
+        if change_type == "modified":
+            if is_directory:
+                return False
+            state = self._touch(path, is_directory, now, existed=True)
+            state.exists_now = True
+        elif change_type == "created":
+            state = self._touch(path, is_directory, now, existed=False)
+            state.exists_now = True
+        elif change_type == "deleted":
+            state = self._touch(path, is_directory, now, existed=True)
+            state.exists_now = False
+        elif change_type == "moved" and dest_path is not None:
+            self._add_move(path, dest_path, is_directory, now)
+        else:
+            return False
+        return was_idle
+
+    def _add_move(self, src: str, dest: str, is_directory: bool, now: float) -> None:
+        source = self._touch(src, is_directory, now, existed=True)
+        source.exists_now = False
+        if source.existed_before:
+            origin: str | None = src
+        elif source.renamed_from is not None:  # chained rename a → b → c
+            origin = source.renamed_from
+        else:  # temp file written in this window
+            origin = None
+        # An atomic save renames a fresh temp file over the real one, so
+        # the destination counts as pre-existing and reports "modified".
+        target = self._touch(dest, is_directory, now, existed=origin is None)
+        target.exists_now = True
+        self._unlink(source)
+        self._unlink(target)
+        if origin is not None and origin in self._states:
+            target.renamed_from = origin
+            target.partner = origin
+            self._states[origin].partner = dest
+            self._states[origin].last_seen = now
+
+    def _touch(self, path: str, is_directory: bool, now: float, *, existed: bool) -> _PathState:
+        state = self._states.get(path)
+        if state is None:
+            state = _PathState(
+                existed_before=existed,
+                exists_now=existed,
+                is_directory=is_directory,
+                first_seen=now,
+                last_seen=now,
+            )
+            self._states[path] = state
+        state.last_seen = now
+        state.is_directory = state.is_directory or is_directory
+        return state
+
+    def _unlink(self, state: _PathState) -> None:
+        if state.partner is not None:
+            partner = self._states.get(state.partner)
+            if partner is not None:
+                partner.partner = None
+                partner.renamed_from = None
+            state.partner = None
+            state.renamed_from = None
+
+    def next_deadline(self) -> float | None:
+        """Monotonic time at which :meth:`flush` may report something."""
+        if not self._states:
+            return None
+        if self._bulk:
+            earliest = self._bulk_due_at()
+        else:
+            earliest = min(self._due_at(s) for s in self._states.values())
+        return max(earliest, self._blocked_until)
+
+    @property
+    def _bulk(self) -> bool:
+        return len(self._states) > self.batch_threshold
+
+    def _bulk_due_at(self) -> float:
+        """During a storm everything waits for the storm to go quiet."""
+        states = self._states.values()
+        return min(
+            max(s.last_seen for s in states) + self.debounce_seconds,
+            min(s.first_seen for s in states) + self.max_wait_seconds,
+        )
+
+    def _due_at(self, state: _PathState) -> float:
+        """When ``state`` (and the other half of its rename) may be reported."""
+        due = self._quiet_at(state)
+        partner = self._states.get(state.partner) if state.partner else None
+        return max(due, self._quiet_at(partner)) if partner is not None else due
+
+    def _quiet_at(self, state: _PathState) -> float:
+        return min(
+            state.last_seen + self.debounce_seconds,
+            state.first_seen + self.max_wait_seconds,
+        )
+
+    def flush(self, now: float) -> list[FileChange | FileChangeBatch]:
+        """Report every path whose quiet window has elapsed."""
+        if not self._states or now < self._blocked_until:
+            return []
+        self._refill(now)
+        if self._bulk:
+            due = list(self._states) if self._bulk_due_at() <= now else []
+        else:
+            due = [path for path, state in self._states.items() if self._due_at(state) <= now]
+        if not due:
+            return []
+
+        changes = self._net_changes(due)
+        available = int(self._budget + 1e-9)  # float drift from refills
+        if len(changes) > min(self.batch_threshold, available):
+            if available < 1:
+                # Out of budget: keep absorbing callbacks until one event
+                # may be sent, then report everything as one batch.
+                self._blocked_until = now + (1 - self._budget) * 60 / self.max_events_per_minute
+                return []
+            result: list[FileChange | FileChangeBatch] = [self._batch(changes)]
+        else:
+            result = list(changes)
+        for path in due:
+            del self._states[path]
+        self._budget -= len(result)
+        return result
+
+    def _refill(self, now: float) -> None:
+        if self._budget_updated is not None:
+            elapsed = now - self._budget_updated
+            self._budget = min(
+                float(self._capacity),
+                self._budget + elapsed * self.max_events_per_minute / 60,
+            )
+        self._budget_updated = now
+
+    def _net_changes(self, paths: list[str]) -> list[FileChange]:
+        allowed = set(self.change_types)
+        folded = {
+            self._states[p].renamed_from
+            for p in paths
+            if self._states[p].renamed_from is not None
+            and "moved" in allowed
+            and self._is_rename(self._states[p])
+        }
+        changes: list[FileChange] = []
+        for path in paths:
+            if path in folded:
+                continue
+            change = self._net_change(path, self._states[path])
+            if change is None:
+                continue
+            if change.change_type == "moved" and "moved" not in allowed:
+                change = FileChange(path, "created", change.is_directory)
+            if change.change_type in allowed:
+                changes.append(change)
+        return changes
+
+    def _is_rename(self, state: _PathState) -> bool:
+        origin = self._states.get(state.renamed_from or "")
+        return (
+            origin is not None
+            and origin.existed_before
+            and not origin.exists_now
+            and not state.existed_before
+            and state.exists_now
+        )
+
+    def _net_change(self, path: str, state: _PathState) -> FileChange | None:
+        if not state.existed_before:
+            if not state.exists_now:
+                return None
+            if self._is_rename(state):
+                return FileChange(path, "moved", state.is_directory, src_path=state.renamed_from)
+            return FileChange(path, "created", state.is_directory)
+        if not state.exists_now:
+            return FileChange(path, "deleted", state.is_directory)
+        return FileChange(path, "modified", state.is_directory)
+
+    def _batch(self, changes: list[FileChange]) -> FileChangeBatch:
+        kept = changes[: self.max_batch_paths]
+        try:
+            root = os.path.commonpath([c.path for c in changes])
+        except ValueError:  # mixed absolute / relative or drives
+            root = ""
+        return FileChangeBatch(
+            root=root,
+            changes=tuple(kept),
+            counts=dict(Counter(c.change_type for c in changes)),
+            truncated=len(changes) - len(kept),
+        )
@@ -1,14 +1,23 @@
 """File-system event source backed by ``watchdog``.
 
 Watches one or more paths for ``created`` / ``modified`` / ``deleted``
-events and publishes them as ``AgentEvent(event_type=FILE_CHANGED)``.
-
-``watchdog`` runs its observer on a background thread, so we bridge to
-asyncio with ``asyncio.run_coroutine_threadsafe``: the watchdog handler
-schedules the (async) ``event_callback`` onto the loop captured at
-``start`` time. This keeps the public surface identical to other
-``EventSourceProtocol`` implementations — the daemon does not have to
-know that a thread exists.
+(/ ``moved``) changes and publishes them as
+``AgentEvent(event_type=FILE_CHANGED)``.
+
+Raw watchdog callbacks are not forwarded one by one: a single editor
+save fires several and a ``git checkout`` thousands. They go through a
+:class:`FileEventCoalescer` that debounces per path, collapses each
+sequence to its net effect (an atomic save is one ``modified``, a
+temporary file that came and went is nothing) and reports bulk changes
+as one event with ``change_type: "batch"`` and a path list, capped at
+``max_events_per_minute``.
+
+``watchdog`` runs its observer on a background thread. The handler only
+records callbacks in the coalescer (under a lock) and wakes a flush task
+on the loop captured at ``start`` time, which awaits the (async)
+``event_callback`` for each coalesced event. This keeps the public
+surface identical to other ``EventSourceProtocol`` implementations — the
+daemon does not have to know that a thread exists.
 
 ``watchdog`` ships as a core dependency. The factory still raises
 :class:`ModuleNotFoundError` with a helpful hint if the package is
@@ -20,12 +29,18 @@ from __future__ import annotations
 
 import asyncio
 import threading
+import time
 from collections.abc import Awaitable, Callable
 from typing import Any
 
 import structlog
 
 from taskforce.core.domain.agent_event import AgentEvent, AgentEventType
+from taskforce.infrastructure.event_sources.file_event_coalescer import (
+    FileChange,
+    FileChangeBatch,
+    FileEventCoalescer,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -33,7 +48,24 @@ EventCallback = Callable[[AgentEvent], Awaitable[None]]
 
 
 class FileWatcherEventSource:
-    """Watch one or more directories/files and emit ``FILE_CHANGED`` events."""
+    """Watch one or more directories/files and emit ``FILE_CHANGED`` events.
+
+    Args:
+        paths: Directories or files to watch.
+        event_callback: Receives one ``AgentEvent`` per coalesced change
+            or batch.
+        recursive: Watch subdirectories too.
+        source_name: ``AgentEvent.source`` of emitted events.
+        change_types: Net change types to report (subset of created,
+            modified, deleted, moved). Without ``moved`` a rename reports
+            as ``deleted`` + ``created``.
+        debounce_seconds: Quiet window a path needs before it is reported.
+        max_wait_seconds: Report a path that keeps changing after this long.
+        batch_threshold: More changes than this at once become one batch.
+        max_events_per_minute: Upper bound on emitted events, batches
+            included.
+        max_batch_paths: Paths listed in a batch event; the rest is counted.
+    """
 
     def __init__(
         self,
@@ -43,6 +75,11 @@ class FileWatcherEventSource:
         recursive: bool = True,
         source_name: str = "file_watcher",
         change_types: tuple[str, ...] = ("created", "modified", "deleted"),
+        debounce_seconds: float = 0.5,
+        max_wait_seconds: float = 5.0,
+        batch_threshold: int = 20,
+        max_events_per_minute: int = 120,
+        max_batch_paths: int = 1000,
     ) -> None:
         if not paths:
             raise ValueError("FileWatcherEventSource requires at least one path")
@@ -51,8 +88,18 @@ class FileWatcherEventSource:
         self._recursive = recursive
         self._source_name = source_name
         self._change_types = tuple(change_types)
+        self._coalescer = FileEventCoalescer(
+            debounce_seconds=debounce_seconds,
+            max_wait_seconds=max_wait_seconds,
+            batch_threshold=batch_threshold,
+            max_events_per_minute=max_events_per_minute,
+            max_batch_paths=max_batch_paths,
+            change_types=self._change_types,
+        )
         self._observer: Any = None
         self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._flush_task: asyncio.Task[None] | None = None
         self._running = False
         self._lock = threading.Lock()
 
@@ -77,23 +124,24 @@ class FileWatcherEventSource:
             ) from exc
 
         self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
         self._observer = Observer()
 
-        handler = _make_handler(
-            self._dispatch,
-            FileSystemEventHandler,
-            change_types=self._change_types,
-        )
+        handler = _make_handler(self._dispatch, FileSystemEventHandler)
         for path in self._paths:
             self._observer.schedule(handler, path, recursive=self._recursive)
 
-        self._observer.start()
         self._running = True
+        self._flush_task = asyncio.create_task(
+            self._flush_loop(), name=f"event-source-{self._source_name}"
+        )
+        self._observer.start()
         logger.info(
             "file_watcher_source.started",
             paths=self._paths,
             recursive=self._recursive,
             change_types=list(self._change_types),
+            debounce_s=self._coalescer.debounce_seconds,
         )
 
     async def stop(self) -> None:
@@ -107,32 +155,96 @@ class FileWatcherEventSource:
             except Exception:  # pragma: no cover — best-effort
                 pass
             self._observer = None
-        logger.info("file_watcher_source.stopped")
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        logger.info("file_watcher_source.stopped", dropped_pending=self._coalescer.pending)
 
-    def _dispatch(self, change_type: str, src_path: str, is_directory: bool) -> None:
-        """Threadsafe handler — bridges watchdog to the asyncio callback."""
+    def _dispatch(
+        self,
+        change_type: str,
+        src_path: str,
+        is_directory: bool,
+        dest_path: str | None = None,
+    ) -> None:
+        """Threadsafe handler — records a raw callback and wakes the flusher."""
+        if not self._running:
+            return
         with self._lock:
+            was_idle = self._coalescer.add(
+                change_type, src_path, is_directory, time.monotonic(), dest_path=dest_path
+            )
             loop = self._loop
-            cb = self._event_callback
-        if loop is None or cb is None or not self._running:
-            return
+            wakeup = self._wakeup
+        if was_idle and loop is not None and wakeup is not None:
+            try:
+                loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:  # pragma: no cover — loop closing during shutdown
+                pass
 
-        event = AgentEvent(
+    async def _flush_loop(self) -> None:
+        """Sleep until the next quiet window ends, then emit what is due."""
+        assert self._wakeup is not None
+        while self._running:
+            with self._lock:
+                deadline = self._coalescer.next_deadline()
+            if deadline is None:
+                self._wakeup.clear()
+                with self._lock:
+                    idle = self._coalescer.pending == 0
+                if idle:
+                    await self._wakeup.wait()
+                continue
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            with self._lock:
+                due = self._coalescer.flush(time.monotonic())
+            for item in due:
+                await self._emit(item)
+
+    async def _emit(self, item: FileChange | FileChangeBatch) -> None:
+        if self._event_callback is None:
+            return
+        try:
+            await self._event_callback(self._to_event(item))
+        except Exception as exc:
+            logger.warning(
+                "file_watcher_source.callback_error",
+                source=self._source_name,
+                error=str(exc),
+            )
+
+    def _to_event(self, item: FileChange | FileChangeBatch) -> AgentEvent:
+        if isinstance(item, FileChangeBatch):
+            payload: dict[str, Any] = {
+                "path": item.root,
+                "change_type": "batch",
+                "is_directory": True,
+                "paths": [c.path for c in item.changes],
+                "counts": item.counts,
+                "truncated": item.truncated,
+            }
+        else:
+            payload = {
+                "path": item.path,
+                "change_type": item.change_type,
+                "is_directory": item.is_directory,
+            }
+            if item.src_path is not None:
+                payload["src_path"] = item.src_path
+        return AgentEvent(
             source=self._source_name,
             event_type=AgentEventType.FILE_CHANGED,
-            payload={
-                "path": src_path,
-                "change_type": change_type,
-                "is_directory": is_directory,
-            },
+            payload=payload,
             metadata={"watch_paths": list(self._paths)},
         )
 
-        try:
-            asyncio.run_coroutine_threadsafe(cb(event), loop)
-        except RuntimeError:  # pragma: no cover — loop closing during shutdown
-            pass
-
     @classmethod
     def from_config(
         cls,
@@ -144,7 +256,9 @@ class FileWatcherEventSource:
 
         Required key: ``paths`` (list of strings).
         Optional keys: ``recursive`` (bool, default True), ``source_name``,
-        ``change_types`` (subset of created/modified/deleted/moved).
+        ``change_types`` (subset of created/modified/deleted/moved),
+        ``debounce_ms`` (500), ``max_wait_seconds`` (5), ``batch_threshold``
+        (20), ``max_events_per_minute`` (120), ``max_batch_paths`` (1000).
         """
         paths = config.get("paths") or []
         if isinstance(paths, str):  # tolerate scalar
@@ -154,43 +268,47 @@ class FileWatcherEventSource:
             event_callback=event_callback,
             recursive=bool(config.get("recursive", True)),
             source_name=config.get("source_name", "file_watcher"),
-            change_types=tuple(
-                config.get("change_types", ("created", "modified", "deleted"))
-            ),
+            change_types=tuple(config.get("change_types", ("created", "modified", "deleted"))),
+            debounce_seconds=float(config.get("debounce_ms", 500)) / 1000,
+            max_wait_seconds=float(config.get("max_wait_seconds", 5.0)),
+            batch_threshold=int(config.get("batch_threshold", 20)),
+            max_events_per_minute=int(config.get("max_events_per_minute", 120)),
+            max_batch_paths=int(config.get("max_batch_paths", 1000)),
         )
 
 
 def _make_handler(
-    dispatch: Callable[[str, str, bool], None],
+    dispatch: Callable[..., None],
     base_cls: type,
-    *,
-    change_types: tuple[str, ...],
 ) -> Any:
     """Build a watchdog ``FileSystemEventHandler`` subclass that calls
-    ``dispatch(change_type, src_path, is_directory)`` for whitelisted
-    event types.
+    ``dispatch(change_type, src_path, is_directory, dest_path=None)``
+    for every raw change.
+
+    Filtering by change type happens after coalescing: a ``moved`` that
+    completes an atomic save must be seen even when only ``modified`` is
+    watched.
 
     Defined as a closure so the handler captures the running source's
     dispatch method without circular imports.
     """
 
-    allowed = set(change_types)
-
     class _Handler(base_cls):  # type: ignore[misc, valid-type]
         def on_created(self, event: Any) -> None:
-            if "created" in allowed:
-                dispatch("created", event.src_path, bool(event.is_directory))
+            dispatch("created", event.src_path, bool(event.is_directory))
 
         def on_modified(self, event: Any) -> None:
-            if "modified" in allowed:
-                dispatch("modified", event.src_path, bool(event.is_directory))
+            dispatch("modified", event.src_path, bool(event.is_directory))
 
         def on_deleted(self, event: Any) -> None:
-            if "deleted" in allowed:
-                dispatch("deleted", event.src_path, bool(event.is_directory))
+            dispatch("deleted", event.src_path, bool(event.is_directory))
 
         def on_moved(self, event: Any) -> None:
-            if "moved" in allowed:
-                dispatch("moved", event.dest_path, bool(event.is_directory))
+            dispatch(
+                "moved",
+                event.src_path,
+                bool(event.is_directory),
+                dest_path=event.dest_path,
+            )
 
     return _Handler()
@@ -1,10 +1,20 @@
-"""IMAP inbox poller that emits ``EMAIL_RECEIVED`` events.
+"""IMAP inbox watcher that emits ``EMAIL_RECEIVED`` events.
 
 Uses the synchronous ``imaplib`` from the standard library, executed via
-``asyncio.to_thread`` inside the polling loop. Sticking with the stdlib
-keeps the framework's optional dependency footprint small (no
-``aioimaplib`` install needed for the simple "new mail" case the butler
-typically wants).
+``asyncio.to_thread``. Sticking with the stdlib keeps the framework's
+optional dependency footprint small (no ``aioimaplib`` install needed for
+the simple "new mail" case the butler typically wants).
+
+The source keeps one logged-in connection per mailbox
+(:class:`~taskforce.infrastructure.event_sources.imap_session.IMAPMailboxSession`)
+instead of connecting on every poll. It remembers ``UIDVALIDITY`` and the
+last UID it emitted, so only new messages are fetched, and reads headers
+plus a capped text preview in batched ``BODY.PEEK`` requests. Attachments
+are listed in the payload and downloaded on demand via
+:meth:`IMAPEmailEventSource.fetch_attachment`. When the server supports
+IMAP IDLE the source waits for push notifications instead of sleeping for
+the poll interval; a dropped connection is re-established with jittered
+exponential backoff.
 
 Authentication: username/password (or app-password). For OAuth2 flows
 plug a custom factory that wires the existing ``AuthManager`` instead.
@@ -17,24 +27,28 @@ read-only against a shared inbox.
 from __future__ import annotations
 
 import asyncio
-import email
 import imaplib
+import random
+import threading
 from collections.abc import Awaitable, Callable
-from email.message import Message
 from typing import Any
 
 import structlog
 
 from taskforce.core.domain.agent_event import AgentEvent, AgentEventType
+from taskforce.infrastructure.event_sources.imap_session import IMAPMailboxSession
 from taskforce.infrastructure.event_sources.polling_base import PollingEventSource
 
 logger = structlog.get_logger(__name__)
 
 EventCallback = Callable[[AgentEvent], Awaitable[None]]
 
+_RECONNECT_BASE_SECONDS = 1.0
+_RECONNECT_MAX_SECONDS = 300.0
+
 
 class IMAPEmailEventSource(PollingEventSource):
-    """Poll an IMAP mailbox for unseen messages and emit ``EMAIL_RECEIVED``.
+    """Watch an IMAP mailbox for unseen messages and emit ``EMAIL_RECEIVED``.
 
     Configuration (butler profile YAML)::
 
@@ -46,10 +60,17 @@ class IMAPEmailEventSource(PollingEventSource):
             password_env: BUTLER_IMAP_PASSWORD   # read at runtime, not stored
             mailbox: INBOX
             mark_seen: true                       # mark messages \\Seen on poll
-            poll_interval_minutes: 2
+            poll_interval_minutes: 2              # used when IDLE is unavailable
+            idle: true                            # push via IMAP IDLE if supported
+            idle_refresh_minutes: 10              # re-issue IDLE (and re-check) this often
 
     Set ``mark_seen=false`` to leave the inbox untouched (useful for
     read-only audits or when another client also processes mail).
+
+    Event payloads carry ``uid`` / ``uidvalidity``, the headers, the first
+    8192 characters of the first ``text/plain`` part and an
+    ``attachments`` list (``part``, ``filename``, ``content_type``,
+    ``size``) without the attachment bytes.
     """
 
     def __init__(
@@ -63,6 +84,8 @@ class IMAPEmailEventSource(PollingEventSource):
         mark_seen: bool = True,
         poll_interval_seconds: float = 120.0,
         use_ssl: bool = True,
+        use_idle: bool = True,
+        idle_refresh_seconds: float = 600.0,
         source_name: str = "imap_email",
         event_callback: EventCallback | None = None,
     ) -> None:
@@ -78,6 +101,29 @@ class IMAPEmailEventSource(PollingEventSource):
         self._mailbox = mailbox
         self._mark_seen = mark_seen
         self._use_ssl = use_ssl
+        self._use_idle = use_idle
+        self._idle_refresh = idle_refresh_seconds
+        self._session: IMAPMailboxSession | None = None
+        self._failures = 0
+        self._stop_idle = threading.Event()
+
+    @property
+    def _client_cls(self) -> Any:
+        return imaplib.IMAP4_SSL if self._use_ssl else imaplib.IMAP4
+
+    async def start(self) -> None:
+        self._stop_idle.clear()
+        await super().start()
+
+    async def stop(self) -> None:
+        """Stop watching and log out of the persistent session."""
+        self._stop_idle.set()
+        await super().stop()
+        session, self._session = self._session, None
+        if session is not None:
+            # Waits (at most about a second) for an IDLE still running in
+            # its worker thread to notice the stop event.
+            await asyncio.to_thread(session.close)
 
     async def _poll_once(self) -> list[AgentEvent]:
         if not self._password:
@@ -87,15 +133,9 @@ class IMAPEmailEventSource(PollingEventSource):
             )
             return []
         try:
-            return await asyncio.to_thread(self._poll_sync)
+            events = await asyncio.to_thread(self._poll_sync)
         except (imaplib.IMAP4.error, OSError, ValueError) as exc:
-            logger.warning(
-                "imap_email_source.poll_failed",
-                host=self._host,
-                username=self._username,
-                error=str(exc),
-                error_type=type(exc).__name__,
-            )
+            await self._on_connection_error(exc, "imap_email_source.poll_failed")
             return []
         except Exception as exc:  # noqa: BLE001 — last-resort guard, log loudly
             # We still must not let a polling failure kill the daemon,
@@ -110,73 +150,123 @@ class IMAPEmailEventSource(PollingEventSource):
                 error_type=type(exc).__name__,
             )
             return []
+        self._failures = 0
+        return events
+
+    async def _wait_for_next_poll(self) -> None:
+        """Back off after failures, else IDLE until new mail or sleep."""
+        if self._failures:
+            await asyncio.sleep(self._reconnect_delay())
+            return
+        session = self._session
+        if not (self._use_idle and session is not None and session.supports_idle):
+            await super()._wait_for_next_poll()
+            return
+        try:
+            await asyncio.to_thread(session.idle, self._idle_refresh, self._stop_idle)
+        except (imaplib.IMAP4.error, OSError) as exc:
+            await self._on_connection_error(exc, "imap_email_source.idle_failed")
+            await asyncio.sleep(self._reconnect_delay())
 
     def _poll_sync(self) -> list[AgentEvent]:
-        """Synchronous IMAP poll — runs in a worker thread."""
-        client_cls = imaplib.IMAP4_SSL if self._use_ssl else imaplib.IMAP4
-        with _imap_connection(client_cls, self._host, self._port) as conn:
-            conn.login(self._username, self._password or "")
-            select_status, _ = conn.select(self._mailbox, readonly=not self._mark_seen)
-            if select_status != "OK":
-                logger.warning(
-                    "imap_email_source.select_failed",
-                    mailbox=self._mailbox,
-                    status=select_status,
-                )
-                return []
-
-            search_status, message_ids = conn.search(None, "UNSEEN")
-            if search_status != "OK" or not message_ids or not message_ids[0]:
-                return []
-
-            ids = message_ids[0].split()
-            events: list[AgentEvent] = []
-            for raw_id in ids:
-                fetch_status, data = conn.fetch(raw_id, "(RFC822)")
-                if fetch_status != "OK" or not data:
-                    continue
-                payload = self._parse_message(data, raw_id.decode("utf-8", "replace"))
-                if payload is None:
-                    continue
-                events.append(
-                    AgentEvent(
-                        source=self.source_name,
-                        event_type=AgentEventType.EMAIL_RECEIVED,
-                        payload=payload,
-                        metadata={"host": self._host, "mailbox": self._mailbox},
-                    )
-                )
-                if self._mark_seen:
-                    conn.store(raw_id, "+FLAGS", "\\Seen")
+        """Fetch new messages on the persistent session — runs in a worker thread."""
+        session = self._session
+        if session is None or not session.connected:
+            session = session or IMAPMailboxSession(
+                self._client_cls,
+                self._host,
+                self._port,
+                self._username,
+                self._password or "",
+                self._mailbox,
+                readonly=not self._mark_seen,
+            )
+            session.connect()
+            self._session = session
+            logger.info(
+                "imap_email_source.connected",
+                host=self._host,
+                mailbox=self._mailbox,
+                idle=session.supports_idle,
+            )
+        return [
+            AgentEvent(
+                source=self.source_name,
+                event_type=AgentEventType.EMAIL_RECEIVED,
+                payload=payload,
+                metadata={"host": self._host, "mailbox": self._mailbox},
+            )
+            for payload in session.fetch_new(mark_seen=self._mark_seen)
+        ]
+
+    async def fetch_attachment(
+        self, uid: int, part: str, *, uidvalidity: int | None = None
+    ) -> bytes:
+        """Download one attachment listed in an event's ``attachments``.
+
+        Uses its own short-lived connection so it does not have to wait
+        for the watcher's IDLE to end.
+
+        Raises:
+            ValueError: The mailbox's UIDVALIDITY no longer matches
+                ``uidvalidity`` (UIDs were reassigned) or the UID is gone.
+        """
+        session = IMAPMailboxSession(
+            self._client_cls,
+            self._host,
+            self._port,
+            self._username,
+            self._password or "",
+            self._mailbox,
+            readonly=True,
+        )
+
+        def _fetch() -> bytes:
+            session.connect()
             try:
-                conn.close()
-            except (imaplib.IMAP4.error, OSError):
-                # Server may already have closed the connection — not
-                # worth surfacing, but narrow the catch so a real bug
-                # (e.g. AttributeError on a refactor) is not swallowed.
-                pass
-            return events
-
-    @staticmethod
-    def _parse_message(data: list[Any], raw_id: str) -> dict[str, Any] | None:
-        """Extract a friendly payload from an IMAP fetch tuple."""
-        for item in data:
-            if not isinstance(item, tuple) or len(item) < 2:
-                continue
-            raw_bytes = item[1]
-            if not isinstance(raw_bytes, (bytes, bytearray)):
-                continue
-            msg: Message = email.message_from_bytes(bytes(raw_bytes))
-            return {
-                "imap_id": raw_id,
-                "subject": str(msg.get("Subject", "")),
-                "from": str(msg.get("From", "")),
-                "to": str(msg.get("To", "")),
-                "date": str(msg.get("Date", "")),
-                "message_id": str(msg.get("Message-ID", "")),
-                "body": _first_text_part(msg)[:8192],  # cap to keep events small
-            }
-        return None
+                if uidvalidity is not None and session.uidvalidity != uidvalidity:
+                    raise ValueError(
+                        f"UIDVALIDITY of {self._mailbox} changed "
+                        f"({uidvalidity} -> {session.uidvalidity})"
+                    )
+                return session.fetch_part(uid, part)
+            finally:
+                session.close()
+
+        return await asyncio.to_thread(_fetch)
+
+    async def _on_connection_error(self, exc: Exception, event: str) -> None:
+        """Close the connection so the next poll reconnects after a backoff.
+
+        The session object is kept: it reconnects with the remembered
+        ``UIDVALIDITY`` and last UID, so messages already emitted are not
+        emitted again (and a changed ``UIDVALIDITY`` is detected).
+        """
+        self._failures += 1
+        session = self._session
+        if session is not None:
+            await asyncio.to_thread(session.close)
+        logger.warning(
+            event,
+            host=self._host,
+            username=self._username,
+            error=str(exc),
+            error_type=type(exc).__name__,
+            consecutive_failures=self._failures,
+        )
+
+    def _reconnect_delay(self) -> float:
+        """Jittered backoff in ``[d/2, d]``; ``d`` doubles per failure.
+
+        ``d`` is capped at five minutes and at the poll interval, so a
+        broken connection is never retried less often than polling would.
+        """
+        delay = min(
+            _RECONNECT_MAX_SECONDS,
+            _RECONNECT_BASE_SECONDS * 2 ** (self._failures - 1),
+            max(self._poll_interval, _RECONNECT_BASE_SECONDS),
+        )
+        return random.uniform(delay / 2, delay)
 
     @classmethod
     def from_config(
@@ -205,49 +295,9 @@ class IMAPEmailEventSource(PollingEventSource):
             mark_seen=bool(config.get("mark_seen", True)),
             poll_interval_seconds=float(poll_minutes) * 60.0,
             use_ssl=bool(config.get("use_ssl", True)),
+            use_idle=bool(config.get("idle", True)),
+            idle_refresh_seconds=float(config.get("idle_refresh_minutes", 10)) * 60.0,
             source_name=config.get("source_name", "imap_email"),
             event_callback=event_callback,
         )
 
-
-def _first_text_part(msg: Message) -> str:
-    """Return the first text/plain part of a message, decoded best-effort."""
-    if msg.is_multipart():
-        for part in msg.walk():
-            if part.get_content_type() == "text/plain":
-                payload = part.get_payload(decode=True)
-                if isinstance(payload, (bytes, bytearray)):
-                    return payload.decode(
-                        part.get_content_charset() or "utf-8",
-                        errors="replace",
-                    )
-        return ""
-    payload = msg.get_payload(decode=True)
-    if isinstance(payload, (bytes, bytearray)):
-        return payload.decode(msg.get_content_charset() or "utf-8", errors="replace")
-    return str(payload or "")
-
-
-class _imap_connection:
-    """Tiny context-manager wrapper so we always logout/close cleanly."""
-
-    def __init__(self, client_cls: Any, host: str, port: int) -> None:
-        self._client_cls = client_cls
-        self._host = host
-        self._port = port
-        self._conn: Any = None
-
-    def __enter__(self) -> Any:
-        self._conn = self._client_cls(self._host, self._port)
-        return self._conn
-
-    def __exit__(self, *exc_info: Any) -> None:
-        if self._conn is None:
-            return
-        try:
-            self._conn.logout()
-        except (imaplib.IMAP4.error, OSError):
-            # Best-effort cleanup. Same narrowing rationale as
-            # ``conn.close()`` above: narrow the catch so unexpected
-            # exception types still surface in tests / logs.
-            pass
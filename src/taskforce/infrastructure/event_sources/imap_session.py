@@ -0,0 +1,580 @@
+"""Long-lived IMAP mailbox session used by ``IMAPEmailEventSource``.
+
+Internal helper. Not part of the public API.
+
+One :class:`IMAPMailboxSession` keeps a logged-in ``imaplib`` connection
+with the mailbox selected and remembers ``UIDVALIDITY`` plus the highest
+UID it has handed out, so each fetch only asks the server for messages
+that arrived since. New messages are read in two batched round trips:
+
+1. ``UID FETCH <uids> (UID RFC822.SIZE BODYSTRUCTURE)`` to find each
+   message's first ``text/plain`` part and its attachments, then
+2. ``UID FETCH <uids> (BODY.PEEK[HEADER.FIELDS (...)] BODY.PEEK[<part>]<0.n>)``
+   per distinct text part number (usually one), capped at ``n`` octets.
+
+Attachments are never downloaded here; the payload lists them by part
+number and :meth:`IMAPMailboxSession.fetch_part` retrieves one on demand.
+
+:meth:`IMAPMailboxSession.idle` waits for new mail with IMAP IDLE
+(RFC 2177) when the server advertises it. Python's ``imaplib`` only gained
+``idle()`` in 3.14, so the command is issued by hand on the same socket.
+
+Every method is blocking and meant to run in a worker thread; a lock
+serializes commands on the connection.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import codecs
+import email
+import imaplib
+import quopri
+import re
+import select
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from email.message import Message
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+HEADER_FIELDS = ("SUBJECT", "FROM", "TO", "DATE", "MESSAGE-ID")
+BODY_PREVIEW_CHARS = 8192
+# Octets fetched for the body preview: room for multi-byte characters
+# and base64 / quoted-printable inflation of ``BODY_PREVIEW_CHARS``.
+BODY_PREVIEW_OCTETS = 3 * BODY_PREVIEW_CHARS
+
+# How often a waiting IDLE checks whether it was asked to stop.
+_IDLE_SLICE_SECONDS = 1.0
+_IDLE_WAKE_PATTERN = re.compile(rb"^\* \d+ (?:EXISTS|RECENT)\b", re.IGNORECASE)
+_IDLE_NOISE = ("EXISTS", "RECENT", "EXPUNGE", "FETCH")
+
+
+# ----------------------------------------------------------------------
+# Response parsing
+# ----------------------------------------------------------------------
+
+
+def _tokens(data: bytes) -> Iterator[Any]:
+    """Tokenize an IMAP response: ``(``, ``)``, atoms, strings, literals.
+
+    ``BODY[HEADER.FIELDS (A B)]<0>`` is one atom. Quoted strings and
+    literals yield ``bytes``; atoms yield ``bytes`` too, except ``NIL``
+    which yields ``None``. Parentheses yield the one-character ``str``.
+    """
+    i, n = 0, len(data)
+    while i < n:
+        c = data[i : i + 1]
+        if c in b" \r\n":
+            i += 1
+        elif c in b"()":
+            yield c.decode()
+            i += 1
+        elif c == b'"':
+            i += 1
+            out = bytearray()
+            while i < n and data[i : i + 1] != b'"':
+                if data[i : i + 1] == b"\\":
+                    i += 1
+                out += data[i : i + 1]
+                i += 1
+            i += 1
+            yield bytes(out)
+        elif c == b"{":
+            end = data.index(b"}", i)
+            size = int(data[i + 1 : end])
+            start = end + 1
+            while data[start : start + 1] in (b"\r", b"\n"):
+                start += 1
+            yield data[start : start + size]
+            i = start + size
+        else:
+            start = i
+            depth = 0
+            while i < n:
+                ch = data[i : i + 1]
+                if ch == b"[":
+                    depth += 1
+                elif ch == b"]":
+                    depth -= 1
+                elif depth == 0 and ch in b" ()\r\n":
+                    break
+                i += 1
+            atom = data[start:i]
+            yield None if atom.upper() == b"NIL" else atom
+
+
+def _parse(tokens: Iterator[Any]) -> list[Any]:
+    """Nest a token stream into lists until the matching ``)``."""
+    items: list[Any] = []
+    for token in tokens:
+        if token == "(":
+            items.append(_parse(tokens))
+        elif token == ")":
+            return items
+        else:
+            items.append(token)
+    return items
+
+
+def _join_fetch_data(data: Iterable[Any]) -> bytes:
+    """Reassemble ``imaplib`` FETCH data (literals split out) into one stream."""
+    out = bytearray()
+    for item in data:
+        if isinstance(item, tuple):
+            out += item[0] + b"\r\n" + item[1]
+        elif isinstance(item, (bytes, bytearray)):
+            out += b" " + bytes(item) + b"\r\n"
+    return bytes(out)
+
+
+def parse_fetch_response(data: Iterable[Any]) -> dict[int, dict[bytes, Any]]:
+    """Map UID -> ``{item name: value}`` for a ``UID FETCH`` response.
+
+    Item names are upper-cased with ``.PEEK`` removed, so a request for
+    ``BODY.PEEK[1]<0.100>`` is answered under ``BODY[1]<0>``.
+    """
+    messages: dict[int, dict[bytes, Any]] = {}
+    tokens = _tokens(_join_fetch_data(data))
+    for token in tokens:
+        if token != "(":
+            continue  # the message sequence number
+        values = _parse(tokens)
+        items = {
+            bytes(values[k]).upper(): values[k + 1]
+            for k in range(0, len(values) - 1, 2)
+            if isinstance(values[k], bytes)
+        }
+        uid = items.get(b"UID")
+        if uid is not None:
+            messages[int(uid)] = items
+    return messages
+
+
+def _response_key(item: str) -> bytes:
+    key = item.upper().replace(".PEEK", "")
+    return re.sub(r"<(\d+)\.\d+>$", r"<\1>", key).encode()
+
+
+# ----------------------------------------------------------------------
+# BODYSTRUCTURE
+# ----------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class BodyPart:
+    """One leaf of a message's MIME tree as described by BODYSTRUCTURE."""
+
+    part: str
+    content_type: str
+    params: dict[str, str]
+    encoding: str
+    size: int
+    disposition: str = ""
+    filename: str = ""
+
+    @property
+    def charset(self) -> str:
+        """The declared charset if Python knows it, else ``utf-8``.
+
+        The value comes from the sender (``unknown-8bit``, typos), so an
+        unknown name must not make decoding raise ``LookupError``.
+        """
+        name = self.params.get("charset", "") or "utf-8"
+        try:
+            codecs.lookup(name)
+        except LookupError:
+            return "utf-8"
+        return name
+
+
+@dataclass
+class MessageStructure:
+    """Where a message's body preview lives and which parts are attachments."""
+
+    text: BodyPart | None = None
+    attachments: list[BodyPart] = field(default_factory=list)
+
+
+def _text(value: Any) -> str:
+    return bytes(value).decode("utf-8", "replace") if isinstance(value, bytes) else ""
+
+
+def _params(value: Any) -> dict[str, str]:
+    if not isinstance(value, list):
+        return {}
+    return {_text(value[k]).lower(): _text(value[k + 1]) for k in range(0, len(value) - 1, 2)}
+
+
+def _leaves(structure: list[Any], prefix: str) -> Iterator[BodyPart]:
+    if structure and isinstance(structure[0], list):  # multipart
+        # Children come first; the subtype and extension data (which may
+        # contain lists, e.g. the boundary parameter) follow.
+        children = []
+        for child in structure:
+            if not isinstance(child, list):
+                break
+            children.append(child)
+        for index, child in enumerate(children, 1):
+            yield from _leaves(child, f"{prefix}.{index}" if prefix else str(index))
+        return
+    if len(structure) < 7:
+        return
+    maintype, subtype = _text(structure[0]).lower(), _text(structure[1]).lower()
+    # Extension data follows the basic fields: text/* has a line count,
+    # message/rfc822 an envelope, body and line count (RFC 3501 7.4.2).
+    basic = 8 if maintype == "text" else 7
+    if (maintype, subtype) == ("message", "rfc822"):
+        basic = 10
+    disposition = structure[basic + 1] if len(structure) > basic + 1 else None
+    disposition_type, disposition_params = "", {}
+    if isinstance(disposition, list) and disposition:
+        disposition_type = _text(disposition[0]).lower()
+        disposition_params = _params(disposition[1] if len(disposition) > 1 else None)
+    params = _params(structure[2])
+    size = structure[6]
+    yield BodyPart(
+        part=prefix or "1",
+        content_type=f"{maintype}/{subtype}",
+        params=params,
+        encoding=_text(structure[5]).lower(),
+        size=int(size) if isinstance(size, bytes) and size.isdigit() else 0,
+        disposition=disposition_type,
+        filename=disposition_params.get("filename") or params.get("name", ""),
+    )
+
+
+def parse_bodystructure(structure: Any) -> MessageStructure:
+    """Pick the body preview part and list the attachments of a message.
+
+    The preview is the first inline ``text/plain`` part; a single-part
+    message of any ``text/*`` type is its own preview. Every other leaf
+    that is not ``text/*`` or carries a filename or an ``attachment``
+    disposition is an attachment.
+    """
+    result = MessageStructure()
+    if not isinstance(structure, list):
+        return result
+    leaves = list(_leaves(structure, ""))
+    single = not isinstance(structure[0], list)
+    for leaf in leaves:
+        is_attachment = leaf.disposition == "attachment" or bool(leaf.filename)
+        if (
+            result.text is None
+            and not is_attachment
+            and (
+                leaf.content_type == "text/plain"
+                or (single and leaf.content_type.startswith("text/"))
+            )
+        ):
+            result.text = leaf
+        elif is_attachment or not leaf.content_type.startswith("text/"):
+            result.attachments.append(leaf)
+    return result
+
+
+def decode_part(raw: bytes, encoding: str) -> bytes:
+    """Undo a part's Content-Transfer-Encoding (tolerates truncated input)."""
+    if encoding == "base64":
+        compact = re.sub(rb"[^A-Za-z0-9+/=]", b"", raw)
+        compact = compact[: len(compact) - len(compact) % 4]
+        try:
+            return base64.b64decode(compact)
+        except (binascii.Error, ValueError):
+            return b""
+    if encoding == "quoted-printable":
+        return quopri.decodestring(raw)
+    return raw
+
+
+# ----------------------------------------------------------------------
+# Session
+# ----------------------------------------------------------------------
+
+
+class IMAPMailboxSession:
+    """A logged-in connection with one mailbox selected (see module docstring)."""
+
+    def __init__(
+        self,
+        client_cls: Any,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        mailbox: str = "INBOX",
+        *,
+        readonly: bool = False,
+    ) -> None:
+        self._client_cls = client_cls
+        self._host = host
+        self._port = port
+        self._username = username
+        self._password = password
+        self.mailbox = mailbox
+        self._readonly = readonly
+        self._conn: Any = None
+        self._lock = threading.Lock()
+        self.uidvalidity: int | None = None
+        self.last_uid: int | None = None
+
+    @property
+    def connected(self) -> bool:
+        return self._conn is not None
+
+    @property
+    def supports_idle(self) -> bool:
+        return self._conn is not None and "IDLE" in getattr(self._conn, "capabilities", ())
+
+    def connect(self) -> None:
+        """Open the connection, log in and select the mailbox.
+
+        A changed ``UIDVALIDITY`` invalidates the remembered UID, so the
+        next fetch starts over from the mailbox's unseen messages.
+
+        Raises:
+            imaplib.IMAP4.error: Login or SELECT was rejected.
+        """
+        with self._lock:
+            self._close_locked()
+            conn = self._client_cls(self._host, self._port)
+            try:
+                conn.login(self._username, self._password)
+                status, _ = conn.select(self.mailbox, readonly=self._readonly)
+                if status != "OK":
+                    raise imaplib.IMAP4.error(f"SELECT {self.mailbox} failed: {status}")
+                uidvalidity = _int_response(conn, "UIDVALIDITY")
+            except BaseException:
+                _logout(conn)
+                raise
+            if self.uidvalidity is not None and uidvalidity != self.uidvalidity:
+                logger.warning(
+                    "imap_session.uidvalidity_changed",
+                    mailbox=self.mailbox,
+                    previous=self.uidvalidity,
+                    current=uidvalidity,
+                )
+                self.last_uid = None
+            self.uidvalidity = uidvalidity
+            self._conn = conn
+
+    def close(self) -> None:
+        """Log out; waits for a running :meth:`idle` to notice its stop event."""
+        with self._lock:
+            self._close_locked()
+
+    def fetch_new(self, *, mark_seen: bool) -> list[dict[str, Any]]:
+        """Payloads for unseen messages above the last UID handed out.
+
+        The first call after (re)connecting with an unknown UID returns
+        all unseen messages, like the old per-poll ``SEARCH UNSEEN``.
+        """
+        with self._lock:
+            conn = self._require_conn()
+            if self.last_uid is None:
+                criteria: tuple[str, ...] = ("UNSEEN",)
+            else:
+                criteria = ("UID", f"{self.last_uid + 1}:*", "UNSEEN")
+            status, data = conn.uid("SEARCH", None, *criteria)
+            if status != "OK":
+                raise imaplib.IMAP4.error(f"UID SEARCH failed: {status}")
+            uids = sorted(int(u) for u in (data[0] or b"").split() if u.isdigit())
+            if self.last_uid is not None:
+                # "n:*" always matches the highest UID, even below n.
+                uids = [u for u in uids if u > self.last_uid]
+            if self.last_uid is None:
+                last_uid = max([_int_response(conn, "UIDNEXT", 1) - 1, *uids])
+            else:
+                last_uid = uids[-1] if uids else self.last_uid
+
+            # Only advance past UIDs once their payloads are built, so a
+            # failure here re-fetches them on the next call instead of
+            # dropping them.
+            payloads = self._fetch_payloads(conn, uids) if uids else []
+            if mark_seen and uids:
+                conn.uid("STORE", _uid_set(uids), "+FLAGS", "(\\Seen)")
+            self.last_uid = last_uid
+            return payloads
+
+    def fetch_part(self, uid: int, part: str) -> bytes:
+        """Download and decode one MIME part of a message (attachments)."""
+        with self._lock:
+            conn = self._require_conn()
+            parsed = self._uid_fetch(conn, [uid], ["BODYSTRUCTURE", f"BODY.PEEK[{part}]"])
+            items = parsed.get(uid)
+            if items is None:
+                raise ValueError(f"Message UID {uid} not found in {self.mailbox}")
+            encoding = ""
+            for leaf in _leaves(items.get(b"BODYSTRUCTURE") or [], ""):
+                if leaf.part == part:
+                    encoding = leaf.encoding
+            return decode_part(bytes(items.get(_response_key(f"BODY[{part}]")) or b""), encoding)
+
+    def idle(self, timeout: float, stop: threading.Event | None = None) -> bool:
+        """Wait in IDLE until new mail arrives, ``timeout`` passes or ``stop`` is set.
+
+        Returns:
+            True when the server announced new messages.
+
+        Raises:
+            imaplib.IMAP4.abort: The server closed the connection.
+        """
+        with self._lock:
+            conn = self._require_conn()
+            tag = conn._new_tag()
+            conn.send(tag + b" IDLE\r\n")
+            reply = conn.readline()
+            if not reply.startswith(b"+"):
+                conn.tagged_commands.pop(tag, None)
+                raise imaplib.IMAP4.error(f"IDLE rejected: {reply!r}")
+            changed = False
+            deadline = time.monotonic() + timeout
+            while not (stop is not None and stop.is_set()):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if not _readable(conn, min(remaining, _IDLE_SLICE_SECONDS)):
+                    continue
+                line = conn.readline()
+                if not line:
+                    raise imaplib.IMAP4.abort("connection closed during IDLE")
+                if _IDLE_WAKE_PATTERN.match(line):
+                    changed = True
+                    break
+            conn.send(b"DONE\r\n")
+            conn._get_tagged_response(tag)
+            for name in _IDLE_NOISE:
+                conn.untagged_responses.pop(name, None)
+            return changed
+
+    def noop(self) -> None:
+        """Keep the connection alive and let the server report changes."""
+        with self._lock:
+            self._require_conn().noop()
+
+    # ------------------------------------------------------------------
+
+    def _require_conn(self) -> Any:
+        if self._conn is None:
+            raise imaplib.IMAP4.abort("IMAP session is not connected")
+        return self._conn
+
+    def _close_locked(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            _logout(conn)
+
+    def _fetch_payloads(self, conn: Any, uids: list[int]) -> list[dict[str, Any]]:
+        structures = self._uid_fetch(conn, uids, ["UID", "RFC822.SIZE", "BODYSTRUCTURE"])
+        parsed = {
+            uid: parse_bodystructure(items.get(b"BODYSTRUCTURE"))
+            for uid, items in structures.items()
+        }
+
+        headers_item = f"BODY.PEEK[HEADER.FIELDS ({' '.join(HEADER_FIELDS)})]"
+        preview_item = "BODY.PEEK[{}]<0." + str(BODY_PREVIEW_OCTETS) + ">"
+        by_part: dict[str | None, list[int]] = {}
+        for uid in uids:
+            text = parsed[uid].text if uid in parsed else None
+            by_part.setdefault(text.part if text else None, []).append(uid)
+        contents: dict[int, dict[bytes, Any]] = {}
+        for part, group in by_part.items():
+            items = [headers_item]
+            if part is not None:
+                items.append(preview_item.format(part))
+            contents.update(self._uid_fetch(conn, group, items))
+
+        payloads = []
+        for uid in uids:
+            items = contents.get(uid)
+            if items is None:
+                continue
+            structure = parsed.get(uid, MessageStructure())
+            headers: Message = email.message_from_bytes(
+                bytes(items.get(_response_key(headers_item)) or b"")
+            )
+            body = ""
+            if structure.text is not None:
+                raw = items.get(_response_key(preview_item.format(structure.text.part))) or b""
+                body = decode_part(bytes(raw), structure.text.encoding).decode(
+                    structure.text.charset, errors="replace"
+                )
+            size = structures.get(uid, {}).get(b"RFC822.SIZE")
+            payloads.append(
+                {
+                    "imap_id": str(uid),
+                    "uid": uid,
+                    "uidvalidity": self.uidvalidity,
+                    "subject": str(headers.get("Subject", "")),
+                    "from": str(headers.get("From", "")),
+                    "to": str(headers.get("To", "")),
+                    "date": str(headers.get("Date", "")),
+                    "message_id": str(headers.get("Message-ID", "")),
+                    "body": body[:BODY_PREVIEW_CHARS],
+                    "size": int(size) if isinstance(size, bytes) and size.isdigit() else None,
+                    "attachments": [
+                        {
+                            "part": leaf.part,
+                            "filename": leaf.filename,
+                            "content_type": leaf.content_type,
+                            "size": leaf.size,
+                        }
+                        for leaf in structure.attachments
+                    ],
+                }
+            )
+        return payloads
+
+    @staticmethod
+    def _uid_fetch(conn: Any, uids: list[int], items: list[str]) -> dict[int, dict[bytes, Any]]:
+        status, data = conn.uid("FETCH", _uid_set(uids), f"({' '.join(items)})")
+        if status != "OK":
+            raise imaplib.IMAP4.error(f"UID FETCH failed: {status}")
+        return parse_fetch_response(data or [])
+
+
+def _uid_set(uids: Iterable[int]) -> str:
+    """Compress sorted UIDs into an IMAP sequence set (``1:3,7``)."""
+    ranges: list[str] = []
+    start = prev = None
+    for uid in sorted(uids):
+        if prev is not None and uid == prev + 1:
+            prev = uid
+            continue
+        if start is not None:
+            ranges.append(f"{start}:{prev}" if start != prev else str(start))
+        start = prev = uid
+    if start is not None:
+        ranges.append(f"{start}:{prev}" if start != prev else str(start))
+    return ",".join(ranges)
+
+
+def _int_response(conn: Any, name: str, default: int | None = None) -> Any:
+    _, values = conn.response(name)
+    for value in values or []:
+        if isinstance(value, bytes) and value.strip().isdigit():
+            return int(value)
+    return default
+
+
+def _readable(conn: Any, timeout: float) -> bool:
+    sock = conn.sock
+    pending = getattr(sock, "pending", None)
+    if pending is not None and pending():
+        return True
+    readable, _, _ = select.select([sock], [], [], timeout)
+    return bool(readable)
+
+
+def _logout(conn: Any) -> None:
+    try:
+        conn.logout()
+    except (imaplib.IMAP4.error, OSError):
+        # Best effort: the server may already have dropped the connection.
+        pass
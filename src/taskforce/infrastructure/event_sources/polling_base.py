@@ -104,10 +104,18 @@ class PollingEventSource:
                         source=self._source_name,
                         error=str(exc),
                     )
-                await asyncio.sleep(self._poll_interval)
+                await self._wait_for_next_poll()
         except asyncio.CancelledError:
             pass
 
+    async def _wait_for_next_poll(self) -> None:
+        """Wait between polls; sleeps ``poll_interval_seconds`` by default.
+
+        Sources with a push channel (e.g. IMAP IDLE) override this to
+        return as soon as the external system reports a change.
+        """
+        await asyncio.sleep(self._poll_interval)
+
     async def _poll_once(self) -> list[AgentEvent]:
         """Override in subclass to poll the external system.
 
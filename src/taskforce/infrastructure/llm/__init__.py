@@ -1,9 +1,31 @@
-"""LLM provider implementations."""
+"""LLM provider implementations.
 
-from taskforce.infrastructure.llm.litellm_service import LiteLLMService
+Exports resolve lazily: importing a submodule such as
+``taskforce.infrastructure.llm.response_cache`` must not pull in LiteLLM
+(several seconds of import time) as a side effect.
+"""
 
-# Re-export RetryPolicy so that existing ``from taskforce.infrastructure.llm import RetryPolicy``
-# continues to work.  The canonical definition lives in ``llm_config_loader``.
-from taskforce.infrastructure.llm.llm_config_loader import RetryPolicy
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from taskforce.infrastructure.llm.litellm_service import LiteLLMService
+    from taskforce.infrastructure.llm.llm_config_loader import RetryPolicy
 
 __all__ = ["LiteLLMService", "RetryPolicy"]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "LiteLLMService":
+        from taskforce.infrastructure.llm.litellm_service import LiteLLMService
+
+        return LiteLLMService
+    # Re-export RetryPolicy so that existing ``from taskforce.infrastructure.llm import
+    # RetryPolicy`` continues to work. The canonical definition lives in
+    # ``llm_config_loader``.
+    if name == "RetryPolicy":
+        from taskforce.infrastructure.llm.llm_config_loader import RetryPolicy
+
+        return RetryPolicy
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
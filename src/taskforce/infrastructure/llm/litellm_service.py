@@ -9,9 +9,13 @@ Key features:
 - Provider-agnostic: Provider is determined by model string prefix (e.g., "anthropic/", "azure/")
 - Model alias resolution from YAML configuration
 - Per-model default parameters with merge semantics
-- Configurable retry logic with exponential backoff
+- Configurable retry logic with jittered exponential backoff honouring Retry-After
+- Optional process-wide rate governor (``rate_limits`` config section):
+  RPM/TPM buckets, adaptive concurrency and a per-model circuit breaker
 - Streaming support for real-time token delivery
-- Optional file-based tracing
+- Optional file-based tracing (batched background writer, ``tracing.file_config``)
+- Optional record/replay response cache (``response_cache`` config section)
+- Provider prompt-cache breakpoints (``prompt_caching`` config section)
 
 Configuration loading and model resolution are handled by ``LLMConfigLoader``.
 Response parsing and normalization are handled by ``LLMResponseParser``.
@@ -34,50 +38,75 @@ Environment variables are read natively by LiteLLM per provider:
 import asyncio
 import json
 import logging
-import os
 import re
 import time
 from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, nullcontext
 from datetime import UTC, datetime
-from pathlib import Path
 from typing import Any
 
-# Suppress LiteLLM verbose logging before import
-os.environ.setdefault("LITELLM_LOG_LEVEL", "ERROR")
-os.environ.setdefault("LITELLM_LOGGING", "off")
-os.environ.setdefault("HTTPX_LOG_LEVEL", "warning")
-
-# Map AZURE_OPENAI_* to AZURE_* for LiteLLM compatibility.
-# LiteLLM expects AZURE_API_KEY, AZURE_API_BASE, AZURE_API_VERSION.
-# Many projects use AZURE_OPENAI_API_KEY, AZURE_OPENAI_ENDPOINT (Microsoft convention).
-# Without this, api_base=None causes: "argument of type 'NoneType' is not iterable".
-if not os.environ.get("AZURE_API_KEY") and os.environ.get("AZURE_OPENAI_API_KEY"):
-    os.environ["AZURE_API_KEY"] = os.environ["AZURE_OPENAI_API_KEY"]
-if not os.environ.get("AZURE_API_BASE") and os.environ.get("AZURE_OPENAI_ENDPOINT"):
-    endpoint = os.environ["AZURE_OPENAI_ENDPOINT"].rstrip("/")
-    os.environ["AZURE_API_BASE"] = f"{endpoint}/"
-if not os.environ.get("AZURE_API_VERSION") and os.environ.get("AZURE_OPENAI_API_VERSION"):
-    os.environ["AZURE_API_VERSION"] = os.environ["AZURE_OPENAI_API_VERSION"]
+from taskforce.infrastructure.llm.provider_env import (  # noqa: E402
+    apply_litellm_env_defaults,
+)
+
+# Quiet LiteLLM and map AZURE_OPENAI_* -> AZURE_* before litellm is imported.
+apply_litellm_env_defaults()
 
 for _ln in ["LiteLLM", "litellm", "httpcore", "httpx", "aiohttp", "openai"]:
     logging.getLogger(_ln).setLevel(logging.ERROR)
 
-import aiofiles  # noqa: E402
 import litellm  # noqa: E402
 import structlog  # noqa: E402
 import yaml  # noqa: E402
 
+from taskforce.core.utils.metrics import get_metrics_registry  # noqa: E402
 from taskforce.infrastructure.llm.llm_config_loader import (  # noqa: E402
     LLMConfigLoader,
     RetryPolicy,
 )
 from taskforce.infrastructure.llm.llm_response_parser import LLMResponseParser  # noqa: E402
+from taskforce.infrastructure.llm.prompt_caching import PromptCachingConfig  # noqa: E402
+from taskforce.infrastructure.llm.rate_governor import (  # noqa: E402
+    CircuitOpenError,
+    ModelGovernor,
+    Permit,
+    RateGovernorConfig,
+    backoff_delay,
+    estimate_request_tokens,
+    get_rate_governor,
+    retry_after_seconds,
+)
+from taskforce.infrastructure.llm.response_cache import (  # noqa: E402
+    LLMCacheMissError,
+    LLMResponseCache,
+    canonical_request_key,
+)
+from taskforce.infrastructure.tracing.trace_file_writer import (  # noqa: E402
+    TraceFileWriter,
+    get_trace_file_writer,
+)
 
 litellm.suppress_debug_info = True
 litellm.drop_params = True
 
 logger = structlog.get_logger(__name__)
 
+_LLM_DURATION = get_metrics_registry().histogram(
+    "taskforce_llm_request_duration_seconds",
+    "Provider call latency per attempt by model, mode (complete, stream) and outcome.",
+    ("model", "mode", "outcome"),
+)
+_LLM_TTFT = get_metrics_registry().histogram(
+    "taskforce_llm_time_to_first_token_seconds",
+    "Streaming time from request to the first token or tool-call delta.",
+    ("model",),
+)
+_LLM_RETRIES = get_metrics_registry().counter(
+    "taskforce_llm_retries_total",
+    "Completion attempts retried after a transient provider error.",
+    ("model",),
+)
+
 # Error type names that indicate transient failures worth retrying
 _RETRYABLE_ERROR_TYPES = frozenset(
     {"RateLimitError", "APIConnectionError", "Timeout", "ServiceUnavailableError"}
@@ -155,6 +184,9 @@ class LiteLLMService:
 
     Args:
         config_path: Path to YAML configuration file.
+        response_cache: Optional record/replay cache. When omitted, one is
+            built from the ``response_cache`` config section (or the
+            ``TASKFORCE_LLM_CACHE_MODE`` env var) on first use.
 
     Raises:
         FileNotFoundError: If config file doesn't exist (on first access).
@@ -167,10 +199,17 @@ class LiteLLMService:
         *,
         recover_via_rephrase: bool = True,
         recovery_keep_last_n: int = 2,
+        response_cache: LLMResponseCache | None = None,
     ) -> None:
         self.logger = structlog.get_logger(__name__)
         self._config = LLMConfigLoader(config_path)
         self._parser = LLMResponseParser()
+        self._response_cache = response_cache
+        self._response_cache_resolved = response_cache is not None
+        self._trace_writer_cache: tuple[str, TraceFileWriter] | None = None
+        self._rate_governor_config = RateGovernorConfig.from_dict(
+            self._config.rate_limits_config, self._config.models
+        )
         # ON by default since #274 — content-filter recovery escalates to
         # a neutral-rephrase stage if straight history-stripping also
         # fails. Costs one extra small LLM call ONLY on the failure path
@@ -280,6 +319,93 @@ class LiteLLMService:
         """
         await self._config.ensure_config_loaded()
 
+    # ------------------------------------------------------------------
+    # Response cache (record / replay)
+    # ------------------------------------------------------------------
+
+    @property
+    def response_cache(self) -> LLMResponseCache | None:
+        """The active response cache, or ``None`` when caching is off."""
+        if not self._response_cache_resolved:
+            self._response_cache = LLMResponseCache.from_config(
+                self._config.response_cache_config
+            )
+            self._response_cache_resolved = True
+        return self._response_cache
+
+    async def _cache_lookup(
+        self, kind: str, litellm_kwargs: dict[str, Any], resolved_model: str
+    ) -> tuple[str | None, Any | None]:
+        """Look up a prepared request in the response cache.
+
+        Returns:
+            Tuple of (cache_key, cached_response). ``cache_key`` is ``None``
+            when caching is off; ``cached_response`` is ``None`` on a miss
+            or when the mode does not read from the cache.
+
+        Raises:
+            LLMCacheMissError: On a miss in ``replay`` mode.
+        """
+        cache = self.response_cache
+        if cache is None:
+            return None, None
+        key = canonical_request_key(kind, litellm_kwargs)
+        if not cache.reads:
+            return key, None
+        cached = await cache.get(key)
+        if cached is not None:
+            self.logger.info("llm_cache_hit", model=resolved_model, kind=kind, key=key[:16])
+            return key, cached
+        if cache.replay_only:
+            raise LLMCacheMissError(key, resolved_model)
+        return key, None
+
+    async def _cache_store(
+        self, key: str | None, kind: str, resolved_model: str, response: Any
+    ) -> None:
+        """Record a provider response when the cache mode writes."""
+        cache = self.response_cache
+        if key is None or cache is None or not cache.writes:
+            return
+        await cache.put(key, kind, resolved_model, response)
+
+    # ------------------------------------------------------------------
+    # Rate governor
+    # ------------------------------------------------------------------
+
+    def _model_governor(self, resolved_model: str) -> ModelGovernor | None:
+        """Shared governor for a model, or ``None`` when ``rate_limits`` is off.
+
+        Governors are shared with every service in the process that has
+        the same limits for the model.
+        """
+        config = self._rate_governor_config
+        if not config.enabled:
+            return None
+        return get_rate_governor().for_model(resolved_model, config.limits_for(resolved_model))
+
+    def _governed(
+        self, resolved_model: str, litellm_kwargs: dict[str, Any]
+    ) -> AbstractAsyncContextManager[Permit | None]:
+        """Hold a governor slot for one provider call (no-op when disabled)."""
+        governor = self._model_governor(resolved_model)
+        if governor is None:
+            return nullcontext()
+        estimated = estimate_request_tokens(
+            litellm_kwargs.get("messages") or [], litellm_kwargs.get("tools")
+        )
+        return governor.slot(estimated)
+
+    def model_available(self, model: str | None = None) -> bool:
+        """Whether the model behind an alias currently accepts calls.
+
+        False while the rate governor holds that model's circuit open.
+        ``LLMRouter`` uses this to fail over before sending a request.
+        """
+        resolved = self._config.resolve_model(model)
+        governor = self._model_governor(resolved)
+        return governor is None or governor.available
+
     # ------------------------------------------------------------------
     # Request preparation (delegates to config loader for resolution)
     # ------------------------------------------------------------------
@@ -313,6 +439,11 @@ class LiteLLMService:
             litellm_kwargs["tools"] = tools
             litellm_kwargs["tool_choice"] = tool_choice or "auto"
 
+        caching = PromptCachingConfig.from_dict(self._config.prompt_caching_config)
+        injection_points = caching.injection_points(resolved_model, messages)
+        if injection_points:
+            litellm_kwargs["cache_control_injection_points"] = injection_points
+
         return alias, resolved_model, litellm_kwargs
 
     # ------------------------------------------------------------------
@@ -349,9 +480,14 @@ class LiteLLMService:
             tools_count=len(tools) if tools else 0,
         )
 
-        response = await litellm.acompletion(**litellm_kwargs)
-        latency_ms = int((time.time() - start_time) * 1000)
-        result = LLMResponseParser.parse_response(response, resolved_model, latency_ms)
+        async with self._governed(resolved_model, litellm_kwargs) as permit:
+            response = await litellm.acompletion(**litellm_kwargs)
+            elapsed = time.time() - start_time
+            _LLM_DURATION.labels(resolved_model, "complete", "success").observe(elapsed)
+            latency_ms = int(elapsed * 1000)
+            result = LLMResponseParser.parse_response(response, resolved_model, latency_ms)
+            if permit is not None:
+                permit.complete((result.get("usage") or {}).get("total_tokens"))
 
         self._log_completion_success(result, resolved_model, latency_ms)
         await self._trace_success(messages, result, resolved_model, latency_ms)
@@ -415,18 +551,40 @@ class LiteLLMService:
     ) -> bool:
         """Decide whether to retry or record failure after an exception.
 
+        The backoff is jittered and never shorter than the provider's
+        Retry-After hint; a hint beyond ``max_backoff_seconds`` or an open
+        circuit ends the loop.
+
         Returns:
             True if the caller should retry, False if it should break.
         """
-        is_last = attempt >= self._config.retry_policy.max_attempts - 1
-        if not is_last and self._should_retry(error):
-            backoff_time = self._config.retry_policy.backoff_multiplier**attempt
+        _LLM_DURATION.labels(resolved_model, "complete", "error").observe(
+            time.time() - start_time
+        )
+        policy = self._config.retry_policy
+        is_last = attempt >= policy.max_attempts - 1
+        retry_after = retry_after_seconds(error)
+        if (
+            not is_last
+            and not isinstance(error, CircuitOpenError)
+            and self._should_retry(error)
+            and (retry_after is None or retry_after <= policy.max_backoff_seconds)
+        ):
+            _LLM_RETRIES.labels(resolved_model).inc()
+            backoff_time = backoff_delay(
+                attempt,
+                policy.backoff_multiplier,
+                retry_after=retry_after,
+                jitter=policy.jitter,
+                cap=policy.max_backoff_seconds,
+            )
             self.logger.warning(
                 "llm_completion_retry",
                 model=resolved_model,
                 error_type=type(error).__name__,
                 attempt=attempt + 1,
-                backoff_seconds=backoff_time,
+                backoff_seconds=round(backoff_time, 3),
+                retry_after=retry_after,
             )
             await asyncio.sleep(backoff_time)
             return True
@@ -468,13 +626,27 @@ class LiteLLMService:
             messages, model, tools, tool_choice, **kwargs
         )
 
+        try:
+            cache_key, cached = await self._cache_lookup("complete", litellm_kwargs, resolved_model)
+        except LLMCacheMissError as miss:
+            return {
+                "success": False,
+                "error": str(miss),
+                "error_type": type(miss).__name__,
+                "model": resolved_model,
+            }
+        if cached is not None:
+            return {**cached, "latency_ms": 0, "cache_hit": True}
+
         last_error: Exception | None = None
         for attempt in range(self._config.retry_policy.max_attempts):
             start_time = time.time()
             try:
-                return await self._attempt_completion(
+                result = await self._attempt_completion(
                     litellm_kwargs, resolved_model, messages, tools, attempt + 1
                 )
+                await self._cache_store(cache_key, "complete", resolved_model, result)
+                return result
             except Exception as e:
                 last_error = e
                 should_retry = await self._handle_retry_or_fail(
@@ -693,6 +865,8 @@ class LiteLLMService:
         if is_content_filter:
             event["error_kind"] = "content_filter"
             event["non_retryable"] = True
+        elif isinstance(error, CircuitOpenError):
+            event["error_kind"] = "circuit_open"
         return event
 
     async def _run_stream_attempt(
@@ -700,6 +874,29 @@ class LiteLLMService:
         messages: list[dict[str, Any]],
         resolved_model: str,
         litellm_kwargs: dict[str, Any],
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Consume one streaming completion attempt under the rate governor.
+
+        The governor slot is held until the stream ends; the ``done``
+        usage reconciles the TPM estimate and a chunk-timeout ``error``
+        counts as a failure. Raises :class:`CircuitOpenError` when the
+        model's circuit is open.
+        """
+        async with self._governed(resolved_model, litellm_kwargs) as permit:
+            async for event in self._stream_provider_events(
+                messages, resolved_model, litellm_kwargs
+            ):
+                if permit is not None and event["type"] == "done":
+                    permit.complete(event["usage"].get("total_tokens"))
+                elif permit is not None and event["type"] == "error":
+                    permit.fail()
+                yield event
+
+    async def _stream_provider_events(
+        self,
+        messages: list[dict[str, Any]],
+        resolved_model: str,
+        litellm_kwargs: dict[str, Any],
     ) -> AsyncIterator[dict[str, Any]]:
         """Consume one streaming completion attempt.
 
@@ -710,11 +907,13 @@ class LiteLLMService:
         :meth:`complete_stream` can decide whether to retry on stripped
         history (content-filter recovery) or surface the error.
         """
+        request_started = time.time()
         response = await litellm.acompletion(**litellm_kwargs)
 
         current_tool_calls: dict[int, dict[str, Any]] = {}
         content_accumulated = ""
         start_time = time.time()
+        first_output_seen = False
 
         stream_usage: dict[str, Any] = {}
         stream_actual_model: str | None = None
@@ -731,6 +930,9 @@ class LiteLLMService:
                 break
             except TimeoutError:
                 latency_ms = int((time.time() - start_time) * 1000)
+                _LLM_DURATION.labels(resolved_model, "stream", "timeout").observe(
+                    time.time() - request_started
+                )
                 self.logger.warning(
                     "llm_stream_chunk_timeout",
                     model=resolved_model,
@@ -769,6 +971,12 @@ class LiteLLMService:
             delta = chunk.choices[0].delta
             finish_reason = chunk.choices[0].finish_reason
 
+            if not first_output_seen and (
+                getattr(delta, "content", None) or getattr(delta, "tool_calls", None)
+            ):
+                first_output_seen = True
+                _LLM_TTFT.labels(resolved_model).observe(time.time() - request_started)
+
             if hasattr(delta, "content") and delta.content:
                 content_accumulated += delta.content
                 yield {"type": "token", "content": delta.content}
@@ -788,6 +996,9 @@ class LiteLLMService:
                         "index": tc_idx,
                     }
 
+        _LLM_DURATION.labels(resolved_model, "stream", "success").observe(
+            time.time() - request_started
+        )
         latency_ms = int((time.time() - start_time) * 1000)
         done_event = self._build_stream_done_event(
             resolved_model,
@@ -837,6 +1048,12 @@ class LiteLLMService:
             tool_choice: Optional tool choice strategy.
             **kwargs: Additional parameters.
 
+        When the response cache is active, a hit re-emits the recorded
+        ``token`` / ``tool_call_*`` / ``done`` sequence verbatim and a miss
+        in ``replay`` mode yields a non-retryable ``error`` event with
+        ``error_kind="cache_miss"``. Only successful primary attempts are
+        recorded — content-filter recovery streams are never cached.
+
         Yields:
             Event dicts: token, tool_call_start, tool_call_delta,
             tool_call_end, done, error, stream_restart. A
@@ -850,6 +1067,22 @@ class LiteLLMService:
             messages, model, tools, tool_choice, **kwargs
         )
 
+        try:
+            cache_key, cached = await self._cache_lookup("stream", litellm_kwargs, resolved_model)
+        except LLMCacheMissError as miss:
+            yield {
+                "type": "error",
+                "message": str(miss),
+                "error_kind": "cache_miss",
+                "non_retryable": True,
+            }
+            return
+        if cached is not None:
+            for event in cached:
+                yield dict(event)
+            return
+        recorded: list[dict[str, Any]] | None = [] if cache_key is not None else None
+
         self.logger.debug(
             "llm_stream_started",
             model=resolved_model,
@@ -859,7 +1092,11 @@ class LiteLLMService:
 
         try:
             async for event in self._run_stream_attempt(messages, resolved_model, litellm_kwargs):
+                if recorded is not None:
+                    recorded.append(dict(event))
                 yield event
+            if recorded and recorded[-1].get("type") == "done":
+                await self._cache_store(cache_key, "stream", resolved_model, recorded)
             return
         except Exception as primary_error:
             if not self._is_content_filter_error(primary_error):
@@ -1489,7 +1726,9 @@ class LiteLLMService:
         trace_data = {
             "timestamp": datetime.now(UTC).isoformat(),
             "model": model,
-            "messages": messages,
+            # Copied: the record is serialized later on the writer thread,
+            # after the caller may have appended to its history list.
+            "messages": list(messages),
             "response": response_content,
             "usage": token_stats,
             "latency_ms": latency_ms,
@@ -1501,17 +1740,23 @@ class LiteLLMService:
             await self._trace_to_file(trace_data)
 
     async def _trace_to_file(self, trace_data: dict[str, Any]) -> None:
-        """Write trace data to JSONL file."""
-        try:
-            file_config = self._config.tracing_config.get("file_config", {})
-            file_path = file_config.get("path", "traces/llm_traces.jsonl")
-
-            path = Path(file_path)
-            if not path.parent.exists():
-                path.parent.mkdir(parents=True, exist_ok=True)
-
-            async with aiofiles.open(path, mode="a", encoding="utf-8") as f:
-                await f.write(json.dumps(trace_data) + "\n")
+        """Queue trace data for the shared background JSONL writer.
 
+        Serialization, file I/O and rotation happen on the writer's thread;
+        the LLM call only pays for the enqueue (see ``TraceFileWriter``).
+        """
+        try:
+            await self._trace_file_writer().put(trace_data)
         except Exception as e:
             self.logger.error("trace_file_write_failed", error=str(e))
+
+    def _trace_file_writer(self) -> TraceFileWriter:
+        """Return the writer for the configured trace file (cached per path)."""
+        file_config = self._config.tracing_config.get("file_config", {})
+        file_path = str(file_config.get("path", "traces/llm_traces.jsonl"))
+        cached = getattr(self, "_trace_writer_cache", None)
+        if cached is not None and cached[0] == file_path and not cached[1].closed:
+            return cached[1]
+        writer = get_trace_file_writer(file_path, file_config)
+        self._trace_writer_cache = (file_path, writer)
+        return writer
@@ -8,6 +8,9 @@ Handles:
 - Model alias resolution from config
 - Per-model parameter merging with defaults
 - Retry policy extraction
+- Response-cache section passthrough (see ``response_cache``)
+- Prompt-caching section passthrough (see ``prompt_caching``)
+- Rate-governor section passthrough (see ``rate_limits``)
 """
 
 from __future__ import annotations
@@ -25,11 +28,18 @@ logger = structlog.get_logger(__name__)
 
 @dataclass
 class RetryPolicy:
-    """Retry policy configuration for LLM API calls."""
+    """Retry policy configuration for LLM API calls.
+
+    ``jitter`` spreads each backoff over ``[base / 2, base]``;
+    ``max_backoff_seconds`` caps the exponential part, and a provider
+    Retry-After longer than it ends the retry loop instead of waiting.
+    """
 
     max_attempts: int = 3
     backoff_multiplier: float = 2.0
     timeout: int = 60
+    jitter: bool = True
+    max_backoff_seconds: float = 60.0
 
 
 class LLMConfigLoader:
@@ -62,6 +72,9 @@ class LLMConfigLoader:
         self.tracing_config: dict[str, Any] = {}
         self.routing_config: dict[str, Any] = {}
         self.task_complexity_config: dict[str, Any] = {}
+        self.response_cache_config: dict[str, Any] = {}
+        self.prompt_caching_config: dict[str, Any] = {}
+        self.rate_limits_config: dict[str, Any] = {}
 
         # Eagerly resolve and validate the config file path so that
         # FileNotFoundError is raised immediately (preserving existing behavior).
@@ -159,6 +172,9 @@ class LLMConfigLoader:
         self.tracing_config = config.get("tracing", {})
         self.routing_config = config.get("routing", {})
         self.task_complexity_config = config.get("task_complexity", {})
+        self.response_cache_config = config.get("response_cache", {}) or {}
+        self.prompt_caching_config = config.get("prompt_caching", {}) or {}
+        self.rate_limits_config = config.get("rate_limits", {}) or {}
         self._config_loaded = True
 
         self.logger.info(
@@ -178,6 +194,8 @@ class LLMConfigLoader:
             max_attempts=retry_cfg.get("max_attempts", 3),
             backoff_multiplier=retry_cfg.get("backoff_multiplier", 2.0),
             timeout=retry_cfg.get("timeout", 60),
+            jitter=bool(retry_cfg.get("jitter", True)),
+            max_backoff_seconds=float(retry_cfg.get("max_backoff_seconds", 60.0)),
         )
 
     async def ensure_config_loaded(self) -> None:
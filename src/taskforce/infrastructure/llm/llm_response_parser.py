@@ -164,18 +164,55 @@ class LLMResponseParser:
             response: Raw LiteLLM response object.
 
         Returns:
-            Dict with total_tokens, prompt_tokens, completion_tokens (or empty dict).
+            Dict with total_tokens, prompt_tokens, completion_tokens (or empty
+            dict), plus cached_prompt_tokens when the provider reports a
+            prompt-cache hit.
         """
         raw_usage = getattr(response, "usage", None)
         if raw_usage is None:
             return {}
         if isinstance(raw_usage, dict):
             return raw_usage
-        return {
+        usage = {
             "total_tokens": getattr(raw_usage, "total_tokens", 0) or 0,
             "prompt_tokens": getattr(raw_usage, "prompt_tokens", 0) or 0,
             "completion_tokens": getattr(raw_usage, "completion_tokens", 0) or 0,
         }
+        cached = LLMResponseParser.extract_cached_tokens(raw_usage)
+        if cached:
+            usage["cached_prompt_tokens"] = cached
+        return usage
+
+    @staticmethod
+    def extract_cached_tokens(usage: Any) -> int:
+        """Return the prompt tokens served from the provider's prompt cache.
+
+        LiteLLM normalises cache reads into
+        ``usage.prompt_tokens_details.cached_tokens``; Anthropic responses
+        also carry ``cache_read_input_tokens``. Both count *within*
+        ``prompt_tokens``.
+
+        Args:
+            usage: LiteLLM ``Usage`` object or plain usage dict.
+
+        Returns:
+            Cached prompt token count (0 when the provider reports none).
+        """
+
+        def _field(obj: Any, name: str) -> Any:
+            if obj is None:
+                return None
+            if isinstance(obj, dict):
+                return obj.get(name)
+            return getattr(obj, name, None)
+
+        for value in (
+            _field(_field(usage, "prompt_tokens_details"), "cached_tokens"),
+            _field(usage, "cache_read_input_tokens"),
+        ):
+            if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+                return value
+        return 0
 
     @staticmethod
     def init_tool_call_entry(tc: Any) -> dict[str, Any]:
@@ -13,6 +13,12 @@ Routing decisions are based on context signals:
 The router implements LLMProviderProtocol itself, so it is a drop-in
 replacement that requires no changes to agents or planning strategies.
 
+Optional ``fallbacks`` map an alias to alternatives. When the delegate
+reports the selected model as unavailable (``model_available()`` — the
+rate governor's circuit breaker is open) or a call fails with
+``CircuitOpenError``, the router moves on to the first available fallback
+instead of waiting for the circuit to close.
+
 Example profile configuration::
 
     llm:
@@ -30,6 +36,8 @@ Example profile configuration::
             model: main
           - condition: no_tools
             model: fast
+        fallbacks:
+          main: [claude-sonnet]
 """
 
 from __future__ import annotations
@@ -83,6 +91,8 @@ class LLMRouter:
         default_model: Fallback model alias when no rule matches.
         known_aliases: Set of real model aliases the delegate knows about.
             Used to distinguish "this is a real alias" from "this is a hint".
+        fallbacks: Alias -> ordered alternative aliases used while the
+            selected model's circuit is open.
     """
 
     delegate: LLMProviderProtocol
@@ -91,6 +101,7 @@ class LLMRouter:
     known_aliases: frozenset[str] = field(default_factory=frozenset)
     task_complexity_config: dict[str, Any] = field(default_factory=dict)
     complexity_override: str | None = None
+    fallbacks: dict[str, list[str]] = field(default_factory=dict)
 
     def _select_model(
         self,
@@ -197,6 +208,22 @@ class LLMRouter:
         )
         return simple_model
 
+    # ── Failover ────────────────────────────────────────────────────────
+
+    def _candidates(self, alias: str) -> list[str]:
+        """The selected alias followed by its fallbacks, available ones first.
+
+        Delegates without ``model_available`` (or with every candidate
+        unavailable) keep the configured order.
+        """
+        candidates = [alias, *[a for a in self.fallbacks.get(alias, []) if a != alias]]
+        if len(candidates) == 1 or not hasattr(self.delegate, "model_available"):
+            return candidates
+        available = [a for a in candidates if self.delegate.model_available(a)]
+        if available and available[0] != alias:
+            logger.warning("llm_router.failover", model=alias, fallback=available[0])
+        return available or candidates
+
     # ── LLMProviderProtocol implementation ──────────────────────────────
 
     async def complete(
@@ -212,13 +239,19 @@ class LLMRouter:
         See ``LLMProviderProtocol.complete`` for full documentation.
         """
         resolved = self._select_model(model, messages, tools)
-        return await self.delegate.complete(
-            messages=messages,
-            model=resolved,
-            tools=tools,
-            tool_choice=tool_choice,
-            **kwargs,
-        )
+        candidates = self._candidates(resolved)
+        for index, alias in enumerate(candidates):
+            result = await self.delegate.complete(
+                messages=messages,
+                model=alias,
+                tools=tools,
+                tool_choice=tool_choice,
+                **kwargs,
+            )
+            if result.get("error_type") != "CircuitOpenError" or index == len(candidates) - 1:
+                return result
+            logger.warning("llm_router.failover", model=alias, fallback=candidates[index + 1])
+        return result
 
     async def generate(
         self,
@@ -307,14 +340,27 @@ class LLMRouter:
         See ``LLMProviderProtocol.complete_stream`` for full documentation.
         """
         resolved = self._select_model(model, messages, tools)
-        async for chunk in self.delegate.complete_stream(
-            messages=messages,
-            model=resolved,
-            tools=tools,
-            tool_choice=tool_choice,
-            **kwargs,
-        ):
-            yield chunk
+        candidates = self._candidates(resolved)
+        for index, alias in enumerate(candidates):
+            failed_over = False
+            async for chunk in self.delegate.complete_stream(
+                messages=messages,
+                model=alias,
+                tools=tools,
+                tool_choice=tool_choice,
+                **kwargs,
+            ):
+                # An open circuit is reported before any output, so the
+                # next candidate can take over without a stream_restart.
+                if chunk.get("error_kind") == "circuit_open" and index < len(candidates) - 1:
+                    logger.warning(
+                        "llm_router.failover", model=alias, fallback=candidates[index + 1]
+                    )
+                    failed_over = True
+                    break
+                yield chunk
+            if not failed_over:
+                return
 
 
 def build_llm_router(
@@ -357,6 +403,10 @@ def build_llm_router(
         known_aliases = frozenset(delegate.models.keys())
 
     router_default = routing_config.get("default_model", default_model)
+    fallbacks = {
+        str(alias): [str(a) for a in ([targets] if isinstance(targets, str) else targets or [])]
+        for alias, targets in (routing_config.get("fallbacks") or {}).items()
+    }
 
     logger.info(
         "llm_router.initialized",
@@ -371,4 +421,5 @@ def build_llm_router(
         rules=rules,
         default_model=router_default,
         known_aliases=known_aliases,
+        fallbacks=fallbacks,
     )
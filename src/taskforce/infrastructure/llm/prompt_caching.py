@@ -0,0 +1,86 @@
+"""Provider prompt-cache breakpoints for LiteLLM requests.
+
+OpenAI and Azure cache request prefixes automatically; they only need
+the stable message layout produced by
+:class:`~taskforce.core.domain.prompt_layout.PromptLayout`. Anthropic
+(and Claude via Bedrock / Vertex) caches only up to explicit
+``cache_control`` breakpoints. LiteLLM inserts those from the
+``cache_control_injection_points`` request parameter, so this module
+decides where they go:
+
+* ``messages[0]`` — the system prompt; together with the tool schemas
+  that providers render before it, this is the long-lived prefix.
+* the last history message — the message *before* the volatile tail when
+  one is present, so each step reads the previous step's prefix from
+  the cache and writes the extended one.
+
+Configured by the ``prompt_caching`` section of ``llm_config.yaml``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from taskforce.core.domain.prompt_layout import is_volatile_context_message
+
+DEFAULT_BREAKPOINT_PROVIDERS = ("anthropic", "bedrock", "vertex_ai")
+
+
+@dataclass(frozen=True)
+class PromptCachingConfig:
+    """Settings for explicit cache breakpoints.
+
+    Attributes:
+        enabled: Master switch; when False no breakpoints are injected.
+        breakpoint_providers: LiteLLM provider prefixes whose models take
+            ``cache_control`` breakpoints. Bare ``claude-*`` model ids
+            count as ``anthropic``.
+    """
+
+    enabled: bool = True
+    breakpoint_providers: tuple[str, ...] = DEFAULT_BREAKPOINT_PROVIDERS
+
+    @classmethod
+    def from_dict(cls, raw: Mapping[str, Any] | None) -> PromptCachingConfig:
+        """Build from the ``prompt_caching`` config section (missing = defaults)."""
+        raw = raw or {}
+        providers = raw.get("breakpoint_providers")
+        return cls(
+            enabled=bool(raw.get("enabled", True)),
+            breakpoint_providers=(
+                tuple(str(p) for p in providers)
+                if providers is not None
+                else DEFAULT_BREAKPOINT_PROVIDERS
+            ),
+        )
+
+    def uses_breakpoints(self, model: str) -> bool:
+        """Return True if *model* should receive ``cache_control`` breakpoints."""
+        if not self.enabled:
+            return False
+        provider = model.split("/", 1)[0] if "/" in model else ""
+        if not provider and model.startswith("claude"):
+            provider = "anthropic"
+        return provider in self.breakpoint_providers
+
+    def injection_points(
+        self, model: str, messages: Sequence[Mapping[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Return LiteLLM ``cache_control_injection_points`` for a request.
+
+        Empty when the model takes no breakpoints or the request is too
+        short to have a reusable prefix.
+        """
+        if not messages or not self.uses_breakpoints(model):
+            return []
+        points: list[dict[str, Any]] = []
+        if messages[0].get("role") == "system":
+            points.append({"location": "message", "index": 0})
+        last = len(messages) - 1
+        if is_volatile_context_message(messages[last]):
+            last -= 1
+        if last > 0:
+            points.append({"location": "message", "index": last})
+        return points
@@ -0,0 +1,32 @@
+"""Provider environment normalisation for LiteLLM.
+
+Kept free of the ``litellm`` import so entry points (API server, CLI)
+can apply it early without paying LiteLLM's multi-second import time.
+"""
+
+from __future__ import annotations
+
+import os
+
+
+def apply_litellm_env_defaults() -> None:
+    """Quiet LiteLLM logging and map Azure env vars to LiteLLM's names.
+
+    Idempotent; never overrides a variable that is already set.
+    """
+    # Suppress LiteLLM verbose logging before import
+    os.environ.setdefault("LITELLM_LOG_LEVEL", "ERROR")
+    os.environ.setdefault("LITELLM_LOGGING", "off")
+    os.environ.setdefault("HTTPX_LOG_LEVEL", "warning")
+
+    # Map AZURE_OPENAI_* to AZURE_* for LiteLLM compatibility.
+    # LiteLLM expects AZURE_API_KEY, AZURE_API_BASE, AZURE_API_VERSION.
+    # Many projects use AZURE_OPENAI_API_KEY, AZURE_OPENAI_ENDPOINT (Microsoft convention).
+    # Without this, api_base=None causes: "argument of type 'NoneType' is not iterable".
+    if not os.environ.get("AZURE_API_KEY") and os.environ.get("AZURE_OPENAI_API_KEY"):
+        os.environ["AZURE_API_KEY"] = os.environ["AZURE_OPENAI_API_KEY"]
+    if not os.environ.get("AZURE_API_BASE") and os.environ.get("AZURE_OPENAI_ENDPOINT"):
+        endpoint = os.environ["AZURE_OPENAI_ENDPOINT"].rstrip("/")
+        os.environ["AZURE_API_BASE"] = f"{endpoint}/"
+    if not os.environ.get("AZURE_API_VERSION") and os.environ.get("AZURE_OPENAI_API_VERSION"):
+        os.environ["AZURE_API_VERSION"] = os.environ["AZURE_OPENAI_API_VERSION"]
@@ -0,0 +1,697 @@
+"""
+Process-wide rate governor for LLM provider calls.
+
+Internal helper for LiteLLMService. Not part of the public API.
+
+Agents, sub-agents and daemons in one process share model deployments
+and the provider's per-deployment limits. Without coordination every
+worker sends as fast as it can, they all hit 429 together and then retry
+in lockstep. One :class:`ModelGovernor` per resolved model string gates
+every attempt through:
+
+- **token buckets** for requests per minute (``rpm``) and tokens per
+  minute (``tpm``). The TPM bucket is debited with the estimated prompt
+  tokens before the call and reconciled against the reported usage after
+  it. Reservations may drive a bucket negative; later callers then wait
+  in order until it has refilled.
+- **adaptive concurrency** (AIMD): the in-flight limit grows by roughly
+  one per window of successful calls and is multiplied by
+  ``decrease_factor`` on a 429/overload signal. Only one decrease is
+  applied per congestion event: failures of calls that started before
+  the last decrease are ignored.
+- **Retry-After**: a throttled response pauses every new caller for the
+  model until the provider's hint has elapsed.
+- **a circuit breaker**: ``failure_threshold`` consecutive transient
+  failures (a burst of 429s counting once, like for the limiter) open
+  the circuit for ``cooldown_seconds``. Calls fail fast
+  with :class:`CircuitOpenError` until then, and :class:`LLMRouter` can
+  fail over to another alias. After the cooldown one probe call is
+  allowed through (half-open); its outcome closes or re-opens the
+  circuit.
+
+Each service reads the ``rate_limits`` section of its own
+``llm_config.yaml``; governing is off unless ``enabled`` is set there.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, fields, replace
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import structlog
+
+from taskforce.core.domain.heuristic_token_estimator import HeuristicTokenEstimator
+from taskforce.core.utils.metrics import get_metrics_registry
+
+logger = structlog.get_logger(__name__)
+
+_THROTTLED = get_metrics_registry().counter(
+    "taskforce_llm_throttled_total",
+    "Provider calls rejected with 429/overload, by model.",
+    ("model",),
+)
+_CONCURRENCY_LIMIT = get_metrics_registry().gauge(
+    "taskforce_llm_concurrency_limit",
+    "Current adaptive in-flight limit per model.",
+    ("model",),
+)
+_CIRCUIT_STATE = get_metrics_registry().gauge(
+    "taskforce_llm_circuit_state",
+    "Circuit breaker state per model (0 closed, 1 open or probing).",
+    ("model",),
+)
+
+# Error type names / status codes / message fragments that mean "slow down".
+_OVERLOAD_ERROR_TYPES = frozenset({"RateLimitError", "ServiceUnavailableError"})
+_OVERLOAD_STATUS_CODES = frozenset({429, 503, 529})
+_OVERLOAD_PATTERN = re.compile(
+    r"\b(?:429|503|529)\b|rate limit|ratelimit|too many requests|overloaded"
+)
+
+# Transient failures that count towards the circuit breaker besides overload.
+_TRANSIENT_ERROR_TYPES = frozenset(
+    {"APIConnectionError", "Timeout", "InternalServerError", "BadGatewayError"}
+)
+_TRANSIENT_PATTERN = re.compile(r"\b(?:500|502|504)\b|timeout|timed out")
+
+_RETRY_AFTER_PATTERN = re.compile(
+    r"(?:retry[- ]after|try again in)\D{0,3}(\d+(?:\.\d+)?)\s*"
+    r"(ms|milliseconds?|s|sec|seconds?)?",
+    re.IGNORECASE,
+)
+
+_estimator = HeuristicTokenEstimator()
+
+
+# ----------------------------------------------------------------------
+# Configuration
+# ----------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class RateLimits:
+    """Limits and tuning for one model deployment.
+
+    Attributes:
+        rpm: Requests per minute, or ``None`` for no request bucket.
+        tpm: Tokens per minute, or ``None`` for no token bucket.
+        max_concurrency: Upper bound (and starting value) of the adaptive
+            in-flight limit.
+        min_concurrency: The limit never drops below this.
+        decrease_factor: Multiplier applied to the limit on overload.
+        failure_threshold: Consecutive transient failures that open the
+            circuit.
+        cooldown_seconds: How long an open circuit rejects calls before
+            letting a probe through.
+    """
+
+    rpm: int | None = None
+    tpm: int | None = None
+    max_concurrency: int = 32
+    min_concurrency: int = 1
+    decrease_factor: float = 0.5
+    failure_threshold: int = 5
+    cooldown_seconds: float = 30.0
+
+    def merged(self, overrides: Mapping[str, Any] | None) -> RateLimits:
+        """Return a copy with the known keys of ``overrides`` applied."""
+        known = {f.name for f in fields(self)}
+        changes = {k: v for k, v in (overrides or {}).items() if k in known}
+        return replace(self, **changes) if changes else self
+
+
+@dataclass(frozen=True)
+class RateGovernorConfig:
+    """The ``rate_limits`` section of ``llm_config.yaml``.
+
+    Attributes:
+        enabled: Gate provider calls through the governor.
+        defaults: Limits for models without their own entry.
+        models: Limits per resolved model string.
+    """
+
+    enabled: bool = False
+    defaults: RateLimits = field(default_factory=RateLimits)
+    models: Mapping[str, RateLimits] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(
+        cls, section: Mapping[str, Any] | None, aliases: Mapping[str, str] | None = None
+    ) -> RateGovernorConfig:
+        """Build the config from YAML.
+
+        Per-model entries may be keyed by alias or by model string; alias
+        keys are resolved through ``aliases`` so every alias of one
+        deployment shares its limits. Entries inherit from ``defaults``.
+        """
+        section = section or {}
+        defaults = RateLimits().merged(section.get("defaults"))
+        models: dict[str, RateLimits] = {}
+        for key, overrides in (section.get("models") or {}).items():
+            resolved = (aliases or {}).get(key, key)
+            models[resolved] = defaults.merged(overrides)
+        return cls(enabled=bool(section.get("enabled", False)), defaults=defaults, models=models)
+
+    def limits_for(self, model: str) -> RateLimits:
+        """Limits for a resolved model string (exact, then without provider prefix)."""
+        if model in self.models:
+            return self.models[model]
+        bare = model.split("/", 1)[1] if "/" in model else model
+        return self.models.get(bare, self.defaults)
+
+
+# ----------------------------------------------------------------------
+# Error classification and backoff
+# ----------------------------------------------------------------------
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a model whose circuit breaker is open."""
+
+    def __init__(self, model: str, retry_in: float) -> None:
+        super().__init__(
+            f"Circuit open for model {model}: too many consecutive failures, "
+            f"next probe in {retry_in:.1f}s"
+        )
+        self.model = model
+        self.retry_in = retry_in
+
+
+def _status_code(error: BaseException) -> int | None:
+    code = getattr(error, "status_code", None)
+    return code if isinstance(code, int) else None
+
+
+def is_overload(error: BaseException) -> bool:
+    """Whether ``error`` asks the client to slow down (429, 503, 529)."""
+    if type(error).__name__ in _OVERLOAD_ERROR_TYPES:
+        return True
+    if _status_code(error) in _OVERLOAD_STATUS_CODES:
+        return True
+    return _OVERLOAD_PATTERN.search(str(error).lower()) is not None
+
+
+def is_transient_failure(error: BaseException) -> bool:
+    """Whether ``error`` says the deployment is unhealthy (for the breaker)."""
+    if is_overload(error) or type(error).__name__ in _TRANSIENT_ERROR_TYPES:
+        return True
+    code = _status_code(error)
+    if code is not None and code >= 500:
+        return True
+    return _TRANSIENT_PATTERN.search(str(error).lower()) is not None
+
+
+def retry_after_seconds(error: BaseException) -> float | None:
+    """Extract the provider's Retry-After hint from an exception.
+
+    Looks at a ``retry_after`` attribute, then the ``retry-after-ms`` and
+    ``retry-after`` headers of ``error.response`` (seconds or HTTP date),
+    then phrases like "retry after 20 seconds" in the message.
+    """
+    value = getattr(error, "retry_after", None)
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return max(0.0, float(value))
+
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is not None:
+        try:
+            lowered = {str(k).lower(): str(v) for k, v in dict(headers).items()}
+        except (TypeError, ValueError):
+            lowered = {}
+        if "retry-after-ms" in lowered:
+            try:
+                return max(0.0, float(lowered["retry-after-ms"]) / 1000)
+            except ValueError:
+                pass
+        if "retry-after" in lowered:
+            parsed = _parse_retry_after(lowered["retry-after"])
+            if parsed is not None:
+                return parsed
+
+    match = _RETRY_AFTER_PATTERN.search(str(error))
+    if match:
+        amount = float(match.group(1))
+        unit = (match.group(2) or "s").lower()
+        return amount / 1000 if unit.startswith("m") else amount
+    return None
+
+
+def _parse_retry_after(value: str) -> float | None:
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+def backoff_delay(
+    attempt: int,
+    multiplier: float,
+    *,
+    retry_after: float | None = None,
+    jitter: bool = True,
+    cap: float | None = None,
+) -> float:
+    """Delay before retry ``attempt`` (0-based).
+
+    The exponential base ``multiplier ** attempt`` is spread over
+    ``[base / 2, base]`` ("equal jitter") so clients that failed together
+    do not retry together. A Retry-After hint is a lower bound. ``cap``
+    bounds the exponential part only.
+    """
+    base = float(multiplier**attempt)
+    if cap is not None:
+        base = min(base, cap)
+    delay = random.uniform(base / 2, base) if jitter else base
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+def estimate_request_tokens(
+    messages: list[dict[str, Any]], tools: list[dict[str, Any]] | None = None
+) -> int:
+    """Cheap prompt-size estimate used to debit the TPM bucket up front."""
+    tokens = 0
+    for message in messages:
+        content = message.get("content")
+        if content is not None and not isinstance(content, str):
+            content = json.dumps(content, default=str)
+        tokens += _estimator.count_tokens(content or "") + _estimator.count_message_overhead()
+        if message.get("tool_calls"):
+            tokens += _estimator.count_tokens(json.dumps(message["tool_calls"], default=str))
+    if tools:
+        tokens += _estimator.count_tokens(json.dumps(tools, default=str))
+        tokens += _estimator.count_tool_schema_overhead() * len(tools)
+    return tokens
+
+
+# ----------------------------------------------------------------------
+# Building blocks
+# ----------------------------------------------------------------------
+
+
+class TokenBucket:
+    """Continuously refilling bucket holding one minute of allowance.
+
+    :meth:`reserve` debits immediately and returns how long the caller
+    must wait for the debit to be covered, so concurrent callers queue in
+    order without a lock (the event loop is single-threaded).
+    """
+
+    def __init__(self, per_minute: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.capacity = float(per_minute)
+        self._rate = self.capacity / 60.0
+        self._clock = clock
+        self._level = self.capacity
+        self._updated = clock()
+
+    @property
+    def level(self) -> float:
+        self._refill()
+        return self._level
+
+    def reserve(self, amount: float) -> float:
+        """Debit ``amount`` (at most one minute's worth); return seconds to wait."""
+        self._refill()
+        self._level -= min(float(amount), self.capacity)
+        return 0.0 if self._level >= 0 else -self._level / self._rate
+
+    def adjust(self, delta: float) -> None:
+        """Debit ``delta`` more (or refund if negative) after the fact."""
+        self._refill()
+        self._level = min(self.capacity, self._level - delta)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._level = min(self.capacity, self._level + (now - self._updated) * self._rate)
+        self._updated = now
+
+
+class AdaptiveConcurrencyLimiter:
+    """FIFO in-flight limiter whose limit follows AIMD."""
+
+    def __init__(
+        self,
+        maximum: int,
+        minimum: int = 1,
+        decrease_factor: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maximum = max(1, int(maximum))
+        self.minimum = max(1, min(int(minimum), self.maximum))
+        self.decrease_factor = min(max(float(decrease_factor), 0.1), 0.95)
+        self._clock = clock
+        self._limit = float(self.maximum)
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def limit(self) -> int:
+        return max(self.minimum, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()  # granted just before the cancellation landed
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        self._in_flight -= 1
+        self._wake()
+
+    def increase(self) -> None:
+        """Additive increase: about +1 per ``limit`` successful calls."""
+        if self._limit < self.maximum:
+            self._limit = min(float(self.maximum), self._limit + 1.0 / self._limit)
+            self._wake()
+
+    def decrease(self, started_at: float) -> bool:
+        """Multiplicative decrease, once per congestion event.
+
+        Returns:
+            False when the signal came from a call that started before the
+            last decrease (already accounted for).
+        """
+        if started_at < self._last_decrease:
+            return False
+        self._limit = max(float(self.minimum), self._limit * self.decrease_factor)
+        self._last_decrease = self._clock()
+        return True
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done() or waiter.get_loop().is_closed():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker counting consecutive failures."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        cooldown_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.cooldown_seconds = max(0.0, float(cooldown_seconds))
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and self.retry_in() == 0.0:
+            return self.HALF_OPEN
+        return self._state
+
+    @property
+    def available(self) -> bool:
+        """Whether a call would currently be let through."""
+        state = self.state
+        return state == self.CLOSED or (state == self.HALF_OPEN and not self._probing)
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit lets a probe through."""
+        if self._state != self.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.cooldown_seconds - self._clock())
+
+    def try_acquire(self) -> bool:
+        """Admit a call; in half-open state only one probe at a time."""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._probing:
+            self._state = self.HALF_OPEN
+            self._probing = True
+            return True
+        return False
+
+    def release_probe(self) -> None:
+        """Forget an admitted probe whose call never produced an outcome."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        self._state = self.CLOSED
+        self._failures = 0
+        self._probing = False
+
+    def record_failure(self) -> bool:
+        """Count a failure; returns True if this opened the circuit."""
+        self._failures += 1
+        if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            was_open = self._state == self.OPEN
+            self._state = self.OPEN
+            self._opened_at = self._clock()
+            self._probing = False
+            return not was_open
+        return False
+
+
+# ----------------------------------------------------------------------
+# Governor
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class Permit:
+    """One admitted call; the caller reports usage or failure on it."""
+
+    estimated_tokens: int = 0
+    started_at: float = 0.0
+    total_tokens: int | None = None
+    failed: bool = False
+
+    def complete(self, total_tokens: int | None) -> None:
+        """Report the provider's token usage for TPM reconciliation."""
+        self.total_tokens = total_tokens
+
+    def fail(self) -> None:
+        """Mark a transient failure that did not raise (e.g. stream stall)."""
+        self.failed = True
+
+
+class ModelGovernor:
+    """Gates calls to one resolved model (see module docstring)."""
+
+    def __init__(
+        self,
+        model: str,
+        limits: RateLimits,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.model = model
+        self.limits = limits
+        self._clock = clock
+        self._requests = TokenBucket(limits.rpm, clock) if limits.rpm else None
+        self._tokens = TokenBucket(limits.tpm, clock) if limits.tpm else None
+        self.limiter = AdaptiveConcurrencyLimiter(
+            limits.max_concurrency, limits.min_concurrency, limits.decrease_factor, clock
+        )
+        self.breaker = CircuitBreaker(limits.failure_threshold, limits.cooldown_seconds, clock)
+        self._paused_until = 0.0
+        _CONCURRENCY_LIMIT.labels(model).set(self.limiter.limit)
+
+    @property
+    def available(self) -> bool:
+        """Whether the circuit currently admits calls."""
+        return self.breaker.available
+
+    @asynccontextmanager
+    async def slot(self, estimated_tokens: int = 0) -> AsyncIterator[Permit]:
+        """Wait for capacity and hold one in-flight slot for the call.
+
+        An exception leaving the block is classified (overload, transient
+        or neither) and fed back into the limiter and breaker.
+
+        Raises:
+            CircuitOpenError: When the circuit is open.
+        """
+        if not self.breaker.try_acquire():
+            raise CircuitOpenError(self.model, self.breaker.retry_in())
+        permit = Permit(estimated_tokens=estimated_tokens)
+        try:
+            await self.limiter.acquire()
+        except BaseException:
+            self.breaker.release_probe()
+            raise
+        # Rate and Retry-After waits happen while holding the slot, so a
+        # caller admitted by the limiter still sees a pause set meanwhile.
+        try:
+            await self._wait_for_capacity(estimated_tokens)
+        except BaseException:
+            self.limiter.release()
+            self.breaker.release_probe()
+            raise
+        permit.started_at = self._clock()
+        try:
+            yield permit
+        except Exception as error:
+            self._on_error(error, permit)
+            raise
+        except BaseException:
+            self.breaker.release_probe()  # cancelled / closed consumer
+            raise
+        else:
+            if permit.failed:
+                self._record_failure()
+            else:
+                self._on_success(permit)
+        finally:
+            self.limiter.release()
+
+    def record_throttle(self, retry_after: float | None, started_at: float) -> bool:
+        """React to a 429/overload: shrink concurrency, honour Retry-After.
+
+        Returns:
+            True when this was a new congestion event (the limit shrank),
+            False for a call that was already in flight at the last one.
+        """
+        _THROTTLED.labels(self.model).inc()
+        fresh = self.limiter.decrease(started_at)
+        if fresh:
+            _CONCURRENCY_LIMIT.labels(self.model).set(self.limiter.limit)
+            logger.warning(
+                "rate_governor.concurrency_decreased",
+                model=self.model,
+                limit=self.limiter.limit,
+            )
+        if retry_after:
+            self._paused_until = max(self._paused_until, self._clock() + retry_after)
+            logger.info("rate_governor.paused", model=self.model, retry_after=retry_after)
+        return fresh
+
+    async def _wait_for_capacity(self, tokens: int) -> None:
+        while (pause := self._paused_until - self._clock()) > 0:
+            await asyncio.sleep(pause)
+        delay = self._requests.reserve(1) if self._requests else 0.0
+        if self._tokens and tokens:
+            delay = max(delay, self._tokens.reserve(tokens))
+        if delay <= 0:
+            return
+        logger.debug("rate_governor.waiting", model=self.model, seconds=round(delay, 3))
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            if self._requests:
+                self._requests.adjust(-1)
+            if self._tokens and tokens:
+                self._tokens.adjust(-tokens)
+            raise
+
+    def _on_success(self, permit: Permit) -> None:
+        self.limiter.increase()
+        _CONCURRENCY_LIMIT.labels(self.model).set(self.limiter.limit)
+        self.breaker.record_success()
+        _CIRCUIT_STATE.labels(self.model).set(0)
+        if self._tokens and permit.total_tokens is not None:
+            self._tokens.adjust(permit.total_tokens - permit.estimated_tokens)
+
+    def _on_error(self, error: Exception, permit: Permit) -> None:
+        if is_overload(error):
+            # A burst of 429s from calls that were in flight together is
+            # one congestion event for the breaker, as for the limiter.
+            if self.record_throttle(retry_after_seconds(error), permit.started_at):
+                self._record_failure()
+        elif is_transient_failure(error):
+            self._record_failure()
+        else:
+            # The deployment answered (e.g. a 400); it is not unhealthy.
+            self.breaker.record_success()
+            _CIRCUIT_STATE.labels(self.model).set(0)
+
+    def _record_failure(self) -> None:
+        if self.breaker.record_failure():
+            logger.warning(
+                "rate_governor.circuit_opened",
+                model=self.model,
+                cooldown_seconds=self.breaker.cooldown_seconds,
+            )
+        _CIRCUIT_STATE.labels(self.model).set(1)
+
+
+class RateGovernor:
+    """Registry of :class:`ModelGovernor` instances keyed by model and limits.
+
+    Each service passes the limits from its own ``rate_limits`` section.
+    Services configured alike share one governor per model; a service
+    with other limits gets its own, so it neither replaces a governor
+    whose slots are held nor switches governing off for the others.
+    """
+
+    def __init__(self) -> None:
+        self._governors: dict[tuple[str, RateLimits], ModelGovernor] = {}
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        """Drop all per-model state."""
+        with self._lock:
+            self._governors.clear()
+
+    def for_model(self, model: str, limits: RateLimits) -> ModelGovernor:
+        """The shared governor for ``model`` under ``limits``."""
+        key = (model, limits)
+        governor = self._governors.get(key)
+        if governor is None:
+            with self._lock:
+                governor = self._governors.get(key)
+                if governor is None:
+                    governor = ModelGovernor(model, limits)
+                    self._governors[key] = governor
+        return governor
+
+
+_governor = RateGovernor()
+
+
+def get_rate_governor() -> RateGovernor:
+    """Return the process-wide rate governor."""
+    return _governor
+
+
+def reset_rate_governor() -> None:
+    """Drop all per-model state (tests)."""
+    _governor.reset()
@@ -0,0 +1,233 @@
+"""
+Record/replay response cache for LiteLLMService.
+
+Internal helper for LiteLLMService. Not part of the public API.
+
+Evals, autooptim campaigns and local development re-send byte-identical
+prompts to the provider over and over. This cache keys every request by a
+SHA-256 over its canonicalized payload (messages + tools + tool_choice +
+resolved model + sampling params) and stores the normalized response in an
+on-disk content-addressed store, so a rerun can be served without touching
+the provider.
+
+Modes:
+- ``off`` — cache disabled (default).
+- ``record`` — always call the provider and (over)write the entry.
+- ``replay`` — serve only from the cache; a miss is an error. Gives a
+  deterministic, network-free substrate for benchmarks and CI.
+- ``read_through`` — serve hits from the cache, call the provider on a
+  miss and record the result.
+
+Blocking completions store the normalized result dict; streaming
+completions store the exact ``token`` / ``tool_call_*`` / ``done`` event
+sequence so a replay re-emits what the consumer saw the first time.
+
+Directory Structure:
+    cache_dir/
+        ab/
+            ab12…ef.json    # {"key", "kind", "model", "created_at", "response"}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+from datetime import UTC, datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from taskforce.core.utils.atomic_io import atomic_write_text
+
+logger = structlog.get_logger(__name__)
+
+# Environment overrides so eval runs can flip the cache on without editing
+# llm_config.yaml (e.g. ``TASKFORCE_LLM_CACHE_MODE=replay pytest evals/``).
+CACHE_MODE_ENV = "TASKFORCE_LLM_CACHE_MODE"
+CACHE_DIR_ENV = "TASKFORCE_LLM_CACHE_DIR"
+
+DEFAULT_CACHE_DIR = ".taskforce/llm_cache"
+
+# LiteLLM kwargs that influence transport, not the model output. They are
+# excluded from the request key so e.g. a different timeout or an API key
+# rotation does not invalidate recorded responses.
+_NON_SEMANTIC_KEYS = frozenset(
+    {
+        "messages",
+        "tools",
+        "tool_choice",
+        "model",
+        "timeout",
+        "drop_params",
+        "stream",
+        "stream_options",
+        "metadata",
+        "api_key",
+    }
+)
+
+# Bump when the stored entry layout changes so stale entries read as misses.
+_ENTRY_VERSION = 1
+
+
+class CacheMode(str, Enum):
+    """Operating mode of :class:`LLMResponseCache`."""
+
+    OFF = "off"
+    RECORD = "record"
+    REPLAY = "replay"
+    READ_THROUGH = "read_through"
+
+
+class LLMCacheMissError(LookupError):
+    """Raised when ``replay`` mode finds no recorded response for a request."""
+
+    def __init__(self, key: str, model: str) -> None:
+        super().__init__(
+            f"LLM response cache miss in replay mode (model={model}, key={key[:16]}…). "
+            f"Record the run first with {CACHE_MODE_ENV}=record or read_through."
+        )
+        self.key = key
+        self.model = model
+
+
+def canonical_request_key(kind: str, litellm_kwargs: dict[str, Any]) -> str:
+    """Compute the content address for a prepared LiteLLM request.
+
+    Args:
+        kind: ``"complete"`` or ``"stream"`` — the two are stored in
+            different shapes and therefore never share an entry.
+        litellm_kwargs: Kwargs as built by ``LiteLLMService._prepare_request``.
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON payload.
+    """
+    params = {k: v for k, v in litellm_kwargs.items() if k not in _NON_SEMANTIC_KEYS}
+    payload = {
+        "v": _ENTRY_VERSION,
+        "kind": kind,
+        "model": litellm_kwargs.get("model"),
+        "messages": litellm_kwargs.get("messages") or [],
+        "tools": litellm_kwargs.get("tools") or [],
+        "tool_choice": litellm_kwargs.get("tool_choice") if litellm_kwargs.get("tools") else None,
+        "params": params,
+    }
+    canonical = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """On-disk content-addressed store for LLM responses.
+
+    Args:
+        cache_dir: Root directory of the store.
+        mode: One of :class:`CacheMode` (or its string value).
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path = DEFAULT_CACHE_DIR,
+        mode: CacheMode | str = CacheMode.READ_THROUGH,
+    ) -> None:
+        self.cache_dir = Path(cache_dir).resolve()
+        self.mode = CacheMode(mode)
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None) -> LLMResponseCache | None:
+        """Build a cache from the ``response_cache`` config section.
+
+        Environment variables ``TASKFORCE_LLM_CACHE_MODE`` and
+        ``TASKFORCE_LLM_CACHE_DIR`` take precedence over the YAML values.
+
+        Returns:
+            A cache instance, or ``None`` when the resolved mode is ``off``.
+
+        Raises:
+            ValueError: If the configured mode is not a valid ``CacheMode``.
+        """
+        config = config or {}
+        raw_mode = os.environ.get(CACHE_MODE_ENV) or config.get("mode") or CacheMode.OFF.value
+        mode = CacheMode(str(raw_mode).strip().lower().replace("-", "_"))
+        if mode is CacheMode.OFF:
+            return None
+        cache_dir = os.environ.get(CACHE_DIR_ENV) or config.get("path") or DEFAULT_CACHE_DIR
+        return cls(cache_dir=cache_dir, mode=mode)
+
+    # ------------------------------------------------------------------
+    # Mode helpers
+    # ------------------------------------------------------------------
+
+    @property
+    def reads(self) -> bool:
+        """Whether lookups are served from the store in this mode."""
+        return self.mode in (CacheMode.REPLAY, CacheMode.READ_THROUGH)
+
+    @property
+    def writes(self) -> bool:
+        """Whether provider responses are recorded in this mode."""
+        return self.mode in (CacheMode.RECORD, CacheMode.READ_THROUGH)
+
+    @property
+    def replay_only(self) -> bool:
+        """Whether a miss must fail instead of falling through to the provider."""
+        return self.mode is CacheMode.REPLAY
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    async def get(self, key: str) -> Any | None:
+        """Return the stored response for *key*, or ``None`` on a miss.
+
+        Unreadable or corrupt entries are treated as misses so a damaged
+        store degrades to provider calls instead of failing the run.
+        """
+        path = self._entry_path(key)
+        try:
+            raw = await asyncio.to_thread(path.read_text, encoding="utf-8")
+            entry = json.loads(raw)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("llm_cache_entry_unreadable", key=key, error=str(exc))
+            self.misses += 1
+            return None
+
+        if entry.get("v") != _ENTRY_VERSION:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry.get("response")
+
+    async def put(self, key: str, kind: str, model: str, response: Any) -> None:
+        """Store *response* under *key* (atomic; last writer wins)."""
+        path = self._entry_path(key)
+        entry = {
+            "v": _ENTRY_VERSION,
+            "key": key,
+            "kind": kind,
+            "model": model,
+            "created_at": datetime.now(UTC).isoformat(),
+            "response": response,
+        }
+        try:
+            await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+            await atomic_write_text(
+                path, json.dumps(entry, ensure_ascii=False, default=str)
+            )
+        except OSError as exc:
+            # Recording is best-effort — never fail a live call because the
+            # cache volume is full or read-only.
+            logger.warning("llm_cache_write_failed", key=key, error=str(exc))
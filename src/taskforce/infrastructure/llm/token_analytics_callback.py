@@ -36,6 +36,7 @@ from taskforce.core.domain.token_analytics import (
     LLMCallRecord,
     build_summary,
 )
+from taskforce.infrastructure.llm.llm_response_parser import LLMResponseParser
 
 logger = structlog.get_logger(__name__)
 
@@ -121,6 +122,7 @@ class TokenAnalyticsCallback(litellm.integrations.custom_logger.CustomLogger):
                     "prompt_tokens": getattr(u, "prompt_tokens", 0) or 0,
                     "completion_tokens": getattr(u, "completion_tokens", 0) or 0,
                     "total_tokens": getattr(u, "total_tokens", 0) or 0,
+                    "cached_prompt_tokens": LLMResponseParser.extract_cached_tokens(u),
                 }
 
             # Latency
@@ -155,6 +157,7 @@ class TokenAnalyticsCallback(litellm.integrations.custom_logger.CustomLogger):
                 prompt_tokens=usage.get("prompt_tokens", 0),
                 completion_tokens=usage.get("completion_tokens", 0),
                 total_tokens=usage.get("total_tokens", 0),
+                cached_prompt_tokens=usage.get("cached_prompt_tokens", 0),
                 latency_ms=latency_ms,
                 tool_call_names=tool_call_names,
                 timestamp=now,
@@ -173,6 +176,7 @@ class TokenAnalyticsCallback(litellm.integrations.custom_logger.CustomLogger):
                     model=model,
                     prompt_tokens=record.prompt_tokens,
                     completion_tokens=record.completion_tokens,
+                    cached_prompt_tokens=record.cached_prompt_tokens,
                 )
             except Exception:
                 logger.debug("token_ledger_record_failed", exc_info=True)
@@ -5,13 +5,26 @@ directory prefix encodes the page kind (``entities``, ``preferences``,
 ``concepts``, ...).  ``index.md`` is regenerated after every mutation;
 ``log.md`` is append-only.
 
-The store performs no caching — wikis are expected to stay small
-(~hundreds of pages) and on-demand file I/O is cheap at that scale.
+The store keeps a :class:`WikiLinkGraph` (links, title and index hook
+per page) so lint, backlink lookups and ``index.md`` never have to read
+every page body. It is persisted as a snapshot (``.link_graph.json``)
+plus an append-only journal of changes (``.link_graph.jsonl``) that is
+folded into the snapshot when the next store instance loads it, or once
+it grows past ``_GRAPH_JOURNAL_MAX_LINES``. Several store instances
+(and processes) may share one root: before the graph is used or
+persisted, the journal lines other writers appended since are replayed,
+and a snapshot rewritten by another writer makes the graph reload, so
+``index.md`` and link lookups include their pages. Pages edited outside the
+store are picked up on load and on ``link_graph(rescan=True)`` by
+comparing each file's mtime and size with the ones recorded in the
+graph — a stat per page, and a read only for pages that changed.
 """
 
 from __future__ import annotations
 
 import asyncio
+import json
+import os
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -19,8 +32,9 @@ from typing import Any
 import structlog
 import yaml
 
+from taskforce.core.domain.wiki_link_graph import WikiLinkEntry, WikiLinkGraph
 from taskforce.core.domain.wiki_page import WikiPage
-from taskforce.core.domain.wiki_service import apply_section_update, render_index
+from taskforce.core.domain.wiki_service import apply_section_update, render_index_entries
 from taskforce.core.interfaces.wiki_store import WikiStoreProtocol
 from taskforce.core.utils.atomic_io import atomic_write_text
 
@@ -33,6 +47,16 @@ _LOG_FORMAT = "## [%Y-%m-%d %H:%M]"
 # Lock key for append_log — contains ":" so it can never collide with a
 # real page name (``_validate_name`` rejects names containing ":").
 _LOG_LOCK_KEY = "::log"
+_GRAPH_FILE = ".link_graph.json"
+_GRAPH_JOURNAL_FILE = ".link_graph.jsonl"
+_GRAPH_VERSION = 1
+# Journal lines after which the next change writes a fresh snapshot.
+_GRAPH_JOURNAL_MAX_LINES = 1000
+
+# (mtime_ns, size) of a page file when its graph entry was taken.
+_Signature = tuple[int, int]
+# (mtime_ns, size, inode) of the graph snapshot, None when there is none.
+_FileSignature = tuple[int, int, int] | None
 
 
 class FileWikiStore(WikiStoreProtocol):
@@ -49,7 +73,21 @@ class FileWikiStore(WikiStoreProtocol):
         # concurrent update cannot clobber another writer's change.
         self._locks: dict[str, asyncio.Lock] = {}
         self._locks_lock = asyncio.Lock()
+        # Also guards the link graph and its files.
         self._index_lock = asyncio.Lock()
+        self._graph: WikiLinkGraph | None = None
+        self._signatures: dict[str, _Signature] = {}
+        self._compact_graph = False
+        self._journal_lines = 0
+        # How far this instance has read the journal, and the snapshot it
+        # was read against; used to replay other writers' changes.
+        self._journal_offset = 0
+        self._snapshot_signature: _FileSignature = None
+
+    @property
+    def root(self) -> Path:
+        """Absolute wiki root; identifies the wiki across store instances."""
+        return self._root.resolve()
 
     async def _get_lock(self, key: str) -> asyncio.Lock:
         """Return the lock for *key* (a page name or ``_LOG_LOCK_KEY``)."""
@@ -95,6 +133,32 @@ class FileWikiStore(WikiStoreProtocol):
         scored.sort(key=lambda item: item[0], reverse=True)
         return [page for _, page in scored[:limit]]
 
+    async def link_graph(self, *, rescan: bool = False) -> WikiLinkGraph:
+        """Return the wiki's link graph.
+
+        Loaded on first use and reconciled with the files on disk; later
+        calls return it as kept current by this store's own mutations.
+        ``rescan=True`` also picks up pages edited outside the store.
+        """
+        async with self._index_lock:
+            loaded = self._graph is not None
+            graph = await self._sync_graph()
+            if rescan or not loaded:
+                changed = await self._rescan_graph(graph)
+                await self._persist_graph(graph, changed)
+                if changed:
+                    await self._write_index(graph)
+            return graph
+
+    async def page_signatures(self) -> dict[str, tuple[int, int]]:
+        """Map every page name to its file's ``(mtime_ns, size)``.
+
+        Reconciles the link graph with the files first, so pages edited
+        outside the store show up with their new signature.
+        """
+        await self.link_graph(rescan=True)
+        return dict(self._signatures)
+
     async def read_index(self) -> str:
         index_path = self._root / _INDEX_FILE
         if not index_path.exists():
@@ -114,7 +178,8 @@ class FileWikiStore(WikiStoreProtocol):
             page.touch()
             path.parent.mkdir(parents=True, exist_ok=True)
             await atomic_write_text(path, self._serialise(page))
-        await self._refresh_index()
+            signature = _signature(path)
+        await self._refresh_index(page.name, page, signature)
         logger.info("wiki.write_page", name=page.name)
         return page
 
@@ -134,8 +199,10 @@ class FileWikiStore(WikiStoreProtocol):
                 return None
             page.body = apply_section_update(page.body, section, content, mode)
             page.touch()
-            await atomic_write_text(self._page_path(name), self._serialise(page))
-        await self._refresh_index()
+            path = self._page_path(name)
+            await atomic_write_text(path, self._serialise(page))
+            signature = _signature(path)
+        await self._refresh_index(name, page, signature)
         logger.info("wiki.update_section", name=name, section=section, mode=mode)
         return page
 
@@ -145,7 +212,7 @@ class FileWikiStore(WikiStoreProtocol):
             if not path.exists():
                 return False
             path.unlink()
-        await self._refresh_index()
+        await self._refresh_index(name, None, None)
         logger.info("wiki.delete_page", name=name)
         return True
 
@@ -227,11 +294,251 @@ class FileWikiStore(WikiStoreProtocol):
         body = page.body.rstrip() + "\n"
         return f"{_FRONTMATTER_DELIM}\n{yaml_block}\n{_FRONTMATTER_DELIM}\n\n{body}"
 
-    async def _refresh_index(self) -> None:
-        # Serialised so two page mutations cannot race on index.md.
+    async def _refresh_index(
+        self, name: str, page: WikiPage | None, signature: _Signature | None
+    ) -> None:
+        """Record a mutation in the link graph, then rewrite ``index.md``."""
+        # Serialised so two page mutations cannot race on the graph or index.md.
         async with self._index_lock:
-            pages = await self.list_pages()
-            await atomic_write_text(self._root / _INDEX_FILE, render_index(pages))
+            loaded = self._graph is not None
+            graph = await self._sync_graph()
+            if page is None or signature is None:
+                graph.remove_page(name)
+                self._signatures.pop(name, None)
+            else:
+                graph.set_page(name, WikiLinkEntry.from_page(page))
+                self._signatures[name] = signature
+            changed = [name]
+            if not loaded:
+                # First use: pick up pages edited while no store was open.
+                changed += await self._rescan_graph(graph)
+            await self._persist_graph(graph, changed)
+            await self._write_index(graph)
+
+    async def _write_index(self, graph: WikiLinkGraph) -> None:
+        entries = ((n, entry.title, entry.hook) for n, entry in graph.entries())
+        await atomic_write_text(self._root / _INDEX_FILE, render_index_entries(entries))
+
+    # -- link graph (caller holds ``_index_lock``) --------------------------
+
+    async def _load_graph(self) -> WikiLinkGraph:
+        """Load the persisted graph once: snapshot plus replayed journal."""
+        if self._graph is not None:
+            return self._graph
+        snapshot_signature, records, journal, offset = await asyncio.to_thread(
+            self._read_graph_files
+        )
+        ops = _journal_ops(journal)
+        for op in ops:
+            if op.get("op") == "set":
+                records[op.get("name")] = op.get("page")
+            elif op.get("op") == "delete":
+                records.pop(op.get("name"), None)
+        graph = WikiLinkGraph()
+        self._signatures = {}
+        for name, record in records.items():
+            self._set_record(graph, name, record)
+        self._graph = graph
+        # A journal to fold in, or a missing snapshot, is compacted on
+        # the first persist.
+        self._compact_graph = bool(ops) or snapshot_signature is None
+        self._journal_lines = 0
+        self._journal_offset = offset
+        self._snapshot_signature = snapshot_signature
+        return graph
+
+    async def _sync_graph(self) -> WikiLinkGraph:
+        """Load the graph, or replay what other writers persisted since.
+
+        Journal lines appended after ``_journal_offset`` (this instance's
+        own included — replaying them is harmless) are applied in file
+        order. A different snapshot means another writer compacted the
+        journal away, so the graph is loaded again from scratch.
+        """
+        if self._graph is None:
+            return await self._load_graph()
+        snapshot_signature, tail = await asyncio.to_thread(
+            self._read_journal_tail, self._journal_offset
+        )
+        if snapshot_signature != self._snapshot_signature or tail is None:
+            self._graph = None
+            return await self._load_graph()
+        if tail:
+            ops = _journal_ops(tail)
+            for op in ops:
+                name = op.get("name")
+                if op.get("op") == "set":
+                    self._set_record(self._graph, name, op.get("page"))
+                elif op.get("op") == "delete":
+                    self._graph.remove_page(name)
+                    self._signatures.pop(name, None)
+            self._journal_offset += len(tail)
+            self._journal_lines += len(ops)
+        return self._graph
+
+    def _set_record(self, graph: WikiLinkGraph, name: Any, record: Any) -> None:
+        """Put a persisted page record into ``graph`` (skipped if malformed)."""
+        try:
+            entry = WikiLinkEntry(
+                title=str(record["title"]),
+                hook=str(record["hook"]),
+                links=tuple(str(link) for link in record["links"]),
+            )
+            signature = (int(record["sig"][0]), int(record["sig"][1]))
+        except (KeyError, IndexError, TypeError, ValueError):
+            return  # no signature → the rescan reads the page again
+        graph.set_page(str(name), entry)
+        self._signatures[str(name)] = signature
+
+    def _read_graph_files(self) -> tuple[_FileSignature, dict[str, Any], bytes, int]:
+        """Return the snapshot's signature and records, plus the journal.
+
+        The journal is cut after its last complete line; the returned
+        offset is where the next :meth:`_read_journal_tail` starts. The
+        signature is ``None`` when there is no usable snapshot.
+        """
+        records: dict[str, Any] = {}
+        snapshot_signature = _file_signature(self._root / _GRAPH_FILE)
+        try:
+            data = json.loads((self._root / _GRAPH_FILE).read_text(encoding="utf-8"))
+            if data.get("version") == _GRAPH_VERSION and isinstance(data.get("pages"), dict):
+                records = data["pages"]
+            else:
+                snapshot_signature = None
+        except (OSError, ValueError, AttributeError):
+            snapshot_signature = None
+        try:
+            journal = (self._root / _GRAPH_JOURNAL_FILE).read_bytes()
+        except OSError:
+            journal = b""
+        # A torn final line (crash or a concurrent append) is read later.
+        journal = journal[: journal.rfind(b"\n") + 1]
+        return snapshot_signature, records, journal, len(journal)
+
+    def _read_journal_tail(self, offset: int) -> tuple[_FileSignature, bytes | None]:
+        """Return the snapshot's signature and the journal's complete lines past ``offset``.
+
+        The lines are ``None`` when the journal is shorter than ``offset``,
+        i.e. it was replaced since this instance read it.
+        """
+        snapshot_signature = _file_signature(self._root / _GRAPH_FILE)
+        try:
+            with (self._root / _GRAPH_JOURNAL_FILE).open("rb") as journal:
+                if os.fstat(journal.fileno()).st_size < offset:
+                    return snapshot_signature, None
+                journal.seek(offset)
+                tail = journal.read()
+        except FileNotFoundError:
+            return snapshot_signature, b"" if offset == 0 else None
+        except OSError:
+            return snapshot_signature, b""
+        return snapshot_signature, tail[: tail.rfind(b"\n") + 1]
+
+    async def _rescan_graph(self, graph: WikiLinkGraph) -> list[str]:
+        """Bring the graph in line with the files; return changed page names."""
+        on_disk = await asyncio.to_thread(_scan_signatures, self._root)
+        stale = [name for name, sig in on_disk.items() if self._signatures.get(name) != sig]
+        gone = [name for name in self._signatures if name not in on_disk]
+        pages = await asyncio.to_thread(
+            lambda: [self._read_file(self._page_path(name)) for name in stale]
+        )
+        for name, page in zip(stale, pages, strict=True):
+            if page is None:
+                gone.append(name)
+                continue
+            graph.set_page(name, WikiLinkEntry.from_page(page))
+            self._signatures[name] = on_disk[name]
+        for name in gone:
+            graph.remove_page(name)
+            self._signatures.pop(name, None)
+        return stale + gone
+
+    async def _persist_graph(self, graph: WikiLinkGraph, changed: list[str]) -> None:
+        """Journal ``changed`` pages, or write a fresh snapshot when due."""
+        if self._journal_lines + len(changed) > _GRAPH_JOURNAL_MAX_LINES:
+            self._compact_graph = True
+        if self._compact_graph:
+            pages = {name: self._graph_record(name, entry) for name, entry in graph.entries()}
+            snapshot = json.dumps({"version": _GRAPH_VERSION, "pages": pages})
+            await atomic_write_text(self._root / _GRAPH_FILE, snapshot)
+            await asyncio.to_thread((self._root / _GRAPH_JOURNAL_FILE).unlink, missing_ok=True)
+            self._compact_graph = False
+            self._journal_lines = 0
+            self._journal_offset = 0
+            self._snapshot_signature = _file_signature(self._root / _GRAPH_FILE)
+            return
+        if not changed:
+            return
+        lines = []
+        for name in dict.fromkeys(changed):
+            entry = graph.get(name)
+            op: dict[str, Any] = (
+                {"op": "set", "name": name, "page": self._graph_record(name, entry)}
+                if entry is not None
+                else {"op": "delete", "name": name}
+            )
+            lines.append(json.dumps(op) + "\n")
+        # ``_journal_offset`` stays put: the next sync reads these lines
+        # back together with any other writer's, in file order.
+        await asyncio.to_thread(self._append_journal, lines)
+
+    def _append_journal(self, lines: list[str]) -> None:
+        with (self._root / _GRAPH_JOURNAL_FILE).open("a", encoding="utf-8") as journal:
+            journal.writelines(lines)
+
+    def _graph_record(self, name: str, entry: WikiLinkEntry) -> dict[str, Any]:
+        return {
+            "title": entry.title,
+            "hook": entry.hook,
+            "links": list(entry.links),
+            "sig": list(self._signatures[name]),
+        }
+
+
+def _signature(path: Path) -> _Signature:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _file_signature(path: Path) -> _FileSignature:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def _journal_ops(journal: bytes) -> list[dict[str, Any]]:
+    """Parse complete journal lines, skipping any that are not valid JSON."""
+    ops = []
+    for line in journal.decode("utf-8", "replace").splitlines():
+        try:
+            op = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(op, dict):
+            ops.append(op)
+    return ops
+
+
+def _scan_signatures(root: Path) -> dict[str, _Signature]:
+    """Map every page name under ``root`` to its file's (mtime_ns, size)."""
+    signatures: dict[str, _Signature] = {}
+    prefix = len(str(root)) + 1
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".md") and entry.name not in {_INDEX_FILE, _LOG_FILE}:
+                        stat = entry.stat()
+                        name = entry.path[prefix:-3].replace(os.sep, "/")
+                        signatures[name] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            continue
+    return signatures
 
 
 def _word_matches(word: str, haystack: str) -> bool:
@@ -1,5 +1,6 @@
 """Messaging infrastructure adapters."""
 
 from taskforce.infrastructure.messaging.in_memory_bus import InMemoryMessageBus
+from taskforce.infrastructure.messaging.sqlite_bus import DeadLetter, SqliteMessageBus
 
-__all__ = ["InMemoryMessageBus"]
+__all__ = ["DeadLetter", "InMemoryMessageBus", "SqliteMessageBus"]
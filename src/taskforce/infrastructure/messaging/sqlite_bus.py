@@ -0,0 +1,619 @@
+"""
+Durable SQLite Message Bus
+
+A ``MessageBusProtocol`` implementation that keeps topics in a WAL-mode
+SQLite database, so pending messages survive process restarts and
+crashes.
+
+Delivery model:
+
+- **Consumer groups.** Every group subscribed to a topic receives every
+  message; within a group each message goes to one consumer. A group
+  starts at the oldest retained message of its topic, so messages
+  published before the first ``subscribe()`` are not lost. Each group
+  keeps a cursor (the highest sequence number handed out) plus a row per
+  in-flight message.
+- **At-least-once.** Claiming a message makes it invisible to the rest of
+  the group for ``visibility_timeout_seconds``. ``ack()`` removes it;
+  ``nack()`` makes it visible again immediately. A consumer that dies
+  without acking simply lets the timeout expire, and the message is
+  redelivered.
+- **Dead-lettering.** A message claimed ``max_attempts`` times without an
+  ack (or nacked with ``requeue=False``) moves to the ``dead_letters``
+  table instead of being delivered again.
+- **Retention.** Messages every group of their topic has consumed and
+  acked are purged once older than ``retention_seconds``; dead letters
+  age out the same way. ``0`` keeps everything.
+
+Subscribers claim messages in batches of ``batch_size`` and poll every
+``poll_interval_seconds`` while the topic is idle; a publish from the
+same bus instance wakes them immediately. All SQLite work runs in a
+worker thread over one connection guarded by a lock, so the event loop
+never blocks on disk I/O.
+
+Configuration (``message_bus`` in the profile, ``type: sqlite``):
+    path: Database file (default ``<work_dir>/message_bus.db``)
+    consumer_group: Group used when ``subscribe()`` names none ("default")
+    visibility_timeout_seconds: In-flight lease per claim (default 30)
+    max_attempts: Deliveries before dead-lettering (default 5)
+    retention_seconds: Keep consumed messages this long (default 7 days)
+    poll_interval_seconds: Idle poll interval (default 0.5)
+    batch_size: Messages claimed per round trip (default 32)
+    synchronous: SQLite ``synchronous`` pragma, ``NORMAL`` or ``FULL``
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import AsyncIterator, Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import structlog
+
+from taskforce.core.domain.messaging import MessageEnvelope
+from taskforce.core.interfaces.messaging import MessageBusProtocol
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_GROUP = "default"
+_SYNCHRONOUS_MODES = ("NORMAL", "FULL")
+_PURGE_INTERVAL_SECONDS = 60.0
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS messages (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        message_id TEXT NOT NULL UNIQUE,
+        topic TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        headers TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        published_ts REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_messages_topic_seq ON messages (topic, seq)",
+    """
+    CREATE TABLE IF NOT EXISTS consumer_groups (
+        topic TEXT NOT NULL,
+        group_name TEXT NOT NULL,
+        cursor INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (topic, group_name)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS deliveries (
+        group_name TEXT NOT NULL,
+        topic TEXT NOT NULL,
+        seq INTEGER NOT NULL,
+        attempts INTEGER NOT NULL,
+        visible_at REAL NOT NULL,
+        PRIMARY KEY (group_name, seq)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_deliveries_visible "
+    "ON deliveries (group_name, topic, visible_at)",
+    "CREATE INDEX IF NOT EXISTS idx_deliveries_seq ON deliveries (seq)",
+    """
+    CREATE TABLE IF NOT EXISTS dead_letters (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        group_name TEXT NOT NULL,
+        message_id TEXT NOT NULL,
+        topic TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        headers TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        attempts INTEGER NOT NULL,
+        reason TEXT NOT NULL,
+        dead_ts REAL NOT NULL
+    )
+    """,
+)
+
+
+@dataclass(frozen=True)
+class DeadLetter:
+    """A message a consumer group gave up on."""
+
+    envelope: MessageEnvelope
+    group: str
+    attempts: int
+    reason: str
+
+
+class SqliteMessageBus(MessageBusProtocol):
+    """Persistent message bus with consumer groups and at-least-once delivery.
+
+    Args:
+        path: SQLite database file; parent directories are created.
+        consumer_group: Group used by ``subscribe``/``ack``/``nack`` when
+            the caller does not name one.
+        visibility_timeout_seconds: How long a claimed message stays
+            invisible to the rest of its group before redelivery.
+        max_attempts: Deliveries per group before a message is dead-lettered.
+        retention_seconds: Age after which fully consumed messages and dead
+            letters are purged (``0`` disables purging).
+        poll_interval_seconds: Idle poll interval of ``subscribe``.
+        batch_size: Messages claimed per database round trip.
+        synchronous: ``NORMAL`` (survives process crashes) or ``FULL``
+            (also survives power loss, at a cost per commit).
+        clock: Time source, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        consumer_group: str = DEFAULT_GROUP,
+        visibility_timeout_seconds: float = 30.0,
+        max_attempts: int = 5,
+        retention_seconds: float = 7 * 24 * 3600.0,
+        poll_interval_seconds: float = 0.5,
+        batch_size: int = 32,
+        synchronous: str = "NORMAL",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        synchronous = synchronous.upper()
+        if synchronous not in _SYNCHRONOUS_MODES:
+            raise ValueError(
+                f"synchronous must be one of {_SYNCHRONOUS_MODES}, got {synchronous!r}"
+            )
+        self._path = Path(path)
+        self._group = consumer_group
+        self._visibility_timeout = max(0.0, float(visibility_timeout_seconds))
+        self._max_attempts = max(1, int(max_attempts))
+        self._retention = max(0.0, float(retention_seconds))
+        self._poll_interval = max(0.01, float(poll_interval_seconds))
+        self._batch_size = max(1, int(batch_size))
+        self._clock = clock
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = sqlite3.connect(
+            self._path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={synchronous}")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        with self._transaction() as conn:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+
+        # message_id -> groups it was claimed for through this instance,
+        # so ack()/nack() without an explicit group hit the right delivery.
+        self._claims: dict[str, list[str]] = defaultdict(list)
+        self._wakeups: dict[str, set[asyncio.Event]] = defaultdict(set)
+        self._last_purge = 0.0
+        self.stats: Counter[str] = Counter()
+
+    @property
+    def path(self) -> Path:
+        """The database file."""
+        return self._path
+
+    # ------------------------------------------------------------------
+    # MessageBusProtocol
+    # ------------------------------------------------------------------
+
+    async def publish(
+        self,
+        topic: str,
+        payload: dict[str, Any],
+        *,
+        headers: dict[str, Any] | None = None,
+        message_id: str | None = None,
+    ) -> MessageEnvelope:
+        """Persist a message. Re-publishing an existing ``message_id`` is a no-op."""
+        envelope = MessageEnvelope(
+            message_id=message_id or uuid4().hex,
+            topic=topic,
+            payload=payload,
+            headers=headers or {},
+        )
+        await asyncio.to_thread(self._insert, [envelope])
+        self._wake(topic)
+        return envelope
+
+    async def publish_many(
+        self, topic: str, payloads: Iterable[dict[str, Any]]
+    ) -> list[MessageEnvelope]:
+        """Persist several messages to ``topic`` in one transaction."""
+        envelopes = [
+            MessageEnvelope(message_id=uuid4().hex, topic=topic, payload=payload)
+            for payload in payloads
+        ]
+        if envelopes:
+            await asyncio.to_thread(self._insert, envelopes)
+            self._wake(topic)
+        return envelopes
+
+    async def subscribe(
+        self, topic: str, *, group: str | None = None
+    ) -> AsyncIterator[MessageEnvelope]:
+        """Yield messages of ``topic`` for ``group`` (the bus default if omitted).
+
+        Every yielded message must be acked or nacked; otherwise it is
+        redelivered once its visibility timeout expires.
+        """
+        group = group or self._group
+        await asyncio.to_thread(self._register_group, topic, group)
+        wakeup = asyncio.Event()
+        self._wakeups[topic].add(wakeup)
+        unyielded: list[MessageEnvelope] = []
+        try:
+            while True:
+                wakeup.clear()
+                batch = await asyncio.to_thread(self._claim, topic, group, self._batch_size)
+                if not batch:
+                    try:
+                        await asyncio.wait_for(wakeup.wait(), self._poll_interval)
+                    except TimeoutError:
+                        pass
+                    continue
+                unyielded = batch
+                while unyielded:
+                    envelope = unyielded.pop(0)
+                    self._claims[envelope.message_id].append(group)
+                    yield envelope
+        finally:
+            self._wakeups[topic].discard(wakeup)
+            if unyielded and self._conn is not None:
+                # Prefetched claims the consumer never saw go back to the
+                # group now rather than after the visibility timeout.
+                await asyncio.to_thread(
+                    self._release_messages, group, [e.message_id for e in unyielded]
+                )
+
+    async def ack(self, message_id: str, *, group: str | None = None) -> None:
+        """Mark ``message_id`` processed for ``group``."""
+        group = self._settle_claim(message_id, group)
+        await asyncio.to_thread(self._ack, message_id, group)
+
+    async def nack(
+        self, message_id: str, *, requeue: bool = True, group: str | None = None
+    ) -> None:
+        """Make the message visible again, or dead-letter it when ``requeue`` is False."""
+        group = self._settle_claim(message_id, group)
+        topic = await asyncio.to_thread(self._nack, message_id, group, requeue)
+        if topic is not None and requeue:
+            self._wake(topic)
+
+    # ------------------------------------------------------------------
+    # Operations
+    # ------------------------------------------------------------------
+
+    async def recover(self, group: str | None = None) -> int:
+        """Release every in-flight claim (all groups unless ``group`` is given).
+
+        Call this on startup when this process is the only consumer: claims
+        held by a crashed predecessor become visible at once instead of
+        after their visibility timeout. Returns the number released.
+        """
+        return await asyncio.to_thread(self._release_claims, group)
+
+    async def purge(self) -> int:
+        """Apply retention now. Returns the number of rows removed."""
+        return await asyncio.to_thread(self._purge)
+
+    async def pending_count(self, topic: str, *, group: str | None = None) -> int:
+        """Messages of ``topic`` not yet acked by ``group`` (in flight included)."""
+        return await asyncio.to_thread(self._pending_count, topic, group or self._group)
+
+    async def dead_letters(
+        self, topic: str | None = None, *, limit: int = 100
+    ) -> list[DeadLetter]:
+        """Return the most recent dead letters, newest first."""
+        return await asyncio.to_thread(self._dead_letters, topic, limit)
+
+    def close(self) -> None:
+        """Close the database connection (pending messages stay on disk)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------
+    # Database access (worker threads)
+    # ------------------------------------------------------------------
+
+    def _transaction(self) -> _Transaction:
+        if self._conn is None:
+            raise RuntimeError("SqliteMessageBus is closed")
+        return _Transaction(self._conn, self._lock)
+
+    def _insert(self, envelopes: list[MessageEnvelope]) -> None:
+        now = self._clock()
+        rows = [
+            (
+                e.message_id,
+                e.topic,
+                json.dumps(e.payload),
+                json.dumps(e.headers),
+                e.created_at.isoformat(),
+                now,
+            )
+            for e in envelopes
+        ]
+        with self._transaction() as conn:
+            inserted = conn.executemany(
+                "INSERT OR IGNORE INTO messages "
+                "(message_id, topic, payload, headers, created_at, published_ts) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            ).rowcount
+        self.stats["published"] += inserted
+        self.stats["duplicates"] += len(rows) - inserted
+
+    def _register_group(self, topic: str, group: str) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO consumer_groups (topic, group_name, cursor) "
+                "VALUES (?, ?, 0)",
+                (topic, group),
+            )
+
+    def _claim(self, topic: str, group: str, limit: int) -> list[MessageEnvelope]:
+        self._maybe_purge()
+        now = self._clock()
+        lease = now + self._visibility_timeout
+        with self._transaction() as conn:
+            claimed: list[int] = []
+            expired = conn.execute(
+                "SELECT seq, attempts FROM deliveries "
+                "WHERE group_name = ? AND topic = ? AND visible_at <= ? "
+                "ORDER BY visible_at, seq LIMIT ?",
+                (group, topic, now, limit),
+            ).fetchall()
+            for seq, attempts in expired:
+                if attempts >= self._max_attempts:
+                    self._dead_letter(conn, group, seq, attempts, "max_attempts", now)
+                    continue
+                conn.execute(
+                    "UPDATE deliveries SET attempts = attempts + 1, visible_at = ? "
+                    "WHERE group_name = ? AND seq = ?",
+                    (lease, group, seq),
+                )
+                claimed.append(seq)
+                self.stats["redelivered"] += 1
+
+            remaining = limit - len(claimed)
+            if remaining > 0:
+                (cursor,) = conn.execute(
+                    "SELECT cursor FROM consumer_groups WHERE topic = ? AND group_name = ?",
+                    (topic, group),
+                ).fetchone()
+                fresh = [
+                    seq
+                    for (seq,) in conn.execute(
+                        "SELECT seq FROM messages WHERE topic = ? AND seq > ? "
+                        "ORDER BY seq LIMIT ?",
+                        (topic, cursor, remaining),
+                    )
+                ]
+                if fresh:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO deliveries "
+                        "(group_name, topic, seq, attempts, visible_at) VALUES (?, ?, ?, 1, ?)",
+                        [(group, topic, seq, lease) for seq in fresh],
+                    )
+                    conn.execute(
+                        "UPDATE consumer_groups SET cursor = ? "
+                        "WHERE topic = ? AND group_name = ?",
+                        (fresh[-1], topic, group),
+                    )
+                    claimed.extend(fresh)
+            if not claimed:
+                return []
+            placeholders = ",".join("?" * len(claimed))
+            rows = conn.execute(
+                "SELECT seq, message_id, topic, payload, headers, created_at FROM messages "
+                f"WHERE seq IN ({placeholders})",
+                claimed,
+            ).fetchall()
+        self.stats["delivered"] += len(rows)
+        by_seq = {row[0]: _envelope(row[1:]) for row in rows}
+        return [by_seq[seq] for seq in claimed if seq in by_seq]
+
+    def _ack(self, message_id: str, group: str) -> None:
+        with self._transaction() as conn:
+            deleted = conn.execute(
+                "DELETE FROM deliveries WHERE group_name = ? AND seq = "
+                "(SELECT seq FROM messages WHERE message_id = ?)",
+                (group, message_id),
+            ).rowcount
+        self.stats["acked"] += deleted
+
+    def _nack(self, message_id: str, group: str, requeue: bool) -> str | None:
+        now = self._clock()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT d.seq, d.topic, d.attempts FROM deliveries d "
+                "JOIN messages m ON m.seq = d.seq "
+                "WHERE d.group_name = ? AND m.message_id = ?",
+                (group, message_id),
+            ).fetchone()
+            if row is None:
+                return None
+            seq, topic, attempts = row
+            if requeue:
+                conn.execute(
+                    "UPDATE deliveries SET visible_at = ? WHERE group_name = ? AND seq = ?",
+                    (now, group, seq),
+                )
+                self.stats["nacked"] += 1
+            else:
+                self._dead_letter(conn, group, seq, attempts, "rejected", now)
+        return topic
+
+    def _dead_letter(
+        self,
+        conn: sqlite3.Connection,
+        group: str,
+        seq: int,
+        attempts: int,
+        reason: str,
+        now: float,
+    ) -> None:
+        conn.execute(
+            "INSERT INTO dead_letters (group_name, message_id, topic, payload, headers, "
+            "created_at, attempts, reason, dead_ts) "
+            "SELECT ?, message_id, topic, payload, headers, created_at, ?, ?, ? "
+            "FROM messages WHERE seq = ?",
+            (group, attempts, reason, now, seq),
+        )
+        conn.execute("DELETE FROM deliveries WHERE group_name = ? AND seq = ?", (group, seq))
+        self.stats["dead_lettered"] += 1
+        logger.warning(
+            "message_bus.dead_lettered", group=group, seq=seq, attempts=attempts, reason=reason
+        )
+
+    def _release_claims(self, group: str | None) -> int:
+        now = self._clock()
+        with self._transaction() as conn:
+            if group is None:
+                released = conn.execute(
+                    "UPDATE deliveries SET visible_at = ? WHERE visible_at > ?", (now, now)
+                ).rowcount
+            else:
+                released = conn.execute(
+                    "UPDATE deliveries SET visible_at = ? "
+                    "WHERE group_name = ? AND visible_at > ?",
+                    (now, group, now),
+                ).rowcount
+        if released:
+            logger.info("message_bus.claims_released", released=released, group=group)
+        return released
+
+    def _release_messages(self, group: str, message_ids: list[str]) -> None:
+        now = self._clock()
+        with self._transaction() as conn:
+            conn.executemany(
+                "UPDATE deliveries SET visible_at = ? WHERE group_name = ? AND seq = "
+                "(SELECT seq FROM messages WHERE message_id = ?)",
+                [(now, group, message_id) for message_id in message_ids],
+            )
+
+    def _maybe_purge(self) -> None:
+        now = self._clock()
+        if self._retention and now - self._last_purge >= _PURGE_INTERVAL_SECONDS:
+            self._last_purge = now
+            self._purge()
+
+    def _purge(self) -> int:
+        if not self._retention:
+            return 0
+        cutoff = self._clock() - self._retention
+        with self._transaction() as conn:
+            messages = conn.execute(
+                "DELETE FROM messages WHERE published_ts < ? "
+                "AND seq <= (SELECT MIN(cursor) FROM consumer_groups g "
+                "WHERE g.topic = messages.topic) "
+                "AND NOT EXISTS (SELECT 1 FROM deliveries d WHERE d.seq = messages.seq)",
+                (cutoff,),
+            ).rowcount
+            dead = conn.execute(
+                "DELETE FROM dead_letters WHERE dead_ts < ?", (cutoff,)
+            ).rowcount
+        self.stats["purged"] += messages + dead
+        return messages + dead
+
+    def _pending_count(self, topic: str, group: str) -> int:
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT cursor FROM consumer_groups WHERE topic = ? AND group_name = ?",
+                (topic, group),
+            ).fetchone()
+            cursor = row[0] if row else 0
+            (unclaimed,) = conn.execute(
+                "SELECT COUNT(*) FROM messages WHERE topic = ? AND seq > ?", (topic, cursor)
+            ).fetchone()
+            (in_flight,) = conn.execute(
+                "SELECT COUNT(*) FROM deliveries WHERE topic = ? AND group_name = ?",
+                (topic, group),
+            ).fetchone()
+        return unclaimed + in_flight
+
+    def _dead_letters(self, topic: str | None, limit: int) -> list[DeadLetter]:
+        query = (
+            "SELECT message_id, topic, payload, headers, created_at, group_name, attempts, "
+            "reason FROM dead_letters"
+        )
+        params: tuple[Any, ...] = ()
+        if topic is not None:
+            query += " WHERE topic = ?"
+            params = (topic,)
+        query += " ORDER BY id DESC LIMIT ?"
+        with self._transaction() as conn:
+            rows = conn.execute(query, (*params, limit)).fetchall()
+        return [
+            DeadLetter(envelope=_envelope(row[:5]), group=row[5], attempts=row[6], reason=row[7])
+            for row in rows
+        ]
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _settle_claim(self, message_id: str, group: str | None) -> str:
+        """Forget this instance's claim of ``message_id`` and return its group.
+
+        Without an explicit ``group`` the oldest claim wins (the bus
+        default if there is none).
+        """
+        groups = self._claims.get(message_id)
+        if not groups:
+            return group or self._group
+        if group is None:
+            group = groups.pop(0)
+        elif group in groups:
+            groups.remove(group)
+        if not groups:
+            del self._claims[message_id]
+        return group
+
+    def _wake(self, topic: str) -> None:
+        for event in self._wakeups.get(topic, ()):
+            event.set()
+
+
+class _Transaction:
+    """``BEGIN IMMEDIATE`` … ``COMMIT`` under the bus lock (rollback on error)."""
+
+    def __init__(self, conn: sqlite3.Connection, lock: threading.Lock) -> None:
+        self._conn = conn
+        self._lock = lock
+
+    def __enter__(self) -> sqlite3.Connection:
+        self._lock.acquire()
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+        except BaseException:
+            self._lock.release()
+            raise
+        return self._conn
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        try:
+            self._conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self._lock.release()
+
+
+def _envelope(row: tuple[Any, ...]) -> MessageEnvelope:
+    message_id, topic, payload, headers, created_at = row
+    return MessageEnvelope.from_dict(
+        {
+            "message_id": message_id,
+            "topic": topic,
+            "payload": json.loads(payload),
+            "headers": json.loads(headers),
+            "created_at": created_at,
+        }
+    )
@@ -24,6 +24,7 @@ from taskforce.core.domain.agent_models import (
     ProfileAgentDefinition,
 )
 from taskforce.core.interfaces.tool_mapping import ToolMapperProtocol
+from taskforce.core.utils.config_catalog import get_config_catalog
 
 logger = structlog.get_logger()
 
@@ -91,8 +92,7 @@ def parse_profile_agent_yaml(
         ProfileAgentDefinition if valid, None if the file is corrupt or unreadable.
     """
     try:
-        with open(profile_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = get_config_catalog().load_yaml(profile_path)
 
         profile_name = profile_path.stem
 
@@ -118,7 +118,7 @@ def parse_profile_agent_yaml(
 def parse_profile_agent_md(profile_path: Path) -> ProfileAgentDefinition | None:
     """Parse a ``*.agent.md`` profile (YAML frontmatter + markdown body)."""
     try:
-        text = profile_path.read_text(encoding="utf-8")
+        text = get_config_catalog().read_text(profile_path)
         if not text.startswith("---"):
             return None
         end = text.find("\n---", 3)
@@ -31,6 +31,7 @@ from taskforce.core.domain.agent_models import (
 )
 from taskforce.core.domain.deployment import DeploymentManifest
 from taskforce.core.interfaces.tool_mapping import ToolMapperProtocol
+from taskforce.core.utils.config_catalog import get_config_catalog
 from taskforce.core.utils.paths import get_base_path
 from taskforce.infrastructure.persistence.agent_serializer import (
     build_agent_yaml,
@@ -268,19 +269,20 @@ class FileAgentRegistry:
             return custom
 
         # Try profile agents (agent_id matches profile name)
+        catalog = get_config_catalog()
         profile_path = self.configs_dir / f"{agent_id}.yaml"
-        if profile_path.exists() and agent_id not in _NON_PROFILE_STEMS:
+        if catalog.is_file(profile_path) and agent_id not in _NON_PROFILE_STEMS:
             return parse_profile_agent_yaml(profile_path)
 
         # Try profile agents in extra dirs (agent packages)
         for extra in self._extra_dirs():
             yaml_candidate = extra / f"{agent_id}.yaml"
-            if yaml_candidate.exists() and agent_id not in _NON_PROFILE_STEMS:
+            if catalog.is_file(yaml_candidate) and agent_id not in _NON_PROFILE_STEMS:
                 profile = parse_profile_agent_yaml(yaml_candidate)
                 if profile:
                     return profile
             md_candidate = extra / f"{agent_id}.agent.md"
-            if md_candidate.exists():
+            if catalog.is_file(md_candidate):
                 profile = parse_profile_agent_md(md_candidate)
                 if profile:
                     return profile
@@ -333,42 +335,39 @@ class FileAgentRegistry:
             List of all valid agent definitions
         """
         agents: list[CustomAgentDefinition | ProfileAgentDefinition | PluginAgentDefinition] = []
+        # Listings and parsed YAML come from the shared config catalog, so
+        # repeated listings only re-parse files that changed.
+        catalog = get_config_catalog()
 
         # Load custom agents
-        if self.custom_dir.exists():
-            for yaml_file in self.custom_dir.glob("*.yaml"):
-                agent_id = yaml_file.stem
-                agent = self._load_custom_agent(agent_id)
-                if agent:
-                    agents.append(agent)
+        for yaml_file in catalog.files(self.custom_dir, ".yaml"):
+            agent_id = yaml_file.stem
+            agent = self._load_custom_agent(agent_id)
+            if agent:
+                agents.append(agent)
 
         # Load profile agents
         seen_profiles: set[str] = set()
-        if self.configs_dir.exists():
-            for yaml_file in self.configs_dir.glob("*.yaml"):
-                # Skip framework-managed non-profile config files and custom dir
-                if yaml_file.stem in _NON_PROFILE_STEMS:
-                    continue
-                if yaml_file.parent.name == "custom":
-                    continue
+        for yaml_file in catalog.files(self.configs_dir, ".yaml"):
+            # Skip framework-managed non-profile config files
+            if yaml_file.stem in _NON_PROFILE_STEMS:
+                continue
 
-                profile = parse_profile_agent_yaml(yaml_file)
-                if profile:
-                    agents.append(profile)
-                    seen_profiles.add(profile.profile)
+            profile = parse_profile_agent_yaml(yaml_file)
+            if profile:
+                agents.append(profile)
+                seen_profiles.add(profile.profile)
 
         # Load profile agents from extra dirs (agent packages)
         for extra in self._extra_dirs():
-            if not extra.exists():
-                continue
-            for yaml_file in extra.glob("*.yaml"):
+            for yaml_file in catalog.files(extra, ".yaml"):
                 if yaml_file.stem in _NON_PROFILE_STEMS:
                     continue
                 profile = parse_profile_agent_yaml(yaml_file)
                 if profile and profile.profile not in seen_profiles:
                     agents.append(profile)
                     seen_profiles.add(profile.profile)
-            for md_file in extra.glob("*.agent.md"):
+            for md_file in catalog.files(extra, ".agent.md"):
                 profile = parse_profile_agent_md(md_file)
                 if profile and profile.profile not in seen_profiles:
                     agents.append(profile)
@@ -10,12 +10,25 @@ Directory layout::
         index.json              # Conversation metadata index
         {conv_id}/
             messages.json       # Message history
+
+The parsed index is shared by every store instance in the process (the
+API builds a new store per request) and revalidated with one ``stat`` of
+``index.json`` — its ``(mtime_ns, size, inode)`` changes on every atomic
+rewrite, including writes by other processes. Reads therefore cost a
+dict lookup (``get_info``) or a bisect into a lazily sorted order (the
+paged listings) instead of re-parsing the index. As in
+:mod:`taskforce.core.utils.config_catalog`, an index modified less than
+``_RACY_WINDOW_NS`` before it was read is not cached, since a second
+change within the same timestamp tick would go unnoticed.
 """
 
 from __future__ import annotations
 
 import json
+import os
 import shutil
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -28,11 +41,77 @@ from taskforce.core.domain.conversation import Conversation, ConversationStatus
 from taskforce.core.interfaces.conversation import (
     ConversationInfo,
     ConversationManagerProtocol,
+    ConversationPage,
     ConversationSummary,
 )
+from taskforce.core.utils.pagination import PageKey, page_descending
 
 logger = structlog.get_logger(__name__)
 
+_RACY_WINDOW_NS = 2_000_000_000
+_MAX_CACHED_INDEXES = 64
+
+_Signature = tuple[int, int, int]
+
+
+class _IndexSnapshot:
+    """Parsed ``index.json`` plus lookup structures built on demand."""
+
+    def __init__(self, entries: list[dict[str, Any]]) -> None:
+        self.entries = entries
+        self.by_id = {entry["conversation_id"]: entry for entry in entries}
+        self._orders: dict[str, tuple[list[dict[str, Any]], list[PageKey]]] = {}
+
+    def active_order(self) -> tuple[list[dict[str, Any]], list[PageKey]]:
+        """Active entries sorted by ascending ``(last_activity, id)``."""
+        return self._order(
+            "active",
+            lambda c: c["status"] == ConversationStatus.ACTIVE.value,
+            "last_activity",
+        )
+
+    def archived_order(self) -> tuple[list[dict[str, Any]], list[PageKey]]:
+        """Archived entries sorted by ascending ``(archived_at, id)``."""
+        return self._order(
+            "archived",
+            lambda c: c["status"] == ConversationStatus.ARCHIVED.value
+            and bool(c.get("archived_at")),
+            "archived_at",
+        )
+
+    def _order(
+        self, name: str, include: Any, field: str
+    ) -> tuple[list[dict[str, Any]], list[PageKey]]:
+        order = self._orders.get(name)
+        if order is None:
+            rows = sorted(
+                (c for c in self.entries if include(c)),
+                key=lambda c: (c[field], c["conversation_id"]),
+            )
+            order = (rows, [(c[field], c["conversation_id"]) for c in rows])
+            self._orders[name] = order
+        return order
+
+
+# index.json path -> (signature, snapshot); shared by all store instances.
+_snapshots: OrderedDict[Path, tuple[_Signature, _IndexSnapshot]] = OrderedDict()
+
+
+def _signature(st: os.stat_result) -> _Signature:
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _cache_snapshot(path: Path, signature: _Signature, snapshot: _IndexSnapshot) -> None:
+    _snapshots[path] = (signature, snapshot)
+    _snapshots.move_to_end(path)
+    while len(_snapshots) > _MAX_CACHED_INDEXES:
+        _snapshots.popitem(last=False)
+
+
+def clear_index_cache() -> None:
+    """Drop every cached conversation index (testing helper)."""
+    _snapshots.clear()
+
 
 class FileConversationStore:
     """File-based conversation management.
@@ -57,11 +136,10 @@ class FileConversationStore:
         project_id: str | None = None,
     ) -> str:
         """Return the active conversation for channel/sender, or create one."""
-        index = await self._load_index()
-        for conv in index:
+        active, _ = (await self._snapshot()).active_order()
+        for conv in active:
             if (
-                conv["status"] == ConversationStatus.ACTIVE.value
-                and conv["channel"] == channel
+                conv["channel"] == channel
                 and conv.get("sender_id") == sender_id
             ):
                 return conv["conversation_id"]
@@ -186,43 +264,44 @@ class FileConversationStore:
 
     async def list_active(self) -> list[ConversationInfo]:
         """List active conversations ordered by last activity (newest first)."""
-        index = await self._load_index()
-        active = [c for c in index if c["status"] == ConversationStatus.ACTIVE.value]
-        active.sort(key=lambda c: c["last_activity"], reverse=True)
-        return [
-            ConversationInfo(
-                conversation_id=c["conversation_id"],
-                channel=c["channel"],
-                started_at=datetime.fromisoformat(c["started_at"]),
-                last_activity=datetime.fromisoformat(c["last_activity"]),
-                message_count=c["message_count"],
-                topic=c.get("topic"),
-                project_id=c.get("project_id"),
-            )
-            for c in active
-        ]
+        return (await self.list_active_page()).items
 
     async def list_archived(self, limit: int = 20) -> list[ConversationSummary]:
         """List archived conversations ordered by archive date (newest first)."""
-        index = await self._load_index()
-        archived = [
-            c
-            for c in index
-            if c["status"] == ConversationStatus.ARCHIVED.value and c.get("archived_at")
-        ]
-        archived.sort(key=lambda c: c["archived_at"], reverse=True)
-        return [
-            ConversationSummary(
-                conversation_id=c["conversation_id"],
-                topic=c.get("topic") or "",
-                summary=c.get("summary") or "",
-                started_at=datetime.fromisoformat(c["started_at"]),
-                archived_at=datetime.fromisoformat(c["archived_at"]),
-                message_count=c["message_count"],
-                project_id=c.get("project_id"),
-            )
-            for c in archived[:limit]
-        ]
+        return (await self.list_archived_page(limit=limit)).items
+
+    async def get_info(self, conversation_id: str) -> ConversationInfo | None:
+        """Look up one conversation by id (a dict lookup in the cached index)."""
+        entry = (await self._snapshot()).by_id.get(conversation_id)
+        return _to_info(entry) if entry is not None else None
+
+    async def list_active_page(
+        self,
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+        project_id: str | None = None,
+    ) -> ConversationPage[ConversationInfo]:
+        """Page through active conversations, newest activity first."""
+        rows, keys = (await self._snapshot()).active_order()
+        page, next_cursor = page_descending(
+            rows, keys, limit=limit, cursor=cursor, predicate=_project_filter(project_id)
+        )
+        return ConversationPage([_to_info(c) for c in page], next_cursor)
+
+    async def list_archived_page(
+        self,
+        *,
+        limit: int | None = 20,
+        cursor: str | None = None,
+        project_id: str | None = None,
+    ) -> ConversationPage[ConversationSummary]:
+        """Page through archived conversations, newest archive first."""
+        rows, keys = (await self._snapshot()).archived_order()
+        page, next_cursor = page_descending(
+            rows, keys, limit=limit, cursor=cursor, predicate=_project_filter(project_id)
+        )
+        return ConversationPage([_to_summary(c) for c in page], next_cursor)
 
     async def delete(self, conversation_id: str) -> bool:
         """Hard-delete a conversation: drop the index entry and purge messages.
@@ -278,76 +357,102 @@ class FileConversationStore:
         This is used by the ConversationManager for topic segmentation.
         Returns ``None`` if the conversation is not found.
         """
-        index = await self._load_index()
-        for entry in index:
-            if entry["conversation_id"] == conversation_id:
-                from datetime import datetime as dt
-
-                started = entry.get("started_at", "")
-                last = entry.get("last_activity", "")
-                conv = Conversation(
-                    channel=entry["channel"],
-                    conversation_id=entry["conversation_id"],
-                    status=ConversationStatus(entry.get("status", "active")),
-                    started_at=(
-                        dt.fromisoformat(started)
-                        if isinstance(started, str) and started
-                        else datetime.now(UTC)
-                    ),
-                    last_activity=(
-                        dt.fromisoformat(last)
-                        if isinstance(last, str) and last
-                        else datetime.now(UTC)
-                    ),
-                    message_count=entry.get("message_count", 0),
-                    topic=entry.get("topic"),
-                    summary=entry.get("summary"),
-                    sender_id=entry.get("sender_id"),
-                    project_id=entry.get("project_id"),
-                    metadata=entry.get("metadata", {}),
+        entry = (await self._snapshot()).by_id.get(conversation_id)
+        if entry is None:
+            return None
+        from datetime import datetime as dt
+
+        started = entry.get("started_at", "")
+        last = entry.get("last_activity", "")
+        conv = Conversation(
+            channel=entry["channel"],
+            conversation_id=entry["conversation_id"],
+            status=ConversationStatus(entry.get("status", "active")),
+            started_at=(
+                dt.fromisoformat(started)
+                if isinstance(started, str) and started
+                else datetime.now(UTC)
+            ),
+            last_activity=(
+                dt.fromisoformat(last)
+                if isinstance(last, str) and last
+                else datetime.now(UTC)
+            ),
+            message_count=entry.get("message_count", 0),
+            topic=entry.get("topic"),
+            summary=entry.get("summary"),
+            sender_id=entry.get("sender_id"),
+            project_id=entry.get("project_id"),
+            metadata=entry.get("metadata", {}),
+        )
+        # Load topic segments if stored.
+        segments_data = entry.get("topic_segments", [])
+        if segments_data:
+            from taskforce.core.domain.conversation import TopicSegment
+
+            for seg_data in segments_data:
+                seg = TopicSegment(
+                    label=seg_data.get("label", ""),
+                    topic_id=seg_data.get("topic_id", ""),
+                    summary=seg_data.get("summary"),
+                    source=seg_data.get("source", "user"),
+                    priority=seg_data.get("priority", 0),
+                    message_range=tuple(seg_data.get("message_range", [0, 0])),
                 )
-                # Load topic segments if stored.
-                segments_data = entry.get("topic_segments", [])
-                if segments_data:
-                    from taskforce.core.domain.conversation import TopicSegment
-
-                    for seg_data in segments_data:
-                        seg = TopicSegment(
-                            label=seg_data.get("label", ""),
-                            topic_id=seg_data.get("topic_id", ""),
-                            summary=seg_data.get("summary"),
-                            source=seg_data.get("source", "user"),
-                            priority=seg_data.get("priority", 0),
-                            message_range=tuple(seg_data.get("message_range", [0, 0])),
-                        )
-                        if seg_data.get("started_at"):
-                            seg.started_at = dt.fromisoformat(seg_data["started_at"])
-                        if seg_data.get("ended_at"):
-                            seg.ended_at = dt.fromisoformat(seg_data["ended_at"])
-                        conv.topic_segments.append(seg)
-                conv.active_topic_id = entry.get("active_topic_id")
-                return conv
-        return None
+                if seg_data.get("started_at"):
+                    seg.started_at = dt.fromisoformat(seg_data["started_at"])
+                if seg_data.get("ended_at"):
+                    seg.ended_at = dt.fromisoformat(seg_data["ended_at"])
+                conv.topic_segments.append(seg)
+        conv.active_topic_id = entry.get("active_topic_id")
+        return conv
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
     async def _load_index(self) -> list[dict[str, Any]]:
-        """Load the conversation index from disk."""
-        if not self._index_file.exists():
-            return []
+        """Load a private, mutable copy of the conversation index."""
+        return [dict(entry) for entry in (await self._snapshot()).entries]
+
+    async def _snapshot(self) -> _IndexSnapshot:
+        """Return the parsed index, re-reading it only when the file changed.
+
+        The snapshot is shared between store instances — treat it as
+        read-only and go through ``_load_index`` to modify entries.
+        """
+        try:
+            st = os.stat(self._index_file)
+        except OSError:
+            _snapshots.pop(self._index_file, None)
+            return _IndexSnapshot([])
+        signature = _signature(st)
+        cached = _snapshots.get(self._index_file)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
         try:
             async with aiofiles.open(self._index_file, encoding="utf-8") as f:
                 content = await f.read()
-            return json.loads(content) if content.strip() else []
+            snapshot = _IndexSnapshot(json.loads(content) if content.strip() else [])
         except (OSError, json.JSONDecodeError) as exc:
             logger.error("conversation.index_load_failed", error=str(exc))
-            return []
+            return _IndexSnapshot([])
+        if time.time_ns() - st.st_mtime_ns >= _RACY_WINDOW_NS:
+            _cache_snapshot(self._index_file, signature, snapshot)
+        return snapshot
 
     async def _save_index(self, index: list[dict[str, Any]]) -> None:
-        """Persist the conversation index to disk."""
+        """Persist the conversation index and cache it as the current snapshot.
+
+        ``index`` is handed over to the cache; callers must not modify it
+        afterwards.
+        """
         await self._write_json(self._index_file, index)
+        try:
+            signature = _signature(os.stat(self._index_file))
+        except OSError:
+            return
+        _cache_snapshot(self._index_file, signature, _IndexSnapshot(index))
 
     async def _load_messages(self, conversation_id: str) -> list[dict[str, Any]]:
         """Load messages for a conversation."""
@@ -385,3 +490,39 @@ class FileConversationStore:
         if path.exists():
             path.unlink()
         temp.rename(path)
+
+
+def _to_info(entry: dict[str, Any]) -> ConversationInfo:
+    archived_at = entry.get("archived_at")
+    return ConversationInfo(
+        conversation_id=entry["conversation_id"],
+        channel=entry["channel"],
+        started_at=datetime.fromisoformat(entry["started_at"]),
+        last_activity=datetime.fromisoformat(entry["last_activity"]),
+        message_count=entry["message_count"],
+        topic=entry.get("topic"),
+        project_id=entry.get("project_id"),
+        archived_at=(
+            datetime.fromisoformat(archived_at)
+            if entry["status"] == ConversationStatus.ARCHIVED.value and archived_at
+            else None
+        ),
+    )
+
+
+def _to_summary(entry: dict[str, Any]) -> ConversationSummary:
+    return ConversationSummary(
+        conversation_id=entry["conversation_id"],
+        topic=entry.get("topic") or "",
+        summary=entry.get("summary") or "",
+        started_at=datetime.fromisoformat(entry["started_at"]),
+        archived_at=datetime.fromisoformat(entry["archived_at"]),
+        message_count=entry["message_count"],
+        project_id=entry.get("project_id"),
+    )
+
+
+def _project_filter(project_id: str | None) -> Any:
+    if project_id is None:
+        return None
+    return lambda entry: entry.get("project_id") == project_id
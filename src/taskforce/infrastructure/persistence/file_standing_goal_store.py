@@ -92,6 +92,8 @@ class FileStandingGoalStore:
         goal_id: str,
         evaluated_at: datetime,
         action_taken: str,
+        *,
+        input_fingerprint: str | None = None,
     ) -> None:
         async with self._lock:
             goals = self._read()
@@ -100,6 +102,8 @@ class FileStandingGoalStore:
                     continue
                 existing.last_evaluated_at = evaluated_at
                 existing.last_action_taken = action_taken
+                if input_fingerprint is not None:
+                    existing.input_fingerprint = input_fingerprint
                 goals[idx] = existing
                 self._write(goals)
                 return
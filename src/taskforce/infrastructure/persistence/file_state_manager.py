@@ -15,6 +15,7 @@ The implementation is compatible with Agent V2 state files and provides:
 
 import asyncio
 import json
+import time
 from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
@@ -25,6 +26,13 @@ import structlog
 
 from taskforce.core.interfaces.state import StateManagerProtocol
 from taskforce.core.utils.atomic_io import atomic_write_text
+from taskforce.core.utils.metrics import get_metrics_registry
+
+_STATE_SAVE_DURATION = get_metrics_registry().histogram(
+    "taskforce_state_save_duration_seconds",
+    "FileStateManager.save_state latency, including session-lock wait.",
+    ("outcome",),
+)
 
 
 class FileStateManager(StateManagerProtocol):
@@ -173,6 +181,7 @@ class FileStateManager(StateManagerProtocol):
         Returns:
             True if state was saved successfully, False otherwise
         """
+        started = time.perf_counter()
         async with await self._get_lock(session_id):
             state_file = self.states_dir / f"{session_id}.json"
 
@@ -184,6 +193,7 @@ class FileStateManager(StateManagerProtocol):
                     session_id=session_id,
                     error=str(exc),
                 )
+                _STATE_SAVE_DURATION.labels("error").observe(time.perf_counter() - started)
                 return False
 
             try:
@@ -194,8 +204,11 @@ class FileStateManager(StateManagerProtocol):
                     session_id=session_id,
                     error=str(exc),
                 )
+                _STATE_SAVE_DURATION.labels("error").observe(time.perf_counter() - started)
                 return False
 
+            _STATE_SAVE_DURATION.labels("ok").observe(time.perf_counter() - started)
+
             self.logger.info(
                 "state_saved",
                 session_id=session_id,
@@ -21,6 +21,8 @@ from typing import Any
 import structlog
 import yaml
 
+from taskforce.core.utils.config_catalog import get_config_catalog
+
 logger = structlog.get_logger()
 
 
@@ -71,6 +73,9 @@ def safe_load_yaml(path: Path) -> dict[str, Any] | None:
     """
     Safely load a YAML file, returning None on any error.
 
+    Parsed documents are cached in the shared config catalog until the
+    file's mtime, size or inode changes; each call returns a fresh copy.
+
     Args:
         path: Path to the YAML file.
 
@@ -82,8 +87,7 @@ def safe_load_yaml(path: Path) -> dict[str, Any] | None:
         return None
 
     try:
-        with open(path, encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        return get_config_catalog().load_yaml(path)
     except Exception as e:
         logger.warning(
             "yaml.load.failed",
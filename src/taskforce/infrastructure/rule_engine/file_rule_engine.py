@@ -2,11 +2,22 @@
 
 Maintains a set of TriggerRules and evaluates them against incoming
 AgentEvents, returning matching actions to dispatch.
+
+Rules are compiled when they are added: payload filters become
+predicates and templates are parsed once. Compiled rules are indexed by
+their ``(source, event_type)`` trigger (``"*"`` being its own key) and
+each index bucket is kept in priority order, so an event only looks at
+the up to four buckets that can match it and merges them instead of
+sorting every rule.
 """
 
 from __future__ import annotations
 
+import bisect
+import heapq
 import json
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any
 
@@ -20,89 +31,120 @@ from taskforce.core.utils.atomic_io import atomic_write_text
 logger = structlog.get_logger(__name__)
 
 
-def _match_filter(value: Any, condition: Any) -> bool:
-    """Evaluate a single filter condition against a value.
+_Check = Callable[[Any], bool]
+
+# Operator -> predicate factory. Unknown operators match everything, as
+# they always have.
+_OPERATORS: dict[str, Callable[[Any], _Check]] = {
+    "$eq": lambda expected: lambda value: value == expected,
+    "$ne": lambda expected: lambda value: value != expected,
+    "$gt": lambda expected: lambda value: value > expected,
+    "$gte": lambda expected: lambda value: value >= expected,
+    "$lt": lambda expected: lambda value: value < expected,
+    "$lte": lambda expected: lambda value: value <= expected,
+    "$in": lambda expected: lambda value: value in expected,
+    "$contains": lambda expected: lambda value: expected in str(value),
+}
+
+
+def _compile_filter(condition: Any) -> _Check:
+    """Turn one filter condition into a predicate on the payload value.
 
     Supports operators: $eq, $ne, $gt, $gte, $lt, $lte, $in, $contains.
     If condition is a plain value (not a dict), uses equality check.
     """
     if not isinstance(condition, dict):
-        return value == condition
+        return lambda value: value == condition
 
-    for op, expected in condition.items():
-        if op == "$eq" and value != expected:
-            return False
-        if op == "$ne" and value == expected:
-            return False
-        if op == "$gt" and not (value > expected):
-            return False
-        if op == "$gte" and not (value >= expected):
-            return False
-        if op == "$lt" and not (value < expected):
-            return False
-        if op == "$lte" and not (value <= expected):
-            return False
-        if op == "$in" and value not in expected:
-            return False
-        if op == "$contains" and expected not in str(value):
-            return False
-    return True
+    checks = [_OPERATORS[op](expected) for op, expected in condition.items() if op in _OPERATORS]
+    if len(checks) == 1:
+        return checks[0]
+    return lambda value: all(check(value) for check in checks)
+
+
+def _compile_template(template: str, rule_id: str = "") -> Callable[[AgentEvent], str]:
+    """Compile a Jinja2-style template rendered with event data.
 
+    Falls back to simple {{key}} replacement if jinja2 is not available
+    or the template does not parse, so one malformed template neither
+    rejects its rule nor stops the other rules from loading.
+    """
+    compiled: Any = None
+    try:
+        from jinja2 import Template, TemplateSyntaxError
+    except ImportError:
+        pass
+    else:
+        try:
+            compiled = Template(template)
+        except TemplateSyntaxError as exc:
+            logger.warning("rule_engine.template_invalid", rule_id=rule_id, error=str(exc))
+
+    def render(event: AgentEvent) -> str:
+        context = {
+            "event": {
+                "source": event.source,
+                "event_type": event.event_type.value,
+                **event.payload,
+            },
+            "metadata": event.metadata,
+        }
+        if compiled is not None:
+            return compiled.render(**context)
+        result = template
+        for key, val in context["event"].items():
+            result = result.replace("{{event." + key + "}}", str(val))
+        for key, val in context["metadata"].items():
+            result = result.replace("{{metadata." + key + "}}", str(val))
+        return result
 
-def _matches_event(rule: TriggerRule, event: AgentEvent) -> bool:
-    """Check whether a rule's trigger condition matches an event."""
-    trigger = rule.trigger
+    return render
 
-    # Check source
-    if trigger.source != "*" and trigger.source != event.source:
-        return False
 
-    # Check event type
-    if trigger.event_type != "*" and trigger.event_type != event.event_type.value:
-        return False
+@dataclass(frozen=True)
+class _CompiledRule:
+    """A rule with its filters and template compiled once, at add time."""
 
-    # Check payload filters
-    for key, condition in trigger.filters.items():
-        actual = event.payload.get(key)
-        if not _match_filter(actual, condition):
-            return False
+    rule: TriggerRule
+    # (-priority, insertion sequence): highest priority first, ties in the
+    # order the rules were added.
+    sort_key: tuple[int, int]
+    checks: tuple[tuple[str, _Check], ...]
+    render: Callable[[AgentEvent], str] | None
 
-    return True
+    @property
+    def index_key(self) -> tuple[str, str]:
+        return (self.rule.trigger.source, self.rule.trigger.event_type)
 
+    def matches(self, payload: dict[str, Any]) -> bool:
+        for key, check in self.checks:
+            if not check(payload.get(key)):
+                return False
+        return True
 
-def _render_template(template: str, event: AgentEvent) -> str:
-    """Render a Jinja2-style template with event data.
 
-    Falls back to simple string.format_map if jinja2 is not available.
-    """
-    context = {
-        "event": {
-            "source": event.source,
-            "event_type": event.event_type.value,
-            **event.payload,
-        },
-        "metadata": event.metadata,
-    }
+def _compile_rule(rule: TriggerRule, sequence: int) -> _CompiledRule:
+    return _CompiledRule(
+        rule=rule,
+        sort_key=(-rule.priority, sequence),
+        checks=tuple((key, _compile_filter(cond)) for key, cond in rule.trigger.filters.items()),
+        render=(
+            _compile_template(rule.action.template, rule.rule_id) if rule.action.template else None
+        ),
+    )
 
-    try:
-        from jinja2 import Template
 
-        return Template(template).render(**context)
-    except ImportError:
-        # Fallback: simple {{key}} replacement
-        result = template
-        for key, val in context.get("event", {}).items():
-            result = result.replace("{{event." + key + "}}", str(val))
-        for key, val in context.get("metadata", {}).items():
-            result = result.replace("{{metadata." + key + "}}", str(val))
-        return result
+def _sort_key(compiled: _CompiledRule) -> tuple[int, int]:
+    return compiled.sort_key
 
 
 class FileRuleEngine:
     """Evaluates trigger rules against agent events.
 
     Rules are stored in-memory and persisted to a JSON file
-    for survival across restarts.
+    for survival across restarts. A rule's trigger, priority and template
+    are compiled by :meth:`add_rule`; re-add the rule after changing them.
+    ``enabled`` is checked on every evaluation.
     """
 
     def __init__(
@@ -110,7 +152,9 @@ class FileRuleEngine:
         work_dir: str = ".taskforce",
         rules_filename: str = "rules.json",
     ) -> None:
-        self._rules: dict[str, TriggerRule] = {}
+        self._rules: dict[str, _CompiledRule] = {}
+        self._index: dict[tuple[str, str], list[_CompiledRule]] = {}
+        self._sequence = 0
         self._store_path = Path(work_dir) / rules_filename
 
     async def load(self) -> None:
@@ -121,43 +165,91 @@ class FileRuleEngine:
             async with aiofiles.open(self._store_path, encoding="utf-8") as f:
                 raw = await f.read()
             data = json.loads(raw)
-            for item in data:
-                rule = TriggerRule.from_dict(item)
-                self._rules[rule.rule_id] = rule
-            logger.info("rule_engine.loaded", count=len(self._rules))
         except Exception as exc:
             logger.warning("rule_engine.load_failed", error=str(exc))
+            return
+        for item in data:
+            # One broken entry must not drop the rules stored after it.
+            try:
+                self._insert(TriggerRule.from_dict(item))
+            except Exception as exc:  # noqa: BLE001 — skip the entry, keep loading
+                logger.warning("rule_engine.rule_load_failed", error=str(exc))
+        logger.info("rule_engine.loaded", count=len(self._rules))
 
     async def _persist(self) -> None:
         """Persist rules to disk."""
         self._store_path.parent.mkdir(parents=True, exist_ok=True)
-        data = [r.to_dict() for r in self._rules.values()]
+        data = [c.rule.to_dict() for c in self._rules.values()]
         raw = json.dumps(data, indent=2, default=str)
         await atomic_write_text(self._store_path, raw)
 
+    def _insert(self, rule: TriggerRule) -> None:
+        """Compile ``rule`` and file it under its index key.
+
+        A rule replacing one with the same ID keeps the old one's place
+        among rules of equal priority.
+        """
+        previous = self._discard(rule.rule_id)
+        if previous is not None:
+            sequence = previous.sort_key[1]
+        else:
+            sequence = self._sequence
+            self._sequence += 1
+        compiled = _compile_rule(rule, sequence)
+        self._rules[rule.rule_id] = compiled
+        bisect.insort(self._index.setdefault(compiled.index_key, []), compiled, key=_sort_key)
+
+    def _discard(self, rule_id: str) -> _CompiledRule | None:
+        compiled = self._rules.pop(rule_id, None)
+        if compiled is None:
+            return None
+        bucket = self._index[compiled.index_key]
+        position = bisect.bisect_left(bucket, compiled.sort_key, key=_sort_key)
+        del bucket[position]
+        if not bucket:
+            del self._index[compiled.index_key]
+        return compiled
+
     async def add_rule(self, rule: TriggerRule) -> str:
         """Add a new trigger rule."""
-        self._rules[rule.rule_id] = rule
+        self._insert(rule)
         await self._persist()
         logger.info("rule_engine.rule_added", rule_id=rule.rule_id, name=rule.name)
         return rule.rule_id
 
     async def remove_rule(self, rule_id: str) -> bool:
         """Remove a trigger rule."""
-        if rule_id not in self._rules:
+        if self._discard(rule_id) is None:
             return False
-        del self._rules[rule_id]
         await self._persist()
         logger.info("rule_engine.rule_removed", rule_id=rule_id)
         return True
 
     async def get_rule(self, rule_id: str) -> TriggerRule | None:
         """Retrieve a rule by ID."""
-        return self._rules.get(rule_id)
+        compiled = self._rules.get(rule_id)
+        return compiled.rule if compiled is not None else None
 
     async def list_rules(self) -> list[TriggerRule]:
         """List all rules, sorted by priority descending."""
-        return sorted(self._rules.values(), key=lambda r: r.priority, reverse=True)
+        return [c.rule for c in heapq.merge(*self._index.values(), key=_sort_key)]
+
+    def _candidates(self, event: AgentEvent) -> Iterable[_CompiledRule]:
+        """Rules whose source and event type can match, in priority order."""
+        event_type = event.event_type.value
+        buckets = [
+            bucket
+            for key in {
+                (event.source, event_type),
+                (event.source, "*"),
+                ("*", event_type),
+                ("*", "*"),
+            }
+            if (bucket := self._index.get(key))
+        ]
+        if len(buckets) == 1:
+            return buckets[0]
+        return heapq.merge(*buckets, key=_sort_key)
 
     async def evaluate(self, event: AgentEvent) -> list[RuleAction]:
         """Evaluate all rules against an event, return matching actions.
@@ -165,30 +257,22 @@ class FileRuleEngine:
         Actions are returned in priority order (highest first).
         If a rule has a template, the action's params['message'] is rendered.
         """
-        rules_sorted = sorted(self._rules.values(), key=lambda r: r.priority, reverse=True)
-
         matching_actions: list[RuleAction] = []
-        for rule in rules_sorted:
-            if not rule.enabled:
+        for compiled in self._candidates(event):
+            rule = compiled.rule
+            if not rule.enabled or not compiled.matches(event.payload):
                 continue
-            if _matches_event(rule, event):
-                action = rule.action
-                # Render template if present
-                if action.template:
-                    rendered = _render_template(action.template, event)
-                    params = dict(action.params)
-                    params["message"] = rendered
-                    action = RuleAction(
-                        action_type=action.action_type,
-                        params=params,
-                        template=action.template,
-                    )
-                matching_actions.append(action)
-                logger.info(
-                    "rule_engine.rule_matched",
-                    rule_id=rule.rule_id,
-                    rule_name=rule.name,
-                    event_type=event.event_type.value,
-                )
+            action = rule.action
+            if compiled.render is not None:
+                params = dict(action.params)
+                params["message"] = compiled.render(event)
+                action = replace(action, params=params)
+            matching_actions.append(action)
+            logger.info(
+                "rule_engine.rule_matched",
+                rule_id=rule.rule_id,
+                rule_name=rule.name,
+                event_type=event.event_type.value,
+            )
 
         return matching_actions
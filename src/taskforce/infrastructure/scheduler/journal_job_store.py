@@ -0,0 +1,256 @@
+"""Journal-based job store for large numbers of scheduled jobs.
+
+``FileJobStore`` keeps one JSON file per job, so loading N jobs opens N
+files and every firing rewrites (and fsyncs) a whole file. This store
+keeps an in-memory index of all jobs and persists changes as single
+lines appended to one journal::
+
+    {work_dir}/scheduler/jobs.jsonl
+    {"op": "put", "job": {...}}
+    {"op": "delete", "job_id": "..."}
+
+Startup replays the journal once; the index keeps each job's latest
+journal line (bytes, parsed on ``load``), which is several times smaller
+than holding the decoded jobs. Each ``save``/``delete`` appends one
+record, and concurrent writers share one ``fsync`` (group commit). When
+the journal holds more than ``compact_ratio`` times as many records as
+live jobs, it is rewritten atomically with one ``put`` per job.
+
+A torn final line (crash mid-append) is truncated on load. Any other
+unparseable line is logged and skipped. If the journal does not exist
+yet, jobs from a ``FileJobStore`` directory are imported once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import structlog
+
+from taskforce.core.domain.schedule import ScheduleJob
+
+logger = structlog.get_logger(__name__)
+
+
+class JournalJobStore:
+    """Persist scheduled jobs in an append-only journal with an in-memory index.
+
+    Args:
+        work_dir: Base directory; the journal lives in ``scheduler/``.
+        fsync: Flush each change to stable storage before returning
+            (shared between concurrent writers).
+        compact_ratio: Rewrite the journal once it holds this many times
+            more records than live jobs.
+        compact_min_records: Never compact journals smaller than this.
+    """
+
+    def __init__(
+        self,
+        work_dir: str = ".taskforce",
+        *,
+        fsync: bool = True,
+        compact_ratio: float = 2.0,
+        compact_min_records: int = 1000,
+    ) -> None:
+        self._dir = Path(work_dir) / "scheduler"
+        self._path = self._dir / "jobs.jsonl"
+        self._legacy_dir = self._dir / "jobs"
+        self._fsync = fsync
+        self._compact_ratio = max(1.0, float(compact_ratio))
+        self._compact_min_records = max(1, int(compact_min_records))
+
+        # job_id -> latest ``put`` line for that job
+        self._index: dict[str, bytes] | None = None
+        self._handle: BinaryIO | None = None
+        self._records = 0
+        self._appended = 0
+        self._synced = 0
+        self._buffer: list[bytes] | None = None
+        self._sync_lock = asyncio.Lock()
+
+    @property
+    def path(self) -> Path:
+        """The journal file."""
+        return self._path
+
+    async def save(self, job: ScheduleJob) -> None:
+        """Persist a job (one appended record)."""
+        index = await self._ensure_loaded()
+        line = _encode({"op": "put", "job": job.to_dict()})
+        index[job.job_id] = line
+        self._append(line)
+        await self._commit()
+        logger.debug("job_store.saved", job_id=job.job_id, name=job.name)
+
+    async def load(self, job_id: str) -> ScheduleJob | None:
+        """Load a single job from the index."""
+        index = await self._ensure_loaded()
+        line = index.get(job_id)
+        return _decode(line) if line is not None else None
+
+    async def load_all(self) -> list[ScheduleJob]:
+        """Load all persisted jobs."""
+        index = await self._ensure_loaded()
+        return [_decode(line) for line in index.values()]
+
+    async def delete(self, job_id: str) -> bool:
+        """Delete a persisted job."""
+        index = await self._ensure_loaded()
+        if index.pop(job_id, None) is None:
+            return False
+        self._append(_encode({"op": "delete", "job_id": job_id}))
+        await self._commit()
+        logger.debug("job_store.deleted", job_id=job_id)
+        return True
+
+    def close(self) -> None:
+        """Close the journal handle (the index is reloaded on next use)."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        self._index = None
+
+    # ------------------------------------------------------------------
+    # Journal
+    # ------------------------------------------------------------------
+
+    async def _ensure_loaded(self) -> dict[str, bytes]:
+        if self._index is None:
+            index, records = await asyncio.to_thread(self._replay)
+            if self._index is None:
+                self._index = index
+                self._records = records
+                self._handle = open(self._path, "ab")  # noqa: SIM115 — long-lived handle
+                if self._compaction_due():
+                    async with self._sync_lock:
+                        await self._compact()
+        return self._index
+
+    def _replay(self) -> tuple[dict[str, bytes], int]:
+        self._dir.mkdir(parents=True, exist_ok=True)
+        if not self._path.exists():
+            return self._import_legacy()
+        index: dict[str, bytes] = {}
+        records = 0
+        with open(self._path, "rb") as handle:
+            data = handle.read()
+        complete = data.rfind(b"\n") + 1
+        if complete < len(data):
+            logger.warning(
+                "job_store.journal_torn_tail",
+                path=str(self._path),
+                dropped_bytes=len(data) - complete,
+            )
+            with open(self._path, "r+b") as handle:
+                handle.truncate(complete)
+        for lineno, line in enumerate(data[:complete].splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                if record["op"] == "put":
+                    index[str(record["job"]["job_id"])] = line + b"\n"
+                elif record["op"] == "delete":
+                    index.pop(str(record["job_id"]), None)
+                else:
+                    raise ValueError(f"unknown op {record['op']!r}")
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError) as exc:
+                logger.error(
+                    "job_store.journal_line_corrupt",
+                    path=str(self._path),
+                    line=lineno,
+                    error=str(exc),
+                )
+                continue
+            records += 1
+        return index, records
+
+    def _import_legacy(self) -> tuple[dict[str, bytes], int]:
+        """Seed a new journal from ``FileJobStore`` files, if any."""
+        index: dict[str, bytes] = {}
+        for path in sorted(self._legacy_dir.glob("*.json")):
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                job = ScheduleJob.from_dict(data)
+                index[job.job_id] = _encode({"op": "put", "job": job.to_dict()})
+            except (OSError, json.JSONDecodeError, KeyError, ValueError) as exc:
+                logger.error("job_store.legacy_import_failed", path=str(path), error=str(exc))
+        if index:
+            _write_atomic(self._path, b"".join(index.values()))
+            logger.info("job_store.legacy_imported", jobs=len(index), path=str(self._path))
+        return index, len(index)
+
+    def _append(self, line: bytes) -> None:
+        self._appended += 1
+        self._records += 1
+        if self._buffer is not None:  # compaction in progress
+            self._buffer.append(line)
+            return
+        assert self._handle is not None
+        self._handle.write(line)
+        self._handle.flush()
+
+    async def _commit(self) -> None:
+        """Make every record appended so far durable, sharing fsyncs."""
+        target = self._appended
+        async with self._sync_lock:
+            if self._fsync and self._synced < target and self._handle is not None:
+                upto = self._appended
+                await asyncio.to_thread(os.fsync, self._handle.fileno())
+                self._synced = upto
+            if self._compaction_due():
+                await self._compact()
+
+    def _compaction_due(self) -> bool:
+        return (
+            self._index is not None
+            and self._records >= self._compact_min_records
+            and self._records > len(self._index) * self._compact_ratio
+        )
+
+    async def _compact(self) -> None:
+        """Rewrite the journal as one ``put`` per live job.
+
+        The caller holds ``_sync_lock``. Records appended while the
+        snapshot is being written are buffered and appended afterwards.
+        """
+        assert self._index is not None and self._handle is not None
+        before = self._records
+        snapshot = b"".join(self._index.values())
+        snapshot_records = len(self._index)
+        snapshot_appended = self._appended
+        self._buffer = []
+        self._handle.close()
+        self._handle = None
+        try:
+            await asyncio.to_thread(_write_atomic, self._path, snapshot)
+        finally:
+            self._handle = open(self._path, "ab")  # noqa: SIM115 — long-lived handle
+            buffered, self._buffer = self._buffer, None
+            self._handle.write(b"".join(buffered))
+            self._handle.flush()
+        self._records = snapshot_records + len(buffered)
+        self._synced = snapshot_appended
+        logger.info("job_store.journal_compacted", records_before=before, jobs=snapshot_records)
+
+
+def _encode(record: dict[str, Any]) -> bytes:
+    return json.dumps(record, default=str).encode("utf-8") + b"\n"
+
+
+def _decode(line: bytes) -> ScheduleJob:
+    return ScheduleJob.from_dict(json.loads(line)["job"])
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to a sibling temp file, fsync it, then rename over ``path``."""
+    tmp = path.with_name(f"{path.name}.compact")
+    with open(tmp, "wb") as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp, path)
@@ -1,8 +1,16 @@
 """Asyncio-based scheduler service for managing timed jobs.
 
 Uses asyncio tasks for scheduling instead of APScheduler to avoid
-an external dependency. Jobs are persisted via FileJobStore and
-survive restarts.
+an external dependency. Jobs are persisted via FileJobStore (or the
+indexed JournalJobStore) and survive restarts.
+
+Scaling (thousands of jobs): all jobs share one min-heap of next-fire
+times driven by a single timer task, which sleeps until the earliest
+slot. Due slots are handed to a bounded pool of worker tasks
+(``max_concurrent_fires``) that persist the firing and run the event
+callback, so a slow callback never delays the timer. Cron expressions are
+compiled once and the next occurrence is found by skipping whole
+months/days/hours, keeping startup cheap.
 
 Edge-case handling (issue #158):
 
@@ -13,7 +21,10 @@ Edge-case handling (issue #158):
 - **Coalesce policy:** Jobs missed during downtime honour the
   :class:`taskforce.core.domain.schedule.CoalescePolicy` field. ``SKIP``
   ignores missed firings; ``RUN_ONCE`` fires a single catch-up at
-  startup.
+  startup. The same policy applies to any recurring slot dispatched more
+  than ``misfire_grace_seconds`` late (e.g. after the event loop stalled).
+  A slot that comes due while the job's previous firing is still running
+  is coalesced into it rather than queued.
 - **One-shot idempotency:** ``last_fired_at`` is persisted **before** the
   action runs. On startup, one-shots whose ``last_fired_at`` is set are
   skipped and removed from disk so they cannot fire again.
@@ -26,8 +37,14 @@ Edge-case handling (issue #158):
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
+import time
+from collections import Counter
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
@@ -37,9 +54,13 @@ from taskforce.core.domain.agent_event import AgentEvent, AgentEventType
 from taskforce.core.domain.schedule import CoalescePolicy, ScheduleJob, ScheduleType
 from taskforce.core.utils.time import utc_now
 from taskforce.infrastructure.scheduler.file_job_store import FileJobStore
+from taskforce.infrastructure.scheduler.journal_job_store import JournalJobStore
 
 logger = structlog.get_logger(__name__)
 
+# Upper bound on one driver sleep, so wall-clock jumps are noticed.
+_MAX_DRIVER_SLEEP = 60.0
+
 
 def _parse_interval(expression: str) -> timedelta:
     """Parse an interval expression like '15m', '1h', '30s' into timedelta."""
@@ -77,6 +98,57 @@ def _is_nonexistent_local(naive: datetime, zone: ZoneInfo) -> bool:
     return roundtrip != naive
 
 
+@dataclass(frozen=True)
+class _CronSpec:
+    """A 5-field cron expression expanded into the set of values per field."""
+
+    minutes: frozenset[int]
+    hours: frozenset[int]
+    days: frozenset[int]
+    months: frozenset[int]
+    weekdays: frozenset[int]  # datetime.weekday(): Monday == 0
+
+
+def _cron_field_matches(value: int, spec: str, min_val: int) -> bool:
+    if spec == "*":
+        return True
+    for part in spec.split(","):
+        if "/" in part:
+            base, step = part.split("/", 1)
+            base_val = min_val if base == "*" else int(base)
+            if (value - base_val) >= 0 and (value - base_val) % int(step) == 0:
+                return True
+        elif "-" in part:
+            lo, hi = part.split("-", 1)
+            if int(lo) <= value <= int(hi):
+                return True
+        elif int(part) == value:
+            return True
+    return False
+
+
+@lru_cache(maxsize=4096)
+def _compile_cron(expression: str) -> _CronSpec:
+    """Expand ``expression`` once; thousands of jobs share a few expressions."""
+    parts = expression.strip().split()
+    if len(parts) != 5:
+        raise ValueError(f"Invalid cron expression (expected 5 fields): {expression}")
+
+    def expand(spec: str, min_val: int, max_val: int) -> frozenset[int]:
+        return frozenset(
+            v for v in range(min_val, max_val + 1) if _cron_field_matches(v, spec, min_val)
+        )
+
+    minute_spec, hour_spec, dom_spec, month_spec, dow_spec = parts
+    return _CronSpec(
+        minutes=expand(minute_spec, 0, 59),
+        hours=expand(hour_spec, 0, 23),
+        days=expand(dom_spec, 1, 31),
+        months=expand(month_spec, 1, 12),
+        weekdays=expand(dow_spec, 0, 6),
+    )
+
+
 def _next_cron_occurrence(
     expression: str,
     after: datetime,
@@ -88,6 +160,10 @@ def _next_cron_occurrence(
     Cron fields are evaluated in ``timezone`` (defaults to UTC). The returned
     datetime is timezone-aware in UTC so callers can keep doing UTC arithmetic.
 
+    The search skips whole months, days and hours that cannot match, so a
+    daily expression costs a handful of steps rather than a minute-by-minute
+    scan.
+
     DST handling:
 
     - **Forward jump** (e.g. local 02:30 does not exist on the spring DST
@@ -96,30 +172,9 @@ def _next_cron_occurrence(
       day): the first occurrence is used (``fold=0``), so the slot fires
       exactly once.
     """
-    parts = expression.strip().split()
-    if len(parts) != 5:
-        raise ValueError(f"Invalid cron expression (expected 5 fields): {expression}")
-
-    minute_spec, hour_spec, dom_spec, month_spec, dow_spec = parts
+    spec = _compile_cron(expression)
     zone = _resolve_zone(timezone)
 
-    def _matches(value: int, spec: str, min_val: int, max_val: int) -> bool:
-        if spec == "*":
-            return True
-        for part in spec.split(","):
-            if "/" in part:
-                base, step = part.split("/", 1)
-                base_val = min_val if base == "*" else int(base)
-                if (value - base_val) >= 0 and (value - base_val) % int(step) == 0:
-                    return True
-            elif "-" in part:
-                lo, hi = part.split("-", 1)
-                if int(lo) <= value <= int(hi):
-                    return True
-            elif int(part) == value:
-                return True
-        return False
-
     # Convert ``after`` to local naive time so we iterate the cron grid in the
     # job's wall clock (so "0 8 * * *" stays at 08:00 local across DST).
     if after.tzinfo is None:
@@ -128,19 +183,32 @@ def _next_cron_occurrence(
         after_utc = after.astimezone(UTC)
     local_after = after_utc.astimezone(zone).replace(tzinfo=None)
     candidate = local_after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+    limit = candidate + timedelta(minutes=525960)  # scan up to ~1 year
 
-    for _ in range(525960):  # scan up to ~1 year
-        if (
-            _matches(candidate.minute, minute_spec, 0, 59)
-            and _matches(candidate.hour, hour_spec, 0, 23)
-            and _matches(candidate.day, dom_spec, 1, 31)
-            and _matches(candidate.month, month_spec, 1, 12)
-            and _matches(candidate.weekday(), dow_spec, 0, 6)
-        ):
-            if not _is_nonexistent_local(candidate, zone):
-                aware_local = candidate.replace(tzinfo=zone, fold=0)
-                return aware_local.astimezone(UTC)
-            # Skipped wall-clock (DST gap) — keep scanning.
+    while candidate < limit:
+        if candidate.month not in spec.months:
+            year, month = divmod(candidate.month, 12)
+            candidate = candidate.replace(
+                year=candidate.year + year, month=month + 1, day=1, hour=0, minute=0
+            )
+            continue
+        if candidate.day not in spec.days or candidate.weekday() not in spec.weekdays:
+            candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            continue
+        if candidate.hour not in spec.hours:
+            candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            continue
+        if candidate.minute not in spec.minutes:
+            later = [m for m in spec.minutes if m > candidate.minute]
+            if later:
+                candidate = candidate.replace(minute=min(later))
+            else:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            continue
+        if not _is_nonexistent_local(candidate, zone):
+            aware_local = candidate.replace(tzinfo=zone, fold=0)
+            return aware_local.astimezone(UTC)
+        # Skipped wall-clock (DST gap) — keep scanning.
         candidate += timedelta(minutes=1)
 
     raise ValueError(f"No matching time found within 1 year for cron: {expression}")
@@ -151,6 +219,19 @@ class SchedulerService:
 
     Persists jobs to a FileJobStore and publishes AgentEvents on the
     message bus when jobs fire.
+
+    Args:
+        work_dir: Base directory of the default job store.
+        event_callback: Receives one ``AgentEvent`` per firing.
+        job_store: Store to use instead of the one selected by ``store``.
+        default_timezone: Timezone for jobs that do not set one.
+        store: ``file`` (one JSON file per job) or ``journal``
+            (:class:`JournalJobStore`, for large job counts).
+        max_concurrent_fires: Size of the worker pool running callbacks.
+        misfire_grace_seconds: How late a slot may be dispatched and still
+            count as on time; later slots follow the job's coalesce policy.
+            The default minute absorbs event-loop stalls and slow fires, so
+            only real downtime skips recurring slots.
     """
 
     def __init__(
@@ -159,13 +240,32 @@ class SchedulerService:
         event_callback: Callable[[AgentEvent], Awaitable[None]] | None = None,
         job_store: Any | None = None,
         default_timezone: str = "UTC",
+        *,
+        store: str = "file",
+        max_concurrent_fires: int = 16,
+        misfire_grace_seconds: float = 60.0,
     ) -> None:
-        self._store = job_store or FileJobStore(work_dir)
+        self._store = job_store or _build_job_store(store, work_dir)
         self._event_callback = event_callback
         self._jobs: dict[str, ScheduleJob] = {}
-        self._tasks: dict[str, asyncio.Task[None]] = {}
         self._running = False
         self._default_timezone = default_timezone or "UTC"
+        self._max_concurrent_fires = max(1, int(max_concurrent_fires))
+        self._misfire_grace = max(0.0, float(misfire_grace_seconds))
+
+        # Timer heap of (due timestamp, entry id, job_id). Rescheduling or
+        # removing a job only replaces its entry id in ``_entries``; stale
+        # heap entries are discarded when they surface.
+        self._heap: list[tuple[float, int, str]] = []
+        self._entries: dict[str, int] = {}
+        self._entry_ids = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._driver: asyncio.Task[None] | None = None
+
+        self._dispatch: asyncio.Queue[tuple[str, float]] = asyncio.Queue()
+        self._workers: list[asyncio.Task[None]] = []
+        self._busy: set[str] = set()  # jobs queued or firing
+        self.stats: Counter[str] = Counter()
 
     @property
     def is_running(self) -> bool:
@@ -186,8 +286,11 @@ class SchedulerService:
         if self._running:
             return
         self._running = True
+        self._wakeup = asyncio.Event()
+        self._dispatch = asyncio.Queue()
         persisted = await self._store.load_all()
         scheduled = 0
+        now = utc_now()
         for job in persisted:
             if job.schedule_type == ScheduleType.ONE_SHOT and job.last_fired_at is not None:
                 # Already fired before a crash/restart — drop it permanently.
@@ -200,19 +303,28 @@ class SchedulerService:
                 await self._store.delete(job.job_id)
                 continue
             self._jobs[job.job_id] = job
-            if job.enabled:
-                self._schedule_task(job)
+            if job.enabled and self._schedule(job, self._initial_due(job, now)):
                 scheduled += 1
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"scheduler-worker-{i}")
+            for i in range(self._max_concurrent_fires)
+        ]
+        self._driver = asyncio.create_task(self._drive(), name="scheduler-driver")
         logger.info("scheduler.started", job_count=scheduled)
 
     async def stop(self) -> None:
-        """Gracefully stop all scheduled tasks."""
+        """Gracefully stop the driver and worker tasks."""
         self._running = False
-        for task in self._tasks.values():
+        tasks = [t for t in (self._driver, *self._workers) if t is not None]
+        for task in tasks:
             task.cancel()
-        if self._tasks:
-            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
-        self._tasks.clear()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._driver = None
+        self._workers = []
+        self._heap.clear()
+        self._entries.clear()
+        self._busy.clear()
         logger.info("scheduler.stopped")
 
     async def add_job(self, job: ScheduleJob) -> str:
@@ -222,7 +334,7 @@ class SchedulerService:
         self._jobs[job.job_id] = job
         await self._store.save(job)
         if job.enabled and self._running:
-            self._schedule_task(job)
+            self._schedule(job, self._initial_due(job, utc_now()))
         logger.info(
             "scheduler.job_added",
             job_id=job.job_id,
@@ -236,9 +348,7 @@ class SchedulerService:
         """Remove a scheduled job."""
         if job_id not in self._jobs:
             return False
-        task = self._tasks.pop(job_id, None)
-        if task:
-            task.cancel()
+        self._unschedule(job_id)
         del self._jobs[job_id]
         await self._store.delete(job_id)
         logger.info("scheduler.job_removed", job_id=job_id)
@@ -259,9 +369,7 @@ class SchedulerService:
             return False
         job.enabled = False
         await self._store.save(job)
-        task = self._tasks.pop(job_id, None)
-        if task:
-            task.cancel()
+        self._unschedule(job_id)
         return True
 
     async def resume_job(self, job_id: str) -> bool:
@@ -272,144 +380,183 @@ class SchedulerService:
         job.enabled = True
         await self._store.save(job)
         if self._running:
-            self._schedule_task(job)
+            self._schedule(job, self._initial_due(job, utc_now()))
         return True
 
-    def _schedule_task(self, job: ScheduleJob) -> None:
-        """Create an asyncio task for a job."""
-        existing = self._tasks.pop(job.job_id, None)
-        if existing:
-            existing.cancel()
-        self._tasks[job.job_id] = asyncio.create_task(
-            self._run_job_loop(job), name=f"scheduler-{job.job_id}"
-        )
+    # ------------------------------------------------------------------
+    # Timer heap
+    # ------------------------------------------------------------------
 
-    async def _run_job_loop(self, job: ScheduleJob) -> None:
-        """Run the scheduling loop for a single job."""
-        try:
-            if job.schedule_type == ScheduleType.ONE_SHOT:
-                await self._run_one_shot(job)
-            elif job.schedule_type == ScheduleType.INTERVAL:
-                await self._run_interval(job)
-            elif job.schedule_type == ScheduleType.CRON:
-                await self._run_cron(job)
-        except asyncio.CancelledError:
-            pass
-        except Exception as exc:
-            logger.error("scheduler.job_error", job_id=job.job_id, error=str(exc))
+    def _schedule(self, job: ScheduleJob, due: datetime | None) -> bool:
+        """Put ``job`` on the heap at ``due`` (replacing any pending slot)."""
+        if due is None:
+            self._unschedule(job.job_id)
+            return False
+        entry = next(self._entry_ids)
+        self._entries[job.job_id] = entry
+        job.next_run = due
+        due_ts = due.timestamp()
+        heapq.heappush(self._heap, (due_ts, entry, job.job_id))
+        if self._heap[0][1] == entry:
+            self._wakeup.set()  # new earliest deadline
+        return True
 
-    def _parse_one_shot_target(self, job: ScheduleJob) -> datetime:
-        """Parse a one-shot expression into a UTC datetime.
+    def _unschedule(self, job_id: str) -> None:
+        if self._entries.pop(job_id, None) is not None:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.next_run = None
+            if len(self._heap) > 64 and len(self._heap) > 2 * len(self._entries):
+                self._compact_heap()
 
-        Naive ISO datetimes are interpreted in the job's timezone.
-        """
-        target = datetime.fromisoformat(job.expression)
-        if target.tzinfo is None:
-            zone = _resolve_zone(self._job_timezone(job))
-            target = target.replace(tzinfo=zone)
-        return target.astimezone(UTC)
+    def _compact_heap(self) -> None:
+        self._heap = [e for e in self._heap if self._entries.get(e[2]) == e[1]]
+        heapq.heapify(self._heap)
 
-    async def _run_one_shot(self, job: ScheduleJob) -> None:
-        """Execute a one-shot job at the specified time.
+    async def _drive(self) -> None:
+        """Single timer task: sleep until the earliest slot, then dispatch it."""
+        try:
+            while self._running:
+                self._wakeup.clear()
+                delay = self._dispatch_due()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except TimeoutError:
+                    pass
+        except asyncio.CancelledError:
+            pass
 
-        ``last_fired_at`` is persisted **before** the action runs so a crash
-        between persistence and action does not cause a duplicate firing on
-        restart (issue #158).
-        """
-        # If a previous run already marked this one-shot as fired (e.g. the
-        # store handed us a stale copy), refuse to fire again.
-        if job.last_fired_at is not None:
+    def _dispatch_due(self) -> float:
+        """Dispatch every slot that is due; return seconds until the next one."""
+        heap = self._heap
+        now_ts = time.time()
+        while heap:
+            due_ts, entry, job_id = heap[0]
+            if self._entries.get(job_id) != entry:
+                heapq.heappop(heap)
+                continue
+            if due_ts > now_ts:
+                return min(due_ts - now_ts, _MAX_DRIVER_SLEEP)
+            heapq.heappop(heap)
+            del self._entries[job_id]
+            job = self._jobs.get(job_id)
+            if job is not None:
+                self._on_due(job, due_ts, now_ts)
+        return _MAX_DRIVER_SLEEP
+
+    def _on_due(self, job: ScheduleJob, due_ts: float, now_ts: float) -> None:
+        """Apply misfire/overlap policy to one due slot and queue the next one."""
+        due = datetime.fromtimestamp(due_ts, UTC)
+        late = now_ts - due_ts
+        fire = True
+        if job.schedule_type != ScheduleType.ONE_SHOT and late > self._misfire_grace:
+            fire = job.coalesce == CoalescePolicy.RUN_ONCE
+            self.stats["misfired"] += 1
             logger.info(
-                "scheduler.one_shot_already_fired",
+                "scheduler.catch_up_run_once" if fire else "scheduler.catch_up_skipped",
                 job_id=job.job_id,
                 name=job.name,
+                missed_at=due.isoformat(),
             )
-            self._jobs.pop(job.job_id, None)
-            self._tasks.pop(job.job_id, None)
-            await self._store.delete(job.job_id)
-            return
+        if fire and job.job_id in self._busy:
+            # The previous firing has not finished: coalesce into it.
+            fire = False
+            self.stats["coalesced"] += 1
+            logger.debug("scheduler.fire_coalesced", job_id=job.job_id, due=due.isoformat())
+        if fire:
+            self._busy.add(job.job_id)
+            self._dispatch.put_nowait((job.job_id, due_ts))
+        if job.schedule_type != ScheduleType.ONE_SHOT:
+            self._schedule(job, self._following_due(job, due, now_ts))
+
+    def _initial_due(self, job: ScheduleJob, now: datetime) -> datetime | None:
+        """First slot for a job being (re)started.
+
+        For recurring jobs that already ran, this is the slot expected after
+        ``last_run``; if that lies in the past the driver treats it as a
+        misfire and applies the job's coalesce policy (catch-up on restart).
+        """
+        try:
+            if job.schedule_type == ScheduleType.ONE_SHOT:
+                return self._parse_one_shot_target(job)
+            if job.schedule_type == ScheduleType.INTERVAL:
+                interval = _parse_interval(job.expression)
+                if job.last_run is not None:
+                    return _as_utc(job.last_run) + interval
+                return now + interval
+            if job.schedule_type == ScheduleType.CRON:
+                tz = self._job_timezone(job)
+                if job.last_run is not None:
+                    expected = _next_cron_occurrence(job.expression, job.last_run, tz)
+                    if expected <= now:
+                        return expected
+                return _next_cron_occurrence(job.expression, now, tz)
+        except ValueError as exc:
+            logger.error("scheduler.job_error", job_id=job.job_id, error=str(exc))
+        return None
 
-        target = self._parse_one_shot_target(job)
-        delay = (target - utc_now()).total_seconds()
-        if delay > 0:
-            await asyncio.sleep(delay)
-        await self._fire_job(job)
+    def _following_due(self, job: ScheduleJob, due: datetime, now_ts: float) -> datetime | None:
+        """Next slot after ``due`` that is still in the future."""
+        now = datetime.fromtimestamp(now_ts, UTC)
+        try:
+            if job.schedule_type == ScheduleType.INTERVAL:
+                interval = _parse_interval(job.expression)
+                following = due + interval
+                if following <= now:
+                    # Late by more than a period: realign on the next slot.
+                    periods = (now - due) // interval + 1
+                    following = due + interval * periods
+                return following
+            return _next_cron_occurrence(job.expression, max(due, now), self._job_timezone(job))
+        except ValueError as exc:
+            logger.error("scheduler.job_error", job_id=job.job_id, error=str(exc))
+            return None
+
+    # ------------------------------------------------------------------
+    # Worker pool
+    # ------------------------------------------------------------------
+
+    async def _worker(self) -> None:
+        while True:
+            job_id, due_ts = await self._dispatch.get()
+            try:
+                job = self._jobs.get(job_id)
+                if job is not None and job.enabled and self._running:
+                    await self._run_due(job, due_ts)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error("scheduler.job_error", job_id=job_id, error=str(exc))
+            finally:
+                self._busy.discard(job_id)
+
+    async def _run_due(self, job: ScheduleJob, due_ts: float) -> None:
+        if job.schedule_type != ScheduleType.ONE_SHOT:
+            await self._fire_job(job, scheduled_for=due_ts)
+            return
+        # If a previous run already marked this one-shot as fired (e.g. the
+        # store handed us a stale copy), refuse to fire again.
+        if job.last_fired_at is not None:
+            logger.info("scheduler.one_shot_already_fired", job_id=job.job_id, name=job.name)
+        else:
+            await self._fire_job(job, scheduled_for=due_ts)
+            logger.info("scheduler.one_shot_completed", job_id=job.job_id, name=job.name)
         # Clean up: remove completed one-shot job from memory and disk.
         self._jobs.pop(job.job_id, None)
-        self._tasks.pop(job.job_id, None)
         await self._store.delete(job.job_id)
-        logger.info("scheduler.one_shot_completed", job_id=job.job_id, name=job.name)
 
-    async def _maybe_catch_up(self, job: ScheduleJob, now: datetime, expected: datetime) -> bool:
-        """Apply the coalesce policy when ``expected`` is already in the past.
+    def _parse_one_shot_target(self, job: ScheduleJob) -> datetime:
+        """Parse a one-shot expression into a UTC datetime.
 
-        Returns True when a catch-up event was fired (so the caller knows the
-        job has been advanced past ``expected``).
+        Naive ISO datetimes are interpreted in the job's timezone.
         """
-        if expected > now:
-            return False
-        if job.coalesce == CoalescePolicy.RUN_ONCE:
-            logger.info(
-                "scheduler.catch_up_run_once",
-                job_id=job.job_id,
-                name=job.name,
-                missed_at=expected.isoformat(),
-            )
-            await self._fire_job(job)
-            return True
-        # SKIP: drop missed runs silently.
-        logger.info(
-            "scheduler.catch_up_skipped",
-            job_id=job.job_id,
-            name=job.name,
-            missed_at=expected.isoformat(),
-        )
-        return True
-
-    async def _run_interval(self, job: ScheduleJob) -> None:
-        """Execute an interval job repeatedly.
+        target = datetime.fromisoformat(job.expression)
+        if target.tzinfo is None:
+            zone = _resolve_zone(self._job_timezone(job))
+            target = target.replace(tzinfo=zone)
+        return target.astimezone(UTC)
 
-        On startup we honour ``coalesce``: if more than one interval has
-        elapsed since ``last_run`` we either fire one catch-up or skip
-        directly to the next slot.
-        """
-        interval = _parse_interval(job.expression)
-        anchor = job.last_run
-        if anchor is not None and self._running and job.enabled:
-            now = utc_now()
-            expected = anchor + interval
-            if expected <= now:
-                fired = await self._maybe_catch_up(job, now, expected)
-                if fired and not (self._running and job.enabled):
-                    return
-        while self._running and job.enabled:
-            await asyncio.sleep(interval.total_seconds())
-            if self._running and job.enabled:
-                await self._fire_job(job)
-
-    async def _run_cron(self, job: ScheduleJob) -> None:
-        """Execute a cron job at matching times.
-
-        On startup we honour ``coalesce``: if the previous expected
-        occurrence is in the past (because the scheduler was down) we
-        either fire one catch-up or skip directly to the next slot.
-        """
-        tz = self._job_timezone(job)
-        if job.last_run is not None and self._running and job.enabled:
-            now = utc_now()
-            expected = _next_cron_occurrence(job.expression, job.last_run, tz)
-            if expected <= now:
-                await self._maybe_catch_up(job, now, expected)
-        while self._running and job.enabled:
-            now = utc_now()
-            next_time = _next_cron_occurrence(job.expression, now, tz)
-            delay = (next_time - now).total_seconds()
-            if delay > 0:
-                await asyncio.sleep(delay)
-            if self._running and job.enabled:
-                await self._fire_job(job)
-
-    async def _fire_job(self, job: ScheduleJob) -> None:
+    async def _fire_job(self, job: ScheduleJob, *, scheduled_for: float | None = None) -> None:
         """Fire a job by publishing an AgentEvent.
 
         ``last_fired_at`` and ``last_run`` are persisted *before* the
@@ -420,6 +567,14 @@ class SchedulerService:
         job.last_run = fired_at
         await self._store.save(job)
 
+        metadata: dict[str, Any] = {
+            "schedule_type": job.schedule_type.value,
+            "tenant_id": job.tenant_id,
+            "agent_id": job.agent_id,
+            "timezone": self._job_timezone(job),
+        }
+        if scheduled_for is not None:
+            metadata["scheduled_for"] = datetime.fromtimestamp(scheduled_for, UTC).isoformat()
         event = AgentEvent(
             source="scheduler",
             event_type=AgentEventType.SCHEDULE_TRIGGERED,
@@ -430,14 +585,10 @@ class SchedulerService:
                 "tenant_id": job.tenant_id,
                 "agent_id": job.agent_id,
             },
-            metadata={
-                "schedule_type": job.schedule_type.value,
-                "tenant_id": job.tenant_id,
-                "agent_id": job.agent_id,
-                "timezone": self._job_timezone(job),
-            },
+            metadata=metadata,
         )
 
+        self.stats["fired"] += 1
         logger.info(
             "scheduler.job_fired",
             job_id=job.job_id,
@@ -447,3 +598,15 @@ class SchedulerService:
 
         if self._event_callback:
             await self._event_callback(event)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def _build_job_store(store: str, work_dir: str) -> Any:
+    if store == "file":
+        return FileJobStore(work_dir)
+    if store == "journal":
+        return JournalJobStore(work_dir)
+    raise ValueError(f"Unknown job store type: {store}")
@@ -5,14 +5,21 @@ This package provides infrastructure implementations for skills:
 - SkillParser: Parse SKILL.md files into Skill objects
 - SkillLoader: Load skills from filesystem
 - FileSkillRegistry: File-based skill registry implementation
+- SkillChangeWatcher: Event-driven change tracking for skill directories
 """
 
 from taskforce.infrastructure.skills.skill_loader import SkillLoader
 from taskforce.infrastructure.skills.skill_parser import parse_skill_markdown
 from taskforce.infrastructure.skills.skill_registry import FileSkillRegistry
+from taskforce.infrastructure.skills.skill_watcher import (
+    SkillChangeWatcher,
+    create_skill_watcher,
+)
 
 __all__ = [
     "parse_skill_markdown",
     "SkillLoader",
     "FileSkillRegistry",
+    "SkillChangeWatcher",
+    "create_skill_watcher",
 ]
@@ -9,7 +9,7 @@ Extended to support:
 - Filtering by skill type (context, prompt, agent)
 """
 
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 import structlog
@@ -64,6 +64,10 @@ class FileSkillRegistry:
         # Slash-name index: effective_slash_name -> canonical_name
         self._slash_name_index: dict[str, str] = {}
 
+        # Source index: skill directory -> canonical_name, including skills
+        # shadowed by a same-named skill from a later directory
+        self._source_index: dict[str, str] = {}
+
         if auto_discover:
             self.refresh()
 
@@ -106,6 +110,13 @@ class FileSkillRegistry:
 
     def _try_load_metadata(self, skill_dir: Path) -> None:
         """Try to load metadata from a skill directory and update indexes."""
+        metadata = self._parse_metadata(skill_dir)
+        if metadata is not None:
+            self._index(metadata)
+            logger.debug("skill.discovered", skill_name=metadata.name, path=str(skill_dir))
+
+    def _parse_metadata(self, skill_dir: Path) -> SkillMetadataModel | None:
+        """Parse the frontmatter of ``skill_dir``'s SKILL.md, or None on failure."""
         from taskforce.infrastructure.skills.skill_parser import (
             SkillParseError,
             parse_skill_metadata,
@@ -114,12 +125,16 @@ class FileSkillRegistry:
         skill_file = skill_dir / SkillLoader.SKILL_FILE
         try:
             content = skill_file.read_text(encoding="utf-8")
-            metadata = parse_skill_metadata(content, str(skill_dir))
-            self._metadata_cache[metadata.name] = metadata
-            self._slash_name_index[metadata.effective_slash_name] = metadata.name
-            logger.debug("skill.discovered", skill_name=metadata.name, path=str(skill_dir))
+            return parse_skill_metadata(content, str(skill_dir))
         except (OSError, UnicodeDecodeError, SkillParseError) as e:
             logger.warning("skill.metadata_load_failed", path=str(skill_dir), error=str(e))
+            return None
+
+    def _index(self, metadata: SkillMetadataModel) -> None:
+        """Add ``metadata`` to the name, slash-name and source indexes."""
+        self._metadata_cache[metadata.name] = metadata
+        self._slash_name_index[metadata.effective_slash_name] = metadata.name
+        self._source_index[metadata.source_path] = metadata.name
 
     def discover_skills(self) -> list[SkillMetadataModel]:
         """Discover all available skills and return their metadata."""
@@ -130,14 +145,95 @@ class FileSkillRegistry:
         self._metadata_cache.clear()
         self._skill_cache.clear()
         self._slash_name_index.clear()
+        self._source_index.clear()
 
         metadata_list = self._loader.discover_metadata()
         for metadata in metadata_list:
-            self._metadata_cache[metadata.name] = metadata
-            self._slash_name_index[metadata.effective_slash_name] = metadata.name
+            self._index(metadata)
 
         logger.info("skill.registry_refreshed", skill_count=len(self._metadata_cache))
 
+    def apply_changes(self, paths: Iterable[str | Path]) -> set[str]:
+        """
+        Re-read only the skills that own the given changed paths.
+
+        A changed path belongs to the skill directory directly below the
+        configured directory it lives in (``<dir>/<skill>/...``), or to the
+        configured directory itself when that holds a ``SKILL.md``. Each
+        affected skill is re-parsed, added or removed; every other cached
+        skill is left untouched. Falls back to :meth:`refresh` when a change
+        involves two skills with the same name, where directory order
+        decides which one wins.
+
+        Args:
+            paths: Files or directories that were created, modified,
+                   deleted or renamed (both old and new path for renames)
+
+        Returns:
+            Names of the skills that were added, updated or removed
+        """
+        skill_dirs: set[Path] = set()
+        for path in paths:
+            skill_dirs.update(self._owning_skill_dirs(Path(path)))
+
+        affected: set[str] = set()
+        for skill_dir in sorted(skill_dirs):
+            names = self._sync_skill_dir(skill_dir)
+            if names is None:
+                before = set(self._metadata_cache)
+                self.refresh()
+                return before | set(self._metadata_cache)
+            affected |= names
+        return affected
+
+    def _owning_skill_dirs(self, path: Path) -> set[Path]:
+        """Return the candidate skill directories a changed path belongs to."""
+        owners: set[Path] = set()
+        for root in self._loader.directories:
+            if path == root:
+                owners.add(root)
+                owners.update(
+                    Path(source)
+                    for source in self._source_index
+                    if Path(source).parent == root
+                )
+            elif root in path.parents:
+                owners.add(root)
+                owners.add(root / path.relative_to(root).parts[0])
+        return owners
+
+    def _sync_skill_dir(self, skill_dir: Path) -> set[str] | None:
+        """Bring one skill directory in line with disk; None if ambiguous."""
+        source = str(skill_dir)
+        old_name = self._source_index.get(source)
+        skill_file = skill_dir / SkillLoader.SKILL_FILE
+        metadata = self._parse_metadata(skill_dir) if skill_file.is_file() else None
+
+        if old_name is not None:
+            shadowing = [s for s, n in self._source_index.items() if n == old_name and s != source]
+            if shadowing:
+                return None
+            self._forget(old_name)
+            del self._source_index[source]
+
+        if metadata is None:
+            return {old_name} if old_name else set()
+        current = self._metadata_cache.get(metadata.name)
+        if current is not None and current.source_path != source:
+            return None
+        self._index(metadata)
+        self._skill_cache.pop(metadata.name, None)
+        logger.debug("skill.reloaded", skill_name=metadata.name, path=source)
+        return {metadata.name} | ({old_name} if old_name else set())
+
+    def _forget(self, name: str) -> None:
+        """Drop ``name`` from the metadata, skill and slash-name indexes."""
+        self._metadata_cache.pop(name, None)
+        self._skill_cache.pop(name, None)
+        for slash_name, canonical in list(self._slash_name_index.items()):
+            if canonical == name:
+                del self._slash_name_index[slash_name]
+
     def get_skill(self, name: str) -> Skill | None:
         """
         Load a complete skill by canonical name.
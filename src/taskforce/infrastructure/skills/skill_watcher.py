@@ -0,0 +1,400 @@
+"""
+Skill Change Watcher
+
+Tracks file-system changes under skill directories so the registry can
+be updated incrementally instead of re-walking every directory on each
+skill lookup.
+
+Two backends share one interface:
+
+- ``InotifySkillWatcher`` (Linux): one inotify watch per directory, read
+  without blocking. The kernel queues events at write time, so a change
+  is visible to the very next lookup, and an empty queue costs a single
+  ``read()`` syscall.
+- ``PollingSkillWatcher`` (other platforms, or when inotify is not
+  available): a daemon thread diffs per-file ``(mtime_ns, size)``
+  snapshots every ``poll_interval`` seconds. Lookups never walk; changes
+  become visible after at most one interval.
+
+inotify only reports changes made through the local kernel, so a root on
+(or containing) a network filesystem such as NFS or SMB is refused by the
+inotify backend with ``OSError``; callers then fall back to polling.
+
+Both expose a monotonically increasing ``generation`` that callers
+compare in O(1), and ``drain()``, which returns the paths changed since
+the previous drain, or ``None`` when events were lost and a full rescan
+is required.
+
+watchdog is deliberately not used here: its inotify backend holds events
+back to pair renames, which would make a just-written ``SKILL.md``
+invisible to the next listing.
+"""
+
+from __future__ import annotations
+
+import abc
+import ctypes
+import ctypes.util
+import errno
+import os
+import re
+import struct
+import sys
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+)
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len
+_READ_SIZE = 64 * 1024
+# A directory that vanished between the event and the watch is not an error.
+_VANISHED = (errno.ENOENT, errno.ENOTDIR)
+# Filesystems whose remote writes never reach the local inotify queue.
+_NETWORK_FS_TYPES = frozenset(
+    {
+        "9p",
+        "afs",
+        "ceph",
+        "cifs",
+        "fuse.sshfs",
+        "glusterfs",
+        "lustre",
+        "ncpfs",
+        "nfs",
+        "nfs4",
+        "smb3",
+        "smbfs",
+    }
+)
+_MOUNTS_FILE = "/proc/self/mounts"
+_OCTAL_ESCAPE = re.compile(r"\\([0-7]{3})")
+
+
+class SkillChangeWatcher(abc.ABC):
+    """Base class: generation counter plus the set of pending changed paths."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._roots: list[Path] = []
+        self._generation = 0
+        self._pending: set[Path] = set()
+        self._overflow = False
+
+    @property
+    def roots(self) -> list[Path]:
+        """Directories currently being watched (recursively)."""
+        return list(self._roots)
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped once for every batch of observed changes."""
+        self._pump()
+        return self._generation
+
+    def watch(self, directory: str | Path) -> bool:
+        """Start watching ``directory`` recursively.
+
+        Returns:
+            True if the directory was newly watched, False if it is already
+            watched or does not exist.
+
+        Raises:
+            OSError: If the backend cannot watch the directory (for example
+                the inotify watch limit is exhausted).
+        """
+        path = Path(directory).expanduser().resolve()
+        if path in self._roots or not path.is_dir():
+            return False
+        self._roots.append(path)
+        try:
+            self._add_root(path)
+        except OSError:
+            self._roots.remove(path)
+            raise
+        logger.debug("skill_watcher.watching", path=str(path), backend=type(self).__name__)
+        return True
+
+    def drain(self) -> set[Path] | None:
+        """Return and clear the paths changed since the previous drain.
+
+        Returns ``None`` when changes were lost (queue overflow) and the
+        caller must fall back to a full rescan.
+        """
+        self._pump()
+        with self._lock:
+            paths, self._pending = self._pending, set()
+            overflow, self._overflow = self._overflow, False
+        return None if overflow else paths
+
+    def close(self) -> None:  # noqa: B027 — optional hook, nothing to release by default
+        """Release backend resources."""
+
+    def _record(self, paths: Iterable[Path], *, overflow: bool = False) -> None:
+        """Add a batch of changes. The caller must hold ``self._lock``."""
+        before = len(self._pending)
+        self._pending.update(paths)
+        if overflow:
+            self._overflow = True
+        if overflow or len(self._pending) != before:
+            self._generation += 1
+
+    @abc.abstractmethod
+    def _add_root(self, root: Path) -> None:
+        """Start observing ``root``; raise ``OSError`` if that is impossible."""
+
+    def _pump(self) -> None:  # noqa: B027 — optional hook for on-demand backends
+        """Pull pending backend events into the change set (no-op by default)."""
+
+
+class InotifySkillWatcher(SkillChangeWatcher):
+    """Linux inotify backend, drained on demand from a non-blocking fd."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._libc = _load_libc()
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1 failed: {os.strerror(err)}")
+        self._fd = fd
+        self._wd_paths: dict[int, Path] = {}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fd >= 0:
+                os.close(self._fd)
+                self._fd = -1
+            self._wd_paths.clear()
+
+    def _add_root(self, root: Path) -> None:
+        fstype = _network_fs_type(root)
+        if fstype is not None:
+            raise OSError(
+                errno.EOPNOTSUPP,
+                f"inotify misses remote changes on {fstype} mounts",
+                str(root),
+            )
+        with self._lock:
+            self._add_tree(root)
+
+    def _add_tree(self, top: Path) -> None:
+        for dirpath, _dirnames, _filenames in os.walk(top):
+            self._add_watch(Path(dirpath))
+
+    def _add_watch(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err in _VANISHED:
+                return
+            raise OSError(err, f"inotify_add_watch failed: {os.strerror(err)}", str(directory))
+        self._wd_paths[wd] = directory
+
+    def _forget_tree(self, top: Path) -> None:
+        for wd, path in list(self._wd_paths.items()):
+            if path == top or top in path.parents:
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._wd_paths[wd]
+
+    def _pump(self) -> None:
+        with self._lock:
+            if self._fd < 0:
+                return
+            while True:
+                try:
+                    data = os.read(self._fd, _READ_SIZE)
+                except BlockingIOError:
+                    return
+                self._handle(data)
+
+    def _handle(self, data: bytes) -> None:
+        changed: set[Path] = set()
+        overflow = False
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            wd, mask, _cookie, length = _EVENT.unpack_from(data, offset)
+            start = offset + _EVENT.size
+            name = data[start : start + length].rstrip(b"\0")
+            offset = start + length
+
+            if mask & _IN_Q_OVERFLOW:
+                overflow = True
+                continue
+            if mask & _IN_IGNORED:
+                self._wd_paths.pop(wd, None)
+                continue
+            directory = self._wd_paths.get(wd)
+            if directory is None:
+                continue
+            path = directory / os.fsdecode(name) if name else directory
+            changed.add(path)
+
+            if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF) and path in self._roots:
+                self._roots.remove(path)
+            if mask & _IN_MOVE_SELF:
+                self._forget_tree(path)
+            elif mask & _IN_ISDIR and mask & _IN_MOVED_FROM:
+                self._forget_tree(path)
+            elif mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+                # Files written before the new watch existed are covered by
+                # the directory path itself: consumers re-read its owner.
+                try:
+                    self._add_tree(path)
+                except OSError as exc:
+                    logger.warning("skill_watcher.watch_failed", path=str(path), error=str(exc))
+                    overflow = True
+        self._record(changed, overflow=overflow)
+
+
+class PollingSkillWatcher(SkillChangeWatcher):
+    """Portable backend: a daemon thread diffs file snapshots periodically."""
+
+    def __init__(self, poll_interval: float = 2.0, *, start_thread: bool = True) -> None:
+        super().__init__()
+        self._poll_interval = poll_interval
+        self._start_thread = start_thread
+        self._snapshot: dict[Path, tuple[int, int]] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def scan(self) -> None:
+        """Run one polling pass over every watched root."""
+        current: dict[Path, tuple[int, int]] = {}
+        for root in list(self._roots):
+            current.update(_snapshot(root))
+        with self._lock:
+            previous = self._snapshot
+            self._snapshot = current
+            self._record(
+                path
+                for path in previous.keys() | current.keys()
+                if previous.get(path) != current.get(path)
+            )
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._poll_interval + 1.0)
+            self._thread = None
+
+    def _add_root(self, root: Path) -> None:
+        snapshot = _snapshot(root)
+        with self._lock:
+            self._snapshot.update(snapshot)
+        if self._start_thread and self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="skill-watcher-poll", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._poll_interval):
+            try:
+                self.scan()
+            except Exception as exc:  # pragma: no cover — keep polling
+                logger.warning("skill_watcher.poll_failed", error=str(exc))
+
+
+def _snapshot(root: Path) -> dict[Path, tuple[int, int]]:
+    """Map every file below ``root`` to its ``(mtime_ns, size)``."""
+    snapshot: dict[Path, tuple[int, int]] = {}
+    for dirpath, _dirnames, filenames in os.walk(root):
+        base = Path(dirpath)
+        for filename in filenames:
+            path = base / filename
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def _network_fs_type(root: Path) -> str | None:
+    """Return the network filesystem type ``root`` lives on or contains.
+
+    Reads ``/proc/self/mounts``; returns ``None`` when every mount at or
+    below ``root`` is local or the mount table is unavailable.
+    """
+    try:
+        with open(_MOUNTS_FILE, encoding="utf-8", errors="replace") as handle:
+            lines = handle.readlines()
+    except OSError:
+        return None
+    owner: tuple[int, str] | None = None
+    for line in lines:
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        # Whitespace in mount points is octal-escaped (``\040``).
+        mountpoint = Path(_OCTAL_ESCAPE.sub(lambda m: chr(int(m[1], 8)), fields[1]))
+        fstype = fields[2]
+        if mountpoint == root or mountpoint in root.parents:
+            # The deepest mount above ``root`` is the one it lives on.
+            depth = len(mountpoint.parts)
+            if owner is None or depth >= owner[0]:
+                owner = (depth, fstype)
+        elif root in mountpoint.parents and fstype in _NETWORK_FS_TYPES:
+            return fstype
+    if owner is not None and owner[1] in _NETWORK_FS_TYPES:
+        return owner[1]
+    return None
+
+
+def _load_libc() -> ctypes.CDLL:
+    """Load libc with the inotify entry points, or raise ``OSError``."""
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    try:
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    except AttributeError as exc:
+        raise OSError(errno.ENOSYS, "libc has no inotify support") from exc
+    return libc
+
+
+def create_skill_watcher(
+    poll_interval: float = 2.0, *, force_polling: bool = False
+) -> SkillChangeWatcher:
+    """Return the inotify watcher on Linux, else the polling fallback.
+
+    ``force_polling`` selects the polling backend unconditionally, for
+    skill directories on mounts that :func:`_network_fs_type` does not
+    recognise (for example a FUSE bridge to remote storage).
+    """
+    if sys.platform.startswith("linux") and not force_polling:
+        try:
+            return InotifySkillWatcher()
+        except OSError as exc:
+            logger.warning("skill_watcher.inotify_unavailable", error=str(exc))
+    return PollingSkillWatcher(poll_interval)
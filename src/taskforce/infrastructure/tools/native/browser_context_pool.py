@@ -0,0 +1,272 @@
+"""Per-session browser contexts on one shared browser process.
+
+``BrowserTool`` keeps a single Chromium warm and gives every agent
+session its own Playwright ``BrowserContext`` and page, so missions
+running at the same time neither serialise on one page nor clobber each
+other's navigation, cookies or storage. Opening a context costs
+milliseconds; launching a browser costs seconds.
+
+:class:`BrowserContextPool` hands out those contexts keyed by session
+id:
+
+* at most ``max_contexts`` are open; when full, the least recently used
+  idle context is closed, and callers wait if every context is busy;
+* a context unused for ``idle_timeout_seconds`` is closed;
+* before a context closes its ``storage_state`` (cookies, local
+  storage) is kept and handed to the next context opened for the same
+  session — under ``storage_dir`` when one is set, so it also survives
+  a restart, else in memory for the 256 most recently closed sessions.
+
+All methods must run on the Playwright worker loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from taskforce.core.utils.atomic_io import atomic_write_text
+
+logger = structlog.get_logger(__name__)
+
+# Closed sessions whose storage state is kept in memory (no storage_dir,
+# or writing it failed); the least recently closed are dropped first.
+_MAX_SAVED_STATES = 256
+
+
+@dataclass
+class BrowserLease:
+    """An open context and its page, owned by one session."""
+
+    key: str
+    context: Any
+    page: Any
+    # The browser session that opened the context; a relaunched browser
+    # invalidates every context of the old one.
+    owner: Any
+    last_used: float
+    in_use: int = 0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class BrowserContextPool:
+    """Session-keyed browser contexts with a size limit and idle eviction.
+
+    Args:
+        max_contexts: Contexts open at the same time.
+        idle_timeout_seconds: Unused time after which a context closes.
+        storage_dir: Directory for persisted ``storage_state`` files
+            (cookies and local storage — treat as credentials). ``None``
+            keeps the state of recently closed sessions in memory only.
+        clock: Monotonic time source (tests).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_contexts: int = 8,
+        idle_timeout_seconds: float = 300.0,
+        storage_dir: str | Path | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_contexts = max(1, max_contexts)
+        self._idle_timeout = idle_timeout_seconds
+        self._storage_dir = Path(storage_dir) if storage_dir else None
+        self._clock = clock
+        self._leases: OrderedDict[str, BrowserLease] = OrderedDict()
+        self._saved_state: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._changed = asyncio.Condition()
+        self._sweep_handle: asyncio.TimerHandle | None = None
+        # The event loop only keeps weak references to tasks.
+        self._sweep_task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._leases)
+
+    @contextlib.asynccontextmanager
+    async def lease(
+        self, key: str, browser: Any, *, timeout_seconds: float = 30.0
+    ) -> AsyncIterator[BrowserLease]:
+        """Hold ``key``'s context for one action.
+
+        Opens the context on first use (``browser.new_page_context``).
+        Actions of the same session run one at a time; different
+        sessions run concurrently.
+
+        Raises:
+            TimeoutError: If every context stays busy for
+                ``timeout_seconds``.
+        """
+        lease = await self._acquire(key, browser, timeout_seconds)
+        try:
+            async with lease.lock:
+                yield lease
+        finally:
+            lease.in_use -= 1
+            lease.last_used = self._clock()
+            async with self._changed:
+                self._changed.notify_all()
+            self._schedule_sweep()
+
+    async def close(self, key: str) -> bool:
+        """Close ``key``'s context, keeping its storage state."""
+        async with self._changed:
+            lease = self._leases.get(key)
+            if lease is None:
+                return False
+            await self._close_lease(lease)
+            self._changed.notify_all()
+            return True
+
+    async def close_all(self, *, timeout_seconds: float = 30.0) -> None:
+        """Close every context, keeping their storage state.
+
+        Waits for running actions to release their contexts first.
+
+        Raises:
+            TimeoutError: If a context stays busy for ``timeout_seconds``;
+                nothing is closed then.
+        """
+        async with self._changed:
+            try:
+                await asyncio.wait_for(
+                    self._changed.wait_for(
+                        lambda: not any(lease.in_use for lease in self._leases.values())
+                    ),
+                    timeout_seconds,
+                )
+            except TimeoutError:
+                busy = sum(1 for lease in self._leases.values() if lease.in_use)
+                raise TimeoutError(f"{busy} browser context(s) still in use") from None
+            for lease in list(self._leases.values()):
+                await self._close_lease(lease)
+            self._changed.notify_all()
+
+    async def _acquire(self, key: str, browser: Any, timeout_seconds: float) -> BrowserLease:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
+        async with self._changed:
+            while True:
+                lease = self._leases.get(key)
+                if lease is not None and lease.owner is not browser:
+                    # Opened on a browser that has since been relaunched;
+                    # keep what state it still yields for the new context.
+                    await self._close_lease(lease)
+                    lease = None
+                if lease is not None:
+                    lease.in_use += 1
+                    self._leases.move_to_end(key)
+                    return lease
+                await self._evict_idle()
+                if len(self._leases) < self._max_contexts:
+                    break
+                victim = next((v for v in self._leases.values() if not v.in_use), None)
+                if victim is not None:
+                    await self._close_lease(victim)
+                    break
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise TimeoutError(f"all {self._max_contexts} browser contexts are busy")
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._changed.wait(), remaining)
+
+            storage_state = self._saved_state.pop(key, None)
+            if storage_state is None:
+                storage_state = await asyncio.to_thread(self._load_state, key)
+            started = time.perf_counter()
+            context, page = await browser.new_page_context(storage_state)
+            lease = BrowserLease(
+                key=key,
+                context=context,
+                page=page,
+                owner=browser,
+                last_used=self._clock(),
+                in_use=1,
+            )
+            self._leases[key] = lease
+            logger.info(
+                "browser_pool.context_opened",
+                session_id=key,
+                open_contexts=len(self._leases),
+                restored_state=storage_state is not None,
+                startup_ms=round((time.perf_counter() - started) * 1000, 1),
+            )
+            return lease
+
+    async def _evict_idle(self) -> None:
+        now = self._clock()
+        for lease in list(self._leases.values()):
+            if not lease.in_use and now - lease.last_used >= self._idle_timeout:
+                await self._close_lease(lease)
+
+    async def _close_lease(self, lease: BrowserLease) -> None:
+        """Save ``lease``'s storage state and close its context."""
+        self._leases.pop(lease.key, None)
+        try:
+            state = await lease.context.storage_state()
+        except Exception as exc:  # noqa: BLE001 — browser may already be gone
+            logger.warning("browser_pool.state_save_failed", session_id=lease.key, error=repr(exc))
+        else:
+            path = self._state_path(lease.key)
+            if path is None or not await self._write_state(path, lease.key, state):
+                self._saved_state[lease.key] = state
+                self._saved_state.move_to_end(lease.key)
+                while len(self._saved_state) > _MAX_SAVED_STATES:
+                    self._saved_state.popitem(last=False)
+        with contextlib.suppress(Exception):
+            await lease.context.close()
+        logger.info("browser_pool.context_closed", session_id=lease.key)
+
+    def _schedule_sweep(self) -> None:
+        if self._sweep_handle is not None or not self._leases:
+            return
+        loop = asyncio.get_running_loop()
+        self._sweep_handle = loop.call_later(self._idle_timeout, self._start_sweep, loop)
+
+    def _start_sweep(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._sweep_task = loop.create_task(self._sweep())
+
+    async def _sweep(self) -> None:
+        self._sweep_handle = None
+        async with self._changed:
+            await self._evict_idle()
+            self._changed.notify_all()
+        self._schedule_sweep()
+
+    # -- persisted storage state -------------------------------------------
+
+    def _state_path(self, key: str) -> Path | None:
+        if self._storage_dir is None:
+            return None
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+        return self._storage_dir / f"{digest}.json"
+
+    def _load_state(self, key: str) -> dict[str, Any] | None:
+        path = self._state_path(key)
+        if path is None:
+            return None
+        try:
+            state = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return state if isinstance(state, dict) else None
+
+    async def _write_state(self, path: Path, key: str, state: dict[str, Any]) -> bool:
+        """Persist ``state`` owner-readable only; return whether it was written."""
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            await atomic_write_text(path, json.dumps(state), mode=0o600)
+        except OSError as exc:
+            logger.warning("browser_pool.state_write_failed", session_id=key, error=repr(exc))
+            return False
+        return True
@@ -5,6 +5,11 @@ Provides browser automation capabilities using Playwright.
 Supports navigating pages, clicking elements, filling forms,
 taking screenshots, and extracting content from web pages.
 
+One Chromium process is kept warm per process; every agent session
+gets its own browser context and page from a
+:class:`BrowserContextPool`, so concurrent missions browse in parallel
+without sharing navigation state or cookies.
+
 Playwright ships as a core dependency. Chromium binaries still need
 to be downloaded once via ``playwright install chromium``.
 """
@@ -20,8 +25,10 @@ from typing import Any, TypeVar
 
 import structlog
 
+from taskforce.application.token_ledger import get_run_context
 from taskforce.core.domain.errors import ToolError, tool_error_payload
 from taskforce.core.interfaces.tools import ApprovalRiskLevel, ToolProtocol
+from taskforce.infrastructure.tools.native.browser_context_pool import BrowserContextPool
 from taskforce.infrastructure.tools.native.url_validator import validate_url_for_ssrf
 
 logger = structlog.get_logger(__name__)
@@ -102,9 +109,14 @@ class _PlaywrightWorker:
         return await asyncio.wrap_future(future)
 
 
-# Module-level browser session – shared across tool calls within a process.
-# All access must be from the playwright worker loop.
+# Module-level browser process and context pool – shared across tool calls
+# within a process. All access must be from the playwright worker loop.
 _session: "_BrowserSession | None" = None
+_session_lock: asyncio.Lock | None = None
+_pool: BrowserContextPool | None = None
+
+# Pool key for calls made outside a mission (no run context).
+_DEFAULT_SESSION_KEY = "default"
 
 
 def _get_async_playwright() -> Any:
@@ -115,13 +127,11 @@ def _get_async_playwright() -> Any:
 
 
 class _BrowserSession:
-    """Manages a persistent Playwright browser session."""
+    """Manages the persistent Playwright browser process."""
 
     def __init__(self) -> None:
         self._playwright: Any = None
         self._browser: Any = None
-        self._context: Any = None
-        self._page: Any = None
         self._headless: bool | None = None
 
     @property
@@ -130,7 +140,7 @@ class _BrowserSession:
         return self._headless
 
     async def start(self, headless: bool = True) -> None:
-        """Launch the browser and open an initial page.
+        """Launch the browser.
 
         If a headless launch fails (e.g. missing/incompatible browser
         binary), automatically retry with ``headless=False`` so a real
@@ -155,15 +165,6 @@ class _BrowserSession:
             self._browser = await self._playwright.chromium.launch(headless=False)
             effective_headless = False
 
-        self._context = await self._browser.new_context(
-            viewport={"width": 1280, "height": 720},
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            ),
-        )
-        self._page = await self._context.new_page()
         self._headless = effective_headless
         logger.info(
             "browser_session.started",
@@ -172,18 +173,25 @@ class _BrowserSession:
         )
 
     @property
-    def page(self) -> Any:
-        """Return the active page."""
-        return self._page
+    def browser(self) -> Any:
+        """Return the running browser (None once closed)."""
+        return self._browser
+
+    async def new_page_context(self, storage_state: dict[str, Any] | None) -> tuple[Any, Any]:
+        """Open an isolated context with one page, restoring ``storage_state``."""
+        context = await self._browser.new_context(
+            viewport={"width": 1280, "height": 720},
+            user_agent=(
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/120.0.0.0 Safari/537.36"
+            ),
+            storage_state=storage_state,
+        )
+        return context, await context.new_page()
 
     async def close(self) -> None:
         """Close the browser and release all resources."""
-        if self._page:
-            await self._page.close()
-            self._page = None
-        if self._context:
-            await self._context.close()
-            self._context = None
         if self._browser:
             await self._browser.close()
             self._browser = None
@@ -193,13 +201,45 @@ class _BrowserSession:
         logger.info("browser_session.closed")
 
 
+def _get_session_lock() -> asyncio.Lock:
+    """Return the lock serialising browser launches and relaunches."""
+    global _session_lock
+    if _session_lock is None:
+        _session_lock = asyncio.Lock()
+    return _session_lock
+
+
 async def _get_session(headless: bool = True) -> _BrowserSession:
-    """Return the active session, creating one if necessary."""
+    """Return the active session, creating one if necessary.
+
+    Concurrent first calls share one launch instead of each starting a
+    browser.
+    """
     global _session
-    if _session is None or _session.page is None:
-        _session = _BrowserSession()
-        await _session.start(headless=headless)
-    return _session
+    async with _get_session_lock():
+        if _session is None or _session.browser is None or not _session.browser.is_connected():
+            _session = await _launch_session(headless)
+        return _session
+
+
+async def _launch_session(headless: bool) -> _BrowserSession:
+    session = _BrowserSession()
+    await session.start(headless=headless)
+    return session
+
+
+def _get_pool(
+    max_contexts: int, idle_timeout_seconds: float, storage_dir: str | None
+) -> BrowserContextPool:
+    """Return the process-wide context pool; the first caller's limits apply."""
+    global _pool
+    if _pool is None:
+        _pool = BrowserContextPool(
+            max_contexts=max_contexts,
+            idle_timeout_seconds=idle_timeout_seconds,
+            storage_dir=storage_dir,
+        )
+    return _pool
 
 
 # ---------------------------------------------------------------------------
@@ -211,9 +251,11 @@ class BrowserTool(ToolProtocol):
     """
     Browser automation tool for interacting with web pages.
 
-    Uses Playwright to control a headless Chromium browser. The session
-    persists across multiple tool calls so that navigation state, cookies,
-    and form data are maintained between steps.
+    Uses Playwright to control a headless Chromium browser. Each agent
+    session gets its own browser context and page, which persist across
+    that session's tool calls so that navigation state, cookies, and form
+    data are maintained between steps. Sessions run concurrently on one
+    shared browser process.
 
     Supported actions:
         navigate          – Go to a URL and wait for DOM ready.
@@ -239,7 +281,18 @@ class BrowserTool(ToolProtocol):
         restart_headed    – Close the current session and reopen the
                             browser with a visible desktop window so the
                             user can intervene when headless gets stuck.
-        close             – Close the browser session.
+        close             – Close this session's browser context.
+
+    Args:
+        max_contexts: Sessions with an open context at the same time.
+        idle_timeout_seconds: A session's context closes after this long
+            unused; its cookies and storage are restored when the
+            session browses again.
+        storage_dir: Persist each session's cookies and storage here so
+            they also survive a restart (default: in memory only).
+
+    The pool settings of the first ``BrowserTool`` that browses in a
+    process apply to the whole process.
 
     Installation:
         Playwright is bundled with the core ``taskforce`` install.
@@ -247,6 +300,16 @@ class BrowserTool(ToolProtocol):
         once so the browser binary is downloaded.
     """
 
+    def __init__(
+        self,
+        max_contexts: int = 8,
+        idle_timeout_seconds: float = 300.0,
+        storage_dir: str | None = None,
+    ) -> None:
+        self._max_contexts = max_contexts
+        self._idle_timeout_seconds = idle_timeout_seconds
+        self._storage_dir = storage_dir
+
     @property
     def name(self) -> str:
         return "browser"
@@ -373,7 +436,8 @@ class BrowserTool(ToolProtocol):
 
     @property
     def supports_parallelism(self) -> bool:
-        # Browser has shared state; parallel calls would corrupt the session.
+        # One page per session: parallel calls within a mission would race
+        # on it. Separate missions get separate contexts.
         return False
 
     def get_approval_preview(self, **kwargs: Any) -> str:
@@ -403,9 +467,11 @@ class BrowserTool(ToolProtocol):
             Dictionary with 'success' bool and action-specific fields.
         """
         action = kwargs.get("action", "")
+        # Read on the caller's loop: context variables do not reach the worker.
+        session_key = get_run_context().get("session_id") or _DEFAULT_SESSION_KEY
         worker = _PlaywrightWorker.get()
         try:
-            return await worker.submit(lambda: self._execute_in_worker(**kwargs))
+            return await worker.submit(lambda: self._execute_in_worker(session_key, **kwargs))
         except ImportError:
             return {
                 "success": False,
@@ -428,22 +494,22 @@ class BrowserTool(ToolProtocol):
             logger.error("browser_tool.error", action=action, error=repr(e))
             return tool_error_payload(tool_error)
 
-    async def _execute_in_worker(self, **kwargs: Any) -> dict[str, Any]:
+    async def _execute_in_worker(self, session_key: str, **kwargs: Any) -> dict[str, Any]:
         """Run the action on the playwright worker loop. All page/browser
         objects are bound to that loop, so every Playwright call must happen
         inside this method."""
         action = kwargs.get("action", "")
         timeout = int(kwargs.get("timeout", 30_000))
         headless = bool(kwargs.get("headless", True))
+        pool = _get_pool(self._max_contexts, self._idle_timeout_seconds, self._storage_dir)
 
         if action == "close":
-            return await self._action_close()
+            return await self._action_close(pool, session_key)
 
         if action == "restart_headed":
-            return await self._action_restart_headed()
+            return await self._action_restart_headed(pool, timeout / 1000)
 
         session = await _get_session(headless=headless)
-        page = session.page
 
         dispatch: dict[str, Any] = {
             "navigate": self._action_navigate,
@@ -467,9 +533,11 @@ class BrowserTool(ToolProtocol):
         if handler is None:
             return {"success": False, "error": f"Unknown action: '{action}'"}
 
-        if action in ("screenshot", "evaluate", "scroll", "dismiss_overlays", "inspect"):
-            return await handler(page, kwargs)
-        return await handler(page, kwargs, timeout)
+        async with pool.lease(session_key, session, timeout_seconds=timeout / 1000) as lease:
+            page = lease.page
+            if action in ("screenshot", "evaluate", "scroll", "dismiss_overlays", "inspect"):
+                return await handler(page, kwargs)
+            return await handler(page, kwargs, timeout)
 
     # ------------------------------------------------------------------
     # Individual action implementations
@@ -730,12 +798,9 @@ class BrowserTool(ToolProtocol):
             "amount": amount,
         }
 
-    async def _action_close(self) -> dict[str, Any]:
-        """Close the active browser session and free resources."""
-        global _session
-        if _session:
-            await _session.close()
-            _session = None
+    async def _action_close(self, pool: BrowserContextPool, session_key: str) -> dict[str, Any]:
+        """Close this session's context; the browser stays warm for others."""
+        await pool.close(session_key)
         return {"success": True, "action": "close", "message": "Browser session closed."}
 
     async def _action_dismiss_overlays(
@@ -954,21 +1019,38 @@ class BrowserTool(ToolProtocol):
             "page": snapshot,
         }
 
-    async def _action_restart_headed(self) -> dict[str, Any]:
-        """Close the current session and reopen the browser visibly.
+    async def _action_restart_headed(
+        self, pool: BrowserContextPool, timeout_seconds: float
+    ) -> dict[str, Any]:
+        """Close the browser and reopen it visibly.
 
         Escalation path for when headless interactions keep failing
         (overlays intercept clicks, anti-bot challenges, unstable DOM,
         manual login required). The visible Chromium window lets the
-        user watch or intervene directly. Pre-existing cookies and
-        session state on the old context are dropped — the agent must
-        re-navigate after this call.
+        user watch or intervene directly. Every session's context is
+        closed with the old browser; cookies and storage are restored
+        when a session browses again, but open pages are lost — the
+        agent must re-navigate after this call. Actions still running in
+        other sessions are waited for up to ``timeout_seconds``; after
+        that the restart is refused.
         """
         global _session
-        if _session is not None:
-            await _session.close()
-            _session = None
-        session = await _get_session(headless=False)
+        try:
+            await pool.close_all(timeout_seconds=timeout_seconds)
+        except TimeoutError as exc:
+            return {
+                "success": False,
+                "action": "restart_headed",
+                "error": (
+                    f"Browser restart refused: {exc}. Other sessions are still "
+                    "browsing; retry restart_headed when they are done."
+                ),
+            }
+        async with _get_session_lock():
+            if _session is not None:
+                await _session.close()
+                _session = None
+            _session = session = await _launch_session(headless=False)
         logger.info(
             "browser_tool.restart_headed",
             headless=session.headless,
@@ -4,6 +4,8 @@ File System Tools
 Provides safe file reading and writing operations with size limits and backup support.
 """
 
+import asyncio
+from pathlib import Path
 from typing import Any
 
 from taskforce.core.interfaces.tools import ApprovalRiskLevel
@@ -12,13 +14,24 @@ from taskforce.core.interfaces.workspace import (
     resolve_workspace_path,
 )
 from taskforce.infrastructure.tools.base_tool import BaseTool
+from taskforce.infrastructure.tools.native.file_window import (
+    read_byte_window,
+    read_line_window,
+)
+
+DEFAULT_LINE_LIMIT = 2000
 
 
 class FileReadTool(BaseTool):
     """Safe file reading with size limits and encoding detection."""
 
     tool_name = "file_read"
-    tool_description = "Read file contents safely with size limits and encoding detection"
+    tool_description = (
+        "Read file contents safely with size limits and encoding detection. "
+        "Use offset/limit to page through large files by line, or "
+        "byte_offset/byte_length for a byte range; windowed reads work for "
+        "files larger than max_size_mb."
+    )
     tool_parameters_schema: dict[str, Any] = {
         "type": "object",
         "properties": {
@@ -33,7 +46,26 @@ class FileReadTool(BaseTool):
             },
             "max_size_mb": {
                 "type": "integer",
-                "description": "Maximum file size in MB (default: 10)",
+                "description": (
+                    "Maximum file size in MB for whole-file reads, or maximum "
+                    "window size for ranged reads (default: 10)"
+                ),
+            },
+            "offset": {
+                "type": "integer",
+                "description": "1-based line number to start reading from",
+            },
+            "limit": {
+                "type": "integer",
+                "description": f"Number of lines to read (default: {DEFAULT_LINE_LIMIT})",
+            },
+            "byte_offset": {
+                "type": "integer",
+                "description": "0-based byte position to start reading from",
+            },
+            "byte_length": {
+                "type": "integer",
+                "description": "Number of bytes to read from byte_offset",
             },
         },
         "required": ["path"],
@@ -51,6 +83,10 @@ class FileReadTool(BaseTool):
         path: str,
         encoding: str = "utf-8",
         max_size_mb: int = 10,
+        offset: int | None = None,
+        limit: int | None = None,
+        byte_offset: int | None = None,
+        byte_length: int | None = None,
         **kwargs: Any,
     ) -> dict[str, Any]:
         """Read file contents safely with size limits and encoding detection."""
@@ -62,11 +98,16 @@ class FileReadTool(BaseTool):
         if not file_path.exists():
             return {"success": False, "error": f"File not found: {path}"}
 
+        ranged = any(v is not None for v in (offset, limit, byte_offset, byte_length))
         file_size_mb = file_path.stat().st_size / (1024 * 1024)
-        if file_size_mb > max_size_mb:
+        if file_size_mb > max_size_mb and not ranged:
             return {
                 "success": False,
-                "error": f"File too large: {file_size_mb:.2f}MB > {max_size_mb}MB",
+                "error": (
+                    f"File too large: {file_size_mb:.2f}MB > {max_size_mb}MB. "
+                    "Read it in windows with offset/limit (lines) or "
+                    "byte_offset/byte_length."
+                ),
             }
 
         # Detect binary files and return actionable guidance
@@ -97,6 +138,11 @@ class FileReadTool(BaseTool):
                 ),
             }
 
+        if ranged:
+            return await self._read_window(
+                file_path, encoding, max_size_mb, offset, limit, byte_offset, byte_length
+            )
+
         content = file_path.read_text(encoding=encoding)
         return {
             "success": True,
@@ -105,6 +151,51 @@ class FileReadTool(BaseTool):
             "path": str(file_path.absolute()),
         }
 
+    async def _read_window(
+        self,
+        file_path: Path,
+        encoding: str,
+        max_size_mb: int,
+        offset: int | None,
+        limit: int | None,
+        byte_offset: int | None,
+        byte_length: int | None,
+    ) -> dict[str, Any]:
+        """Serve a line or byte window without loading the whole file."""
+        max_bytes = int(max_size_mb * 1024 * 1024)
+        result: dict[str, Any] = {"success": True, "path": str(file_path.absolute())}
+        if byte_offset is not None or byte_length is not None:
+            if offset is not None or limit is not None:
+                return {
+                    "success": False,
+                    "error": "Use either offset/limit or byte_offset/byte_length, not both.",
+                }
+            length = min(byte_length if byte_length is not None else max_bytes, max_bytes)
+            window = await asyncio.to_thread(
+                read_byte_window, file_path, byte_offset or 0, length, encoding
+            )
+            result.update(byte_offset=window.start, byte_end=window.end)
+            if window.has_more:
+                result["next_byte_offset"] = window.end
+        else:
+            window = await asyncio.to_thread(
+                read_line_window,
+                file_path,
+                offset or 1,
+                limit or DEFAULT_LINE_LIMIT,
+                encoding,
+                max_bytes,
+            )
+            result.update(start_line=window.start, end_line=window.end)
+            if window.total_lines is not None:
+                result["total_lines"] = window.total_lines
+            if window.has_more:
+                result["next_offset"] = window.end + 1
+            if window.truncated:
+                result["truncated"] = True
+        result.update(content=window.content, size=len(window.content), has_more=window.has_more)
+        return result
+
 
 class FileWriteTool(BaseTool):
     """Safe file writing with backup option and atomic writes."""
@@ -0,0 +1,222 @@
+"""
+Windowed File Reads
+
+Line- and byte-range reads for ``file_read``, so agents paging through
+large logs and CSVs only touch the bytes of the requested window instead
+of loading the whole file.
+
+Files are read through ``mmap`` (falling back to seek/read for files that
+cannot be mapped). Line windows are located with a sparse line index:
+the newline count before every 64 KiB block boundary. The index is built
+lazily — only as far into the file as a request reaches — and cached per
+``(path, mtime_ns, size)``, so paging forward costs one bisect plus a
+scan of at most one block, and any change to the file invalidates it.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+BLOCK_SIZE = 64 * 1024
+_INDEX_CACHE_SIZE = 32
+
+
+@dataclass(frozen=True)
+class FileWindow:
+    """Decoded content of one window plus its position in the file."""
+
+    content: str
+    start: int  # first line (1-based) or first byte (0-based)
+    end: int  # last line (1-based, inclusive) or end byte (exclusive)
+    has_more: bool
+    truncated: bool = False
+    total_lines: int | None = None
+
+
+class _FileView:
+    """Byte access to an open file via mmap, or seek/read when it cannot be mapped."""
+
+    def __init__(self, handle: BinaryIO, size: int) -> None:
+        self.size = size
+        self._handle = handle
+        self._map: mmap.mmap | None = None
+        if size:
+            try:
+                self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                self._map = None
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+
+    def read(self, start: int, end: int) -> bytes:
+        end = min(end, self.size)
+        if start >= end:
+            return b""
+        if self._map is not None:
+            return self._map[start:end]
+        self._handle.seek(start)
+        return self._handle.read(end - start)
+
+    def count_newlines(self, start: int, end: int) -> int:
+        return self.read(start, end).count(b"\n")
+
+    def nth_newline(self, start: int, end: int, n: int) -> int:
+        """Position of the ``n``-th newline in ``[start, end)``; ``-1`` if fewer."""
+        if self._map is not None:
+            pos = start - 1
+            for _ in range(n):
+                pos = self._map.find(b"\n", pos + 1, end)
+                if pos < 0:
+                    return -1
+            return pos
+        chunk = self.read(start, end)
+        pos = -1
+        for _ in range(n):
+            pos = chunk.find(b"\n", pos + 1)
+            if pos < 0:
+                return -1
+        return start + pos
+
+
+class LineIndex:
+    """Sparse newline index over one file version, extended on demand."""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        # _counts[i] = number of newlines in bytes [0, i * BLOCK_SIZE)
+        self._counts = array("Q", [0])
+        self._lock = threading.Lock()
+        self._last_byte_is_newline = False
+
+    @property
+    def scanned(self) -> int:
+        """Bytes covered by the index so far."""
+        return min((len(self._counts) - 1) * BLOCK_SIZE, self.size)
+
+    @property
+    def total_lines(self) -> int | None:
+        """Line count once the whole file is indexed, else None."""
+        if self.scanned < self.size:
+            return None
+        newlines = self._counts[-1]
+        return newlines + (1 if self.size and not self._last_byte_is_newline else 0)
+
+    def line_start(self, view: _FileView, line: int) -> int | None:
+        """Byte offset where 0-based ``line`` starts, or None past the end."""
+        if line <= 0:
+            return 0 if self.size else None
+        with self._lock:
+            while self._counts[-1] < line and self.scanned < self.size:
+                self._extend(view)
+            block = bisect_left(self._counts, line) - 1
+            if block + 1 >= len(self._counts):
+                return None
+            base = self._counts[block]
+        start = block * BLOCK_SIZE
+        newline = view.nth_newline(start, min(start + BLOCK_SIZE, self.size), line - base)
+        if newline < 0 or newline + 1 >= self.size:
+            return None
+        return newline + 1
+
+    def _extend(self, view: _FileView) -> None:
+        start = self.scanned
+        end = min(start + BLOCK_SIZE, self.size)
+        chunk = view.read(start, end)
+        self._counts.append(self._counts[-1] + chunk.count(b"\n"))
+        if end == self.size and chunk:
+            self._last_byte_is_newline = chunk.endswith(b"\n")
+
+
+_index_cache: OrderedDict[tuple[str, int, int], LineIndex] = OrderedDict()
+_index_cache_lock = threading.Lock()
+
+
+def _line_index(path: Path, stat: os.stat_result) -> LineIndex:
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    with _index_cache_lock:
+        index = _index_cache.get(key)
+        if index is not None:
+            _index_cache.move_to_end(key)
+            return index
+        index = LineIndex(stat.st_size)
+        _index_cache[key] = index
+        while len(_index_cache) > _INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+        return index
+
+
+def clear_line_index_cache() -> None:
+    """Drop every cached line index (testing helper)."""
+    with _index_cache_lock:
+        _index_cache.clear()
+
+
+def read_line_window(
+    path: Path, offset: int, limit: int, encoding: str, max_bytes: int
+) -> FileWindow:
+    """Read ``limit`` lines starting at 1-based line ``offset``.
+
+    The window is cut at the last complete line when it exceeds
+    ``max_bytes`` (``truncated`` is then set and ``end`` adjusted).
+    """
+    offset = max(1, offset)
+    limit = max(1, limit)
+    with open(path, "rb") as handle:
+        stat = os.fstat(handle.fileno())
+        view = _FileView(handle, stat.st_size)
+        try:
+            index = _line_index(path, stat)
+            start = index.line_start(view, offset - 1)
+            if start is None:
+                return FileWindow("", offset, offset - 1, False, total_lines=index.total_lines)
+            end = index.line_start(view, offset - 1 + limit)
+            end = view.size if end is None else end
+            truncated = end - start > max_bytes
+            if truncated:
+                cut = view.read(start, start + max_bytes).rfind(b"\n")
+                end = start + (cut + 1 if cut >= 0 else max_bytes)
+            data = view.read(start, end)
+        finally:
+            view.close()
+    lines = data.count(b"\n") + (0 if data.endswith(b"\n") else 1)
+    return FileWindow(
+        content=data.decode(encoding, errors="replace" if truncated else "strict"),
+        start=offset,
+        end=offset + lines - 1,
+        has_more=end < stat.st_size,
+        truncated=truncated,
+        total_lines=index.total_lines,
+    )
+
+
+def read_byte_window(path: Path, byte_offset: int, byte_length: int, encoding: str) -> FileWindow:
+    """Read ``byte_length`` bytes from ``byte_offset``.
+
+    Window edges may split a multi-byte character; such bytes are decoded
+    as U+FFFD instead of failing the read.
+    """
+    byte_offset = max(0, byte_offset)
+    with open(path, "rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        view = _FileView(handle, size)
+        try:
+            data = view.read(byte_offset, byte_offset + max(0, byte_length))
+        finally:
+            view.close()
+    end = byte_offset + len(data)
+    return FileWindow(
+        content=data.decode(encoding, errors="replace"),
+        start=byte_offset,
+        end=end,
+        has_more=end < size,
+    )
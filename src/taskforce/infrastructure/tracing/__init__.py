@@ -1,7 +1,8 @@
 """
 Infrastructure Layer - Tracing
 
-This module provides OpenTelemetry-based tracing with Arize Phoenix integration.
+This module provides OpenTelemetry-based tracing with Arize Phoenix integration
+and the batched JSONL writer behind file-based LLM tracing.
 Follows hexagonal architecture by keeping observability concerns in infrastructure.
 """
 
@@ -11,11 +12,19 @@ from taskforce.infrastructure.tracing.phoenix_tracer import (
     init_tracing,
     shutdown_tracing,
 )
+from taskforce.infrastructure.tracing.trace_file_writer import (
+    TraceFileWriter,
+    get_trace_file_writer,
+    shutdown_trace_file_writers,
+)
 
 __all__ = [
     "init_tracing",
     "shutdown_tracing",
     "get_tracer",
     "TracingConfig",
+    "TraceFileWriter",
+    "get_trace_file_writer",
+    "shutdown_trace_file_writers",
 ]
 
@@ -0,0 +1,364 @@
+"""
+Batched JSONL Trace File Writer
+
+Moves LLM trace persistence off the request path. Callers hand a record
+to :meth:`TraceFileWriter.submit` (or ``await put()``), which only
+appends to a bounded in-memory queue; a daemon thread serializes the
+records, writes them in batches through one long-lived file handle and
+rotates the file by size and/or age, optionally gzip-compressing rotated
+files.
+
+When the queue is full the ``overflow`` policy decides: ``drop_oldest``
+(default) discards the oldest queued record so the LLM call never waits,
+``block`` makes ``put()`` wait (off the event loop) until the writer has
+made room.
+
+Writers are shared per file path via :func:`get_trace_file_writer`, so
+several LLM services tracing to the same file never interleave partial
+lines. :func:`shutdown_trace_file_writers` flushes and closes them; it
+runs from ``shutdown_tracing()`` and, as a last resort, at interpreter
+exit.
+
+Configuration (``tracing.file_config`` in ``llm_config.yaml``):
+    path: JSONL file (default ``traces/llm_traces.jsonl``)
+    queue_size: Max queued records (default 1000)
+    batch_size: Records per write (default 100)
+    flush_interval_seconds: Max delay before a partial batch is written (1.0)
+    max_bytes: Rotate when the file would exceed this size (0 = off)
+    rotate_interval_seconds: Rotate files older than this (0 = off)
+    backup_count: Rotated files to keep (default 5, 0 = keep all)
+    compress: Gzip rotated files (default false)
+    overflow: ``drop_oldest`` or ``block``
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import gzip
+import json
+import os
+import shutil
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Mapping
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+OVERFLOW_POLICIES = ("drop_oldest", "block")
+
+_OPTION_KEYS = (
+    "queue_size",
+    "batch_size",
+    "flush_interval_seconds",
+    "max_bytes",
+    "rotate_interval_seconds",
+    "backup_count",
+    "compress",
+    "overflow",
+)
+
+
+class TraceFileWriter:
+    """Bounded queue plus a background thread appending JSONL batches to one file."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        queue_size: int = 1000,
+        batch_size: int = 100,
+        flush_interval_seconds: float = 1.0,
+        max_bytes: int = 0,
+        rotate_interval_seconds: float = 0.0,
+        backup_count: int = 5,
+        compress: bool = False,
+        overflow: str = "drop_oldest",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, got {overflow!r}")
+        self._path = Path(path)
+        self._queue_size = max(1, int(queue_size))
+        self._batch_size = max(1, int(batch_size))
+        self._flush_interval = max(0.0, float(flush_interval_seconds))
+        self._max_bytes = max(0, int(max_bytes))
+        self._rotate_interval = max(0.0, float(rotate_interval_seconds))
+        self._backup_count = max(0, int(backup_count))
+        self._compress = bool(compress)
+        self._overflow = overflow
+        self._clock = clock
+
+        self._records: deque[dict[str, Any]] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._in_flight = 0
+        self._thread: threading.Thread | None = None
+
+        # Owned by the writer thread (or by close() once the thread is gone)
+        self._file: BinaryIO | None = None
+        self._size = 0
+        self._opened_at = 0.0
+
+        self.stats: Counter[str] = Counter()
+
+    @property
+    def path(self) -> Path:
+        """The active trace file."""
+        return self._path
+
+    @property
+    def closed(self) -> bool:
+        """True once :meth:`close` was called."""
+        return self._closed
+
+    def submit(self, record: dict[str, Any]) -> bool:
+        """Queue ``record`` without blocking.
+
+        Returns:
+            False if the record was not queued: the writer is closed, or the
+            queue is full under the ``block`` policy (use :meth:`put`).
+        """
+        with self._cond:
+            if self._closed:
+                return False
+            if len(self._records) >= self._queue_size:
+                if self._overflow == "block":
+                    return False
+                self._records.popleft()
+                self.stats["dropped"] += 1
+            self._enqueue(record)
+        self._ensure_thread()
+        return True
+
+    async def put(self, record: dict[str, Any]) -> None:
+        """Queue ``record``; under ``block`` wait off-loop until there is room."""
+        if self.submit(record) or self._overflow != "block":
+            return
+        await asyncio.to_thread(self._put_blocking, record)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until every queued record is on disk. Returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._cond.notify_all()
+            while self._records or self._in_flight:
+                if self._thread is None or not self._thread.is_alive():
+                    return not self._records
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write out the remaining records, close the file and stop the thread."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+            if thread.is_alive():
+                logger.warning("trace_file_writer.close_timeout", path=str(self._path))
+                return
+        self._close_file()
+        if self.stats["dropped"]:
+            logger.warning(
+                "trace_file_writer.records_dropped",
+                path=str(self._path),
+                dropped=self.stats["dropped"],
+            )
+
+    # ------------------------------------------------------------------
+    # Queue
+    # ------------------------------------------------------------------
+
+    def _enqueue(self, record: dict[str, Any]) -> None:
+        """Append under ``self._cond``; wake the writer on first record or full batch."""
+        self._records.append(record)
+        self.stats["submitted"] += 1
+        if len(self._records) == 1 or len(self._records) >= self._batch_size:
+            self._cond.notify_all()
+
+    def _put_blocking(self, record: dict[str, Any]) -> None:
+        with self._cond:
+            while len(self._records) >= self._queue_size and not self._closed:
+                self._cond.wait()
+            if self._closed:
+                self.stats["dropped"] += 1
+                return
+            self._enqueue(record)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._cond:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="trace-file-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._records and not self._closed:
+                    self._cond.wait()
+                deadline = time.monotonic() + self._flush_interval
+                while len(self._records) < self._batch_size and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch = list(self._records)
+                self._records.clear()
+                self._in_flight = len(batch)
+                closing = self._closed
+                self._cond.notify_all()
+            if batch:
+                self._write_batch(batch)
+            with self._cond:
+                self._in_flight = 0
+                self._cond.notify_all()
+            if closing:
+                return
+
+    # ------------------------------------------------------------------
+    # File handling (writer thread only)
+    # ------------------------------------------------------------------
+
+    def _write_batch(self, batch: list[dict[str, Any]]) -> None:
+        lines = []
+        for record in batch:
+            try:
+                lines.append(json.dumps(record))
+            except (TypeError, ValueError) as exc:
+                self.stats["errors"] += 1
+                logger.error("trace_file_write_failed", error=str(exc))
+        if not lines:
+            return
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        try:
+            handle = self._open()
+            if self._rotation_due(len(data)):
+                self._rotate()
+                handle = self._open()
+            handle.write(data)
+            handle.flush()
+            self._size += len(data)
+            self.stats["written"] += len(lines)
+            self.stats["batches"] += 1
+        except OSError as exc:
+            self.stats["errors"] += len(lines)
+            logger.error("trace_file_write_failed", error=str(exc), path=str(self._path))
+            self._close_file()
+
+    def _open(self) -> BinaryIO:
+        if self._file is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self._path, "ab")  # noqa: SIM115 — long-lived handle
+            self._size = os.fstat(self._file.fileno()).st_size
+            self._opened_at = self._clock()
+        return self._file
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.close()
+            finally:
+                self._file = None
+
+    def _rotation_due(self, incoming: int) -> bool:
+        if self._size == 0:
+            return False
+        if self._max_bytes and self._size + incoming > self._max_bytes:
+            return True
+        return bool(
+            self._rotate_interval and self._clock() - self._opened_at >= self._rotate_interval
+        )
+
+    def _rotate(self) -> None:
+        self._close_file()
+        stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+        target = self._path.with_name(f"{self._path.stem}.{stamp}{self._path.suffix}")
+        sequence = 1
+        while target.exists() or Path(f"{target}.gz").exists():
+            target = self._path.with_name(
+                f"{self._path.stem}.{stamp}-{sequence}{self._path.suffix}"
+            )
+            sequence += 1
+        os.replace(self._path, target)
+        if self._compress:
+            with open(target, "rb") as src, gzip.open(f"{target}.gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            target.unlink()
+        self.stats["rotations"] += 1
+        logger.info("trace_file_writer.rotated", path=str(self._path), rotated_to=str(target))
+        self._prune()
+
+    def _prune(self) -> None:
+        if not self._backup_count:
+            return
+        rotated = sorted(
+            (
+                p
+                for p in self._path.parent.glob(f"{self._path.stem}.*")
+                if p != self._path
+            ),
+            key=lambda p: p.stat().st_mtime_ns,
+        )
+        for old in rotated[: max(0, len(rotated) - self._backup_count)]:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+
+# ----------------------------------------------------------------------
+# Shared writers per path
+# ----------------------------------------------------------------------
+
+_writers: dict[Path, TraceFileWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_trace_file_writer(
+    path: str | Path, options: Mapping[str, Any] | None = None
+) -> TraceFileWriter:
+    """Return the shared writer for ``path``, creating it on first use.
+
+    Args:
+        path: Trace file location.
+        options: ``tracing.file_config`` mapping; keys other than the writer
+            options listed in the module docstring are ignored. Only the
+            first call for a path configures its writer.
+    """
+    key = Path(path).expanduser().resolve()
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None or writer.closed:
+            kwargs = {k: v for k, v in (options or {}).items() if k in _OPTION_KEYS}
+            writer = TraceFileWriter(key, **kwargs)
+            _writers[key] = writer
+        return writer
+
+
+def shutdown_trace_file_writers(timeout: float = 5.0) -> None:
+    """Flush and close every shared writer (safe to call more than once)."""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.close(timeout)
+
+
+atexit.register(shutdown_trace_file_writers)
@@ -0,0 +1,116 @@
+"""Benchmark: time-to-first-step of the ``adaptive`` planning strategy.
+
+Drives a real ``Agent`` with the adaptive strategy built by
+``select_planning_strategy`` against a stub LLM provider with fixed
+latencies (classification call and time-to-first-token of the ReAct
+call). Reports the time from ``execute_stream()`` until the first LLM
+token of the first ReAct step for four setups:
+
+* ``sequential``  — classify, then start the chosen strategy (baseline)
+* ``speculative`` — native_react starts while the classifier runs
+* ``cached``      — second run of the same mission (verdict cache hit)
+* ``heuristic``   — mission the local pre-classifier decides on its own
+
+Run::
+
+    python tests/benchmarks/adaptive_routing_latency.py
+
+The sequential baseline costs classifier + first-token latency.
+Speculation overlaps the two (events are held back until the verdict, so
+it costs the larger of both); a cache hit or a confident heuristic
+verdict leaves only the first-token latency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from taskforce.application.planning_strategy_factory import select_planning_strategy
+from taskforce.core.domain.agent import Agent
+from taskforce.core.domain.complexity_classifier import get_complexity_verdict_cache
+from taskforce.core.domain.enums import EventType
+
+CLASSIFIER_LATENCY_S = 0.40
+FIRST_TOKEN_LATENCY_S = 0.25
+RUNS = 5
+
+AMBIGUOUS_MISSION = "Tell me something interesting about octopuses"
+HEURISTIC_MISSION = "What is the capital of Austria?"
+
+
+class StubLLM:
+    """Provider with fixed classification and time-to-first-token latency."""
+
+    async def complete_json(self, **kwargs: Any) -> dict[str, Any]:
+        await asyncio.sleep(CLASSIFIER_LATENCY_S)
+        return {"success": True, "data": {"level": "simple", "confidence": 0.9, "reason": "stub"}}
+
+    async def complete_stream(self, **kwargs: Any):
+        await asyncio.sleep(FIRST_TOKEN_LATENCY_S)
+        yield {"type": "token", "content": "Octopuses have three hearts."}
+        yield {"type": "done", "usage": {}}
+
+
+def _agent(params: dict[str, Any]) -> Agent:
+    llm = StubLLM()
+    state_manager = AsyncMock()
+    state_manager.load_state.return_value = {"answers": {}}
+    return Agent(
+        state_manager=state_manager,
+        llm_provider=llm,
+        tools=[],
+        logger=MagicMock(),
+        max_steps=3,
+        planning_strategy=select_planning_strategy("adaptive", params, llm_provider=llm),
+    )
+
+
+async def _time_to_first_step(params: dict[str, Any], mission: str) -> float:
+    agent = _agent(params)
+    started = time.perf_counter()
+    first = 0.0
+    async for event in agent.execute_stream(mission, "bench"):
+        if not first and event.event_type == EventType.LLM_TOKEN:
+            first = time.perf_counter() - started
+    return first
+
+
+async def _median(params: dict[str, Any], mission: str, *, warm: bool = False) -> float:
+    samples = []
+    for _ in range(RUNS):
+        get_complexity_verdict_cache().clear()
+        if warm:
+            await _time_to_first_step(params, mission)
+        samples.append(await _time_to_first_step(params, mission))
+    return sorted(samples)[len(samples) // 2]
+
+
+async def main() -> None:
+    sequential = {"speculate": None, "classifier_cache_ttl_seconds": 0}
+    cached = {"speculate": None}
+    default: dict[str, Any] = {}
+    rows = [
+        ("sequential", await _median(sequential, AMBIGUOUS_MISSION)),
+        ("speculative", await _median(default, AMBIGUOUS_MISSION)),
+        ("cached", await _median(cached, AMBIGUOUS_MISSION, warm=True)),
+        ("heuristic", await _median(default, HEURISTIC_MISSION)),
+    ]
+    print(
+        f"stub latencies: classifier {CLASSIFIER_LATENCY_S * 1000:.0f} ms, "
+        f"first token {FIRST_TOKEN_LATENCY_S * 1000:.0f} ms"
+    )
+    baseline = rows[0][1]
+    for name, seconds in rows:
+        print(
+            f"{name:<12} time-to-first-step {seconds * 1000:7.1f} ms "
+            f"({seconds / baseline:4.0%} of sequential)"
+        )
+    print(json.dumps({name: round(seconds, 4) for name, seconds in rows}))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
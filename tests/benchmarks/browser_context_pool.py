@@ -0,0 +1,119 @@
+"""Benchmark: concurrent BrowserTool missions, shared page vs per-session contexts.
+
+Serves the static fixture site (``tests/fixtures/static_site.py``) from a
+temporary directory and runs ``--missions`` concurrent missions of
+``--steps`` navigate + get_text actions each:
+
+* ``shared`` — every mission under the same session id, i.e. one page
+  that all missions queue on (the previous behaviour)
+* ``pooled`` — one session id per mission, each on its own context
+
+Also reports the browser launch time and the mean context startup time.
+Needs Chromium (``playwright install chromium``).
+
+Run::
+
+    python tests/benchmarks/browser_context_pool.py [--missions 8] [--steps 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+import taskforce.infrastructure.tools.native.browser_tool as browser_module
+from taskforce.application.token_ledger import run_context
+from taskforce.infrastructure.tools.native.browser_tool import BrowserTool
+from tests.fixtures.static_site import serve_static_site
+
+
+async def _mission(tool: BrowserTool, session_id: str, base_url: str, steps: int) -> None:
+    with run_context(session_id=session_id):
+        for step in range(steps):
+            page = "index.html" if step % 2 == 0 else f"login.html?user={session_id}"
+            result = await tool.execute(action="navigate", url=f"{base_url}/{page}")
+            if not result.get("success"):
+                raise RuntimeError(result.get("error"))
+            await tool.execute(action="get_text", selector="body")
+
+
+async def _run(
+    tool: BrowserTool, base_url: str, missions: int, steps: int, *, pooled: bool
+) -> float:
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(
+            _mission(tool, f"mission-{i}" if pooled else "shared", base_url, steps)
+            for i in range(missions)
+        )
+    )
+    return time.perf_counter() - started
+
+
+async def _context_startup_ms(samples: int) -> float:
+    async def measure() -> float:
+        session = await browser_module._get_session(headless=True)
+        total = 0.0
+        for _ in range(samples):
+            started = time.perf_counter()
+            context, _page = await session.new_page_context(None)
+            total += time.perf_counter() - started
+            await context.close()
+        return total / samples * 1000
+
+    return await browser_module._PlaywrightWorker.get().submit(measure)
+
+
+async def _shutdown() -> None:
+    async def close() -> None:
+        if browser_module._pool is not None:
+            await browser_module._pool.close_all()
+        if browser_module._session is not None:
+            await browser_module._session.close()
+
+    await browser_module._PlaywrightWorker.get().submit(close)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--missions", type=int, default=8)
+    parser.add_argument("--steps", type=int, default=10)
+    args = parser.parse_args()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+    # The fixture site is on loopback, which the SSRF guard rejects.
+    browser_module.validate_url_for_ssrf = lambda url: (True, None)
+
+    tool = BrowserTool(max_contexts=args.missions)
+    results: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as tmp, serve_static_site(Path(tmp)) as base_url:
+        started = time.perf_counter()
+        await tool.execute(action="navigate", url=f"{base_url}/index.html")
+        results["browser_launch_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        results["context_startup_ms"] = round(await _context_startup_ms(10), 1)
+        actions = args.missions * args.steps * 2
+        for mode in ("shared", "pooled"):
+            seconds = await _run(tool, base_url, args.missions, args.steps, pooled=mode == "pooled")
+            results[mode] = {
+                "seconds": round(seconds, 2),
+                "actions_per_second": round(actions / seconds, 1),
+            }
+        await _shutdown()
+
+    print(f"{args.missions} missions x {args.steps} steps")
+    print(f"browser launch   {results['browser_launch_ms']:8.1f} ms")
+    print(f"context startup  {results['context_startup_ms']:8.1f} ms")
+    for mode in ("shared", "pooled"):
+        row = results[mode]
+        print(f"{mode:<7} {row['seconds']:7.2f} s  {row['actions_per_second']:7.1f} actions/s")
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
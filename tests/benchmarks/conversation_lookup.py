@@ -0,0 +1,130 @@
+"""Benchmark: conversation ownership checks and listings vs. archive size.
+
+For 1k, 10k and 100k archived conversations (plus a few active ones) in
+one user's ``index.json`` this measures, per request as the API runs it
+(a fresh ``FileConversationStore`` per request):
+
+* **ownership (old)** — ``list_active()`` + ``list_archived(limit=10_000)``
+  and a linear scan, as ``_require_conversation_access`` did before, with
+  the index cache cleared before each call because the store used to
+  re-parse ``index.json`` every time. Beyond 10k archived conversations
+  it also misses older ids.
+* **ownership (get_info)** — one indexed lookup; the parsed index is
+  shared across store instances and revalidated with one ``stat``.
+* **archived page** — ``list_archived_page(limit=20)``, first page and a
+  page 50k items deep (reached via its cursor).
+
+Run::
+
+    python tests/benchmarks/conversation_lookup.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import structlog
+
+from taskforce.core.utils.pagination import encode_cursor
+from taskforce.infrastructure.persistence.file_conversation_store import (
+    FileConversationStore,
+    clear_index_cache,
+)
+
+SIZES = (1_000, 10_000, 100_000)
+ACTIVE = 5
+REPEATS = 200
+
+
+def seed(work_dir: Path, archived: int) -> list[dict]:
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    entries = []
+    for i in range(archived + ACTIVE):
+        at = (base + timedelta(minutes=i)).isoformat()
+        is_archived = i < archived
+        entries.append(
+            {
+                "conversation_id": f"{i:032x}",
+                "channel": "rest",
+                "status": "archived" if is_archived else "active",
+                "started_at": at,
+                "last_activity": at,
+                "message_count": 12,
+                "topic": f"Topic {i}",
+                "summary": None,
+                "archived_at": at if is_archived else None,
+                "sender_id": "user-1",
+                "project_id": None,
+            }
+        )
+    index = work_dir / "conversations" / "index.json"
+    index.parent.mkdir(parents=True)
+    index.write_text(json.dumps(entries, indent=2))
+    os.utime(index, ns=(0, 0))  # an index at rest, outside the racy window
+    return entries
+
+
+async def old_ownership_check(store: FileConversationStore, conversation_id: str) -> bool:
+    clear_index_cache()
+    active = await store.list_active()
+    if any(c.conversation_id == conversation_id for c in active):
+        return True
+    clear_index_cache()
+    archived = await store.list_archived(limit=10_000)
+    return any(c.conversation_id == conversation_id for c in archived)
+
+
+async def timed(fn, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+async def run(size: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        entries = seed(Path(tmp), size)
+        middle = entries[size // 2]  # an archived conversation in the middle
+        target = middle["conversation_id"]
+        old = await timed(
+            lambda: old_ownership_check(FileConversationStore(tmp), target),
+            max(3, REPEATS // (size // 1_000)),
+        )
+        await FileConversationStore(tmp).get_info(target)  # first parse
+        new = await timed(lambda: FileConversationStore(tmp).get_info(target), REPEATS)
+        first_page = await timed(
+            lambda: FileConversationStore(tmp).list_archived_page(limit=20), REPEATS
+        )
+        deep = encode_cursor((middle["archived_at"], target))
+        deep_page = await timed(
+            lambda: FileConversationStore(tmp).list_archived_page(limit=20, cursor=deep),
+            REPEATS,
+        )
+        found = await old_ownership_check(
+            FileConversationStore(tmp), entries[0]["conversation_id"]
+        )
+    print(
+        f"{size:>7} archived  ownership old {old * 1e3:>8.2f} ms"
+        f"{'' if found else ' (misses oldest)':<17}"
+        f"get_info {new * 1e6:>6.1f} us   page 1 {first_page * 1e6:>6.1f} us   "
+        f"deep page {deep_page * 1e6:>6.1f} us"
+    )
+
+
+async def main() -> None:
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+    for size in SIZES:
+        await run(size)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
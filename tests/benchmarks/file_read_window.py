@@ -0,0 +1,99 @@
+"""Benchmark: reading lines 1M..1M+200 of a multi-GB log with ``file_read``.
+
+Writes a log file of ``--size-gb`` GiB (default 2) with ~100-byte lines to
+a temp directory and times reading the 200-line window starting at line
+1,000,000:
+
+* ``islice``       — stream the file line by line (what a python-tool
+  workaround does; the old ``file_read`` rejected the file outright and
+  would otherwise have loaded all of it)
+* ``window cold``  — ranged ``file_read``, line index built up to line 1M
+* ``window warm``  — same window again (cached index)
+* ``next page``    — the following window, as an agent paging forward
+* ``deep page``    — lines 15M..15M+200 after the ones above
+
+Run::
+
+    python tests/benchmarks/file_read_window.py [--size-gb 2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from taskforce.infrastructure.tools.native.file_tools import FileReadTool
+from taskforce.infrastructure.tools.native.file_window import clear_line_index_cache
+
+START_LINE = 1_000_000
+WINDOW = 200
+
+
+def _write_log(path: Path, size_bytes: int) -> int:
+    block = "".join(
+        f"2024-05-01T12:00:{i % 60:02d}Z INFO worker-{i % 16:02d} request handled "
+        f"in {i % 997:3d} ms status=200 bytes={i * 37 % 100000:6d}\n"
+        for i in range(10_000)
+    ).encode()
+    lines_per_block = 10_000
+    written = 0
+    blocks = 0
+    with open(path, "wb") as fh:
+        while written < size_bytes:
+            fh.write(block)
+            written += len(block)
+            blocks += 1
+    return blocks * lines_per_block
+
+
+def _timed(fn) -> tuple[float, object]:
+    started = time.perf_counter()
+    value = fn()
+    return time.perf_counter() - started, value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-gb", type=float, default=2.0)
+    args = parser.parse_args()
+
+    tool = FileReadTool()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "big.log"
+        seconds, total_lines = _timed(lambda: _write_log(path, int(args.size_gb * 1024**3)))
+        size_gib = os.path.getsize(path) / 1024**3
+        print(f"wrote {size_gib:.2f} GiB, {total_lines:,} lines in {seconds:.1f}s")
+
+        def islice_read() -> list[str]:
+            with open(path, encoding="utf-8") as fh:
+                return list(itertools.islice(fh, START_LINE - 1, START_LINE - 1 + WINDOW))
+
+        def window(offset: int) -> dict:
+            return asyncio.run(tool.execute(path=str(path), offset=offset, limit=WINDOW))
+
+        clear_line_index_cache()
+        rows = []
+        t, expected = _timed(islice_read)
+        rows.append(("islice", t))
+        t, cold = _timed(lambda: window(START_LINE))
+        rows.append(("window cold", t))
+        assert cold["content"] == "".join(expected), "window differs from islice"
+        rows.append(("window warm", _timed(lambda: window(START_LINE))[0]))
+        rows.append(("next page", _timed(lambda: window(START_LINE + WINDOW))[0]))
+        deep = min(15_000_000, total_lines - WINDOW)
+        rows.append((f"deep page {deep // 1_000_000}M", _timed(lambda: window(deep))[0]))
+        rows.append(("deep again", _timed(lambda: window(deep))[0]))
+
+        whole = asyncio.run(tool.execute(path=str(path)))
+        print(f"whole-file read: {whole['error'][:60]}...")
+        for name, seconds in rows:
+            print(f"{name:<14} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Benchmark: new-mail event latency and bytes per message for the IMAP source.
+
+Runs against the in-process IMAP server from ``tests/fixtures/imap_server.py``
+(plain TCP on localhost, so latency is protocol overhead, not network).
+A mailbox is pre-filled with ``--backlog`` read messages; then ``--messages``
+new ones, each with a ``--attachment-kb`` PDF attachment, are delivered at
+random moments and the time until the ``EMAIL_RECEIVED`` event is measured.
+
+* ``legacy poll`` — the previous implementation: connect and log in every
+  ``--poll-seconds``, ``SEARCH UNSEEN``, ``FETCH (RFC822)`` per message
+* ``idle``        — ``IMAPEmailEventSource`` with a persistent session,
+  IMAP IDLE and UID-incremental, attachment-free fetches
+
+Run::
+
+    python -m tests.benchmarks.imap_event_latency [--messages 20] [--poll-seconds 2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import email
+import imaplib
+import json
+import random
+import statistics
+import time
+from typing import Any
+
+from taskforce.core.domain.agent_event import AgentEvent
+from taskforce.infrastructure.event_sources.imap_email_source import IMAPEmailEventSource
+from tests.fixtures.imap_server import FakeIMAPServer, build_message
+
+
+def _legacy_poll(port: int) -> list[str]:
+    """The pre-session poll: one connection, SEARCH UNSEEN, RFC822 per message."""
+    conn = imaplib.IMAP4("127.0.0.1", port)
+    try:
+        conn.login("butler", "secret")
+        conn.select("INBOX")
+        _, ids = conn.search(None, "UNSEEN")
+        subjects = []
+        for raw_id in (ids[0] or b"").split():
+            _, data = conn.fetch(raw_id, "(RFC822)")
+            subjects.append(str(email.message_from_bytes(data[0][1])["Subject"]))
+            conn.store(raw_id, "+FLAGS", "\\Seen")
+        return subjects
+    finally:
+        conn.logout()
+
+
+async def _deliver_all(
+    server: FakeIMAPServer, count: int, attachment: bytes, spacing: float
+) -> dict[str, float]:
+    delivered: dict[str, float] = {}
+    for index in range(count):
+        await asyncio.sleep(random.uniform(0.5, 1.5) * spacing)
+        subject = f"bench {index}"
+        delivered[subject] = time.monotonic()
+        raw = build_message(subject, "Quarterly numbers.", attachment=attachment)
+        await asyncio.to_thread(server.deliver, raw)
+    return delivered
+
+
+async def _run_legacy(args: argparse.Namespace, attachment: bytes) -> dict[str, Any]:
+    with FakeIMAPServer() as server:
+        for index in range(args.backlog):
+            server.deliver(build_message(f"old {index}"))
+            server.messages[-1].seen = True
+        baseline = server.bytes_sent
+        received: dict[str, float] = {}
+        stop = asyncio.Event()
+
+        async def poller() -> None:
+            while not stop.is_set():
+                for subject in await asyncio.to_thread(_legacy_poll, server.port):
+                    received[subject] = time.monotonic()
+                try:
+                    await asyncio.wait_for(stop.wait(), args.poll_seconds)
+                except TimeoutError:
+                    pass
+
+        task = asyncio.create_task(poller())
+        delivered = await _deliver_all(server, args.messages, attachment, args.poll_seconds)
+        while len(received) < args.messages:
+            await asyncio.sleep(0.05)
+        stop.set()
+        await task
+        return _summary(delivered, received, server.bytes_sent - baseline, args.messages)
+
+
+async def _run_idle(args: argparse.Namespace, attachment: bytes) -> dict[str, Any]:
+    with FakeIMAPServer() as server:
+        for index in range(args.backlog):
+            server.deliver(build_message(f"old {index}"))
+            server.messages[-1].seen = True
+        received: dict[str, float] = {}
+
+        async def on_event(event: AgentEvent) -> None:
+            received[event.payload["subject"]] = time.monotonic()
+
+        source = IMAPEmailEventSource(
+            host="127.0.0.1",
+            username="butler",
+            password="secret",
+            port=server.port,
+            use_ssl=False,
+            poll_interval_seconds=args.poll_seconds,
+            event_callback=on_event,
+        )
+        baseline = server.bytes_sent
+        await source.start()
+        try:
+            delivered = await _deliver_all(server, args.messages, attachment, args.poll_seconds)
+            while len(received) < args.messages:
+                await asyncio.sleep(0.01)
+        finally:
+            await source.stop()
+        return _summary(delivered, received, server.bytes_sent - baseline, args.messages)
+
+
+def _summary(
+    delivered: dict[str, float], received: dict[str, float], sent: int, count: int
+) -> dict[str, Any]:
+    latencies = sorted(received[s] - delivered[s] for s in delivered)
+    return {
+        "latency_p50_ms": round(statistics.median(latencies) * 1000, 1),
+        "latency_max_ms": round(latencies[-1] * 1000, 1),
+        "bytes_per_message": sent // count,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=20)
+    parser.add_argument("--backlog", type=int, default=2000)
+    parser.add_argument("--attachment-kb", type=int, default=512)
+    parser.add_argument("--poll-seconds", type=float, default=2.0)
+    args = parser.parse_args()
+    attachment = random.randbytes(args.attachment_kb * 1024)
+
+    results = {
+        "legacy poll": await _run_legacy(args, attachment),
+        "idle": await _run_idle(args, attachment),
+    }
+    print(
+        f"{args.messages} messages with {args.attachment_kb} KB attachment, "
+        f"{args.backlog} read messages in the mailbox, poll every {args.poll_seconds}s"
+    )
+    for name, row in results.items():
+        print(
+            f"{name:<12} latency p50 {row['latency_p50_ms']:8.1f} ms  "
+            f"max {row['latency_max_ms']:8.1f} ms  {row['bytes_per_message']:9d} bytes/message"
+        )
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,121 @@
+"""Benchmark: FastIntentRouter per-message latency vs. number of intents.
+
+Builds synthetic intent sets (five patterns each, a mix of plain
+literals, ``a.*b`` pairs, alternations and ``\\b``-anchored words, as in
+deployment configs) and classifies messages of chat-like lengths made of
+everyday words with an occasional intent trigger. Compares the compiled
+single-scan matcher with the previous strategy of running every regex
+against every message.
+
+Run::
+
+    python tests/benchmarks/intent_router_scaling.py
+
+The compiled matcher should stay roughly flat as intents grow; the
+per-pattern loop grows linearly.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import timeit
+
+from taskforce.application.intent_router import FastIntentRouter, IntentPattern
+
+INTENT_COUNTS = (10, 50, 200, 400)
+MESSAGE_LENGTHS = (60, 300, 1200)
+REPEAT = 5
+
+_rng = random.Random(7)
+_SYLLABLES = (
+    "ka", "ro", "mi", "te", "lun", "bor", "sa", "qui", "ven", "dol", "tra", "pe",
+    "zor", "fi", "gu", "hex", "jo", "lek", "nu", "ox", "plo", "ri", "sku", "vy",
+)
+_FILLER = (
+    "please", "could", "you", "check", "the", "latest", "numbers", "for", "our",
+    "team", "and", "send", "me", "a", "short", "update", "about", "what", "happened",
+    "yesterday", "in", "meeting", "with", "client", "thanks", "also", "need", "this",
+    "before", "friday", "so", "we", "can", "plan", "next", "steps", "together",
+)
+
+
+def _word() -> str:
+    return "".join(_rng.choice(_SYLLABLES) for _ in range(_rng.randint(3, 4)))
+
+
+def build_intents(count: int) -> list[IntentPattern]:
+    intents = []
+    for i in range(count):
+        a, b, c, d, e = (_word() for _ in range(5))
+        intents.append(
+            IntentPattern(
+                intent=f"INTENT_{i}",
+                patterns=[
+                    a,
+                    rf"{b}.*{c}",
+                    rf"(?:{d}|{e})\s+{a}",
+                    rf"\b{c}\b",
+                    rf"{e}(?:s|en)?\s*{b}",
+                ],
+                skill=f"skill-{i}",
+                min_confidence=0.2,
+            )
+        )
+    return intents
+
+
+def build_message(length: int, intents: list[IntentPattern]) -> str:
+    words: list[str] = []
+    while sum(len(w) + 1 for w in words) < length:
+        words.append(
+            _rng.choice(_FILLER) if _rng.random() > 0.03 else _rng.choice(intents).patterns[0]
+        )
+    return " ".join(words)[:length]
+
+
+def per_pattern_loop(intents: list[IntentPattern]):
+    """The pre-compiled-matcher strategy: every regex against every message."""
+    compiled = [(p, [re.compile(x, re.IGNORECASE) for x in p.patterns]) for p in intents]
+
+    def classify(message: str) -> int:
+        lowered = message.lower()
+        hits = 0
+        for _, regexes in compiled:
+            hits += sum(1 for r in regexes if r.search(lowered))
+        return hits
+
+    return classify
+
+
+def main() -> None:
+    print(f"{'intents':>8} {'chars':>6} {'per-pattern µs':>15} {'compiled µs':>12}")
+    for count in INTENT_COUNTS:
+        intents = build_intents(count)
+        router = FastIntentRouter(patterns=list(intents))
+        loop = per_pattern_loop(intents)
+        for length in MESSAGE_LENGTHS:
+            messages = [build_message(length, intents) for _ in range(50)]
+            number = 20
+            old = min(
+                timeit.repeat(
+                    lambda loop=loop, messages=messages: [loop(m) for m in messages],
+                    number=number,
+                    repeat=REPEAT,
+                )
+            )
+            new = min(
+                timeit.repeat(
+                    lambda router=router, messages=messages: [
+                        router.candidates(m) for m in messages
+                    ],
+                    number=number,
+                    repeat=REPEAT,
+                )
+            )
+            scale = 1e6 / (number * len(messages))
+            print(f"{count:>8} {length:>6} {old * scale:>15.1f} {new * scale:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark: post-mission learning, inline vs. queued.
+
+Replays the 80 recorded missions in ``tests/fixtures/learning_missions.jsonl``
+through both pipelines against a scripted extraction LLM that takes
+``--llm-ms`` per call:
+
+* ``inline`` — the previous behaviour: one extraction call awaited after
+  every successful mission, facts merged only into a page of the same name
+* ``queued`` — ``LearningQueue``: missions without novel tool evidence are
+  skipped, the rest are batched ``--batch-size`` at a time in the
+  background, and facts are merged into similar existing pages
+
+Reports LLM calls per mission, wiki pages created per 100 missions, total
+page text, and the time learning adds to mission completion.
+
+Run::
+
+    python tests/benchmarks/learning_pipeline.py [--llm-ms 800] [--batch-size 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import tempfile
+from pathlib import Path
+
+import structlog
+
+from tests.fixtures.learning_replay import load_missions, replay
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--llm-ms", type=float, default=800)
+    parser.add_argument("--batch-size", type=int, default=4)
+    args = parser.parse_args()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+
+    rows = load_missions()
+    results = {}
+    for pipeline in ("inline", "queued"):
+        with tempfile.TemporaryDirectory() as tmp:
+            results[pipeline] = await replay(
+                rows,
+                Path(tmp),
+                pipeline=pipeline,
+                llm_seconds=args.llm_ms / 1000,
+                batch_size=args.batch_size,
+            )
+
+    print(f"{len(rows)} missions, extraction call {args.llm_ms:.0f} ms")
+    for name, row in results.items():
+        print(
+            f"{name:<7} llm calls/mission {row['llm_calls_per_mission']:5.3f}  "
+            f"pages/100 missions {row['pages_per_100_missions']:5.1f}  "
+            f"wiki chars {row['wiki_chars']:6d}  "
+            f"added to mission {row['hot_path_ms_mean']:7.2f} ms"
+        )
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,171 @@
+"""Benchmark: goodput and tail latency of LLM calls under a provider rate limit.
+
+Drives ``LiteLLMService.complete`` from many concurrent callers against a
+simulated provider (``litellm.acompletion`` patched) that enforces a
+request rate and a concurrency cap and answers everything beyond them
+with a 429 carrying ``Retry-After``. Three setups:
+
+* ``lockstep``  — governor off, deterministic ``backoff_multiplier ** attempt``
+  backoff (the behaviour before the rate governor)
+* ``jitter``    — governor off, jittered backoff honouring Retry-After
+* ``governed``  — ``rate_limits`` enabled with the provider's RPM: token
+  bucket, adaptive concurrency and Retry-After pause
+
+Reports goodput (successful calls per second of wall time), how many
+provider requests were throttled, failed calls and p50/p99 latency per
+call (including queueing and retries).
+
+Run::
+
+    python tests/benchmarks/llm_rate_governor.py [--callers 64] [--calls 400]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import yaml
+
+from taskforce.infrastructure.llm.litellm_service import LiteLLMService
+from taskforce.infrastructure.llm.rate_governor import reset_rate_governor
+
+PROVIDER_RPS = 40
+PROVIDER_CONCURRENCY = 8
+PROVIDER_LATENCY_S = 0.1
+
+
+class ProviderRateLimitError(Exception):
+    """429 as LiteLLM surfaces it: status code plus response headers."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__("429 Too Many Requests: rate limit exceeded")
+        self.status_code = 429
+        self.response = MagicMock(headers={"retry-after-ms": str(int(retry_after * 1000))})
+
+
+class SimulatedProvider:
+    """Sliding one-second request window plus a concurrency cap."""
+
+    def __init__(self) -> None:
+        self.window: deque[float] = deque()
+        self.in_flight = 0
+        self.requests = 0
+        self.throttled = 0
+
+    async def __call__(self, **kwargs: Any) -> Any:
+        self.requests += 1
+        now = time.monotonic()
+        while self.window and self.window[0] <= now - 1.0:
+            self.window.popleft()
+        if len(self.window) >= PROVIDER_RPS or self.in_flight >= PROVIDER_CONCURRENCY:
+            self.throttled += 1
+            retry_after = self.window[0] + 1.0 - now if self.window else PROVIDER_LATENCY_S
+            raise ProviderRateLimitError(max(retry_after, 0.01))
+        self.window.append(now)
+        self.in_flight += 1
+        try:
+            await asyncio.sleep(PROVIDER_LATENCY_S)
+        finally:
+            self.in_flight -= 1
+        message = MagicMock(content="ok", tool_calls=None)
+        response = MagicMock(model="gpt-4.1")
+        response.choices = [MagicMock(message=message)]
+        response.usage = MagicMock(total_tokens=120, prompt_tokens=100, completion_tokens=20)
+        return response
+
+
+def _config(directory: Path, name: str, *, jitter: bool, governed: bool) -> str:
+    config = {
+        "default_model": "main",
+        "models": {"main": "gpt-4.1"},
+        "retry": {
+            "max_attempts": 8,
+            "backoff_multiplier": 2,
+            "timeout": 30,
+            "jitter": jitter,
+            "max_backoff_seconds": 16,
+        },
+        "logging": {"log_token_usage": False},
+        "rate_limits": {
+            "enabled": governed,
+            "defaults": {"max_concurrency": 2 * PROVIDER_CONCURRENCY},
+            "models": {"main": {"rpm": PROVIDER_RPS * 60}},
+        },
+    }
+    path = directory / f"{name}.yaml"
+    path.write_text(yaml.dump(config), encoding="utf-8")
+    return str(path)
+
+
+async def _run(config_path: str, callers: int, calls: int) -> dict[str, Any]:
+    reset_rate_governor()
+    service = LiteLLMService(config_path=config_path)
+    provider = SimulatedProvider()
+    latencies: list[float] = []
+    failures = 0
+    remaining = iter(range(calls))
+
+    async def caller() -> None:
+        nonlocal failures
+        for _ in remaining:
+            started = time.perf_counter()
+            result = await service.complete(
+                messages=[{"role": "user", "content": "Summarise the ticket."}], model="main"
+            )
+            latencies.append(time.perf_counter() - started)
+            failures += not result["success"]
+
+    with patch("litellm.acompletion", new=provider):
+        started = time.perf_counter()
+        await asyncio.gather(*[caller() for _ in range(callers)])
+        wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "goodput_per_s": round((calls - failures) / wall, 1),
+        "throttled": provider.throttled,
+        "failed": failures,
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000),
+        "wall_s": round(wall, 2),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--callers", type=int, default=64)
+    parser.add_argument("--calls", type=int, default=400)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        setups = {
+            "lockstep": _config(directory, "lockstep", jitter=False, governed=False),
+            "jitter": _config(directory, "jitter", jitter=True, governed=False),
+            "governed": _config(directory, "governed", jitter=True, governed=True),
+        }
+        results = {name: await _run(path, args.callers, args.calls) for name, path in setups.items()}
+    reset_rate_governor()
+
+    print(
+        f"provider: {PROVIDER_RPS} req/s, {PROVIDER_CONCURRENCY} concurrent, "
+        f"{PROVIDER_LATENCY_S * 1000:.0f} ms; {args.callers} callers, {args.calls} calls"
+    )
+    for name, row in results.items():
+        print(
+            f"{name:<9} goodput {row['goodput_per_s']:6.1f}/s  throttled {row['throttled']:5d}  "
+            f"failed {row['failed']:4d}  p50 {row['p50_ms']:6d} ms  p99 {row['p99_ms']:6d} ms"
+        )
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
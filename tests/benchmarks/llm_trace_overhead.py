@@ -0,0 +1,122 @@
+"""Benchmark: per-call overhead of file-based LLM tracing.
+
+Runs ``LiteLLMService.complete()`` against an instant stub provider
+(``litellm.acompletion`` patched) with a chat-sized history and reports,
+for three setups, the time each call spends in ``_trace_to_file`` (the
+latency tracing adds to the LLM call) and the mean wall time per call:
+
+* ``off``         — tracing disabled
+* ``inline``      — the previous implementation: open the JSONL file with
+  aiofiles, dump the record and close it on every call
+* ``background``  — the batched ``TraceFileWriter`` (enqueue only)
+
+Run::
+
+    python tests/benchmarks/llm_trace_overhead.py
+
+With an instant provider the loop is CPU-bound, so the background
+thread's serialization still shows up in wall time; with a real provider
+it runs while the call waits on the network.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiofiles
+import yaml
+
+from taskforce.infrastructure.llm.litellm_service import LiteLLMService
+from taskforce.infrastructure.tracing import shutdown_trace_file_writers
+
+CALLS = 2000
+HISTORY_MESSAGES = 30
+MESSAGE_CHARS = 2000
+
+
+def _response() -> MagicMock:
+    message = MagicMock(content="ok", tool_calls=None)
+    response = MagicMock(choices=[MagicMock(message=message)], model="gpt-4.1")
+    response.usage = MagicMock(total_tokens=30, prompt_tokens=20, completion_tokens=10)
+    return response
+
+
+def _service(workdir: Path, tracing: bool) -> LiteLLMService:
+    workdir.mkdir(parents=True, exist_ok=True)
+    config = {
+        "default_model": "main",
+        "models": {"main": "gpt-4.1"},
+        "logging": {"log_token_usage": False},
+        "tracing": {
+            "enabled": tracing,
+            "mode": "file",
+            "file_config": {"path": str(workdir / "traces.jsonl")},
+        },
+    }
+    path = workdir / "llm_config.yaml"
+    path.write_text(yaml.dump(config), encoding="utf-8")
+    return LiteLLMService(config_path=str(path))
+
+
+async def _inline_trace_to_file(self: LiteLLMService, trace_data: dict[str, Any]) -> None:
+    """The pre-writer implementation, kept here as the baseline."""
+    file_path = Path(self._config.tracing_config["file_config"]["path"])
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    async with aiofiles.open(file_path, mode="a", encoding="utf-8") as f:
+        await f.write(json.dumps(trace_data) + "\n")
+
+
+async def _per_call_us(service: LiteLLMService) -> tuple[float, float]:
+    history = [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": "x" * MESSAGE_CHARS}
+        for i in range(HISTORY_MESSAGES)
+    ]
+    in_trace = 0.0
+    trace_to_file = service._trace_to_file
+
+    async def _timed(trace_data: dict[str, Any]) -> None:
+        nonlocal in_trace
+        started = time.perf_counter()
+        await trace_to_file(trace_data)
+        in_trace += time.perf_counter() - started
+
+    service._trace_to_file = _timed  # type: ignore[method-assign]
+    with patch("litellm.acompletion", new_callable=AsyncMock, return_value=_response()):
+        for _ in range(50):
+            await service.complete(messages=history, model="main")
+        in_trace = 0.0
+        started = time.perf_counter()
+        for _ in range(CALLS):
+            await service.complete(messages=history, model="main")
+        elapsed = time.perf_counter() - started
+    return in_trace / CALLS * 1e6, elapsed / CALLS * 1e6
+
+
+async def main() -> None:
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        rows.append(("off", await _per_call_us(_service(workdir / "off", False))))
+        inline = _service(workdir / "inline", True)
+        with patch.object(LiteLLMService, "_trace_to_file", _inline_trace_to_file):
+            rows.append(("inline", await _per_call_us(inline)))
+        rows.append(("background", await _per_call_us(_service(workdir / "bg", True))))
+        shutdown_trace_file_writers()
+        written = sum(1 for _ in (workdir / "bg" / "traces.jsonl").open())
+
+    record_kb = HISTORY_MESSAGES * MESSAGE_CHARS / 1024
+    print(f"{CALLS} calls, ~{record_kb:.0f} KiB per trace record")
+    print(f"{'setup':<11} {'in-call trace µs':>17} {'wall µs/call':>13}")
+    for name, (trace_us, wall_us) in rows:
+        print(f"{name:<11} {trace_us:17.1f} {wall_us:13.1f}")
+    print(f"background writer flushed {written} records on shutdown")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
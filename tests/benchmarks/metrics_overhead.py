@@ -0,0 +1,93 @@
+"""Microbenchmark: metrics instrumentation overhead per ReAct step.
+
+One ReAct step touches every instrumented hot path once: a streamed LLM
+call (duration + time-to-first-token), a tool execution, a state save
+and the run/queue gauges. This script replays exactly those updates
+against the real metric families and reports the added cost per step,
+with recording enabled vs. disabled (``TASKFORCE_METRICS_ENABLED=0``).
+
+Run::
+
+    python tests/benchmarks/metrics_overhead.py
+
+For scale: a single LLM round-trip is 300 ms - 30 s; the instrumentation
+is expected to stay in the low single-digit microseconds per step.
+"""
+
+from __future__ import annotations
+
+import time
+import timeit
+
+# Importing the instrumented modules registers the production families.
+from taskforce.application import request_queue, run_registry  # noqa: F401
+from taskforce.core.domain.lean_agent_components import tool_executor  # noqa: F401
+from taskforce.core.utils.metrics import get_metrics_registry
+from taskforce.infrastructure.llm import litellm_service  # noqa: F401
+from taskforce.infrastructure.persistence import file_state_manager  # noqa: F401
+
+STEPS = 200_000
+
+
+def _families():
+    registry = get_metrics_registry()
+    return (
+        registry.get("taskforce_llm_request_duration_seconds"),
+        registry.get("taskforce_llm_time_to_first_token_seconds"),
+        registry.get("taskforce_tool_duration_seconds"),
+        registry.get("taskforce_state_save_duration_seconds"),
+        registry.get("taskforce_request_queue_depth"),
+        registry.get("taskforce_active_runs"),
+    )
+
+
+def react_step_updates() -> None:
+    """The metric updates one ReAct step performs, in order."""
+    llm, ttft, tool, state, depth, runs = _FAMILIES
+    started = time.perf_counter()
+    ttft.labels("azure/gpt-4.1").observe(time.perf_counter() - started)
+    llm.labels("azure/gpt-4.1", "stream", "success").observe(time.perf_counter() - started)
+    tool.labels("file_read", "success").observe(time.perf_counter() - started)
+    state.labels("ok").observe(time.perf_counter() - started)
+    depth.set(0)
+    runs.set(1)
+
+
+def baseline_step() -> None:
+    """The same ``perf_counter`` calls without any metric update."""
+    started = time.perf_counter()
+    for _ in range(4):
+        time.perf_counter() - started
+
+
+_FAMILIES = _families()
+
+
+def _per_step_ns(fn) -> float:
+    best = min(timeit.repeat(fn, number=STEPS, repeat=5))
+    return best / STEPS * 1e9
+
+
+def main() -> None:
+    registry = get_metrics_registry()
+    baseline = _per_step_ns(baseline_step)
+
+    registry.enabled = True
+    enabled = _per_step_ns(react_step_updates)
+    registry.enabled = False
+    disabled = _per_step_ns(react_step_updates)
+    registry.enabled = True
+
+    render_started = time.perf_counter()
+    text = registry.render()
+    render_ms = (time.perf_counter() - render_started) * 1000
+
+    print(f"baseline (timers only):      {baseline:8.0f} ns/step")
+    print(f"metrics enabled:             {enabled:8.0f} ns/step")
+    print(f"metrics disabled:            {disabled:8.0f} ns/step")
+    print(f"added by instrumentation:    {enabled - baseline:8.0f} ns/step")
+    print(f"/metrics render:             {render_ms:8.2f} ms ({len(text.splitlines())} lines)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""Benchmark: SchedulerService with 50k jobs — memory, startup, firing jitter.
+
+Three measurements:
+
+* **startup** — 50k persisted jobs (interval and cron, some due for a
+  catch-up) loaded by ``SchedulerService.start()`` from the per-file
+  ``FileJobStore`` and from the ``JournalJobStore``; reports wall time and,
+  from a second run under tracemalloc, the memory the running scheduler
+  and its store hold.
+* **timers** — memory of the heap driver vs. the previous design of one
+  sleeping asyncio task per job, for the same 50k jobs.
+* **jitter** — 50k one-shot jobs due uniformly over 10 seconds; reports
+  how late each firing reached the callback (p50/p99/max) for the heap
+  driver and for one task per job.
+
+Run::
+
+    python tests/benchmarks/scheduler_scale.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import statistics
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import structlog
+
+from taskforce.core.domain.agent_event import AgentEvent
+from taskforce.core.domain.schedule import (
+    CoalescePolicy,
+    ScheduleAction,
+    ScheduleActionType,
+    ScheduleJob,
+    ScheduleType,
+)
+from taskforce.infrastructure.scheduler.file_job_store import FileJobStore
+from taskforce.infrastructure.scheduler.journal_job_store import JournalJobStore
+from taskforce.infrastructure.scheduler.scheduler_service import SchedulerService
+
+JOBS = 50_000
+JITTER_WINDOW_SECONDS = 10.0
+CRONS = ("*/5 * * * *", "0 8 * * *", "30 6 * * 1-5", "0 */2 * * *", "15 9 1 * *")
+
+
+class MemoryStore:
+    """Job store without I/O, so jitter measures the scheduler alone."""
+
+    def __init__(self, jobs: list[ScheduleJob] | None = None) -> None:
+        self.jobs = {job.job_id: job for job in jobs or []}
+
+    async def save(self, job: ScheduleJob) -> None:
+        self.jobs[job.job_id] = job
+
+    async def load(self, job_id: str) -> ScheduleJob | None:
+        return self.jobs.get(job_id)
+
+    async def load_all(self) -> list[ScheduleJob]:
+        return list(self.jobs.values())
+
+    async def delete(self, job_id: str) -> bool:
+        return self.jobs.pop(job_id, None) is not None
+
+
+def recurring_jobs() -> list[ScheduleJob]:
+    now = datetime.now(UTC)
+    jobs = []
+    for i in range(JOBS):
+        if i % 5 == 0:
+            job = ScheduleJob(
+                name=f"digest-{i}",
+                schedule_type=ScheduleType.CRON,
+                expression=CRONS[i % len(CRONS)],
+                timezone="Europe/Vienna",
+            )
+        else:
+            job = ScheduleJob(
+                name=f"mailbox-poll-{i}",
+                schedule_type=ScheduleType.INTERVAL,
+                expression=f"{600 + i % 3000}s",
+                last_run=now - timedelta(seconds=i % 7200),
+                coalesce=CoalescePolicy.RUN_ONCE if i % 97 == 0 else CoalescePolicy.SKIP,
+            )
+        jobs.append(job)
+    return jobs
+
+
+def seed_file_store(work_dir: Path, jobs: list[ScheduleJob]) -> None:
+    jobs_dir = work_dir / "scheduler" / "jobs"
+    jobs_dir.mkdir(parents=True)
+    for job in jobs:
+        (jobs_dir / f"{job.job_id}.json").write_text(json.dumps(job.to_dict()))
+
+
+def seed_journal(work_dir: Path, jobs: list[ScheduleJob]) -> None:
+    path = work_dir / "scheduler" / "jobs.jsonl"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        "".join(json.dumps({"op": "put", "job": job.to_dict()}) + "\n" for job in jobs)
+    )
+
+
+async def measure_startup(label: str, make_store: Callable[[], object]) -> None:
+    svc = SchedulerService(job_store=make_store())
+    start = time.perf_counter()
+    await svc.start()
+    elapsed = time.perf_counter() - start
+    await svc.stop()
+
+    # Second run under tracemalloc (which slows it down) for the memory figure.
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    svc = SchedulerService(job_store=make_store())
+    await svc.start()
+    held = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    await svc.stop()
+    print(f"startup {label:<16} {elapsed:>7.2f} s   memory held {held / 1e6:>7.1f} MB")
+
+
+async def measure_timers(jobs: list[ScheduleJob]) -> None:
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    svc = SchedulerService(job_store=MemoryStore(jobs))
+    await svc.start()
+    heap = tracemalloc.get_traced_memory()[0] - baseline
+    await svc.stop()
+
+    baseline = tracemalloc.get_traced_memory()[0]
+    tasks = [asyncio.create_task(asyncio.sleep(3600)) for _ in jobs]
+    await asyncio.sleep(0)
+    per_task = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    print(
+        f"timers  heap driver      {heap / 1e6:>7.1f} MB (incl. job objects)   "
+        f"one task per job {per_task / 1e6:>7.1f} MB (tasks alone)"
+    )
+
+
+def one_shots(start: datetime) -> list[ScheduleJob]:
+    step = JITTER_WINDOW_SECONDS / JOBS
+    return [
+        ScheduleJob(
+            name=f"reminder-{i}",
+            schedule_type=ScheduleType.ONE_SHOT,
+            expression=(start + timedelta(seconds=i * step)).isoformat(),
+            action=ScheduleAction(ScheduleActionType.SEND_NOTIFICATION),
+        )
+        for i in range(JOBS)
+    ]
+
+
+def report(label: str, lateness: list[float]) -> None:
+    lateness.sort()
+    p99 = lateness[int(len(lateness) * 0.99)]
+    print(
+        f"jitter  {label:<16} fired {len(lateness):>6}  "
+        f"p50 {statistics.median(lateness) * 1e3:>7.2f} ms  p99 {p99 * 1e3:>7.2f} ms  "
+        f"max {lateness[-1] * 1e3:>8.2f} ms"
+    )
+
+
+async def measure_heap_jitter() -> None:
+    lateness: list[float] = []
+
+    async def on_event(event: AgentEvent) -> None:
+        due = datetime.fromisoformat(event.metadata["scheduled_for"]).timestamp()
+        lateness.append(time.time() - due)
+
+    start = datetime.now(UTC) + timedelta(seconds=3)
+    svc = SchedulerService(job_store=MemoryStore(one_shots(start)), event_callback=on_event)
+    await svc.start()
+    while len(lateness) < JOBS:
+        await asyncio.sleep(0.2)
+    await svc.stop()
+    report("heap driver", lateness)
+
+
+async def measure_task_jitter() -> None:
+    lateness: list[float] = []
+
+    async def fire_at(due: float) -> None:
+        await asyncio.sleep(max(0.0, due - time.time()))
+        lateness.append(time.time() - due)
+
+    start = time.time() + 3
+    step = JITTER_WINDOW_SECONDS / JOBS
+    tasks = [asyncio.create_task(fire_at(start + i * step)) for i in range(JOBS)]
+    await asyncio.gather(*tasks)
+    report("one task per job", lateness)
+
+
+async def main() -> None:
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+    jobs = recurring_jobs()
+    with tempfile.TemporaryDirectory() as tmp:
+        seed_file_store(Path(tmp) / "file", jobs)
+        seed_journal(Path(tmp) / "journal", jobs)
+        file_dir, journal_dir = str(Path(tmp) / "file"), str(Path(tmp) / "journal")
+        await measure_startup("FileJobStore", lambda: FileJobStore(file_dir))
+        await measure_startup("JournalJobStore", lambda: JournalJobStore(journal_dir))
+    await measure_timers(jobs)
+    await measure_heap_jitter()
+    await measure_task_jitter()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
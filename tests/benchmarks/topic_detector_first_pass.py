@@ -0,0 +1,67 @@
+"""Offline evaluation: TopicDetector lexical first pass vs. LLM-only.
+
+Replays the labelled cases in ``tests/fixtures/topic_shift_cases.py``
+twice: once with ``lexical_first_pass=False`` (every message goes to the
+LLM) and once with the default two-stage detector. The LLM is an oracle
+that returns the gold answer, so the accuracy delta isolates the errors
+made by the local stage. Also prints each first-pass decision for tuning
+``same_topic_above`` / ``changed_below``.
+
+Run::
+
+    python -m tests.benchmarks.topic_detector_first_pass
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+from taskforce.application.topic_detector import TopicDetector
+from tests.fixtures.topic_shift_cases import TOPIC_SHIFT_CASES
+
+
+class OracleLLM:
+    """Answers detection prompts with the gold label of the current case."""
+
+    def __init__(self) -> None:
+        self.gold = False
+        self.calls = 0
+
+    async def complete(self, **kwargs: Any) -> dict[str, Any]:
+        self.calls += 1
+        return {"content": json.dumps({"changed": self.gold, "label": "gold", "confidence": 0.9})}
+
+
+async def _run(lexical: bool, *, verbose: bool = False) -> tuple[float, int]:
+    llm = OracleLLM()
+    detector = TopicDetector(llm, lexical_first_pass=lexical)
+    correct = 0
+    for case in TOPIC_SHIFT_CASES:
+        llm.gold = case.changed
+        change, d = await detector.decide(case.message, case.current_label, case.recent)
+        hit = (change is not None) == case.changed
+        correct += hit
+        if verbose:
+            print(
+                f"  {'ok ' if hit else 'ERR'} {d.stage:<7} {d.reason:<17} "
+                f"score={d.score:.3f} gold={case.changed!s:<5} {case.message[:48]}"
+            )
+    return correct / len(TOPIC_SHIFT_CASES), llm.calls
+
+
+async def main() -> None:
+    base_acc, base_calls = await _run(lexical=False)
+    print("first-pass decisions:")
+    acc, calls = await _run(lexical=True, verbose=True)
+    n = len(TOPIC_SHIFT_CASES)
+    print(f"cases:           {n}")
+    print(f"LLM-only:        {base_calls} calls, accuracy {base_acc:.1%}")
+    print(f"two-stage:       {calls} calls, accuracy {acc:.1%}")
+    print(f"calls avoided:   {base_calls - calls} ({(base_calls - calls) / base_calls:.0%})")
+    print(f"accuracy delta:  {acc - base_acc:+.1%}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
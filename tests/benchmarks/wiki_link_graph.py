@@ -0,0 +1,136 @@
+"""Benchmark: wiki lint, backlinks and page writes on a large wiki.
+
+Generates ``--pages`` pages on disk (``tests/fixtures/wiki_generator.py``)
+and compares
+
+* ``legacy`` — the previous lint (``list_pages`` and re-extract every
+  ``[[link]]``), a backlink lookup as a scan over all page bodies, and a
+  page write that re-reads every page to render ``index.md``
+* ``graph``  — ``FileWikiStore``'s persisted link graph: lint and
+  backlinks answered from forward/backward adjacency, writes updating
+  the graph incrementally
+
+The graph is measured cold (first store on the wiki: every page read
+once to build it) and warm (a new store loading the persisted graph and
+re-statting the files).
+
+Run::
+
+    python tests/benchmarks/wiki_link_graph.py [--pages 50000] [--lookups 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import structlog
+
+from taskforce.application.wiki_lint_service import LintReport, lint_wiki
+from taskforce.core.domain.wiki_link_graph import WikiLinkGraph
+from taskforce.core.domain.wiki_page import WikiPage
+from taskforce.core.domain.wiki_service import extract_wiki_links, render_index
+from taskforce.core.utils.atomic_io import atomic_write_text
+from taskforce.infrastructure.memory.file_wiki_store import FileWikiStore
+from tests.fixtures.wiki_generator import generate_wiki
+
+
+class _ListingOnly:
+    """Hides the link graph so ``lint_wiki`` takes the list_pages path."""
+
+    def __init__(self, store: FileWikiStore) -> None:
+        self._store = store
+
+    async def list_pages(self) -> list[WikiPage]:
+        return await self._store.list_pages()
+
+
+async def _timed(coro) -> tuple[float, object]:
+    started = time.perf_counter()
+    result = await coro
+    return (time.perf_counter() - started) * 1000, result
+
+
+async def _legacy_backlinks(store: FileWikiStore, name: str) -> list[str]:
+    return [p.name for p in await store.list_pages() if name in extract_wiki_links(p.body)]
+
+
+async def _legacy_write(store: FileWikiStore, root: Path, page: WikiPage) -> None:
+    path = root / f"{page.name}.md"
+    await atomic_write_text(path, store._serialise(page))
+    await atomic_write_text(root / "index.md", render_index(await store.list_pages()))
+
+
+def _issue_count(report: LintReport) -> int:
+    return len(report.issues)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=50_000)
+    parser.add_argument("--lookups", type=int, default=200)
+    args = parser.parse_args()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "wiki"
+        started = time.perf_counter()
+        names = generate_wiki(root, args.pages)
+        print(f"generated {args.pages} pages in {time.perf_counter() - started:.1f} s")
+        targets = random.Random(5).sample(names, min(args.lookups, len(names)))
+        page = WikiPage(name=names[0], title="Topic 0", body="Rewritten, see [[" + names[1] + "]].")
+
+        store = FileWikiStore(root)
+        legacy_lint_ms, legacy_report = await _timed(lint_wiki(_ListingOnly(store)))
+        legacy_backlinks_ms, _ = await _timed(_legacy_backlinks(store, targets[0]))
+        legacy_write_ms, _ = await _timed(_legacy_write(store, root, page))
+
+        cold_ms, _ = await _timed(store.link_graph())
+        warm_store = FileWikiStore(root)
+        warm_ms, graph = await _timed(warm_store.link_graph())
+        graph_lint_ms, graph_report = await _timed(lint_wiki(warm_store))
+        assert isinstance(graph, WikiLinkGraph)
+        started = time.perf_counter()
+        for name in targets:
+            graph.backlinks(name)
+            graph.neighbourhood(name)
+        lookup_us = (time.perf_counter() - started) / len(targets) * 1e6
+        graph_write_ms, _ = await _timed(warm_store.write_page(page))
+
+    results = {
+        "legacy": {
+            "lint_ms": round(legacy_lint_ms, 1),
+            "backlinks_us": round(legacy_backlinks_ms * 1000, 1),
+            "write_page_ms": round(legacy_write_ms, 1),
+            "issues": _issue_count(legacy_report),
+        },
+        "graph": {
+            "cold_build_ms": round(cold_ms, 1),
+            "warm_load_ms": round(warm_ms, 1),
+            "lint_ms": round(graph_lint_ms, 1),
+            "backlinks_us": round(lookup_us, 1),
+            "write_page_ms": round(graph_write_ms, 1),
+            "issues": _issue_count(graph_report),
+        },
+    }
+    print(f"{args.pages} pages")
+    for name, row in results.items():
+        extra = (
+            f"  cold build {row['cold_build_ms']:8.1f} ms  warm load {row['warm_load_ms']:7.1f} ms"
+            if "cold_build_ms" in row
+            else ""
+        )
+        print(
+            f"{name:<7} lint {row['lint_ms']:8.1f} ms  backlinks {row['backlinks_us']:10.1f} us  "
+            f"write_page {row['write_page_ms']:8.1f} ms  issues {row['issues']}{extra}"
+        )
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
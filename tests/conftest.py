@@ -186,6 +186,19 @@ from unittest.mock import AsyncMock, MagicMock  # noqa: E402
 import pytest  # noqa: E402
 
 from taskforce.core.interfaces.logging import LoggerProtocol  # noqa: E402
+from taskforce.infrastructure.llm.rate_governor import reset_rate_governor  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _isolated_rate_governor():
+    """Keep the process-wide LLM rate governor's per-model state per test.
+
+    Otherwise failures injected by one test could open a circuit (or shrink
+    the concurrency limit) for a model another test uses.
+    """
+    reset_rate_governor()
+    yield
+    reset_rate_governor()
 
 
 class MockLogger(LoggerProtocol):
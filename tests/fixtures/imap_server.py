@@ -0,0 +1,387 @@
+"""Minimal in-process IMAP4rev1 server for IMAP event-source tests.
+
+Supports what ``IMAPEmailEventSource`` and a plain ``imaplib`` poller
+use: CAPABILITY, LOGIN, SELECT/EXAMINE, SEARCH, FETCH, STORE (plain and
+``UID``), NOOP, CLOSE, LOGOUT and IDLE. Messages live in memory;
+:meth:`FakeIMAPServer.deliver` appends one and notifies idling clients
+with ``* n EXISTS``. Every byte the server sends is counted so tests and
+benchmarks can compare transfer volume.
+
+Usage::
+
+    with FakeIMAPServer() as server:
+        uid = server.deliver(raw_rfc822_bytes)
+        client = imaplib.IMAP4("127.0.0.1", server.port)
+"""
+
+from __future__ import annotations
+
+import email
+import re
+import socket
+import socketserver
+import threading
+import time
+from dataclasses import dataclass, field
+from email.message import EmailMessage, Message
+from email.policy import compat32
+from typing import Any
+
+
+@dataclass
+class StoredMessage:
+    uid: int
+    raw: bytes
+    seen: bool = False
+    delivered_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def message(self) -> Message:
+        return email.message_from_bytes(self.raw, policy=compat32)
+
+
+def build_message(
+    subject: str, body: str = "Hello there", *, attachment: bytes | None = None
+) -> bytes:
+    """RFC 822 bytes for a test mail, optionally with a PDF attachment."""
+    msg = EmailMessage()
+    msg["Subject"] = subject
+    msg["From"] = "alice@example.com"
+    msg["To"] = "butler@example.com"
+    msg["Message-ID"] = f"<{subject.replace(' ', '-')}@example.com>"
+    msg.set_content(body, cte="base64" if attachment else "7bit")
+    if attachment is not None:
+        msg.add_attachment(
+            attachment, maintype="application", subtype="pdf", filename="report.pdf"
+        )
+    return msg.as_bytes()
+
+
+def _quote(value: str | None) -> str:
+    if value is None:
+        return "NIL"
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _literal(data: bytes) -> bytes:
+    return b"{%d}\r\n" % len(data) + data
+
+
+def _split_raw(raw: bytes) -> tuple[bytes, bytes]:
+    for separator in (b"\r\n\r\n", b"\n\n"):
+        index = raw.find(separator)
+        if index >= 0:
+            return raw[: index + len(separator)], raw[index + len(separator) :]
+    return raw, b""
+
+
+def _leaf_for(msg: Message, part: str) -> Message | None:
+    node = msg
+    for index in part.split("."):
+        if not node.is_multipart():
+            return node if index == "1" else None
+        children = node.get_payload()
+        position = int(index) - 1
+        if position >= len(children):
+            return None
+        node = children[position]
+    return node
+
+
+def bodystructure(msg: Message) -> str:
+    """BODYSTRUCTURE for ``msg`` (basic fields plus disposition)."""
+    if msg.is_multipart():
+        children = "".join(bodystructure(part) for part in msg.get_payload())
+        return f"({children} {_quote(msg.get_content_subtype().upper())})"
+    maintype = msg.get_content_maintype().upper()
+    subtype = msg.get_content_subtype().upper()
+    params = [(k, v) for k, v in msg.get_params(header="content-type", failobj=[])[1:]]
+    param_text = (
+        "(" + " ".join(f"{_quote(k.upper())} {_quote(v)}" for k, v in params) + ")"
+        if params
+        else "NIL"
+    )
+    encoding = (msg.get("Content-Transfer-Encoding") or "7bit").upper()
+    body = msg.get_payload().encode("utf-8", "surrogateescape")
+    fields = (
+        f"{_quote(maintype)} {_quote(subtype)} {param_text} NIL NIL "
+        f"{_quote(encoding)} {len(body)}"
+    )
+    if maintype == "TEXT":
+        line_count = body.count(b"\n")
+        fields += f" {line_count}"
+    disposition = msg.get_content_disposition()
+    if disposition:
+        filename = msg.get_filename()
+        disposition_params = f"({_quote('FILENAME')} {_quote(filename)})" if filename else "NIL"
+        fields += f" NIL ({_quote(disposition.upper())} {disposition_params})"
+    return f"({fields})"
+
+
+class FakeIMAPServer:
+    """Threaded IMAP server on 127.0.0.1 (see module docstring)."""
+
+    def __init__(self, *, idle: bool = True, uidvalidity: int = 1) -> None:
+        self.capabilities = "IMAP4rev1 IDLE" if idle else "IMAP4rev1"
+        self.uidvalidity = uidvalidity
+        self.messages: list[StoredMessage] = []
+        self.bytes_sent = 0
+        self.logins = 0
+        self.commands: list[str] = []
+        self._next_uid = 1
+        self._lock = threading.Lock()
+        self._idlers: list[_Handler] = []
+        outer = self
+
+        class Handler(_Handler):
+            server_state = outer
+
+        self._server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self) -> FakeIMAPServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def deliver(self, raw: bytes) -> int:
+        """Append a message and wake idling clients. Returns its UID."""
+        with self._lock:
+            message = StoredMessage(uid=self._next_uid, raw=raw)
+            self._next_uid += 1
+            self.messages.append(message)
+            count = len(self.messages)
+            idlers = list(self._idlers)
+        for handler in idlers:
+            handler.push(f"* {count} EXISTS")
+        return message.uid
+
+    def reset_uids(self, uidvalidity: int) -> None:
+        """Simulate a mailbox rebuild: new UIDVALIDITY, UIDs renumbered."""
+        with self._lock:
+            self.uidvalidity = uidvalidity
+            for index, message in enumerate(self.messages, 1000):
+                message.uid = index
+            self._next_uid = 1000 + len(self.messages)
+
+    def disconnect_all(self) -> None:
+        """Drop every client connection (simulates a network failure)."""
+        for handler in list(_Handler.live):
+            if handler.server_state is self:
+                handler.drop()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server_state: FakeIMAPServer
+    live: set[_Handler] = set()
+
+    def setup(self) -> None:
+        super().setup()
+        # Replies go out line by line; without this, Nagle plus delayed
+        # ACKs add ~40 ms per round trip on loopback.
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._write_lock = threading.Lock()
+        _Handler.live.add(self)
+
+    def finish(self) -> None:
+        _Handler.live.discard(self)
+        try:
+            super().finish()
+        except OSError:
+            pass
+
+    def drop(self) -> None:
+        try:
+            self.request.shutdown(2)
+        except OSError:
+            pass
+
+    def send(self, data: bytes) -> None:
+        with self._write_lock:
+            self.server_state.bytes_sent += len(data)
+            self.wfile.write(data)
+            self.wfile.flush()
+
+    def push(self, line: str) -> None:
+        try:
+            self.send(line.encode() + b"\r\n")
+        except OSError:
+            pass
+
+    def handle(self) -> None:
+        state = self.server_state
+        self.push(f"* OK [CAPABILITY {state.capabilities}] fake IMAP ready")
+        while True:
+            try:
+                line = self.rfile.readline()
+            except OSError:
+                return
+            if not line:
+                return
+            text = line.decode("utf-8", "replace").rstrip("\r\n")
+            tag, _, rest = text.partition(" ")
+            command, _, args = rest.partition(" ")
+            command = command.upper()
+            state.commands.append(f"{command} {args}".strip())
+            if command == "UID":
+                command, _, args = args.partition(" ")
+                command, by_uid = command.upper(), True
+            else:
+                by_uid = False
+            try:
+                if self._dispatch(tag, command, args, by_uid) is False:
+                    return
+            except OSError:
+                return
+
+    # ------------------------------------------------------------------
+
+    def _dispatch(self, tag: str, command: str, args: str, by_uid: bool) -> bool | None:
+        state = self.server_state
+        if command == "CAPABILITY":
+            self.push(f"* CAPABILITY {state.capabilities}")
+        elif command == "LOGIN":
+            state.logins += 1
+        elif command in ("SELECT", "EXAMINE"):
+            with state._lock:
+                exists = len(state.messages)
+                next_uid = state._next_uid
+            self.push(f"* {exists} EXISTS")
+            self.push("* 0 RECENT")
+            self.push(f"* OK [UIDVALIDITY {state.uidvalidity}] UIDs valid")
+            self.push(f"* OK [UIDNEXT {next_uid}] next UID")
+            mode = "READ-ONLY" if command == "EXAMINE" else "READ-WRITE"
+            self.push(f"{tag} OK [{mode}] {command} completed")
+            return None
+        elif command == "SEARCH":
+            hits = self._search(args, by_uid)
+            self.push("* SEARCH" + "".join(f" {h}" for h in hits))
+        elif command == "FETCH":
+            self._fetch(args, by_uid)
+        elif command == "STORE":
+            self._store(args, by_uid)
+        elif command == "IDLE":
+            return self._idle(tag)
+        elif command == "LOGOUT":
+            self.push("* BYE logging out")
+            self.push(f"{tag} OK LOGOUT completed")
+            return False
+        elif command not in ("NOOP", "CLOSE"):
+            self.push(f"{tag} BAD unknown command {command}")
+            return None
+        self.push(f"{tag} OK {command} completed")
+        return None
+
+    def _numbered(self) -> list[tuple[int, StoredMessage]]:
+        with self.server_state._lock:
+            return list(enumerate(self.server_state.messages, 1))
+
+    def _select(self, spec: str, by_uid: bool) -> list[tuple[int, StoredMessage]]:
+        numbered = self._numbered()
+        if not numbered:
+            return []
+        highest = numbered[-1][1].uid if by_uid else numbered[-1][0]
+        wanted: set[int] = set()
+        for chunk in spec.split(","):
+            low, _, high = chunk.partition(":")
+            lo = highest if low == "*" else int(low)
+            hi = lo if not high else (highest if high == "*" else int(high))
+            lo, hi = min(lo, hi), max(lo, hi)
+            wanted.update(range(lo, hi + 1))
+        return [(seq, m) for seq, m in numbered if (m.uid if by_uid else seq) in wanted]
+
+    def _search(self, args: str, by_uid: bool) -> list[int]:
+        tokens = args.upper().split()
+        candidates = self._numbered()
+        if "UID" in tokens:
+            spec = tokens[tokens.index("UID") + 1]
+            selected = {m.uid for _, m in self._select(spec, True)}
+            candidates = [(s, m) for s, m in candidates if m.uid in selected]
+        if "UNSEEN" in tokens:
+            candidates = [(s, m) for s, m in candidates if not m.seen]
+        return [m.uid if by_uid else s for s, m in candidates]
+
+    def _store(self, args: str, by_uid: bool) -> None:
+        spec, _, rest = args.partition(" ")
+        for _, message in self._select(spec, by_uid):
+            if "\\SEEN" in rest.upper():
+                message.seen = not rest.lstrip().startswith("-")
+
+    def _fetch(self, args: str, by_uid: bool) -> None:
+        spec, _, items_text = args.partition(" ")
+        items = re.findall(
+            r"BODY(?:\.PEEK)?\[[^\]]*\](?:<\d+\.\d+>)?|[A-Z0-9.]+", items_text.upper()
+        )
+        if by_uid and "UID" not in items:
+            items.insert(0, "UID")
+        for seq, message in self._select(spec, by_uid):
+            out = b"* %d FETCH (" % seq
+            parts: list[bytes] = []
+            for item in items:
+                parts.append(self._fetch_item(message, item))
+                if item.startswith("BODY[") or item in ("RFC822", "RFC822.TEXT"):
+                    message.seen = True
+            out += b" ".join(parts) + b")\r\n"
+            self.send(out)
+
+    def _fetch_item(self, message: StoredMessage, item: str) -> bytes:
+        if item == "UID":
+            return b"UID %d" % message.uid
+        if item == "FLAGS":
+            return b"FLAGS (\\Seen)" if message.seen else b"FLAGS ()"
+        if item == "RFC822.SIZE":
+            return b"RFC822.SIZE %d" % len(message.raw)
+        if item == "RFC822":
+            return b"RFC822 " + _literal(message.raw)
+        if item == "BODYSTRUCTURE":
+            return b"BODYSTRUCTURE " + bodystructure(message.message).encode()
+        match = re.fullmatch(r"BODY(?:\.PEEK)?\[([^\]]*)\](?:<(\d+)\.(\d+)>)?", item)
+        if not match:
+            return b""
+        section, offset, length = match.group(1), match.group(2), match.group(3)
+        header, body = _split_raw(message.raw)
+        if section == "":
+            data = message.raw
+        elif section == "HEADER":
+            data = header
+        elif section == "TEXT":
+            data = body
+        elif section.startswith("HEADER.FIELDS"):
+            names = set(re.findall(r"[A-Z0-9-]+", section.split("(", 1)[1]))
+            lines = [
+                f"{key}: {value}\r\n".encode()
+                for key, value in message.message.items()
+                if key.upper() in names
+            ]
+            data = b"".join(lines) + b"\r\n"
+        else:
+            leaf = _leaf_for(message.message, section)
+            data = b"" if leaf is None else leaf.get_payload().encode("utf-8", "surrogateescape")
+        name = f"BODY[{section}]"
+        if offset is not None:
+            data = data[int(offset) : int(offset) + int(length)]
+            name += f"<{offset}>"
+        return name.encode() + b" " + _literal(data)
+
+    def _idle(self, tag: str) -> bool | None:
+        state = self.server_state
+        self.push("+ idling")
+        with state._lock:
+            state._idlers.append(self)
+        try:
+            line = self.rfile.readline()
+        except OSError:
+            line = b""
+        finally:
+            with state._lock:
+                if self in state._idlers:
+                    state._idlers.remove(self)
+        if not line:
+            return False
+        self.push(f"{tag} OK IDLE terminated")
+        return None
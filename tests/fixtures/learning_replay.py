@@ -0,0 +1,122 @@
+"""Offline replay of post-mission learning.
+
+``learning_missions.jsonl`` holds 80 finished butler missions in the
+order a user sent them: recurring questions (weather, trains, exchange
+rates, news, parcels) answered through the same sources, contacts and
+customers looked up again, report requests, plus chit-chat without tool
+calls and runs whose only tool call failed. Each row carries the chat
+messages at completion and the facts an extraction LLM returns for it;
+repeated topics get paraphrased facts under new slugs, as a real model
+does. :class:`ScriptedExtractionLLM` answers extraction prompts from
+those rows (matched by tool-call id) and counts calls.
+
+Usage::
+
+    stats = await replay(load_missions(), wiki_dir, pipeline="queued")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any
+
+from taskforce.application.learning_queue import LearningQueue
+from taskforce.application.learning_service import LlmExtractingLearningService
+from taskforce.core.domain.wiki_page import WikiPage
+from taskforce.infrastructure.memory.file_wiki_store import FileWikiStore
+
+MISSIONS = Path(__file__).parent / "learning_missions.jsonl"
+
+
+def load_missions() -> list[dict[str, Any]]:
+    lines = MISSIONS.read_text(encoding="utf-8").splitlines()
+    return [json.loads(line) for line in lines]
+
+
+class ScriptedExtractionLLM:
+    """``complete_json`` stand-in returning each mission's recorded facts."""
+
+    def __init__(self, rows: list[dict[str, Any]], latency_seconds: float = 0.0) -> None:
+        self._facts: dict[str, list[dict[str, Any]]] = {}
+        for row in rows:
+            for msg in row["messages"]:
+                for call in msg.get("tool_calls") or []:
+                    self._facts[call["id"]] = row["facts"]
+        self._latency = latency_seconds
+        self.calls = 0
+
+    async def complete_json(self, prompt: str, **_: Any) -> dict[str, Any]:
+        self.calls += 1
+        await asyncio.sleep(self._latency)
+        call_ids = dict.fromkeys(re.findall(r"call_\d{3}", prompt))
+        facts = [fact for call_id in call_ids for fact in self._facts.get(call_id, [])]
+        return {"success": True, "data": {"facts": facts}}
+
+
+class LegacyLearningService(LlmExtractingLearningService):
+    """Page writes as before the similarity index: merge by exact name only."""
+
+    async def _persist_fact(self, fact: dict[str, Any], session_id: str) -> str | None:
+        kind = str(fact.get("kind", "")).strip().lower()
+        slug = str(fact.get("slug", "")).strip()
+        name = f"{kind}/{slug}"
+        body = str(fact.get("body", "")).strip()
+        if await self._wiki.get_page(name) is not None:
+            await self._wiki.update_section(name, "Aktualisierung", f"- {body}", "append")
+            return name
+        page = WikiPage(name=name, title=str(fact.get("title", "")), body=body)
+        await self._wiki.write_page(page)
+        return name
+
+
+async def replay(
+    rows: list[dict[str, Any]],
+    wiki_dir: Path,
+    *,
+    pipeline: str,
+    llm_seconds: float = 0.0,
+    batch_size: int = 4,
+) -> dict[str, Any]:
+    """Feed every mission through one pipeline and measure the outcome.
+
+    ``pipeline`` is ``"inline"`` (the previous behaviour: one awaited
+    extraction per mission, pages merged only under the same name) or
+    ``"queued"`` (``LearningQueue`` with novelty filter, batching and
+    similarity merging).
+    """
+    store = FileWikiStore(wiki_dir)
+    llm = ScriptedExtractionLLM(rows, latency_seconds=llm_seconds)
+    hot_path: list[float] = []
+    if pipeline == "inline":
+        service = LegacyLearningService(store, llm)
+        for index, row in enumerate(rows):
+            started = time.perf_counter()
+            await service.learn_from_mission(row["mission"], row["messages"], f"s{index:03d}")
+            hot_path.append(time.perf_counter() - started)
+    else:
+        queue = LearningQueue(
+            LlmExtractingLearningService(store, llm),
+            batch_size=batch_size,
+            max_wait_seconds=3600,
+        )
+        for index, row in enumerate(rows):
+            started = time.perf_counter()
+            queue.submit(row["mission"], row["messages"], f"s{index:03d}")
+            hot_path.append(time.perf_counter() - started)
+            await asyncio.sleep(0)
+        await queue.drain()
+
+    pages = await store.list_pages()
+    return {
+        "missions": len(rows),
+        "llm_calls": llm.calls,
+        "llm_calls_per_mission": round(llm.calls / len(rows), 3),
+        "pages": len(pages),
+        "pages_per_100_missions": round(len(pages) * 100 / len(rows), 1),
+        "wiki_chars": sum(len(p.body) for p in pages),
+        "hot_path_ms_mean": round(sum(hot_path) / len(hot_path) * 1000, 2),
+    }
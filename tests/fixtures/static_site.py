@@ -0,0 +1,85 @@
+"""Local static HTML site for browser tests and benchmarks.
+
+Writes a few small pages into a directory and serves it over HTTP on
+127.0.0.1 from a background thread:
+
+* ``/index.html`` — a short article with a form and a few links
+* ``/login.html?user=<name>`` — stores ``user`` in a cookie and in
+  ``localStorage``, like a login page would
+* ``/whoami.html`` — shows the cookie and ``localStorage`` values it sees
+
+Usage::
+
+    with serve_static_site(tmp_path) as base_url:
+        ...  # navigate to f"{base_url}/index.html"
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import threading
+from collections.abc import Iterator
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+PAGES = {
+    "index.html": """<!doctype html>
+<html><head><title>Fixture index</title></head>
+<body>
+<h1>Fixture index</h1>
+<p>A static page served from a temporary directory.</p>
+<form id="search"><input name="q" id="q"><button type="submit">Search</button></form>
+<ul>
+  <li><a href="login.html?user=alice">login alice</a></li>
+  <li><a href="whoami.html">who am i</a></li>
+</ul>
+</body></html>
+""",
+    "login.html": """<!doctype html>
+<html><head><title>Login</title></head>
+<body>
+<p id="status">logging in</p>
+<script>
+  const user = new URLSearchParams(location.search).get("user") || "";
+  document.cookie = "user=" + user + "; path=/; max-age=3600";
+  localStorage.setItem("user", user);
+  document.getElementById("status").textContent = "logged in as " + user;
+</script>
+</body></html>
+""",
+    "whoami.html": """<!doctype html>
+<html><head><title>Who am I</title></head>
+<body>
+<p id="cookie"></p>
+<p id="storage"></p>
+<script>
+  const match = document.cookie.match(/(?:^|; )user=([^;]*)/);
+  document.getElementById("cookie").textContent = match ? match[1] : "";
+  document.getElementById("storage").textContent = localStorage.getItem("user") || "";
+</script>
+</body></html>
+""",
+}
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+@contextlib.contextmanager
+def serve_static_site(root: Path) -> Iterator[str]:
+    """Write the fixture pages under ``root`` and yield the site's base URL."""
+    root.mkdir(parents=True, exist_ok=True)
+    for name, html in PAGES.items():
+        (root / name).write_text(html, encoding="utf-8")
+    handler = functools.partial(_QuietHandler, directory=str(root))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,126 @@
+"""Labelled topic-shift cases for evaluating ``TopicDetector``.
+
+Each case is one incoming gateway message with the active topic label,
+the recent conversation turns and the gold answer (``changed``). The set
+mixes clear continuations, acknowledgements, short follow-ups, explicit
+switches and silent subject changes in English and German, roughly in
+the proportions seen on busy chat channels (most messages continue the
+current topic).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True)
+class TopicShiftCase:
+    current_label: str
+    message: str
+    changed: bool
+    recent: list[dict[str, Any]] = field(default_factory=list)
+
+
+def _turns(*pairs: str) -> list[dict[str, Any]]:
+    roles = ("user", "assistant")
+    return [{"role": roles[i % 2], "content": text} for i, text in enumerate(pairs)]
+
+
+_TRIP = _turns(
+    "I want to plan a weekend trip to Vienna in March",
+    "Great idea. Vienna in March is mild; museums, coffee houses and the "
+    "Naschmarkt are good picks. Do you need train or flight connections?",
+    "Train from Munich please, and a hotel near the city centre",
+    "The Railjet from Munich to Vienna takes about four hours. Hotels near "
+    "Stephansplatz start around 120 EUR per night.",
+)
+_BUDGET = _turns(
+    "Can you check the marketing budget for Q3?",
+    "The Q3 marketing budget is 48,000 EUR; 31,000 EUR is already committed "
+    "to campaigns and agency fees.",
+    "What is left for the trade fair booth?",
+    "About 17,000 EUR remains uncommitted, enough for the trade fair booth "
+    "if the agency fees stay as planned.",
+)
+_BUG = _turns(
+    "The login page throws a 500 error since this morning's deploy",
+    "The server log shows a KeyError in the session middleware after the "
+    "deploy: the config key SESSION_SECRET is missing.",
+    "Which deploy introduced the session config change?",
+    "Release 2.14 renamed the session secret setting in the deploy config.",
+)
+_GARDEN = _turns(
+    "When should I plant tomatoes on my balcony?",
+    "Plant tomatoes after the last frost, usually mid May. Use deep pots, "
+    "sunny spots and water the plants regularly.",
+    "Which tomato varieties grow well in pots?",
+    "Cherry tomatoes and bush varieties like Balkonstar grow well in pots.",
+)
+_REZEPT = _turns(
+    "Ich suche ein Rezept für Kürbissuppe",
+    "Für Kürbissuppe brauchst du Hokkaido Kürbis, Zwiebeln, Ingwer, "
+    "Gemüsebrühe und Kokosmilch. Kochzeit etwa 30 Minuten.",
+    "Kann ich statt Kokosmilch auch Sahne nehmen?",
+    "Ja, Sahne funktioniert, die Suppe wird dann milder und weniger exotisch.",
+)
+
+TOPIC_SHIFT_CASES: tuple[TopicShiftCase, ...] = (
+    # --- continuations with strong lexical overlap ---
+    TopicShiftCase("Weekend trip to Vienna", "Which hotel near Stephansplatz has the best "
+                   "reviews for a weekend in Vienna?", False, _TRIP),
+    TopicShiftCase("Weekend trip to Vienna", "Book the Railjet train from Munich to Vienna "
+                   "on Friday morning", False, _TRIP),
+    TopicShiftCase("Weekend trip to Vienna", "Are the Vienna museums open on Sunday in "
+                   "March?", False, _TRIP),
+    TopicShiftCase("Q3 marketing budget", "Move 5,000 EUR of the Q3 marketing budget from "
+                   "agency fees to the trade fair booth", False, _BUDGET),
+    TopicShiftCase("Q3 marketing budget", "How much of the committed campaign budget is "
+                   "already spent?", False, _BUDGET),
+    TopicShiftCase("Login 500 error after deploy", "Roll back the session middleware "
+                   "config to release 2.13 to fix the login error", False, _BUG),
+    TopicShiftCase("Login 500 error after deploy", "Add SESSION_SECRET to the deploy "
+                   "config and redeploy", False, _BUG),
+    TopicShiftCase("Tomatoes on the balcony", "How often should I water cherry tomatoes "
+                   "in pots?", False, _GARDEN),
+    TopicShiftCase("Tomatoes on the balcony", "Do tomato plants in pots need fertiliser "
+                   "in May?", False, _GARDEN),
+    TopicShiftCase("Kürbissuppe Rezept", "Wie lange muss der Hokkaido Kürbis für die "
+                   "Suppe kochen?", False, _REZEPT),
+    TopicShiftCase("Kürbissuppe Rezept", "Passt Ingwer auch zur Kürbissuppe mit Sahne?",
+                   False, _REZEPT),
+    # --- acknowledgements (no content terms) ---
+    TopicShiftCase("Weekend trip to Vienna", "ok thanks!", False, _TRIP),
+    TopicShiftCase("Q3 marketing budget", "yes please", False, _BUDGET),
+    TopicShiftCase("Kürbissuppe Rezept", "Danke, super!", False, _REZEPT),
+    TopicShiftCase("Login 500 error after deploy", "ok, do it", False, _BUG),
+    # --- short follow-ups with little overlap (ambiguous for the first pass) ---
+    TopicShiftCase("Weekend trip to Vienna", "And what about Saturday evening?", False, _TRIP),
+    TopicShiftCase("Q3 marketing budget", "Is that enough?", False, _BUDGET),
+    TopicShiftCase("Login 500 error after deploy", "Who approved it?", False, _BUG),
+    TopicShiftCase("Tomatoes on the balcony", "What about basil?", False, _GARDEN),
+    # --- explicit switches ---
+    TopicShiftCase("Weekend trip to Vienna", "Let's talk about the Q3 marketing budget "
+                   "now", True, _TRIP),
+    TopicShiftCase("Q3 marketing budget", "New topic: my tomatoes on the balcony look "
+                   "yellow", True, _BUDGET),
+    TopicShiftCase("Kürbissuppe Rezept", "Anderes Thema: wann fährt morgen der Zug nach "
+                   "Salzburg?", True, _REZEPT),
+    # --- silent subject changes ---
+    TopicShiftCase("Weekend trip to Vienna", "The login page throws a 500 error since "
+                   "this morning's deploy", True, _TRIP),
+    TopicShiftCase("Q3 marketing budget", "Remind me to call the dentist tomorrow "
+                   "afternoon about my appointment", True, _BUDGET),
+    TopicShiftCase("Login 500 error after deploy", "Suggest a good recipe for pumpkin "
+                   "soup with ginger", True, _BUG),
+    TopicShiftCase("Tomatoes on the balcony", "Summarise the quarterly sales report "
+                   "for the board meeting", True, _GARDEN),
+    TopicShiftCase("Kürbissuppe Rezept", "Erstelle eine Rechnung für Kunde Meier über "
+                   "drei Beratungsstunden", True, _REZEPT),
+    TopicShiftCase("Weekend trip to Vienna", "Draft an email to the landlord about the "
+                   "broken heating radiator", True, _TRIP),
+    TopicShiftCase("Tomatoes on the balcony", "Which laptop should I buy for video "
+                   "editing under 1500 EUR?", True, _GARDEN),
+    TopicShiftCase("Q3 marketing budget", "Translate this contract clause into "
+                   "German for the lawyer", True, _BUDGET),
+)
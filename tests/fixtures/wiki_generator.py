@@ -0,0 +1,51 @@
+"""Generate large wikis on disk for link-graph tests and benchmarks.
+
+Pages are written straight to files in the ``FileWikiStore`` format
+(YAML frontmatter + markdown body), as a user's editor or a sync tool
+would, so no index or link graph exists yet. Each page links to a few
+others; roughly 2% of links point at pages that do not exist and about
+one page in 50 is linked by nobody. Titles repeat every 997 pages to
+give lint some duplicates.
+
+Usage::
+
+    names = generate_wiki(tmp_path / "wiki", pages=50_000)
+"""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+KINDS = ("entities", "concepts", "preferences")
+
+
+def page_name(index: int) -> str:
+    return f"{KINDS[index % len(KINDS)]}/page-{index:06d}"
+
+
+def generate_wiki(root: Path, pages: int, *, links_per_page: int = 4, seed: int = 11) -> list[str]:
+    """Write ``pages`` pages under ``root`` and return their names."""
+    rng = random.Random(seed)
+    names = [page_name(index) for index in range(pages)]
+    linkable = [name for index, name in enumerate(names) if index % 50 != 7]
+    for kind in KINDS:
+        (root / kind).mkdir(parents=True, exist_ok=True)
+    for index, name in enumerate(names):
+        links = []
+        for _ in range(links_per_page):
+            if rng.random() < 0.02:
+                links.append(f"concepts/missing-{rng.randrange(pages)}")
+            else:
+                links.append(rng.choice(linkable))
+        body = (
+            f"Notes on topic {index}: recurring details the butler looked up.\n\n"
+            "## Links\n\n" + "\n".join(f"- see [[{link}]]" for link in links) + "\n"
+        )
+        (root / f"{name}.md").write_text(
+            f"---\ntitle: Topic {index % 997}\ntags: []\n"
+            "created_at: '2026-01-01T00:00:00+00:00'\n"
+            "updated_at: '2026-01-01T00:00:00+00:00'\n---\n\n" + body,
+            encoding="utf-8",
+        )
+    return names
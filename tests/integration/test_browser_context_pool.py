@@ -0,0 +1,90 @@
+"""BrowserTool with a real Chromium against a local static site.
+
+Skipped unless the Chromium binary is installed
+(``playwright install chromium``). The loopback site is exempt from the
+SSRF guard for these tests only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import taskforce.infrastructure.tools.native.browser_tool as browser_module
+from taskforce.application.token_ledger import run_context
+from taskforce.infrastructure.tools.native.browser_tool import BrowserTool
+from tests.fixtures.static_site import serve_static_site
+
+
+def _chromium_installed() -> bool:
+    try:
+        from playwright.sync_api import sync_playwright
+
+        with sync_playwright() as playwright:
+            return Path(playwright.chromium.executable_path).exists()
+    except Exception:  # noqa: BLE001 — any failure means "not available"
+        return False
+
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(not _chromium_installed(), reason="Chromium not installed"),
+]
+
+
+@pytest.fixture
+def site(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(browser_module, "validate_url_for_ssrf", lambda url: (True, None))
+    with serve_static_site(tmp_path / "site") as base_url:
+        yield base_url
+
+
+@pytest.fixture
+async def tool():
+    browser_module._pool = None
+    tool = BrowserTool(max_contexts=4)
+    yield tool
+    pool = browser_module._pool
+    if pool is not None:
+        await browser_module._PlaywrightWorker.get().submit(pool.close_all)
+    browser_module._pool = None
+
+
+async def _as(session_id: str, tool: BrowserTool, **kwargs: Any) -> dict[str, Any]:
+    with run_context(session_id=session_id):
+        return await tool.execute(**kwargs)
+
+
+async def test_sessions_keep_separate_cookies_and_storage(site: str, tool: BrowserTool) -> None:
+    await asyncio.gather(
+        _as("alice", tool, action="navigate", url=f"{site}/login.html?user=alice"),
+        _as("bob", tool, action="navigate", url=f"{site}/login.html?user=bob"),
+    )
+    alice, bob = await asyncio.gather(
+        _as("alice", tool, action="navigate", url=f"{site}/whoami.html"),
+        _as("bob", tool, action="navigate", url=f"{site}/whoami.html"),
+    )
+    assert alice["success"] and bob["success"]
+
+    seen = {
+        user: (
+            await _as(user, tool, action="get_text", selector="#cookie"),
+            await _as(user, tool, action="get_text", selector="#storage"),
+        )
+        for user in ("alice", "bob")
+    }
+    assert seen["alice"][0]["text"] == "alice" and seen["alice"][1]["text"] == "alice"
+    assert seen["bob"][0]["text"] == "bob" and seen["bob"][1]["text"] == "bob"
+
+
+async def test_closed_session_gets_its_cookies_back(site: str, tool: BrowserTool) -> None:
+    await _as("carol", tool, action="navigate", url=f"{site}/login.html?user=carol")
+    await _as("carol", tool, action="close")
+
+    await _as("carol", tool, action="navigate", url=f"{site}/whoami.html")
+    result = await _as("carol", tool, action="get_text", selector="#cookie")
+
+    assert result["text"] == "carol"
@@ -0,0 +1,173 @@
+"""Tests for lazy Typer sub-app registration and the CLI import-time budget."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import types
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from taskforce.api.cli.lazy_group import LazySubcommand, lazy_group
+
+runner = CliRunner()
+
+_MODULE = "lazy_group_test_commands"
+
+
+@pytest.fixture
+def lazy_module(monkeypatch):
+    """Register a fake command module and record whether it was imported."""
+    imported: list[str] = []
+
+    sub = typer.Typer()
+
+    @sub.command("hello")
+    def hello(name: str = "world") -> None:
+        typer.echo(f"hello {name}")
+
+    class _Module(types.ModuleType):
+        def __getattr__(self, attr: str):
+            if attr == "app":
+                imported.append(attr)
+                return sub
+            raise AttributeError(attr)
+
+    monkeypatch.setitem(sys.modules, _MODULE, _Module(_MODULE))
+    return imported
+
+
+def _app() -> typer.Typer:
+    app = typer.Typer(
+        no_args_is_help=True,
+        cls=lazy_group(
+            {
+                "greet": LazySubcommand(f"{_MODULE}:app", "Say hello"),
+                "broken": LazySubcommand("no_such_module_xyz:app", "Never loads"),
+            }
+        ),
+    )
+
+    @app.callback()
+    def main() -> None:
+        """Test CLI."""
+
+    @app.command()
+    def version() -> None:
+        typer.echo("v1")
+
+    return app
+
+
+@pytest.mark.spec("cli.subcommands_imported_only_when_invoked")
+def test_help_lists_lazy_subcommands_without_importing(lazy_module):
+    result = runner.invoke(_app(), ["--help"], env={"COLUMNS": "200"})
+
+    assert result.exit_code == 0, result.output
+    assert "greet" in result.output and "Say hello" in result.output
+    assert "broken" in result.output
+    assert lazy_module == []
+
+
+def test_invoking_lazy_subcommand_imports_and_runs_it(lazy_module):
+    app = _app()
+
+    assert runner.invoke(app, ["version"]).output.strip() == "v1"
+    assert lazy_module == []
+
+    result = runner.invoke(app, ["greet", "hello", "--name", "tf"])
+    assert result.exit_code == 0, result.output
+    assert result.output.strip() == "hello tf"
+    assert lazy_module == ["app"]
+
+
+def _error_text(result) -> str:
+    """Usage-error text wherever this click/typer version puts it.
+
+    Depending on the versions the message lands in ``output``, in
+    ``stderr`` or stays on the raised exception.
+    """
+    try:
+        stderr = result.stderr
+    except ValueError:  # older click mixes stderr into output
+        stderr = ""
+    return "\n".join((result.output, stderr, str(result.exception or "")))
+
+
+def test_unloadable_subcommand_fails_with_clear_error():
+    result = runner.invoke(_app(), ["broken"])
+
+    assert result.exit_code != 0
+    assert "no_such_module_xyz:app" in _error_text(result)
+
+
+def test_typo_suggestion_includes_lazy_subcommands():
+    result = runner.invoke(_app(), ["gret"])
+
+    assert result.exit_code != 0
+    assert "Did you mean 'greet'" in _error_text(result)
+
+
+# ---------------------------------------------------------------------------
+# Import-time budget (python -X importtime)
+# ---------------------------------------------------------------------------
+
+# Modules that must never be imported just to print help or the version.
+_FORBIDDEN_AT_STARTUP = (
+    "litellm",
+    "fastapi",
+    "tiktoken",
+    "playwright",
+    "aiohttp",
+    "prompt_toolkit",
+    "taskforce.application.factory",
+)
+
+# Generous wall-clock budget for the summed import time (microseconds);
+# the forbidden-module check is the precise regression signal. Override
+# on slow CI runners via TASKFORCE_CLI_IMPORT_BUDGET_MS.
+_IMPORT_BUDGET_US = int(os.environ.get("TASKFORCE_CLI_IMPORT_BUDGET_MS", "1500")) * 1000
+
+
+def _importtime(argv: list[str]) -> dict[str, int]:
+    """Run the unified CLI under ``-X importtime``; return ``{module: self_us}``."""
+    code = (
+        "import sys; sys.argv = ['taskforce', *sys.argv[1:]]\n"
+        "from taskforce_cli.main import app\n"
+        "app()\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code, *argv],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        env={**os.environ, "COLUMNS": "120"},
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    modules: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:") :].split("|")
+        modules[name.strip()] = int(self_us)
+    return modules
+
+
+@pytest.mark.spec("cli.help_and_version_stay_within_import_budget")
+@pytest.mark.parametrize("argv", [["--help"], ["version"]])
+def test_cli_startup_import_budget(argv):
+    pytest.importorskip("taskforce_cli")
+
+    modules = _importtime(argv)
+
+    loaded = sorted(
+        name
+        for name in modules
+        for heavy in _FORBIDDEN_AT_STARTUP
+        if name == heavy or name.startswith(heavy + ".")
+    )
+    assert loaded == [], f"taskforce {' '.join(argv)} imported heavy modules: {loaded}"
+    assert sum(modules.values()) < _IMPORT_BUDGET_US
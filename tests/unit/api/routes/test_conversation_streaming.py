@@ -31,7 +31,7 @@ class _RecordingConversationManager:
     """Plain async manager double — avoids AsyncMock side-effect quirks."""
 
     # Conversation ids the streaming tests operate on; the stream route's
-    # ownership guard (#279) resolves the path id against list_active().
+    # ownership guard (#279) resolves the path id via get_info().
     _KNOWN_IDS = ("conv-1", "conv-2", "conv-3", "conv-keepalive")
 
     def __init__(self) -> None:
@@ -62,6 +62,10 @@ class _RecordingConversationManager:
     async def list_archived(self, limit: int = 20) -> list[Any]:
         return []
 
+    async def get_info(self, conversation_id: str) -> Any:
+        active = await self.list_active()
+        return next((c for c in active if c.conversation_id == conversation_id), None)
+
 
 class _StreamingExecutor:
     """Plain executor double exposing an async-iterating mission stream."""
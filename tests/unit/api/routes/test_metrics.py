@@ -0,0 +1,71 @@
+"""Unit tests for the Prometheus ``/metrics`` route and hot-path instrumentation."""
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient
+
+from taskforce.api.server import create_app
+from taskforce.application.request_queue import RequestQueue
+from taskforce.application.run_registry import RunRegistry
+from taskforce.core.domain.lean_agent_components.tool_executor import ToolExecutor
+from taskforce.core.domain.request import AgentRequest
+from taskforce.core.utils.metrics import get_metrics_registry
+
+
+@pytest.fixture(autouse=True)
+def _fresh_metrics():
+    get_metrics_registry().reset()
+    yield
+    get_metrics_registry().reset()
+
+
+class _Logger:
+    def __getattr__(self, _name):
+        return lambda *args, **kwargs: None
+
+
+class _EchoTool:
+    async def execute(self, **kwargs):
+        return {"success": kwargs.get("ok", True)}
+
+
+@pytest.mark.spec("observability.metrics_route_serves_prometheus_text")
+def test_metrics_route_serves_text_exposition():
+    client = TestClient(create_app())
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE taskforce_tool_duration_seconds histogram" in response.text
+    assert "# TYPE taskforce_request_queue_depth gauge" in response.text
+
+
+async def test_tool_executor_records_latency_by_outcome():
+    executor = ToolExecutor(tools={"echo": _EchoTool()}, logger=_Logger())
+    await executor.execute("echo", {})
+    await executor.execute("echo", {"ok": False})
+
+    text = get_metrics_registry().render()
+    assert 'taskforce_tool_duration_seconds_count{tool="echo",outcome="success"} 1' in text
+    assert 'taskforce_tool_duration_seconds_count{tool="echo",outcome="failure"} 1' in text
+
+
+async def test_request_queue_and_run_registry_gauges():
+    queue = RequestQueue()
+    await queue.enqueue(AgentRequest(channel="rest", message="a"))
+    await queue.enqueue(AgentRequest(channel="rest", message="b"))
+    assert "taskforce_request_queue_depth 2" in get_metrics_registry().render()
+    await queue.dequeue()
+    text = get_metrics_registry().render()
+    assert "taskforce_request_queue_depth 1" in text
+    assert "taskforce_request_queue_wait_seconds_count 1" in text
+
+    runs = RunRegistry()
+    runs.register("s1")
+    runs.register("s2")
+    runs.unregister("s1")
+    text = get_metrics_registry().render()
+    assert "taskforce_active_runs 1" in text
+    assert "taskforce_run_duration_seconds_count 1" in text
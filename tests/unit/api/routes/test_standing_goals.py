@@ -83,6 +83,20 @@ def test_patch_partial_update(app: FastAPI) -> None:
     assert body["description"] == "x"  # untouched
 
 
+def test_inputs_round_trip_through_create_and_patch(app: FastAPI) -> None:
+    client = TestClient(app)
+    inputs = [{"type": "file", "path": "reports/*.csv"}]
+    create = client.post(
+        "/api/v1/standing-goals",
+        json={"description": "x", "evaluation_prompt": "y", "frequency": "0 * * * *", "inputs": inputs},
+    )
+    assert create.json()["inputs"] == inputs
+    goal_id = create.json()["goal_id"]
+
+    response = client.patch(f"/api/v1/standing-goals/{goal_id}", json={"inputs": []})
+    assert response.json()["inputs"] == []
+
+
 @pytest.mark.spec("standing-goals.rest_crud_roundtrip")
 def test_delete_returns_204_then_404(app: FastAPI) -> None:
     client = TestClient(app)
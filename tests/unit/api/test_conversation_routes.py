@@ -9,7 +9,63 @@ import pytest
 from fastapi.testclient import TestClient
 
 from taskforce.api.routes.conversations import router
-from taskforce.core.interfaces.conversation import ConversationInfo, ConversationSummary
+from taskforce.core.interfaces.conversation import (
+    ConversationInfo,
+    ConversationPage,
+    ConversationSummary,
+)
+from taskforce.core.utils.pagination import page_descending
+
+
+def _derive_lookups(mgr: AsyncMock) -> None:
+    """Answer ``get_info`` and the paged listings from the list mocks.
+
+    Tests keep configuring ``list_active`` / ``list_archived``; the
+    routes' id lookups and pages are computed from whatever those return
+    at call time.
+    """
+
+    async def get_info(conversation_id: str) -> ConversationInfo | None:
+        for info in await mgr.list_active():
+            if info.conversation_id == conversation_id:
+                return info
+        for summary in await mgr.list_archived():
+            if summary.conversation_id == conversation_id:
+                return ConversationInfo(
+                    conversation_id=summary.conversation_id,
+                    channel="rest",
+                    started_at=summary.started_at,
+                    last_activity=summary.archived_at,
+                    message_count=summary.message_count,
+                    topic=summary.topic,
+                    project_id=summary.project_id,
+                    archived_at=summary.archived_at,
+                )
+        return None
+
+    def page(items, sort_field, *, limit, cursor, project_id) -> ConversationPage:
+        ordered = sorted(items, key=lambda c: (getattr(c, sort_field), c.conversation_id))
+        keys = [(getattr(c, sort_field).isoformat(), c.conversation_id) for c in ordered]
+        rows, next_cursor = page_descending(
+            ordered,
+            keys,
+            limit=limit,
+            cursor=cursor,
+            predicate=None if project_id is None else lambda c: c.project_id == project_id,
+        )
+        return ConversationPage(rows, next_cursor)
+
+    async def list_active_page(*, limit=None, cursor=None, project_id=None):
+        items = await mgr.list_active()
+        return page(items, "last_activity", limit=limit, cursor=cursor, project_id=project_id)
+
+    async def list_archived_page(*, limit=20, cursor=None, project_id=None):
+        items = await mgr.list_archived()
+        return page(items, "archived_at", limit=limit, cursor=cursor, project_id=project_id)
+
+    mgr.get_info = AsyncMock(side_effect=get_info)
+    mgr.list_active_page = AsyncMock(side_effect=list_active_page)
+    mgr.list_archived_page = AsyncMock(side_effect=list_archived_page)
 
 
 @pytest.fixture
@@ -34,6 +90,7 @@ def mock_conversation_manager():
     mgr.append_message = AsyncMock()
     mgr.archive = AsyncMock()
     mgr.delete = AsyncMock(return_value=True)
+    _derive_lookups(mgr)
     return mgr
 
 
@@ -192,6 +249,50 @@ class TestListConversations:
         assert data[0]["project_id"] == "proj-1"
 
 
+class TestListPagination:
+    @staticmethod
+    def _archived(n: int) -> list[ConversationSummary]:
+        return [
+            ConversationSummary(
+                conversation_id=f"arch-{i}",
+                topic=f"t{i}",
+                summary="",
+                started_at=datetime(2026, 3, 1, tzinfo=UTC),
+                archived_at=datetime(2026, 3, 1 + i, tzinfo=UTC),
+                message_count=1,
+            )
+            for i in range(n)
+        ]
+
+    @pytest.mark.spec("conversations.list_paginated_by_cursor")
+    def test_archived_next_cursor_header_walks_all_pages(self, client, mock_conversation_manager):
+        mock_conversation_manager.list_archived = AsyncMock(return_value=self._archived(5))
+
+        first = client.get("/api/v1/conversations/archived?limit=2")
+        second = client.get(
+            "/api/v1/conversations/archived",
+            params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]},
+        )
+        last = client.get(
+            "/api/v1/conversations/archived",
+            params={"limit": 2, "cursor": second.headers["X-Next-Cursor"]},
+        )
+
+        ids = [c["conversation_id"] for r in (first, second, last) for c in r.json()]
+        assert ids == ["arch-4", "arch-3", "arch-2", "arch-1", "arch-0"]
+        assert "X-Next-Cursor" not in last.headers
+
+    def test_active_without_limit_returns_everything(self, client):
+        resp = client.get("/api/v1/conversations")
+        assert len(resp.json()) == 1
+        assert "X-Next-Cursor" not in resp.headers
+
+    def test_malformed_cursor_returns_400(self, client):
+        resp = client.get("/api/v1/conversations/archived?cursor=not-a-cursor")
+        assert resp.status_code == 400
+        assert resp.json()["detail"]["code"] == "invalid_cursor"
+
+
 class TestAppendMessage:
     def test_sends_message_and_gets_reply(self, client, mock_conversation_manager, mock_executor):
         # After append, get_messages should return updated messages.
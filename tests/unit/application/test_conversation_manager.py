@@ -6,7 +6,7 @@ from unittest.mock import AsyncMock
 import pytest
 
 from taskforce.application.conversation_manager import ConversationManager
-from taskforce.core.interfaces.conversation import ConversationInfo
+from taskforce.core.interfaces.conversation import ConversationInfo, ConversationPage
 
 
 class TestConversationManager:
@@ -46,6 +46,16 @@ class TestConversationManager:
         await manager.append_message("conv-123", msg)
         mock_store.append_message.assert_called_once_with("conv-123", msg)
 
+    async def test_lookup_and_pages_delegate(self, manager, mock_store):
+        mock_store.get_info = AsyncMock(return_value=None)
+        mock_store.list_archived_page = AsyncMock(return_value=ConversationPage())
+
+        assert await manager.get_info("conv-9") is None
+        await manager.list_archived_page(limit=5, cursor="c", project_id="p")
+
+        mock_store.get_info.assert_awaited_once_with("conv-9")
+        mock_store.list_archived_page.assert_awaited_once_with(limit=5, cursor="c", project_id="p")
+
     @pytest.mark.spec("conversations.auto_archive_stale_on_get_or_create")
     async def test_auto_archive_stale_conversations(self, mock_store):
         stale_time = datetime.now(UTC) - timedelta(hours=25)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from taskforce.application.event_router import EventRouter
@@ -184,3 +185,73 @@ class TestEventRouterDispatch:
         # Should not raise.
         actions = await router.route(_event())
         assert len(actions) == 1
+
+
+class TestConcurrentDispatch:
+    async def test_slow_notify_does_not_block_execute(self) -> None:
+        engine = _StubRuleEngine()
+        release = asyncio.Event()
+        executed = asyncio.Event()
+
+        async def on_notify(*_args):
+            await release.wait()
+
+        async def on_execute(*_args):
+            executed.set()
+            release.set()
+
+        router = EventRouter(
+            rule_engine=engine, notify_callback=on_notify, execute_callback=on_execute
+        )
+        await engine.add_rule(_rule(params={"message": "slow"}))
+        await engine.add_rule(_rule(action_type=RuleActionType.EXECUTE_MISSION))
+
+        await asyncio.wait_for(router.route(_event()), timeout=2)
+        assert executed.is_set()
+
+    async def test_ordered_action_waits_for_earlier_and_blocks_later(self) -> None:
+        engine = _StubRuleEngine()
+        log: list[str] = []
+
+        async def on_notify(_channel, _recipient, message, _params):
+            log.append(f"start {message}")
+            await asyncio.sleep(0.01 if message == "a" else 0)
+            log.append(f"end {message}")
+
+        router = EventRouter(rule_engine=engine, notify_callback=on_notify)
+        await engine.add_rule(_rule(params={"message": "a"}))
+        await engine.add_rule(_rule(params={"message": "b"}))
+        ordered = _rule(params={"message": "c"})
+        ordered.action.ordered = True
+        await engine.add_rule(ordered)
+        await engine.add_rule(_rule(params={"message": "d"}))
+
+        await router.route(_event())
+
+        assert log.index("start c") > max(log.index("end a"), log.index("end b"))
+        assert log.index("start d") > log.index("end c")
+
+    async def test_per_action_type_limit(self) -> None:
+        engine = _StubRuleEngine()
+        in_flight = 0
+        peak = 0
+
+        async def on_notify(*_args):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        router = EventRouter(
+            rule_engine=engine,
+            notify_callback=on_notify,
+            action_concurrency={"notify": 2},
+        )
+        for index in range(6):
+            await engine.add_rule(_rule(params={"message": str(index)}))
+
+        await asyncio.gather(router.route(_event()), router.route(_event()))
+
+        assert peak == 2
+        assert router.action_count == 12
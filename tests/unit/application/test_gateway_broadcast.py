@@ -0,0 +1,259 @@
+"""Tests for concurrent, resumable CommunicationGateway.broadcast."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from taskforce.application.gateway import CommunicationGateway
+from taskforce.application.notification_fanout import ChannelLimits, NotificationFanout
+from taskforce.core.domain.gateway import BroadcastResults
+from taskforce.core.domain.models import ExecutionResult
+from taskforce.infrastructure.communication.broadcast_outbox import (
+    FileBroadcastOutbox,
+    InMemoryBroadcastOutbox,
+)
+from taskforce.infrastructure.communication.gateway_conversation_store import (
+    InMemoryGatewayConversationStore,
+)
+from taskforce.infrastructure.communication.recipient_registry import (
+    FileRecipientRegistry,
+    InMemoryRecipientRegistry,
+)
+
+
+class FakeExecutor:
+    async def execute_mission(self, **kwargs: Any) -> ExecutionResult:
+        return ExecutionResult(session_id=kwargs["session_id"], status="completed")
+
+
+class SlowSender:
+    """Records sends and tracks how many were in flight at once."""
+
+    def __init__(self, delay: float = 0.01, fail_for: set[str] | None = None) -> None:
+        self.delay = delay
+        self.fail_for = fail_for or set()
+        self.sent: list[str] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    @property
+    def channel(self) -> str:
+        return "telegram"
+
+    async def send(
+        self, *, recipient_id: str, message: str, metadata: dict[str, Any] | None = None
+    ) -> None:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if recipient_id in self.fail_for:
+                raise ConnectionError("blocked by user")
+            self.sent.append(recipient_id)
+        finally:
+            self.in_flight -= 1
+
+
+class NoBulkRegistry:
+    """Registry predating ``resolve_many`` — exercises the fallback path."""
+
+    def __init__(self, inner: InMemoryRecipientRegistry) -> None:
+        self._inner = inner
+        self.resolve_calls = 0
+
+    async def resolve(self, *, channel: str, user_id: str) -> dict[str, Any] | None:
+        self.resolve_calls += 1
+        return await self._inner.resolve(channel=channel, user_id=user_id)
+
+    async def list_recipients(self, channel: str) -> list[str]:
+        return await self._inner.list_recipients(channel)
+
+
+def _gateway(registry, sender, *, outbox=None, concurrency: int = 8) -> CommunicationGateway:
+    return CommunicationGateway(
+        executor=FakeExecutor(),
+        conversation_store=InMemoryGatewayConversationStore(),
+        recipient_registry=registry,
+        outbound_senders={"telegram": sender},
+        notification_fanout=NotificationFanout(
+            {"telegram": ChannelLimits(concurrency=concurrency)}
+        ),
+        broadcast_outbox=outbox,
+    )
+
+
+async def _register(registry, count: int, **extra: Any) -> None:
+    for i in range(count):
+        await registry.register(
+            channel="telegram",
+            user_id=f"u{i:02d}",
+            reference={"conversation_id": f"c{i:02d}", **extra},
+        )
+
+
+@pytest.mark.spec("gateway.broadcast_concurrency_bounded_per_channel")
+async def test_broadcast_runs_concurrently_within_limit() -> None:
+    registry = InMemoryRecipientRegistry()
+    await _register(registry, 20)
+    sender = SlowSender()
+    gateway = _gateway(registry, sender, concurrency=5)
+
+    results = await gateway.broadcast(channel="telegram", message="hi")
+
+    assert isinstance(results, BroadcastResults)
+    assert [r.recipient_id for r in results] == [f"u{i:02d}" for i in range(20)]
+    assert sorted(sender.sent) == [f"c{i:02d}" for i in range(20)]
+    assert sender.peak == 5
+    assert results.stats.total == 20
+    assert results.stats.sent == 20
+    assert results.stats.throughput_per_s > 0
+
+
+async def test_broadcast_reports_failures_in_stats() -> None:
+    registry = InMemoryRecipientRegistry()
+    await _register(registry, 4)
+    gateway = _gateway(registry, SlowSender(fail_for={"c01", "c03"}))
+
+    results = await gateway.broadcast(channel="telegram", message="hi")
+
+    assert [r.success for r in results] == [True, False, True, False]
+    assert results.stats.failed == 2
+    assert "blocked by user" in (results[1].error or "")
+
+
+async def test_broadcast_falls_back_without_bulk_resolve() -> None:
+    inner = InMemoryRecipientRegistry()
+    await inner.register(
+        channel="telegram", user_id="a", reference={"conversation_id": "1", "tenant_id": "t1"}
+    )
+    await inner.register(
+        channel="telegram", user_id="b", reference={"conversation_id": "2", "tenant_id": "t2"}
+    )
+    registry = NoBulkRegistry(inner)
+    sender = SlowSender(delay=0)
+
+    results = await _gateway(registry, sender).broadcast(
+        channel="telegram", message="hi", tenant_id="t1"
+    )
+
+    assert [r.recipient_id for r in results] == ["a"]
+    assert results[0].tenant_id == "t1"
+    assert sender.sent == ["1"]
+    assert registry.resolve_calls == 2
+
+
+@pytest.mark.spec("gateway.broadcast_resumes_from_outbox")
+async def test_interrupted_broadcast_resumes_without_resending() -> None:
+    registry = InMemoryRecipientRegistry()
+    await _register(registry, 3)
+    outbox = InMemoryBroadcastOutbox()
+    # Simulate a crash after u00 was delivered and u01 failed.
+    await outbox.open(
+        broadcast_id="b1", channel="telegram", message="hi", metadata={}, tenant_id=None
+    )
+    await outbox.record(broadcast_id="b1", recipient_id="u00", success=True, error=None)
+    await outbox.record(broadcast_id="b1", recipient_id="u01", success=False, error="boom")
+    sender = SlowSender(delay=0)
+    gateway = _gateway(registry, sender, outbox=outbox)
+
+    [results] = await gateway.resume_broadcasts()
+
+    # u00 was delivered; the failed u01 is retried along with u02.
+    assert sorted(sender.sent) == ["c01", "c02"]
+    assert [r.success for r in results] == [True, True, True]
+    assert results.stats.resumed == 1
+    assert await outbox.pending() == []
+
+
+async def test_unresolvable_recipient_gets_failed_result() -> None:
+    registry = InMemoryRecipientRegistry()
+    await _register(registry, 2)
+    await registry.register(channel="telegram", user_id="ghost", reference={})
+    sender = SlowSender(delay=0)
+
+    results = await _gateway(registry, sender).broadcast(channel="telegram", message="hi")
+
+    assert [r.recipient_id for r in results] == ["u00", "u01", "ghost"]
+    assert [r.success for r in results] == [True, True, False]
+    assert "not registered" in (results[2].error or "")
+    assert results.stats.failed == 1
+    assert sorted(sender.sent) == ["c00", "c01"]
+
+
+class ExtraReferenceRegistry(InMemoryRecipientRegistry):
+    """``resolve_many`` also returns a reference ``list_recipients`` omits."""
+
+    async def resolve_many(self, *, channel: str) -> dict[str, dict[str, Any]]:
+        references = await super().resolve_many(channel=channel)
+        return {**references, "unlisted": {"conversation_id": "c-unlisted"}}
+
+
+async def test_broadcast_sends_only_to_listed_recipients() -> None:
+    registry = ExtraReferenceRegistry()
+    await _register(registry, 2)
+    sender = SlowSender(delay=0)
+
+    results = await _gateway(registry, sender).broadcast(channel="telegram", message="hi")
+
+    assert [r.recipient_id for r in results] == ["u00", "u01"]
+    assert sorted(sender.sent) == ["c00", "c01"]
+
+
+async def test_identical_concurrent_broadcasts_use_separate_outbox_records(tmp_path) -> None:
+    registry = InMemoryRecipientRegistry()
+    await _register(registry, 3)
+    sender = SlowSender()
+    gateway = _gateway(registry, sender, outbox=FileBroadcastOutbox(str(tmp_path)))
+
+    first, second = await asyncio.gather(
+        gateway.broadcast(channel="telegram", message="hi"),
+        gateway.broadcast(channel="telegram", message="hi"),
+    )
+
+    assert first.stats.broadcast_id != second.stats.broadcast_id
+    assert first.stats.sent == second.stats.sent == 3
+    assert sorted(sender.sent) == sorted([f"c{i:02d}" for i in range(3)] * 2)
+    assert not list((tmp_path / "outbox").glob("*.jsonl"))
+
+
+async def test_file_outbox_survives_restart(tmp_path) -> None:
+    registry = FileRecipientRegistry(work_dir=str(tmp_path))
+    await _register(registry, 3)
+
+    class CrashingSender(SlowSender):
+        async def send(self, *, recipient_id: str, message: str, metadata=None) -> None:
+            if recipient_id == "c02":
+                raise asyncio.CancelledError  # process killed mid-fan-out
+            await super().send(recipient_id=recipient_id, message=message, metadata=metadata)
+
+    first = CrashingSender(delay=0)
+    with pytest.raises(asyncio.CancelledError):
+        await _gateway(
+            registry, first, outbox=FileBroadcastOutbox(str(tmp_path)), concurrency=1
+        ).broadcast(channel="telegram", message="hi")
+    assert first.sent == ["c00", "c01"]
+
+    second = SlowSender(delay=0)
+    restarted = _gateway(registry, second, outbox=FileBroadcastOutbox(str(tmp_path)))
+    [results] = await restarted.resume_broadcasts()
+
+    assert second.sent == ["c02"]
+    assert results.stats.resumed == 2
+    assert not list((tmp_path / "outbox").glob("*.jsonl"))
+
+
+async def test_file_registry_resolve_many(tmp_path) -> None:
+    registry = FileRecipientRegistry(work_dir=str(tmp_path))
+    await _register(registry, 2)
+    (tmp_path / "recipients" / "telegram" / "broken.json").write_text("{not json")
+
+    references = await registry.resolve_many(channel="telegram")
+
+    assert references == {
+        "u00": {"conversation_id": "c00"},
+        "u01": {"conversation_id": "c01"},
+    }
+    assert await registry.resolve_many(channel="teams") == {}
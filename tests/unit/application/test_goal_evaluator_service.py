@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import asyncio
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -11,6 +14,7 @@ from taskforce.application.goal_evaluator_service import (
     GoalDecision,
     GoalEvaluatorService,
 )
+from taskforce.application.goal_input_probes import GoalInputProber
 from taskforce.core.domain.standing_goal import StandingGoal
 
 
@@ -41,12 +45,16 @@ class _InMemoryStore:
         goal_id: str,
         evaluated_at: datetime,
         action_taken: str,
+        *,
+        input_fingerprint: str | None = None,
     ) -> None:
         self.evaluated.append((goal_id, evaluated_at, action_taken))
         goal = self._goals.get(goal_id)
         if goal:
             goal.last_evaluated_at = evaluated_at
             goal.last_action_taken = action_taken
+            if input_fingerprint is not None:
+                goal.input_fingerprint = input_fingerprint
 
 
 @pytest.mark.spec("standing-goals.disabled_goal_is_skipped")
@@ -314,3 +322,174 @@ async def test_submit_failure_leaves_goal_unevaluated() -> None:
 
     assert store.evaluated == []
     assert results == []
+
+
+class _Clock:
+    def __init__(self, start: datetime) -> None:
+        self.now = start
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, **kwargs: float) -> None:
+        self.now += timedelta(**kwargs)
+
+
+def _gated_service(
+    goals: list[StandingGoal], prober: GoalInputProber, clock: _Clock
+) -> tuple[GoalEvaluatorService, _InMemoryStore, list[Any]]:
+    store = _InMemoryStore(goals)
+    submitted: list[Any] = []
+
+    async def submit(req: Any) -> None:
+        submitted.append(req)
+
+    async def decide(goal: StandingGoal, _now: Any) -> GoalDecision:
+        return GoalDecision(act=True, mission=goal.evaluation_prompt)
+
+    service = GoalEvaluatorService(
+        store=store,
+        submit=submit,
+        decide=decide,
+        clock=clock,
+        fingerprint=prober.fingerprint,
+    )
+    return service, store, submitted
+
+
+@pytest.mark.spec("standing-goals.unchanged_inputs_skip_mission")
+async def test_missions_are_submitted_only_when_a_file_input_changes(tmp_path: Path) -> None:
+    report = tmp_path / "reports" / "sales.csv"
+    report.parent.mkdir()
+    report.write_text("q1,10\n", encoding="utf-8")
+    goal = StandingGoal(
+        description="summarise sales",
+        evaluation_prompt="summarise",
+        frequency="0 * * * *",  # hourly
+        inputs=[{"type": "file", "path": "reports/*.csv", "hash": True}],
+    )
+    clock = _Clock(datetime(2026, 5, 6, 9, 0, tzinfo=UTC))
+    service, store, submitted = _gated_service([goal], GoalInputProber(base_dir=tmp_path), clock)
+
+    await service.evaluate_due_goals()  # first run
+    assert len(submitted) == 1
+
+    for _ in range(3):  # hourly firings, nothing changed
+        clock.advance(hours=1)
+        results = await service.evaluate_due_goals()
+        assert results == [
+            {
+                "goal_id": goal.goal_id,
+                "acted": False,
+                "rationale": "inputs unchanged",
+                "skipped": True,
+            }
+        ]
+    assert len(submitted) == 1
+    assert goal.last_evaluated_at == clock.now
+
+    report.write_text("q1,10\nq2,12\n", encoding="utf-8")
+    clock.advance(minutes=30)
+    await service.evaluate_due_goals()
+    assert len(submitted) == 1  # changed, but the cron has not fired yet
+
+    clock.advance(minutes=30)
+    await service.evaluate_due_goals()
+    assert len(submitted) == 2
+
+    (tmp_path / "reports" / "costs.csv").write_text("x", encoding="utf-8")
+    clock.advance(hours=1)
+    await service.evaluate_due_goals()
+    assert len(submitted) == 3  # a new file matching the glob counts as a change
+
+
+async def test_event_count_input_gates_on_new_events(tmp_path: Path) -> None:
+    counts: Counter[tuple[str, str]] = Counter({("github", "webhook_received"): 2})
+    goal = StandingGoal(
+        description="triage",
+        evaluation_prompt="triage new issues",
+        frequency="*/15 * * * *",
+        inputs=[{"type": "event_count", "source": "github"}],
+    )
+    clock = _Clock(datetime(2026, 5, 6, 9, 0, tzinfo=UTC))
+    prober = GoalInputProber(base_dir=tmp_path, event_counts=lambda: counts)
+    service, _store, submitted = _gated_service([goal], prober, clock)
+
+    await service.evaluate_due_goals()
+    counts[("gmail", "email_received")] += 1  # another source
+    clock.advance(minutes=15)
+    await service.evaluate_due_goals()
+    assert len(submitted) == 1
+
+    counts[("github", "webhook_received")] += 1
+    clock.advance(minutes=15)
+    await service.evaluate_due_goals()
+    assert len(submitted) == 2
+
+
+async def test_goals_without_inputs_or_failing_probes_are_not_gated(tmp_path: Path) -> None:
+    plain = StandingGoal(description="a", evaluation_prompt="a", frequency="0 * * * *")
+    broken = StandingGoal(
+        description="b",
+        evaluation_prompt="b",
+        frequency="0 * * * *",
+        inputs=[{"type": "wiki_page", "page": "missing-store"}],  # no wiki store wired
+    )
+    clock = _Clock(datetime(2026, 5, 6, 9, 0, tzinfo=UTC))
+    service, store, submitted = _gated_service(
+        [plain, broken], GoalInputProber(base_dir=tmp_path), clock
+    )
+
+    for _ in range(2):
+        await service.evaluate_due_goals()
+        clock.advance(hours=1)
+
+    assert len(submitted) == 4
+    assert broken.input_fingerprint == ""
+
+
+async def test_forced_evaluation_records_fingerprint(tmp_path: Path) -> None:
+    (tmp_path / "notes.md").write_text("v1", encoding="utf-8")
+    goal = StandingGoal(
+        description="d",
+        evaluation_prompt="p",
+        frequency="0 * * * *",
+        last_evaluated_at=datetime(2026, 5, 6, 8, 0, tzinfo=UTC),
+        inputs=[{"type": "file", "path": "notes.md"}],
+    )
+    clock = _Clock(datetime(2026, 5, 6, 9, 30, tzinfo=UTC))
+    service, _store, submitted = _gated_service([goal], GoalInputProber(base_dir=tmp_path), clock)
+
+    result = await service.evaluate_goal(goal.goal_id)
+    clock.advance(hours=1)
+    await service.evaluate_due_goals()
+
+    assert result is not None and result["forced"] is True
+    assert len(submitted) == 1  # the heartbeat saw the same inputs
+
+
+async def test_due_goals_are_evaluated_concurrently_up_to_the_cap() -> None:
+    goals = [
+        StandingGoal(description=str(i), evaluation_prompt="p", frequency="* * * * *")
+        for i in range(6)
+    ]
+    store = _InMemoryStore(goals)
+    running = 0
+    peak = 0
+
+    async def submit(_req: Any) -> None:
+        pass
+
+    async def decide(_g: Any, _now: Any) -> GoalDecision:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return GoalDecision(act=False)
+
+    service = GoalEvaluatorService(store=store, submit=submit, decide=decide, max_concurrent=3)
+    results = await service.evaluate_due_goals()
+
+    assert peak == 3
+    assert [r["goal_id"] for r in results] == [g.goal_id for g in goals]
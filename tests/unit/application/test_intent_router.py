@@ -5,6 +5,8 @@ Tests the regex-based intent classification that enables skipping
 planning for well-defined intents in the accounting domain.
 """
 
+import re
+
 import pytest
 
 from taskforce.application.intent_router import (
@@ -331,3 +333,79 @@ class TestIntentPattern:
 
         # Default confidence threshold allows single-pattern matches
         assert pattern.min_confidence == 0.4  # Can be overridden per intent
+
+
+class TestCompiledMatcher:
+    """The single-scan compiled matcher must agree with per-pattern search."""
+
+    @staticmethod
+    def _brute_force(patterns: list[IntentPattern], message: str) -> dict[str, list[str]]:
+        lowered = message.lower()
+        return {
+            p.intent: hits
+            for p in patterns
+            if (hits := [pat for pat in p.patterns if re.search(pat, lowered, re.IGNORECASE)])
+        }
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "Buche diese Rechnung und erkläre die Vorsteuer nach § 15",
+            "Was bedeutet Reverse Charge bei der AfA?",
+            "Wie hoch ist der Buchwert nach der Abschreibung?",
+            "Welche MwSt gilt hier? Zeig mir die Position",
+            "STRASSE und Straße",
+            "nothing relevant here at all",
+        ],
+    )
+    def test_candidates_match_brute_force_search(self, message: str):
+        router = FastIntentRouter(patterns=list(DEFAULT_INTENT_PATTERNS))
+        expected = self._brute_force(DEFAULT_INTENT_PATTERNS, message)
+        found = {m.intent: m.matched_patterns for m in router.candidates(message)}
+        thresholds = {p.intent: p for p in DEFAULT_INTENT_PATTERNS}
+        expected = {
+            intent: hits
+            for intent, hits in expected.items()
+            if len(hits) / len(thresholds[intent].patterns) >= thresholds[intent].min_confidence
+        }
+        assert found == expected
+
+    def test_patterns_without_literals_are_still_checked(self):
+        router = FastIntentRouter(
+            patterns=[IntentPattern("DIGITS", [r"\d{4,}", r"[xyz]+"], "digits", 0.5)]
+        )
+        match = router.classify("order 123456")
+        assert match is not None and match.matched_patterns == [r"\d{4,}"]
+
+    def test_candidates_sorted_by_priority_then_confidence(self):
+        router = FastIntentRouter(
+            patterns=[
+                IntentPattern("LOW", ["invoice", "pay"], "low", 0.1),
+                IntentPattern("HIGH", ["invoice", "x{9}", "y{9}"], "high", 0.1, priority=5),
+            ]
+        )
+        assert [m.intent for m in router.candidates("pay this invoice")] == ["HIGH", "LOW"]
+
+    def test_priority_resolves_ambiguity(self):
+        patterns = [
+            IntentPattern("A", ["invoice"], "a", 0.1),
+            IntentPattern("B", ["invoice"], "b", 0.1),
+        ]
+        assert FastIntentRouter(patterns=list(patterns)).classify("the invoice") is None
+
+        patterns[1] = IntentPattern("B", ["invoice"], "b", 0.1, priority=1)
+        match = FastIntentRouter(patterns=list(patterns)).classify("the invoice")
+        assert match is not None and match.intent == "B"
+
+    def test_compiled_matcher_shared_per_config_and_rebuilt_on_change(self):
+        config = {"intent_router": {"patterns": [
+            {"intent": "X", "patterns": ["foo.*bar"], "skill": "x", "priority": 2},
+        ]}}
+        first = create_intent_router_from_config(config)
+        second = create_intent_router_from_config(config)
+        assert first._compiled is second._compiled
+
+        second.add_pattern(IntentPattern("Y", ["baz"], "y"))
+        assert second._compiled is not first._compiled
+        assert second.classify("baz") is not None
+        assert first.classify("baz") is None
@@ -0,0 +1,288 @@
+"""Tests for the background learning queue and similarity merging."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+from taskforce.application import learning_queue
+from taskforce.application.learning_queue import LearningQueue, get_learning_queue, tool_evidence
+from taskforce.application.learning_service import LlmExtractingLearningService
+from taskforce.core.domain.wiki_page import WikiPage
+from taskforce.infrastructure.memory.file_wiki_store import FileWikiStore
+from tests.fixtures.learning_replay import load_missions, replay
+
+
+def _mission(call_id: str, tool: str, args: dict[str, Any], result: str) -> list[dict]:
+    return [
+        {"role": "user", "content": "question"},
+        {
+            "role": "assistant",
+            "content": "",
+            "tool_calls": [
+                {"id": call_id, "function": {"name": tool, "arguments": json.dumps(args)}}
+            ],
+        },
+        {"role": "tool", "tool_call_id": call_id, "name": tool, "content": result},
+        {"role": "assistant", "content": "answer"},
+    ]
+
+
+class _FactLLM:
+    """Returns the same facts for every prompt and records the prompts."""
+
+    def __init__(self, facts: list[dict[str, Any]] | None = None, success: bool = True) -> None:
+        self.facts = facts or []
+        self.success = success
+        self.prompts: list[str] = []
+
+    async def complete_json(self, prompt: str, **_: Any) -> dict[str, Any]:
+        self.prompts.append(prompt)
+        if not self.success:
+            return {"success": False, "error": "rate limited"}
+        return {"success": True, "data": {"facts": self.facts}}
+
+
+def _fact(slug: str, title: str, body: str, kind: str = "concepts") -> dict[str, Any]:
+    return {
+        "kind": kind,
+        "slug": slug,
+        "title": title,
+        "body": body,
+        "tags": ["test"],
+        "future_relevance": "Recurring question answered from the same source.",
+    }
+
+
+class TestToolEvidence:
+    def test_failed_and_empty_tool_results_carry_no_evidence(self) -> None:
+        messages = _mission("c1", "web_fetch", {"url": "https://x"}, "ERROR: 503")
+        messages += _mission("c2", "web_fetch", {"url": "https://y"}, "")
+
+        assert tool_evidence(messages) == []
+
+    def test_same_call_with_reordered_arguments_is_one_key(self) -> None:
+        first = _mission("c1", "weather", {"city": "Wien", "days": 1}, "12°C")
+        second = _mission("c9", "weather", {"days": 1, "city": "Wien"}, "14°C")
+        other = _mission("c3", "weather", {"city": "Graz", "days": 1}, "10°C")
+
+        assert tool_evidence(first) == tool_evidence(second)
+        assert tool_evidence(first) != tool_evidence(other)
+
+
+class TestLearningQueue:
+    async def test_missions_without_novel_evidence_are_skipped(self, tmp_path: Path) -> None:
+        llm = _FactLLM()
+        queue = LearningQueue(
+            LlmExtractingLearningService(FileWikiStore(tmp_path), llm), background=False
+        )
+
+        assert queue.submit("chat", [{"role": "user", "content": "hi"}], "s1") is False
+        assert queue.submit("w", _mission("c1", "weather", {"city": "Wien"}, "12°C"), "s2")
+        assert not queue.submit("w", _mission("c2", "weather", {"city": "Wien"}, "9°C"), "s3")
+        assert queue.pending == 1
+
+    async def test_full_batch_is_extracted_with_one_call(self, tmp_path: Path) -> None:
+        llm = _FactLLM()
+        queue = LearningQueue(
+            LlmExtractingLearningService(FileWikiStore(tmp_path), llm),
+            batch_size=3,
+            max_wait_seconds=3600,
+        )
+        for index in range(3):
+            queue.submit("q", _mission(f"c{index}", "lookup", {"n": index}, "ok"), f"s{index}")
+        await asyncio.sleep(0.05)
+
+        assert len(llm.prompts) == 1
+        assert llm.prompts[0].count("### Mission") == 3
+        assert queue.pending == 0
+        await queue.drain()
+
+    async def test_partial_batch_is_extracted_after_max_wait(self, tmp_path: Path) -> None:
+        llm = _FactLLM()
+        queue = LearningQueue(
+            LlmExtractingLearningService(FileWikiStore(tmp_path), llm),
+            batch_size=4,
+            max_wait_seconds=0.05,
+        )
+        queue.submit("q", _mission("c1", "lookup", {"n": 1}, "ok"), "s1")
+        await asyncio.sleep(0.01)
+        assert llm.prompts == []
+
+        await asyncio.sleep(0.1)
+        assert len(llm.prompts) == 1
+        await queue.drain()
+
+    async def test_failed_extraction_lets_a_later_mission_retry(self, tmp_path: Path) -> None:
+        llm = _FactLLM(success=False)
+        queue = LearningQueue(
+            LlmExtractingLearningService(FileWikiStore(tmp_path), llm), background=False
+        )
+        messages = _mission("c1", "weather", {"city": "Wien"}, "12°C")
+        queue.submit("w", messages, "s1")
+        await queue.flush()
+
+        assert queue.submit("w", messages, "s2") is True
+
+    async def test_worker_keeps_running_after_a_failed_batch(self, tmp_path: Path) -> None:
+        llm = _FactLLM()
+        service = LlmExtractingLearningService(FileWikiStore(tmp_path), llm)
+        learn = service.learn_from_missions
+        calls = 0
+
+        async def flaky(missions):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("wiki unavailable")
+            return await learn(missions)
+
+        service.learn_from_missions = flaky  # type: ignore[method-assign]
+        queue = LearningQueue(service, batch_size=1, max_wait_seconds=3600)
+        queue.submit("q", _mission("c1", "lookup", {"n": 1}, "ok"), "s1")
+        queue.submit("q", _mission("c2", "lookup", {"n": 2}, "ok"), "s2")
+        await asyncio.sleep(0.05)
+
+        assert calls == 2
+        assert len(llm.prompts) == 1
+        assert queue.pending == 0
+        await queue.drain()
+
+    async def test_queues_of_closed_loops_are_evicted(self, tmp_path: Path) -> None:
+        store = FileWikiStore(tmp_path)
+
+        async def on_other_loop() -> None:
+            get_learning_queue("cli", store, _FactLLM(), {})
+
+        await asyncio.to_thread(asyncio.run, on_other_loop())
+        try:
+            assert ("cli", str(store.root)) in learning_queue._QUEUES
+            get_learning_queue("api", store, _FactLLM(), {})
+
+            assert ("cli", str(store.root)) not in learning_queue._QUEUES
+        finally:
+            learning_queue._QUEUES.pop(("cli", str(store.root)), None)
+            learning_queue._QUEUES.pop(("api", str(store.root)), None)
+
+
+class TestSimilarityMerge:
+    async def _store_with_source_page(self, tmp_path: Path) -> FileWikiStore:
+        store = FileWikiStore(tmp_path)
+        await store.write_page(
+            WikiPage(
+                name="concepts/wetter-quelle",
+                title="Wetter Quelle",
+                body=(
+                    "Wettervorhersage fuer Wien liefert die GeoSphere API zuverlaessig.\n\n"
+                    "## Quelle\n\nhttps://dataset.api.hub.geosphere.at"
+                ),
+            )
+        )
+        return store
+
+    async def test_paraphrase_is_merged_into_similar_page(self, tmp_path: Path) -> None:
+        store = await self._store_with_source_page(tmp_path)
+        llm = _FactLLM(
+            [
+                _fact(
+                    "wien-wetter-api",
+                    "Wetter Wien API",
+                    "GeoSphere API liefert die Wettervorhersage fuer Wien; "
+                    "Parameter lat/lon.\n\n## Quelle\n\nhttps://dataset.api.hub.geosphere.at",
+                )
+            ]
+        )
+        service = LlmExtractingLearningService(store, llm)
+
+        result = await service.learn_from_mission("Wetter?", _mission("c1", "w", {}, "ok"), "s1")
+
+        assert result.pages_written == ["concepts/wetter-quelle"]
+        assert await store.get_page("concepts/wien-wetter-api") is None
+        page = await store.get_page("concepts/wetter-quelle")
+        assert "## Aktualisierung" in page.body
+        assert "Parameter lat/lon" in page.body
+        assert page.body.count("https://dataset.api.hub.geosphere.at") == 1
+
+    async def test_near_duplicate_is_not_written(self, tmp_path: Path) -> None:
+        store = await self._store_with_source_page(tmp_path)
+        llm = _FactLLM(
+            [
+                _fact(
+                    "wetter-wien",
+                    "Wetter Quelle",
+                    "Wettervorhersage fuer Wien liefert die GeoSphere API zuverlaessig.",
+                )
+            ]
+        )
+        service = LlmExtractingLearningService(store, llm)
+
+        result = await service.learn_from_mission("Wetter?", _mission("c1", "w", {}, "ok"), "s1")
+
+        assert result.pages_written == []
+        page = await store.get_page("concepts/wetter-quelle")
+        assert "Aktualisierung" not in page.body
+
+    async def test_unrelated_fact_creates_a_page(self, tmp_path: Path) -> None:
+        store = await self._store_with_source_page(tmp_path)
+        llm = _FactLLM(
+            [_fact("oebb-scotty", "OeBB Scotty", "Zugverbindungen Linz-Wien ueber Scotty.")]
+        )
+        service = LlmExtractingLearningService(store, llm)
+
+        result = await service.learn_from_mission("Zug?", _mission("c1", "z", {}, "ok"), "s1")
+
+        assert result.pages_written == ["concepts/oebb-scotty"]
+
+    async def test_index_rereads_only_pages_changed_between_batches(
+        self, tmp_path: Path
+    ) -> None:
+        store = await self._store_with_source_page(tmp_path)
+        await store.write_page(
+            WikiPage(name="concepts/maut", title="Maut", body="Vignette fuer Autobahnen.")
+        )
+        llm = _FactLLM([_fact("oebb-scotty", "OeBB Scotty", "Zugverbindungen ueber Scotty.")])
+        service = LlmExtractingLearningService(store, llm)
+        await service.learn_from_mission("Zug?", _mission("c1", "z", {}, "ok"), "s1")
+
+        await FileWikiStore(tmp_path).write_page(
+            WikiPage(
+                name="concepts/wetter-quelle",
+                title="Wetter Quelle",
+                body="Luftqualitaet fuer Linz meldet das Land Oberoesterreich.",
+            )
+        )
+        read: list[str] = []
+        get_page = store.get_page
+
+        async def counting_get_page(name: str) -> WikiPage | None:
+            read.append(name)
+            return await get_page(name)
+
+        store.get_page = counting_get_page  # type: ignore[method-assign]
+        store.list_pages = None  # type: ignore[assignment]
+        llm.facts = [
+            _fact(
+                "linz-luft",
+                "Luft Linz",
+                "Luftqualitaet fuer Linz meldet das Land Oberoesterreich.",
+            )
+        ]
+        result = await service.learn_from_mission("Luft?", _mission("c2", "l", {}, "ok"), "s2")
+
+        assert result.pages_written == []
+        assert "concepts/wetter-quelle" in read
+        assert "concepts/maut" not in read
+
+
+class TestRecordedMissions:
+    async def test_queue_cuts_llm_calls_and_page_growth(self, tmp_path: Path) -> None:
+        rows = load_missions()
+        inline = await replay(rows, tmp_path / "inline", pipeline="inline")
+        queued = await replay(rows, tmp_path / "queued", pipeline="queued")
+
+        assert inline["llm_calls_per_mission"] == 1.0
+        assert queued["llm_calls_per_mission"] <= 0.2
+        assert queued["pages"] * 2 <= inline["pages"]
+        assert queued["pages"] > 0
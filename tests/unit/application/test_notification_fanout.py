@@ -0,0 +1,123 @@
+"""Tests for the rate-limited notification fan-out engine."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from taskforce.application.notification_fanout import (
+    ChannelLimits,
+    NotificationFanout,
+    TokenBucket,
+)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    def test_burst_is_free_then_waits_scale_with_deficit(self):
+        clock = _FakeClock()
+        bucket = TokenBucket(rate_per_s=2.0, capacity=2, clock=clock)
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    def test_refills_over_time_up_to_capacity(self):
+        clock = _FakeClock()
+        bucket = TokenBucket(rate_per_s=1.0, capacity=1, clock=clock)
+        bucket.reserve()
+        assert not bucket.idle
+        clock.now = 10.0
+        assert bucket.idle
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate_per_s=0, capacity=1)
+
+
+class TestNotificationFanout:
+    async def test_run_respects_concurrency_and_preserves_order(self):
+        fanout = NotificationFanout({"chat": ChannelLimits(concurrency=3)})
+        in_flight = 0
+        peak = 0
+
+        def make_job(i: int):
+            async def job() -> int:
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01 * (10 - i))
+                in_flight -= 1
+                return i
+
+            return job
+
+        results = await fanout.run("chat", [(f"r{i}", make_job(i)) for i in range(10)])
+
+        assert results == list(range(10))
+        assert peak == 3
+
+    async def test_concurrency_is_shared_between_callers(self):
+        fanout = NotificationFanout({"chat": ChannelLimits(concurrency=1)})
+        in_flight = 0
+        peak = 0
+
+        async def job() -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        await asyncio.gather(
+            fanout.run("chat", [("a", job), ("b", job)]),
+            fanout.run("chat", [("c", job)]),
+        )
+        assert peak == 1
+
+    async def test_channel_rate_limit_spaces_out_sends(self):
+        fanout = NotificationFanout(
+            {"chat": ChannelLimits(concurrency=10, rate_per_s=50.0, burst=1)}
+        )
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        async def job() -> None:
+            return None
+
+        await fanout.run("chat", [(f"r{i}", job) for i in range(6)])
+        # One token up front, then five more at 50/s => >= ~0.1s.
+        assert loop.time() - started >= 0.09
+
+    async def test_per_recipient_limit_only_throttles_repeat_recipient(self):
+        fanout = NotificationFanout(
+            {"chat": ChannelLimits(concurrency=10, recipient_rate_per_s=20.0)}
+        )
+        loop = asyncio.get_running_loop()
+
+        started = loop.time()
+        async with fanout.slot("chat", "a"):
+            pass
+        async with fanout.slot("chat", "b"):
+            pass
+        assert loop.time() - started < 0.04
+
+        async with fanout.slot("chat", "a"):
+            pass
+        assert loop.time() - started >= 0.04
+
+    def test_telegram_has_provider_defaults(self):
+        limits = NotificationFanout().limits_for("telegram")
+        assert limits.rate_per_s is not None
+        assert limits.recipient_rate_per_s == 1.0
+        assert NotificationFanout().limits_for("unknown") == ChannelLimits()
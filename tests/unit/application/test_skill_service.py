@@ -577,3 +577,98 @@ class TestRefreshDynamicSkillDirsWatcher:
             )
 
         assert service is not None
+
+
+class TestWatcherIncrementalRefresh:
+    """Watcher-driven refresh: O(1) steady state, per-skill incremental updates."""
+
+    @pytest.fixture
+    def live(self, tmp_path):
+        from taskforce.infrastructure.skills.skill_registry import FileSkillRegistry
+
+        clear_extra_skill_dirs()
+        reset_skill_service()
+        root = (tmp_path / "skills").resolve()
+        (root / "alpha" / "references").mkdir(parents=True)
+        _write_skill_file(root, "alpha")
+        service = SkillService(registry=FileSkillRegistry([str(root)]))
+        with patch("taskforce.application.skill_service._skill_service", service):
+            refresh_dynamic_skill_dirs()  # first call starts watching
+            yield service, root
+        reset_skill_service()
+        clear_extra_skill_dirs()
+
+    def _refresh_counting(self, service) -> int:
+        with patch.object(service.registry, "refresh", wraps=service.registry.refresh) as spy:
+            refresh_dynamic_skill_dirs()
+        return spy.call_count
+
+    def test_add_nested_skill(self, live) -> None:
+        service, root = live
+        _write_skill_file(root, "beta")
+
+        assert self._refresh_counting(service) == 0
+        assert service.list_skills() == ["alpha", "beta"]
+
+    @pytest.mark.spec("skills.watcher_reparses_only_changed_skills")
+    def test_modify_nested_resource_and_skill_file(self, live) -> None:
+        service, root = live
+        before = service.get_skill("alpha")
+        (root / "alpha" / "references" / "guide.md").write_text("# Guide")
+        _write_skill_file(root, "alpha", description="Edited alpha.")
+
+        assert self._refresh_counting(service) == 0
+        assert service.get_skill_metadata("alpha").description == "Edited alpha."
+        assert service.get_skill("alpha") is not before
+
+    def test_delete_skill(self, live) -> None:
+        import shutil
+
+        service, root = live
+        _write_skill_file(root, "beta")
+        refresh_dynamic_skill_dirs()
+        shutil.rmtree(root / "beta")
+
+        assert self._refresh_counting(service) == 0
+        assert service.list_skills() == ["alpha"]
+
+    def test_rename_skill_directory(self, live) -> None:
+        service, root = live
+        (root / "alpha").rename(root / "omega")
+        _write_skill_file(root, "omega")
+
+        assert self._refresh_counting(service) == 0
+        assert service.list_skills() == ["omega"]
+        assert service.resolve_slash_command("/alpha")[0] is None
+
+    @pytest.mark.spec("skills.watcher_steady_state_has_no_directory_walk")
+    def test_steady_state_performs_no_filesystem_walk(self, live) -> None:
+        """Unchanged skills: the lookup path never lists or walks a directory."""
+        import os
+        from pathlib import Path
+
+        service, root = live
+
+        def _walk(*args, **kwargs):
+            raise AssertionError("directory walk on the steady-state path")
+
+        with (
+            patch.object(os, "scandir", _walk),
+            patch.object(os, "walk", _walk),
+            patch.object(os, "listdir", _walk),
+            patch.object(Path, "iterdir", _walk),
+            patch.object(Path, "rglob", _walk),
+            patch.object(Path, "glob", _walk),
+        ):
+            for _ in range(5):
+                refresh_dynamic_skill_dirs()
+
+        assert service.list_skills() == ["alpha"]
+
+
+def _write_skill_file(root, name: str, description: str | None = None) -> None:
+    skill_dir = root / name
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: {description or f'Skill {name}.'}\n---\n\n# {name}\n"
+    )
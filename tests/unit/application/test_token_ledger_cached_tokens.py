@@ -0,0 +1,84 @@
+"""Cached prompt tokens are stored per call and priced at the cached rate."""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from taskforce.application.pricing import ModelPrice, PricingTable
+from taskforce.application.token_ledger import TokenLedger
+
+_TS = datetime(2026, 5, 1, tzinfo=UTC)
+
+
+def _table() -> PricingTable:
+    return PricingTable(
+        models={
+            "anthropic/claude-sonnet-4-6": ModelPrice(3.0, 15.0, cached_input_per_1m_usd=0.3),
+            "ollama/*": ModelPrice(0.0, 0.0),
+        },
+        default=ModelPrice(1.0, 3.0),
+        as_of="2026-05-01",
+    )
+
+
+@pytest.mark.spec("observability.token_ledger_prices_cached_prompt_tokens")
+def test_cached_prompt_tokens_recorded_and_priced_separately(tmp_path: Path) -> None:
+    ledger = TokenLedger(db_path=tmp_path / "analytics.db", pricing=_table())
+
+    entry = ledger.record(
+        timestamp=_TS,
+        model="anthropic/claude-sonnet-4-6",
+        prompt_tokens=10_000,
+        completion_tokens=100,
+        cached_prompt_tokens=9_000,
+        session_id="s1",
+    )
+
+    # 1k uncached × $3 + 9k cached × $0.30 + 100 out × $15, per 1M tokens.
+    assert entry is not None
+    assert entry.cost_usd == pytest.approx(0.003 + 0.0027 + 0.0015)
+    assert ledger.per_session("s1")["cached_prompt_tokens"] == 9_000
+    assert ledger.aggregate_by_period()[0].cached_prompt_tokens == 9_000
+
+
+def test_cached_rate_defaults_to_input_rate() -> None:
+    table = _table()
+
+    with_cache = table.cost("azure/gpt-x", 1_000_000, 0, cached_prompt_tokens=500_000)
+    without_cache = table.cost("azure/gpt-x", 1_000_000, 0)
+
+    assert with_cache.cost_usd == without_cache.cost_usd == pytest.approx(1.0)
+
+
+def test_existing_database_is_migrated(tmp_path: Path) -> None:
+    db_path = tmp_path / "analytics.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE llm_calls (id INTEGER PRIMARY KEY AUTOINCREMENT, ts TEXT NOT NULL, "
+            "session_id TEXT, conversation_id TEXT, agent_id TEXT, profile TEXT, "
+            "model TEXT NOT NULL, prompt_tokens INTEGER NOT NULL, "
+            "completion_tokens INTEGER NOT NULL, cost_usd REAL NOT NULL)"
+        )
+        conn.execute(
+            "INSERT INTO llm_calls (ts, session_id, model, prompt_tokens, completion_tokens, "
+            "cost_usd) VALUES (?, 's1', 'ollama/llama3', 10, 5, 0.0)",
+            (_TS.isoformat(),),
+        )
+
+    ledger = TokenLedger(db_path=db_path, pricing=_table())
+    ledger.record(
+        timestamp=_TS,
+        model="ollama/llama3",
+        prompt_tokens=20,
+        completion_tokens=5,
+        cached_prompt_tokens=15,
+        session_id="s1",
+    )
+
+    usage = ledger.per_session("s1")
+    assert usage["prompt_tokens"] == 30
+    assert usage["cached_prompt_tokens"] == 15
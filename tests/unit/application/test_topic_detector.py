@@ -5,7 +5,8 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from taskforce.application.topic_detector import TopicChange, TopicDetector
+from taskforce.application.topic_detector import TopicChange, TopicDecision, TopicDetector
+from tests.fixtures.topic_shift_cases import TOPIC_SHIFT_CASES
 
 
 def _make_llm(response_content: str) -> AsyncMock:
@@ -161,3 +162,91 @@ class TestTopicChange:
         tc = TopicChange(label="Test", confidence=0.5)
         with pytest.raises(AttributeError):
             tc.label = "Changed"
+
+
+class _OracleLLM:
+    """LLM stand-in that answers detection prompts with the gold label."""
+
+    def __init__(self) -> None:
+        self.gold = False
+        self.calls = 0
+
+    async def complete(self, **kwargs):
+        self.calls += 1
+        return {
+            "content": json.dumps({"changed": self.gold, "label": "Gold", "confidence": 0.9})
+        }
+
+
+async def _evaluate(detector: TopicDetector, llm: _OracleLLM) -> tuple[int, int]:
+    correct = 0
+    for case in TOPIC_SHIFT_CASES:
+        llm.gold = case.changed
+        change = await detector.detect(case.message, case.current_label, case.recent)
+        correct += (change is not None) == case.changed
+    return correct, llm.calls
+
+
+class TestLexicalFirstPass:
+    """The local stage decides clear cases; the LLM only sees the uncertain band."""
+
+    @pytest.mark.spec("conversations.topic_first_pass_avoids_llm_without_accuracy_loss")
+    async def test_fixture_set_avoids_llm_calls_without_accuracy_loss(self) -> None:
+        llm_only = _OracleLLM()
+        baseline_correct, baseline_calls = await _evaluate(
+            TopicDetector(llm_only, lexical_first_pass=False), llm_only
+        )
+        two_stage = _OracleLLM()
+        correct, calls = await _evaluate(TopicDetector(two_stage), two_stage)
+
+        assert baseline_calls == len(TOPIC_SHIFT_CASES)
+        assert calls <= baseline_calls // 2
+        assert correct == baseline_correct
+
+    async def test_acknowledgement_stays_on_topic_without_llm(self) -> None:
+        llm = _make_llm("{}")
+        detector = TopicDetector(llm)
+        result, decision = await detector.decide("ok thanks!", "Weekend trip to Vienna")
+        assert result is None
+        llm.complete.assert_not_awaited()
+        assert decision == TopicDecision("lexical", False, 0.0, "no_content_terms")
+
+    async def test_dissimilar_message_labelled_from_its_terms(self) -> None:
+        llm = _make_llm("{}")
+        detector = TopicDetector(llm)
+        case = next(c for c in TOPIC_SHIFT_CASES if c.message.startswith("Which laptop"))
+        result, decision = await detector.decide(case.message, case.current_label, case.recent)
+        assert result is not None
+        assert "laptop" in result.label.lower()
+        llm.complete.assert_not_awaited()
+        assert decision.reason == "dissimilar"
+
+    async def test_explicit_switch_always_consults_llm(self) -> None:
+        response = json.dumps({"changed": True, "label": "Budget", "confidence": 0.9})
+        llm = _make_llm(response)
+        detector = TopicDetector(llm)
+        result, decision = await detector.decide(
+            "Let's talk about the weekend trip to Vienna",
+            "Weekend trip to Vienna",
+        )
+        assert result == TopicChange(label="Budget", confidence=0.9)
+        assert decision.stage == "llm"
+        assert decision.reason == "explicit_switch"
+        assert detector.stats["llm_changed"] == 1
+
+    async def test_document_frequencies_decay_and_stay_bounded(self) -> None:
+        detector = TopicDetector(_make_llm("{}"), idf_window=10, max_vocabulary=5)
+        for i in range(25):
+            await detector.detect(f"unique{i}word alpha{i}beta", "Weekend trip to Vienna")
+        await detector.detect("shared budget forecast", "Weekend trip to Vienna")
+
+        assert detector._docs < 10
+        assert len(detector._doc_freq) <= 5 + 3
+
+    def test_score_is_pure(self) -> None:
+        detector = TopicDetector(_make_llm("{}"))
+        recent = [{"role": "user", "content": "Train from Munich to Vienna"}]
+        first = detector.score("Vienna train tickets", "Weekend trip to Vienna", recent)
+        second = detector.score("Vienna train tickets", "Weekend trip to Vienna", recent)
+        assert first == second > 0.3
+        assert detector.score("dentist appointment", "Weekend trip to Vienna") == 0.0
@@ -46,3 +46,29 @@ async def test_detects_duplicate_titles(store: FileWikiStore) -> None:
     await store.write_page(WikiPage(name="entities/b", title="Shared", body="[[entities/a]]"))
     report = await lint_wiki(store)
     assert any(i.kind == "duplicate_title" for i in report.issues)
+
+
+async def test_graph_lint_matches_full_scan_on_generated_wiki(tmp_path: Path) -> None:
+    from taskforce.core.domain.wiki_service import extract_wiki_links
+    from tests.fixtures.wiki_generator import generate_wiki
+
+    generate_wiki(tmp_path / "wiki", pages=1200)
+    store = FileWikiStore(tmp_path / "wiki")
+    pages = await store.list_pages()
+    names = {page.name for page in pages}
+    linked = {t for page in pages for t in extract_wiki_links(page.body)}
+    broken = {
+        f"{page.name} links to unknown page [[{target}]]"
+        for page in pages
+        for target in extract_wiki_links(page.body)
+        if target not in names
+    }
+
+    report = await lint_wiki(store)
+
+    by_kind: dict[str, set[str]] = {}
+    for issue in report.issues:
+        by_kind.setdefault(issue.kind, set()).add(issue.message)
+    assert by_kind["broken_link"] == broken
+    assert by_kind["orphan"] == {f"{n} has no inbound links" for n in names - linked}
+    assert len(by_kind["duplicate_title"]) == 1200 - 997
@@ -13,6 +13,7 @@ from taskforce.core.domain.lean_agent_components.context_manager import ContextM
 from taskforce.core.domain.lean_agent_components.message_history_manager import (
     MessageHistoryManager,
 )
+from taskforce.core.domain.prompt_layout import PromptLayout, is_volatile_context_message
 from taskforce.core.domain.token_budgeter import TokenBudgeter
 from taskforce.core.interfaces.context_manager import ContextItem, ContextSnapshot
 
@@ -457,6 +458,68 @@ async def test_prepare_for_llm_on_uninitialized_context(
     assert ctx.messages == []
 
 
+# ---------------------------------------------------------------------------
+# Prompt-cache layout (volatile tail)
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def ctx_with_layout(
+    mock_history_manager: Mock,
+    openai_tools: list[dict[str, Any]],
+    mock_token_budgeter: TokenBudgeter,
+    mock_logger: Mock,
+) -> ContextManager:
+    """ContextManager whose layout callback reports the current message count."""
+
+    def layout(**kwargs: Any) -> PromptLayout:
+        return PromptLayout(stable="Stable prompt", volatile=f"step {len(kwargs['messages'])}")
+
+    return ContextManager(
+        message_history_manager=mock_history_manager,
+        openai_tools=openai_tools,
+        token_budgeter=mock_token_budgeter,
+        logger=mock_logger,
+        build_system_prompt_fn=lambda **kwargs: "Legacy prompt",
+        build_prompt_layout_fn=layout,
+    )
+
+
+@pytest.mark.spec("context-manager.volatile_tail_stays_last_and_is_replaced")
+async def test_volatile_tail_stays_last_and_is_replaced(
+    ctx_with_layout: ContextManager,
+) -> None:
+    ctx_with_layout.initialize(mission="test", state={}, base_system_prompt="sys")
+
+    await ctx_with_layout.prepare_for_llm(mission="test", state={})
+    ctx_with_layout.append_message({"role": "assistant", "content": "thinking"})
+
+    messages = ctx_with_layout.messages
+    assert messages[0] == {"role": "system", "content": "Stable prompt"}
+    assert [m["content"] for m in messages[1:3]] == ["Hello", "thinking"]
+    assert is_volatile_context_message(messages[-1])
+    assert messages[-1]["content"].endswith("step 2")
+
+    await ctx_with_layout.prepare_for_llm(mission="test", state={})
+
+    assert sum(is_volatile_context_message(m) for m in messages) == 1
+    assert messages[-1]["content"].endswith("step 3")
+
+
+async def test_restore_drops_captured_volatile_tail(ctx_with_layout: ContextManager) -> None:
+    ctx_with_layout.initialize(mission="test", state={}, base_system_prompt="sys")
+    await ctx_with_layout.prepare_for_llm(mission="test", state={})
+    paused = list(ctx_with_layout.messages)
+
+    ctx_with_layout.restore(paused + [{"role": "user", "content": "answer"}])
+
+    assert [m["content"] for m in ctx_with_layout.messages] == [
+        "Stable prompt",
+        "Hello",
+        "answer",
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Sub-agent snapshot registration
 # ---------------------------------------------------------------------------
@@ -1,12 +1,19 @@
 """Tests for AdaptivePlanningStrategy."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncIterator
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from taskforce.core.domain.complexity_classifier import ComplexityVerdict
+from taskforce.core.domain.complexity_classifier import (
+    ComplexityVerdict,
+    ComplexityVerdictCache,
+    mission_fingerprint,
+)
+from taskforce.core.domain.enums import EventType
+from taskforce.core.domain.models import StreamEvent
 from taskforce.core.domain.planning_strategy import AdaptivePlanningStrategy
 
 
@@ -214,3 +221,250 @@ class TestFactoryIntegration:
 
         with pytest.raises(ValueError, match="requires llm_provider"):
             select_planning_strategy("adaptive")
+
+    def test_factory_speculates_native_react_and_caches_by_default(self):
+        from taskforce.application.planning_strategy_factory import select_planning_strategy
+
+        llm = MagicMock()
+        llm.complete_json = AsyncMock()
+        strat = select_planning_strategy("adaptive", llm_provider=llm)
+        assert strat.speculate == "simple"
+        assert strat.verdict_cache is not None
+        assert strat.profile_hash
+
+    def test_factory_speculation_and_cache_can_be_disabled(self):
+        from taskforce.application.planning_strategy_factory import select_planning_strategy
+
+        llm = MagicMock()
+        llm.complete_json = AsyncMock()
+        strat = select_planning_strategy(
+            "adaptive",
+            params={"speculate": None, "classifier_cache_ttl_seconds": 0},
+            llm_provider=llm,
+        )
+        assert strat.speculate is None
+        assert strat.verdict_cache is None
+
+    def test_factory_does_not_speculate_on_non_native_simple(self):
+        from taskforce.application.planning_strategy_factory import select_planning_strategy
+
+        llm = MagicMock()
+        llm.complete_json = AsyncMock()
+        strat = select_planning_strategy(
+            "adaptive", params={"simple": "plan_and_execute"}, llm_provider=llm
+        )
+        assert strat.speculate is None
+
+
+# ---------------------------------------------------------------------------
+# Verdict cache
+# ---------------------------------------------------------------------------
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _cached_strategy(simple, complex_strategy, classifier, cache, profile_hash="p1"):
+    return AdaptivePlanningStrategy(
+        simple=simple,
+        complex_strategy=complex_strategy,
+        classifier=classifier,
+        verdict_cache=cache,
+        profile_hash=profile_hash,
+    )
+
+
+class TestVerdictCache:
+    def test_fingerprint_ignores_case_whitespace_and_trailing_punctuation(self):
+        assert mission_fingerprint("Plan my  trip to Berlin!") == mission_fingerprint(
+            "plan my trip to berlin"
+        )
+        assert mission_fingerprint("plan my trip") != mission_fingerprint("plan my trips")
+
+    @pytest.mark.spec("react-loop.adaptive_verdict_cached_per_fingerprint_and_profile")
+    async def test_repeated_mission_skips_classifier_per_profile(
+        self, simple_strategy, complex_strategy, fake_agent
+    ):
+        cache = ComplexityVerdictCache()
+        classifier = _StubClassifier(ComplexityVerdict("simple", 0.9, "ok"))
+        strat = _cached_strategy(simple_strategy, complex_strategy, classifier, cache)
+
+        await strat.execute(fake_agent, "Look up the Berlin weather", "s1")
+        await strat.execute(fake_agent, "look up the  berlin weather.", "s2")
+        assert len(classifier.calls) == 1
+        assert len(simple_strategy.execute_calls) == 2
+
+        other = _cached_strategy(
+            simple_strategy, complex_strategy, classifier, cache, profile_hash="p2"
+        )
+        await other.execute(fake_agent, "Look up the Berlin weather", "s3")
+        assert len(classifier.calls) == 2
+
+    async def test_zero_confidence_verdict_is_not_cached(
+        self, simple_strategy, complex_strategy, fake_agent
+    ):
+        cache = ComplexityVerdictCache()
+        classifier = _StubClassifier(ComplexityVerdict("complex", 0.0, "fallback"))
+        strat = _cached_strategy(simple_strategy, complex_strategy, classifier, cache)
+
+        await strat.execute(fake_agent, "x", "s1")
+        await strat.execute(fake_agent, "x", "s2")
+        assert len(classifier.calls) == 2
+        assert len(cache) == 0
+
+    def test_entries_expire_after_ttl_and_lru_is_bounded(self):
+        clock = _Clock()
+        cache = ComplexityVerdictCache(ttl_seconds=10, max_entries=2, clock=clock)
+        verdict = ComplexityVerdict("simple", 0.9, "ok")
+        cache.put(("p", "a"), verdict)
+        clock.now = 9.9
+        assert cache.get(("p", "a")) is verdict
+        clock.now = 10.0
+        assert cache.get(("p", "a")) is None
+
+        for key in ("a", "b", "c"):
+            cache.put(("p", key), verdict)
+        assert len(cache) == 2
+        assert cache.get(("p", "a")) is None
+
+
+# ---------------------------------------------------------------------------
+# Speculative execution
+# ---------------------------------------------------------------------------
+
+
+class _EventStrategy:
+    """Strategy stub that streams scripted events and records tool runs."""
+
+    def __init__(self, name: str, script: list[EventType]):
+        self.name = name
+        self.script = script
+        self.tools_executed = 0
+        self.closed = False
+
+    async def execute(self, agent, mission, session_id):  # pragma: no cover - unused
+        raise AssertionError("adaptive speculation must go through execute_stream")
+
+    async def execute_stream(self, agent, mission, session_id):
+        try:
+            for event_type in self.script:
+                yield StreamEvent(event_type=event_type, data={"source": self.name})
+                if event_type == EventType.TOOL_CALL:
+                    self.tools_executed += 1
+                if event_type == EventType.FINAL_ANSWER:
+                    return
+        finally:
+            self.closed = True
+
+
+class _SlowClassifier(_StubClassifier):
+    """Classifier whose verdict arrives only after ``release`` is set."""
+
+    def __init__(self, verdict: ComplexityVerdict):
+        super().__init__(verdict)
+        self.release = asyncio.Event()
+
+    async def classify(self, mission: str) -> ComplexityVerdict:
+        self.calls.append(mission)
+        await self.release.wait()
+        return self.verdict
+
+
+_SPEC_SCRIPT = [
+    EventType.STEP_START,
+    EventType.LLM_TOKEN,
+    EventType.TOOL_CALL,
+    EventType.TOOL_RESULT,
+    EventType.FINAL_ANSWER,
+]
+
+
+async def _drain(strat, agent, classifier) -> list[StreamEvent]:
+    events: list[StreamEvent] = []
+
+    async def consume():
+        async for ev in strat.execute_stream(agent, "ambiguous mission", "s1"):
+            events.append(ev)
+
+    task = asyncio.create_task(consume())
+    for _ in range(20):  # let the speculative run reach its pause point
+        await asyncio.sleep(0)
+    assert events == []  # nothing leaks before the verdict
+    classifier.release.set()
+    await task
+    return events
+
+
+class TestSpeculation:
+    @pytest.mark.spec("react-loop.adaptive_speculation_discarded_without_side_effects")
+    async def test_rejected_speculation_is_cancelled_before_any_tool_runs(self, fake_agent):
+        simple = _EventStrategy("native_react", _SPEC_SCRIPT)
+        complex_strategy = _EventStrategy("plan_and_react", [EventType.FINAL_ANSWER])
+        classifier = _SlowClassifier(ComplexityVerdict("complex", 0.9, "multi-step"))
+        strat = AdaptivePlanningStrategy(
+            simple=simple,
+            complex_strategy=complex_strategy,
+            classifier=classifier,
+            speculate="simple",
+        )
+
+        events = await _drain(strat, fake_agent, classifier)
+
+        assert [(e.event_type, e.data["source"]) for e in events] == [
+            (EventType.FINAL_ANSWER, "plan_and_react")
+        ]
+        assert simple.tools_executed == 0
+        assert simple.closed
+
+    async def test_accepted_speculation_replays_buffer_and_continues(self, fake_agent):
+        simple = _EventStrategy("native_react", _SPEC_SCRIPT)
+        complex_strategy = _EventStrategy("plan_and_react", [EventType.FINAL_ANSWER])
+        classifier = _SlowClassifier(ComplexityVerdict("simple", 0.9, "trivial"))
+        strat = AdaptivePlanningStrategy(
+            simple=simple,
+            complex_strategy=complex_strategy,
+            classifier=classifier,
+            speculate="simple",
+        )
+
+        events = await _drain(strat, fake_agent, classifier)
+
+        assert [e.event_type for e in events] == _SPEC_SCRIPT
+        assert {e.data["source"] for e in events} == {"native_react"}
+        assert simple.tools_executed == 1
+        assert classifier.calls == ["ambiguous mission"]
+
+    async def test_no_speculation_when_verdict_is_local(
+        self, simple_strategy, complex_strategy, fake_agent
+    ):
+        classifier = _StubClassifier(ComplexityVerdict("complex", 0.85, "heuristic"))
+        classifier.classify_local = lambda mission: classifier.verdict
+        strat = AdaptivePlanningStrategy(
+            simple=simple_strategy,
+            complex_strategy=complex_strategy,
+            classifier=classifier,
+            speculate="simple",
+        )
+        async for _ in strat.execute_stream(fake_agent, "compare a and b", "s1"):
+            pass
+        assert simple_strategy.stream_calls == []
+        assert len(complex_strategy.stream_calls) == 1
+
+    async def test_execute_collects_speculative_stream(self, fake_agent):
+        simple = _EventStrategy("native_react", _SPEC_SCRIPT)
+        complex_strategy = _EventStrategy("plan_and_react", [EventType.FINAL_ANSWER])
+        classifier = _StubClassifier(ComplexityVerdict("simple", 0.9, "trivial"))
+        strat = AdaptivePlanningStrategy(
+            simple=simple,
+            complex_strategy=complex_strategy,
+            classifier=classifier,
+            speculate="simple",
+        )
+        result = await strat.execute(fake_agent, "ambiguous mission", "s1")
+        assert result.session_id == "s1"
+        assert simple.tools_executed == 1
@@ -0,0 +1,117 @@
+"""Replay test for the prompt-cache-aware message layout.
+
+Drives a real ``Agent`` through a scripted multi-step mission (plan,
+tool call, plan update, final answer) and checks what each LLM request
+looked like on the wire: ``messages[0]`` and the history before the
+volatile tail must be byte-identical prefixes of the next request, while
+the plan status only ever appears in the tail.
+
+Spec: docs/spec/context-manager.md.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from taskforce.core.domain.agent import Agent
+from taskforce.core.domain.prompt_layout import (
+    VOLATILE_CONTEXT_HEADER,
+    is_volatile_context_message,
+)
+
+_SCRIPT: list[dict[str, Any]] = [
+    {"name": "planner", "arguments": {"action": "create_plan", "tasks": ["Look", "Report"]}},
+    {"name": "noop", "arguments": {}},
+    {"name": "planner", "arguments": {"action": "mark_done", "step_index": 1}},
+    {"content": "All done."},
+]
+
+
+def _noop_tool() -> MagicMock:
+    tool = MagicMock()
+    tool.name = "noop"
+    tool.description = "no-op tool"
+    tool.parameters_schema = {"type": "object", "properties": {}}
+    tool.requires_approval = False
+    tool.supports_parallelism = False
+    tool.execute = AsyncMock(return_value={"success": True, "output": "observation " * 20})
+    return tool
+
+
+def _replay_agent(requests: list[list[str]], **agent_kwargs: Any) -> Agent:
+    """Agent whose provider replays ``_SCRIPT`` and records each request."""
+    turns = iter(enumerate(_SCRIPT))
+
+    async def stream(**kwargs: Any):
+        # Serialise at call time: the live list keeps mutating afterwards.
+        requests.append([json.dumps(m, sort_keys=True) for m in kwargs["messages"]])
+        idx, turn = next(turns)
+        if "content" in turn:
+            yield {"type": "token", "content": turn["content"]}
+        else:
+            yield {
+                "type": "tool_call_end",
+                "index": 0,
+                "id": f"call_{idx}",
+                "name": turn["name"],
+                "arguments": json.dumps(turn["arguments"]),
+            }
+        yield {"type": "done", "usage": {}}
+
+    state_manager = AsyncMock()
+    state_manager.load_state.return_value = {"answers": {}}
+    provider = AsyncMock()
+    provider.complete_stream = MagicMock(side_effect=lambda **kw: stream(**kw))
+    return Agent(
+        state_manager=state_manager,
+        llm_provider=provider,
+        tools=[_noop_tool()],
+        logger=MagicMock(),
+        max_steps=10,
+        **agent_kwargs,
+    )
+
+
+def _split(request: list[str]) -> tuple[list[str], str | None]:
+    """Split a serialised request into (cacheable prefix, volatile tail)."""
+    last = json.loads(request[-1])
+    if is_volatile_context_message(last):
+        return request[:-1], last["content"]
+    return request, None
+
+
+@pytest.mark.spec("context-manager.stable_prefix_byte_identical_across_steps")
+async def test_request_prefix_is_byte_identical_across_steps() -> None:
+    requests: list[list[str]] = []
+    agent = _replay_agent(requests)
+
+    result = await agent.execute("Look around and report", "s-cache")
+
+    assert result.final_message == "All done."
+    assert len(requests) == len(_SCRIPT)
+    prefixes = [_split(r)[0] for r in requests]
+    for earlier, later in zip(prefixes, prefixes[1:], strict=False):
+        assert later[: len(earlier)] == earlier
+    assert len({p[0] for p in prefixes}) == 1
+    assert "## CURRENT PLAN STATUS" not in prefixes[-1][0]
+
+    tails = [_split(r)[1] for r in requests[1:]]
+    assert all(t and t.startswith(VOLATILE_CONTEXT_HEADER) for t in tails)
+    assert "## CURRENT PLAN STATUS" in tails[0]
+    assert tails[0] != tails[-1]
+
+
+async def test_legacy_layout_rebuilds_system_prompt_with_plan() -> None:
+    requests: list[list[str]] = []
+    agent = _replay_agent(requests, prompt_cache_layout=False)
+
+    await agent.execute("Look around and report", "s-legacy")
+
+    assert all(_split(r)[1] is None for r in requests)
+    system_prompts = [json.loads(r[0])["content"] for r in requests]
+    assert "## CURRENT PLAN STATUS" not in system_prompts[0]
+    assert "## CURRENT PLAN STATUS" in system_prompts[1]
@@ -31,6 +31,8 @@ def test_round_trip_preserves_fields() -> None:
         last_evaluated_at=datetime(2026, 5, 1, 9, 0, tzinfo=UTC),
         last_action_taken="sent",
         metadata={"team": "platform"},
+        inputs=[{"type": "file", "path": "notes/*.md"}],
+        input_fingerprint="abc123",
     )
     encoded = goal.to_dict()
     decoded = StandingGoal.from_dict(encoded)
@@ -48,3 +50,5 @@ def test_from_dict_tolerates_missing_optional_fields() -> None:
     assert goal.priority == 5
     assert goal.enabled is True
     assert goal.metadata == {}
+    assert goal.inputs == []
+    assert goal.input_fingerprint == ""
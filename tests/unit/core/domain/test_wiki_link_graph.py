@@ -0,0 +1,82 @@
+"""Tests for WikiLinkGraph adjacency and lint queries."""
+
+from __future__ import annotations
+
+from taskforce.core.domain.wiki_link_graph import WikiLinkEntry, WikiLinkGraph
+from taskforce.core.domain.wiki_page import WikiPage
+
+
+def _graph(**bodies: str) -> WikiLinkGraph:
+    return WikiLinkGraph.from_pages(
+        WikiPage(name=name.replace("__", "/"), title=name, body=body)
+        for name, body in bodies.items()
+    )
+
+
+class TestAdjacency:
+    def test_forward_and_backward_links(self) -> None:
+        graph = _graph(
+            entities__a="[[entities/b]] and [[entities/c]] and [[entities/b]]",
+            entities__b="[[entities/c]]",
+            entities__c="",
+        )
+
+        assert graph.outlinks("entities/a") == ["entities/b", "entities/c"]
+        assert graph.backlinks("entities/c") == ["entities/a", "entities/b"]
+        assert graph.backlinks("entities/a") == []
+
+    def test_rewriting_a_page_moves_only_its_links(self) -> None:
+        graph = _graph(entities__a="[[entities/b]]", entities__b="", entities__c="")
+
+        graph.set_page("entities/a", WikiLinkEntry("A", "hook", ("entities/c",)))
+
+        assert graph.backlinks("entities/b") == []
+        assert graph.backlinks("entities/c") == ["entities/a"]
+
+    def test_removing_a_page_drops_its_outlinks_but_keeps_inbound(self) -> None:
+        graph = _graph(entities__a="[[entities/b]]", entities__b="[[entities/a]]")
+
+        assert graph.remove_page("entities/b") is True
+
+        assert graph.backlinks("entities/a") == []
+        assert graph.broken_links() == [("entities/a", "entities/b")]
+        assert graph.remove_page("entities/b") is False
+
+    def test_neighbourhood_follows_both_directions_to_depth(self) -> None:
+        graph = _graph(
+            entities__a="[[entities/b]]",
+            entities__b="[[entities/c]] [[entities/ghost]]",
+            entities__c="",
+            entities__d="[[entities/a]]",
+        )
+
+        assert graph.neighbourhood("entities/a") == {"entities/b", "entities/d"}
+        assert graph.neighbourhood("entities/a", depth=2) == {
+            "entities/b",
+            "entities/c",
+            "entities/d",
+        }
+
+
+class TestLintQueries:
+    def test_broken_links_orphans_and_duplicate_titles(self) -> None:
+        graph = WikiLinkGraph.from_pages(
+            [
+                WikiPage(name="entities/a", title="Same", body="[[entities/b]] [[x/ghost]]"),
+                WikiPage(name="entities/b", title="Same", body="[[entities/a]]"),
+                WikiPage(name="entities/c", title="C", body=""),
+            ]
+        )
+
+        assert graph.broken_links() == [("entities/a", "x/ghost")]
+        assert graph.orphans() == ["entities/c"]
+        assert graph.duplicate_titles() == [("Same", "entities/a", "entities/b")]
+
+    def test_link_to_a_page_written_later_resolves(self) -> None:
+        graph = _graph(entities__a="[[entities/b]]")
+        assert graph.broken_links() == [("entities/a", "entities/b")]
+
+        graph.set_page("entities/b", WikiLinkEntry("B", "", ()))
+
+        assert graph.broken_links() == []
+        assert graph.backlinks("entities/b") == ["entities/a"]
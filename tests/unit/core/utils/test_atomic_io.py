@@ -31,6 +31,33 @@ async def test_atomic_write_text_overwrites_existing(tmp_path: Path) -> None:
     assert target.read_text(encoding="utf-8") == "new"
 
 
+@pytest.mark.skipif(not hasattr(os, "fchmod"), reason="POSIX permission bits")
+async def test_atomic_write_text_applies_mode_before_writing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """``mode`` is set on the temp file's descriptor before the content lands."""
+    events: list[str] = []
+    real_fchmod = os.fchmod
+    real_fsync = os.fsync
+
+    def _spy_fchmod(fd: int, mode: int) -> None:
+        events.append(f"fchmod {mode:o}")
+        real_fchmod(fd, mode)
+
+    def _spy_fsync(fd: int) -> None:
+        events.append("fsync")
+        real_fsync(fd)
+
+    monkeypatch.setattr(atomic_io.os, "fchmod", _spy_fchmod)
+    monkeypatch.setattr(atomic_io.os, "fsync", _spy_fsync)
+    target = tmp_path / "secret.json"
+
+    await atomic_write_text(target, "token", mode=0o640)
+
+    assert events == ["fchmod 640", "fsync"]
+    assert target.stat().st_mode & 0o777 == 0o640
+
+
 async def test_atomic_write_text_fsyncs_before_rename(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -0,0 +1,144 @@
+"""Tests for the stat-validated config catalog."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+from taskforce.core.utils import config_catalog
+from taskforce.core.utils.config_catalog import ConfigCatalog
+
+
+def _backdate(*paths: Path, seconds: float = 60.0) -> None:
+    """Move mtimes out of the racy window so entries become cacheable."""
+    stamp = time.time() - seconds
+    for path in paths:
+        os.utime(path, (stamp, stamp))
+
+
+@pytest.fixture
+def counted_parser():
+    calls: list[str] = []
+
+    def parser(text: str) -> str:
+        calls.append(text)
+        return text.upper()
+
+    return parser, calls
+
+
+def test_listing_answers_existence_checks(tmp_path: Path):
+    (tmp_path / "butler.yaml").write_text("a: 1")
+    (tmp_path / "custom").mkdir()
+    catalog = ConfigCatalog()
+
+    assert catalog.is_file(tmp_path / "butler.yaml")
+    assert not catalog.is_file(tmp_path / "custom")
+    assert catalog.is_dir(tmp_path / "custom")
+    assert not catalog.is_file(tmp_path / "missing.yaml")
+    assert catalog.files(tmp_path, ".yaml") == [tmp_path / "butler.yaml"]
+    assert catalog.subdirs(tmp_path) == [tmp_path / "custom"]
+    assert catalog.entries(tmp_path / "nope") == {}
+
+
+@pytest.mark.spec("profiles.catalog_listing_revalidated_by_directory_stat")
+def test_stable_listing_is_cached_until_directory_changes(tmp_path: Path, monkeypatch):
+    (tmp_path / "a.yaml").write_text("a: 1")
+    _backdate(tmp_path)
+    scans: list[Path] = []
+    real_scandir = os.scandir
+
+    def counting_scandir(path):
+        scans.append(Path(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(config_catalog.os, "scandir", counting_scandir)
+    catalog = ConfigCatalog()
+
+    assert catalog.is_file(tmp_path / "a.yaml")
+    assert not catalog.is_file(tmp_path / "b.yaml")
+    assert len(scans) == 1
+
+    (tmp_path / "b.yaml").write_text("b: 2")
+    assert catalog.is_file(tmp_path / "b.yaml")
+    assert len(scans) == 2
+
+
+@pytest.mark.spec("profiles.catalog_reparses_only_changed_files")
+def test_parsed_document_cached_until_file_changes(tmp_path: Path, counted_parser):
+    parser, calls = counted_parser
+    path = tmp_path / "agent.yaml"
+    path.write_text("one")
+    _backdate(path)
+    catalog = ConfigCatalog()
+
+    assert catalog.parse(path, parser) == "ONE"
+    assert catalog.parse(path, parser) == "ONE"
+    assert len(calls) == 1
+
+    path.write_text("two!")
+    _backdate(path, seconds=30)
+    assert catalog.parse(path, parser) == "TWO!"
+    assert len(calls) == 2
+
+
+def test_recently_modified_files_are_never_cached(tmp_path: Path, counted_parser):
+    parser, calls = counted_parser
+    path = tmp_path / "fresh.yaml"
+    path.write_text("x")
+    catalog = ConfigCatalog()
+
+    catalog.parse(path, parser)
+    catalog.parse(path, parser)
+
+    assert len(calls) == 2
+
+
+def test_atomic_replace_with_same_size_and_mtime_is_detected(tmp_path: Path, counted_parser):
+    parser, calls = counted_parser
+    path = tmp_path / "agent.yaml"
+    path.write_text("aaa")
+    _backdate(path)
+    catalog = ConfigCatalog()
+    catalog.parse(path, parser)
+
+    replacement = tmp_path / ".tmp"
+    replacement.write_text("bbb")
+    os.utime(replacement, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns))
+    replacement.replace(path)
+
+    assert catalog.parse(path, parser) == "BBB"
+    assert len(calls) == 2
+
+
+async def test_load_yaml_returns_private_copies(tmp_path: Path):
+    path = tmp_path / "profile.yaml"
+    path.write_text("agent:\n  max_steps: 5\n")
+    _backdate(path)
+    catalog = ConfigCatalog()
+
+    first = catalog.load_yaml(path)
+    first["agent"]["max_steps"] = 99
+    second = await catalog.load_yaml_async(path)
+
+    assert second == {"agent": {"max_steps": 5}}
+    assert second is not first
+
+
+def test_missing_file_raises_and_bad_yaml_is_not_cached(tmp_path: Path):
+    catalog = ConfigCatalog()
+    with pytest.raises(FileNotFoundError):
+        catalog.load_yaml(tmp_path / "missing.yaml")
+
+    broken = tmp_path / "broken.yaml"
+    broken.write_text("a: [1,")
+    _backdate(broken)
+    with pytest.raises(yaml.YAMLError):
+        catalog.load_yaml(broken)
+    broken.write_text("a: [1]")
+    _backdate(broken, seconds=30)
+    assert catalog.load_yaml(broken) == {"a": [1]}
@@ -0,0 +1,77 @@
+"""Tests for the in-process metrics registry."""
+
+from __future__ import annotations
+
+import pytest
+
+from taskforce.core.utils.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    return MetricsRegistry(enabled=True)
+
+
+def test_counter_and_gauge_render(registry):
+    calls = registry.counter("calls_total", "Calls.", ("tool",))
+    calls.labels("read").inc()
+    calls.labels("read").inc(2)
+    calls.labels("write").inc()
+    depth = registry.gauge("queue_depth", "Depth.")
+    depth.set(3)
+    depth.dec()
+
+    text = registry.render()
+
+    assert "# TYPE calls_total counter" in text
+    assert 'calls_total{tool="read"} 3' in text
+    assert 'calls_total{tool="write"} 1' in text
+    assert "# TYPE queue_depth gauge" in text
+    assert "queue_depth 2" in text
+
+
+def test_histogram_buckets_are_cumulative_and_upper_inclusive(registry):
+    latency = registry.histogram("lat_seconds", "Latency.", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 5.0):
+        latency.observe(value)
+
+    lines = registry.render().splitlines()
+
+    assert 'lat_seconds_bucket{le="0.1"} 2' in lines
+    assert 'lat_seconds_bucket{le="1"} 3' in lines
+    assert 'lat_seconds_bucket{le="+Inf"} 4' in lines
+    assert "lat_seconds_count 4" in lines
+    assert "lat_seconds_sum 5.65" in lines
+
+
+def test_registration_is_get_or_create(registry):
+    first = registry.counter("x_total", "X.", ("a",))
+    assert registry.counter("x_total", "X.", ("a",)) is first
+    with pytest.raises(ValueError):
+        registry.gauge("x_total", "X.")
+    with pytest.raises(ValueError):
+        first.labels("a", "b")
+
+
+def test_label_values_are_escaped(registry):
+    registry.counter("e_total", "E.", ("path",)).labels('a"b\\c').inc()
+    assert 'e_total{path="a\\"b\\\\c"} 1' in registry.render()
+
+
+@pytest.mark.spec("observability.metrics_disabled_records_nothing")
+def test_disabled_registry_records_nothing():
+    registry = MetricsRegistry(enabled=False)
+    counter = registry.counter("off_total", "Off.")
+    counter.inc()
+    registry.histogram("off_seconds", "Off.").observe(1.0)
+    assert counter.labels().value == 0
+    assert registry.histogram("off_seconds", "Off.").labels().count == 0
+
+
+def test_reset_keeps_families(registry):
+    counter = registry.counter("r_total", "R.")
+    counter.inc()
+    registry.reset()
+    assert "\nr_total " not in registry.render()
+    counter.inc()
+    assert "r_total 1" in registry.render()
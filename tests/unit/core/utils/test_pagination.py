@@ -0,0 +1,44 @@
+"""Tests for keyset pagination helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from taskforce.core.utils.pagination import decode_cursor, encode_cursor, page_descending
+
+
+def test_cursor_round_trip() -> None:
+    key = ("2026-03-01T10:00:00+00:00", "conv/1?")
+    assert decode_cursor(encode_cursor(key)) == key
+
+
+@pytest.mark.parametrize("cursor", ["", "%%%", encode_cursor(("a",))[:-1] + "!", "bnVsbA"])
+def test_malformed_cursor_raises(cursor: str) -> None:
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_equal_timestamps_neither_skipped_nor_repeated() -> None:
+    keys = sorted(("2026-03-01", f"id-{i}") for i in range(5))
+    items = [key[1] for key in keys]
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = page_descending(items, keys, limit=2, cursor=cursor)
+        seen.extend(page)
+        if cursor is None:
+            break
+    assert seen == list(reversed(items))
+
+
+def test_predicate_does_not_count_towards_limit() -> None:
+    keys = [(str(i), str(i)) for i in range(10)]
+    items = list(range(10))
+
+    page, cursor = page_descending(items, keys, limit=2, predicate=lambda i: i % 3 == 0)
+
+    assert page == [9, 6]
+    rest, cursor = page_descending(
+        items, keys, limit=2, cursor=cursor, predicate=lambda i: i % 3 == 0
+    )
+    assert (rest, cursor) == ([3, 0], None)
@@ -0,0 +1,336 @@
+"""Tests for the embedded in-process ctxman engine."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from taskforce.core.domain.lean_agent_components.message_history_manager import (
+    MessageHistoryManager,
+)
+from taskforce.core.domain.token_budgeter import TokenBudgeter
+from taskforce.infrastructure.context import ctxman_embedded
+from taskforce.infrastructure.context.ctxman_client import (
+    CtxmanConflictError,
+    CtxmanGoneError,
+    CtxmanIncompleteUnitError,
+)
+from taskforce.infrastructure.context.ctxman_context_manager import (
+    CtxmanConfig,
+    CtxmanContextManager,
+    build_ctxman_context_manager_factory,
+)
+from taskforce.infrastructure.context.ctxman_embedded import EmbeddedCtxmanEngine
+
+STATIC = [{"kind": "system_prompt", "role": "system", "content": "base", "source": "core"}]
+
+
+def _tool_call(call_id: str, name: str = "file_read") -> dict[str, Any]:
+    return {
+        "kind": "tool_call",
+        "role": "assistant",
+        "tool_call_id": call_id,
+        "content": json.dumps({"name": name, "arguments": '{"path": "a"}'}),
+    }
+
+
+def _tool_result(call_id: str, content: str) -> dict[str, Any]:
+    return {"kind": "tool_result", "role": "tool", "tool_call_id": call_id, "content": content}
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> EmbeddedCtxmanEngine:
+    return EmbeddedCtxmanEngine(storage_dir=tmp_path, default_budget_tokens=10_000)
+
+
+@pytest.fixture
+def history_manager() -> Mock:
+    mhm = Mock(spec=MessageHistoryManager)
+    mhm.build_initial_messages = Mock(
+        return_value=[
+            {"role": "system", "content": "base prompt"},
+            {"role": "user", "content": "the mission"},
+        ]
+    )
+    mhm.compress_messages = AsyncMock(side_effect=lambda msgs: msgs)
+    mhm.preflight_budget_check = Mock(side_effect=lambda msgs: msgs)
+    return mhm
+
+
+@pytest.mark.spec("context-manager-ctxman.embedded_engine_round_trip")
+async def test_adapter_round_trip_renders_valid_openai_history(
+    engine: EmbeddedCtxmanEngine, history_manager: Mock
+) -> None:
+    logger = Mock()
+    adapter = CtxmanContextManager(
+        client=engine,
+        message_history_manager=history_manager,
+        openai_tools=[{"type": "function", "function": {"name": "file_read"}}],
+        token_budgeter=TokenBudgeter(logger=logger, max_input_tokens=100_000),
+        logger=logger,
+    )
+    adapter.initialize("the mission", {}, "base prompt")
+    adapter.append_message(
+        {
+            "role": "assistant",
+            "content": "",
+            "tool_calls": [
+                {"id": "c1", "function": {"name": "file_read", "arguments": '{"path": "a"}'}},
+            ],
+        }
+    )
+    adapter.append_message({"role": "tool", "tool_call_id": "c1", "content": "file body"})
+    messages = adapter.messages
+
+    await adapter.prepare_for_llm(rebuild_system_prompt=False)
+
+    assert adapter.messages is messages
+    assert messages == [
+        {"role": "system", "content": "base prompt"},
+        {"role": "user", "content": "the mission"},
+        {
+            "role": "assistant",
+            "content": "",
+            "tool_calls": [
+                {
+                    "id": "c1",
+                    "type": "function",
+                    "function": {"name": "file_read", "arguments": '{"path": "a"}'},
+                }
+            ],
+        },
+        {"role": "tool", "tool_call_id": "c1", "content": "file body"},
+    ]
+    assert await adapter.expand_ref("seg-2") == {"success": True, "content": "file body"}
+
+
+async def test_static_region_replaced_only_when_hash_changes(
+    engine: EmbeddedCtxmanEngine,
+) -> None:
+    session_id, version = await engine.create_session(static_segments=STATIC)
+
+    same = await engine.replace_static_segments(
+        session_id, STATIC, if_match=version, idempotency_key="k1"
+    )
+    assert same == {"static_epoch": 0, "context_version": version}
+
+    changed = await engine.replace_static_segments(
+        session_id,
+        [{**STATIC[0], "content": "new base"}],
+        if_match=version,
+        idempotency_key="k2",
+    )
+    assert changed["static_epoch"] == 1
+    with pytest.raises(CtxmanConflictError):
+        await engine.replace_static_segments(
+            session_id, STATIC, if_match=version, idempotency_key="k3"
+        )
+    rendered = await engine.render(session_id, provider="openai")
+    assert rendered.system == "new base"
+    assert rendered.cache_breakpoints[0]["static_epoch"] == 1
+
+
+async def test_append_replays_key_and_rejects_open_units(engine: EmbeddedCtxmanEngine) -> None:
+    session_id, _ = await engine.create_session(static_segments=STATIC)
+    batch = [{"kind": "user_msg", "role": "user", "content": "hi"}]
+
+    first = await engine.append_segments(session_id, batch, idempotency_key="s:0")
+    replay = await engine.append_segments(session_id, batch, idempotency_key="s:0")
+    assert replay == first
+    assert len((await engine.render(session_id, provider="openai")).messages) == 1
+
+    with pytest.raises(CtxmanIncompleteUnitError) as exc_info:
+        await engine.append_segments(
+            session_id,
+            [_tool_call("c1"), {"kind": "user_msg", "role": "user", "content": "next"}],
+            idempotency_key="s:1",
+        )
+    assert exc_info.value.open_tool_call_ids == ["c1"]
+
+
+@pytest.mark.spec("context-manager-ctxman.embedded_watermark_gc")
+async def test_watermark_elides_then_major_gc_evicts(engine: EmbeddedCtxmanEngine) -> None:
+    session_id, _ = await engine.create_session(
+        static_segments=STATIC, policy_overrides={"budget_tokens": 5_000}
+    )
+    segments: list[dict[str, Any]] = [{"kind": "user_msg", "role": "user", "content": "mission"}]
+    for i in range(6):
+        segments += [_tool_call(f"c{i}"), _tool_result(f"c{i}", f"row {i} " * 400)]
+    await engine.append_segments(session_id, segments, idempotency_key="s:0")
+
+    rendered = await engine.render(session_id, provider="openai")
+
+    tool_messages = [m for m in rendered.messages if m["role"] == "tool"]
+    assert tool_messages[0]["content"].startswith("[elided")
+    assert tool_messages[-1]["content"].startswith("row 5")
+    elided_id = "seg-2"
+    assert (await engine.get_ref(session_id, elided_id))["content"] == "row 0 " * 400
+
+    await engine.append_segments(
+        session_id,
+        [_tool_call("big"), _tool_result("big", "x" * 4_000)],
+        idempotency_key="s:1",
+    )
+    await engine.gc(session_id, level="major")
+
+    with pytest.raises(CtxmanGoneError) as exc_info:
+        await engine.get_ref(session_id, elided_id)
+    assert exc_info.value.summary.startswith("row 0")
+    rendered = await engine.render(session_id, provider="openai")
+    assert rendered.messages[0] == {"role": "user", "content": "mission"}
+    assert rendered.tokens_total <= 5_000 * 0.7
+
+
+async def test_frames_scope_render_and_evict_on_pop(engine: EmbeddedCtxmanEngine) -> None:
+    session_id, _ = await engine.create_session(static_segments=STATIC)
+    await engine.append_segments(
+        session_id,
+        [{"kind": "user_msg", "role": "user", "content": "parent"}, _tool_call("agent")],
+        idempotency_key="p:0",
+    )
+    frame_id = await engine.push_frame(session_id, "coder", idempotency_key="f1")
+    child_ids, _ = await engine.append_segments(
+        session_id,
+        [{"kind": "user_msg", "role": "user", "content": "child task"}],
+        idempotency_key="c:0",
+    )
+
+    framed = await engine.render(session_id, provider="openai", scope="frame")
+    assert framed.messages == [{"role": "user", "content": "child task"}]
+
+    with pytest.raises(CtxmanConflictError):
+        await engine.pop_frame(session_id, "frame-99", return_content="x", idempotency_key="f2")
+    popped = await engine.pop_frame(
+        session_id, frame_id, return_content="Sub-agent coder completed", idempotency_key="f3"
+    )
+    await engine.append_segments(
+        session_id, [_tool_result("agent", "done")], idempotency_key="p:1"
+    )
+
+    rendered = await engine.render(session_id, provider="openai")
+    assert [m["role"] for m in rendered.messages] == ["user", "assistant", "tool"]
+    with pytest.raises(CtxmanGoneError):
+        await engine.get_ref(session_id, child_ids[0])
+    returned = await engine.get_ref(session_id, popped["return_segment_id"])
+    assert returned["content"] == "Sub-agent coder completed"
+
+
+@pytest.mark.spec("context-manager-ctxman.embedded_sessions_persist_locally")
+async def test_sessions_reload_from_disk_and_expire(tmp_path: Path) -> None:
+    engine = EmbeddedCtxmanEngine(storage_dir=tmp_path)
+    session_id, _ = await engine.create_session(static_segments=STATIC)
+    await engine.append_segments(
+        session_id,
+        [{"kind": "user_msg", "role": "user", "content": "remember me"}],
+        idempotency_key="s:0",
+    )
+    await engine.archive_session(session_id, idempotency_key="a")
+
+    reloaded = EmbeddedCtxmanEngine(storage_dir=tmp_path)
+    replay, _ = await reloaded.append_segments(
+        session_id,
+        [{"kind": "user_msg", "role": "user", "content": "remember me"}],
+        idempotency_key="s:0",
+    )
+    rendered = await reloaded.render(session_id, provider="openai")
+    assert replay == ["seg-0"]
+    assert rendered.messages == [{"role": "user", "content": "remember me"}]
+
+    session_file = tmp_path / session_id / "session.json"
+    stale = time.time() - 3 * 3600
+    os.utime(session_file, (stale, stale))
+    expiring = EmbeddedCtxmanEngine(storage_dir=tmp_path, retention_hours=1)
+    with pytest.raises(CtxmanGoneError):
+        await expiring.get_session(session_id)
+    assert not (tmp_path / session_id).exists()
+
+
+async def test_stale_sessions_are_swept_without_being_requested(tmp_path: Path) -> None:
+    seed = EmbeddedCtxmanEngine(storage_dir=tmp_path)
+    stale_id, _ = await seed.create_session(static_segments=STATIC)
+    stale = time.time() - 3 * 3600
+    os.utime(tmp_path / stale_id / "session.json", (stale, stale))
+
+    engine = EmbeddedCtxmanEngine(storage_dir=tmp_path, retention_hours=1)
+    fresh_id, _ = await engine.create_session(static_segments=STATIC)
+    await engine._sweep_task
+
+    assert not (tmp_path / stale_id).exists()
+    assert (tmp_path / fresh_id / "session.json").is_file()
+
+
+async def test_idle_and_surplus_sessions_are_released_from_memory(tmp_path: Path) -> None:
+    engine = EmbeddedCtxmanEngine(
+        storage_dir=tmp_path, idle_release_seconds=60, max_resident_sessions=2
+    )
+    idle_id, _ = await engine.create_session(static_segments=STATIC)
+    engine._sessions[idle_id].last_used -= 120
+    first_id, _ = await engine.create_session(static_segments=STATIC)
+    assert list(engine._sessions) == [first_id]
+
+    second_id, _ = await engine.create_session(static_segments=STATIC)
+    await engine.get_session(first_id)
+    third_id, _ = await engine.create_session(static_segments=STATIC)
+
+    assert list(engine._sessions) == [first_id, third_id]
+    assert (await engine.get_session(idle_id))["session_id"] == idle_id
+    assert (await engine.get_session(second_id))["session_id"] == second_id
+
+
+async def test_sweep_task_of_a_closed_loop_is_replaced(tmp_path: Path) -> None:
+    engine = EmbeddedCtxmanEngine(storage_dir=tmp_path)
+    other_loop = asyncio.new_event_loop()
+    engine._sweep_task = other_loop.create_future()  # type: ignore[assignment]
+    other_loop.close()
+
+    await engine.create_session(static_segments=STATIC)
+
+    assert engine._sweep_task.get_loop() is asyncio.get_running_loop()
+    await engine._sweep_task
+
+
+async def test_coalesced_persist_callers_wait_for_the_write(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    engine = EmbeddedCtxmanEngine(storage_dir=tmp_path)
+    session_id, _ = await engine.create_session(static_segments=STATIC)
+
+    async def failing_write(path: Path, text: str) -> None:
+        await asyncio.sleep(0)
+        raise OSError("disk full")
+
+    monkeypatch.setattr(ctxman_embedded, "atomic_write_text", failing_write)
+    results = await asyncio.gather(
+        engine.push_frame(session_id, "a", idempotency_key="f:a"),
+        engine.push_frame(session_id, "b", idempotency_key="f:b"),
+        return_exceptions=True,
+    )
+
+    assert [type(r) for r in results] == [OSError, OSError]
+
+
+def test_factory_uses_embedded_engine(tmp_path: Path, history_manager: Mock) -> None:
+    config = CtxmanConfig.from_dict(
+        {"engine": "embedded", "embedded": {"storage_dir": str(tmp_path)}}
+    )
+    logger = Mock()
+
+    adapter = build_ctxman_context_manager_factory(config)(
+        message_history_manager=history_manager,
+        openai_tools=[],
+        token_budgeter=TokenBudgeter(logger=logger, max_input_tokens=10_000),
+        logger=logger,
+    )
+
+    assert isinstance(adapter._client, EmbeddedCtxmanEngine)
+    with pytest.raises(ValueError, match="engine"):
+        CtxmanConfig.from_dict({"engine": "grpc"})
+    with pytest.raises(ValueError, match="openai"):
+        CtxmanConfig.from_dict({"engine": "embedded", "provider": "anthropic"})
@@ -0,0 +1,208 @@
+"""Tests for FileWatcherEventSource and its event coalescer.
+
+The storms in ``tests/fixtures/file_event_storms/`` were recorded from a
+real watchdog observer (inotify): one JSON line per raw callback with
+its offset in milliseconds and the path relative to the watched root.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from taskforce.core.domain.agent_event import AgentEvent, AgentEventType
+from taskforce.infrastructure.event_sources.file_event_coalescer import (
+    FileChange,
+    FileChangeBatch,
+    FileEventCoalescer,
+)
+from taskforce.infrastructure.event_sources.file_watcher_source import (
+    FileWatcherEventSource,
+)
+
+STORMS = Path(__file__).parents[3] / "fixtures" / "file_event_storms"
+ROOT = "/watched"
+
+
+def _storm(name: str) -> list[dict]:
+    lines = (STORMS / f"{name}.jsonl").read_text(encoding="utf-8").splitlines()
+    return [json.loads(line) for line in lines]
+
+
+def _replay(coalescer: FileEventCoalescer, rows: list[dict]) -> list[FileChange | FileChangeBatch]:
+    """Feed raw callbacks at their recorded times, flushing like the source does."""
+    emitted: list[FileChange | FileChangeBatch] = []
+
+    def run_until(now: float) -> None:
+        while (deadline := coalescer.next_deadline()) is not None and deadline <= now:
+            emitted.extend(coalescer.flush(deadline))
+
+    for row in rows:
+        now = row["t"] / 1000
+        run_until(now)
+        dest = f"{ROOT}/{row['dest']}" if "dest" in row else None
+        coalescer.add(row["type"], f"{ROOT}/{row['path']}", row["dir"], now, dest_path=dest)
+    run_until(float("inf"))
+    return emitted
+
+
+def _summary(emitted: list[FileChange | FileChangeBatch]) -> list[tuple]:
+    return [
+        ("batch", item.root, item.counts)
+        if isinstance(item, FileChangeBatch)
+        else (item.change_type, item.path.removeprefix(ROOT + "/"))
+        for item in emitted
+    ]
+
+
+class TestRecordedStorms:
+    @pytest.mark.parametrize(
+        ("storm", "raw_count", "expected"),
+        [
+            # probe file, rename to backup, write new file, delete backup
+            ("vim_save", 13, [("modified", "notes.md")]),
+            # write a hidden temp file, rename it over the target
+            ("atomic_rename_save", 9, [("modified", "config.yaml")]),
+            # three truncate-and-write saves in quick succession
+            ("inplace_save", 6, [("modified", "report.txt")]),
+            # 300 files rewritten, one added, plus .git bookkeeping
+            (
+                "git_checkout",
+                1818,
+                [("batch", ROOT, {"modified": 303, "created": 1})],
+            ),
+            ("rm_build_dir", 402, [("batch", f"{ROOT}/build", {"deleted": 201})]),
+        ],
+    )
+    def test_storm_collapses_to_expected_events(
+        self, storm: str, raw_count: int, expected: list[tuple]
+    ) -> None:
+        rows = _storm(storm)
+        assert len(rows) == raw_count
+
+        assert _summary(_replay(FileEventCoalescer(), rows)) == expected
+
+    def test_batch_lists_paths_up_to_the_cap(self) -> None:
+        (batch,) = _replay(FileEventCoalescer(max_batch_paths=50), _storm("rm_build_dir"))
+
+        assert isinstance(batch, FileChangeBatch)
+        assert len(batch.changes) == 50 and batch.truncated == 151
+        assert batch.counts == {"deleted": 201}
+
+
+class TestCollapsing:
+    def test_rename_reports_moved_when_watched(self) -> None:
+        coalescer = FileEventCoalescer(change_types=("created", "deleted", "moved"))
+        coalescer.add("moved", "/w/a.txt", False, 0.0, dest_path="/w/b.txt")
+
+        assert coalescer.flush(1.0) == [FileChange("/w/b.txt", "moved", False, src_path="/w/a.txt")]
+
+    def test_rename_splits_into_deleted_and_created_otherwise(self) -> None:
+        coalescer = FileEventCoalescer()
+        coalescer.add("moved", "/w/a.txt", False, 0.0, dest_path="/w/b.txt")
+
+        assert sorted(coalescer.flush(1.0), key=lambda c: c.path) == [
+            FileChange("/w/a.txt", "deleted", False),
+            FileChange("/w/b.txt", "created", False),
+        ]
+
+    def test_created_then_modified_reports_created(self) -> None:
+        coalescer = FileEventCoalescer()
+        coalescer.add("created", "/w/new.md", False, 0.0)
+        coalescer.add("modified", "/w/new.md", False, 0.2)
+
+        assert coalescer.flush(0.6) == []  # still inside the quiet window
+        assert coalescer.flush(0.7) == [FileChange("/w/new.md", "created", False)]
+
+    def test_continuously_written_file_reports_every_max_wait(self) -> None:
+        coalescer = FileEventCoalescer(max_wait_seconds=5.0)
+        rows = [
+            {"t": ms, "type": "modified", "path": "app.log", "dir": False}
+            for ms in range(0, 12_000, 100)
+        ]
+
+        assert _summary(_replay(coalescer, rows)) == [("modified", "app.log")] * 3
+
+
+class TestRateCap:
+    def test_steady_stream_never_exceeds_events_per_minute(self) -> None:
+        # One new file every 100 ms for two minutes, each quiet on its own.
+        rows = [
+            {"t": ms, "type": "created", "path": f"in/{ms}.csv", "dir": False}
+            for ms in range(0, 120_000, 100)
+        ]
+        emitted = _replay(FileEventCoalescer(batch_threshold=5, max_events_per_minute=30), rows)
+
+        assert len(emitted) <= 2 * 30 + 5
+        reported = sum(
+            len(item.changes) if isinstance(item, FileChangeBatch) else 1 for item in emitted
+        )
+        assert reported == len(rows)
+
+    def test_unknown_change_type_is_rejected(self) -> None:
+        with pytest.raises(ValueError, match="renamed"):
+            FileEventCoalescer(change_types=("created", "renamed"))
+
+
+class TestSource:
+    async def test_atomic_save_emits_one_event(self, tmp_path: Path) -> None:
+        target = tmp_path / "config.yaml"
+        target.write_text("a: 1\n", encoding="utf-8")
+        received: asyncio.Queue[AgentEvent] = asyncio.Queue()
+        source = FileWatcherEventSource(
+            [str(tmp_path)], event_callback=received.put, debounce_seconds=0.1
+        )
+        await source.start()
+        try:
+            await asyncio.sleep(0.1)
+            temp = tmp_path / ".config.yaml.swp"
+            for value in range(5):
+                temp.write_text(f"a: {value}\n", encoding="utf-8")
+            os.replace(temp, target)
+
+            event = await asyncio.wait_for(received.get(), timeout=5)
+            await asyncio.sleep(0.3)
+        finally:
+            await source.stop()
+
+        assert event.event_type == AgentEventType.FILE_CHANGED
+        assert event.payload == {
+            "path": str(target),
+            "change_type": "modified",
+            "is_directory": False,
+        }
+        assert received.empty()
+
+    async def test_bulk_change_emits_one_batch_event(self, tmp_path: Path) -> None:
+        received: asyncio.Queue[AgentEvent] = asyncio.Queue()
+        source = FileWatcherEventSource(
+            [str(tmp_path)], event_callback=received.put, debounce_seconds=0.2
+        )
+        await source.start()
+        try:
+            await asyncio.sleep(0.1)
+            for index in range(100):
+                (tmp_path / f"f{index}.txt").write_text("x", encoding="utf-8")
+
+            event = await asyncio.wait_for(received.get(), timeout=5)
+            await asyncio.sleep(0.4)
+        finally:
+            await source.stop()
+
+        assert event.payload["change_type"] == "batch"
+        assert event.payload["path"] == str(tmp_path)
+        assert event.payload["counts"] == {"created": 100}
+        assert len(event.payload["paths"]) == 100
+        assert received.empty()
+
+    def test_from_config_reads_coalescing_settings(self) -> None:
+        source = FileWatcherEventSource.from_config(
+            {"paths": "/tmp", "debounce_ms": 250, "batch_threshold": 7, "max_events_per_minute": 10}
+        )
+        assert source._coalescer.debounce_seconds == 0.25
+        assert source._coalescer.batch_threshold == 7
+        assert source._coalescer.max_events_per_minute == 10
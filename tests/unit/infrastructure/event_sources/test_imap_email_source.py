@@ -0,0 +1,258 @@
+"""Tests for IMAPEmailEventSource against an in-process IMAP server."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import time
+
+import pytest
+
+from taskforce.core.domain.agent_event import AgentEvent, AgentEventType
+from taskforce.infrastructure.event_sources.imap_email_source import IMAPEmailEventSource
+from taskforce.infrastructure.event_sources.imap_session import (
+    _parse,
+    _tokens,
+    parse_bodystructure,
+)
+from tests.fixtures.imap_server import FakeIMAPServer
+from tests.fixtures.imap_server import build_message as _mail
+
+ATTACHMENT = bytes(range(256)) * 400  # ~100 KB
+
+
+@pytest.fixture
+def server():
+    with FakeIMAPServer() as srv:
+        yield srv
+
+
+def _source(server: FakeIMAPServer, **kwargs) -> IMAPEmailEventSource:
+    kwargs.setdefault("poll_interval_seconds", 3600)
+    return IMAPEmailEventSource(
+        host="127.0.0.1",
+        username="butler",
+        password="secret",
+        port=server.port,
+        use_ssl=False,
+        **kwargs,
+    )
+
+
+class TestIncrementalFetch:
+    async def test_first_poll_emits_unseen_then_only_new_messages(self, server) -> None:
+        server.deliver(_mail("first"))
+        server.deliver(_mail("second"))
+        source = _source(server)
+        try:
+            first = await source._poll_once()
+            assert [e.payload["subject"] for e in first] == ["first", "second"]
+            assert first[0].event_type == AgentEventType.EMAIL_RECEIVED
+            assert first[0].payload["body"].strip() == "Hello there"
+            assert first[0].payload["uidvalidity"] == 1
+            assert all(m.seen for m in server.messages)
+
+            assert await source._poll_once() == []
+
+            server.deliver(_mail("third"))
+            third = await source._poll_once()
+            assert [e.payload["subject"] for e in third] == ["third"]
+            assert server.logins == 1
+        finally:
+            await source.stop()
+
+    async def test_attachments_are_listed_not_downloaded(self, server) -> None:
+        server.deliver(_mail("with pdf", "See attached.", attachment=ATTACHMENT))
+        source = _source(server)
+        try:
+            before = server.bytes_sent
+            (event,) = await source._poll_once()
+            transferred = server.bytes_sent - before
+
+            assert event.payload["body"].strip() == "See attached."
+            assert event.payload["attachments"] == [
+                {
+                    "part": "2",
+                    "filename": "report.pdf",
+                    "content_type": "application/pdf",
+                    "size": event.payload["attachments"][0]["size"],
+                }
+            ]
+            assert transferred < len(ATTACHMENT) / 10
+
+            data = await source.fetch_attachment(
+                event.payload["uid"], "2", uidvalidity=event.payload["uidvalidity"]
+            )
+            assert data == ATTACHMENT
+        finally:
+            await source.stop()
+
+    async def test_read_only_mode_leaves_messages_unseen_without_reemitting(self, server) -> None:
+        server.deliver(_mail("audit"))
+        source = _source(server, mark_seen=False)
+        try:
+            assert len(await source._poll_once()) == 1
+            assert await source._poll_once() == []
+            assert not server.messages[0].seen
+            assert any(c.startswith("EXAMINE") for c in server.commands)
+        finally:
+            await source.stop()
+
+    async def test_uidvalidity_change_starts_over_from_unseen(self, server) -> None:
+        server.deliver(_mail("kept unseen"))
+        source = _source(server, mark_seen=False)
+        try:
+            await source._poll_once()
+            server.reset_uids(uidvalidity=2)
+            server.disconnect_all()
+            await source._poll_once()  # notices the dropped connection
+
+            events = await source._poll_once()
+            assert [e.payload["uid"] for e in events] == [1000]
+            assert events[0].payload["uidvalidity"] == 2
+        finally:
+            await source.stop()
+
+    async def test_unknown_charset_decodes_as_utf8(self, server) -> None:
+        server.deliver(
+            b"Subject: odd charset\r\n"
+            b"Content-Type: text/plain; charset=unknown-8bit\r\n"
+            b"Content-Transfer-Encoding: base64\r\n\r\n"
+            + base64.b64encode("Grüße".encode())
+            + b"\r\n"
+        )
+        source = _source(server)
+        try:
+            (event,) = await source._poll_once()
+            assert event.payload["body"].strip() == "Grüße"
+        finally:
+            await source.stop()
+
+    async def test_failed_payload_fetch_does_not_skip_messages(self, server, monkeypatch) -> None:
+        server.deliver(_mail("retried"))
+        source = _source(server)
+        try:
+            assert len(await source._poll_once()) == 1
+            session = source._session
+            original = session._fetch_payloads
+
+            def _fail_once(conn, uids):
+                monkeypatch.setattr(session, "_fetch_payloads", original)
+                raise ValueError("boom")
+
+            monkeypatch.setattr(session, "_fetch_payloads", _fail_once)
+            server.deliver(_mail("arrives later"))
+            assert await source._poll_once() == []
+
+            events = await source._poll_once()
+            assert [e.payload["subject"] for e in events] == ["arrives later"]
+        finally:
+            await source.stop()
+
+
+class TestConnectionLifecycle:
+    async def test_reconnects_after_connection_loss_without_duplicates(self, server) -> None:
+        server.deliver(_mail("before"))
+        source = _source(server)
+        try:
+            await source._poll_once()
+            server.disconnect_all()
+            assert await source._poll_once() == []
+            assert source._failures == 1
+
+            server.deliver(_mail("after"))
+            events = await source._poll_once()
+            assert [e.payload["subject"] for e in events] == ["after"]
+            assert server.logins == 2 and source._failures == 0
+        finally:
+            await source.stop()
+
+    async def test_read_only_reconnect_does_not_reemit_unseen(self, server) -> None:
+        server.deliver(_mail("kept unseen"))
+        source = _source(server, mark_seen=False)
+        try:
+            assert len(await source._poll_once()) == 1
+            session = source._session
+            server.disconnect_all()
+            assert await source._poll_once() == []
+            assert source._failures == 1
+
+            server.deliver(_mail("new"))
+            events = await source._poll_once()
+            assert [e.payload["subject"] for e in events] == ["new"]
+            assert source._session is session
+        finally:
+            await source.stop()
+
+    def test_reconnect_backoff_doubles_and_is_capped_by_poll_interval(self) -> None:
+        source = IMAPEmailEventSource("h", "u", password="p", poll_interval_seconds=10)
+        delays = []
+        for failures in (1, 2, 3, 8):
+            source._failures = failures
+            delays.append(source._reconnect_delay())
+        assert 0.5 <= delays[0] <= 1 and 1 <= delays[1] <= 2 and 2 <= delays[2] <= 4
+        assert 5 <= delays[3] <= 10
+
+    async def test_idle_push_delivers_event_without_waiting_for_poll(self, server) -> None:
+        received: asyncio.Queue[AgentEvent] = asyncio.Queue()
+        source = _source(server, event_callback=received.put)
+        await source.start()
+        try:
+            for _ in range(100):  # wait until the watcher is idling
+                if any(c == "IDLE" for c in server.commands):
+                    break
+                await asyncio.sleep(0.02)
+            delivered = time.monotonic()
+            server.deliver(_mail("pushed"))
+            event = await asyncio.wait_for(received.get(), timeout=5)
+            latency = time.monotonic() - delivered
+        finally:
+            await source.stop()
+
+        assert event.payload["subject"] == "pushed"
+        assert latency < 2  # poll interval is an hour
+        assert server.logins == 1
+
+    async def test_falls_back_to_interval_polling_without_idle(self) -> None:
+        with FakeIMAPServer(idle=False) as server:
+            received: asyncio.Queue[AgentEvent] = asyncio.Queue()
+            source = _source(server, poll_interval_seconds=0.05, event_callback=received.put)
+            await source.start()
+            try:
+                await asyncio.sleep(0.1)
+                server.deliver(_mail("polled"))
+                event = await asyncio.wait_for(received.get(), timeout=5)
+            finally:
+                await source.stop()
+
+        assert event.payload["subject"] == "polled"
+        assert "IDLE" not in server.commands and server.logins == 1
+
+    def test_from_config_reads_idle_settings(self) -> None:
+        source = IMAPEmailEventSource.from_config(
+            {"host": "h", "username": "u", "idle": False, "idle_refresh_minutes": 5}
+        )
+        assert source._use_idle is False
+        assert source._idle_refresh == 300
+
+
+def test_bodystructure_finds_nested_text_and_attachments() -> None:
+    raw = (
+        b'((("TEXT" "PLAIN" ("CHARSET" "iso-8859-1") NIL NIL "QUOTED-PRINTABLE" 120 4 NIL NIL)'
+        b'("TEXT" "HTML" ("CHARSET" "utf-8") NIL NIL "7BIT" 300 8 NIL NIL) "ALTERNATIVE" '
+        b'("BOUNDARY" "inner") NIL NIL)'
+        b'("IMAGE" "PNG" ("NAME" "logo.png") NIL NIL "BASE64" 4000 NIL '
+        b'("INLINE" ("FILENAME" "logo.png")) NIL)'
+        b'("APPLICATION" "PDF" NIL NIL NIL "BASE64" 90000 NIL ("ATTACHMENT" '
+        b'("FILENAME" "a.pdf")) NIL) "MIXED" ("BOUNDARY" "outer") NIL NIL)'
+    )
+    structure = parse_bodystructure(_parse(_tokens(raw))[0])
+
+    assert structure.text is not None
+    assert structure.text.part == "1.1"
+    assert structure.text.charset == "iso-8859-1"
+    assert structure.text.encoding == "quoted-printable"
+    assert [(a.part, a.filename) for a in structure.attachments] == [
+        ("2", "logo.png"),
+        ("3", "a.pdf"),
+    ]
@@ -99,12 +99,14 @@ async def test_complete_returns_error_dict_on_provider_exception(config_file):
 @pytest.mark.asyncio
 async def test_retry_exponential_backoff_until_max_attempts(config_file):
     """A retryable error is retried up to retry.max_attempts with
-    backoff_multiplier ** attempt seconds between attempts."""
+    backoff_multiplier ** attempt seconds between attempts (jitter pinned
+    to the top of its [base/2, base] range)."""
     service = LiteLLMService(config_path=config_file)
 
     with (
         patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion,
         patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        patch("random.uniform", side_effect=lambda low, high: high),
     ):
         mock_completion.side_effect = Exception("503 service unavailable")
         result = await service.complete(
@@ -118,6 +120,37 @@ async def test_retry_exponential_backoff_until_max_attempts(config_file):
     assert result["success"] is False
 
 
+@pytest.mark.spec("llm-service.retry_backoff_is_jittered_and_honours_retry_after")
+@pytest.mark.asyncio
+async def test_retry_backoff_is_jittered_and_honours_retry_after(config_file):
+    """Backoffs fall in [base/2, base]; a Retry-After hint is a lower bound,
+    and one longer than retry.max_backoff_seconds ends the loop."""
+    service = LiteLLMService(config_path=config_file)
+
+    with (
+        patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion,
+        patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+    ):
+        mock_completion.side_effect = Exception("503 service unavailable")
+        await service.complete(messages=[{"role": "user", "content": "hi"}], model="main")
+        jittered = [c.args[0] for c in mock_sleep.await_args_list]
+
+        mock_sleep.reset_mock()
+        mock_completion.side_effect = Exception("429 rate limit, retry after 7 seconds")
+        await service.complete(messages=[{"role": "user", "content": "hi"}], model="main")
+        hinted = [c.args[0] for c in mock_sleep.await_args_list]
+
+        mock_sleep.reset_mock()
+        mock_completion.reset_mock()
+        mock_completion.side_effect = Exception("429 rate limit, retry after 3600 seconds")
+        result = await service.complete(messages=[{"role": "user", "content": "hi"}], model="main")
+
+    assert 0.5 <= jittered[0] <= 1 and 1 <= jittered[1] <= 2
+    assert hinted == [7, 7]
+    assert mock_sleep.await_count == 0 and mock_completion.await_count == 1
+    assert result["success"] is False
+
+
 # ---------------------------------------------------------------------------
 # Model alias resolution + parameter merge
 # ---------------------------------------------------------------------------
@@ -320,3 +353,83 @@ async def test_complete_json_returns_parse_error_on_invalid_json(config_file):
     assert result["success"] is False
     assert result["error_type"] == "JSONDecodeError"
     assert result["raw_content"] == "this is not json"
+
+
+# ---------------------------------------------------------------------------
+# Prompt caching
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.spec("llm-service.cache_breakpoints_precede_volatile_tail")
+def test_cache_breakpoints_precede_volatile_tail(tmp_path):
+    """Claude models get breakpoints on messages[0] and the last history
+    message before the volatile tail; OpenAI models get none (automatic
+    prefix caching) and neither does a disabled ``prompt_caching`` block."""
+    from taskforce.core.domain.prompt_layout import PromptLayout
+
+    config = {
+        "default_model": "main",
+        "models": {"main": "anthropic/claude-sonnet-4-6", "fast": "gpt-4.1-mini"},
+    }
+    path = tmp_path / "llm_config.yaml"
+    path.write_text(yaml.dump(config), encoding="utf-8")
+    service = LiteLLMService(config_path=str(path))
+    messages = [
+        {"role": "system", "content": "stable"},
+        {"role": "user", "content": "mission"},
+        {"role": "assistant", "content": "step"},
+        PromptLayout(stable="", volatile="plan").volatile_message(),
+    ]
+
+    _, _, kwargs = service._prepare_request(messages, "main", None, None)
+    assert kwargs["cache_control_injection_points"] == [
+        {"location": "message", "index": 0},
+        {"location": "message", "index": 2},
+    ]
+
+    _, _, kwargs = service._prepare_request(messages, "fast", None, None)
+    assert "cache_control_injection_points" not in kwargs
+
+    config["prompt_caching"] = {"enabled": False}
+    path.write_text(yaml.dump(config), encoding="utf-8")
+    disabled = LiteLLMService(config_path=str(path))
+    _, _, kwargs = disabled._prepare_request(messages, "main", None, None)
+    assert "cache_control_injection_points" not in kwargs
+
+
+@pytest.mark.spec("llm-service.trace_file_write_is_off_the_call_path")
+@pytest.mark.asyncio
+async def test_trace_file_write_is_off_the_call_path(tmp_path):
+    """With file tracing on, complete() only enqueues the trace record; the
+    shared background writer appends it later and flushes on shutdown."""
+    import json
+
+    from taskforce.infrastructure.tracing import shutdown_trace_file_writers
+
+    trace_file = tmp_path / "traces" / "llm.jsonl"
+    config = {
+        "default_model": "main",
+        "models": {"main": "gpt-4.1"},
+        "tracing": {
+            "enabled": True,
+            "mode": "file",
+            "file_config": {"path": str(trace_file), "flush_interval_seconds": 60},
+        },
+    }
+    path = tmp_path / "llm_config.yaml"
+    path.write_text(yaml.dump(config), encoding="utf-8")
+    service = LiteLLMService(config_path=str(path))
+    messages = [{"role": "user", "content": "hi"}]
+
+    with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+        mock_completion.return_value = _completion_response("hello")
+        result = await service.complete(messages=messages, model="main")
+    messages.append({"role": "assistant", "content": "appended after the call"})
+
+    assert result["success"] is True
+    assert not trace_file.exists()  # nothing written on the request path
+
+    shutdown_trace_file_writers()
+    [record] = [json.loads(line) for line in trace_file.read_text().splitlines()]
+    assert record["response"] == "hello"
+    assert record["messages"] == [{"role": "user", "content": "hi"}]
@@ -0,0 +1,407 @@
+"""Tests for the process-wide LLM rate governor."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import yaml
+
+from taskforce.infrastructure.llm.litellm_service import LiteLLMService
+from taskforce.infrastructure.llm.rate_governor import (
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    CircuitOpenError,
+    ModelGovernor,
+    RateGovernorConfig,
+    RateLimits,
+    TokenBucket,
+    backoff_delay,
+    get_rate_governor,
+    is_overload,
+    is_transient_failure,
+    retry_after_seconds,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _RateLimitError(Exception):
+    def __init__(self, message: str = "429 Too Many Requests", headers=None) -> None:
+        super().__init__(message)
+        self.status_code = 429
+        self.response = MagicMock(headers=headers or {})
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    config = {
+        "default_model": "main",
+        "models": {"main": "gpt-4.1", "backup": "anthropic/claude-sonnet-4-5"},
+        "retry": {"max_attempts": 1, "backoff_multiplier": 2, "timeout": 1},
+        "rate_limits": {
+            "enabled": True,
+            "defaults": {"max_concurrency": 4, "failure_threshold": 2, "cooldown_seconds": 60},
+            "models": {"main": {"rpm": 600}},
+        },
+    }
+    path = tmp_path / "llm_config.yaml"
+    path.write_text(yaml.dump(config), encoding="utf-8")
+    return str(path)
+
+
+def _completion_response(total_tokens=30):
+    message = MagicMock(content="ok", tool_calls=None)
+    response = MagicMock()
+    response.choices = [MagicMock(message=message)]
+    response.model = "gpt-4.1"
+    response.usage = MagicMock(total_tokens=total_tokens, prompt_tokens=20, completion_tokens=10)
+    return response
+
+
+# ---------------------------------------------------------------------------
+# Error classification and backoff
+# ---------------------------------------------------------------------------
+
+
+def test_overload_and_transient_classification():
+    assert is_overload(_RateLimitError())
+    assert is_overload(Exception("Anthropic API is overloaded"))
+    assert not is_overload(Exception("invalid api key"))
+    assert is_transient_failure(Exception("Request timed out"))
+    assert not is_transient_failure(Exception("400 invalid request"))
+
+
+def test_retry_after_from_headers_attribute_and_message():
+    assert retry_after_seconds(_RateLimitError(headers={"Retry-After": "12"})) == 12
+    assert retry_after_seconds(_RateLimitError(headers={"retry-after-ms": "1500"})) == 1.5
+    error = Exception("busy")
+    error.retry_after = 3  # type: ignore[attr-defined]
+    assert retry_after_seconds(error) == 3
+    assert retry_after_seconds(Exception("Please try again in 250ms")) == 0.25
+    assert retry_after_seconds(Exception("503 service unavailable")) is None
+
+
+def test_backoff_delay_is_jittered_capped_and_bounded_by_retry_after():
+    delays = {backoff_delay(3, 2) for _ in range(50)}
+    assert all(4 <= d <= 8 for d in delays) and len(delays) > 1
+    assert backoff_delay(3, 2, jitter=False) == 8
+    assert backoff_delay(10, 2, jitter=False, cap=5) == 5
+    assert backoff_delay(0, 2, retry_after=9) == 9
+
+
+# ---------------------------------------------------------------------------
+# Building blocks
+# ---------------------------------------------------------------------------
+
+
+def test_token_bucket_queues_callers_and_refills():
+    clock = _Clock()
+    bucket = TokenBucket(60, clock)  # one per second
+
+    assert bucket.reserve(59) == 0.0
+    assert bucket.reserve(1) == 0.0
+    assert bucket.reserve(1) == pytest.approx(1.0)
+    assert bucket.reserve(1) == pytest.approx(2.0)
+
+    clock.now += 2
+    assert bucket.level == pytest.approx(0.0)
+    bucket.adjust(-10)  # refund an over-estimate
+    assert bucket.level == pytest.approx(10.0)
+
+
+def test_adaptive_limiter_decreases_once_per_congestion_event():
+    clock = _Clock()
+    limiter = AdaptiveConcurrencyLimiter(8, minimum=1, decrease_factor=0.5, clock=clock)
+
+    started = clock.now
+    clock.now += 1
+    assert limiter.decrease(started)
+    assert limiter.limit == 4
+    # Another failure from a call that was already in flight is ignored.
+    assert not limiter.decrease(started)
+    assert limiter.limit == 4
+
+    for _ in range(4 * 5):
+        limiter.increase()
+    assert limiter.limit > 4
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_blocks_beyond_limit_in_fifo_order():
+    limiter = AdaptiveConcurrencyLimiter(1)
+    order: list[int] = []
+    await limiter.acquire()
+
+    async def worker(n: int) -> None:
+        await limiter.acquire()
+        order.append(n)
+        limiter.release()
+
+    tasks = [asyncio.create_task(worker(n)) for n in range(3)]
+    await asyncio.sleep(0)
+    assert order == [] and limiter.in_flight == 1
+
+    limiter.release()
+    await asyncio.gather(*tasks)
+    assert order == [0, 1, 2] and limiter.in_flight == 0
+
+
+def test_circuit_breaker_opens_probes_and_closes():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=2, cooldown_seconds=10, clock=clock)
+
+    assert not breaker.record_failure()
+    assert breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN and not breaker.try_acquire()
+
+    clock.now += 10
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.try_acquire()
+    assert not breaker.try_acquire()  # one probe at a time
+
+    breaker.record_failure()  # failed probe re-opens
+    assert breaker.state == CircuitBreaker.OPEN
+
+    clock.now += 10
+    assert breaker.try_acquire()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.available
+
+
+# ---------------------------------------------------------------------------
+# Governor
+# ---------------------------------------------------------------------------
+
+
+def test_config_resolves_aliases_and_inherits_defaults():
+    config = RateGovernorConfig.from_dict(
+        {
+            "enabled": True,
+            "defaults": {"max_concurrency": 8, "unknown_key": 1},
+            "models": {"main": {"tpm": 1000}},
+        },
+        aliases={"main": "azure/gpt-4.1"},
+    )
+
+    assert config.limits_for("azure/gpt-4.1") == RateLimits(tpm=1000, max_concurrency=8)
+    assert config.limits_for("gpt-4.1-mini").max_concurrency == 8
+    assert not RateGovernorConfig.from_dict(None).enabled
+
+
+@pytest.mark.asyncio
+async def test_governor_throttle_shrinks_limit_and_honours_retry_after():
+    clock = _Clock()
+    governor = ModelGovernor("m", RateLimits(max_concurrency=8), clock=clock)
+
+    with pytest.raises(_RateLimitError):
+        async with governor.slot():
+            raise _RateLimitError(headers={"retry-after": "5"})
+
+    assert governor.limiter.limit == 4
+
+    async def fake_sleep(delay):
+        clock.now += delay
+
+    with patch("asyncio.sleep", new_callable=AsyncMock, side_effect=fake_sleep) as mock_sleep:
+        async with governor.slot():
+            pass
+    assert mock_sleep.await_args.args[0] == pytest.approx(5)
+
+
+@pytest.mark.asyncio
+async def test_governor_counts_a_burst_of_429s_once_for_the_breaker():
+    clock = _Clock()
+    governor = ModelGovernor("m", RateLimits(failure_threshold=2), clock=clock)
+
+    async def throttled_call() -> None:
+        async with governor.slot():
+            await asyncio.sleep(0)
+            clock.now += 0.01
+            raise _RateLimitError()
+
+    results = await asyncio.gather(*[throttled_call() for _ in range(3)], return_exceptions=True)
+
+    assert all(isinstance(r, _RateLimitError) for r in results)
+    assert governor.available
+    assert governor.limiter.limit == 16
+
+
+@pytest.mark.asyncio
+async def test_governor_reconciles_tpm_with_reported_usage():
+    clock = _Clock()
+    governor = ModelGovernor("m", RateLimits(tpm=6000), clock=clock)
+
+    async with governor.slot(estimated_tokens=1000) as permit:
+        permit.complete(200)
+
+    assert governor._tokens is not None
+    assert governor._tokens.level == pytest.approx(5800)
+
+
+@pytest.mark.asyncio
+async def test_governor_circuit_fails_fast_and_ignores_client_errors():
+    governor = ModelGovernor("m", RateLimits(failure_threshold=2))
+
+    with pytest.raises(ValueError):
+        async with governor.slot():
+            raise ValueError("400 invalid request")
+    for _ in range(2):
+        with pytest.raises(TimeoutError):
+            async with governor.slot():
+                raise TimeoutError("timed out")
+
+    assert not governor.available
+    with pytest.raises(CircuitOpenError):
+        async with governor.slot():
+            pass
+
+
+# ---------------------------------------------------------------------------
+# LiteLLMService integration
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_service_shares_one_governor_per_model_across_instances(config_file):
+    first = LiteLLMService(config_path=config_file)
+    second = LiteLLMService(config_path=config_file)
+
+    with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+        mock_completion.return_value = _completion_response()
+        await first.complete(messages=[{"role": "user", "content": "hi"}], model="main")
+
+    governor = first._model_governor("gpt-4.1")
+    assert governor is second._model_governor("gpt-4.1")
+    assert governor.limits.rpm == 600 and governor.limits.max_concurrency == 4
+
+
+def test_services_with_other_limits_do_not_replace_or_disable_governor(
+    config_file, tmp_path
+):
+    governed = LiteLLMService(config_path=config_file)
+    governor = governed._model_governor("gpt-4.1")
+
+    ungoverned_path = tmp_path / "ungoverned.yaml"
+    ungoverned_path.write_text(
+        yaml.dump({"default_model": "main", "models": {"main": "gpt-4.1"}}), encoding="utf-8"
+    )
+    ungoverned = LiteLLMService(config_path=str(ungoverned_path))
+    stricter_path = tmp_path / "stricter.yaml"
+    stricter_path.write_text(
+        yaml.dump(
+            {
+                "default_model": "main",
+                "models": {"main": "gpt-4.1"},
+                "rate_limits": {"enabled": True, "defaults": {"max_concurrency": 2}},
+            }
+        ),
+        encoding="utf-8",
+    )
+    stricter = LiteLLMService(config_path=str(stricter_path))
+
+    assert ungoverned._model_governor("gpt-4.1") is None
+    assert stricter._model_governor("gpt-4.1").limits.max_concurrency == 2
+    assert governed._model_governor("gpt-4.1") is governor
+
+
+@pytest.mark.asyncio
+async def test_service_reports_open_circuit_without_calling_provider(config_file):
+    service = LiteLLMService(config_path=config_file)
+
+    with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+        mock_completion.side_effect = Exception("502 bad gateway")
+        for _ in range(2):
+            await service.complete(messages=[{"role": "user", "content": "hi"}], model="main")
+        mock_completion.reset_mock()
+        result = await service.complete(
+            messages=[{"role": "user", "content": "hi"}], model="main"
+        )
+
+    assert mock_completion.await_count == 0
+    assert result["success"] is False and result["error_type"] == "CircuitOpenError"
+    assert not service.model_available("main")
+    assert service.model_available("backup")
+
+
+# ---------------------------------------------------------------------------
+# Simulated provider: goodput under an injected rate limit
+# ---------------------------------------------------------------------------
+
+
+class _SimulatedProvider:
+    """Accepts ``capacity`` concurrent calls; beyond that answers 429."""
+
+    def __init__(self, capacity: int, latency: float = 0.005) -> None:
+        self.capacity = capacity
+        self.latency = latency
+        self.in_flight = 0
+        self.rejected = 0
+        self.served = 0
+
+    async def __call__(self, **kwargs):
+        if self.in_flight >= self.capacity:
+            self.rejected += 1
+            raise _RateLimitError()
+        self.in_flight += 1
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        self.served += 1
+        return _completion_response()
+
+
+@pytest.mark.asyncio
+async def test_governor_cuts_throttling_under_injected_rate_limit(tmp_path):
+    """40 callers against a provider that takes 4 at a time.
+
+    Ungoverned, almost every first attempt is throttled; with the governor
+    the adaptive limit settles near the provider's capacity.
+    """
+
+    async def run(enabled: bool) -> _SimulatedProvider:
+        get_rate_governor().reset()
+        path = tmp_path / f"llm_config_{enabled}.yaml"
+        config = {
+            "default_model": "main",
+            "models": {"main": "gpt-4.1"},
+            "retry": {"max_attempts": 20, "backoff_multiplier": 1.2, "max_backoff_seconds": 0.05},
+            "rate_limits": {
+                "enabled": enabled,
+                "defaults": {"max_concurrency": 16, "failure_threshold": 1000},
+            },
+        }
+        path.write_text(yaml.dump(config), encoding="utf-8")
+        service = LiteLLMService(config_path=str(path))
+        provider = _SimulatedProvider(capacity=4)
+        real_sleep = asyncio.sleep
+
+        async def short_sleep(delay, *args):
+            await real_sleep(min(delay, 0.01), *args)
+
+        with (
+            patch("litellm.acompletion", new=provider),
+            patch("asyncio.sleep", side_effect=short_sleep),
+        ):
+            results = await asyncio.gather(
+                *[
+                    service.complete(messages=[{"role": "user", "content": "hi"}], model="main")
+                    for _ in range(40)
+                ]
+            )
+        assert all(r["success"] for r in results)
+        return provider
+
+    ungoverned = await run(enabled=False)
+    governed = await run(enabled=True)
+
+    assert governed.served == ungoverned.served == 40
+    assert governed.rejected < ungoverned.rejected / 2
@@ -0,0 +1,222 @@
+"""Tests for the LiteLLMService record/replay response cache."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import yaml
+
+from taskforce.infrastructure.llm.litellm_service import LiteLLMService
+from taskforce.infrastructure.llm.response_cache import (
+    CACHE_MODE_ENV,
+    CacheMode,
+    LLMResponseCache,
+    canonical_request_key,
+)
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    config = {
+        "default_model": "main",
+        "models": {"main": "gpt-4.1"},
+        "default_params": {"temperature": 0.2, "max_tokens": 100},
+        "retry": {"max_attempts": 1, "backoff_multiplier": 2, "timeout": 1},
+    }
+    path = tmp_path / "llm_config.yaml"
+    path.write_text(yaml.dump(config), encoding="utf-8")
+    return str(path)
+
+
+def _completion_response(content="ok"):
+    message = MagicMock()
+    message.content = content
+    message.tool_calls = None
+    response = MagicMock()
+    response.choices = [MagicMock(message=message)]
+    response.model = "gpt-4.1"
+    response.usage = MagicMock(total_tokens=30, prompt_tokens=20, completion_tokens=10)
+    return response
+
+
+def _chunk(content=None, tool_calls=None, finish_reason=None):
+    chunk = MagicMock()
+    delta = MagicMock()
+    delta.content = content
+    delta.tool_calls = tool_calls
+    chunk.choices = [MagicMock(delta=delta, finish_reason=finish_reason)]
+    chunk.usage = None
+    return chunk
+
+
+def _tool_call_delta(index, tool_id=None, name=None, arguments=None):
+    tc = MagicMock()
+    tc.index = index
+    tc.id = tool_id
+    tc.function = MagicMock()
+    tc.function.name = name
+    tc.function.arguments = arguments
+    return tc
+
+
+async def _astream(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def _service(config_file, tmp_path, mode):
+    cache = LLMResponseCache(cache_dir=tmp_path / "cache", mode=mode)
+    return LiteLLMService(config_path=config_file, response_cache=cache)
+
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+class TestCanonicalRequestKey:
+    def test_key_is_stable_across_dict_ordering(self):
+        a = {"model": "m", "messages": MESSAGES, "temperature": 0.1, "max_tokens": 5}
+        b = {"max_tokens": 5, "temperature": 0.1, "messages": MESSAGES, "model": "m"}
+        assert canonical_request_key("complete", a) == canonical_request_key("complete", b)
+
+    def test_transport_params_do_not_change_key(self):
+        base = {"model": "m", "messages": MESSAGES, "temperature": 0.1}
+        noisy = {**base, "timeout": 99, "drop_params": True, "api_key": "sk-x"}
+        assert canonical_request_key("complete", base) == canonical_request_key(
+            "complete", noisy
+        )
+
+    def test_sampling_params_and_kind_change_key(self):
+        base = {"model": "m", "messages": MESSAGES, "temperature": 0.1}
+        hot = {**base, "temperature": 0.9}
+        assert canonical_request_key("complete", base) != canonical_request_key("complete", hot)
+        assert canonical_request_key("complete", base) != canonical_request_key("stream", base)
+
+
+class TestFromConfig:
+    def test_off_by_default(self, monkeypatch):
+        monkeypatch.delenv(CACHE_MODE_ENV, raising=False)
+        assert LLMResponseCache.from_config({}) is None
+
+    def test_env_overrides_yaml(self, monkeypatch, tmp_path):
+        monkeypatch.setenv(CACHE_MODE_ENV, "replay")
+        cache = LLMResponseCache.from_config({"mode": "record", "path": str(tmp_path)})
+        assert cache is not None
+        assert cache.mode is CacheMode.REPLAY
+        assert cache.cache_dir == tmp_path.resolve()
+
+    def test_invalid_mode_raises(self, monkeypatch):
+        monkeypatch.delenv(CACHE_MODE_ENV, raising=False)
+        with pytest.raises(ValueError):
+            LLMResponseCache.from_config({"mode": "sometimes"})
+
+
+class TestCompleteCache:
+    @pytest.mark.spec("llm-service.response_cache_replays_complete_without_provider_call")
+    async def test_record_then_replay_skips_provider(self, config_file, tmp_path):
+        recorder = _service(config_file, tmp_path, "record")
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = _completion_response("recorded answer")
+            first = await recorder.complete(messages=MESSAGES, model="main")
+        assert first["success"] is True
+
+        replayer = _service(config_file, tmp_path, "replay")
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            second = await replayer.complete(messages=MESSAGES, model="main")
+            mock_completion.assert_not_awaited()
+
+        assert second["content"] == "recorded answer"
+        assert second["usage"] == first["usage"]
+        assert second["cache_hit"] is True
+
+    @pytest.mark.spec("llm-service.response_cache_replay_miss_is_error")
+    async def test_replay_miss_returns_error_dict(self, config_file, tmp_path):
+        service = _service(config_file, tmp_path, "replay")
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            result = await service.complete(messages=MESSAGES, model="main")
+            mock_completion.assert_not_awaited()
+
+        assert result["success"] is False
+        assert result["error_type"] == "LLMCacheMissError"
+
+    async def test_read_through_calls_provider_once(self, config_file, tmp_path):
+        service = _service(config_file, tmp_path, "read_through")
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = _completion_response()
+            await service.complete(messages=MESSAGES, model="main")
+            await service.complete(messages=MESSAGES, model="main")
+            await service.complete(messages=MESSAGES, model="main", temperature=0.9)
+
+        # Second call is a hit; the different temperature is a new key.
+        assert mock_completion.await_count == 2
+        assert service.response_cache.hits == 1
+
+    async def test_failures_are_not_recorded(self, config_file, tmp_path):
+        service = _service(config_file, tmp_path, "read_through")
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.side_effect = Exception("invalid api key")
+            await service.complete(messages=MESSAGES, model="main")
+            await service.complete(messages=MESSAGES, model="main")
+
+        assert mock_completion.await_count == 2
+
+    async def test_complete_json_is_cached(self, config_file, tmp_path):
+        service = _service(config_file, tmp_path, "read_through")
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = _completion_response('{"a": 1}')
+            first = await service.complete_json(prompt="give json", model="main")
+            second = await service.complete_json(prompt="give json", model="main")
+
+        assert mock_completion.await_count == 1
+        assert first["data"] == second["data"] == {"a": 1}
+
+
+class TestStreamCache:
+    @pytest.mark.spec("llm-service.response_cache_replays_stream_event_sequence")
+    async def test_replay_reemits_recorded_event_sequence(self, config_file, tmp_path):
+        chunks = [
+            _chunk(content="Hel"),
+            _chunk(content="lo"),
+            _chunk(tool_calls=[_tool_call_delta(0, "call_1", "search", '{"q":')]),
+            _chunk(tool_calls=[_tool_call_delta(0, arguments=' "x"}')]),
+            _chunk(finish_reason="tool_calls"),
+        ]
+        recorder = _service(config_file, tmp_path, "record")
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = _astream(chunks)
+            live = [e async for e in recorder.complete_stream(messages=MESSAGES, model="main")]
+
+        replayer = _service(config_file, tmp_path, "replay")
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            replayed = [
+                e async for e in replayer.complete_stream(messages=MESSAGES, model="main")
+            ]
+            mock_completion.assert_not_awaited()
+
+        assert [e["type"] for e in live] == [
+            "token",
+            "token",
+            "tool_call_start",
+            "tool_call_delta",
+            "tool_call_delta",
+            "tool_call_end",
+            "done",
+        ]
+        assert replayed == live
+
+    async def test_stream_replay_miss_yields_error_event(self, config_file, tmp_path):
+        service = _service(config_file, tmp_path, "replay")
+        events = [e async for e in service.complete_stream(messages=MESSAGES, model="main")]
+
+        assert len(events) == 1
+        assert events[0]["type"] == "error"
+        assert events[0]["error_kind"] == "cache_miss"
+        assert events[0]["non_retryable"] is True
+
+    async def test_stream_error_is_not_recorded(self, config_file, tmp_path):
+        service = _service(config_file, tmp_path, "read_through")
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.side_effect = Exception("invalid api key")
+            [e async for e in service.complete_stream(messages=MESSAGES, model="main")]
+
+        assert not list((tmp_path / "cache").rglob("*.json"))
@@ -96,6 +96,15 @@ class TestTokenAnalyticsCallback:
         assert record.total_tokens == 600
         assert record.latency_ms == 1000
 
+    def test_cached_prompt_tokens_extracted(self, callback):
+        response = _make_response(prompt_tokens=1000, completion_tokens=10, total_tokens=1010)
+        response.usage.prompt_tokens_details = SimpleNamespace(cached_tokens=800)
+
+        callback.log_success_event({"model": "anthropic/claude-sonnet-4-6"}, response, None, None)
+
+        assert callback.calls[0].cached_prompt_tokens == 800
+        assert callback.build_summary().total_cached_prompt_tokens == 800
+
     def test_log_stream_event(self, callback):
         kwargs = {"model": "claude-3"}
         response = _make_response(prompt_tokens=200, completion_tokens=80, total_tokens=280)
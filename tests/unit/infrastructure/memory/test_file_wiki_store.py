@@ -8,6 +8,7 @@ from pathlib import Path
 import pytest
 
 from taskforce.core.domain.wiki_page import WikiPage
+from taskforce.infrastructure.memory import file_wiki_store
 from taskforce.infrastructure.memory.file_wiki_store import FileWikiStore
 
 
@@ -286,3 +287,132 @@ async def test_write_preserves_created_at_on_rewrite(store: FileWikiStore) -> No
     reloaded = await store.get_page("entities/x")
     assert reloaded is not None
     assert reloaded.created_at == original_created
+
+
+class TestLinkGraph:
+    async def test_writes_and_deletes_update_the_graph(self, store: FileWikiStore) -> None:
+        await store.write_page(WikiPage(name="entities/a", title="A", body="[[entities/b]]"))
+        await store.write_page(WikiPage(name="entities/b", title="B", body="x"))
+        await store.update_section("entities/b", "Links", "- [[entities/a]]")
+
+        graph = await store.link_graph()
+        assert graph.backlinks("entities/a") == ["entities/b"]
+        assert graph.backlinks("entities/b") == ["entities/a"]
+
+        await store.delete_page("entities/a")
+        assert "entities/a" not in graph
+        assert graph.backlinks("entities/b") == []
+
+    @pytest.mark.spec("wiki-memory.link_graph_survives_reopen_without_reading_pages")
+    async def test_new_store_loads_graph_without_reading_pages(
+        self, store: FileWikiStore, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        for i in range(5):
+            await store.write_page(
+                WikiPage(name=f"entities/p{i}", title=f"P{i}", body=f"[[entities/p{(i + 1) % 5}]]")
+            )
+        await store.delete_page("entities/p4")
+
+        reopened = FileWikiStore(tmp_path / "wiki")
+        reads: list[Path] = []
+        read_file = reopened._read_file
+        monkeypatch.setattr(reopened, "_read_file", lambda p: reads.append(p) or read_file(p))
+        graph = await reopened.link_graph(rescan=True)
+
+        assert reads == []
+        assert len(graph) == 4
+        assert graph.backlinks("entities/p0") == []
+        assert graph.broken_links() == [("entities/p3", "entities/p4")]
+        # The journal was folded into a fresh snapshot.
+        assert not (tmp_path / "wiki" / ".link_graph.jsonl").exists()
+
+    @pytest.mark.spec("wiki-memory.link_graph_rescan_picks_up_disk_edits")
+    async def test_rescan_picks_up_pages_edited_on_disk(
+        self, store: FileWikiStore, tmp_path: Path
+    ) -> None:
+        await store.write_page(WikiPage(name="entities/a", title="A", body="plain"))
+        graph = await store.link_graph()
+
+        path = tmp_path / "wiki" / "entities" / "a.md"
+        path.write_text(path.read_text(encoding="utf-8") + "See [[entities/new]].\n", "utf-8")
+        (tmp_path / "wiki" / "entities" / "new.md").write_text("hello\n", encoding="utf-8")
+
+        assert graph.backlinks("entities/new") == []  # not rescanned yet
+        await store.link_graph(rescan=True)
+        assert graph.backlinks("entities/new") == ["entities/a"]
+
+    async def test_index_includes_pages_created_on_disk(
+        self, store: FileWikiStore, tmp_path: Path
+    ) -> None:
+        await store.write_page(WikiPage(name="entities/a", title="A", body="x"))
+        (tmp_path / "wiki" / "concepts").mkdir()
+        (tmp_path / "wiki" / "concepts" / "outside.md").write_text("hi\n", encoding="utf-8")
+
+        await store.link_graph(rescan=True)
+
+        assert "concepts/outside.md" in await store.read_index()
+
+    async def test_writes_do_not_rescan_the_wiki(
+        self, store: FileWikiStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        await store.write_page(WikiPage(name="entities/a", title="A", body="x"))
+        scans: list[Path] = []
+        monkeypatch.setattr(
+            file_wiki_store, "_scan_signatures", lambda root: scans.append(root) or {}
+        )
+
+        await store.write_page(WikiPage(name="entities/b", title="B", body="y"))
+        await store.update_section("entities/b", "Links", "- [[entities/a]]")
+        await store.delete_page("entities/a")
+
+        assert scans == []
+
+    async def test_journal_is_compacted_past_its_line_limit(
+        self, store: FileWikiStore, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(file_wiki_store, "_GRAPH_JOURNAL_MAX_LINES", 3)
+        journal = tmp_path / "wiki" / ".link_graph.jsonl"
+        # The first write snapshots the new wiki; the next three are journaled.
+        for i in range(4):
+            await store.write_page(WikiPage(name=f"entities/p{i}", title=f"P{i}", body="x"))
+        assert len(journal.read_text(encoding="utf-8").splitlines()) == 3
+
+        await store.write_page(WikiPage(name="entities/p4", title="P4", body="x"))
+
+        assert not journal.exists()
+        reopened = await FileWikiStore(tmp_path / "wiki").link_graph()
+        assert len(reopened) == 5
+
+    async def test_stores_on_one_root_see_each_others_writes(self, tmp_path: Path) -> None:
+        a = FileWikiStore(tmp_path / "wiki")
+        b = FileWikiStore(tmp_path / "wiki")
+        await a.write_page(WikiPage(name="entities/one", title="One", body="[[entities/two]]"))
+        await b.write_page(WikiPage(name="entities/two", title="Two", body="x"))
+        await a.write_page(WikiPage(name="entities/three", title="Three", body="x"))
+
+        index = await a.read_index()
+        for name in ("one", "two", "three"):
+            assert f"entities/{name}.md" in index
+        graph = await a.link_graph()
+        assert graph.broken_links() == []
+        assert graph.backlinks("entities/two") == ["entities/one"]
+
+        await b.delete_page("entities/two")
+        assert (await a.link_graph()).broken_links() == [("entities/one", "entities/two")]
+
+    async def test_store_reloads_after_another_store_compacts(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(file_wiki_store, "_GRAPH_JOURNAL_MAX_LINES", 2)
+        a = FileWikiStore(tmp_path / "wiki")
+        b = FileWikiStore(tmp_path / "wiki")
+        await a.write_page(WikiPage(name="entities/a0", title="A0", body="x"))
+        await b.link_graph()
+        for i in range(1, 4):
+            await a.write_page(WikiPage(name=f"entities/a{i}", title=f"A{i}", body="x"))
+        assert not (tmp_path / "wiki" / ".link_graph.jsonl").exists()
+
+        await b.write_page(WikiPage(name="entities/b0", title="B0", body="x"))
+
+        assert len(await b.link_graph()) == 5
+        assert "entities/a3.md" in await b.read_index()
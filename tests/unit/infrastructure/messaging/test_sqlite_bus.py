@@ -0,0 +1,295 @@
+"""Tests for the durable SQLite message bus."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from taskforce.application.acp_service import build_acp_service
+from taskforce.application.infrastructure_builder import InfrastructureBuilder
+from taskforce.infrastructure.messaging import InMemoryMessageBus, SqliteMessageBus
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "bus.db"
+
+
+def make_bus(db_path: Path, clock: FakeClock, **kwargs) -> SqliteMessageBus:
+    kwargs.setdefault("poll_interval_seconds", 0.01)
+    kwargs.setdefault("visibility_timeout_seconds", 30)
+    return SqliteMessageBus(db_path, clock=clock, **kwargs)
+
+
+async def next_message(subscriber, timeout: float = 2.0):
+    return await asyncio.wait_for(subscriber.__anext__(), timeout=timeout)
+
+
+async def test_publish_subscribe_roundtrip(db_path: Path, clock: FakeClock) -> None:
+    bus = make_bus(db_path, clock)
+    published = await bus.publish("tasks", {"job": "alpha"}, headers={"k": "v"})
+
+    message = await next_message(bus.subscribe("tasks"))
+
+    assert message.message_id == published.message_id
+    assert message.payload == {"job": "alpha"}
+    assert message.headers == {"k": "v"}
+    assert message.created_at == published.created_at
+    await bus.ack(message.message_id)
+    assert await bus.pending_count("tasks") == 0
+    bus.close()
+
+
+async def test_subscriber_woken_by_publish(db_path: Path, clock: FakeClock) -> None:
+    bus = make_bus(db_path, clock, poll_interval_seconds=30)
+    subscriber = bus.subscribe("tasks")
+    waiter = asyncio.create_task(next_message(subscriber))
+    await asyncio.sleep(0.05)
+
+    await bus.publish("tasks", {"n": 1})
+
+    assert (await waiter).payload == {"n": 1}
+    bus.close()
+
+
+@pytest.mark.spec("acp.sqlite_bus_pending_messages_survive_restart")
+async def test_pending_messages_survive_restart(db_path: Path, clock: FakeClock) -> None:
+    bus = make_bus(db_path, clock)
+    for i in range(3):
+        await bus.publish("tasks", {"n": i})
+    bus.close()
+
+    reopened = make_bus(db_path, clock)
+    subscriber = reopened.subscribe("tasks")
+    payloads = [(await next_message(subscriber)).payload["n"] for _ in range(3)]
+
+    assert payloads == [0, 1, 2]
+    reopened.close()
+
+
+@pytest.mark.spec("acp.sqlite_bus_unacked_message_redelivered_after_visibility_timeout")
+async def test_unacked_message_redelivered_after_crash(
+    db_path: Path, clock: FakeClock
+) -> None:
+    bus = make_bus(db_path, clock, visibility_timeout_seconds=10)
+    await bus.publish("tasks", {"job": "x"})
+    first = await next_message(bus.subscribe("tasks"))
+    bus.close()  # consumer dies without acking
+
+    restarted = make_bus(db_path, clock, visibility_timeout_seconds=10)
+    with pytest.raises(asyncio.TimeoutError):
+        await next_message(restarted.subscribe("tasks"), timeout=0.1)
+
+    clock.now += 11
+    again = await next_message(restarted.subscribe("tasks"))
+    assert again.message_id == first.message_id
+    restarted.close()
+
+
+async def test_recover_releases_claims_immediately(db_path: Path, clock: FakeClock) -> None:
+    bus = make_bus(db_path, clock)
+    await bus.publish("tasks", {"job": "x"})
+    first = await next_message(bus.subscribe("tasks"))
+    bus.close()
+
+    restarted = make_bus(db_path, clock)
+    assert await restarted.recover() == 1
+    again = await next_message(restarted.subscribe("tasks"))
+    assert again.message_id == first.message_id
+    restarted.close()
+
+
+async def test_closing_subscriber_releases_prefetched_claims(
+    db_path: Path, clock: FakeClock
+) -> None:
+    bus = make_bus(db_path, clock, batch_size=10)
+    for i in range(3):
+        await bus.publish("tasks", {"n": i})
+    subscriber = bus.subscribe("tasks")
+    first = await next_message(subscriber)
+    await bus.ack(first.message_id)
+    await subscriber.aclose()
+
+    rest = bus.subscribe("tasks")
+    assert [(await next_message(rest)).payload["n"] for _ in range(2)] == [1, 2]
+    bus.close()
+
+
+async def test_nack_requeues(db_path: Path, clock: FakeClock) -> None:
+    bus = make_bus(db_path, clock)
+    await bus.publish("tasks", {"job": "beta"})
+    subscriber = bus.subscribe("tasks")
+    message = await next_message(subscriber)
+
+    await bus.nack(message.message_id, requeue=True)
+
+    retry = await next_message(subscriber)
+    assert retry.message_id == message.message_id
+    bus.close()
+
+
+@pytest.mark.spec("acp.sqlite_bus_dead_letters_after_max_attempts")
+async def test_dead_lettered_after_max_attempts(db_path: Path, clock: FakeClock) -> None:
+    bus = make_bus(db_path, clock, max_attempts=2)
+    await bus.publish("tasks", {"job": "poison"})
+    await bus.publish("tasks", {"job": "fine"})
+    subscriber = bus.subscribe("tasks", group="workers")
+
+    delivered = []
+    for _ in range(3):
+        message = await next_message(subscriber)
+        delivered.append(message.payload["job"])
+        if message.payload["job"] == "poison":
+            await bus.nack(message.message_id)
+        else:
+            await bus.ack(message.message_id)
+
+    assert delivered.count("poison") == 2
+    with pytest.raises(asyncio.TimeoutError):
+        await next_message(subscriber, timeout=0.1)
+    dead = await bus.dead_letters("tasks")
+    assert [(d.envelope.payload, d.group, d.attempts, d.reason) for d in dead] == [
+        ({"job": "poison"}, "workers", 2, "max_attempts")
+    ]
+    assert await bus.pending_count("tasks", group="workers") == 0
+    bus.close()
+
+
+async def test_nack_without_requeue_dead_letters(db_path: Path, clock: FakeClock) -> None:
+    bus = make_bus(db_path, clock)
+    await bus.publish("tasks", {"job": "bad"})
+    message = await next_message(bus.subscribe("tasks"))
+
+    await bus.nack(message.message_id, requeue=False)
+
+    dead = await bus.dead_letters()
+    assert [d.reason for d in dead] == ["rejected"]
+    assert await bus.pending_count("tasks") == 0
+    bus.close()
+
+
+@pytest.mark.spec("acp.sqlite_bus_consumer_groups_each_receive_every_message")
+async def test_consumer_groups(db_path: Path, clock: FakeClock) -> None:
+    bus = make_bus(db_path, clock, batch_size=1)
+    for i in range(4):
+        await bus.publish("events", {"n": i})
+
+    audit = bus.subscribe("events", group="audit")
+    worker_a = bus.subscribe("events", group="workers")
+    worker_b = bus.subscribe("events", group="workers")
+
+    audit_seen = []
+    for _ in range(4):
+        message = await next_message(audit)
+        audit_seen.append(message.payload["n"])
+        await bus.ack(message.message_id, group="audit")
+
+    workers_seen = []
+    for subscriber in (worker_a, worker_b, worker_a, worker_b):
+        message = await next_message(subscriber)
+        workers_seen.append(message.payload["n"])
+        await bus.ack(message.message_id)
+
+    assert audit_seen == [0, 1, 2, 3]
+    assert sorted(workers_seen) == [0, 1, 2, 3]
+    bus.close()
+
+
+async def test_republishing_message_id_is_idempotent(db_path: Path, clock: FakeClock) -> None:
+    bus = make_bus(db_path, clock)
+    await bus.publish("tasks", {"n": 1}, message_id="m-1")
+    await bus.publish("tasks", {"n": 1}, message_id="m-1")
+
+    assert await bus.pending_count("tasks") == 1
+    assert bus.stats["duplicates"] == 1
+    bus.close()
+
+
+async def test_retention_purges_only_consumed_messages(db_path: Path, clock: FakeClock) -> None:
+    bus = make_bus(db_path, clock, retention_seconds=60, batch_size=1)
+    await bus.publish("tasks", {"n": 1})
+    await bus.publish("tasks", {"n": 2})
+    subscriber = bus.subscribe("tasks")
+    first = await next_message(subscriber)
+    await bus.ack(first.message_id)
+    second = await next_message(subscriber)  # claimed, not acked
+
+    clock.now += 61
+    assert await bus.purge() == 1
+    assert await bus.pending_count("tasks") == 1
+    await bus.ack(second.message_id)
+    assert await bus.purge() == 1
+    bus.close()
+
+
+async def test_publish_many(db_path: Path, clock: FakeClock) -> None:
+    bus = make_bus(db_path, clock)
+    envelopes = await bus.publish_many("tasks", [{"n": i} for i in range(5)])
+
+    assert len(envelopes) == 5
+    assert await bus.pending_count("tasks") == 5
+    bus.close()
+
+
+async def test_ack_with_explicit_group_forgets_the_claim(db_path: Path, clock: FakeClock) -> None:
+    bus = make_bus(db_path, clock)
+    await bus.publish("tasks", {"n": 1})
+    message = await next_message(bus.subscribe("tasks", group="workers"))
+
+    await bus.ack(message.message_id, group="workers")
+
+    assert bus._claims == {}
+    bus.close()
+
+
+def test_rejects_unknown_synchronous_mode(db_path: Path) -> None:
+    with pytest.raises(ValueError, match="synchronous"):
+        SqliteMessageBus(db_path, synchronous="OFF")
+
+
+class TestBuilderSelection:
+    def test_default_is_in_memory(self) -> None:
+        assert isinstance(InfrastructureBuilder().build_message_bus({}), InMemoryMessageBus)
+
+    def test_sqlite_selected_by_config(self, tmp_path: Path) -> None:
+        bus = InfrastructureBuilder().build_message_bus(
+            {"message_bus": {"type": "sqlite", "max_attempts": 3}},
+            work_dir_override=str(tmp_path),
+        )
+        assert isinstance(bus, SqliteMessageBus)
+        assert bus.path == tmp_path / "message_bus.db"
+        bus.close()
+
+    def test_unknown_type_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown message bus type"):
+            InfrastructureBuilder().build_message_bus({"message_bus": {"type": "kafka"}})
+
+    @pytest.mark.spec("acp.message_bus_type_selects_sqlite_backend")
+    def test_acp_transport_sqlite_builds_the_durable_bus(self, tmp_path: Path) -> None:
+        service = build_acp_service(
+            {"message_bus": {"transport": "sqlite", "sqlite": {"max_attempts": 3}}},
+            work_dir=str(tmp_path),
+        )
+        assert service is not None
+
+        bus = service.build_message_bus()
+
+        assert isinstance(bus, SqliteMessageBus)
+        assert service.bus is bus
+        assert bus.path == tmp_path / "message_bus.db"
+        bus.close()
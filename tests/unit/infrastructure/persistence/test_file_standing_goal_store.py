@@ -85,6 +85,20 @@ async def test_mark_evaluated_persists_action(store: FileStandingGoalStore) -> N
     assert fetched.last_action_taken == "sent summary"
 
 
+@pytest.mark.asyncio
+async def test_mark_evaluated_keeps_fingerprint_unless_given(
+    store: FileStandingGoalStore,
+) -> None:
+    goal = _make_goal()
+    await store.add(goal)
+    when = datetime(2026, 5, 6, 9, 0, tzinfo=UTC)
+    await store.mark_evaluated(goal.goal_id, when, "acted", input_fingerprint="f1")
+    await store.mark_evaluated(goal.goal_id, when, "inputs unchanged")
+    fetched = await store.get(goal.goal_id)
+    assert fetched is not None
+    assert fetched.input_fingerprint == "f1"
+
+
 @pytest.mark.spec("standing-goals.store_concurrent_mark_evaluated_serialized")
 @pytest.mark.asyncio
 async def test_concurrent_mark_evaluated_does_not_lose_writes(
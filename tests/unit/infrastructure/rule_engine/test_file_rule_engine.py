@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import pytest
@@ -92,6 +93,30 @@ class TestCrudAndPersistence:
         ordered = [r.name for r in await engine.list_rules()]
         assert ordered == ["high", "mid", "low"]
 
+    async def test_malformed_template_does_not_abort_load(self, tmp_path: Path) -> None:
+        engine = FileRuleEngine(work_dir=str(tmp_path))
+        await engine.add_rule(_make_rule(name="r1", priority=3))
+        await engine.add_rule(_make_rule(name="r2", priority=2, template="Hi {{event.x"))
+        await engine.add_rule(_make_rule(name="r3", priority=1))
+
+        engine2 = FileRuleEngine(work_dir=str(tmp_path))
+        await engine2.load()
+
+        assert [r.name for r in await engine2.list_rules()] == ["r1", "r2", "r3"]
+
+    async def test_malformed_rule_entry_is_skipped_on_load(self, tmp_path: Path) -> None:
+        engine = FileRuleEngine(work_dir=str(tmp_path))
+        await engine.add_rule(_make_rule(name="r1", priority=2))
+        await engine.add_rule(_make_rule(name="r3", priority=1))
+        path = tmp_path / "rules.json"
+        data = json.loads(path.read_text())
+        path.write_text(json.dumps([data[0], {"name": "broken"}, data[1]]))
+
+        engine2 = FileRuleEngine(work_dir=str(tmp_path))
+        await engine2.load()
+
+        assert [r.name for r in await engine2.list_rules()] == ["r1", "r3"]
+
 
 class TestEvaluation:
     async def test_wildcard_rule_matches_any_event(self, tmp_path: Path) -> None:
@@ -168,3 +193,84 @@ class TestEvaluation:
             _make_event(payload={"minutes": 15})
         )
         assert actions[0].params["message"] == "Meeting in 15m"
+
+    async def test_malformed_template_falls_back_to_plain_substitution(
+        self, tmp_path: Path
+    ) -> None:
+        engine = FileRuleEngine(work_dir=str(tmp_path))
+        await engine.add_rule(_make_rule(template="{{event.minutes}}m {% if %}"))
+
+        actions = await engine.evaluate(_make_event(payload={"minutes": 15}))
+        assert actions[0].params["message"] == "15m {% if %}"
+
+
+class TestIndexing:
+    async def test_buckets_merge_in_priority_then_insertion_order(self, tmp_path: Path) -> None:
+        engine = FileRuleEngine(work_dir=str(tmp_path))
+        specs = [
+            ("any-5", "*", "*", 5),
+            ("cal-any-5", "calendar", "*", 5),
+            ("any-upcoming-9", "*", "calendar.upcoming", 9),
+            ("cal-upcoming-1", "calendar", "calendar.upcoming", 1),
+            ("cal-upcoming-5", "calendar", "calendar.upcoming", 5),
+            ("email-any-9", "email", "*", 9),
+        ]
+        for name, source, event_type, priority in specs:
+            await engine.add_rule(
+                _make_rule(
+                    name=name,
+                    source=source,
+                    event_type=event_type,
+                    priority=priority,
+                    params={"name": name},
+                )
+            )
+
+        actions = await engine.evaluate(_make_event())
+
+        assert [a.params["name"] for a in actions] == [
+            "any-upcoming-9",
+            "any-5",
+            "cal-any-5",
+            "cal-upcoming-5",
+            "cal-upcoming-1",
+        ]
+
+    async def test_replaced_rule_is_reindexed_in_place(self, tmp_path: Path) -> None:
+        engine = FileRuleEngine(work_dir=str(tmp_path))
+        first = _make_rule(name="first", source="email")
+        await engine.add_rule(first)
+        await engine.add_rule(_make_rule(name="second"))
+
+        await engine.add_rule(
+            TriggerRule(
+                rule_id=first.rule_id,
+                name="first",
+                trigger=TriggerCondition(source="calendar"),
+                action=RuleAction(action_type=RuleActionType.NOTIFY),
+            )
+        )
+
+        assert [r.name for r in await engine.list_rules()] == ["first", "second"]
+        assert len(await engine.evaluate(_make_event(source="calendar"))) == 2
+        assert len(await engine.evaluate(_make_event(source="email"))) == 1
+
+    async def test_removed_rule_no_longer_matches(self, tmp_path: Path) -> None:
+        engine = FileRuleEngine(work_dir=str(tmp_path))
+        keep = await engine.add_rule(_make_rule(name="keep", priority=1))
+        drop = await engine.add_rule(_make_rule(name="drop", priority=1))
+
+        await engine.remove_rule(drop)
+
+        assert len(await engine.evaluate(_make_event())) == 1
+        assert [r.rule_id for r in await engine.list_rules()] == [keep]
+
+    async def test_filters_apply_within_a_bucket(self, tmp_path: Path) -> None:
+        engine = FileRuleEngine(work_dir=str(tmp_path))
+        await engine.add_rule(
+            _make_rule(source="calendar", filters={"minutes": {"$lte": 30, "$gt": 5}})
+        )
+
+        assert await engine.evaluate(_make_event(payload={"minutes": 15}))
+        assert not await engine.evaluate(_make_event(payload={"minutes": 45}))
+        assert not await engine.evaluate(_make_event(payload={"minutes": 5}))
@@ -0,0 +1,109 @@
+"""Unit tests for JournalJobStore."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from taskforce.core.domain.schedule import (
+    ScheduleAction,
+    ScheduleActionType,
+    ScheduleJob,
+    ScheduleType,
+)
+from taskforce.infrastructure.scheduler.file_job_store import FileJobStore
+from taskforce.infrastructure.scheduler.journal_job_store import JournalJobStore
+from taskforce.infrastructure.scheduler.scheduler_service import SchedulerService
+
+
+def _make_job(name: str = "daily_briefing") -> ScheduleJob:
+    return ScheduleJob(
+        name=name,
+        schedule_type=ScheduleType.CRON,
+        expression="0 8 * * *",
+        action=ScheduleAction(
+            action_type=ScheduleActionType.EXECUTE_MISSION,
+            params={"mission": "Summarize overnight events"},
+        ),
+    )
+
+
+def _journal_lines(store: JournalJobStore) -> list[dict]:
+    return [json.loads(line) for line in store.path.read_text().splitlines()]
+
+
+class TestJournalJobStore:
+    @pytest.mark.spec("events-scheduler.journal_store_appends_one_record_per_change")
+    async def test_changes_append_records_and_survive_reopen(self, tmp_path: Path) -> None:
+        store = JournalJobStore(str(tmp_path))
+        kept, dropped = _make_job("kept"), _make_job("dropped")
+        await store.save(kept)
+        await store.save(dropped)
+        kept.enabled = False
+        await store.save(kept)
+        assert await store.delete(dropped.job_id) is True
+        assert await store.delete("missing") is False
+
+        assert [r["op"] for r in _journal_lines(store)] == ["put", "put", "put", "delete"]
+        store.close()
+
+        reopened = JournalJobStore(str(tmp_path))
+        jobs = await reopened.load_all()
+        assert [(j.job_id, j.enabled) for j in jobs] == [(kept.job_id, False)]
+        loaded = await reopened.load(kept.job_id)
+        assert loaded is not None and loaded.action.params == kept.action.params
+        assert await reopened.load(dropped.job_id) is None
+
+    async def test_torn_tail_is_truncated(self, tmp_path: Path) -> None:
+        store = JournalJobStore(str(tmp_path))
+        job = _make_job()
+        await store.save(job)
+        store.close()
+        with open(store.path, "ab") as handle:
+            handle.write(b'{"op": "put", "job": {"job_id": "half')
+
+        reopened = JournalJobStore(str(tmp_path))
+        assert [j.job_id for j in await reopened.load_all()] == [job.job_id]
+        await reopened.save(_make_job("next"))
+        assert len(_journal_lines(reopened)) == 2
+
+    async def test_corrupt_line_is_skipped(self, tmp_path: Path) -> None:
+        store = JournalJobStore(str(tmp_path))
+        await store.save(_make_job("a"))
+        store.close()
+        with open(store.path, "ab") as handle:
+            handle.write(b"not json\n")
+        await JournalJobStore(str(tmp_path)).save(_make_job("b"))
+
+        names = {j.name for j in await JournalJobStore(str(tmp_path)).load_all()}
+        assert names == {"a", "b"}
+
+    async def test_compacts_when_records_outgrow_jobs(self, tmp_path: Path) -> None:
+        store = JournalJobStore(str(tmp_path), compact_min_records=10, fsync=False)
+        job = _make_job()
+        for i in range(10):
+            job.name = f"rev-{i}"
+            await store.save(job)
+
+        lines = _journal_lines(store)
+        assert len(lines) == 1
+        assert lines[0]["job"]["name"] == "rev-9"
+        await store.save(_make_job("after"))
+        assert len(_journal_lines(store)) == 2
+
+    async def test_imports_file_job_store_on_first_use(self, tmp_path: Path) -> None:
+        legacy = FileJobStore(str(tmp_path))
+        await legacy.save(_make_job("a"))
+        await legacy.save(_make_job("b"))
+
+        store = JournalJobStore(str(tmp_path))
+        assert {j.name for j in await store.load_all()} == {"a", "b"}
+        assert store.path.exists()
+
+    async def test_scheduler_selects_journal_store(self, tmp_path: Path) -> None:
+        svc = SchedulerService(work_dir=str(tmp_path), store="journal")
+        await svc.add_job(_make_job())
+
+        assert (tmp_path / "scheduler" / "jobs.jsonl").exists()
@@ -10,6 +10,7 @@ import pytest
 
 from taskforce.core.domain.agent_event import AgentEvent, AgentEventType
 from taskforce.core.domain.schedule import (
+    CoalescePolicy,
     ScheduleAction,
     ScheduleActionType,
     ScheduleJob,
@@ -178,3 +179,164 @@ class TestSchedulerServiceLifecycle:
             assert await svc.get_job(job.job_id) is None
         finally:
             await svc.stop()
+
+
+def _interval_job(name: str = "poll", **kwargs) -> ScheduleJob:
+    return ScheduleJob(
+        name=name,
+        schedule_type=ScheduleType.INTERVAL,
+        expression="60s",
+        action=ScheduleAction(ScheduleActionType.SEND_NOTIFICATION),
+        **kwargs,
+    )
+
+
+class TestTimerHeap:
+    @pytest.mark.spec("events-scheduler.single_driver_task_for_all_jobs")
+    async def test_jobs_share_one_driver_task(self) -> None:
+        store = InMemoryJobStore()
+        for i in range(200):
+            await store.save(_interval_job(f"job-{i}"))
+        svc = SchedulerService(job_store=store, max_concurrent_fires=4)
+
+        await svc.start()
+        try:
+            names = [t.get_name() for t in asyncio.all_tasks() if t.get_name().startswith("sched")]
+            assert sorted(names) == ["scheduler-driver"] + [
+                f"scheduler-worker-{i}" for i in range(4)
+            ]
+            assert all(job.next_run is not None for job in await svc.list_jobs())
+        finally:
+            await svc.stop()
+
+    async def test_pause_and_remove_drop_heap_entries(self) -> None:
+        svc = SchedulerService(job_store=InMemoryJobStore())
+        await svc.start()
+        try:
+            paused, removed, kept = _interval_job("a"), _interval_job("b"), _interval_job("c")
+            for job in (paused, removed, kept):
+                await svc.add_job(job)
+            await svc.pause_job(paused.job_id)
+            await svc.remove_job(removed.job_id)
+
+            assert set(svc._entries) == {kept.job_id}
+            assert paused.next_run is None
+        finally:
+            await svc.stop()
+
+    @pytest.mark.spec("events-scheduler.late_slot_follows_coalesce_policy")
+    async def test_late_slot_follows_coalesce_policy(self) -> None:
+        svc = SchedulerService(job_store=InMemoryJobStore(), misfire_grace_seconds=5)
+        now = datetime.now(UTC).timestamp()
+        skip = _interval_job("skip")
+        run_once = _interval_job("run_once", coalesce=CoalescePolicy.RUN_ONCE)
+        on_time = _interval_job("on_time")
+        for job in (skip, run_once, on_time):
+            svc._jobs[job.job_id] = job
+
+        svc._on_due(skip, now - 600, now)
+        svc._on_due(run_once, now - 600, now)
+        svc._on_due(on_time, now - 2, now)
+
+        queued = [svc._dispatch.get_nowait()[0] for _ in range(svc._dispatch.qsize())]
+        assert queued == [run_once.job_id, on_time.job_id]
+        assert svc.stats["misfired"] == 2
+        # Each job is realigned on its next future slot, not on the missed ones.
+        for job in (skip, run_once, on_time):
+            assert now < job.next_run.timestamp() <= now + 60
+
+    async def test_default_grace_fires_slot_delayed_by_a_loop_stall(self) -> None:
+        svc = SchedulerService(job_store=InMemoryJobStore())
+        job = _interval_job("skip")
+        svc._jobs[job.job_id] = job
+        now = datetime.now(UTC).timestamp()
+
+        svc._on_due(job, now - 5, now)
+
+        assert svc._dispatch.qsize() == 1
+        assert svc.stats["misfired"] == 0
+
+    async def test_slot_due_while_previous_firing_runs_is_coalesced(self) -> None:
+        svc = SchedulerService(job_store=InMemoryJobStore())
+        job = _interval_job()
+        svc._jobs[job.job_id] = job
+        now = datetime.now(UTC).timestamp()
+
+        svc._on_due(job, now, now)
+        svc._on_due(job, now + 0.1, now + 0.1)
+
+        assert svc._dispatch.qsize() == 1
+        assert svc.stats["coalesced"] == 1
+
+    @pytest.mark.spec("events-scheduler.fires_bounded_by_worker_pool")
+    async def test_concurrent_fires_bounded_by_worker_pool(self) -> None:
+        active = 0
+        peak = 0
+        fired = 0
+
+        async def on_event(event: AgentEvent) -> None:
+            nonlocal active, peak, fired
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.05)
+            active -= 1
+            fired += 1
+
+        svc = SchedulerService(
+            job_store=InMemoryJobStore(), event_callback=on_event, max_concurrent_fires=2
+        )
+        await svc.start()
+        try:
+            due = datetime.now(UTC).isoformat()
+            for i in range(6):
+                await svc.add_job(
+                    ScheduleJob(name=f"s{i}", schedule_type=ScheduleType.ONE_SHOT, expression=due)
+                )
+            for _ in range(40):
+                if fired == 6:
+                    break
+                await asyncio.sleep(0.05)
+            assert fired == 6
+            assert peak == 2
+            assert await svc.list_jobs() == []
+        finally:
+            await svc.stop()
+
+    async def test_fired_event_carries_scheduled_slot(self) -> None:
+        fired: list[AgentEvent] = []
+
+        async def on_event(event: AgentEvent) -> None:
+            fired.append(event)
+
+        svc = SchedulerService(job_store=InMemoryJobStore(), event_callback=on_event)
+        due = datetime.now(UTC) + timedelta(milliseconds=30)
+        await svc.start()
+        try:
+            await svc.add_job(
+                ScheduleJob(
+                    name="s", schedule_type=ScheduleType.ONE_SHOT, expression=due.isoformat()
+                )
+            )
+            await asyncio.sleep(0.3)
+            assert datetime.fromisoformat(fired[0].metadata["scheduled_for"]) == due
+        finally:
+            await svc.stop()
+
+    def test_unknown_store_type_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown job store type"):
+            SchedulerService(store="redis")
+
+
+class TestCompiledCron:
+    def test_impossible_date_raises_quickly(self) -> None:
+        with pytest.raises(ValueError, match="No matching time"):
+            _next_cron_occurrence("0 0 31 2 *", datetime(2026, 1, 1, tzinfo=UTC))
+
+    def test_day_and_weekday_must_both_match(self) -> None:
+        # Friday the 13th: 13 February 2026 is the first Friday (weekday 4) on a 13th.
+        nxt = _next_cron_occurrence("0 9 13 * 4", datetime(2026, 1, 1, tzinfo=UTC))
+        assert nxt == datetime(2026, 2, 13, 9, 0, tzinfo=UTC)
+
+    def test_month_rollover_into_next_year(self) -> None:
+        nxt = _next_cron_occurrence("30 6 1 1 *", datetime(2026, 6, 1, tzinfo=UTC))
+        assert nxt == datetime(2027, 1, 1, 6, 30, tzinfo=UTC)
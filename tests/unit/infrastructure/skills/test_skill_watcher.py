@@ -0,0 +1,258 @@
+"""
+Tests for the skill change watchers
+
+Covers both backends (inotify and polling) and the incremental
+``FileSkillRegistry.apply_changes`` path they feed.
+"""
+
+import shutil
+import sys
+
+import pytest
+
+from taskforce.infrastructure.skills import skill_watcher
+from taskforce.infrastructure.skills.skill_registry import FileSkillRegistry
+from taskforce.infrastructure.skills.skill_watcher import (
+    InotifySkillWatcher,
+    PollingSkillWatcher,
+    SkillChangeWatcher,
+    create_skill_watcher,
+)
+
+
+def _write_skill(base, name, description="Does things."):
+    skill_dir = base / name
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: {description}\n---\n\n# {name}\n"
+    )
+    return skill_dir
+
+
+def _inotify_watcher():
+    if not sys.platform.startswith("linux"):
+        pytest.skip("inotify is Linux-only")
+    try:
+        return InotifySkillWatcher()
+    except OSError as exc:  # pragma: no cover — sandboxed kernels
+        pytest.skip(f"inotify unavailable: {exc}")
+
+
+@pytest.fixture(params=["inotify", "polling"])
+def watcher(request):
+    """Both backends; the polling one is driven by explicit ``scan()`` calls."""
+    if request.param == "inotify":
+        w = _inotify_watcher()
+    else:
+        w = PollingSkillWatcher(start_thread=False)
+    yield w
+    w.close()
+
+
+def _changes(watcher):
+    if isinstance(watcher, PollingSkillWatcher):
+        watcher.scan()
+    return watcher.drain()
+
+
+class TestSkillChangeWatcher:
+    def test_watch_is_idempotent_and_skips_missing_dirs(self, watcher, tmp_path):
+        assert watcher.watch(tmp_path) is True
+        assert watcher.watch(tmp_path) is False
+        assert watcher.watch(tmp_path / "missing") is False
+        assert watcher.roots == [tmp_path.resolve()]
+
+    def test_generation_is_stable_without_changes(self, watcher, tmp_path):
+        _write_skill(tmp_path, "alpha")
+        watcher.watch(tmp_path)
+        generation = watcher.generation
+
+        assert _changes(watcher) == set()
+        assert watcher.generation == generation
+
+    def test_nested_write_bumps_generation(self, watcher, tmp_path):
+        skill_dir = _write_skill(tmp_path, "alpha")
+        (skill_dir / "references").mkdir()
+        watcher.watch(tmp_path)
+        generation = watcher.generation
+
+        nested = skill_dir / "references" / "guide.md"
+        nested.write_text("# Guide")
+
+        assert nested.resolve() in _changes(watcher)
+        assert watcher.generation > generation
+
+    def test_new_directory_tree_is_watched(self, watcher, tmp_path):
+        watcher.watch(tmp_path)
+        skill_dir = _write_skill(tmp_path, "beta")
+        changes = _changes(watcher)
+        assert changes & {skill_dir.resolve(), (skill_dir / "SKILL.md").resolve()}
+
+        (skill_dir / "SKILL.md").write_text("changed")
+        assert (skill_dir / "SKILL.md").resolve() in _changes(watcher)
+
+    def test_renamed_directory_reports_both_paths(self, watcher, tmp_path):
+        old = _write_skill(tmp_path, "old-name")
+        watcher.watch(tmp_path)
+
+        new = old.rename(tmp_path / "new-name")
+        changes = _changes(watcher)
+        assert any(p == old.resolve() or old.resolve() in p.parents for p in changes)
+        assert any(p == new.resolve() or new.resolve() in p.parents for p in changes)
+
+        # The moved tree is watched under its new name.
+        (new / "SKILL.md").write_text("changed")
+        assert (new / "SKILL.md").resolve() in _changes(watcher)
+
+    def test_close_is_idempotent(self, watcher, tmp_path):
+        watcher.watch(tmp_path)
+        watcher.close()
+        watcher.close()
+
+
+def test_inotify_change_visible_without_delay(tmp_path):
+    """Kernel-queued events are visible to the very next generation read."""
+    watcher = _inotify_watcher()
+    try:
+        watcher.watch(tmp_path)
+        generation = watcher.generation
+        (tmp_path / "note.md").write_text("x")
+        assert watcher.generation == generation + 1
+    finally:
+        watcher.close()
+
+
+def test_create_skill_watcher_prefers_inotify_on_linux():
+    watcher = create_skill_watcher()
+    try:
+        if sys.platform.startswith("linux"):
+            assert isinstance(watcher, InotifySkillWatcher)
+        else:  # pragma: no cover
+            assert isinstance(watcher, PollingSkillWatcher)
+    finally:
+        watcher.close()
+
+
+def test_create_skill_watcher_can_force_polling():
+    watcher = create_skill_watcher(force_polling=True)
+    try:
+        assert isinstance(watcher, PollingSkillWatcher)
+    finally:
+        watcher.close()
+
+
+def test_base_watcher_is_abstract():
+    with pytest.raises(TypeError):
+        SkillChangeWatcher()
+
+
+def _fake_mounts(monkeypatch, tmp_path, *entries):
+    mounts = tmp_path / "mounts"
+    mounts.write_text("".join(f"server:/x {point} {fstype} rw 0 0\n" for point, fstype in entries))
+    monkeypatch.setattr(skill_watcher, "_MOUNTS_FILE", str(mounts))
+
+
+class TestNetworkMounts:
+    """inotify never sees remote writes, so network mounts must be polled."""
+
+    def test_root_on_network_mount_is_refused(self, monkeypatch, tmp_path):
+        root = (tmp_path / "share").resolve()
+        root.mkdir()
+        _fake_mounts(monkeypatch, tmp_path, ("/", "ext4"), (tmp_path.resolve(), "nfs4"))
+        watcher = _inotify_watcher()
+        try:
+            with pytest.raises(OSError, match="nfs4"):
+                watcher.watch(root)
+            assert watcher.roots == []
+        finally:
+            watcher.close()
+
+    def test_network_mount_below_root_is_refused(self, monkeypatch, tmp_path):
+        root = tmp_path.resolve()
+        _fake_mounts(monkeypatch, tmp_path, ("/", "ext4"), (root / "remote", "cifs"))
+        assert skill_watcher._network_fs_type(root) == "cifs"
+
+    def test_local_mount_below_network_mount_wins(self, monkeypatch, tmp_path):
+        root = tmp_path.resolve()
+        _fake_mounts(monkeypatch, tmp_path, ("/", "nfs"), (root, "tmpfs"))
+        assert skill_watcher._network_fs_type(root) is None
+
+    def test_escaped_mount_point(self, monkeypatch, tmp_path):
+        root = (tmp_path / "my skills").resolve()
+        root.mkdir()
+        escaped = str(root).replace(" ", "\\040")
+        _fake_mounts(monkeypatch, tmp_path, ("/", "ext4"), (escaped, "smb3"))
+        assert skill_watcher._network_fs_type(root) == "smb3"
+
+    def test_missing_mount_table_is_treated_as_local(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(skill_watcher, "_MOUNTS_FILE", str(tmp_path / "absent"))
+        assert skill_watcher._network_fs_type(tmp_path) is None
+
+
+class TestRegistryApplyChanges:
+    """``FileSkillRegistry.apply_changes`` re-reads only the owning skills."""
+
+    @pytest.fixture
+    def root(self, tmp_path):
+        _write_skill(tmp_path, "alpha")
+        _write_skill(tmp_path, "beta")
+        return tmp_path.resolve()
+
+    def test_add(self, root):
+        registry = FileSkillRegistry([str(root)])
+        skill_dir = _write_skill(root, "gamma")
+
+        assert registry.apply_changes({skill_dir / "SKILL.md"}) == {"gamma"}
+        assert registry.list_skills() == ["alpha", "beta", "gamma"]
+
+    def test_modify_nested_file_invalidates_loaded_skill(self, root):
+        registry = FileSkillRegistry([str(root)])
+        first = registry.get_skill("alpha")
+        (root / "alpha" / "SKILL.md").write_text(
+            "---\nname: alpha\ndescription: Updated.\n---\n\n# alpha v2\n"
+        )
+
+        assert registry.apply_changes({root / "alpha" / "SKILL.md"}) == {"alpha"}
+        assert registry.get_skill_metadata("alpha").description == "Updated."
+        assert registry.get_skill("alpha") is not first
+
+    def test_delete(self, root):
+        registry = FileSkillRegistry([str(root)])
+        shutil.rmtree(root / "beta")
+
+        assert registry.apply_changes({root / "beta"}) == {"beta"}
+        assert registry.list_skills() == ["alpha"]
+
+    def test_rename_updates_slash_index(self, root):
+        registry = FileSkillRegistry([str(root)])
+        (root / "beta").rename(root / "delta")
+        (root / "delta" / "SKILL.md").write_text("---\nname: delta\ndescription: Renamed.\n---\n")
+
+        assert registry.apply_changes({root / "beta", root / "delta"}) == {"beta", "delta"}
+        assert registry.list_skills() == ["alpha", "delta"]
+        assert registry.get_skill_by_slash_name("beta") is None
+        assert registry.get_skill_by_slash_name("delta").name == "delta"
+
+    def test_untouched_skills_are_not_reparsed(self, root, monkeypatch):
+        registry = FileSkillRegistry([str(root)])
+        parsed = []
+        original = registry._parse_metadata
+        monkeypatch.setattr(
+            registry, "_parse_metadata", lambda d: parsed.append(d.name) or original(d)
+        )
+        (root / "alpha" / "notes.md").write_text("x")
+
+        registry.apply_changes({root / "alpha" / "notes.md"})
+        assert parsed == ["alpha"]
+
+    def test_name_collision_falls_back_to_full_refresh(self, root, tmp_path_factory):
+        other = tmp_path_factory.mktemp("other").resolve()
+        registry = FileSkillRegistry([str(root), str(other)])
+        _write_skill(other, "alpha", description="Shadowing.")
+        refreshed = []
+        original = registry.refresh
+        registry.refresh = lambda: refreshed.append(True) or original()
+
+        registry.apply_changes({other / "alpha" / "SKILL.md"})
+        assert refreshed == [True]
+        assert registry.get_skill_metadata("alpha").description == "Shadowing."
@@ -183,3 +183,73 @@ class TestFileConversationStore:
         archived = await store.list_archived()
         match = next(c for c in archived if c.conversation_id == conv_id)
         assert match.project_id == "proj-42"
+
+
+class TestConversationLookup:
+    @pytest.fixture
+    def store(self, tmp_path):
+        return FileConversationStore(work_dir=str(tmp_path))
+
+    @pytest.mark.spec("conversations.get_info_resolves_active_and_archived_by_id")
+    async def test_get_info_resolves_active_and_archived(self, store):
+        archived_id = await store.create_new("rest", project_id="proj-1")
+        active_id = await store.create_new("rest")  # archives the first one
+
+        active = await store.get_info(active_id)
+        archived = await store.get_info(archived_id)
+
+        assert active is not None and active.archived_at is None
+        assert archived is not None and archived.archived_at is not None
+        assert archived.channel == "rest" and archived.project_id == "proj-1"
+        assert await store.get_info("never-existed") is None
+
+    async def test_index_parsed_once_until_file_changes(self, store, monkeypatch):
+        import json
+        import os
+
+        from taskforce.infrastructure.persistence import file_conversation_store as module
+
+        conv_id = await store.create_new("rest")
+        index_file = store._index_file
+        os.utime(index_file, ns=(0, 0))  # outside the racy window
+        module.clear_index_cache()
+        parses = []
+        real_loads = json.loads
+        monkeypatch.setattr(
+            module.json, "loads", lambda text: parses.append(1) or real_loads(text)
+        )
+
+        for _ in range(3):
+            assert await FileConversationStore(str(index_file.parent.parent)).get_info(conv_id)
+        assert len(parses) == 1
+
+        # Another writer replaces the file: the next lookup sees the change.
+        entries = real_loads(index_file.read_text())
+        entries[0]["topic"] = "changed elsewhere"
+        index_file.write_text(module.json.dumps(entries))
+        assert (await store.get_info(conv_id)).topic == "changed elsewhere"
+
+    @pytest.mark.spec("conversations.list_paginated_by_cursor")
+    async def test_archived_pages_cover_every_conversation_once(self, store):
+        ids = []
+        for i in range(7):
+            conv_id = await store.create_new("rest", project_id="p" if i % 2 else None)
+            await store.archive(conv_id)
+            ids.append(conv_id)
+
+        seen, cursor = [], None
+        while True:
+            page = await store.list_archived_page(limit=3, cursor=cursor)
+            seen.extend(c.conversation_id for c in page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+        assert sorted(seen) == sorted(ids)
+        assert seen == [c.conversation_id for c in await store.list_archived(limit=100)]
+
+        in_project = await store.list_archived_page(limit=100, project_id="p")
+        assert {c.conversation_id for c in in_project.items} == set(ids[1::2])
+
+    async def test_malformed_cursor_raises_value_error(self, store):
+        with pytest.raises(ValueError):
+            await store.list_active_page(limit=1, cursor="%%%")
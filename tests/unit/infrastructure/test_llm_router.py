@@ -527,3 +527,72 @@ class TestRoutingConfigFromDelegate:
         # "planning" is a known alias → passes through, hint rule is NOT evaluated
         result = router._select_model("planning", [], None)
         assert result == "planning"
+
+
+# ---------------------------------------------------------------------------
+# Failover while a model's circuit is open
+# ---------------------------------------------------------------------------
+
+class TestFailover:
+    """Fallback aliases used while the delegate reports a model unavailable."""
+
+    @pytest.fixture
+    def failover_router(self, mock_delegate):
+        return build_llm_router(
+            mock_delegate,
+            {"fallbacks": {"main": ["fast", "powerful"]}},
+            default_model="main",
+        )
+
+    @pytest.mark.spec("llm-router.open_circuit_fails_over_to_fallback")
+    @pytest.mark.asyncio
+    async def test_unavailable_model_is_skipped(self, failover_router, mock_delegate):
+        mock_delegate.model_available = MagicMock(side_effect=lambda alias: alias != "main")
+
+        await failover_router.complete(messages=[{"role": "user", "content": "x"}], model="main")
+
+        assert mock_delegate.complete.call_args.kwargs["model"] == "fast"
+
+    @pytest.mark.asyncio
+    async def test_circuit_open_result_tries_next_candidate(self, failover_router, mock_delegate):
+        mock_delegate.model_available = MagicMock(return_value=True)
+        mock_delegate.complete = AsyncMock(
+            side_effect=[
+                {"success": False, "error_type": "CircuitOpenError"},
+                {"success": True, "content": "from fast"},
+            ]
+        )
+
+        result = await failover_router.complete(
+            messages=[{"role": "user", "content": "x"}], model="main"
+        )
+
+        assert result["content"] == "from fast"
+        models = [c.kwargs["model"] for c in mock_delegate.complete.call_args_list]
+        assert models == ["main", "fast"]
+
+    @pytest.mark.asyncio
+    async def test_stream_fails_over_before_any_output(self, failover_router, mock_delegate):
+        mock_delegate.model_available = MagicMock(return_value=True)
+
+        async def stream(**kwargs):
+            if kwargs["model"] == "main":
+                yield {"type": "error", "message": "circuit open", "error_kind": "circuit_open"}
+                return
+            yield {"type": "token", "content": kwargs["model"]}
+            yield {"type": "done", "usage": {}}
+
+        mock_delegate.complete_stream = stream
+
+        chunks = [
+            c
+            async for c in failover_router.complete_stream(
+                messages=[{"role": "user", "content": "x"}], model="main"
+            )
+        ]
+
+        assert chunks == [{"type": "token", "content": "fast"}, {"type": "done", "usage": {}}]
+
+    def test_fallbacks_accept_single_alias_string(self, mock_delegate):
+        router = build_llm_router(mock_delegate, {"fallbacks": {"main": "fast"}}, "main")
+        assert router.fallbacks == {"main": ["fast"]}
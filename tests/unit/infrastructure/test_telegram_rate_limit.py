@@ -0,0 +1,119 @@
+"""Tests for TelegramOutboundSender HTTP 429 ``retry_after`` handling."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from taskforce.infrastructure.communication.outbound_senders import (
+    TelegramOutboundSender,
+    _telegram_retry_after,
+    _TelegramClientError,
+)
+
+
+class _FakeResponse:
+    def __init__(self, status: int = 200, body: str = "") -> None:
+        self.status = status
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        return None
+
+    async def text(self):
+        return self._body
+
+
+def _flood_body(retry_after: int) -> str:
+    return json.dumps(
+        {
+            "ok": False,
+            "error_code": 429,
+            "description": f"Too Many Requests: retry after {retry_after}",
+            "parameters": {"retry_after": retry_after},
+        }
+    )
+
+
+def _session(*responses: _FakeResponse) -> MagicMock:
+    session = MagicMock()
+    session.post = MagicMock(side_effect=list(responses))
+    session.closed = False
+    return session
+
+
+class TestRetryAfterParsing:
+    def test_reads_parameters_retry_after(self):
+        assert _telegram_retry_after(_flood_body(7)) == 7.0
+
+    def test_missing_or_malformed_is_none(self):
+        assert _telegram_retry_after("not json") is None
+        assert _telegram_retry_after(json.dumps({"ok": False})) is None
+        assert _telegram_retry_after(json.dumps([1, 2])) is None
+
+
+class TestSendRateLimited:
+    async def test_429_sleeps_retry_after_then_succeeds(self):
+        sender = TelegramOutboundSender("token", base_backoff=0.01)
+        session = _session(_FakeResponse(429, _flood_body(3)), _FakeResponse(200))
+        sleep = AsyncMock()
+        with (
+            patch.object(sender, "_get_session", AsyncMock(return_value=session)),
+            patch.object(sender, "_close_session", AsyncMock()),
+            patch("asyncio.sleep", sleep),
+        ):
+            await sender.send(recipient_id="42", message="hi")
+
+        sleep.assert_awaited_once_with(3.0)
+        assert session.post.call_count == 2
+
+    async def test_5xx_without_hint_uses_exponential_backoff(self):
+        sender = TelegramOutboundSender("token", base_backoff=0.5)
+        session = _session(
+            _FakeResponse(502, "bad gateway"),
+            _FakeResponse(502, "bad gateway"),
+            _FakeResponse(200),
+        )
+        sleep = AsyncMock()
+        with (
+            patch.object(sender, "_get_session", AsyncMock(return_value=session)),
+            patch.object(sender, "_close_session", AsyncMock()),
+            patch("asyncio.sleep", sleep),
+        ):
+            await sender.send(recipient_id="42", message="hi")
+
+        assert [c.args[0] for c in sleep.await_args_list] == [0.5, 1.0]
+
+    async def test_retry_after_above_cap_fails_fast(self):
+        sender = TelegramOutboundSender("token", max_retry_after=10.0)
+        session = _session(_FakeResponse(429, _flood_body(120)))
+        sleep = AsyncMock()
+        with (
+            patch.object(sender, "_get_session", AsyncMock(return_value=session)),
+            patch("asyncio.sleep", sleep),
+            pytest.raises(_TelegramClientError, match="retry_after=120s"),
+        ):
+            await sender.send(recipient_id="42", message="hi")
+
+        sleep.assert_not_awaited()
+        assert session.post.call_count == 1
+
+    async def test_send_file_honours_retry_after(self, tmp_path):
+        doc = tmp_path / "report.pdf"
+        doc.write_bytes(b"%PDF-1.4 test")
+        sender = TelegramOutboundSender("token", base_backoff=0.01)
+        session = _session(_FakeResponse(429, _flood_body(2)), _FakeResponse(200))
+        sleep = AsyncMock()
+        with (
+            patch.object(sender, "_get_session", AsyncMock(return_value=session)),
+            patch.object(sender, "_close_session", AsyncMock()),
+            patch("asyncio.sleep", sleep),
+        ):
+            await sender.send_file(recipient_id="42", file_path=str(doc))
+
+        sleep.assert_awaited_once_with(2.0)
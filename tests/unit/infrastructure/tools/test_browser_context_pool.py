@@ -0,0 +1,317 @@
+"""Tests for BrowserContextPool and per-session contexts in BrowserTool.
+
+Playwright is replaced by small fakes: a browser whose contexts hand out
+pages and record the storage state they were opened with.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import taskforce.infrastructure.tools.native.browser_context_pool as context_pool_module
+import taskforce.infrastructure.tools.native.browser_tool as browser_module
+from taskforce.application.token_ledger import run_context
+from taskforce.infrastructure.tools.native.browser_context_pool import BrowserContextPool
+from taskforce.infrastructure.tools.native.browser_tool import BrowserTool
+
+
+class _FakeContext:
+    def __init__(self, storage_state: dict[str, Any] | None) -> None:
+        self.opened_with = storage_state
+        self.cookies = list((storage_state or {}).get("cookies", []))
+        self.closed = False
+
+    async def storage_state(self) -> dict[str, Any]:
+        return {"cookies": list(self.cookies), "origins": []}
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self) -> None:
+        self.contexts: list[_FakeContext] = []
+
+    async def new_page_context(self, storage_state: dict[str, Any] | None) -> tuple[Any, Any]:
+        context = _FakeContext(storage_state)
+        self.contexts.append(context)
+        return context, MagicMock(name=f"page-{len(self.contexts)}")
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _use(pool: BrowserContextPool, key: str, browser: _FakeBrowser) -> Any:
+    async with pool.lease(key, browser) as lease:
+        return lease
+
+
+class TestPool:
+    @pytest.mark.spec("tools.browser_sessions_get_isolated_contexts")
+    async def test_sessions_get_isolated_contexts_reused_per_session(self) -> None:
+        pool = BrowserContextPool()
+        browser = _FakeBrowser()
+
+        first = await _use(pool, "s1", browser)
+        second = await _use(pool, "s2", browser)
+        again = await _use(pool, "s1", browser)
+
+        assert first.page is not second.page
+        assert again.page is first.page
+        assert len(browser.contexts) == 2
+
+    @pytest.mark.spec("tools.browser_pool_evicts_lru_and_restores_storage_state")
+    async def test_full_pool_evicts_lru_idle_context_and_restores_its_state(self) -> None:
+        pool = BrowserContextPool(max_contexts=2)
+        browser = _FakeBrowser()
+        s1 = await _use(pool, "s1", browser)
+        s1.context.cookies.append({"name": "sid", "value": "abc"})
+        await _use(pool, "s2", browser)
+
+        await _use(pool, "s3", browser)
+
+        assert len(pool) == 2
+        assert s1.context.closed
+        reopened = await _use(pool, "s1", browser)
+        assert reopened.context.opened_with["cookies"] == [{"name": "sid", "value": "abc"}]
+
+    async def test_waits_for_a_busy_context_then_times_out(self) -> None:
+        pool = BrowserContextPool(max_contexts=1)
+        browser = _FakeBrowser()
+        released = asyncio.Event()
+
+        async def hold() -> None:
+            async with pool.lease("s1", browser):
+                await released.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        with pytest.raises(TimeoutError):
+            async with pool.lease("s2", browser, timeout_seconds=0.05):
+                pass
+
+        waiter = asyncio.create_task(_use(pool, "s2", browser))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        released.set()
+        await holder
+        lease = await asyncio.wait_for(waiter, timeout=1)
+        assert lease.key == "s2"
+
+    async def test_same_session_actions_run_one_at_a_time(self) -> None:
+        pool = BrowserContextPool()
+        browser = _FakeBrowser()
+        active = 0
+        peak = 0
+
+        async def action() -> None:
+            nonlocal active, peak
+            async with pool.lease("s1", browser):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(action() for _ in range(5)))
+        assert peak == 1
+
+    async def test_idle_contexts_are_closed(self) -> None:
+        clock = _Clock()
+        pool = BrowserContextPool(idle_timeout_seconds=60, clock=clock)
+        browser = _FakeBrowser()
+        idle = await _use(pool, "idle", browser)
+
+        clock.now = 61
+        await _use(pool, "busy", browser)
+
+        assert idle.context.closed
+        assert len(pool) == 1
+
+    async def test_relaunched_browser_reopens_contexts(self) -> None:
+        pool = BrowserContextPool()
+        old, new = _FakeBrowser(), _FakeBrowser()
+        await _use(pool, "s1", old)
+
+        stale = await _use(pool, "s1", old)
+        stale.context.cookies.append({"name": "sid", "value": "abc"})
+
+        lease = await _use(pool, "s1", new)
+
+        assert lease.owner is new
+        assert len(new.contexts) == 1
+        assert stale.context.closed
+        assert lease.context.opened_with["cookies"] == [{"name": "sid", "value": "abc"}]
+
+    async def test_close_all_waits_for_busy_contexts(self) -> None:
+        pool = BrowserContextPool()
+        browser = _FakeBrowser()
+        idle = await _use(pool, "idle", browser)
+        released = asyncio.Event()
+
+        async def hold() -> None:
+            async with pool.lease("busy", browser):
+                await released.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        with pytest.raises(TimeoutError):
+            await pool.close_all(timeout_seconds=0.05)
+        assert not idle.context.closed
+
+        closing = asyncio.create_task(pool.close_all())
+        await asyncio.sleep(0.01)
+        assert not closing.done()
+        released.set()
+        await holder
+        await asyncio.wait_for(closing, timeout=1)
+
+        assert len(pool) == 0
+        assert all(context.closed for context in browser.contexts)
+
+    async def test_storage_dir_persists_state_across_pools(self, tmp_path: Path) -> None:
+        browser = _FakeBrowser()
+        pool = BrowserContextPool(storage_dir=tmp_path / "state")
+        lease = await _use(pool, "s1", browser)
+        lease.context.cookies.append({"name": "sid", "value": "abc"})
+        await pool.close("s1")
+
+        restarted = BrowserContextPool(storage_dir=tmp_path / "state")
+        reopened = await _use(restarted, "s1", browser)
+        other = await _use(restarted, "s2", browser)
+
+        assert reopened.context.opened_with["cookies"] == [{"name": "sid", "value": "abc"}]
+        assert other.context.opened_with is None
+
+    async def test_persisted_state_is_owner_only_and_not_kept_in_memory(
+        self, tmp_path: Path
+    ) -> None:
+        pool = BrowserContextPool(storage_dir=tmp_path / "state")
+        await _use(pool, "s1", _FakeBrowser())
+        await pool.close("s1")
+
+        (state_file,) = (tmp_path / "state").iterdir()
+        if os.name == "posix":
+            assert state_file.stat().st_mode & 0o777 == 0o600
+        assert not pool._saved_state
+
+    async def test_in_memory_state_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(context_pool_module, "_MAX_SAVED_STATES", 2)
+        pool = BrowserContextPool()
+        browser = _FakeBrowser()
+        for key in ("s1", "s2", "s3"):
+            await _use(pool, key, browser)
+            await pool.close(key)
+
+        assert list(pool._saved_state) == ["s2", "s3"]
+
+    async def test_idle_sweep_task_is_referenced(self) -> None:
+        pool = BrowserContextPool(idle_timeout_seconds=0.01)
+        lease = await _use(pool, "s1", _FakeBrowser())
+
+        await asyncio.sleep(0.05)
+
+        assert pool._sweep_task is not None
+        await pool._sweep_task
+        assert lease.context.closed
+
+
+class TestBrowserToolSessions:
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        browser_module._session = None
+        browser_module._session_lock = None
+        browser_module._pool = None
+        yield
+        browser_module._session = None
+        browser_module._session_lock = None
+        browser_module._pool = None
+
+    async def test_concurrent_first_calls_launch_one_browser(self) -> None:
+        launches: list[bool] = []
+
+        async def launch(headless: bool) -> Any:
+            launches.append(headless)
+            await asyncio.sleep(0.01)
+            return MagicMock()
+
+        with patch.object(browser_module, "_launch_session", launch):
+            sessions = await asyncio.gather(*(browser_module._get_session() for _ in range(3)))
+
+        assert launches == [True]
+        assert sessions[0] is sessions[1] is sessions[2]
+
+    async def test_restart_headed_is_refused_while_another_session_browses(self) -> None:
+        pool = browser_module._get_pool(8, 300.0, None)
+        browser = _FakeBrowser()
+        old_session = MagicMock(close=AsyncMock())
+        browser_module._session = old_session
+        released = asyncio.Event()
+
+        async def hold() -> None:
+            async with pool.lease("s1", browser):
+                await released.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        result = await BrowserTool()._action_restart_headed(pool, 0.05)
+        released.set()
+        await holder
+
+        assert result["success"] is False
+        assert "still in use" in result["error"]
+        old_session.close.assert_not_awaited()
+        assert browser_module._session is old_session
+
+    async def test_concurrent_missions_browse_in_parallel_on_own_pages(self) -> None:
+        pages: list[MagicMock] = []
+
+        async def new_page_context(state: Any) -> tuple[Any, Any]:
+            page = MagicMock()
+            page.url = "about:blank"
+
+            async def goto(url: str, **_: Any) -> Any:
+                await asyncio.sleep(0.2)
+                page.url = url
+                return MagicMock(status=200)
+
+            page.goto = goto
+            page.title = AsyncMock(return_value="t")
+            pages.append(page)
+            context = MagicMock(storage_state=AsyncMock(return_value={}), close=AsyncMock())
+            return context, page
+
+        session = MagicMock(new_page_context=new_page_context)
+        tool = BrowserTool()
+
+        async def mission(session_id: str, url: str) -> dict[str, Any]:
+            with run_context(session_id=session_id):
+                return await tool.execute(action="navigate", url=url)
+
+        with patch.object(browser_module, "_get_session", AsyncMock(return_value=session)):
+            started = time.perf_counter()
+            results = await asyncio.gather(
+                mission("s1", "https://example.com/a"),
+                mission("s2", "https://example.com/b"),
+                mission("s3", "https://example.com/c"),
+            )
+            elapsed = time.perf_counter() - started
+
+        assert [r["url"] for r in results] == [
+            "https://example.com/a",
+            "https://example.com/b",
+            "https://example.com/c",
+        ]
+        assert len(pages) == 3
+        assert elapsed < 0.5  # one shared page would take >= 0.6 s
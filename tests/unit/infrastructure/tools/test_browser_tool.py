@@ -54,10 +54,19 @@ def _make_page(
 
 @pytest.fixture(autouse=True)
 def reset_browser_session():
-    """Ensure module-level browser session is clean before each test."""
+    """Ensure module-level browser session and pool are clean before each test."""
     browser_module._session = None
+    browser_module._pool = None
     yield
     browser_module._session = None
+    browser_module._pool = None
+
+
+def _make_context() -> MagicMock:
+    context = MagicMock()
+    context.storage_state = AsyncMock(return_value={"cookies": [], "origins": []})
+    context.close = AsyncMock()
+    return context
 
 
 @pytest.fixture
@@ -74,9 +83,9 @@ def mock_page() -> MagicMock:
 
 @pytest.fixture
 def mock_session(mock_page: MagicMock) -> MagicMock:
-    """Return a mock _BrowserSession whose .page property returns mock_page."""
+    """Return a mock _BrowserSession whose contexts all open mock_page."""
     session = MagicMock()
-    session.page = mock_page
+    session.new_page_context = AsyncMock(side_effect=lambda state: (_make_context(), mock_page))
     session.close = AsyncMock()
     return session
 
@@ -428,16 +437,15 @@ class TestExecuteActions:
 
     # --- close ---
 
-    async def test_close_action(self, tool: BrowserTool) -> None:
-        # Place a mock session into the module global
-        mock_sess = MagicMock()
-        mock_sess.close = AsyncMock()
-        browser_module._session = mock_sess  # type: ignore[assignment]
+    async def test_close_action(self, tool: BrowserTool, mock_session: MagicMock) -> None:
+        await tool.execute(action="navigate", url="https://example.com")
+        assert len(browser_module._pool) == 1
 
         result = await tool.execute(action="close")
         assert result["success"] is True
-        mock_sess.close.assert_awaited_once()
-        assert browser_module._session is None
+        assert len(browser_module._pool) == 0
+        # Only the session's context closes; the browser stays warm.
+        mock_session.close.assert_not_awaited()
 
     # --- unknown action ---
 
@@ -578,14 +586,13 @@ class TestRestartHeaded:
         new_session = MagicMock()
         new_session.headless = False
 
-        async def _get_session_replacement(headless: bool = True):
+        async def _launch_replacement(headless: bool):
             assert headless is False, "restart_headed must request headless=False"
-            browser_module._session = new_session  # type: ignore[assignment]
             return new_session
 
         with patch(
-            "taskforce.infrastructure.tools.native.browser_tool._get_session",
-            new=_get_session_replacement,
+            "taskforce.infrastructure.tools.native.browser_tool._launch_session",
+            new=_launch_replacement,
         ):
             result = await tool.execute(action="restart_headed")
 
@@ -603,14 +610,13 @@ class TestRestartHeaded:
         new_session = MagicMock()
         new_session.headless = False
 
-        async def _get_session_replacement(headless: bool = True):
+        async def _launch_replacement(headless: bool):
             assert headless is False
-            browser_module._session = new_session  # type: ignore[assignment]
             return new_session
 
         with patch(
-            "taskforce.infrastructure.tools.native.browser_tool._get_session",
-            new=_get_session_replacement,
+            "taskforce.infrastructure.tools.native.browser_tool._launch_session",
+            new=_launch_replacement,
         ):
             result = await tool.execute(action="restart_headed")
 
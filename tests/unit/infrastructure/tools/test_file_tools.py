@@ -321,3 +321,156 @@ class TestFileToolsWorkspaceScoping:
         result = await tool.execute(path=str(target))
         assert result["success"] is True
         assert result["content"] == "fine"
+
+
+class TestFileReadToolWindows:
+    """Line- and byte-range reads served without loading the whole file."""
+
+    @pytest.fixture
+    def tool(self):
+        return FileReadTool()
+
+    @pytest.fixture
+    def log_file(self, tmp_path):
+        from taskforce.infrastructure.tools.native.file_window import clear_line_index_cache
+
+        clear_line_index_cache()
+        path = tmp_path / "app.log"
+        # Long enough to span many 64 KiB index blocks.
+        path.write_text("".join(f"line {i:06d} {'x' * (i % 50)}\n" for i in range(1, 20001)))
+        return path
+
+    @pytest.mark.asyncio
+    async def test_line_window(self, tool, log_file):
+        result = await tool.execute(path=str(log_file), offset=15000, limit=3)
+
+        assert result["success"] is True
+        assert [line.split()[1] for line in result["content"].splitlines()] == [
+            "015000",
+            "015001",
+            "015002",
+        ]
+        assert result["start_line"] == 15000
+        assert result["end_line"] == 15002
+        assert result["has_more"] is True
+        assert result["next_offset"] == 15003
+
+    @pytest.mark.asyncio
+    async def test_last_window_reports_total_lines(self, tool, log_file):
+        result = await tool.execute(path=str(log_file), offset=19999, limit=10)
+
+        assert result["content"].splitlines()[-1].startswith("line 020000")
+        assert result["end_line"] == 20000
+        assert result["total_lines"] == 20000
+        assert result["has_more"] is False
+        assert "next_offset" not in result
+
+    @pytest.mark.asyncio
+    async def test_window_past_end_is_empty(self, tool, log_file):
+        result = await tool.execute(path=str(log_file), offset=20001, limit=5)
+
+        assert result["success"] is True
+        assert result["content"] == ""
+        assert result["has_more"] is False
+
+    @pytest.mark.asyncio
+    async def test_file_without_trailing_newline(self, tool, tmp_path):
+        path = tmp_path / "short.txt"
+        path.write_text("a\nb\nc")
+
+        result = await tool.execute(path=str(path), offset=2, limit=5)
+        assert result["content"] == "b\nc"
+        assert result["end_line"] == 3
+        assert result["total_lines"] == 3
+
+    @pytest.mark.spec("tools.file_read_windows_files_over_size_cap")
+    @pytest.mark.asyncio
+    async def test_file_over_cap_readable_in_windows(self, tool, tmp_path):
+        path = tmp_path / "big.csv"
+        path.write_text("id,value\n" + "".join(f"{i},{'v' * 100}\n" for i in range(12000)))
+
+        whole = await tool.execute(path=str(path), max_size_mb=1)
+        assert whole["success"] is False
+        assert "offset/limit" in whole["error"]
+
+        window = await tool.execute(path=str(path), max_size_mb=1, offset=11001, limit=2)
+        assert window["success"] is True
+        assert window["content"].startswith("10999,")
+
+    @pytest.mark.asyncio
+    async def test_window_capped_at_max_size_on_line_boundary(self, tool, tmp_path):
+        path = tmp_path / "wide.txt"
+        path.write_text(("y" * 1000 + "\n") * 3000)
+
+        result = await tool.execute(path=str(path), offset=1, limit=3000, max_size_mb=1)
+        assert result["truncated"] is True
+        assert result["content"].endswith("\n")
+        assert len(result["content"]) <= 1024 * 1024
+        assert result["next_offset"] == result["end_line"] + 1
+
+    @pytest.mark.asyncio
+    async def test_byte_window(self, tool, tmp_path):
+        path = tmp_path / "data.txt"
+        path.write_text("0123456789" * 10)
+
+        result = await tool.execute(path=str(path), byte_offset=95, byte_length=20)
+        assert result["content"] == "56789"
+        assert result["byte_end"] == 100
+        assert result["has_more"] is False
+
+        result = await tool.execute(path=str(path), byte_offset=10, byte_length=5)
+        assert result["content"] == "01234"
+        assert result["next_byte_offset"] == 15
+
+    @pytest.mark.asyncio
+    async def test_byte_window_splitting_multibyte_char_does_not_fail(self, tool, tmp_path):
+        path = tmp_path / "umlaut.txt"
+        path.write_text("äöü", encoding="utf-8")
+
+        result = await tool.execute(path=str(path), byte_offset=1, byte_length=3)
+        assert result["success"] is True
+        assert "ö" in result["content"]
+
+    @pytest.mark.asyncio
+    async def test_line_and_byte_ranges_are_exclusive(self, tool, log_file):
+        result = await tool.execute(path=str(log_file), offset=1, byte_offset=0)
+        assert result["success"] is False
+
+    @pytest.mark.asyncio
+    async def test_index_invalidated_when_file_changes(self, tool, tmp_path):
+        import os
+
+        path = tmp_path / "grow.log"
+        path.write_text("a\nb\n")
+        first = await tool.execute(path=str(path), offset=1, limit=10)
+        assert first["total_lines"] == 2
+
+        with open(path, "a") as fh:
+            fh.write("c\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        second = await tool.execute(path=str(path), offset=3, limit=10)
+        assert second["content"] == "c\n"
+        assert second["total_lines"] == 3
+
+    @pytest.mark.asyncio
+    async def test_empty_file_window(self, tool, tmp_path):
+        path = tmp_path / "empty.txt"
+        path.write_text("")
+
+        result = await tool.execute(path=str(path), offset=1, limit=10)
+        assert result["success"] is True
+        assert result["content"] == ""
+
+    @pytest.mark.asyncio
+    async def test_seek_read_fallback_when_mmap_unavailable(self, tool, log_file):
+        from unittest.mock import patch
+
+        with patch(
+            "taskforce.infrastructure.tools.native.file_window.mmap.mmap",
+            side_effect=OSError("no mmap"),
+        ):
+            result = await tool.execute(path=str(log_file), offset=15000, limit=2)
+
+        assert result["content"].startswith("line 015000")
+        assert result["end_line"] == 15001
@@ -0,0 +1,153 @@
+"""Tests for the batched background JSONL trace writer."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+
+import pytest
+
+from taskforce.infrastructure.tracing.trace_file_writer import (
+    TraceFileWriter,
+    get_trace_file_writer,
+    shutdown_trace_file_writers,
+)
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.fixture
+def trace_path(tmp_path):
+    return tmp_path / "traces" / "llm_traces.jsonl"
+
+
+class _Paused(TraceFileWriter):
+    """Writer whose thread only starts on ``resume()`` — makes the queue observable."""
+
+    def _ensure_thread(self) -> None:
+        if getattr(self, "_resumed", False):
+            super()._ensure_thread()
+
+    def resume(self) -> None:
+        self._resumed = True
+        super()._ensure_thread()
+
+
+class TestTraceFileWriter:
+    def test_records_are_written_in_batches(self, trace_path) -> None:
+        writer = _Paused(trace_path, batch_size=10)
+        for i in range(25):
+            assert writer.submit({"i": i})
+        writer.resume()
+        assert writer.flush()
+
+        assert [r["i"] for r in _lines(trace_path)] == list(range(25))
+        assert writer.stats["written"] == 25
+        assert writer.stats["batches"] == 1
+        writer.close()
+
+    def test_submit_returns_before_anything_is_written(self, trace_path) -> None:
+        writer = _Paused(trace_path)
+        writer.submit({"a": 1})
+        assert not trace_path.exists()
+        writer.resume()
+        writer.close()
+        assert _lines(trace_path) == [{"a": 1}]
+
+    @pytest.mark.spec("llm-service.trace_writer_drops_oldest_when_queue_full")
+    def test_drop_oldest_when_queue_is_full(self, trace_path) -> None:
+        writer = _Paused(trace_path, queue_size=3)
+        for i in range(5):
+            assert writer.submit({"i": i})
+        writer.resume()
+        writer.close()
+
+        assert [r["i"] for r in _lines(trace_path)] == [2, 3, 4]
+        assert writer.stats["dropped"] == 2
+
+    async def test_block_policy_waits_for_room(self, trace_path) -> None:
+        writer = _Paused(trace_path, queue_size=2, overflow="block")
+        assert writer.submit({"i": 0})
+        assert writer.submit({"i": 1})
+        assert not writer.submit({"i": 2})
+
+        pending = asyncio.ensure_future(writer.put({"i": 2}))
+        await asyncio.sleep(0.05)
+        assert not pending.done()
+        writer.resume()
+        await asyncio.wait_for(pending, timeout=5)
+        writer.close()
+
+        assert [r["i"] for r in _lines(trace_path)] == [0, 1, 2]
+        assert writer.stats["dropped"] == 0
+
+    def test_close_flushes_and_rejects_new_records(self, trace_path) -> None:
+        writer = TraceFileWriter(trace_path, flush_interval_seconds=60)
+        writer.submit({"last": True})
+        writer.close()
+
+        assert _lines(trace_path) == [{"last": True}]
+        assert writer.submit({"late": True}) is False
+        writer.close()  # idempotent
+
+    def test_unserializable_record_is_skipped(self, trace_path) -> None:
+        writer = TraceFileWriter(trace_path)
+        writer.submit({"bad": object()})
+        writer.submit({"good": 1})
+        writer.close()
+
+        assert _lines(trace_path) == [{"good": 1}]
+        assert writer.stats["errors"] == 1
+
+    def test_size_rotation_with_compression_and_pruning(self, trace_path) -> None:
+        writer = TraceFileWriter(
+            trace_path, batch_size=1, max_bytes=200, backup_count=2, compress=True
+        )
+        for i in range(12):
+            writer.submit({"i": i, "pad": "x" * 80})
+            writer.flush()
+        writer.close()
+
+        rotated = sorted(trace_path.parent.glob("llm_traces.*.jsonl.gz"))
+        assert writer.stats["rotations"] >= 3
+        assert len(rotated) == 2
+        assert trace_path.stat().st_size <= 200
+        for archive in rotated:
+            with gzip.open(archive, "rt") as fh:
+                assert all(json.loads(line)["pad"] for line in fh)
+
+    def test_time_rotation(self, trace_path) -> None:
+        now = [1000.0]
+        writer = TraceFileWriter(
+            trace_path, batch_size=1, rotate_interval_seconds=60, clock=lambda: now[0]
+        )
+        writer.submit({"i": 0})
+        writer.flush()
+        now[0] += 61
+        writer.submit({"i": 1})
+        writer.close()
+
+        rotated = list(trace_path.parent.glob("llm_traces.*.jsonl"))
+        assert len(rotated) == 1
+        assert _lines(rotated[0]) == [{"i": 0}]
+        assert _lines(trace_path) == [{"i": 1}]
+
+    def test_rejects_unknown_overflow_policy(self, trace_path) -> None:
+        with pytest.raises(ValueError, match="overflow"):
+            TraceFileWriter(trace_path, overflow="spill")
+
+
+def test_writers_are_shared_per_path_and_closed_on_shutdown(trace_path) -> None:
+    first = get_trace_file_writer(trace_path, {"batch_size": 5, "path": "ignored"})
+    assert get_trace_file_writer(str(trace_path)) is first
+    first.submit({"x": 1})
+
+    shutdown_trace_file_writers()
+
+    assert first.closed
+    assert _lines(trace_path) == [{"x": 1}]
+    assert get_trace_file_writer(trace_path) is not first
+    shutdown_trace_file_writers()